@@ -200,6 +200,27 @@ class BuildQt(Command):
         self.compile_ui_files()
 
 
+class BuildAtlas(Command):
+
+    description = "Pack the action, upgrade slot, faction and ship icons into a texture atlas"
+
+    boolean_options = []
+    user_options = []
+
+    def initialize_options(self):
+        pass
+
+    def finalize_options(self):
+        pass
+
+    def run(self):
+        log.set_verbosity(1)
+        # Imported here so the other commands do not need the package dependencies installed.
+        from x_wing_squad_builder.atlas import ATLAS_DIR, build_atlas
+        count = build_atlas()
+        log.info(f'{count} icons packed into {ATLAS_DIR}')
+
+
 class CleanLocal(Command):
 
     description = "Clean the local project directory"
@@ -298,6 +319,7 @@ class BuildExe(Command):
 
     def run(self):
         self.run_command("build_qt")
+        self.run_command("build_atlas")
         self.run_build_exe()
 
 
@@ -352,6 +374,7 @@ class BuildInstaller(Command):
 class MyBuild(distutils_build.build):
     def run(self):
         self.run_command("build_qt")
+        self.run_command("build_atlas")
         distutils_build.build.run(self)
 
 
@@ -394,6 +417,7 @@ setup(
     cmdclass={
         'build': MyBuild,
         'build_qt': BuildQt,
+        'build_atlas': BuildAtlas,
         'build_exe': BuildExe,
         'build_installer': BuildInstaller,
         'clean': MyClean,
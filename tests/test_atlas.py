@@ -0,0 +1,63 @@
+import os
+
+import pytest
+from PIL import Image
+
+from x_wing_squad_builder.atlas import IconAtlas, build_atlas, pack_shelves
+
+
+def test_pack_shelves():
+    sizes = {"a": (6, 4), "b": (5, 3), "c": (4, 4), "d": (10, 2)}
+    positions, height = pack_shelves(sizes, width=10, padding=1)
+    # no two rectangles overlap and all fit within the width
+    rects = [(x, y, x + sizes[key][0], y + sizes[key][1]) for key, (x, y) in positions.items()]
+    for i, (x0, y0, x1, y1) in enumerate(rects):
+        assert x1 <= 10 and y1 <= height
+        for u0, v0, u1, v1 in rects[i + 1:]:
+            assert x1 <= u0 or u1 <= x0 or y1 <= v0 or v1 <= y0
+    with pytest.raises(ValueError):
+        pack_shelves({"wide": (11, 1)}, width=10)
+
+
+def test_icon_atlas(tmp_path):
+    resources_dir = tmp_path / "resources"
+    colors = {"actions/Focus.png": (255, 0, 0, 255), "factions/rebel alliance.png": (0, 255, 0, 255)}
+    for name, color in colors.items():
+        path = resources_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        Image.new("RGBA", (8, 6), color).save(path)
+
+    atlas_dir = tmp_path / "atlas"
+    assert build_atlas(resources_dir, atlas_dir, dirs=["actions", "factions"], width=16) == 2
+
+    atlas = IconAtlas(atlas_dir, resources_dir)
+    qimage = atlas.qimage(resources_dir / "actions" / "focus.png")
+    assert (qimage.width(), qimage.height()) == (8, 6)
+    assert qimage.pixelColor(3, 3).getRgb() == (255, 0, 0, 255)
+    assert atlas.qimage(resources_dir / "factions" / "rebel alliance.png").pixelColor(0, 0).getRgb() == (0, 255, 0, 255)
+    assert atlas.qimage(resources_dir / "actions" / "focus.png", "green").pixelColor(3, 3).getRgb() == (0, 0, 0, 255)
+    assert atlas.qimage(resources_dir / "factions" / "rebel alliance.png", "red").pixelColor(0, 0).getRgb() == (0, 255, 0, 255)
+    assert atlas.qimage(resources_dir / "actions" / "boost.png") is None
+    assert atlas.qimage(tmp_path / "elsewhere.png") is None
+
+    assert IconAtlas(tmp_path / "missing", resources_dir).qimage(resources_dir / "actions" / "focus.png") is None
+
+
+def test_icon_atlas_skips_changed_icons(tmp_path):
+    resources_dir = tmp_path / "resources"
+    (resources_dir / "actions").mkdir(parents=True)
+    for name in ["focus", "boost"]:
+        Image.new("RGBA", (8, 6), (255, 0, 0, 255)).save(resources_dir / "actions" / f"{name}.png")
+    atlas_dir = tmp_path / "atlas"
+    build_atlas(resources_dir, atlas_dir, dirs=["actions"], width=16)
+
+    # Edited after the atlas was built
+    focus = resources_dir / "actions" / "focus.png"
+    Image.new("RGBA", (8, 6), (0, 0, 255, 255)).save(focus)
+    stat = focus.stat()
+    os.utime(focus, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    atlas = IconAtlas(atlas_dir, resources_dir)
+    assert atlas.qimage(focus) is None
+    assert focus not in atlas
+    assert atlas.qimage(resources_dir / "actions" / "boost.png") is not None
@@ -0,0 +1,93 @@
+import threading
+
+import pytest
+from PIL import Image
+from PySide6 import QtCore, QtGui
+
+from x_wing_squad_builder.card_loader import CardLoader
+from x_wing_squad_builder.thumbnail_store import ThumbnailStore
+from x_wing_squad_builder.utils_pyside import pixmap_cache
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtGui.QGuiApplication.instance() or QtGui.QGuiApplication([])
+
+
+@pytest.fixture
+def cards(tmp_path):
+    paths = {}
+    for name in ["alpha", "beta", "gamma"]:
+        paths[name] = tmp_path / f"{name}.jpg"
+        Image.new("RGB", (30, 42), (200, 10, 10)).save(paths[name])
+    pixmap_cache().clear()
+    yield paths
+    pixmap_cache().clear()
+
+
+@pytest.fixture
+def loader(app, tmp_path):
+    threadpool = QtCore.QThreadPool()
+    threadpool.setMaxThreadCount(1)
+    loader = CardLoader(threadpool, thumbnail_store=ThumbnailStore(tmp_path / "thumbnails"))
+    yield loader
+    threadpool.waitForDone()
+
+
+def block(threadpool: QtCore.QThreadPool) -> threading.Event:
+    """occupies the only thread of threadpool until the returned event is set, so requests stay queued"""
+    event = threading.Event()
+    threadpool.start(event.wait)
+    return event
+
+
+def finish(loader: CardLoader, event: threading.Event = None):
+    if event is not None:
+        event.set()
+    loader.threadpool.waitForDone()
+    QtCore.QCoreApplication.processEvents()
+
+
+def test_request(loader, cards):
+    delivered = []
+    loader.request("pilot", cards["alpha"], lambda pixmap, path: delivered.append((path, pixmap.width())))
+    finish(loader)
+    assert delivered == [(cards["alpha"], 30)]
+
+    # Cached pixmaps are delivered immediately
+    loader.request("pilot", cards["alpha"], lambda pixmap, path: delivered.append((path, pixmap.width())))
+    assert len(delivered) == 2
+
+
+def test_cancel(loader, cards):
+    delivered = []
+    event = block(loader.threadpool)
+    loader.request("pilot", cards["alpha"], lambda pixmap, path: delivered.append(path), prefetch=[cards["beta"]])
+    loader.cancel("pilot")
+    finish(loader, event)
+    assert delivered == []
+    assert pixmap_cache().lookup(cards["alpha"]) is None
+    assert pixmap_cache().lookup(cards["beta"]) is None
+
+
+def test_superseded_request(loader, cards):
+    delivered = []
+    event = block(loader.threadpool)
+    loader.request("pilot", cards["alpha"], lambda pixmap, path: delivered.append(path))
+    loader.request("pilot", cards["beta"], lambda pixmap, path: delivered.append(path))
+    finish(loader, event)
+    assert delivered == [cards["beta"]]
+    assert pixmap_cache().lookup(cards["alpha"]) is None
+
+
+def test_cross_channel_request(loader, cards):
+    delivered = []
+    event = block(loader.threadpool)
+    # gamma is queued as a prefetch of the pilot channel, then requested by the viewer
+    loader.request("pilot", cards["alpha"], lambda pixmap, path: delivered.append(("pilot", path)),
+                   prefetch=[cards["gamma"]])
+    loader.request("viewer_pilot", cards["gamma"], lambda pixmap, path: delivered.append(("viewer_pilot", path)))
+    # Moving the pilot channel on must not cancel the decode the viewer waits for
+    loader.request("pilot", cards["beta"], lambda pixmap, path: delivered.append(("pilot", path)))
+    finish(loader, event)
+    assert sorted(delivered) == [("pilot", cards["beta"]), ("viewer_pilot", cards["gamma"])]
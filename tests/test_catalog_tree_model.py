@@ -0,0 +1,69 @@
+from PySide6.QtTest import QAbstractItemModelTester
+
+from x_wing_squad_builder.catalog_tree_model import CatalogNode, CatalogTreeModel, CatalogFilterProxyModel
+
+
+def make_model(fetched: list) -> CatalogTreeModel:
+    def ships(faction):
+        fetched.append(faction)
+        return [CatalogNode(f"{faction} ship", fetch_children=lambda: [CatalogNode("pilot a"), CatalogNode("pilot b")])]
+
+    model = CatalogTreeModel("Pilot")
+    model.set_roots([CatalogNode(faction, fetch_children=lambda faction=faction: ships(faction))
+                     for faction in ["empire", "rebels"]])
+    return model
+
+
+def test_children_are_created_on_fetch():
+    fetched = []
+    model = make_model(fetched)
+    assert model.rowCount() == 2
+    empire = model.index(0, 0)
+    assert model.hasChildren(empire)
+    assert model.rowCount(empire) == 0
+    assert model.canFetchMore(empire)
+    assert fetched == []
+
+    model.fetchMore(empire)
+    assert fetched == ["empire"]
+    assert not model.canFetchMore(empire)
+    ship = model.index(0, 0, empire)
+    assert ship.data() == "empire ship"
+    assert model.parent(ship) == empire
+    assert model.node(ship).parent is model.node(empire)
+
+
+def test_leaves():
+    fetched = []
+    model = make_model(fetched)
+    assert list(model.leaves(fetch=False)) == []
+    assert [leaf.text for leaf in model.leaves()] == ["pilot a", "pilot b"] * 2
+    assert fetched == ["empire", "rebels"]
+    QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+
+
+def test_filter_proxy():
+    fetched = []
+    model = make_model(fetched)
+    paths = [(faction, f"{faction} ship", pilot) for faction in ["empire", "rebels"] for pilot in ["pilot a", "pilot b"]]
+    proxy = CatalogFilterProxyModel(lambda: paths)
+    proxy.setSourceModel(model)
+
+    proxy.set_query("rebels")
+    assert proxy.rowCount() == 0
+    proxy.set_query("pilot b")
+    assert proxy.rowCount() == 2
+    # Searching does not fetch the catalog
+    assert fetched == []
+
+    rebels = proxy.index(1, 0)
+    proxy.fetchMore(rebels)
+    ship = proxy.index(0, 0, rebels)
+    proxy.fetchMore(ship)
+    assert proxy.rowCount(ship) == 1
+    assert proxy.index(0, 0, ship).data() == "pilot b"
+    assert proxy.node(proxy.index(0, 0, ship)).path == ("rebels", "rebels ship", "pilot b")
+
+    proxy.set_query("")
+    assert proxy.rowCount(ship) == 2
+    QAbstractItemModelTester(proxy, QAbstractItemModelTester.FailureReportingMode.Fatal)
@@ -0,0 +1,76 @@
+import json
+import os
+import shutil
+import threading
+
+import pytest
+
+from x_wing_squad_builder.model.definition_snapshot import (load_definition, read_snapshot, snapshot_path_for,
+                                                           write_snapshot)
+
+
+@pytest.fixture(scope="function")
+def definition_copy(tmp_path, definition_file_path):
+    path = tmp_path / "definition.json"
+    shutil.copy(definition_file_path, path)
+    return path
+
+
+def test_load_definition(definition_copy, definition_data, tmp_path):
+    snapshot_dir = tmp_path / "snapshots"
+    assert load_definition(definition_copy, snapshot_dir) == definition_data
+    assert snapshot_path_for(definition_copy, snapshot_dir).exists()
+    assert read_snapshot(definition_copy, snapshot_dir) == definition_data
+
+
+def test_snapshot_invalidated_on_change(definition_copy, definition_data, tmp_path):
+    snapshot_dir = tmp_path / "snapshots"
+    load_definition(definition_copy, snapshot_dir)
+
+    data = json.loads(definition_copy.read_text())
+    data["upgrades"] = data["upgrades"][:1]
+    definition_copy.write_text(json.dumps(data))
+
+    assert read_snapshot(definition_copy, snapshot_dir) is None
+    assert load_definition(definition_copy, snapshot_dir) == data
+
+
+def test_snapshot_survives_touch(definition_copy, definition_data, tmp_path):
+    snapshot_dir = tmp_path / "snapshots"
+    load_definition(definition_copy, snapshot_dir)
+
+    stat = definition_copy.stat()
+    os.utime(definition_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert read_snapshot(definition_copy, snapshot_dir) == definition_data
+
+
+def test_shared_definition(definition_copy, definition_data, tmp_path):
+    snapshot_dir = tmp_path / "snapshots"
+    data = load_definition(definition_copy, snapshot_dir, shared=True)
+    assert data == definition_data
+    assert snapshot_path_for(definition_copy, snapshot_dir, shared=True).exists()
+    # Equal restrictions are one instance, also once read back from the snapshot
+    for data in (data, load_definition(definition_copy, snapshot_dir, shared=True)):
+        first, second = data["upgrades"][0]["restrictions"], data["upgrades"][1]["restrictions"]
+        assert first["hull"] is second["hull"]
+    assert load_definition(definition_copy, snapshot_dir) is not data
+
+
+def test_concurrent_snapshot_writers(definition_copy, definition_data, tmp_path):
+    snapshot_dir = tmp_path / "snapshots"
+    barrier = threading.Barrier(4)
+    written = []
+
+    def write():
+        barrier.wait()
+        written.append(write_snapshot(definition_copy, definition_data, snapshot_dir))
+
+    threads = [threading.Thread(target=write) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert written == [True] * 4
+    assert read_snapshot(definition_copy, snapshot_dir) == definition_data
+    assert list(snapshot_dir.glob("*.tmp")) == []
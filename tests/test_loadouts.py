@@ -0,0 +1,94 @@
+import copy
+
+import pytest
+
+from x_wing_squad_builder.model.loadouts import (Loadout, LoadoutTable, check_weights, pareto_frontier,
+                                                 pilot_frontier, pilot_loadouts, plain_loadouts)
+from x_wing_squad_builder.model.upgrade import Upgrades
+
+VONREG = ("first order", r"tie%ba interceptor", "major vonreg")
+
+
+def loadout(cost, value, uniques=()):
+    return Loadout(VONREG, (), cost, value, frozenset(uniques))
+
+
+def test_pareto_frontier():
+    cheap = loadout(10, 5)
+    dominated = loadout(12, 5)
+    better = loadout(12, 7)
+    unique = loadout(12, 6, ["han solo"])
+    # Keeps a loadout with unique names only if it is worth more than those without
+    assert pareto_frontier([better, dominated, unique, cheap]) == [cheap, better]
+    assert pareto_frontier([dominated, loadout(11, 6, ["han solo"]), cheap]) == [cheap, loadout(11, 6, ["han solo"])]
+
+
+def test_check_weights():
+    assert check_weights({"hull": 1}) == {"hull": 1}
+    with pytest.raises(ValueError):
+        check_weights({"speed": 1})
+    with pytest.raises(ValueError):
+        check_weights({"hull": -1})
+
+
+def test_pilot_loadouts(xwing, upgrades):
+    loadouts = pilot_loadouts(xwing, upgrades, VONREG, {"upgrades": 1}, 70)
+    assert loadouts[0] == Loadout(VONREG, (), 54, 0, frozenset())
+    assert all(loadout.cost <= 70 for loadout in loadouts)
+    # Cheapest first, every loadout is worth more than the cheaper ones
+    values = [loadout.value for loadout in loadouts]
+    assert values == sorted(values) and len(set(values)) == len(values)
+    assert max(values) == 4
+
+    table = LoadoutTable(xwing, upgrades, {"upgrades": 1}, 70)
+    assert table.loadouts(VONREG) == loadouts
+    assert table.loadouts(VONREG) is table.loadouts(VONREG)
+    assert VONREG in table.pilot_keys("first order")
+    assert table.pilot_limit(VONREG) == 1
+
+
+def test_plain_loadouts_fill_duplicate_slots():
+    base = loadout(40, 40)
+    alpha = {"name": "alpha", "upgrade_slot_types": ["talent"]}
+    beta = {"name": "beta", "upgrade_slot_types": ["talent"]}
+    gamma = {"name": "gamma", "upgrade_slot_types": ["talent"]}
+    loadouts = plain_loadouts(base, ["talent", "talent"], [(alpha, 3), (beta, 3), (gamma, 3)], {"points": 1}, 200, {})
+    # Equal upgrades are interchangeable, but both slots can still be filled
+    assert [(item.cost, item.value) for item in loadouts] == [(40, 40), (43, 43), (46, 46)]
+    assert len(loadouts[-1].upgrades) == 2
+
+
+def upgrades_with_cost(xwing, upgrade_name, cost):
+    upgrade_list = copy.deepcopy(xwing.upgrades)
+    for upgrade in upgrade_list:
+        if upgrade["name"] == upgrade_name:
+            upgrade["cost"] = cost
+    return Upgrades(upgrade_list)
+
+
+def test_loadout_table_cache(xwing, upgrades, tmp_path):
+    path = tmp_path / "loadouts.pickle"
+    table = LoadoutTable(xwing, upgrades, {"upgrades": 1}, 70)
+    loadouts = table.loadouts(VONREG)
+    frontier = pilot_frontier(xwing, upgrades, VONREG, {"upgrades": 1}, 70)
+    assert "talent" in frontier.slots and "crew" not in frontier.slots
+    assert table.save(path)
+
+    loaded = LoadoutTable(xwing, upgrades, {"upgrades": 1}, 70)
+    assert loaded.load(path) == 1
+    assert loaded.loadouts(VONREG) == loadouts
+    # Saved for other weights or budget
+    assert LoadoutTable(xwing, upgrades, {"upgrades": 1}, 80).load(path) == 0
+    assert LoadoutTable(xwing, upgrades, {"hull": 1}, 70).load(path) == 0
+
+    # Only upgrades Vonreg could equip, or using one of its slots, invalidate its loadouts
+    crew = next(upgrade["name"] for upgrade in xwing.upgrades if upgrade["upgrade_slot_types"] == ["crew"])
+    assert LoadoutTable(xwing, upgrades_with_cost(xwing, crew, 1), {"upgrades": 1}, 70).load(path) == 1
+    assert LoadoutTable(xwing, upgrades_with_cost(xwing, "clan training", 1), {"upgrades": 1}, 70).load(path) == 0
+
+
+def test_best_loadout(xwing, upgrades):
+    table = LoadoutTable(xwing, upgrades, {"upgrades": 1}, 70)
+    assert table.best_loadout(VONREG, 53) is None
+    assert table.best_loadout(VONREG, 54) == Loadout(VONREG, (), 54, 0, frozenset())
+    assert table.best_loadout(VONREG, 70).value == 4
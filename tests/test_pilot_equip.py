@@ -4,6 +4,7 @@ from x_wing_squad_builder.model.definition import Action
 from x_wing_squad_builder.model.upgrade import Upgrades
 from x_wing_squad_builder.model.xwing import XWing
 from x_wing_squad_builder.model.pilot_equip import PilotEquip
+from x_wing_squad_builder.settings import settings_snapshot
 
 
 @pytest.mark.parametrize(
@@ -108,3 +109,37 @@ def test_available_actions(xwing: XWing, faction_name, ship_name, pilot_name):
     expected.append(Action(**fake_action))
 
     assert pilot_equip.actions == expected
+
+
+@pytest.mark.parametrize(
+    "faction_name, ship_name, pilot_name, upgrade_name", [
+        pytest.param("galactic empire", "lambda-class t-4a shuttle",
+                     "omicron group pilot", "ion cannon")
+    ]
+)
+def test_derived_properties_invalidated(xwing: XWing, upgrades: Upgrades, faction_name, ship_name, pilot_name,
+                                        upgrade_name):
+    ship = xwing.get_ship(faction_name, ship_name)
+    pilot = ship.get_pilot_data(pilot_name)
+    pilot_equip = PilotEquip(ship, pilot)
+    version = pilot_equip.version
+    slots = pilot_equip.available_upgrade_slots
+    cost = pilot_equip.cost_with_upgrades
+    assert pilot_equip.available_upgrade_slots is slots
+
+    upgrade_dict = upgrades.get_upgrade(upgrade_name)
+    upgrade_slots = upgrades.get_upgrade_slots(upgrade_dict)
+    upgrade_cost = upgrades.get_filtered_upgrade_cost(upgrade_dict, pilot_equip)
+    assert pilot_equip.equip_upgrade(upgrade_slots, upgrade_name, upgrade_cost, upgrade_dict)
+    assert pilot_equip.version == version + 1
+    assert len(pilot_equip.available_upgrade_slots) == len(slots) - len(upgrade_slots)
+    assert pilot_equip.cost_with_upgrades == cost + upgrade_cost
+
+    assert pilot_equip.unequip_upgrade(upgrade_name)
+    assert pilot_equip.available_upgrade_slots == slots
+    assert pilot_equip.cost_with_upgrades == cost
+
+    cached = pilot_equip.upgrade_slots
+    settings_snapshot().reload()
+    assert pilot_equip.upgrade_slots is not cached
+    assert pilot_equip.upgrade_slots == cached
@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import pytest
+from PIL import Image
+from PySide6 import QtGui
+
+from x_wing_squad_builder.utils_pyside import PixmapCache
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtGui.QGuiApplication.instance() or QtGui.QGuiApplication([])
+
+
+def pixmap(app, size: int = 10) -> QtGui.QPixmap:
+    pixmap = QtGui.QPixmap(size, size)
+    pixmap.fill()
+    return pixmap
+
+
+def test_insert_and_lookup(app):
+    cache = PixmapCache()
+    first = pixmap(app)
+    cache.insert(Path("first.png"), None, first)
+    assert cache.lookup(Path("first.png")) is first
+    assert cache.lookup(Path("first.png"), "red") is None
+    assert len(cache) == 1
+    assert cache.size_bytes == PixmapCache.pixmap_bytes(first)
+
+    # Replacing an entry does not count it twice
+    cache.insert(Path("first.png"), None, pixmap(app))
+    assert len(cache) == 1
+    assert cache.size_bytes == PixmapCache.pixmap_bytes(first)
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+    assert cache.lookup(Path("first.png")) is None
+
+
+def test_evicts_least_recently_used(app):
+    size = PixmapCache.pixmap_bytes(pixmap(app))
+    cache = PixmapCache(budget_bytes=2 * size)
+    cache.insert(Path("first.png"), None, pixmap(app))
+    cache.insert(Path("second.png"), None, pixmap(app))
+    # Looking up first makes second the least recently used
+    assert cache.lookup(Path("first.png")) is not None
+    cache.insert(Path("third.png"), None, pixmap(app))
+    assert cache.lookup(Path("second.png")) is None
+    assert cache.lookup(Path("first.png")) is not None
+    assert cache.lookup(Path("third.png")) is not None
+    assert cache.size_bytes == 2 * size
+
+    # Lowering the budget evicts immediately
+    cache.budget_bytes = size
+    assert len(cache) == 1
+    assert cache.lookup(Path("third.png")) is not None
+
+    # A pixmap larger than the budget is not kept
+    cache.insert(Path("large.png"), None, pixmap(app, 20))
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_get_counts_hits_and_misses(app, tmp_path):
+    image_path = tmp_path / "icon.png"
+    Image.new("RGBA", (12, 12), (200, 10, 10, 255)).save(image_path)
+    cache = PixmapCache()
+    first = cache.get(image_path)
+    assert first.width() == 12
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert cache.get(image_path) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.lookup(Path("missing.png"))
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,42 @@
+import pytest
+
+from x_wing_squad_builder.search_index import SearchIndex, SearchMode
+
+PATHS = [
+    ("First Order", "TIE/BA Interceptor", "(6) Major Vonreg (54)"),
+    ("First Order", "Upsilon-Class Command Shuttle", "(1) Major Stridan (61)"),
+    ("Galactic Empire", "TIE/SA Bomber", "(4) Major Rhymer (36)"),
+    ("Galactic Empire", "TIE/LN Fighter", "(1) Academy Pilot (23)"),
+]
+
+
+@pytest.mark.parametrize(
+    "query, mode, expected", [
+        pytest.param("", SearchMode.TOKENS, {0, 1, 2, 3}),
+        pytest.param("jor von", SearchMode.SUBSTRING, {0}),
+        pytest.param("von maj", SearchMode.SUBSTRING, set()),
+        pytest.param("von maj", SearchMode.TOKENS, {0}),
+        pytest.param("MAJOR", SearchMode.TOKENS, {0, 1, 2}),
+        pytest.param("maj", SearchMode.PREFIX, {0, 1, 2}),
+        pytest.param("ajor", SearchMode.PREFIX, set()),
+        pytest.param("ajor", SearchMode.SUBSTRING, {0, 1, 2}),
+    ]
+)
+def test_search(query, mode, expected):
+    assert SearchIndex(PATHS).search(query, mode) == expected
+
+
+def test_incremental_search_matches_full_search():
+    index = SearchIndex(PATHS)
+    for mode in SearchMode:
+        query = ""
+        for char in "major r":
+            query += char
+            assert index.search(query, mode) == SearchIndex(PATHS).search(query, mode)
+        # Backspacing searches everything again
+        assert index.search("ma", mode) == SearchIndex(PATHS).search("ma", mode)
+
+
+def test_matching_paths():
+    assert SearchIndex(PATHS).matching_paths("vonreg") == {
+        ("First Order",), ("First Order", "TIE/BA Interceptor"), PATHS[0]}
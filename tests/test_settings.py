@@ -0,0 +1,29 @@
+import pytest
+
+from x_wing_squad_builder.settings import Settings, SettingsSnapshot, settings_snapshot
+
+
+def test_settings_snapshot():
+    settings = Settings()
+    snapshot = SettingsSnapshot(settings)
+    assert snapshot.mode == settings.mode
+    assert snapshot.scale == settings.scale
+    assert snapshot.theme == settings.theme
+    assert snapshot.log_file_dir == settings.log_file_dir
+    assert snapshot.epic == (settings.mode == Settings.Mode.EPIC)
+
+    generation = snapshot.generation
+    snapshot.reload(settings)
+    assert snapshot.generation == generation + 1
+
+    assert settings_snapshot() is settings_snapshot()
+
+
+def test_settings_snapshot_update():
+    snapshot = SettingsSnapshot(Settings())
+    generation = snapshot.generation
+    snapshot.update(mode=Settings.Mode.EPIC)
+    assert snapshot.epic
+    assert snapshot.generation == generation + 1
+    with pytest.raises(AttributeError):
+        snapshot.update(unknown=1)
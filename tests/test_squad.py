@@ -0,0 +1,38 @@
+from openpyxl import load_workbook
+
+from x_wing_squad_builder.model.squad import SUMMARY_SHEET_NAME, excel_sheet_name, export_squads_as_excel
+from x_wing_squad_builder.squad_validator import build_squad_list
+
+VONREG = {"name": "Vonreg", "faction": "First Order",
+          "pilots": [{"ship": "TIE/ba Interceptor", "pilot": "Major Vonreg", "upgrades": ["Composure"]}]}
+
+
+def test_excel_sheet_name():
+    used = set()
+    assert excel_sheet_name("a/b", used) == "a_b"
+    assert excel_sheet_name("A/B", used) == "A_B (2)"
+    assert excel_sheet_name(SUMMARY_SHEET_NAME, used) == f"{SUMMARY_SHEET_NAME} (2)"
+    assert len(excel_sheet_name("x" * 40, used)) == 31
+    assert excel_sheet_name("x" * 40, used) == "x" * 27 + " (2)"
+
+
+def test_export_squads_as_excel(xwing, upgrades, tmp_path):
+    squad, errors = build_squad_list(xwing, upgrades, VONREG)
+    assert errors == []
+    path = tmp_path / "squads.xlsx"
+    progress = []
+    count = export_squads_as_excel(str(path), [("Vonreg", squad), ("Vonreg", squad)], 2,
+                                   lambda done, total: progress.append((done, total)))
+    assert count == 2
+    assert progress == [(1, 2), (2, 2)]
+
+    workbook = load_workbook(path)
+    assert workbook.sheetnames == [SUMMARY_SHEET_NAME, "Vonreg", "Vonreg (2)"]
+    summary = workbook[SUMMARY_SHEET_NAME]
+    total = squad.total_pilot_cost + squad.total_upgrade_cost
+    assert [cell.value for cell in summary[2]] == ["Vonreg", "First Order", 1, squad.total_pilot_cost,
+                                                   squad.total_upgrade_cost, total, "Vonreg"]
+    sheet = workbook["Vonreg (2)"]
+    assert sheet["B1"].value == "Vonreg"
+    assert [cell.value for cell in sheet[5]][:5] == ["Major Vonreg", "TIE/BA Interceptor", squad.total_pilot_cost,
+                                                     squad.total_upgrade_cost, "Composure"]
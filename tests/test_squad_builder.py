@@ -0,0 +1,81 @@
+import pytest
+
+from x_wing_squad_builder.model import SquadBuilder
+
+FACTION = "first order"
+SHIP = r"tie%ba interceptor"
+PILOT = "major vonreg"
+
+
+@pytest.fixture
+def builder(xwing, upgrades):
+    return SquadBuilder(xwing, upgrades)
+
+
+def test_add_pilot(builder: SquadBuilder):
+    pilot_id = builder.add_pilot(FACTION, SHIP, PILOT)
+    assert pilot_id is not None
+    assert builder.last_error is None
+    pilot_data = builder.squad.get_pilot_data(pilot_id)
+    assert pilot_data.filtered_upgrades
+
+    assert builder.add_pilot(FACTION, SHIP, PILOT) is None
+    assert builder.last_error == "Limit reached for this pilot.  Unable to equip."
+    assert builder.add_pilot(FACTION, SHIP, "unknown pilot") is None
+    assert builder.last_error.startswith("Unknown pilot")
+    assert len(builder.squad.squad_dict) == 1
+
+
+def test_equip_and_unequip_upgrade(builder: SquadBuilder):
+    pilot_id = builder.add_pilot(FACTION, SHIP, PILOT)
+    pilot_data = builder.squad.get_pilot_data(pilot_id)
+    cost = pilot_data.cost_with_upgrades
+
+    assert not builder.equip_upgrade(pilot_id, "unknown upgrade")
+    assert builder.last_error == "Unknown upgrade Unknown Upgrade."
+    # Restricted to mandalorians
+    assert not builder.equip_upgrade(pilot_id, "clan training")
+    assert builder.last_error == "Clan Training is not available to Major Vonreg."
+
+    assert builder.equip_upgrade(pilot_id, "composure")
+    assert builder.last_error is None
+    assert pilot_data.cost_with_upgrades > cost
+    # The only talent slot is taken
+    assert not builder.equip_upgrade(pilot_id, "crack shot")
+    assert builder.last_error.startswith("Insufficient upgrade slots")
+
+    assert not builder.unequip_upgrade(pilot_id, "crack shot")
+    assert builder.last_error == "Crack Shot is not equipped to Major Vonreg."
+    assert builder.unequip_upgrade(pilot_id, "composure")
+    assert pilot_data.cost_with_upgrades == cost
+
+
+def test_remove_pilot(builder: SquadBuilder):
+    pilot_id = builder.add_pilot(FACTION, SHIP, PILOT)
+    assert builder.remove_pilot(pilot_id)
+    assert builder.squad.squad_dict == {}
+    assert builder.add_pilot(FACTION, SHIP, PILOT) is not None
+
+
+def test_batch_refreshes_squad_once(builder: SquadBuilder, monkeypatch):
+    other_id = builder.add_pilot(FACTION, SHIP, "first order provocateur")
+    refreshed = []
+    filtered_upgrades_by_pilot = builder.upgrades.filtered_upgrades_by_pilot
+
+    def count_refresh(pilot_data, squad):
+        refreshed.append(pilot_data.pilot_name)
+        return filtered_upgrades_by_pilot(pilot_data, squad)
+
+    monkeypatch.setattr(builder.upgrades, "filtered_upgrades_by_pilot", count_refresh)
+    with builder.batch():
+        pilot_id = builder.add_pilot(FACTION, SHIP, PILOT)
+        assert builder.equip_upgrade(pilot_id, "composure")
+        # Only the pilot edited is refreshed inside the batch
+        assert refreshed == [PILOT, PILOT]
+    # Then the whole squad once
+    assert sorted(refreshed[2:]) == sorted(["first order provocateur", PILOT])
+    assert builder.squad.get_pilot_data(other_id).filtered_upgrades
+
+    refreshed.clear()
+    assert builder.unequip_upgrade(pilot_id, "composure")
+    assert len(refreshed) == 2
@@ -0,0 +1,68 @@
+from x_wing_squad_builder.model.squad_format import SquadFormat, xws_id
+from x_wing_squad_builder.squad_validator import build_squad_list
+
+VONREG = {"name": "Vonreg/1", "faction": "First Order",
+          "pilots": [{"ship": "TIE/ba Interceptor", "pilot": "Major Vonreg", "upgrades": ["Composure"]}]}
+
+
+def test_xws_id():
+    assert xws_id(r"tie%ba interceptor") == "tiebainterceptor"
+    assert SquadFormat.faction_id("grand army of the republic") == "galacticrepublic"
+
+
+def test_squad_code(xwing, upgrades):
+    squad_format = SquadFormat(xwing, upgrades)
+    squad, _ = build_squad_list(xwing, upgrades, VONREG)
+    code = squad_format.to_code(squad, VONREG["name"])
+    assert code == "1_firstorder_tiebainterceptor.majorvonreg.composure_Vonreg%2F1"
+
+    squad_read = squad_format.from_code(code)
+    assert squad_read.name == VONREG["name"]
+    assert squad_read.errors == []
+    assert squad_format.to_code(squad_read.squad, squad_read.name) == code
+
+    squad_read = squad_format.from_code(code.replace("composure", "composure.unknown"))
+    assert squad_read.errors == ["Unknown upgrade unknown."]
+    assert squad_format.from_code("2_firstorder__").errors == ["Invalid squad code."]
+
+
+def test_xws(xwing, upgrades):
+    squad_format = SquadFormat(xwing, upgrades)
+    squad, _ = build_squad_list(xwing, upgrades, VONREG)
+    data = squad_format.to_xws(squad, VONREG["name"])
+    assert data["faction"] == "firstorder"
+    assert data["points"] == squad.total_pilot_cost + squad.total_upgrade_cost
+    assert data["pilots"] == [{"id": "majorvonreg", "ship": "tiebainterceptor", "points": data["points"],
+                               "upgrades": {"talent": ["composure"]}}]
+
+    squad_read = squad_format.from_xws(data)
+    assert squad_read.errors == []
+    assert squad_format.to_xws(squad_read.squad, squad_read.name) == data
+
+    # The ship may be left out when the pilot id is unambiguous
+    del data["pilots"][0]["ship"]
+    data["pilots"].append({"id": "unknown", "ship": "tiebainterceptor"})
+    squad_read = squad_format.from_xws(data)
+    assert len(squad_read.squad.squad_dict) == 1
+    assert squad_read.errors == ["Unknown pilot unknown (tiebainterceptor, First Order)."]
+
+
+def test_malformed_xws(xwing, upgrades):
+    squad_format = SquadFormat(xwing, upgrades)
+    squad_read = squad_format.from_xws({"faction": "firstorder", "pilots": [
+        {"id": "majorvonreg", "upgrades": ["composure"]},
+        "majorvonreg",
+        {"id": ["majorvonreg"]},
+    ]})
+    assert len(squad_read.squad.squad_dict) == 1
+    assert squad_read.errors == ["Invalid upgrades of pilot majorvonreg.", "Invalid pilot 2.", "Invalid pilot 3."]
+
+    squad_read = squad_format.from_xws({"faction": "firstorder", "pilots": [
+        {"id": "majorvonreg", "upgrades": {"talent": "composure", "missile": [1]}}]})
+    assert len(squad_read.squad.squad_dict) == 1
+    assert squad_read.errors == ["Invalid talent upgrades of pilot majorvonreg.",
+                                 "Invalid missile upgrades of pilot majorvonreg."]
+
+    assert squad_format.from_xws({"pilots": {}}).errors == [
+        "Invalid XWS squad: expected a name, faction and list of pilots."]
+    assert squad_format.from_xws([]).errors == ["Invalid XWS squad: expected a JSON object."]
@@ -0,0 +1,61 @@
+from x_wing_squad_builder.model.squad_builder import SquadBuilder
+from x_wing_squad_builder.model.squad_history import SquadHistory
+
+CADET = ("first order", r"tie%fo fighter", "epsilon squadron cadet")
+
+
+def squad_state(squad):
+    return [(pilot_id, [upgrade.name for upgrade in pilot_data.equipped_upgrades])
+            for pilot_id, pilot_data in squad.squad_dict.items()]
+
+
+def test_undo_redo(xwing, upgrades):
+    builder = SquadBuilder(xwing, upgrades)
+    history = SquadHistory()
+    states = [squad_state(builder.squad)]
+
+    def edit(success):
+        assert success is not None and success is not False
+        assert history.commit(builder.squad)
+        states.append(squad_state(builder.squad))
+
+    first = builder.add_pilot(*CADET)
+    edit(first)
+    edit(builder.equip_upgrade(first, "advanced optics"))
+    second = builder.add_pilot(*CADET)
+    edit(second)
+    edit(builder.equip_upgrade(second, "afterburners"))
+    edit(builder.remove_pilot(first))
+    assert not history.commit(builder.squad)
+
+    for state in reversed(states[:-1]):
+        builder.restore(history.undo())
+        assert squad_state(builder.squad) == state
+    assert history.undo() is None
+    for state in states[1:]:
+        builder.restore(history.redo())
+        assert squad_state(builder.squad) == state
+    assert not history.can_redo
+
+    # Undo a removal, the pilot is back in its place
+    removed, added = builder.restore(history.undo())
+    assert (removed, added) == ([], [first])
+    assert list(builder.squad.squad_dict) == [first, second]
+    # Restoring does not count as an edit, a new edit drops the steps undone
+    assert not history.commit(builder.squad)
+    edit(builder.unequip_upgrade(second, "afterburners"))
+    assert not history.can_redo
+
+
+def test_snapshots_share_unchanged_pilots(xwing, upgrades):
+    builder = SquadBuilder(xwing, upgrades)
+    history = SquadHistory()
+    first = builder.add_pilot(*CADET)
+    second = builder.add_pilot(*CADET)
+    history.commit(builder.squad)
+    before = history.current
+    builder.equip_upgrade(second, "afterburners")
+    history.commit(builder.squad)
+    assert history.current[0] is before[0]
+    assert history.current[1] is not before[1]
+    assert history.current[0].pilot_id == first
@@ -0,0 +1,76 @@
+import random
+from itertools import combinations_with_replacement
+
+import pytest
+
+from x_wing_squad_builder import squad_solver
+from x_wing_squad_builder.model import loadouts
+from x_wing_squad_builder.model.loadouts import Loadout
+from x_wing_squad_builder.squad_solver import search, solve_squad, sort_options
+from x_wing_squad_builder.squad_validator import load_context, validate_squad_list
+
+
+def random_options(rng: random.Random):
+    options = []
+    for pilot in range(8):
+        limit = rng.choice([1, 2, 99])
+        for _ in range(rng.randint(1, 3)):
+            uniques = frozenset(rng.sample("abc", rng.randint(0, 1)))
+            loadout = Loadout(("faction", "ship", f"pilot {pilot}"), (), rng.randint(10, 60), rng.randint(0, 20), uniques)
+            options.append((loadout, limit))
+    return sort_options(options)
+
+
+def brute_force(options, budget, max_pilots):
+    best = float("-inf")
+    for size in range(1, max_pilots + 1):
+        for picks in combinations_with_replacement(options, size):
+            loadouts = [loadout for loadout, _ in picks]
+            pilots = [loadout.pilot for loadout in loadouts]
+            uniques = [root for loadout in loadouts for root in loadout.uniques]
+            if (sum(loadout.cost for loadout in loadouts) <= budget and len(uniques) == len(set(uniques))
+                    and all(pilots.count(loadout.pilot) <= limit for loadout, limit in picks)):
+                best = max(best, sum(loadout.value for loadout in loadouts))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_search_matches_brute_force(seed):
+    options = random_options(random.Random(seed))
+    value, picks = search(options, 100, 4, processes=1)
+    assert value == brute_force(options, 100, 4)
+    assert value == sum(options[i][0].value for i in picks)
+    assert search(options, 100, 4, processes=2)[0] == value
+
+
+def test_solve_squad_is_legal(xwing, upgrades, definition_file_path):
+    solution = solve_squad(xwing, upgrades, "first order", budget=100, weights={"points": 1, "upgrades": 1},
+                           processes=1)
+    assert 0 < solution.cost <= 100
+    assert solution.value == sum(loadout.value for loadout in solution.loadouts)
+
+    load_context(definition_file_path)
+    squad_list = {"faction": "first order",
+                  "pilots": [{"ship": loadout.pilot[1], "pilot": loadout.pilot[2], "upgrades": list(loadout.upgrades)}
+                             for loadout in solution.loadouts]}
+    report = validate_squad_list(squad_list)
+    assert report.errors == []
+    assert report.total_cost == solution.cost
+
+
+def test_solve_squad_cache(xwing, upgrades, definition_file_path, tmp_path, monkeypatch):
+    monkeypatch.setattr(squad_solver, "loadout_table_path",
+                        lambda *args: loadouts.loadout_table_path(*args, cache_dir=tmp_path))
+    solution = solve_squad(xwing, upgrades, "first order", budget=100, processes=1, data_path=definition_file_path)
+    cache_files = list(tmp_path.glob("*.pickle"))
+    assert len(cache_files) == 1
+
+    # Every pilot is read from the cache, nothing is computed or saved again
+    computed = []
+    pilot_frontier = loadouts.pilot_frontier
+    monkeypatch.setattr(loadouts, "pilot_frontier", lambda *args: computed.append(args) or pilot_frontier(*args))
+    mtime_ns = cache_files[0].stat().st_mtime_ns
+    assert solve_squad(xwing, upgrades, "first order", budget=100, processes=1,
+                       data_path=definition_file_path) == solution
+    assert computed == []
+    assert cache_files[0].stat().st_mtime_ns == mtime_ns
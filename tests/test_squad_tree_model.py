@@ -0,0 +1,111 @@
+import pytest
+from PySide6 import QtGui
+from PySide6.QtTest import QAbstractItemModelTester
+
+from x_wing_squad_builder.model.squad import Squad
+from x_wing_squad_builder.model.squad_builder import SquadBuilder
+from x_wing_squad_builder.model.squad_history import SquadHistory
+from x_wing_squad_builder.squad_tree_model import SquadTreeModel
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtGui.QGuiApplication.instance() or QtGui.QGuiApplication([])
+
+
+@pytest.fixture
+def model(app, tmp_path):
+    model = SquadTreeModel(Squad(), tmp_path)
+    QAbstractItemModelTester(model, QAbstractItemModelTester.FailureReportingMode.Fatal, model)
+    return model
+
+
+def record_changes(model: SquadTreeModel) -> list:
+    changes = []
+    model.dataChanged.connect(lambda first, last: changes.append(("changed", first.parent().isValid(), first.row(), last.row())))
+    model.rowsInserted.connect(lambda parent, first, last: changes.append(("inserted", parent.isValid(), first, last)))
+    model.rowsRemoved.connect(lambda parent, first, last: changes.append(("removed", parent.isValid(), first, last)))
+    return changes
+
+
+def rows(model: SquadTreeModel, pilot_id: int):
+    parent = model.pilot_index(pilot_id)
+    return [(model.index(row, 0, parent).data(), model.index(row, 1, parent).data())
+            for row in range(model.rowCount(parent))]
+
+
+def test_equip_updates_only_the_slot_row(model: SquadTreeModel, pilot_equip):
+    pilot_id = model.squad.new_pilot_id()
+    model.squad.add_pilot(pilot_id, pilot_equip)
+    model.add_pilot(pilot_id)
+    changes = record_changes(model)
+
+    upgrade_dict = {"name": "test tech", "upgrade_slot_types": ["tech"]}
+    pilot_equip.equip_upgrade(["tech"], "test tech", 3, upgrade_dict)
+    assert model.refresh_pilot(pilot_id)
+    assert changes == [("changed", True, 1, 1), ("changed", False, 0, 0)]
+    assert rows(model, pilot_id) == [("Talent", ""), ("Tech", "Test Tech (3)"),
+                                     ("Missile", ""), ("Modification", "")]
+
+    changes.clear()
+    assert not model.refresh_pilot(pilot_id)
+    assert changes == []
+
+
+def test_slot_modifications_insert_and_remove_rows(model: SquadTreeModel, pilot_equip):
+    pilot_id = model.squad.new_pilot_id()
+    model.squad.add_pilot(pilot_id, pilot_equip)
+    model.add_pilot(pilot_id)
+    changes = record_changes(model)
+
+    upgrade_dict = {"name": "test mod", "upgrade_slot_types": ["modification"],
+                    "modifications": {"upgrade_slots": {"added": ["cannon", "torpedo"], "removed": ["missile"]}}}
+    pilot_equip.equip_upgrade(["modification"], "test mod", 2, upgrade_dict)
+    model.refresh_pilot(pilot_id)
+    assert changes == [("removed", True, 0, 2), ("inserted", True, 0, 3),
+                       ("changed", True, 4, 4), ("changed", False, 0, 0)]
+    assert rows(model, pilot_id) == [("Cannon", ""), ("Torpedo", ""), ("Talent", ""),
+                                     ("Tech", ""), ("Modification", "Test Mod (2)")]
+
+    pilot_equip.unequip_upgrade("test mod")
+    model.refresh_pilot(pilot_id)
+    assert [slot for slot, _ in rows(model, pilot_id)] == ["Talent", "Tech", "Missile", "Modification"]
+
+
+def test_add_and_remove_pilots(model: SquadTreeModel, pilot_equip):
+    squad = model.squad
+    pilot_id = squad.new_pilot_id()
+    squad.add_pilot(pilot_id, pilot_equip)
+    index = model.add_pilot(pilot_id)
+    assert model.is_pilot(index)
+    assert model.pilot_id(index) == pilot_id
+    child = model.index(0, 0, index)
+    assert not model.is_pilot(child)
+    assert model.pilot_id(child) == pilot_id
+    assert model.slot(child) == "talent"
+    assert model.equipped_upgrade(child) is None
+    assert model.parent(child) == index
+
+    squad.remove_pilot(pilot_id)
+    model.remove_pilot(pilot_id)
+    assert model.rowCount() == 0
+    assert not model.pilot_index(pilot_id).isValid()
+
+
+def test_restored_pilot_keeps_its_row(model: SquadTreeModel, xwing, upgrades):
+    builder = SquadBuilder(xwing, upgrades, model.squad)
+    history = SquadHistory()
+    pilot_ids = [builder.add_pilot("first order", r"tie%fo fighter", "epsilon squadron cadet") for _ in range(3)]
+    for pilot_id in pilot_ids:
+        model.add_pilot(pilot_id)
+    history.commit(model.squad)
+    builder.remove_pilot(pilot_ids[1])
+    model.remove_pilot(pilot_ids[1])
+    history.commit(model.squad)
+
+    changes = record_changes(model)
+    _, added = builder.restore(history.undo())
+    for pilot_id in added:
+        model.add_pilot(pilot_id)
+    assert changes == [("inserted", False, 1, 1)]
+    assert [model.pilot_id(model.index(row, 0)) for row in range(model.rowCount())] == pilot_ids
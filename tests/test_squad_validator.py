@@ -0,0 +1,54 @@
+import json
+
+from x_wing_squad_builder.squad_validator import read_squad_lists, validate_squad_lists
+
+LEGAL = {"name": "legal", "faction": "First Order",
+         "pilots": [{"ship": "TIE/ba Interceptor", "pilot": "Major Vonreg", "upgrades": ["Composure"]}]}
+ILLEGAL = {"name": "illegal", "faction": "First Order",
+           "pilots": [{"ship": "TIE/ba Interceptor", "pilot": "Major Vonreg", "upgrades": ["Composure", "Clan Training"]},
+                      {"ship": "TIE/ba Interceptor", "pilot": "Major Vonreg"}]}
+
+
+def test_validate_squad_lists(tmp_path, definition_file_path):
+    path = tmp_path / "lists.jsonl"
+    path.write_text("\n".join([json.dumps(LEGAL), json.dumps(ILLEGAL), "", "{"]))
+    items = list(read_squad_lists(path))
+    assert [source for source, _ in items] == ["lists.jsonl:1", "lists.jsonl:2", "lists.jsonl:4"]
+
+    reports = list(validate_squad_lists(items, definition_file_path, processes=1))
+    legal, illegal, invalid = reports
+    assert legal.errors == []
+    assert legal.total_cost == legal.pilot_cost + legal.upgrade_cost
+    assert legal.upgrade_cost > 0
+    assert illegal.errors == ["Clan Training is not available to Major Vonreg.",
+                              "Limit reached for this pilot.  Unable to equip."]
+    assert illegal.total_cost == legal.total_cost
+    assert invalid.errors[0].startswith("Invalid squad list")
+
+    assert list(validate_squad_lists(items, definition_file_path, processes=2)) == reports
+
+
+def test_validate_malformed_squad_lists(definition_file_path):
+    malformed = [
+        {"faction": "First Order", "pilots": ["Major Vonreg"]},
+        {"faction": "First Order", "pilots": {"ship": "TIE/ba Interceptor"}},
+        {"faction": "First Order", "pilots": [{"ship": "TIE/ba Interceptor", "pilot": "Major Vonreg",
+                                               "upgrades": "Composure"}]},
+        {"faction": "First Order", "pilots": [{"ship": "TIE/ba Interceptor", "pilot": "Major Vonreg",
+                                               "upgrades": [["Composure"]]}]},
+        {"faction": ["First Order"]},
+    ]
+    items = [(str(i), json.dumps(squad_list)) for i, squad_list in enumerate(malformed)]
+    items.append(("legal", json.dumps(LEGAL)))
+    reports = list(validate_squad_lists(items, definition_file_path, processes=1))
+    assert len(reports) == len(items)
+    for report in reports[:-1]:
+        assert len(report.errors) == 1 and report.errors[0].startswith("Invalid squad list: ")
+    assert reports[-1].errors == []
+    assert reports[-1].upgrade_cost > 0
+
+
+def test_read_squad_list_directory(tmp_path):
+    (tmp_path / "b.json").write_text(json.dumps(ILLEGAL))
+    (tmp_path / "a.json").write_text(json.dumps(LEGAL))
+    assert [source for source, _ in read_squad_lists(tmp_path)] == ["a.json", "b.json"]
@@ -0,0 +1,51 @@
+import threading
+
+from x_wing_squad_builder.model.symbols import PILOT, ROOT, UPGRADE, SymbolTable
+
+
+def test_ids_are_stable():
+    table = SymbolTable()
+    first = table.id(UPGRADE, "composure")
+    second = table.id(UPGRADE, "predator")
+    assert first != second
+    assert table.id(UPGRADE, "composure") == first
+    assert table.name(UPGRADE, second) == "predator"
+
+
+def test_vocabularies_are_separate():
+    table = SymbolTable()
+    assert table.id(PILOT, "han solo") == table.id(PILOT, "han solo")
+    assert table.find(UPGRADE, "han solo") is None
+
+
+def test_find_does_not_assign():
+    table = SymbolTable()
+    assert table.find(UPGRADE, "not an upgrade") is None
+    assert table.find(UPGRADE, "not an upgrade") is None
+
+
+def test_roots_are_shared():
+    table = SymbolTable()
+    assert table.root("gar saxon") == table.root("gar saxon (crew)")
+    assert table.name(ROOT, table.root("gar saxon (crew)")) == "gar saxon"
+    assert table.is_unique("han solo (crew)")
+    assert not table.is_unique("predator")
+
+
+def test_ids_are_unique_across_threads():
+    table = SymbolTable()
+    barrier = threading.Barrier(4)
+
+    def assign(thread: int):
+        barrier.wait()
+        for i in range(2000):
+            table.id(UPGRADE, f"upgrade {i % 500} {thread % 2}")
+
+    threads = [threading.Thread(target=assign, args=(thread,)) for thread in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    ids = {table.find(UPGRADE, f"upgrade {i} {j}") for i in range(500) for j in range(2)}
+    assert ids == set(range(1000))
+    assert all(table.name(UPGRADE, table.find(UPGRADE, f"upgrade {i} 1")) == f"upgrade {i} 1" for i in range(500))
@@ -0,0 +1,35 @@
+import os
+
+from PIL import Image
+
+from x_wing_squad_builder.thumbnail_store import ThumbnailStore
+
+
+def test_display_factor():
+    assert ThumbnailStore.display_factor(1) == 1
+    assert ThumbnailStore.display_factor(0.5) == 1
+    assert ThumbnailStore.display_factor(2) == 0.5
+    assert ThumbnailStore.display_factor(2, device_pixel_ratio=2) == 1
+
+
+def test_thumbnails(tmp_path):
+    source = tmp_path / "card.jpg"
+    Image.new("RGB", (300, 420), (200, 10, 10)).save(source)
+    store = ThumbnailStore(tmp_path / "thumbnails")
+
+    qimage, source_width = store.load(source, 1)
+    assert (qimage.width(), source_width) == (300, 300)
+    assert not (tmp_path / "thumbnails").exists()
+
+    qimage, source_width = store.load(source, 0.5)
+    assert (qimage.width(), qimage.height(), source_width) == (150, 210, 300)
+    thumbnail_path = store.thumbnail_path(source, 0.5)
+    assert thumbnail_path.exists()
+    assert store.generate([source], 0.5) == 0
+
+    # A modified source gets a new thumbnail, replacing the old one
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert store.generate([source], 0.5) == 1
+    assert not thumbnail_path.exists()
+    assert store.thumbnail_path(source, 0.5).exists()
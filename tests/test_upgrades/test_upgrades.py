@@ -11,6 +11,9 @@ from x_wing_squad_builder.model.upgrade_filters import (upgrade_slot_filter, nam
                                                         statistics_filter_simple, statistics_filter_adv,
                                                         limit_filter)
 
+from x_wing_squad_builder.model.upgrade_restrictions import compile_restrictions
+from x_wing_squad_builder.model.upgrade_index import UpgradeIndex
+
 from .filter_tests import FILTER_TESTS
 
 UPGRADE_NAME_1 = "pikachu"
@@ -343,3 +346,90 @@ def test_special_upgrade_crew_in_faction(upgrades: Upgrades, pilot_factory, fact
 
 
 
+
+
+def test_compile_restrictions_drops_null_restrictions(upgrades: Upgrades):
+    clan_training = upgrades.get_upgrade("clan training")
+    # only the keyword restriction remains, every other restriction is empty or a null range
+    assert len(compile_restrictions(clan_training)) == 1
+    assert compile_restrictions({"name": "no restrictions"}) == []
+
+
+@pytest.mark.parametrize(
+    "keywords, expected", [
+        pytest.param(["mandalorian"], True),
+        pytest.param(["jedi", "clone"], False),
+        pytest.param([], False),
+    ]
+)
+def test_compile_restrictions_keywords(upgrades: Upgrades, pilot_factory, keywords, expected):
+    pilot_equip: PilotEquip = pilot_factory("galactic empire", "lambda-class t-4a shuttle", "omicron group pilot")
+    pilot_equip.data["keywords"] = keywords
+    check, = compile_restrictions(upgrades.get_upgrade("clan training"))
+    assert check(pilot_equip, Squad()) is expected
+
+
+def test_upgrade_index_slots():
+    fake_upgrades = [
+        {"name": "single", "upgrade_slot_types": ["crew"]},
+        {"name": "double", "upgrade_slot_types": ["crew", "crew"]},
+        {"name": "combo", "upgrade_slot_types": ["crew", "gunner"]},
+    ]
+    index = UpgradeIndex(fake_upgrades)
+    assert list(UpgradeIndex.iter_bits(index.all & ~index.slots.excluded(["crew"]))) == [0]
+    assert list(UpgradeIndex.iter_bits(index.all & ~index.slots.excluded(["crew", "crew"]))) == [0, 1]
+    assert list(UpgradeIndex.iter_bits(index.all & ~index.slots.excluded(["gunner", "crew"]))) == [0, 2]
+    assert list(UpgradeIndex.iter_bits(index.all & ~index.slots.excluded([]))) == []
+
+
+def test_upgrade_index_names():
+    fake_upgrades = [
+        {"name": "anyone", "restrictions": {"factions": [], "keywords": []}},
+        {"name": "rebels", "restrictions": {"factions": ["rebel alliance"], "keywords": []}},
+        {"name": "jedi", "restrictions": {"factions": [], "keywords": ["jedi", "light side"]}},
+    ]
+    index = UpgradeIndex(fake_upgrades)
+    assert index.names["factions"].query("rebel alliance") == 0b111
+    assert index.names["factions"].query("galactic empire") == 0b101
+    assert index.multiple_names["keywords"].query_any(["light side", "clone"]) == 0b111
+    assert index.multiple_names["keywords"].query_any([]) == 0b011
+
+
+@pytest.mark.parametrize(
+    "faction_name, ship_name, pilot_name", [
+        pytest.param("galactic empire", "lambda-class t-4a shuttle", "omicron group pilot"),
+        pytest.param("rebel alliance", "vcx-100 light freighter", "lothal rebel"),
+        pytest.param("first order", r"tie%ba interceptor", "major vonreg"),
+    ]
+)
+def test_upgrade_index_matches_restrictions(upgrades: Upgrades, pilot_factory, faction_name, ship_name, pilot_name):
+    pilot_equip: PilotEquip = pilot_factory(faction_name, ship_name, pilot_name)
+    index = UpgradeIndex(upgrades.upgrades_list)
+    candidates = set(UpgradeIndex.iter_bits(index.static_candidates(pilot_equip, epic_mode=True)))
+    for i, upgrade in enumerate(upgrades.upgrades_list):
+        indexed = {"restrictions": {k: v for k, v in upgrade["restrictions"].items()
+                                    if k in UpgradeIndex.indexed_restrictions(upgrade)}}
+        expected = all(check(pilot_equip, Squad()) for check in compile_restrictions(indexed))
+        assert (i in candidates) is expected, upgrade["name"]
+
+
+def test_filtered_upgrades_track_squad_changes(upgrades: Upgrades, pilot_factory):
+    first: PilotEquip = pilot_factory("galactic empire", "lambda-class t-4a shuttle", "omicron group pilot")
+    second: PilotEquip = pilot_factory("galactic empire", "lambda-class t-4a shuttle", "omicron group pilot")
+    squad = Squad()
+    squad.add_pilot("first", first)
+    squad.add_pilot("second", second)
+
+    filtered = [upgrade["name"] for upgrade in upgrades.filtered_upgrades_by_pilot(first, squad)]
+    assert "darth vader" in filtered
+    assert filtered == [upgrade["name"] for upgrade in upgrades.filtered_upgrades_by_pilot(first, squad)]
+
+    # equipping a unique upgrade on another pilot only affects the squad dependent upgrades
+    second.equip_upgrade(["crew"], "darth vader", 14, upgrades.get_upgrade("darth vader"))
+    filtered_after = [upgrade["name"] for upgrade in upgrades.filtered_upgrades_by_pilot(first, squad)]
+    assert set(filtered) - set(filtered_after) == {"darth vader"}
+    # darth vader in the squad unlocks 0-0-0
+    assert set(filtered_after) - set(filtered) == {"0-0-0"}
+
+    second.unequip_upgrade("darth vader")
+    assert filtered == [upgrade["name"] for upgrade in upgrades.filtered_upgrades_by_pilot(first, squad)]
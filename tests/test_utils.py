@@ -1,8 +1,10 @@
+import numpy as np
 import pytest
 
 from x_wing_squad_builder.utils import (contains_number, process_part, prettify_name,
                                         gui_text_encode, gui_text_decode,
-                                        get_pilot_name_from_list_item_text, get_upgrade_name_from_list_item_text, get_upgrade_slot_from_list_item_text)
+                                        get_pilot_name_from_list_item_text, get_upgrade_name_from_list_item_text, get_upgrade_slot_from_list_item_text,
+                                        recolor_image_array)
 
 
 def test_contains_number():
@@ -61,3 +63,19 @@ def test_prettify_name():
 def test_get_upgrade_name_from_list_item_text(list_item_text, expected):
     extracted_name = get_upgrade_name_from_list_item_text(list_item_text)
     assert extracted_name == expected
+
+
+@pytest.mark.parametrize(
+    "color, expected", [
+        pytest.param("red", [200, 0, 0, 255]),
+        pytest.param("purple", [200, 0, 100, 255]),
+        pytest.param("green", [0, 150, 100, 255]),
+        pytest.param(None, [200, 150, 100, 255]),
+    ]
+)
+def test_recolor_image_array(color, expected):
+    im_arr = np.array([[[200, 150, 100, 255], [0, 150, 100, 0]]], dtype='uint8')
+    recolor_image_array(im_arr, color)
+    assert im_arr[0, 0].tolist() == expected
+    # pixels without red are left alone
+    assert im_arr[0, 1].tolist() == [0, 150, 100, 0]
@@ -1,3 +1,9 @@
+import copy
+import dataclasses
+
+import pytest
+
+from x_wing_squad_builder.model.definition import action_record
 from x_wing_squad_builder.model.xwing import XWing
 
 
@@ -49,4 +55,27 @@ def test_get_pilot(xwing: XWing):
     assert test_pilot["name"] == pilot
 
 
+def test_lookups_reuse_instances(xwing: XWing):
+    faction = "first order"
+    ship = r"tie%ba interceptor"
+    assert xwing.get_faction(faction) is xwing.get_faction(faction)
+    assert xwing.get_ship(faction, ship) is xwing.get_ship(faction, ship)
+    assert xwing.get_ship("booyah", ship) is None
+    assert xwing.get_pilot(faction, ship, "rockandstone") is None
+
+
+def test_reindex(definition_data: dict):
+    data = copy.deepcopy(definition_data)
+    test_xwing = XWing(data)
+    data["factions"][0]["name"] = "new order"
+    assert test_xwing.get_faction("new order") is None
+
+    test_xwing.reindex()
+    assert test_xwing.get_faction("new order").faction_name == "new order"
+
 
+def test_action_records_are_shared():
+    action = {"action": "focus", "color": "white", "action_link": None, "color_link": None}
+    assert action_record(action) is action_record(dict(action))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        action_record(action).color = "red"
@@ -0,0 +1,14 @@
+"""
+Validates squad lists from the command line, without the GUI.
+
+    python validate.py registrations.jsonl
+    python validate.py squad_lists_dir --mode epic --json
+
+See x_wing_squad_builder/squad_validator.py for the squad list format.
+"""
+import sys
+
+from x_wing_squad_builder.squad_validator import main
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,193 @@
+"""
+Texture atlas of the small icons in data/resources.
+
+The action, upgrade slot, faction and ship icons are hundreds of small PNGs.  build_atlas packs
+them into a single image with a JSON index of where each icon sits, and IconAtlas serves the
+icons from that image once it has been read, so populating the lists and trees reads one file
+instead of one per icon.  Recolored icons (red/purple actions, green equipped slots) are cut
+from a copy of the atlas recolored in one vectorized pass per color.  Icons missing from the
+atlas (or a missing atlas) fall back to the individual files, as do icons whose file changed
+since the atlas was built (the index keeps the size and modification time of every source).
+
+The atlas is generated by `python setup.py build_atlas` and is not checked in.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+from PySide6 import QtCore, QtGui
+
+from .utils import recolor_image_array
+
+# Bump this whenever the atlas layout changes so old atlases are ignored.
+ATLAS_VERSION = 2
+ATLAS_DIRS = ["actions", "upgrade_slots", "factions", "ship_icons"]
+ATLAS_IMAGE = "icons.png"
+ATLAS_INDEX = "icons.json"
+ATLAS_WIDTH = 1024
+ATLAS_PADDING = 1
+
+RESOURCES_DIR = Path(__file__).parents[1] / "data" / "resources"
+ATLAS_DIR = Path(__file__).parents[1] / "data" / "atlas"
+
+
+def atlas_key(relative_path: Path) -> str:
+    """returns the index key of an icon path relative to the resources directory.
+    Keys are lowercase since icons are requested by lowercase names (e.g. "slam" for SLAM.png)."""
+    return relative_path.as_posix().lower()
+
+
+def pack_shelves(sizes: Dict[str, Tuple[int, int]], width: int = ATLAS_WIDTH,
+                 padding: int = ATLAS_PADDING) -> Tuple[Dict[str, Tuple[int, int]], int]:
+    """
+    packs rectangles into rows (shelves) of the given width, tallest first.
+    returns the top-left position of every rectangle and the total height used.
+    """
+    positions = {}
+    x = y = shelf_height = 0
+    for key, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], item[0])):
+        if w > width:
+            raise ValueError(f"{key} is wider than the atlas ({w} > {width})")
+        if x + w > width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        positions[key] = (x, y)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+    return positions, y + shelf_height
+
+
+def build_atlas(resources_dir: Path = RESOURCES_DIR, atlas_dir: Path = ATLAS_DIR,
+                dirs: Iterable[str] = ATLAS_DIRS, width: int = ATLAS_WIDTH) -> int:
+    """packs every PNG in the given resource directories into an atlas image and index.
+    returns the number of icons packed"""
+    images = {}
+    # key -> [path relative to resources_dir, size, modification time] of the icon file
+    sources = {}
+    for directory in dirs:
+        for image_path in sorted((resources_dir / directory).glob("*.png")):
+            relative_path = image_path.relative_to(resources_dir)
+            key = atlas_key(relative_path)
+            if key in images:
+                logging.warning(f"Skipping {image_path}, an icon named {key} is already in the atlas")
+                continue
+            with Image.open(image_path) as im:
+                images[key] = im.convert("RGBA")
+            stat = image_path.stat()
+            sources[key] = [relative_path.as_posix(), stat.st_size, stat.st_mtime_ns]
+
+    positions, height = pack_shelves({key: im.size for key, im in images.items()}, width)
+    atlas = Image.new("RGBA", (width, max(height, 1)), (0, 0, 0, 0))
+    index = {}
+    for key, (x, y) in positions.items():
+        im = images[key]
+        atlas.paste(im, (x, y))
+        index[key] = [x, y, im.width, im.height]
+
+    atlas_dir.mkdir(parents=True, exist_ok=True)
+    tmp_image = atlas_dir / f"{ATLAS_IMAGE}.tmp"
+    atlas.save(tmp_image, "PNG", optimize=True)
+    os.replace(tmp_image, atlas_dir / ATLAS_IMAGE)
+    tmp_index = atlas_dir / f"{ATLAS_INDEX}.tmp"
+    with open(tmp_index, "w") as file:
+        json.dump({"version": ATLAS_VERSION, "image": ATLAS_IMAGE, "icons": index, "sources": sources}, file, indent=1)
+    os.replace(tmp_index, atlas_dir / ATLAS_INDEX)
+    return len(index)
+
+
+class IconAtlas:
+    """Serves icons from the packed atlas image, read on first use."""
+
+    def __init__(self, atlas_dir: Path = ATLAS_DIR, resources_dir: Path = RESOURCES_DIR):
+        self.atlas_dir = atlas_dir
+        self.resources_dir = resources_dir.absolute()
+        self.__loaded = False
+        self.__image: Optional[QtGui.QImage] = None
+        self.__image_path: Optional[Path] = None
+        # color -> recolored copy of the whole atlas
+        self.__variants: Dict[str, QtGui.QImage] = {}
+        self.__rects: Dict[str, QtCore.QRect] = {}
+
+    def load(self) -> bool:
+        """reads the atlas, returns False if it is unavailable"""
+        if self.__loaded:
+            return self.__image is not None
+        self.__loaded = True
+        try:
+            with open(self.atlas_dir / ATLAS_INDEX) as file:
+                index = json.load(file)
+        except (OSError, ValueError) as e:
+            logging.debug(f"Icon atlas unavailable, loading icons individually: {e}")
+            return False
+        if index.get("version") != ATLAS_VERSION:
+            logging.debug("Ignoring outdated icon atlas, rebuild it with setup.py build_atlas")
+            return False
+        image = QtGui.QImage(str(self.atlas_dir / index["image"]))
+        if image.isNull():
+            logging.debug("Unable to read the icon atlas image, loading icons individually")
+            return False
+        self.__image = image
+        self.__image_path = self.atlas_dir / index["image"]
+        sources = index.get("sources", {})
+        self.__rects = {key: QtCore.QRect(*rect) for key, rect in index["icons"].items()
+                        if key in sources and self.is_current(*sources[key])}
+        if len(self.__rects) < len(index["icons"]):
+            logging.debug(f"{len(index['icons']) - len(self.__rects)} icons changed since the icon atlas was built, "
+                          f"loading them individually, rebuild it with setup.py build_atlas")
+        return True
+
+    def is_current(self, relative_path: str, size: int, mtime_ns: int) -> bool:
+        """returns True if the icon file is the one packed in the atlas"""
+        try:
+            stat = (self.resources_dir / relative_path).stat()
+        except OSError:
+            return False
+        return stat.st_size == size and stat.st_mtime_ns == mtime_ns
+
+    def __contains__(self, image_path: Path) -> bool:
+        return self.load() and self.key(image_path) in self.__rects
+
+    def key(self, image_path: Path) -> Optional[str]:
+        try:
+            relative_path = Path(image_path).absolute().relative_to(self.resources_dir)
+        except ValueError:
+            return None
+        return atlas_key(relative_path)
+
+    def variant(self, color: Optional[str] = None) -> QtGui.QImage:
+        """returns the atlas image with every icon recolored (see utils.recolor_image_array)"""
+        if color is None:
+            return self.__image
+        image = self.__variants.get(color)
+        if image is None:
+            with Image.open(self.__image_path) as im:
+                im_arr = np.array(im.convert("RGBA"))
+            # toqimage does not copy the pixels, keep the array's image alive with the QImage copy.
+            image = Image.fromarray(recolor_image_array(im_arr, color)).toqimage().copy()
+            self.__variants[color] = image
+        return image
+
+    def qimage(self, image_path: Path, color: Optional[str] = None) -> Optional[QtGui.QImage]:
+        """returns the icon for image_path cut from the atlas, or None if it is not in the atlas"""
+        if not self.load():
+            return None
+        rect = self.__rects.get(self.key(image_path))
+        if rect is None:
+            return None
+        return self.variant(color).copy(rect)
+
+
+_icon_atlas: Optional[IconAtlas] = None
+
+
+def icon_atlas() -> IconAtlas:
+    """returns the process wide icon atlas"""
+    global _icon_atlas
+    if _icon_atlas is None:
+        _icon_atlas = IconAtlas()
+    return _icon_atlas
@@ -0,0 +1,103 @@
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from PySide6 import QtCore, QtGui
+
+from .settings import settings_snapshot
+from .thumbnail_store import ThumbnailStore
+from .utils_pyside import pixmap_cache, qimage_to_qpixmap
+from .worker import Worker
+
+
+class CardLoader(QtCore.QObject):
+    """
+    Decodes card images on a thread pool and delivers them to the GUI thread.
+
+    Every consumer (e.g. the main window pilot card or the viewer upgrade card) requests cards
+    on its own channel.  Only the latest request of a channel is delivered: when the user moves
+    past a selection, decodes that have not started yet are cancelled and results that arrive
+    late are only kept in the pixmap cache.  The neighbouring rows can be prefetched so that
+    arrowing through a list finds the next card already decoded.
+
+    Cards are read through the thumbnail store at the size they are displayed at, so callers
+    wanting full resolution (e.g. CardViewer on zoom) load it themselves.
+    """
+
+    def __init__(self, threadpool: QtCore.QThreadPool, parent: Optional[QtCore.QObject] = None,
+                 thumbnail_store: Optional[ThumbnailStore] = None):
+        super().__init__(parent)
+        self.threadpool = threadpool
+        self.thumbnail_store = thumbnail_store if thumbnail_store is not None else ThumbnailStore()
+        # channel -> (path, callback) of the latest request
+        self.__requested: Dict[str, Tuple[Path, Callable[[QtGui.QPixmap, Path], None]]] = {}
+        # path -> (channels wanting it, worker) of decodes that are queued or running
+        self.__pending: Dict[Path, Tuple[Set[str], Worker]] = {}
+
+    def request(self, channel: str, image_path: Path, callback: Callable[[QtGui.QPixmap, Path], None],
+                prefetch: Iterable[Path] = ()):
+        """
+        delivers the decoded image_path to callback(pixmap, image_path), superseding any earlier
+        request on channel.  callback is called immediately if the pixmap is cached, otherwise
+        once it is decoded.
+        """
+        image_path = Path(image_path)
+        prefetch = [Path(path) for path in prefetch]
+        self.__requested[channel] = (image_path, callback)
+        self.cancel_stale(channel, {image_path, *prefetch})
+
+        pixmap = pixmap_cache().lookup(image_path)
+        if pixmap is not None:
+            del self.__requested[channel]
+            callback(pixmap, image_path)
+        else:
+            self.start(channel, image_path)
+        for path in prefetch:
+            if pixmap_cache().lookup(path) is None:
+                self.start(channel, path)
+
+    def cancel(self, channel: str):
+        """drops the current request of channel without delivering it"""
+        self.__requested.pop(channel, None)
+        self.cancel_stale(channel, set())
+
+    def cancel_stale(self, channel: str, keep: set):
+        """cancels the queued decodes of channel that are no longer wanted by any channel"""
+        for path, (channels, worker) in list(self.__pending.items()):
+            if channel not in channels or path in keep:
+                continue
+            channels.discard(channel)
+            if not channels and self.threadpool.tryTake(worker):
+                del self.__pending[path]
+
+    def start(self, channel: str, image_path: Path):
+        if image_path in self.__pending:
+            self.__pending[image_path][0].add(channel)
+            return
+        worker = Worker(self.thumbnail_store.load, image_path, self.display_factor())
+        # Kept alive by __pending so that queued workers can be cancelled safely.
+        worker.setAutoDelete(False)
+        worker.signals.result.connect(lambda result: self.handle_result(image_path, *result))
+        worker.signals.error.connect(lambda error: logging.debug(f"Unable to load {image_path}: {error[1]}"))
+        worker.signals.finished.connect(lambda: self.__pending.pop(image_path, None))
+        self.__pending[image_path] = ({channel}, worker)
+        self.threadpool.start(worker)
+
+    @staticmethod
+    def display_factor() -> float:
+        screen = QtGui.QGuiApplication.primaryScreen()
+        device_pixel_ratio = screen.devicePixelRatio() if screen is not None else 1
+        return ThumbnailStore.display_factor(settings_snapshot().scale, device_pixel_ratio)
+
+    def handle_result(self, image_path: Path, qimage: QtGui.QImage, source_width: int):
+        # A thumbnail keeps the logical size of the full card, it just has fewer pixels per point.
+        scale = settings_snapshot().scale
+        if 0 < qimage.width() < source_width:
+            scale *= qimage.width() / source_width
+        pixmap = qimage_to_qpixmap(qimage, scale)
+        if not pixmap.isNull():
+            pixmap_cache().insert(image_path, None, pixmap)
+        for channel, (requested_path, callback) in list(self.__requested.items()):
+            if requested_path == image_path:
+                del self.__requested[channel]
+                callback(pixmap, image_path)
@@ -0,0 +1,232 @@
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple
+
+from PySide6 import QtCore, QtGui
+
+from .search_index import SearchIndex, SearchMode
+from .utils_pyside import image_path_to_qpixmap
+
+
+class CatalogNode:
+    """
+    A row of a CatalogTreeModel.  Nodes with a fetch_children callable have children, which are
+    only created the first time the node is expanded.
+    """
+    __slots__ = ("text", "icon_path", "fetch_children", "parent", "row", "children")
+
+    def __init__(self, text: str, icon_path: Optional[Path] = None,
+                 fetch_children: Optional[Callable[[], List["CatalogNode"]]] = None):
+        self.text = text
+        self.icon_path = icon_path
+        self.fetch_children = fetch_children
+        self.parent: Optional[CatalogNode] = None
+        self.row = 0
+        # None until fetched
+        self.children: Optional[List[CatalogNode]] = None
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.fetch_children is None
+
+    @property
+    def fetched(self) -> bool:
+        return self.children is not None
+
+    @property
+    def path(self) -> Tuple[str, ...]:
+        """returns the texts of the rows from the top level down to this node"""
+        path = []
+        node = self
+        while node is not None:
+            path.append(node.text)
+            node = node.parent
+        return tuple(reversed(path))
+
+
+class CatalogTreeModel(QtCore.QAbstractItemModel):
+    """
+    Read only tree model for the viewer catalogs (factions/ships/pilots and slots/upgrades).
+
+    Only the top level rows are created when the catalog is populated.  Children are created by
+    fetchMore when the view expands a node, and icons are loaded when a row is first drawn, so
+    (re)populating the catalog costs the same however many cards there are.
+    """
+
+    def __init__(self, header: str, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.header = header
+        self.__roots: List[CatalogNode] = []
+
+    def set_roots(self, roots: List[CatalogNode]):
+        self.beginResetModel()
+        self.__roots = self.__adopt(roots, None)
+        self.endResetModel()
+
+    @staticmethod
+    def __adopt(nodes: List[CatalogNode], parent: Optional[CatalogNode]) -> List[CatalogNode]:
+        for row, node in enumerate(nodes):
+            node.parent = parent
+            node.row = row
+        return nodes
+
+    def node(self, index: QtCore.QModelIndex) -> Optional[CatalogNode]:
+        if not index.isValid():
+            return None
+        return index.internalPointer()
+
+    def node_index(self, node: CatalogNode) -> QtCore.QModelIndex:
+        return self.createIndex(node.row, 0, node)
+
+    def child_nodes(self, node: Optional[CatalogNode], fetch: bool = True) -> List[CatalogNode]:
+        """returns the children of node (the top level rows for None), fetching them if needed"""
+        if node is None:
+            return self.__roots
+        if fetch and not node.fetched and not node.is_leaf:
+            self.fetchMore(self.node_index(node))
+        return node.children or []
+
+    def leaves(self, node: Optional[CatalogNode] = None, fetch: bool = True) -> Iterator[CatalogNode]:
+        """
+        iterates over the leaves below node (the whole catalog for None), fetching every node on the
+        way unless fetch is False, in which case only the leaves created so far are visited.
+        """
+        for child in self.child_nodes(node, fetch):
+            if child.is_leaf:
+                yield child
+            else:
+                yield from self.leaves(child, fetch)
+
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        siblings = self.__roots if not parent.isValid() else self.node(parent).children
+        return self.createIndex(row, column, siblings[row])
+
+    def parent(self, index: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        node = self.node(index)
+        if node is None or node.parent is None:
+            return QtCore.QModelIndex()
+        return self.node_index(node.parent)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        if not parent.isValid():
+            return len(self.__roots)
+        return len(self.node(parent).children or [])
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 1
+
+    def hasChildren(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> bool:
+        if not parent.isValid():
+            return len(self.__roots) > 0
+        node = self.node(parent)
+        if node.fetched:
+            return len(node.children) > 0
+        return not node.is_leaf
+
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        node = self.node(parent)
+        return node is not None and not node.is_leaf and not node.fetched
+
+    def fetchMore(self, parent: QtCore.QModelIndex):
+        node = self.node(parent)
+        if node is None or node.is_leaf or node.fetched:
+            return
+        children = node.fetch_children()
+        if not children:
+            node.children = []
+            return
+        self.beginInsertRows(parent, 0, len(children) - 1)
+        node.children = self.__adopt(children, node)
+        self.endInsertRows()
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        node = self.node(index)
+        if node is None:
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return node.text
+        if role == QtCore.Qt.DecorationRole and node.icon_path is not None:
+            return image_path_to_qpixmap(node.icon_path)
+        return None
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole and section == 0:
+            return self.header
+        return None
+
+
+class CatalogFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """
+    Filters a CatalogTreeModel down to the leaves matching a search, and the rows above them.
+
+    Matching is done against a SearchIndex built from the catalog paths on the first search, so the
+    catalog does not have to be fetched to be searched and filterAcceptsRow is a set lookup.  Rows
+    are only inserted into or removed from the view when their visibility changes.
+    """
+
+    HIGHLIGHT_BRUSH = QtGui.QBrush(QtGui.QColor("green"))
+
+    def __init__(self, paths: Callable[[], Iterable[Tuple[str, ...]]], parent: Optional[QtCore.QObject] = None,
+                 mode: SearchMode = SearchMode.TOKENS):
+        """paths returns the path of every leaf in the catalog, see CatalogNode.path"""
+        super().__init__(parent)
+        self.paths = paths
+        self.mode = mode
+        self.__search_index: Optional[SearchIndex] = None
+        self.__query = ""
+        # None shows every row
+        self.__accepted: Optional[Set[Tuple[str, ...]]] = None
+
+    @property
+    def query(self) -> str:
+        return self.__query
+
+    @property
+    def search_index(self) -> SearchIndex:
+        if self.__search_index is None:
+            self.__search_index = SearchIndex(self.paths())
+        return self.__search_index
+
+    def reset_search_index(self):
+        """drops the search index, call when the catalog is repopulated"""
+        self.__search_index = None
+        if self.__query:
+            self.set_query(self.__query, force=True)
+
+    def set_query(self, query: str, force: bool = False):
+        query = query.strip()
+        if query == self.__query and not force:
+            return
+        accepted = self.search_index.matching_paths(query, self.mode) if query else None
+        # Qt 6.9 replaced invalidateRowsFilter with begin/endFilterChange
+        if hasattr(self, "beginFilterChange"):
+            self.beginFilterChange()
+        self.__query = query
+        self.__accepted = accepted
+        if hasattr(self, "endFilterChange"):
+            self.endFilterChange(QtCore.QSortFilterProxyModel.Direction.Rows)
+        else:
+            self.invalidateRowsFilter()
+
+    def node(self, index: QtCore.QModelIndex) -> Optional[CatalogNode]:
+        return self.sourceModel().node(self.mapToSource(index))
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:
+        if self.__accepted is None:
+            return True
+        node = self.sourceModel().node(self.sourceModel().index(source_row, 0, source_parent))
+        return node.path in self.__accepted
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        # Every leaf left by a search is a match
+        if role == QtCore.Qt.ForegroundRole and self.__accepted is not None and self.node(index).is_leaf:
+            return self.HIGHLIGHT_BRUSH
+        return super().data(index, role)
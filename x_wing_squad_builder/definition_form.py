@@ -2,6 +2,7 @@ from PySide6 import QtWidgets, QtCore, QtGui
 from .ui.definition_form_ui import Ui_DefinitionForm
 
 from .model import XWing, Faction, Ship
+from .model.definition_snapshot import load_definition, write_snapshot
 from .model.constants import BASE_SIZES, ARC_TYPES_, ACTION_COLORS, ACTIONS_, UPGRADE_SLOTS_, FACTION_NAMES, KEYWORDS, INVALID
 from .utils import prettify_definition_form_entry
 from .utils_pyside import parse_actions, parse_attacks, arr_to_comma_separated_list, parse_check_box
@@ -49,8 +50,7 @@ class DefinitionForm(QtWidgets.QDialog):
         self.rejected.connect(self.handle_close_pressed)
 
     def load_data(self):
-        with open(self.data_filepath) as file:
-            self.data = json.load(file)
+        self.data = load_definition(self.data_filepath)
 
     def check_ship_name(self):
         faction_idx = self.get_faction_index(self.faction_name)
@@ -713,6 +713,8 @@ class DefinitionForm(QtWidgets.QDialog):
 
         with open(self.data_filepath, "w", encoding='utf-8') as file:
             json.dump(self.data, file, ensure_ascii=False, indent=4)
+        # Refresh the snapshot now so the reload after an edit does not reparse the file.
+        write_snapshot(self.data_filepath, self.data)
 
         logging.info(f"Data successfully written to {self.data_filepath}")
 
@@ -1,5 +1,7 @@
+import json
 import logging
 import os
+from contextlib import contextmanager
 from pathlib import Path
 from PySide6 import QtWidgets, QtCore, QtGui
 
@@ -9,18 +11,26 @@ from x_wing_squad_builder.viewer import Viewer
 from x_wing_squad_builder.model import Ship
 from .settings import Settings
 from .worker import Worker
+from .card_loader import CardLoader
+from .squad_tree_model import SquadTreeModel
 from .root_logger_handler import RootLoggerHandler
 from .ui import DarkPalette, IconPath
 from .ui.main_window_ui import Ui_MainWindow
 from .about_window import AboutWindow
 from .settings_window import SettingsWindow
 
-from .model import XWing, PilotEquip, Squad, Upgrades
+from .model import XWing, Squad, SquadBuilder, Upgrades
+from .model.squad import export_squads_as_excel
+from .model.squad_builder import PilotEntry
+from .model.squad_format import SquadFormat, SquadRead
+from .model.squad_history import SquadHistory, SquadSnapshot
+from .squad_validator import build_squad_list, read_squad_lists, squad_list_error
 
 from .utils_pyside import (image_path_to_qpixmap, populate_list_widget, update_action_layout,
-                           update_upgrade_slot_layout, treewidget_item_is_top_level,
+                           update_upgrade_slot_layout, pixmap_cache,
+                           list_widget_neighbours,
                            )
-from .utils import (get_upgrade_slot_from_list_item_text, gui_text_decode, prettify_name, gui_text_encode,
+from .utils import (gui_text_decode, prettify_name, gui_text_encode,
                     get_pilot_name_from_list_item_text, get_upgrade_name_from_list_item_text)
 
 from pathlib import Path
@@ -28,7 +38,6 @@ from pathlib import Path
 from typing import Optional
 
 from openpyxl import load_workbook
-from openpyxl.utils import get_column_letter
 
 class MainWindow(QtWidgets.QMainWindow):
     """Main Window"""
@@ -53,11 +62,16 @@ class MainWindow(QtWidgets.QMainWindow):
         # worker = Worker(func)
         # self.threadpool.start(worker)
 
+        # Card images are decoded on the threadpool
+        self.card_loader = CardLoader(self.threadpool, self)
+
         # Setup Windows
         self.about_window = AboutWindow()
         self.settings_window = SettingsWindow()
         self.settings_window.ui.theme_combo_box.currentTextChanged.connect(
             self.check_theme)
+        # Cached pixmaps carry the old scale, drop them before the views are repopulated.
+        self.settings_window.saved_signal.connect(pixmap_cache().clear)
         self.settings_window.saved_signal.connect(self.reload_data)
 
         # Add widgets with icon paths here to be inverted on a theme change.
@@ -76,6 +90,24 @@ class MainWindow(QtWidgets.QMainWindow):
             self.handle_show_settings_window)
         self.ui.action_export_as_excel.triggered.connect(self.export_excel)
         self.ui.action_import_excel.triggered.connect(self.import_excel)
+        self.action_export_squad_lists = QtGui.QAction("Export Squad Lists...", self)
+        self.ui.menu_excel.addAction(self.action_export_squad_lists)
+        self.action_export_squad_lists.triggered.connect(self.export_squad_lists)
+        self.menu_xws = QtWidgets.QMenu("XWS", self.ui.menuFile)
+        file_actions = self.ui.menuFile.actions()
+        self.ui.menuFile.insertMenu(file_actions[file_actions.index(self.ui.menu_excel.menuAction()) + 1], self.menu_xws)
+        self.menu_xws.addAction("Import...", self.import_xws)
+        self.menu_xws.addAction("Export...", self.export_xws)
+        self.menu_xws.addSeparator()
+        self.menu_xws.addAction("Import Squad Code...", self.import_squad_code)
+        self.menu_xws.addAction("Copy Squad Code", self.copy_squad_code)
+
+        self.menu_edit = QtWidgets.QMenu("Edit", self.ui.menubar)
+        self.ui.menubar.insertMenu(self.ui.menuTools.menuAction(), self.menu_edit)
+        self.action_undo = self.menu_edit.addAction("Undo", self.undo)
+        self.action_undo.setShortcut(QtGui.QKeySequence.Undo)
+        self.action_redo = self.menu_edit.addAction("Redo", self.redo)
+        self.action_redo.setShortcut(QtGui.QKeySequence.Redo)
 
         self.ui.faction_list_widget.itemSelectionChanged.connect(self.update_faction)
         self.ui.ship_list_widget.itemSelectionChanged.connect(self.update_ship)
@@ -116,13 +148,23 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ui.equip_upgrade_push_button.clicked.connect(self.handle_equip_upgrade)
         self.ui.unequip_upgrade_push_button.clicked.connect(
             self.unequip_upgrade)
-        self.ui.squad_tree_widget.itemSelectionChanged.connect(self.handle_squad_click)
-        self.ui.squad_tree_widget.itemDoubleClicked.connect(self.handle_squad_double_click)
+
+        # Squad view refreshes are deferred while a batch_update is open
+        self.__batch_depth = 0
+        self.__refresh_pending = False
 
         self.squad = Squad()
+        self.squad_history = SquadHistory()
+        self.update_undo_actions()
+        self.squad_model = SquadTreeModel(self.squad, self.upgrade_slots_dir, self)
+        self.ui.squad_tree_view.setModel(self.squad_model)
+        self.ui.squad_tree_view.selectionModel().selectionChanged.connect(self.handle_squad_click)
+        self.ui.squad_tree_view.doubleClicked.connect(self.handle_squad_double_click)
 
         self.xwing = XWing.launch_xwing_data(self.file_path)
         self.upgrades = Upgrades(self.xwing.upgrades)
+        self.squad_builder = SquadBuilder(self.xwing, self.upgrades, self.squad)
+        self.squad_format = SquadFormat(self.xwing, self.upgrades)
 
         # Set up upgrade viewer
         self.viewer = self.initialize_card_viewer()
@@ -155,7 +197,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def initialize_card_viewer(self):
         viewer = Viewer(self.xwing, self.upgrades, self.upgrade_slots_dir,
-                        self.upgrades_dir, self.factions_dir, self.ship_icons_dir, self.pilots_dir)
+                        self.upgrades_dir, self.factions_dir, self.ship_icons_dir, self.pilots_dir,
+                        card_loader=self.card_loader)
         self.ui.action_viewer.triggered.connect(viewer.show)
         viewer.upgrade_edit_signal.connect(self.edit_upgrade)
         viewer.pilot_edit_signal.connect(self.edit_pilot)
@@ -198,8 +241,12 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ui.pilot_list_widget.clear()
         self.ui.faction_list_widget.clear()
         self.ui.upgrade_list_widget.clear()
+        # A new XWing instance rebuilds the faction/ship/pilot index, dropping any stale lookups.
         self.xwing = XWing.launch_xwing_data(self.file_path)
         self.upgrades = Upgrades(self.xwing.upgrades)
+        self.squad_builder.xwing = self.xwing
+        self.squad_builder.upgrades = self.upgrades
+        self.squad_format = SquadFormat(self.xwing, self.upgrades)
         self.viewer.upgrades = self.upgrades
         self.viewer.xwing = self.xwing
         self.viewer.populate_upgrade_viewer()
@@ -211,22 +258,31 @@ class MainWindow(QtWidgets.QMainWindow):
             faction_names, self.ui.faction_list_widget, self.factions_dir)
         # populate_list_widget(
         #     self.upgrades.all_upgrades_for_gui, self.ui.upgrade_list_widget)
+        self.generate_thumbnails()
+
+    def generate_thumbnails(self):
+        """generates any missing card thumbnails for the current scale in the background"""
+        factor = self.card_loader.display_factor()
+        if factor >= 1:
+            return
+        sources = sorted(self.pilots_dir.glob("*.jpg")) + sorted(self.upgrades_dir.glob("*.jpg"))
+        worker = Worker(self.card_loader.thumbnail_store.generate, sources, factor)
+        self.threadpool.start(worker)
 
     def handle_squad_click(self):
-        item = self.squad_tree_selection
-        if item is None:
+        index = self.squad_tree_selection
+        if index is None:
             return
         self.ui.upgrade_list_widget.clear()
 
+        pilot_data = self.squad_model.pilot_data(index)
         # If you click on a pilot...
-        if treewidget_item_is_top_level(item):
-            pilot_data = self.squad.get_pilot_data(item)
+        if self.squad_model.is_pilot(index):
             filtered_for_gui = self.upgrades.filtered_upgrades_for_gui(
                 pilot_data.filtered_upgrades)
         # If you click on an upgrade slot...
         else:
-            pilot_data = self.squad.get_pilot_data(item.parent())
-            upgrade_slot = get_upgrade_slot_from_list_item_text(item.text(0))
+            upgrade_slot = self.squad_model.slot(index)
             filtered_upgrades = self.upgrades.filtered_upgrades_by_pilot_and_slot(
                 pilot_data, upgrade_slot)
             filtered_for_gui = self.upgrades.filtered_upgrades_for_gui(
@@ -238,94 +294,104 @@ class MainWindow(QtWidgets.QMainWindow):
         self.update_upgrade(self.squad_tree_upgrade_name_selection)
 
     def handle_squad_double_click(self):
-        item = self.squad_tree_selection
-        if item is None:
+        index = self.squad_tree_selection
+        if index is None:
             return
 
-        if treewidget_item_is_top_level(item):
+        if self.squad_model.is_pilot(index):
             self.unequip_pilot()
         else:
             self.unequip_upgrade()
 
-    def refresh_squad_upgrade_slots(self, parent_select_item: QtWidgets.QTreeWidgetItem = None, select_item: QtWidgets.QTreeWidgetItem = None, auto_include_bypass = True):
-        """rebuilds the squad list widget.  pass in args if you wish to set selection to the same prior to refresh"""
-        for item, pilot_data in self.squad.squad_dict.items():
-            # first clear the list
-            for i in reversed(range(item.childCount())):
-                item.removeChild(item.child(i))
-            # Add all child slots to the pilot item
-            item.setText(0, f"({pilot_data.initiative}) {prettify_name(pilot_data.pilot_name)} ({pilot_data.cost}) ({pilot_data.cost_with_upgrades})")
-            for slot in pilot_data.upgrade_slots:
-                child = QtWidgets.QTreeWidgetItem([prettify_name(slot)])
-                pixmap = image_path_to_qpixmap(
-                    self.upgrade_slots_dir / f"{slot}.png")
-                child.setIcon(0, pixmap)
-                item.addChild(child)
-                # sets the selection to the item clicked before the refresh
-                if parent_select_item == item and select_item.text(0).lower() == slot:
-                    self.ui.squad_tree_widget.clearSelection()
-                    child.setSelected(True)
-
-            # Update available upgrades based on squad
-            pilot_data.filtered_upgrades = self.upgrades.filtered_upgrades_by_pilot(
-                pilot_data, self.squad)
-
-            if not auto_include_bypass:
-                for upgrade in pilot_data.filtered_upgrades:
-                    auto_include = upgrade.get("autoinclude", "False") == "True"
-                    if auto_include:
-                        slots = self.upgrades.get_upgrade_slots(upgrade)
-                        equipped_upgrades = [upgrade.name for upgrade in pilot_data.equipped_upgrades]
-                        equipped = False
-                        if upgrade["name"] not in equipped_upgrades:
-                            equipped = pilot_data.equip_upgrade(slots, upgrade.get("name"), upgrade["cost"], upgrade)
-                        if equipped:
-                            logging.info(f"{prettify_name(upgrade['name'])} equipped automatically to {prettify_name(pilot_data.pilot_name)}")
-
-            # Now color in equipped upgrades
-            self.color_in_equipped_upgrades(item, pilot_data)
-            self.ui.squad_tree_widget.resizeColumnToContents(0)
-
-    def color_in_equipped_upgrades(self, parent_item: QtWidgets.QTreeWidgetItem, pilot_data: PilotEquip):
-        for upgrade in pilot_data.equipped_upgrades:
-            required_slots = upgrade.attributes['upgrade_slot_types']
-            for slot in required_slots:
-                # Find an available item
-                for child_idx in range(parent_item.childCount()):
-                    child_item = parent_item.child(child_idx)
-                    potential_slot = child_item.text(0).lower()
-                    gui_equipped = child_item.text(1)
-                    # empty string means nothing equipped here
-                    if len(gui_equipped) == 0 and potential_slot == slot:
-                        # Update icon to green (for equipped)
-                        pixmap = image_path_to_qpixmap(
-                            self.upgrade_slots_dir / f"{slot}.png", color="green")
-                        child_item.setIcon(0, pixmap)
-                        # update item column to the name
-                        child_item.setText(
-                            1, f'{prettify_name(upgrade.name)} ({upgrade.cost})')
-                        break
+    def refresh_squad_tree(self):
+        """
+        updates the squad tree after the squad builder changed the squad.  Only the rows of pilots
+        whose slots or upgrades changed are updated, so the selection is kept.
+        """
+        self.squad_model.refresh()
+        self.ui.squad_tree_view.resizeColumnToContents(0)
+
+    @contextmanager
+    def batch_update(self):
+        """
+        defers the squad views refresh (see squad_changed) until the outermost batch_update ends,
+        then refreshes them once if the squad changed.  Squad tree rows are still added and
+        removed immediately, so pilot ids can be used inside the batch.  The upgrades available
+        to the squad are refreshed once too, see SquadBuilder.batch.
+        """
+        self.__batch_depth += 1
+        try:
+            with self.squad_builder.batch():
+                yield
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0 and self.__refresh_pending:
+                self.__refresh_pending = False
+                self.squad_changed()
+
+    def squad_changed(self):
+        """
+        records an undo step and refreshes the squad views now, or at the end of the current
+        batch_update so that the whole batch is undone at once
+        """
+        if self.__batch_depth > 0:
+            self.__refresh_pending = True
+            return
+        self.squad_history.commit(self.squad)
+        self.update_undo_actions()
+        self.refresh_squad_views()
+
+    def update_undo_actions(self):
+        self.action_undo.setEnabled(self.squad_history.can_undo)
+        self.action_redo.setEnabled(self.squad_history.can_redo)
+
+    def undo(self):
+        snapshot = self.squad_history.undo()
+        if snapshot is not None:
+            self.restore_squad(snapshot)
+
+    def redo(self):
+        snapshot = self.squad_history.redo()
+        if snapshot is not None:
+            self.restore_squad(snapshot)
+
+    def restore_squad(self, snapshot: SquadSnapshot):
+        """sets the squad to a history snapshot, only the pilots that changed are updated in the tree"""
+        removed, added = self.squad_builder.restore(snapshot)
+        for pilot_id in removed:
+            self.squad_model.remove_pilot(pilot_id)
+        for pilot_id in added:
+            self.squad_model.add_pilot(pilot_id)
+            self.ui.squad_tree_view.expand(self.squad_model.pilot_index(pilot_id))
+        self.update_undo_actions()
+        self.refresh_squad_views()
+
+    def refresh_squad_views(self):
+        self.refresh_squad_tree()
+        self.handle_squad_click()
+        self.update_costs()
+        self.viewer.populate_squad_viewer(self.squad)
 
     def handle_copy_pilot(self):
-        if self.squad_tree_selection is None or not treewidget_item_is_top_level(self.squad_tree_selection):
+        index = self.squad_tree_selection
+        if index is None or not self.squad_model.is_pilot(index):
             logging.info(
                 "No pilot selected in squad tree - select an equipped pilot and try again.")
             return
-        top_level_idx = self.ui.squad_tree_widget.indexOfTopLevelItem(
-            self.squad_tree_selection)
-        item = self.ui.squad_tree_widget.topLevelItem(top_level_idx)
-        pilot_data = self.squad.get_pilot_data(item)
-        equipped_item = self.equip_pilot(pilot_data.faction_name, pilot_data.ship_name, pilot_data.pilot_name)
-        if equipped_item is not None:
-            new_pilot_data = self.squad.get_pilot_data(equipped_item)
+        pilot_data = self.squad_model.pilot_data(index)
+        with self.batch_update():
+            pilot_id = self.equip_pilot(pilot_data.faction_name, pilot_data.ship_name, pilot_data.pilot_name)
+            if pilot_id is None:
+                return
+            new_pilot_data = self.squad.get_pilot_data(pilot_id)
             for upgrade in pilot_data.equipped_upgrades:
+                if upgrade.name in [u.name for u in new_pilot_data.equipped_upgrades]:
+                    continue
                 if upgrade.name in [u['name'] for u in new_pilot_data.filtered_upgrades]:
-                    self.equip_upgrade(upgrade.name, new_pilot_data)
+                    self.equip_upgrade(upgrade.name, pilot_id)
                 else:
                     logging.info(f"Unable to equip {prettify_name(upgrade.name)}")
-            logging.info(f"{prettify_name(pilot_data.pilot_name)} successfully copied.")
-        else:
-            return
+        logging.info(f"{prettify_name(pilot_data.pilot_name)} successfully copied.")
 
     def handle_equip_pilot(self):
         if not self.pilot_name_selected:
@@ -337,76 +403,52 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         self.equip_pilot(faction_name, ship_name, self.pilot_name_selected)
 
-    def equip_pilot(self, faction_name: str, ship_name: str, pilot_name: str) -> Optional[QtWidgets.QTreeWidgetItem]:
-        pilot = self.xwing.get_pilot(
-            faction_name, ship_name, pilot_name)
-        ship = self.xwing.get_ship(faction_name, ship_name)
-        pilot_data = PilotEquip(ship, pilot)
-        # TODO: Turn this formatting into a function as it's also used by the ship module
-        item = QtWidgets.QTreeWidgetItem([f"({pilot_data.initiative}) {prettify_name(pilot_name)} ({pilot_data.cost}) (With Upgrades: {pilot_data.cost_with_upgrades})"])
-        added = self.squad.add_pilot(item, pilot_data)
-        if not added:
+    def equip_pilot(self, faction_name: str, ship_name: str, pilot_name: str) -> Optional[int]:
+        """adds a pilot to the squad, returns its pilot id or None if it can't be equipped"""
+        pilot_id = self.squad_builder.add_pilot(faction_name, ship_name, pilot_name)
+        if pilot_id is None:
             return None
 
-        self.ui.squad_tree_widget.insertTopLevelItem(
-            self.squad_tree_bottom_index, item)
-        self.refresh_squad_upgrade_slots(auto_include_bypass=False)
-        # self.ui.squad_tree_widget.resizeColumnToContents(0)
-        self.ui.squad_tree_widget.expandAll()
-        self.update_costs()
-        self.viewer.populate_squad_viewer(self.squad)
-        return item
+        self.squad_model.add_pilot(pilot_id)
+        self.ui.squad_tree_view.expand(self.squad_model.pilot_index(pilot_id))
+        self.squad_changed()
+        return pilot_id
 
     def unequip_pilot(self):
-        if self.squad_tree_selection is None:
+        index = self.squad_tree_selection
+        if index is None:
             logging.info(
                 "No pilot selected in squad tree - select a squad tree item and try again.")
-        top_level_idx = self.ui.squad_tree_widget.indexOfTopLevelItem(
-            self.squad_tree_selection)
-        item = self.ui.squad_tree_widget.topLevelItem(top_level_idx)
-        removed = self.squad.remove_pilot(item)
+            return
+        pilot_id = self.squad_model.pilot_id(index)
+        removed = self.squad_builder.remove_pilot(pilot_id)
         if removed:
-            self.ui.squad_tree_widget.takeTopLevelItem(top_level_idx)
-            self.refresh_squad_upgrade_slots()
-            self.update_costs()
-            self.viewer.populate_squad_viewer(self.squad)
+            self.squad_model.remove_pilot(pilot_id)
+            self.squad_changed()
 
     def handle_equip_upgrade(self):
-        if self.squad_tree_selection is None or treewidget_item_is_top_level(self.squad_tree_selection):
+        index = self.squad_tree_selection
+        if index is None or self.squad_model.is_pilot(index):
             return
         if self.upgrade_name_selected is None:
             logging.info("No upgrade selected - select an upgrade and try again.")
-        pilot_item = self.squad_tree_selection.parent()
-        pilot_data = self.squad.get_pilot_data(pilot_item)
-        self.equip_upgrade(self.upgrade_name_selected, pilot_data, self.squad_tree_selection.parent(), self.squad_tree_selection)
+            return
+        self.equip_upgrade(self.upgrade_name_selected, self.squad_model.pilot_id(index))
 
-    def equip_upgrade(self, upgrade_name: str, pilot_data: PilotEquip, parent_item=None, select_item=None):
-        upgrade_dict = self.upgrades.get_upgrade(upgrade_name)
-        upgrade_cost = Upgrades.get_filtered_upgrade_cost(
-            upgrade_dict, pilot_data)
-        upgrade_slots = Upgrades.get_upgrade_slots(upgrade_dict)
-        equipped = pilot_data.equip_upgrade(
-            upgrade_slots, upgrade_name, upgrade_cost, upgrade_dict)
-        if equipped:
-            self.refresh_squad_upgrade_slots(parent_select_item=parent_item, select_item=select_item)
-        self.handle_squad_click()
-        self.update_costs()
-        self.viewer.populate_squad_viewer(self.squad)
+    def equip_upgrade(self, upgrade_name: str, pilot_id: int):
+        if self.squad_builder.equip_upgrade(pilot_id, upgrade_name):
+            self.squad_changed()
 
     def unequip_upgrade(self):
-        if self.squad_tree_selection is None or treewidget_item_is_top_level(self.squad_tree_selection):
+        index = self.squad_tree_selection
+        if index is None or self.squad_model.is_pilot(index):
             return
-        pilot_item = self.squad_tree_selection.parent()
-        pilot_data = self.squad.get_pilot_data(pilot_item)
         # Something is equipped
         if len(self.squad_tree_upgrade_name_selection) > 0:
-            unequipped = pilot_data.unequip_upgrade(
-                self.squad_tree_upgrade_name_selection)
+            unequipped = self.squad_builder.unequip_upgrade(
+                self.squad_model.pilot_id(index), self.squad_tree_upgrade_name_selection)
             if unequipped:
-                self.refresh_squad_upgrade_slots(self.squad_tree_selection.parent(), self.squad_tree_selection)
-        self.handle_squad_click()
-        self.update_costs()
-        self.viewer.populate_squad_viewer(self.squad)
+                self.squad_changed()
 
     def update_costs(self):
         """updates the UI cost labels based on squad list"""
@@ -421,16 +463,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.ui.total_cost_label.setText(str(total_cost))
 
     @property
-    def squad_tree_bottom_index(self):
-        return self.ui.squad_tree_widget.topLevelItemCount()
-
-    @property
-    def squad_tree_selection(self) -> QtWidgets.QTreeWidgetItem:
+    def squad_tree_selection(self) -> Optional[QtCore.QModelIndex]:
+        """returns the index of the selected squad tree row (first column)"""
         try:
-            val = self.ui.squad_tree_widget.selectedItems()[0]
+            val = self.ui.squad_tree_view.selectionModel().selectedIndexes()[0]
         except IndexError:
             return
-        return val
+        return val.siblingAtColumn(0)
 
     def handle_new_upgrade_data(self, data):
         insert_flag = self.definition_form.insert_new_upgrade_entry(data)
@@ -495,10 +534,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
     @pilot_image_label.setter
     def pilot_image_label(self, pilot_name: str):
-        self.ui.main_card_viewer.set_card(
-            image_path_to_qpixmap(self.pilots_dir / f"{pilot_name}.jpg"))
+        prefetch = [self.pilots_dir / f"{get_pilot_name_from_list_item_text(item.text())}.jpg"
+                    for item in list_widget_neighbours(self.ui.pilot_list_widget)]
+        self.card_loader.request("pilot", self.pilots_dir / f"{pilot_name}.jpg",
+                                 self.ui.main_card_viewer.set_card, prefetch)
 
     def update_pilot(self):
+        self.card_loader.cancel("upgrade")
         self.ui.main_card_viewer.add_card(None)
         self.ui.upgrade_list_widget.blockSignals(True)
         self.ui.upgrade_list_widget.clear()
@@ -532,8 +574,10 @@ class MainWindow(QtWidgets.QMainWindow):
     def update_upgrade(self, upgrade_name):
         if upgrade_name is None:
             return
-        self.ui.main_card_viewer.add_card(
-            image_path_to_qpixmap(self.upgrades_dir / f"{upgrade_name}.jpg"))
+        prefetch = [self.upgrades_dir / f"{get_upgrade_name_from_list_item_text(item.text())}.jpg"
+                    for item in list_widget_neighbours(self.ui.upgrade_list_widget)]
+        self.card_loader.request("upgrade", self.upgrades_dir / f"{upgrade_name}.jpg",
+                                 self.ui.main_card_viewer.add_card, prefetch)
 
     @property
     def faction_selected(self) -> str:
@@ -597,16 +641,16 @@ class MainWindow(QtWidgets.QMainWindow):
 
     @property
     def squad_tree_upgrade_name_selection(self) -> str:
-        """returns the encoded lowercase name of the selected upgrade from the squad tree widget."""
+        """returns the encoded lowercase name of the upgrade equipped in the selected squad tree slot,
+        an empty string if nothing is equipped there."""
 
-        try:
-            val = get_upgrade_name_from_list_item_text(
-                self.squad_tree_selection.text(1))
-        except IndexError:
+        index = self.squad_tree_selection
+        if index is None:
             logging.info(
                 "No squad tree item selected - select an item from the squad tree and try again.")
             return
-        return val
+        upgrade = self.squad_model.equipped_upgrade(index)
+        return "" if upgrade is None else upgrade.name
 
     @property
     def data_dir(self) -> Path:
@@ -641,6 +685,7 @@ class MainWindow(QtWidgets.QMainWindow):
         return Path(__file__).parents[1] / "data" / "resources" / "actions"
 
     def check_theme(self):
+        pixmap_cache().clear()
         app = QtWidgets.QApplication.instance()
         if self.settings_window.ui.theme_combo_box.currentText() == Settings.Theme.DARK.value:
             app.setStyle("Fusion")
@@ -698,46 +743,166 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             logging.info("Equip a pilot before trying to export your squad.")
 
+    def export_squad_lists(self):
+        """exports a file of squad lists (see squad_validator) to one workbook on the threadpool"""
+        options = QtWidgets.QFileDialog.Options()
+        source, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Export Squad Lists", "", "Squad Lists (*.jsonl *.json)", options=options
+        )
+        if not source:
+            return
+        filename, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Save As", "", "Excel Workbook (*.xlsx)", options=options
+        )
+        if not filename:
+            return
+        # The worker builds the squads from its own model, the GUI keeps using self.xwing and self.upgrades
+        worker = Worker(self.write_squad_lists, self.xwing.data, Path(source), filename, report_progress=True)
+        worker.signals.progress.connect(self.handle_export_progress)
+        worker.signals.result.connect(
+            lambda count: self.ui.statusbar.showMessage(f"Exported {count} squads to {filename}"))
+        self.threadpool.start(worker)
+
+    def handle_export_progress(self, done: int, total: int):
+        self.ui.statusbar.showMessage(f"Exporting squads... {done}/{total}")
+
+    @staticmethod
+    def write_squad_lists(data: dict, source: Path, filename: str, progress_callback=None) -> int:
+        """
+        builds the squad lists in source one at a time while they are written, returns how many were written.
+        Safe to call off the GUI thread: the squads are built from a model of their own over the definition data.
+        """
+        xwing = XWing(data)
+        upgrades = Upgrades(xwing.upgrades)
+        # Parsed up front so that the progress total only counts the lists that will be written
+        squad_lists = []
+        for item_source, text in read_squad_lists(source):
+            try:
+                squad_list = json.loads(text)
+            except json.JSONDecodeError as e:
+                logging.warning(f"Skipping {item_source}: {e}")
+                continue
+            error = squad_list_error(squad_list)
+            if error is not None:
+                logging.warning(f"Skipping {item_source}: {error}")
+                continue
+            squad_lists.append((item_source, squad_list))
+
+        def squads():
+            for item_source, squad_list in squad_lists:
+                squad, errors = build_squad_list(xwing, upgrades, squad_list)
+                if errors:
+                    logging.warning(f"{item_source} breaks {len(errors)} rule(s), exporting the legal part")
+                yield squad_list.get("name", item_source), squad
+
+        return export_squads_as_excel(filename, squads(), len(squad_lists), progress_callback)
+
     def import_excel(self):
         # TODO: Add checks for proper formatting (so you can't try to import any excel sheet)
         # TODO: This will only work for standard or epic mode
-        if self.ready_for_export:
-            buttonReply = QtWidgets.QMessageBox.question(
-                self, "Warning", "Squad already in progress.  Are you sure you want to import?", QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel)
-            if buttonReply == QtWidgets.QMessageBox.Cancel:
-                return
+        if not self.confirm_replace_squad():
+            return
         options = QtWidgets.QFileDialog.Options()
         filename, _ = QtWidgets.QFileDialog.getOpenFileName(
             self, "Import Squad", "", "Excel Workbook (*.xlsx)", options=options
         )
         if not filename:
             return
-        self.squad = Squad()
-        self.ui.squad_tree_widget.clear()
-
-        workbook = load_workbook(filename)
+        workbook = load_workbook(filename, read_only=True)
         worksheet = workbook.active
         squad_name = worksheet['B1'].value
         faction_name = gui_text_encode(worksheet['B2'].value)
+        entries = []
+        for row in worksheet.iter_rows(min_row=5, values_only=True):
+            if not row or row[0] is None:
+                break
+            upgrade_names = []
+            for value in row[4:]:
+                if value is None:
+                    break
+                upgrade_names.append(gui_text_encode(value))
+            entries.append(PilotEntry(faction_name, gui_text_encode(row[1]), gui_text_encode(row[0]), upgrade_names))
+        workbook.close()
+
+        builder = SquadBuilder(self.xwing, self.upgrades)
+        builder.add_pilots(entries)
+        self.load_squad(builder.squad, squad_name)
+
+    def load_squad(self, squad: Squad, squad_name: str):
+        """replaces the squad by one built in the model, updating the views once"""
+        self.squad = squad
+        self.squad_builder.squad = squad
+        self.squad_model.set_squad(squad)
         self.ui.squad_name_line_edit.setText(squad_name)
-        row_idx = 5
-        while worksheet[f'A{row_idx}'].value is not None:
-            pilot_name = gui_text_encode(worksheet[f'A{row_idx}'].value)
-            ship_name = gui_text_encode(worksheet[f'B{row_idx}'].value)
-            self.equip_pilot(faction_name, ship_name, pilot_name)
-            col_idx = 5
-            while worksheet[f'{get_column_letter(col_idx)}{row_idx}'].value is not None:
-                upgrade_val = gui_text_encode(worksheet[f'{get_column_letter(col_idx)}{row_idx}'].value)
-                pilot_data = self.squad.get_pilot_data_from_name(pilot_name)
-                self.equip_upgrade(upgrade_val, pilot_data)
-                col_idx += 1
-
-            row_idx += 1
+        self.ui.squad_tree_view.expandAll()
+        self.squad_changed()
+        faction_name = SquadFormat.squad_faction(squad)
         for i in range(self.ui.faction_list_widget.count()):
             item = self.ui.faction_list_widget.item(i)
             if gui_text_encode(item.text()) == faction_name:
                 item.setSelected(True)
 
+    def confirm_replace_squad(self) -> bool:
+        if self.ready_for_export:
+            buttonReply = QtWidgets.QMessageBox.question(
+                self, "Warning", "Squad already in progress.  Are you sure you want to import?", QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel)
+            if buttonReply == QtWidgets.QMessageBox.Cancel:
+                return False
+        return True
+
+    def load_squad_read(self, squad_read: SquadRead):
+        for error in squad_read.errors:
+            logging.warning(f"Not imported: {error}")
+        self.load_squad(squad_read.squad, squad_read.name)
+
+    def export_xws(self):
+        if not self.ready_for_export:
+            logging.info("Equip a pilot before trying to export your squad.")
+            return
+        options = QtWidgets.QFileDialog.Options()
+        filename, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Save As", "", "XWS Squad (*.json)", options=options
+        )
+        if filename:
+            with open(filename, "w", encoding="utf-8") as file:
+                json.dump(self.squad_format.to_xws(self.squad, self.squad_name), file, indent=2)
+            logging.info(f"Successfully exported squad to {filename}")
+
+    def import_xws(self):
+        if not self.confirm_replace_squad():
+            return
+        options = QtWidgets.QFileDialog.Options()
+        filename, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Import Squad", "", "XWS Squad (*.json)", options=options
+        )
+        if not filename:
+            return
+        try:
+            with open(filename, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, json.JSONDecodeError) as e:
+            logging.error(f"Unable to read {filename}: {e}")
+            return
+        if not isinstance(data, dict):
+            logging.error(f"Unable to read {filename}: expected a JSON object")
+            return
+        self.load_squad_read(self.squad_format.from_xws(data))
+
+    def copy_squad_code(self):
+        if not self.ready_for_export:
+            logging.info("Equip a pilot before trying to export your squad.")
+            return
+        QtWidgets.QApplication.clipboard().setText(self.squad_format.to_code(self.squad, self.squad_name))
+        logging.info("Squad code copied to the clipboard.")
+
+    def import_squad_code(self):
+        if not self.confirm_replace_squad():
+            return
+        code, ok = QtWidgets.QInputDialog.getText(
+            self, "Import Squad Code", "Squad code:", text=QtWidgets.QApplication.clipboard().text())
+        if ok and code:
+            self.load_squad_read(self.squad_format.from_code(code))
+
     def closeEvent(self, event):
         buttonReply = QtWidgets.QMessageBox.question(
             self, "Warning", "Are you sure you want to quit?", QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.Cancel)
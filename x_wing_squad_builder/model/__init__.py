@@ -3,4 +3,5 @@ from .faction import Faction
 from .ship import Ship
 from .pilot_equip import PilotEquip
 from .squad import Squad
-from .upgrade import Upgrades
\ No newline at end of file
+from .upgrade import Upgrades
+from .squad_builder import SquadBuilder
@@ -1,5 +1,7 @@
+import sys
 from enum import Enum
 from dataclasses import dataclass
+from functools import lru_cache
 
 class Statistics(Enum):
     ATTACKS = "attacks"
@@ -27,10 +29,58 @@ class Attributes(Enum):
     COST = "cost"
     KEYWORDS = "keywords"
 
-@dataclass
+@dataclass(frozen=True)
 class Action:
+    __slots__ = ("action", "color", "action_link", "color_link")
     action: str
     color: str
     action_link: str
     color_link: str
 
+
+@lru_cache(maxsize=None)
+def _action(action: str, color: str, action_link: str, color_link: str) -> Action:
+    return Action(action, color, action_link, color_link)
+
+
+def action_record(action: dict) -> Action:
+    """returns the Action of an action entry of the definition, equal entries share one instance"""
+    return _action(action["action"], action["color"], action["action_link"], action["color_link"])
+
+
+def share_definition(data):
+    """
+    returns the definition data with every repeated value stored once: equal dicts and lists
+    (in the same key order) become one shared instance and strings are interned.  Most of the
+    definition is repeated, such as the {"low": null, "high": null} restriction ranges of every
+    upgrade, so this keeps a fraction of the memory.
+
+    The result must not be mutated in place, a change to one entry would change every entry
+    sharing it.  Edit a definition loaded without sharing (see load_definition).
+    """
+    memo = {}
+
+    def share(value):
+        value_type = type(value)
+        if value_type is str:
+            return sys.intern(value)
+        if value_type is dict:
+            items = [(share(key), share(item)) for key, item in value.items()]
+            key = (dict, tuple((item_key, identity(item)) for item_key, item in items))
+        elif value_type is list:
+            items = [share(item) for item in value]
+            key = (list, tuple(identity(item) for item in items))
+        else:
+            return value
+        shared = memo.get(key)
+        if shared is None:
+            # The memo keeps the instances alive, so the ids used in the keys stay unique
+            shared = memo[key] = dict(items) if value_type is dict else items
+        return shared
+
+    def identity(value):
+        """returns a key equal for equal shared values"""
+        return id(value) if type(value) in (dict, list) else (type(value), value)
+
+    return share(data)
+
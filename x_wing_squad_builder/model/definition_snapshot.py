@@ -0,0 +1,127 @@
+"""
+Binary snapshot of definition.json.
+
+Parsing the full definition file is the largest single startup cost, so the parsed
+data is pickled into the cache directory and loaded in its place.  A snapshot is
+only trusted while the source file matches the stamp stored alongside it:
+the size and mtime are checked first, and the content hash is used as a fallback
+so that touching the file (e.g. a fresh checkout) does not force a reparse.
+
+The shared definition (see definition.share_definition) has its own snapshot, pickle keeps
+the sharing so it is only computed again when the file changes.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from contextlib import suppress
+from pathlib import Path
+from typing import Optional, Union
+
+from .definition import share_definition
+from ..settings import Settings
+
+# Bump this whenever the snapshot layout changes to discard stale snapshots.
+SNAPSHOT_VERSION = 1
+
+
+def snapshot_path_for(data_path: Union[str, Path], snapshot_dir: Optional[Path] = None,
+                      shared: bool = False) -> Path:
+    """returns the snapshot location for a given definition file.
+
+    Snapshots are keyed by the absolute source path so multiple definition files
+    (e.g. the test data) never overwrite each other."""
+    data_path = Path(data_path).absolute()
+    if snapshot_dir is None:
+        snapshot_dir = Settings().cache_dir / "definition"
+    key = hashlib.sha1(str(data_path).encode("utf-8")).hexdigest()[:16]
+    suffix = "-shared" if shared else ""
+    return snapshot_dir / f"{data_path.stem}-{key}{suffix}.pickle"
+
+
+def _file_digest(data_path: Path) -> str:
+    with open(data_path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def _stamp(data_path: Path, digest: Optional[str] = None) -> dict:
+    stat = data_path.stat()
+    return {
+        "version": SNAPSHOT_VERSION,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": digest if digest is not None else _file_digest(data_path),
+    }
+
+
+def write_snapshot(data_path: Union[str, Path], data: dict, snapshot_dir: Optional[Path] = None,
+                   digest: Optional[str] = None, shared: bool = False) -> bool:
+    """writes a snapshot of data, stamped with the current state of data_path.
+    returns True if the snapshot was written"""
+    data_path = Path(data_path)
+    snapshot_path = snapshot_path_for(data_path, snapshot_dir, shared)
+    # Pools load the definition in every process at once, each writer needs its own temporary file
+    tmp_path = snapshot_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as file:
+            pickle.dump(_stamp(data_path, digest), file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path)
+    except (OSError, pickle.PickleError) as e:
+        logging.debug(f"Unable to write definition snapshot {snapshot_path}: {e}")
+        with suppress(OSError):
+            tmp_path.unlink()
+        return False
+    return True
+
+
+def read_snapshot(data_path: Union[str, Path], snapshot_dir: Optional[Path] = None,
+                  shared: bool = False) -> Optional[dict]:
+    """returns the snapshot data if it is still valid for data_path, otherwise None"""
+    data_path = Path(data_path)
+    snapshot_path = snapshot_path_for(data_path, snapshot_dir, shared)
+    try:
+        with open(snapshot_path, "rb") as file:
+            stamp = pickle.load(file)
+            if stamp.get("version") != SNAPSHOT_VERSION:
+                return None
+            stat = data_path.stat()
+            if stamp["mtime_ns"] == stat.st_mtime_ns and stamp["size"] == stat.st_size:
+                return pickle.load(file)
+            if stamp["size"] != stat.st_size:
+                return None
+            digest = _file_digest(data_path)
+            if stamp["sha256"] != digest:
+                return None
+            data = pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, KeyError, TypeError) as e:
+        logging.debug(f"Ignoring unreadable definition snapshot {snapshot_path}: {e}")
+        return None
+    # Same content with a new mtime, restamp so the next load takes the fast path.
+    write_snapshot(data_path, data, snapshot_dir, digest, shared)
+    return data
+
+
+def load_definition(data_path: Union[str, Path], snapshot_dir: Optional[Path] = None, shared: bool = False) -> dict:
+    """returns the parsed definition data, using the snapshot when it is up to date.
+
+    Every call returns a new object, so callers are free to mutate the result, unless shared is
+    True: the data is then returned with its repeated values shared (see share_definition),
+    which is smaller but read only."""
+    data = read_snapshot(data_path, snapshot_dir, shared)
+    if data is not None:
+        return data
+    if shared:
+        data = share_definition(load_definition(data_path, snapshot_dir))
+        write_snapshot(data_path, data, snapshot_dir, shared=True)
+        return data
+    with open(data_path, "rb") as file:
+        raw = file.read()
+    data = json.loads(raw)
+    write_snapshot(data_path, data, snapshot_dir, hashlib.sha256(raw).hexdigest())
+    return data
@@ -1,16 +1,22 @@
 from typing import List, Tuple, Optional
 from .ship import Ship
 
-from ..settings import Settings
+from ..settings import settings_snapshot
 
 from ..utils import prettify_name
 
 
 class Faction:
-    settings = Settings()
+    __slots__ = ("faction_data", "__ships", "__ship_index")
+    settings = settings_snapshot()
 
     def __init__(self, data: dict):
         self.faction_data = data
+        # Ship instances are built once and kept alive, indexed by name for get_ship.
+        self.__ships = [Ship(self.faction_name, ship) for ship in self.faction_data['ships']]
+        self.__ship_index = {}
+        for ship in self.__ships:
+            self.__ship_index.setdefault(ship.ship_name, ship)
 
     def __repr__(self):
         return f"Faction(name={self.faction_name})"
@@ -21,21 +27,18 @@ class Faction:
 
     @property
     def faction_ships(self) -> List[Ship]:
-        ships = []
-        for ship in self.faction_data['ships']:
-            new_ship = Ship(self.faction_name, ship)
-            if self.settings.mode != Settings.Mode.EPIC:
-                if new_ship.base == "huge":
-                    continue
-            ships.append(new_ship)
-        return ships
+        if not self.settings.epic:
+            return [ship for ship in self.__ships if ship.base != "huge"]
+        return self.__ships.copy()
 
     @property
     def ship_names_for_gui(self):
         return sorted([prettify_name(ship.ship_name) for ship in self.faction_ships])
 
     def get_ship(self, ship_name: str) -> Optional[Ship]:
-        for ship in self.faction_ships:
-            if ship_name == ship.ship_name:
-                return ship
-        return None
+        ship = self.__ship_index.get(ship_name)
+        if ship is None:
+            return None
+        if ship.base == "huge" and not self.settings.epic:
+            return None
+        return ship
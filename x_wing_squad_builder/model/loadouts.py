@@ -0,0 +1,439 @@
+"""
+Upgrade loadouts of single pilots, scored by a weighted sum of metrics.
+
+Enumerating every set of upgrades a pilot can equip is far too slow (tens of thousands of sets
+for a pilot with four slots), so loadouts are built in two steps:
+
+1. Structural upgrades, which change what else can be equipped (they add or remove slots or
+   actions, use a weapon hardpoint, or are auto included), are equipped one after the other
+   with a SquadBuilder, so every rule of the GUI applies.
+2. For every structural state, the remaining (plain) upgrades only consume slots and points.
+   They are combined with a knapsack over the free slots that only keeps the loadouts on the
+   Pareto frontier of cost, value and unique names.
+
+Upgrades that only become available when another squad member is present (squad_include)
+are not considered, as a single pilot is evaluated in an empty squad.
+
+A LoadoutTable can be saved to a cache file.  Every pilot's frontier is stored with the upgrades
+and slots it depended on, so when the definition changes only the pilots affected by the
+changed upgrades are computed again.
+"""
+import bisect
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from collections import Counter, namedtuple
+from contextlib import suppress
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+from .pilot_equip import PilotEquip
+from ..settings import Settings, settings_snapshot
+from .squad_builder import SquadBuilder
+from .unique_upgrades import UNIQUE_UPGRADES, get_root
+from .upgrade import Upgrades
+from .xwing import XWing
+
+# pilot: value of the pilot with its structural upgrades equipped
+# upgrade: value added by a plain upgrade, from the upgrade and its cost for the pilot
+Metric = namedtuple('Metric', ['pilot', 'upgrade'])
+
+# pilot: (faction name, ship name, pilot name), upgrades: in equip order, cost: including the pilot,
+# uniques: name roots no other squad member may use
+Loadout = namedtuple('Loadout', ['pilot', 'upgrades', 'cost', 'value', 'uniques'])
+
+# loadouts: the Pareto frontier, upgrades: names available to the pilot in some state,
+# slots: slot types the pilot had in some state.  Upgrades outside of both can't change the frontier.
+PilotFrontier = namedtuple('PilotFrontier', ['loadouts', 'upgrades', 'slots'])
+
+PilotKey = Tuple[str, str, str]
+
+# Bump this whenever the cache file layout or the loadout computation changes
+LOADOUT_TABLE_VERSION = 1
+
+
+def statistic(name: str, key: Optional[str] = None) -> Callable[[PilotEquip], int]:
+    def value(pilot: PilotEquip) -> int:
+        stat = PilotEquip.get_statistic(pilot.statistics, name)[name]
+        if key is not None:
+            stat = stat.get(key)
+        return stat or 0
+    return value
+
+
+def no_value(upgrade: dict, cost: int) -> int:
+    return 0
+
+
+METRICS: Dict[str, Metric] = {
+    "hull": Metric(statistic("hull"), no_value),
+    "shields": Metric(statistic("shield", "shield"), no_value),
+    "agility": Metric(statistic("agility"), no_value),
+    "initiative": Metric(lambda pilot: pilot.initiative, no_value),
+    "attack": Metric(lambda pilot: pilot.max_attack, no_value),
+    "upgrades": Metric(lambda pilot: len(pilot.equipped_upgrades), lambda upgrade, cost: 1),
+    "points": Metric(lambda pilot: pilot.cost_with_upgrades, lambda upgrade, cost: cost),
+}
+
+
+def check_weights(weights: Dict[str, float]) -> Dict[str, float]:
+    """returns weights if every metric is known and no weight is negative"""
+    for name, weight in weights.items():
+        if name not in METRICS:
+            raise ValueError(f"Unknown metric {name}, expected one of {', '.join(METRICS)}")
+        if weight < 0:
+            raise ValueError(f"Negative weight for {name}")
+    return weights
+
+
+def pilot_value(pilot: PilotEquip, weights: Dict[str, float]) -> float:
+    return sum(weight * METRICS[name].pilot(pilot) for name, weight in weights.items())
+
+
+def upgrade_value(upgrade: dict, cost: int, weights: Dict[str, float]) -> float:
+    return sum(weight * METRICS[name].upgrade(upgrade, cost) for name, weight in weights.items())
+
+
+def unique_roots(names: Iterable[str]) -> FrozenSet[str]:
+    """returns the roots of the unique or solitary names (see Squad.pilot_error and Upgrades.filter_squad_dependent)"""
+    return frozenset(root for root in map(get_root, names) if root in UNIQUE_UPGRADES)
+
+
+def restricted_actions(upgrades: Upgrades) -> FrozenSet[str]:
+    """returns the actions some upgrade requires the pilot to have"""
+    return frozenset(action["action"] for upgrade in upgrades
+                     for action in (Upgrades.get_upgrade_restrictions(upgrade) or {}).get("actions", []))
+
+
+def is_structural(upgrade: dict, pilot: PilotEquip, required_actions: FrozenSet[str]) -> bool:
+    """returns True if equipping the upgrade may change which other upgrades the pilot can equip"""
+    if upgrade.get("autoinclude", "False") == "True":
+        return True
+    modifications = upgrade.get("modifications") or {}
+    upgrade_slots = modifications.get("upgrade_slots") or {}
+    if upgrade_slots.get("added") or upgrade_slots.get("removed"):
+        return True
+    if any(action["action"] in required_actions for action in modifications.get("actions", [])):
+        return True
+    return any(slot in pilot.hardpoint for slot in Upgrades.get_upgrade_slots(upgrade))
+
+
+def pareto_frontier(loadouts: Iterable[Loadout]) -> List[Loadout]:
+    """
+    returns the loadouts no other loadout dominates, cheapest first.  A loadout dominates another
+    if it costs no more, is worth as much and its unique names are a subset of the other's.
+    """
+    frontier: List[Loadout] = []
+    # Best value kept so far per set of unique names, every kept loadout is at most as expensive
+    best: Dict[FrozenSet[str], float] = {}
+    for loadout in sorted(loadouts, key=lambda loadout: (loadout.cost, -loadout.value, len(loadout.uniques))):
+        if any(value >= loadout.value for uniques, value in best.items() if uniques <= loadout.uniques):
+            continue
+        frontier.append(loadout)
+        best[loadout.uniques] = max(best.get(loadout.uniques, loadout.value), loadout.value)
+    return frontier
+
+
+def extend(loadout: Loadout, extension: Loadout) -> Loadout:
+    return Loadout(loadout.pilot, loadout.upgrades + extension.upgrades, loadout.cost + extension.cost,
+                   loadout.value + extension.value, loadout.uniques | extension.uniques)
+
+
+def combine(loadouts: List[Loadout], extensions: List[Loadout], budget: int) -> List[Loadout]:
+    """returns the frontier of every loadout extended with every compatible extension"""
+    return pareto_frontier(extend(loadout, extension) for loadout in loadouts for extension in extensions
+                           if loadout.cost + extension.cost <= budget and not loadout.uniques & extension.uniques)
+
+
+# Extensions are loadouts without a pilot, holding the upgrades added to a loadout
+NO_EXTENSION = Loadout(None, (), 0, 0, frozenset())
+
+
+def slot_knapsack(items: List[Tuple[Counter, Loadout]], capacity: Counter,
+                  budget: int) -> Dict[Tuple[int, ...], List[Loadout]]:
+    """
+    combines the (needed slots, extension) items into extensions fitting capacity, returns
+    the frontier of the extensions per number of slots used of each type (sorted by type)
+    """
+    slot_types = sorted(capacity)
+    groups: Dict[Tuple[int, ...], List[Loadout]] = {tuple(0 for _ in slot_types): [NO_EXTENSION]}
+    for needed, item in items:
+        for used, extensions in list(groups.items()):
+            extended_used = tuple(count + needed[slot] for slot, count in zip(slot_types, used))
+            if any(count > capacity[slot] for slot, count in zip(slot_types, extended_used)):
+                continue
+            extended = [extend(extension, item) for extension in extensions
+                        if extension.cost + item.cost <= budget and not extension.uniques & item.uniques]
+            if extended:
+                groups[extended_used] = pareto_frontier(groups.get(extended_used, []) + extended)
+    return groups
+
+
+def plain_loadouts(base: Loadout, free_slots: List[str], plain: List[Tuple[dict, int]],
+                   weights: Dict[str, float], budget: int,
+                   memo: Dict[tuple, List[Loadout]]) -> List[Loadout]:
+    """
+    returns the frontier of base extended with plain upgrades, given as (upgrade, cost) pairs.
+
+    Upgrades using several slots are combined first, then each slot type is filled with the
+    upgrades using only that slot.  The frontier of a slot type is kept in memo, as it is usually
+    the same for every structural state of the pilot.
+    """
+    capacity = Counter(free_slots)
+    single: Dict[str, List[Tuple[Counter, Loadout]]] = {}
+    multi: List[Tuple[Counter, Loadout]] = []
+    # Upgrades that are not unique and use the same slots for the same cost and value are interchangeable,
+    # only as many of them as fit in the free slots together are kept
+    interchangeable = Counter()
+    for upgrade, cost in plain:
+        needed = Counter(Upgrades.get_upgrade_slots(upgrade))
+        if any(needed[slot] > capacity[slot] for slot in needed):
+            continue
+        value = upgrade_value(upgrade, cost, weights)
+        uniques = unique_roots([upgrade["name"]])
+        if not uniques:
+            key = (tuple(sorted(needed.items())), cost, value)
+            if interchangeable[key] >= min(capacity[slot] // count for slot, count in needed.items()):
+                continue
+            interchangeable[key] += 1
+        item = (needed, Loadout(None, (upgrade["name"],), cost, value, uniques))
+        if len(needed) == 1 and sum(needed.values()) == 1:
+            single.setdefault(next(iter(needed)), []).append(item)
+        else:
+            multi.append(item)
+
+    loadouts = []
+    for used, extensions in slot_knapsack(multi, capacity, budget - base.cost).items():
+        left = capacity - Counter(dict(zip(sorted(capacity), used)))
+        combined = [extend(base, extension) for extension in extensions]
+        for slot in sorted(single):
+            if left[slot] == 0:
+                continue
+            key = (slot, left[slot], tuple(item.upgrades for _, item in single[slot]))
+            frontier = memo.get(key)
+            if frontier is None:
+                groups = slot_knapsack(single[slot], Counter({slot: left[slot]}), budget)
+                frontier = pareto_frontier(extension for extensions in groups.values() for extension in extensions)
+                memo[key] = frontier
+            combined = combine(combined, frontier, budget)
+        loadouts.extend(combined)
+    return pareto_frontier(loadouts)
+
+
+def pilot_loadouts(xwing: XWing, upgrades: Upgrades, pilot_key: PilotKey, weights: Dict[str, float],
+                   budget: int) -> List[Loadout]:
+    """returns the Pareto frontier of the pilot's loadouts costing at most budget, cheapest first"""
+    return pilot_frontier(xwing, upgrades, pilot_key, weights, budget).loadouts
+
+
+def pilot_frontier(xwing: XWing, upgrades: Upgrades, pilot_key: PilotKey, weights: Dict[str, float],
+                   budget: int) -> PilotFrontier:
+    """returns the pilot's loadouts (see pilot_loadouts) and what they depend on"""
+    required_actions = restricted_actions(upgrades)
+    builder = SquadBuilder(xwing, upgrades)
+    pilot_id = builder.add_pilot(*pilot_key)
+    if pilot_id is None:
+        return PilotFrontier([], frozenset(), frozenset())
+    pilot = builder.squad.get_pilot_data(pilot_id)
+    loadouts: List[Loadout] = []
+    seen = set()
+    memo: Dict[tuple, List[Loadout]] = {}
+    available_upgrades = set()
+    slots = set()
+
+    def visit():
+        equipped = tuple(upgrade.name for upgrade in pilot.equipped_upgrades)
+        if frozenset(equipped) in seen or pilot.cost_with_upgrades > budget:
+            return
+        seen.add(frozenset(equipped))
+        available_upgrades.update(upgrade["name"] for upgrade in pilot.filtered_upgrades)
+        slots.update(pilot.upgrade_slots)
+        structural = []
+        plain = []
+        for upgrade in pilot.filtered_upgrades:
+            if upgrade["name"] in equipped:
+                continue
+            if is_structural(upgrade, pilot, required_actions):
+                structural.append(upgrade)
+            else:
+                plain.append((upgrade, upgrade["cost"]))
+        base = Loadout(pilot_key, equipped, pilot.cost_with_upgrades, pilot_value(pilot, weights),
+                       unique_roots((pilot.pilot_name,) + equipped))
+        loadouts.extend(plain_loadouts(base, pilot.available_upgrade_slots, plain, weights, budget, memo))
+
+        for upgrade in structural:
+            # The same upgrades equipped in another order
+            if frozenset(equipped + (upgrade["name"],)) in seen:
+                continue
+            upgrade_slots = Upgrades.get_upgrade_slots(upgrade)
+            if pilot.equip_upgrade_error(upgrade_slots, upgrade["name"], upgrade) is not None:
+                continue
+            if builder.equip_upgrade(pilot_id, upgrade["name"]):
+                visit()
+                builder.unequip_upgrade(pilot_id, upgrade["name"])
+
+    visit()
+    return PilotFrontier(pareto_frontier(loadouts), frozenset(available_upgrades), frozenset(slots))
+
+
+def fingerprint(data) -> str:
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def upgrade_fingerprints(upgrades: Upgrades) -> Dict[str, str]:
+    return {upgrade["name"]: fingerprint(upgrade) for upgrade in upgrades}
+
+
+def loadout_table_path(data_path: Union[str, Path], weights: Dict[str, float], budget: int,
+                       cache_dir: Optional[Path] = None) -> Path:
+    """returns the cache file of the loadout table of a definition file, for the weights, budget and current mode"""
+    data_path = Path(data_path).absolute()
+    if cache_dir is None:
+        cache_dir = Settings().cache_dir / "loadouts"
+    key = fingerprint([str(data_path), sorted(weights.items()), budget, settings_snapshot().mode.value])[:16]
+    return cache_dir / f"{data_path.stem}-{key}.pickle"
+
+
+# Definition used by compute_frontier, one per pool process
+_context = None
+
+
+def init_context(data: dict, mode: Settings.Mode, weights: Dict[str, float], budget: int):
+    """initializer of the LoadoutTable.compute pool"""
+    global _context
+    if settings_snapshot().mode != mode:
+        settings_snapshot().update(mode=mode)
+    xwing = XWing(data)
+    _context = (xwing, Upgrades(xwing.upgrades), weights, budget)
+
+
+def compute_frontier(pilot_key: PilotKey) -> Tuple[PilotKey, PilotFrontier]:
+    xwing, upgrades, weights, budget = _context
+    return pilot_key, pilot_frontier(xwing, upgrades, pilot_key, weights, budget)
+
+
+class LoadoutTable:
+    """
+    Memoizes pilot_loadouts for every pilot of the definition, for one set of weights and budget.
+
+    The table can be saved and loaded again.  Loading keeps the frontiers that are still valid
+    for the current definition: those of pilots whose data did not change, and for which no
+    upgrade they could equip, or using one of their slots, was added, changed or removed.
+    The other pilots are computed again when their loadouts are needed.
+    """
+
+    def __init__(self, xwing: XWing, upgrades: Upgrades, weights: Dict[str, float], budget: int):
+        self.xwing = xwing
+        self.upgrades = upgrades
+        self.weights = check_weights(dict(weights))
+        self.budget = budget
+        self.__frontiers: Dict[PilotKey, PilotFrontier] = {}
+
+    def __len__(self):
+        """returns the number of pilots whose loadouts are computed or loaded"""
+        return len(self.__frontiers)
+
+    def pilot_keys(self, faction_name: str) -> List[PilotKey]:
+        faction = self.xwing.get_faction(faction_name)
+        if faction is None:
+            return []
+        return [(faction_name, ship.ship_name, pilot_name)
+                for ship in faction.faction_ships for pilot_name in ship.pilot_names]
+
+    def pilot_limit(self, pilot_key: PilotKey) -> int:
+        faction_name, ship_name, pilot_name = pilot_key
+        ship = self.xwing.get_ship(faction_name, ship_name)
+        return PilotEquip(ship, ship.get_pilot_data(pilot_name)).limit
+
+    def pilot_fingerprint(self, pilot_key: PilotKey) -> str:
+        faction_name, ship_name, pilot_name = pilot_key
+        ship = self.xwing.get_ship(faction_name, ship_name)
+        if ship is None:
+            return ""
+        ship_data = {key: value for key, value in ship.ship_data.items() if key != "pilots"}
+        return fingerprint([faction_name, ship_data, ship.get_pilot_data(pilot_name)])
+
+    def loadouts(self, pilot_key: PilotKey) -> List[Loadout]:
+        frontier = self.__frontiers.get(pilot_key)
+        if frontier is None:
+            frontier = pilot_frontier(self.xwing, self.upgrades, pilot_key, self.weights, self.budget)
+            self.__frontiers[pilot_key] = frontier
+        return frontier.loadouts
+
+    def best_loadout(self, pilot_key: PilotKey, max_cost: int) -> Optional[Loadout]:
+        """returns the most valuable loadout of the pilot costing at most max_cost, preferring fewer unique names"""
+        loadouts = self.loadouts(pilot_key)
+        affordable = loadouts[:bisect.bisect_right([loadout.cost for loadout in loadouts], max_cost)]
+        return max(affordable, key=lambda loadout: (loadout.value, -len(loadout.uniques), -loadout.cost), default=None)
+
+    def compute(self, pilot_keys: Iterable[PilotKey], processes: Optional[int] = None):
+        """computes the loadouts of the pilots not computed yet over a process pool, processes=1 uses this process"""
+        missing = [pilot_key for pilot_key in pilot_keys if pilot_key not in self.__frontiers]
+        if processes == 1 or len(missing) <= 1:
+            for pilot_key in missing:
+                self.loadouts(pilot_key)
+            return
+        initargs = (self.xwing.data, settings_snapshot().mode, self.weights, self.budget)
+        with Pool(processes, initializer=init_context, initargs=initargs) as pool:
+            for pilot_key, frontier in pool.imap_unordered(compute_frontier, missing):
+                self.__frontiers[pilot_key] = frontier
+
+    def header(self) -> dict:
+        return {"version": LOADOUT_TABLE_VERSION, "weights": sorted(self.weights.items()), "budget": self.budget,
+                "mode": settings_snapshot().mode.value}
+
+    def save(self, path: Path) -> bool:
+        """writes the computed frontiers to path, returns True if the file was written"""
+        # Solvers in other processes may save the same table, each writer needs its own temporary file
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        entries = {pilot_key: (self.pilot_fingerprint(pilot_key), frontier)
+                   for pilot_key, frontier in self.__frontiers.items()}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as file:
+                pickle.dump(self.header(), file, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(upgrade_fingerprints(self.upgrades), file, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(entries, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except (OSError, pickle.PickleError) as e:
+            logging.debug(f"Unable to write loadout table {path}: {e}")
+            with suppress(OSError):
+                tmp_path.unlink()
+            return False
+        return True
+
+    def load(self, path: Path) -> int:
+        """reads the frontiers saved in path that are still valid, returns how many were read"""
+        try:
+            with open(path, "rb") as file:
+                if pickle.load(file) != self.header():
+                    return 0
+                saved_upgrades = pickle.load(file)
+                entries = pickle.load(file)
+        except FileNotFoundError:
+            return 0
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, TypeError) as e:
+            logging.debug(f"Ignoring unreadable loadout table {path}: {e}")
+            return 0
+
+        current_upgrades = upgrade_fingerprints(self.upgrades)
+        changed = {name for name in saved_upgrades.keys() | current_upgrades.keys()
+                   if saved_upgrades.get(name) != current_upgrades.get(name)}
+        changed_slots = {slot for upgrade in self.upgrades if upgrade["name"] in changed
+                         for slot in Upgrades.get_upgrade_slots(upgrade) or []}
+        loaded = 0
+        for pilot_key, (pilot_fingerprint, frontier) in entries.items():
+            if pilot_fingerprint != self.pilot_fingerprint(pilot_key):
+                continue
+            if frontier.upgrades & changed or frontier.slots & changed_slots:
+                continue
+            self.__frontiers[pilot_key] = frontier
+            loaded += 1
+        return loaded
+
+    def faction_loadouts(self, faction_name: str) -> List[Loadout]:
+        return [loadout for pilot_key in self.pilot_keys(faction_name) for loadout in self.loadouts(pilot_key)]
@@ -1,32 +1,59 @@
 import logging
 from collections import namedtuple
+from functools import wraps
 
 from .ship import Ship
 from .upgrade_filters import upgrade_slot_filter
-from .definition import Action
+from .definition import Action, action_record
 
-from ..settings import Settings
+from ..settings import settings_snapshot
 from ..utils import prettify_name
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 
 
 Upgrade = namedtuple('Upgrade', ['slots', 'name', 'cost', 'attributes'])
 
 
+def derived_property(func):
+    """
+    property computed from the pilot data and equipped upgrades, cached until the pilot's
+    version or the settings snapshot generation changes.  The cached value is shared between callers and
+    must not be mutated.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def getter(self):
+        stamp = (self.version, self.settings.generation)
+        cached = self._derived_cache.get(name)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, func(self))
+            self._derived_cache[name] = cached
+        return cached[1]
+    return property(getter)
+
+
 class PilotEquip:
     """
     This class is used for managing equipped pilot data.
 
     Note that filtered upgrades are intended to be updated from the Upgrades class.
+
+    Properties derived from the equipped upgrades are cached (see derived_property).  The cache
+    is invalidated by equip_upgrade/unequip_upgrade bumping the pilot's version, and by the
+    settings snapshot being reloaded for properties depending on the settings (e.g. the epic
+    command slot).
     """
-    settings = Settings()
+    settings = settings_snapshot()
 
     def __init__(self, ship: Ship, pilot: dict):
         self.ship = ship
         self.pilot = pilot
         self.__filtered_upgrades = []
         self.__equipped_upgrades = []
+        self.__version = 0
+        self._derived_cache = {}
 
         self.data = self.__synthesize_ship_and_pilot()
 
@@ -47,6 +74,11 @@ class PilotEquip:
 
         return d
 
+    @property
+    def version(self) -> int:
+        """incremented every time the equipped upgrades change"""
+        return self.__version
+
     @property
     def filtered_upgrades(self):
         """
@@ -111,9 +143,9 @@ class PilotEquip:
             ...
         ]
         """
-        return [Action(**action) for action in self.data.get("actions").copy()]
+        return [action_record(action) for action in self.data.get("actions")]
 
-    @property
+    @derived_property
     def actions(self) -> List[Action]:
         """
         returns a pilot's available actions based on equipped upgrades.
@@ -134,7 +166,7 @@ class PilotEquip:
         for upgrade in self.equipped_upgrades:
 
             upgrade_actions = upgrade.attributes.get("modifications", {}).get("actions", [])
-            upgrade_actions = [Action(**action) for action in upgrade_actions]
+            upgrade_actions = [action_record(action) for action in upgrade_actions]
             additional_actions.extend(upgrade_actions)
 
         return self.default_pilot_actions + additional_actions
@@ -143,16 +175,16 @@ class PilotEquip:
     def keywords(self):
         return self.data.get("keywords")
 
-    @property
+    @derived_property
     def arc_types(self) -> list:
         return [attack.get("arc_type") for attack in self.attacks]
 
-    @property
+    @derived_property
     def attacks(self):
         attacks = self.get_statistic(self.statistics, "attacks")
         return attacks.get("attacks")
 
-    @property
+    @derived_property
     def max_attack(self):
         return max([attack.get("attack") for attack in self.attacks])
 
@@ -224,14 +256,14 @@ class PilotEquip:
         """
         return self.data.get("upgrade_slots").copy()
 
-    @property
+    @derived_property
     def upgrade_slots(self):
         """
         returns upgrade slots, adds additional slots based on equipped upgrades and weapon hardpoints
         adds a command slot if the mode is epic
         """
         additional_slots = []
-        if self.settings.mode == Settings.Mode.EPIC and self.base_size != "huge":
+        if self.settings.epic and self.base_size != "huge":
             additional_slots.append("command")
         added = []
         removed = []
@@ -253,7 +285,7 @@ class PilotEquip:
     def cost(self):
         return self.data.get("cost")
 
-    @property
+    @derived_property
     def cost_with_upgrades(self):
         upgrade_cost = sum([upgrade.cost for upgrade in self.equipped_upgrades])
         return self.data.get("cost") + upgrade_cost
@@ -266,7 +298,7 @@ class PilotEquip:
     def total_equipped_upgrade_cost(self) -> int:
         return sum([upgrade.cost for upgrade in self.equipped_upgrades])
 
-    @property
+    @derived_property
     def available_upgrade_slots(self) -> List[str]:
         """Returns all remaining upgrade slots available for an equipped pilot."""
         upgrade_slots = self.upgrade_slots.copy()
@@ -275,40 +307,59 @@ class PilotEquip:
                 upgrade_slots.pop(upgrade_slots.index(slot))
         return upgrade_slots
 
-    def equip_upgrade(self, upgrade_slots: List[str], upgrade_name: str, upgrade_cost: int, upgrade_dict: dict) -> bool:
-        """adds upgrade to the equipped upgrades
-        returns true if upgrade equipped
-        """
+    def equip_upgrade_error(self, upgrade_slots: List[str], upgrade_name: str, upgrade_dict: dict) -> Optional[str]:
+        """returns why the upgrade can't be equipped to this pilot, None if it can"""
         # Test that slots are available for every slot the upgrade needs
         if not upgrade_slot_filter(upgrade_slots, self.available_upgrade_slots):
-            logging.info(
-                f"Insufficient upgrade slots to equip {prettify_name(upgrade_name)} to {prettify_name(self.pilot_name)}")
-            return False
+            return f"Insufficient upgrade slots to equip {prettify_name(upgrade_name)} to {prettify_name(self.pilot_name)}"
         removed = upgrade_dict.get("modifications", {}).get("upgrade_slots", {}).get("removed", [])
         for removed_upgrade_slot in removed:
             if removed_upgrade_slot not in self.available_upgrade_slots:
-                logging.info(f"An upgrade is equipped in the to-be removed <{removed_upgrade_slot}> slot.  Please unequip this upgrade first.")
-                return False
+                return f"An upgrade is equipped in the to-be removed <{removed_upgrade_slot}> slot.  Please unequip this upgrade first."
         for upgrade in self.equipped_upgrades:
             if upgrade.name == upgrade_name:
-                logging.info("Unable to equip more than one of an upgrade to the same pilot instance.")
-                return False
+                return "Unable to equip more than one of an upgrade to the same pilot instance."
+        return None
+
+    def equip_upgrade(self, upgrade_slots: List[str], upgrade_name: str, upgrade_cost: int, upgrade_dict: dict) -> bool:
+        """adds upgrade to the equipped upgrades
+        returns true if upgrade equipped
+        """
+        error = self.equip_upgrade_error(upgrade_slots, upgrade_name, upgrade_dict)
+        if error is not None:
+            logging.info(error)
+            return False
         self.__equipped_upgrades.append(Upgrade(upgrade_slots, upgrade_name, upgrade_cost, upgrade_dict))
+        self.__version += 1
         return True
 
-    def unequip_upgrade(self, upgrade_name):
-        """removes an equipped upgrade.
-        returns true if upgrade successfully unequipped"""
-        unequipped = False
+    def restore_upgrades(self, upgrades: Tuple[Upgrade, ...]):
+        """sets the equipped upgrades to ones this pilot had before, see SquadHistory"""
+        if tuple(self.__equipped_upgrades) != upgrades:
+            self.__equipped_upgrades = list(upgrades)
+            self.__version += 1
+
+    def unequip_upgrade_error(self, upgrade_name: str) -> Optional[str]:
+        """returns why the equipped upgrade can't be unequipped from this pilot, None if it can"""
         for upgrade in self.equipped_upgrades:
             if upgrade.name == upgrade_name:
                 upgrade_modifiers = upgrade.attributes.get("modifications", {}).get("upgrade_slots", {})
                 added = upgrade_modifiers.get("added", [])
                 for added_upgrade_slot in added:
                     if added_upgrade_slot not in self.available_upgrade_slots:
-                        logging.info(f"An upgrade is equipped in the added <{added_upgrade_slot}> slot.  Please unequip this upgrade first.")
-                        return False
+                        return f"An upgrade is equipped in the added <{added_upgrade_slot}> slot.  Please unequip this upgrade first."
+        return None
+
+    def unequip_upgrade(self, upgrade_name):
+        """removes an equipped upgrade.
+        returns true if upgrade successfully unequipped"""
+        for upgrade in self.equipped_upgrades:
+            if upgrade.name == upgrade_name:
+                error = self.unequip_upgrade_error(upgrade_name)
+                if error is not None:
+                    logging.info(error)
+                    return False
                 self.__equipped_upgrades.pop(self.__equipped_upgrades.index(upgrade))
-                unequipped = True
-                break
-        return unequipped
+                self.__version += 1
+                return True
+        return False
@@ -4,9 +4,14 @@ from ..utils import prettify_name, gui_text_encode
 
 
 class Ship:
+    __slots__ = ("__faction_name", "__ship_data", "__pilot_index")
+
     def __init__(self, faction_name: str, ship_data: dict):
         self.__faction_name = faction_name
         self.__ship_data = ship_data
+        self.__pilot_index = {}
+        for pilot in self.pilots:
+            self.__pilot_index.setdefault(pilot["name"], pilot)
 
     def __repr__(self):
         return f"Ship(ship_name = {self.ship_name}, faction_name = {self.faction_name})"
@@ -96,10 +101,7 @@ class Ship:
                 return stat[attribute]
 
     def get_pilot_data(self, pilot_name: str) -> Optional[dict]:
-        for pilot in self.pilots:
-            if pilot["name"] == pilot_name:
-                return pilot
-        return None
+        return self.__pilot_index.get(pilot_name)
 
     def get_pilot_actions(self, pilot_name: str):
         pilot = self.get_pilot_data(pilot_name)
@@ -1,77 +1,114 @@
 from .pilot_equip import PilotEquip
-from .unique_upgrades import UNIQUE_UPGRADES, get_root
-from ..settings import Settings
-from PySide6.QtWidgets import QTreeWidgetItem
+from .symbols import symbols
+from ..settings import Settings, settings_snapshot
 
 from ..utils import prettify_name
 
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Iterable, Optional, List, Set, Tuple
 
 from collections import Counter
 import logging
+import re
 
 import xlsxwriter
 
 from xlsxwriter.exceptions import XlsxWriterException
 
+SUMMARY_SHEET_NAME = "Squads"
+# Excel rejects longer worksheet names
+EXCEL_SHEET_NAME_LENGTH = 31
+
 
 class Squad:
     """
-    This object is for linking the GUI squad with equipped pilot data.
+    The equipped pilot data of a squad, and the rules for adding and removing pilots.
 
     This can be treated as the source of truth for equipped pilot data, indexed by
-    the tree list widget items.
+    pilot ids (see new_pilot_id) which the squad tree model uses to address its rows.
+    It does not depend on the GUI, see SquadBuilder for building squads without it.
     """
-    settings = Settings()
+    settings = settings_snapshot()
 
     def __init__(self):
         self.__squad = {}
+        self.__next_pilot_id = 0
 
-    def add_pilot(self, item: QTreeWidgetItem, data: PilotEquip):
-        """
-        tries to add a pilot to the squad.
-        returns True if added, False if not
-        """
+    def new_pilot_id(self) -> int:
+        """returns an id that has not been used by this squad"""
+        pilot_id = self.__next_pilot_id
+        self.__next_pilot_id += 1
+        return pilot_id
+
+    def pilot_error(self, data: PilotEquip) -> Optional[str]:
+        """returns why the pilot can't be added to the squad, None if it can"""
         # Check pilot limit
         if self.pilot_counts[data.pilot_name] >= data.limit:
-            logging.info("Limit reached for this pilot.  Unable to equip.")
-            return False
+            return "Limit reached for this pilot.  Unable to equip."
         # Check faction based on mode
         if self.settings.mode == Settings.Mode.STANDARD or self.settings.mode == Settings.Mode.EPIC:
             if len(self.squad_factions) > 0:
                 faction = self.squad_factions[0]
                 if data.faction_name != faction:
-                    logging.info("Must equip pilots of the same faction in standard mode.  Unable to equip.")
-                    return False
+                    return "Must equip pilots of the same faction in standard mode.  Unable to equip."
         # Check if unique upgrade equipped
-        pilot_root = get_root(data.pilot_name)
-        if get_root(data.pilot_name) in UNIQUE_UPGRADES:
-            all_equipped_upgrades = [get_root(upgrade.name) for _, pilot in self.squad_dict.items() for upgrade in pilot.equipped_upgrades]
-            all_equipped_pilots = [get_root(pilot.pilot_name) for _, pilot in self.squad_dict.items()]
+        table = symbols()
+        pilot_root = table.root(data.pilot_name)
+        if pilot_root in table.unique_roots:
+            all_equipped_upgrades = {table.root(upgrade.name) for _, pilot in self.squad_dict.items() for upgrade in pilot.equipped_upgrades}
+            all_equipped_pilots = {table.root(pilot.pilot_name) for _, pilot in self.squad_dict.items()}
             if pilot_root in all_equipped_upgrades:
-                logging.info(f"Unable to equip pilot.  Ensure this pilot is not already equipped as an upgrade.")
-                return False
+                return "Unable to equip pilot.  Ensure this pilot is not already equipped as an upgrade."
             elif pilot_root in all_equipped_pilots:
-                logging.info("Unable to equip pilot.  Ensure another version of this pilot is not already equipped.")
-                return False
+                return "Unable to equip pilot.  Ensure another version of this pilot is not already equipped."
+        return None
 
-        self.__squad[item] = data
+    def add_pilot(self, pilot_id: int, data: PilotEquip):
+        """
+        tries to add a pilot to the squad.
+        returns True if added, False if not
+        """
+        error = self.pilot_error(data)
+        if error is not None:
+            logging.info(error)
+            return False
+        self.__squad[pilot_id] = data
         return True
 
-    def remove_pilot(self, item: QTreeWidgetItem):
-        # First we need to check if any upgrades are dependent on the equipped pilot
-        pilot_data_for_removal = self.get_pilot_data(item)
+    def restore_pilot(self, pilot_id: int, data: PilotEquip):
+        """
+        adds a pilot back without checking the rules, to restore a squad that followed them (see
+        SquadHistory).  Pilots stay in the order they were first added in, the order of their ids.
+        """
+        self.__squad[pilot_id] = data
+        self.__next_pilot_id = max(self.__next_pilot_id, pilot_id + 1)
+        if any(other_id > pilot_id for other_id in self.__squad):
+            self.__squad = dict(sorted(self.__squad.items()))
+
+    def discard_pilot(self, pilot_id: int):
+        """removes a pilot without checking the rules, see restore_pilot"""
+        self.__squad.pop(pilot_id, None)
+
+    def removal_error(self, pilot_id: int) -> Optional[str]:
+        """returns why the pilot can't be removed from the squad, None if it can"""
+        # Upgrades may depend on the equipped pilot
+        pilot_data_for_removal = self.get_pilot_data(pilot_id)
         for _, pilot_data in self.squad_dict.items():
             for upgrade in pilot_data.equipped_upgrades:
                 if pilot_data_for_removal.pilot_name in upgrade.attributes.get("squad_include", []):
-                    logging.info(f"Cannot unequip a pilot with dependent upgrades - try removing {prettify_name(upgrade.name)} from {prettify_name(pilot_data.pilot_name)}.")
-                    return False
-        self.__squad.pop(item, None)
+                    return f"Cannot unequip a pilot with dependent upgrades - try removing {prettify_name(upgrade.name)} from {prettify_name(pilot_data.pilot_name)}."
+        return None
+
+    def remove_pilot(self, pilot_id: int):
+        error = self.removal_error(pilot_id)
+        if error is not None:
+            logging.info(error)
+            return False
+        self.__squad.pop(pilot_id, None)
         return True
 
-    def get_pilot_data(self, item: QTreeWidgetItem) -> Optional[PilotEquip]:
-        """returns pilot data based on qtreewidgetitem name"""
-        return self.__squad.get(item)
+    def get_pilot_data(self, pilot_id: int) -> Optional[PilotEquip]:
+        """returns pilot data based on pilot id"""
+        return self.__squad.get(pilot_id)
 
     def get_pilot_data_from_name(self, pilot_name: str) -> Optional[PilotEquip]:
         for _, pilot_data in self.squad_dict.items():
@@ -80,7 +117,7 @@ class Squad:
         return None
 
     @property
-    def squad_dict(self) -> Dict[QTreeWidgetItem, PilotEquip]:
+    def squad_dict(self) -> Dict[int, PilotEquip]:
         return self.__squad
 
     @property
@@ -92,29 +129,28 @@ class Squad:
     def squad_factions(self) -> List[str]:
         return [pilot_data.faction_name for _, pilot_data in self.squad_dict.items()]
 
-    def export_squad_as_excel(self, workbook_name: str, squad_name: str):
-        try:
-            workbook = xlsxwriter.Workbook(workbook_name)
-        except XlsxWriterException as e:
-            logging.error(f"There was a problem exporting: {e}")
-        worksheet = workbook.add_worksheet(squad_name)
+    @property
+    def total_pilot_cost(self) -> int:
+        return sum(pilot_data.cost for pilot_data in self.__squad.values())
+
+    @property
+    def total_upgrade_cost(self) -> int:
+        return sum(pilot_data.total_equipped_upgrade_cost for pilot_data in self.__squad.values())
+
+    def write_excel_sheet(self, worksheet, squad_name: str, formats: Dict[str, object]):
+        """writes the squad to the worksheet top to bottom, as required by constant_memory workbooks"""
+        bold = formats["bold"]
+        left_align = formats["left_align"]
         worksheet.set_column(0, 25, 32)
-        bold = workbook.add_format({
-            'bold': True
-        })
-        left_align = workbook.add_format()
-        left_align.set_align('left')
         worksheet.write(0, 0, 'Squad Name', bold)
         worksheet.write(0, 1, squad_name)
         worksheet.write(1, 0, 'Faction', bold)
-        worksheet.write(1, 1, prettify_name(self.squad_factions[0]))
+        worksheet.write(1, 1, prettify_name(self.squad_factions[0]) if self.squad_factions else "")
         column_headers = ["Pilot Name", "Ship Name", "Pilot Cost", "Upgrades Cost", "Upgrades"]
         for i, header in enumerate(column_headers):
             worksheet.write(3, i, header, bold)
 
         row_idx = 4
-        total_pilot_cost = 0
-        total_upgrade_cost = 0
         for _, pilot_data in self.squad_dict.items():
             worksheet.write(row_idx, 0, prettify_name(pilot_data.pilot_name))
             worksheet.write(row_idx, 1, prettify_name(pilot_data.ship_name))
@@ -125,19 +161,87 @@ class Squad:
                 worksheet.write(row_idx, col_idx, prettify_name(upgrade.name))
                 col_idx += 1
             row_idx += 1
-            total_pilot_cost += pilot_data.cost
-            total_upgrade_cost += pilot_data.total_equipped_upgrade_cost
 
         row_idx += 1
         worksheet.write(row_idx, 0, "Total Pilot Cost", bold)
-        worksheet.write(row_idx, 1, total_pilot_cost)
+        worksheet.write(row_idx, 1, self.total_pilot_cost)
         worksheet.write(row_idx + 1, 0, "Total Upgrade Cost", bold)
-        worksheet.write(row_idx + 1, 1, total_upgrade_cost)
+        worksheet.write(row_idx + 1, 1, self.total_upgrade_cost)
         worksheet.write(row_idx + 2, 0, "Total Squad Cost", bold)
-        worksheet.write(row_idx + 2, 1, total_pilot_cost+total_upgrade_cost)
+        worksheet.write(row_idx + 2, 1, self.total_pilot_cost + self.total_upgrade_cost)
+
+    def export_squad_as_excel(self, workbook_name: str, squad_name: str):
+        try:
+            workbook = xlsxwriter.Workbook(workbook_name)
+        except XlsxWriterException as e:
+            logging.error(f"There was a problem exporting: {e}")
+        worksheet = workbook.add_worksheet(squad_name)
+        self.write_excel_sheet(worksheet, squad_name, excel_formats(workbook))
 
         workbook.close()
 
         logging.info(f"Successfully exported squad to {workbook_name}")
 
 
+def excel_formats(workbook: xlsxwriter.Workbook) -> Dict[str, object]:
+    """returns the cell formats used by Squad.write_excel_sheet, add them once per workbook"""
+    left_align = workbook.add_format()
+    left_align.set_align('left')
+    return {"bold": workbook.add_format({'bold': True}), "left_align": left_align}
+
+
+def excel_sheet_name(squad_name: str, used_names: Set[str]) -> str:
+    """returns a valid worksheet name for the squad that is not in used_names (compared ignoring case)"""
+    name = re.sub(r"[\[\]:*?/\\]", "_", squad_name).strip("'").strip() or "Squad"
+    name = name[:EXCEL_SHEET_NAME_LENGTH]
+    candidate = name
+    suffix = 2
+    while candidate.lower() in used_names or candidate.lower() == SUMMARY_SHEET_NAME.lower():
+        tail = f" ({suffix})"
+        candidate = name[:EXCEL_SHEET_NAME_LENGTH - len(tail)] + tail
+        suffix += 1
+    used_names.add(candidate.lower())
+    return candidate
+
+
+def export_squads_as_excel(workbook_name: str, squads: Iterable[Tuple[str, Squad]], total: Optional[int] = None,
+                           progress_callback: Optional[Callable[[int, int], None]] = None) -> int:
+    """
+    writes every (squad name, squad) to one workbook, returns the number of squads written.
+
+    The first sheet has one row per squad, followed by a sheet per squad laid out as
+    Squad.export_squad_as_excel.  The workbook is in constant_memory mode, so every row is
+    flushed to disk once written and squads can be generated as they are exported.
+    progress_callback is called with (squads written, total) after every squad, total is 0 if unknown.
+    """
+    workbook = xlsxwriter.Workbook(workbook_name, {'constant_memory': True})
+    formats = excel_formats(workbook)
+    bold = formats["bold"]
+    summary = workbook.add_worksheet(SUMMARY_SHEET_NAME)
+    summary.set_column(0, 6, 32)
+    column_headers = ["Squad Name", "Faction", "Pilots", "Pilot Cost", "Upgrades Cost", "Total Cost", "Sheet"]
+    for i, header in enumerate(column_headers):
+        summary.write(0, i, header, bold)
+
+    used_names: Set[str] = set()
+    count = 0
+    try:
+        for squad_name, squad in squads:
+            sheet_name = excel_sheet_name(squad_name, used_names)
+            count += 1
+            summary.write(count, 0, squad_name)
+            summary.write(count, 1, prettify_name(squad.squad_factions[0]) if squad.squad_factions else "")
+            summary.write(count, 2, len(squad.squad_dict), formats["left_align"])
+            summary.write(count, 3, squad.total_pilot_cost, formats["left_align"])
+            summary.write(count, 4, squad.total_upgrade_cost, formats["left_align"])
+            summary.write(count, 5, squad.total_pilot_cost + squad.total_upgrade_cost, formats["left_align"])
+            quoted_name = sheet_name.replace("'", "''")
+            summary.write_url(count, 6, f"internal:'{quoted_name}'!A1", string=sheet_name)
+            squad.write_excel_sheet(workbook.add_worksheet(sheet_name), squad_name, formats)
+            if progress_callback is not None:
+                progress_callback(count, total or 0)
+    finally:
+        workbook.close()
+
+    logging.info(f"Successfully exported {count} squads to {workbook_name}")
+    return count
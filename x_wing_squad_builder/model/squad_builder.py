@@ -0,0 +1,199 @@
+import logging
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Iterable, List, Optional, Set, Tuple
+
+from .pilot_equip import PilotEquip
+from .squad import Squad
+from .squad_history import SquadSnapshot
+from .upgrade import Upgrades
+from .xwing import XWing
+from ..utils import prettify_name
+
+# A pilot to add with its upgrades, names encoded as in the definition (see utils.gui_text_encode)
+PilotEntry = namedtuple('PilotEntry', ['faction', 'ship', 'pilot', 'upgrades'])
+
+
+class SquadBuilder:
+    """
+    Builds a squad with the same rules as the GUI, without the GUI (no widgets or display needed).
+
+    The main window drives a SquadBuilder and mirrors the squad in its tree; batch tools use it
+    directly.  Operations that break a rule are refused and logged, and the reason is kept in
+    last_error (None after an operation succeeds) so it can be reported.
+    """
+
+    def __init__(self, xwing: XWing, upgrades: Upgrades, squad: Optional[Squad] = None):
+        self.xwing = xwing
+        self.upgrades = upgrades
+        self.squad = squad if squad is not None else Squad()
+        self.last_error: Optional[str] = None
+        # Inside a batch only the pilot edited is refreshed, see batch
+        self.__batch_depth = 0
+        self.__stale: Set[int] = set()
+        self.__auto_include_pending = False
+
+    def fail(self, error: str):
+        self.last_error = error
+        logging.info(error)
+
+    def add_pilot(self, faction_name: str, ship_name: str, pilot_name: str) -> Optional[int]:
+        """adds a pilot and equips its auto include upgrades, returns its pilot id or None if it can't be added"""
+        self.last_error = None
+        ship = self.xwing.get_ship(faction_name, ship_name)
+        pilot = self.xwing.get_pilot(faction_name, ship_name, pilot_name)
+        if ship is None or pilot is None:
+            self.fail(f"Unknown pilot {prettify_name(pilot_name)} "
+                      f"({prettify_name(ship_name)}, {prettify_name(faction_name)}).")
+            return None
+        pilot_data = PilotEquip(ship, pilot)
+        error = self.squad.pilot_error(pilot_data)
+        if error is not None:
+            self.fail(error)
+            return None
+        pilot_id = self.squad.new_pilot_id()
+        self.squad.add_pilot(pilot_id, pilot_data)
+        self.refresh(auto_include=True, pilot_id=pilot_id)
+        return pilot_id
+
+    def remove_pilot(self, pilot_id: int) -> bool:
+        self.last_error = None
+        error = self.squad.removal_error(pilot_id)
+        if error is not None:
+            self.fail(error)
+            return False
+        self.squad.remove_pilot(pilot_id)
+        self.refresh()
+        return True
+
+    def equip_upgrade(self, pilot_id: int, upgrade_name: str) -> bool:
+        """equips an upgrade available to the pilot (see Upgrades.filtered_upgrades_by_pilot)"""
+        self.last_error = None
+        self.refresh_stale(pilot_id)
+        pilot_data = self.squad.get_pilot_data(pilot_id)
+        upgrade_dict = self.upgrades.get_upgrade(upgrade_name)
+        if upgrade_dict is None:
+            self.fail(f"Unknown upgrade {prettify_name(upgrade_name)}.")
+            return False
+        if upgrade_name not in [upgrade["name"] for upgrade in pilot_data.filtered_upgrades]:
+            self.fail(f"{prettify_name(upgrade_name)} is not available to {prettify_name(pilot_data.pilot_name)}.")
+            return False
+        upgrade_slots = Upgrades.get_upgrade_slots(upgrade_dict)
+        error = pilot_data.equip_upgrade_error(upgrade_slots, upgrade_name, upgrade_dict)
+        if error is not None:
+            self.fail(error)
+            return False
+        upgrade_cost = Upgrades.get_filtered_upgrade_cost(upgrade_dict, pilot_data)
+        pilot_data.equip_upgrade(upgrade_slots, upgrade_name, upgrade_cost, upgrade_dict)
+        self.refresh(pilot_id=pilot_id)
+        return True
+
+    def unequip_upgrade(self, pilot_id: int, upgrade_name: str) -> bool:
+        self.last_error = None
+        self.refresh_stale(pilot_id)
+        pilot_data = self.squad.get_pilot_data(pilot_id)
+        if upgrade_name not in [upgrade.name for upgrade in pilot_data.equipped_upgrades]:
+            self.fail(f"{prettify_name(upgrade_name)} is not equipped to {prettify_name(pilot_data.pilot_name)}.")
+            return False
+        error = pilot_data.unequip_upgrade_error(upgrade_name)
+        if error is not None:
+            self.fail(error)
+            return False
+        pilot_data.unequip_upgrade(upgrade_name)
+        self.refresh(pilot_id=pilot_id)
+        return True
+
+    def add_pilots(self, entries: Iterable[PilotEntry]) -> List[str]:
+        """
+        adds every pilot and equips its upgrades, upgrades equipped automatically may be listed too.
+        returns why each pilot or upgrade that could not be added was refused.
+        """
+        errors = []
+        with self.batch():
+            for entry in entries:
+                pilot_id = self.add_pilot(entry.faction, entry.ship, entry.pilot)
+                if pilot_id is None:
+                    errors.append(self.last_error)
+                    continue
+                pilot_data = self.squad.get_pilot_data(pilot_id)
+                for upgrade_name in entry.upgrades:
+                    if upgrade_name in [upgrade.name for upgrade in pilot_data.equipped_upgrades]:
+                        continue
+                    if not self.equip_upgrade(pilot_id, upgrade_name):
+                        errors.append(self.last_error)
+        return errors
+
+    def restore(self, snapshot: SquadSnapshot) -> Tuple[List[int], List[int]]:
+        """
+        sets the squad to a snapshot of the SquadHistory without checking the rules, which the
+        squad followed when the snapshot was taken.  returns the ids of the pilots removed and added.
+        """
+        self.last_error = None
+        states = {state.pilot_id: state for state in snapshot}
+        removed = [pilot_id for pilot_id, pilot_data in self.squad.squad_dict.items()
+                   if pilot_id not in states or states[pilot_id].pilot_data is not pilot_data]
+        for pilot_id in removed:
+            self.squad.discard_pilot(pilot_id)
+        added = []
+        for state in snapshot:
+            if self.squad.get_pilot_data(state.pilot_id) is not state.pilot_data:
+                self.squad.restore_pilot(state.pilot_id, state.pilot_data)
+                added.append(state.pilot_id)
+            state.pilot_data.restore_upgrades(state.upgrades)
+        self.refresh()
+        return removed, added
+
+    @contextmanager
+    def batch(self):
+        """
+        defers the refresh of the whole squad until the outermost batch ends.  Inside the batch
+        only the pilot edited is refreshed, the other pilots are refreshed before they are edited.
+        """
+        self.__batch_depth += 1
+        try:
+            yield
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0 and self.__stale:
+                auto_include = self.__auto_include_pending
+                self.__stale.clear()
+                self.__auto_include_pending = False
+                self.refresh(auto_include)
+
+    def refresh(self, auto_include: bool = False, pilot_id: Optional[int] = None):
+        """
+        updates the upgrades available to every pilot in the squad, equipping auto include upgrades
+        if auto_include.  Inside a batch only pilot_id is updated, the whole squad once the batch ends.
+        """
+        if self.__batch_depth == 0:
+            for pilot_data in self.squad.squad_dict.values():
+                self.refresh_pilot(pilot_data, auto_include)
+            return
+        self.__stale.update(self.squad.squad_dict)
+        self.__auto_include_pending |= auto_include
+        if pilot_id is not None:
+            self.__stale.discard(pilot_id)
+            self.refresh_pilot(self.squad.get_pilot_data(pilot_id), auto_include)
+
+    def refresh_stale(self, pilot_id: int):
+        """refreshes a pilot left out of date by the current batch"""
+        if pilot_id in self.__stale:
+            self.__stale.discard(pilot_id)
+            self.refresh_pilot(self.squad.get_pilot_data(pilot_id))
+
+    def refresh_pilot(self, pilot_data: PilotEquip, auto_include: bool = False):
+        # Update available upgrades based on squad
+        pilot_data.filtered_upgrades = self.upgrades.filtered_upgrades_by_pilot(
+            pilot_data, self.squad)
+
+        if auto_include:
+            for upgrade in pilot_data.filtered_upgrades:
+                if upgrade.get("autoinclude", "False") == "True":
+                    slots = self.upgrades.get_upgrade_slots(upgrade)
+                    equipped_upgrades = [upgrade.name for upgrade in pilot_data.equipped_upgrades]
+                    equipped = False
+                    if upgrade["name"] not in equipped_upgrades:
+                        equipped = pilot_data.equip_upgrade(slots, upgrade.get("name"), upgrade["cost"], upgrade)
+                    if equipped:
+                        logging.info(f"{prettify_name(upgrade['name'])} equipped automatically to "
+                                     f"{prettify_name(pilot_data.pilot_name)}")
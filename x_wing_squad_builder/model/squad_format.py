@@ -0,0 +1,188 @@
+"""
+Squad interchange formats: XWS style JSON (see SquadFormat.to_xws) and a compact, URL safe
+squad code (see SquadFormat.to_code).
+
+Names are written as XWS ids, the lower case letters and digits of the name, and resolved
+against the loaded definition.  Squads are read through a SquadBuilder, so the whole squad is
+built in the model with the GUI rules before anything is displayed, and every pilot or upgrade
+that was refused is reported.
+"""
+import re
+from collections import defaultdict, namedtuple
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import quote, unquote
+
+from .squad import Squad
+from .squad_builder import PilotEntry, SquadBuilder
+from .upgrade import Upgrades
+from .xwing import XWing
+from ..utils import gui_text_decode, prettify_name
+
+# name: the squad name, errors: why each pilot or upgrade was not added
+SquadRead = namedtuple('SquadRead', ['name', 'squad', 'errors'])
+
+XWS_VERSION = "2.0.0"
+
+# Prefix of the squad codes, bump it whenever the code layout changes
+CODE_VERSION = "1"
+
+# XWS ids of the factions named differently in the definition
+FACTION_XWS_IDS = {
+    "grand army of the republic": "galacticrepublic",
+}
+
+
+def xws_id(name: str) -> str:
+    """returns the XWS id of a definition or GUI name"""
+    return re.sub(r"[^a-z0-9]", "", gui_text_decode(name))
+
+
+class SquadFormat:
+    """
+    Writes squads as XWS JSON or squad codes, and reads them back with the rules of the squad builder.
+
+    Ids are resolved against the xwing and upgrades given, build a new SquadFormat after the
+    definition is reloaded.
+    """
+
+    def __init__(self, xwing: XWing, upgrades: Upgrades):
+        self.xwing = xwing
+        self.upgrades = upgrades
+        self.__factions: Dict[str, str] = {}
+        # (faction name, pilot id) -> [(ship id, ship name, pilot name)]
+        self.__pilots: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = defaultdict(list)
+        for faction_name in xwing.faction_names:
+            self.__factions[self.faction_id(faction_name)] = faction_name
+            for ship in xwing.get_faction(faction_name).faction_ships:
+                for pilot_name in ship.pilot_names:
+                    self.__pilots[(faction_name, xws_id(pilot_name))].append(
+                        (xws_id(ship.ship_name), ship.ship_name, pilot_name))
+        self.__upgrades = {xws_id(upgrade["name"]): upgrade["name"] for upgrade in upgrades}
+
+    @staticmethod
+    def faction_id(faction_name: str) -> str:
+        return FACTION_XWS_IDS.get(faction_name, xws_id(faction_name))
+
+    @staticmethod
+    def squad_faction(squad: Squad) -> str:
+        """returns the faction of the first pilot, the faction of the squad outside of freedom mode"""
+        return squad.squad_factions[0] if squad.squad_factions else ""
+
+    def to_xws(self, squad: Squad, squad_name: str) -> dict:
+        faction_name = self.squad_faction(squad)
+        pilots = []
+        for pilot_data in squad.squad_dict.values():
+            upgrades = defaultdict(list)
+            for upgrade in pilot_data.equipped_upgrades:
+                upgrades[xws_id(upgrade.attributes["upgrade_slot_types"][0])].append(xws_id(upgrade.name))
+            pilot = {"id": xws_id(pilot_data.pilot_name), "ship": xws_id(pilot_data.ship_name),
+                     "points": pilot_data.cost + pilot_data.total_equipped_upgrade_cost,
+                     "upgrades": dict(upgrades)}
+            if pilot_data.faction_name != faction_name:
+                pilot["faction"] = self.faction_id(pilot_data.faction_name)
+            pilots.append(pilot)
+        return {"name": squad_name, "faction": self.faction_id(faction_name),
+                "points": squad.total_pilot_cost + squad.total_upgrade_cost,
+                "version": XWS_VERSION, "pilots": pilots}
+
+    def from_xws(self, data: dict) -> SquadRead:
+        """reads an XWS squad, parts that are not laid out as XWS are reported and skipped"""
+        if not isinstance(data, dict):
+            return SquadRead("", Squad(), ["Invalid XWS squad: expected a JSON object."])
+        squad_name = data.get("name", "")
+        faction_id = data.get("faction", "")
+        pilots = data.get("pilots", [])
+        if not isinstance(squad_name, str) or not isinstance(faction_id, str) or not isinstance(pilots, list):
+            return SquadRead("", Squad(), ["Invalid XWS squad: expected a name, faction and list of pilots."])
+        errors = []
+        entries = []
+        for number, pilot in enumerate(pilots, 1):
+            if not isinstance(pilot, dict) or not isinstance(pilot.get("id", ""), str) or \
+                    not isinstance(pilot.get("faction", faction_id), str) or \
+                    not isinstance(pilot.get("ship", ""), (str, type(None))):
+                errors.append(f"Invalid pilot {number}.")
+                continue
+            entry = self.pilot_entry(pilot.get("faction", faction_id), pilot.get("ship"), pilot.get("id", ""),
+                                     self.xws_upgrade_ids(pilot, errors), errors)
+            if entry is not None:
+                entries.append(entry)
+        return self.build(squad_name, entries, errors)
+
+    @staticmethod
+    def xws_upgrade_ids(pilot: dict, errors: List[str]) -> List[str]:
+        """returns the upgrade ids of an XWS pilot, {slot id: [upgrade id, ...]}"""
+        upgrades = pilot.get("upgrades", {})
+        if not isinstance(upgrades, dict):
+            errors.append(f"Invalid upgrades of pilot {pilot.get('id', '')}.")
+            return []
+        upgrade_ids = []
+        for slot_id, slot_upgrade_ids in upgrades.items():
+            if not isinstance(slot_upgrade_ids, list) or \
+                    not all(isinstance(upgrade_id, str) for upgrade_id in slot_upgrade_ids):
+                errors.append(f"Invalid {slot_id} upgrades of pilot {pilot.get('id', '')}.")
+                continue
+            upgrade_ids.extend(slot_upgrade_ids)
+        return upgrade_ids
+
+    def to_code(self, squad: Squad, squad_name: str) -> str:
+        """
+        returns a squad code, made of URL safe characters only:
+
+            1_firstorder_tiebainterceptor.majorvonreg.composure~..._Squad%20Name
+
+        A pilot of another faction (freedom mode) is prefixed by its faction id and "-".
+        """
+        faction_name = self.squad_faction(squad)
+        pilots = []
+        for pilot_data in squad.squad_dict.values():
+            pilot = ".".join([xws_id(pilot_data.ship_name), xws_id(pilot_data.pilot_name)] +
+                             [xws_id(upgrade.name) for upgrade in pilot_data.equipped_upgrades])
+            if pilot_data.faction_name != faction_name:
+                pilot = f"{self.faction_id(pilot_data.faction_name)}-{pilot}"
+            pilots.append(pilot)
+        return "_".join([CODE_VERSION, self.faction_id(faction_name), "~".join(pilots), quote(squad_name, safe="")])
+
+    def from_code(self, code: str) -> SquadRead:
+        parts = code.strip().split("_", 3)
+        if len(parts) != 4 or parts[0] != CODE_VERSION:
+            return SquadRead("", Squad(), ["Invalid squad code."])
+        _, faction_id, pilots, squad_name = parts
+        errors = []
+        entries = []
+        for pilot in filter(None, pilots.split("~")):
+            pilot_faction_id, _, pilot = pilot.rpartition("-")
+            ids = pilot.split(".")
+            if len(ids) < 2:
+                errors.append(f"Invalid pilot {pilot}.")
+                continue
+            entry = self.pilot_entry(pilot_faction_id or faction_id, ids[0], ids[1], ids[2:], errors)
+            if entry is not None:
+                entries.append(entry)
+        return self.build(unquote(squad_name), entries, errors)
+
+    def pilot_entry(self, faction_id: str, ship_id: Optional[str], pilot_id: str, upgrade_ids: List[str],
+                    errors: List[str]) -> Optional[PilotEntry]:
+        """returns the definition names of the ids, ship_id may be None if the pilot id is unambiguous"""
+        faction_name = self.__factions.get(faction_id)
+        if faction_name is None:
+            errors.append(f"Unknown faction {faction_id}.")
+            return None
+        candidates = [candidate for candidate in self.__pilots.get((faction_name, pilot_id), [])
+                      if ship_id is None or candidate[0] == ship_id]
+        if len(candidates) != 1:
+            errors.append(f"Unknown pilot {pilot_id} ({ship_id}, {prettify_name(faction_name)}).")
+            return None
+        _, ship_name, pilot_name = candidates[0]
+        upgrade_names = []
+        for upgrade_id in upgrade_ids:
+            upgrade_name = self.__upgrades.get(upgrade_id)
+            if upgrade_name is None:
+                errors.append(f"Unknown upgrade {upgrade_id}.")
+            else:
+                upgrade_names.append(upgrade_name)
+        return PilotEntry(faction_name, ship_name, pilot_name, upgrade_names)
+
+    def build(self, squad_name: str, entries: List[PilotEntry], errors: List[str]) -> SquadRead:
+        builder = SquadBuilder(self.xwing, self.upgrades)
+        errors.extend(builder.add_pilots(entries))
+        return SquadRead(squad_name, builder.squad, errors)
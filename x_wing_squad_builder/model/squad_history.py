@@ -0,0 +1,93 @@
+"""
+Undo and redo of squad edits, see SquadHistory.
+
+A snapshot of the squad is a tuple of PilotState, one per pilot in squad order.  States are
+immutable and hold the pilot's PilotEquip and the Upgrade records it had equipped, which are
+immutable too.  A pilot's state is only created again when its upgrades changed, so consecutive
+snapshots share every unchanged pilot: a history step costs a tuple of references, not a copy of
+the squad.
+"""
+from collections import deque, namedtuple
+from typing import List, Optional, Tuple
+
+from .squad import Squad
+
+# upgrades: the pilot's equipped upgrades, version: pilot_data.version when they were read
+PilotState = namedtuple('PilotState', ['pilot_id', 'pilot_data', 'version', 'upgrades'])
+
+SquadSnapshot = Tuple[PilotState, ...]
+
+
+class SquadHistory:
+    """
+    Keeps the snapshots of a squad taken after every edit (see commit) and steps through them.
+
+    Restoring a snapshot is left to SquadBuilder.restore, the history never changes the squad.
+    """
+
+    def __init__(self, limit: int = 10000):
+        self.__undo = deque(maxlen=limit)
+        self.__redo: List[SquadSnapshot] = []
+        self.__current: SquadSnapshot = ()
+
+    @property
+    def current(self) -> SquadSnapshot:
+        return self.__current
+
+    @property
+    def can_undo(self) -> bool:
+        return len(self.__undo) > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return len(self.__redo) > 0
+
+    def snapshot(self, squad: Squad) -> SquadSnapshot:
+        """returns the state of the squad, sharing the unchanged pilots with the current snapshot"""
+        previous = {state.pilot_id: state for state in self.__current}
+        states = []
+        for pilot_id, pilot_data in squad.squad_dict.items():
+            state = previous.get(pilot_id)
+            if state is None or state.pilot_data is not pilot_data:
+                state = PilotState(pilot_id, pilot_data, pilot_data.version, tuple(pilot_data.equipped_upgrades))
+            elif state.version != pilot_data.version:
+                upgrades = tuple(pilot_data.equipped_upgrades)
+                # Restored pilots have a new version with the same upgrades
+                if upgrades != state.upgrades:
+                    state = PilotState(pilot_id, pilot_data, pilot_data.version, upgrades)
+            states.append(state)
+        snapshot = tuple(states)
+        return self.__current if snapshot == self.__current else snapshot
+
+    def commit(self, squad: Squad) -> bool:
+        """records the squad after an edit, returns False if it did not change"""
+        snapshot = self.snapshot(squad)
+        if snapshot is self.__current:
+            return False
+        self.__undo.append(self.__current)
+        self.__current = snapshot
+        self.__redo.clear()
+        return True
+
+    def undo(self) -> Optional[SquadSnapshot]:
+        """returns the snapshot before the current one, None if there is none"""
+        if not self.__undo:
+            return None
+        self.__redo.append(self.__current)
+        self.__current = self.__undo.pop()
+        return self.__current
+
+    def redo(self) -> Optional[SquadSnapshot]:
+        """returns the snapshot undone last, None if there is none"""
+        if not self.__redo:
+            return None
+        self.__undo.append(self.__current)
+        self.__current = self.__redo.pop()
+        return self.__current
+
+    def clear(self, squad: Squad):
+        """forgets every step, starting again from the squad"""
+        self.__undo.clear()
+        self.__redo.clear()
+        self.__current = ()
+        self.__current = self.snapshot(squad)
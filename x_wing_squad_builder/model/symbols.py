@@ -0,0 +1,118 @@
+"""
+Integer ids for the names of the model.
+
+Every vocabulary (factions, ships, pilots, upgrades, slots, actions, keywords, ...) numbers its
+names from 0 in the order they are first seen, starting with the vocabularies of constants.py
+and then the names of each definition loaded.  Filters that compare names between squad members
+work on these ids, and on sets of them, instead of on the strings.
+
+Ids are only meaningful inside the process that assigned them: never save them or pass them to
+another process, use the names.  Ids are assigned under a lock, so the table can be shared by
+threads (e.g. a worker building squads while the GUI filters upgrades).
+"""
+import threading
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+from .constants import ACTION_COLORS, ACTIONS_, ARC_TYPES_, BASE_SIZES, FACTION_NAMES, KEYWORDS, UPGRADE_SLOTS_
+from .unique_upgrades import UNIQUE_UPGRADES, get_root
+
+FACTION = "faction"
+SHIP = "ship"
+PILOT = "pilot"
+UPGRADE = "upgrade"
+SLOT = "slot"
+ACTION = "action"
+COLOR = "color"
+KEYWORD = "keyword"
+BASE = "base"
+ARC = "arc"
+# Name roots shared by pilots and upgrades, see unique_upgrades.get_root
+ROOT = "root"
+
+CONSTANT_VOCABULARIES = {
+    FACTION: FACTION_NAMES,
+    SLOT: UPGRADE_SLOTS_,
+    ACTION: ACTIONS_,
+    COLOR: ACTION_COLORS,
+    KEYWORD: KEYWORDS,
+    BASE: BASE_SIZES,
+    ARC: ARC_TYPES_,
+    ROOT: UNIQUE_UPGRADES,
+}
+
+
+class SymbolTable:
+    def __init__(self):
+        self.__ids: Dict[str, Dict[str, int]] = {}
+        self.__names: Dict[str, List[str]] = {}
+        # name of a pilot or upgrade -> id of its root
+        self.__roots: Dict[str, int] = {}
+        self.__lock = threading.Lock()
+        for vocabulary, names in CONSTANT_VOCABULARIES.items():
+            self.ids(vocabulary, names)
+        self.unique_roots: FrozenSet[int] = self.ids(ROOT, UNIQUE_UPGRADES)
+
+    def id(self, vocabulary: str, name: str) -> int:
+        """returns the id of the name, assigning the next one if it has none yet"""
+        symbol = self.find(vocabulary, name)
+        if symbol is not None:
+            return symbol
+        with self.__lock:
+            ids = self.__ids.setdefault(vocabulary, {})
+            symbol = ids.get(name)
+            if symbol is None:
+                names = self.__names.setdefault(vocabulary, [])
+                names.append(name)
+                symbol = ids[name] = len(names) - 1
+            return symbol
+
+    def ids(self, vocabulary: str, names: Iterable[str]) -> FrozenSet[int]:
+        return frozenset(self.id(vocabulary, name) for name in names)
+
+    def find(self, vocabulary: str, name: str) -> Optional[int]:
+        """returns the id of the name, None if it has none (no id is assigned)"""
+        return self.__ids.get(vocabulary, {}).get(name)
+
+    def name(self, vocabulary: str, symbol: int) -> str:
+        return self.__names[vocabulary][symbol]
+
+    def root(self, name: str) -> int:
+        """returns the id of the root of a pilot or upgrade name"""
+        symbol = self.__roots.get(name)
+        if symbol is None:
+            # Two threads may both compute the root, they get the same id
+            symbol = self.__roots[name] = self.id(ROOT, get_root(name))
+        return symbol
+
+    def is_unique(self, name: str) -> bool:
+        """returns True if only one pilot or upgrade with the root of name can be in a squad"""
+        return self.root(name) in self.unique_roots
+
+    def add_definition(self, data: dict):
+        """assigns ids to the names of a definition"""
+        for faction in data["factions"]:
+            self.id(FACTION, faction["name"])
+            for ship in faction["ships"]:
+                self.id(SHIP, ship["name"])
+                self.id(BASE, ship.get("base", ""))
+                self.ids(SLOT, ship.get("upgrade_slots", []))
+                for pilot in ship.get("pilots", []):
+                    self.id(PILOT, pilot["name"])
+                    self.root(pilot["name"])
+                    self.ids(KEYWORD, pilot.get("keywords", []))
+                    self.ids(SLOT, pilot.get("upgrade_slots", []))
+        for upgrade in data["upgrades"]:
+            self.id(UPGRADE, upgrade["name"])
+            self.root(upgrade["name"])
+            self.ids(SLOT, upgrade.get("upgrade_slot_types", []))
+
+
+_symbols: Optional[SymbolTable] = None
+
+
+def symbols() -> SymbolTable:
+    """returns the process wide symbol table"""
+    global _symbols
+    if _symbols is None:
+        _symbols = SymbolTable()
+    return _symbols
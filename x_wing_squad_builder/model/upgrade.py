@@ -1,16 +1,21 @@
 from .pilot_equip import PilotEquip
-from .definition import Action
 from .squad import Squad
 from ..utils import prettify_name
-from ..settings import Settings
-from .upgrade_filters import (upgrade_slot_filter, name_filter, multiple_name_filter, actions_filter,
-                              statistics_filter_simple, statistics_filter_adv, limit_filter, bool_string_filter)
+from ..settings import settings_snapshot
+from .upgrade_restrictions import compile_restrictions
+from .upgrade_index import UpgradeIndex
 
-from .unique_upgrades import UNIQUE_UPGRADES, get_root
+from .symbols import PILOT, UPGRADE, symbols
 
 from typing import List, Optional, Union, Dict
 
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+import weakref
+
+
+# name and root are symbol ids (see symbols.py)
+CompiledUpgrade = namedtuple('CompiledUpgrade', ['unique', 'name', 'root', 'checks'])
+FilterState = namedtuple('FilterState', ['pilot_key', 'pilot_ok', 'deferred', 'squad_key', 'filtered', 'copies'])
 
 
 class Upgrades:
@@ -19,10 +24,34 @@ class Upgrades:
     filtered lists of upgrades based on pilot and upgrade slot.
     """
 
-    settings = Settings()
+    settings = settings_snapshot()
 
     def __init__(self, upgrades: List[dict]):
         self.__upgrades_list = upgrades
+        self.__index = UpgradeIndex(upgrades)
+        self.__compiled = [self.compile_upgrade(upgrade) for upgrade in upgrades]
+        # Upgrade name id -> the first upgrade of that name, as get_upgrade scans the list
+        self.__by_name: Dict[int, dict] = {}
+        for upgrade, compiled in zip(upgrades, self.__compiled):
+            self.__by_name.setdefault(compiled.name, upgrade)
+        # Upgrades whose eligibility depends on other squad members
+        self.__squad_dependent = 0
+        for i, (upgrade, compiled) in enumerate(zip(upgrades, self.__compiled)):
+            if compiled.unique or upgrade.get("squad_include"):
+                self.__squad_dependent |= 1 << i
+        self.__filter_cache = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def compile_upgrade(upgrade: dict) -> CompiledUpgrade:
+        """precomputes the per-upgrade checks filtered_upgrades_by_pilot runs after the index"""
+        table = symbols()
+        solitary = upgrade.get("solitary", "False") == "True"
+        return CompiledUpgrade(
+            unique=solitary or table.is_unique(upgrade['name']),
+            name=table.id(UPGRADE, upgrade['name']),
+            root=table.root(upgrade['name']),
+            checks=compile_restrictions(upgrade, exclude=UpgradeIndex.indexed_restrictions(upgrade)),
+        )
 
     def __iter__(self):
         return (upgrade for upgrade in self.upgrades_list)
@@ -59,96 +88,107 @@ class Upgrades:
         return dict(d)
 
     def get_upgrade(self, upgrade_name: str) -> Optional[dict]:
-        for upgrade in self.upgrades_list:
-            if self.get_upgrade_name(upgrade) == upgrade_name:
-                return upgrade
-        return None
+        name = symbols().find(UPGRADE, upgrade_name)
+        return None if name is None else self.__by_name.get(name)
 
     def filtered_upgrades_by_pilot(self, pilot: PilotEquip, squad: Squad) -> List[dict]:
-        filtered = []
-        for upgrade in self.upgrades_list:
-            valid = upgrade_slot_filter(self.get_upgrade_slots(upgrade), pilot.upgrade_slots)
-            if bool_string_filter(upgrade["epic"]) and self.settings.mode != Settings.Mode.EPIC:
-                valid = False
+        """
+        returns copies of the upgrades the pilot can equip, with costs resolved for the pilot.
 
-            solitary = upgrade.get("solitary", "False") == "True"
-            upgrade_root = get_root(upgrade['name'])
-            if solitary or upgrade_root in UNIQUE_UPGRADES:
-                equipped_upgrade_names = [val.name for _, member in squad.squad_dict.items() for val in member.equipped_upgrades]
-                equipped_pilot_names = [pilot.pilot_name for _, pilot in squad.squad_dict.items()]
-                if upgrade['name'] in equipped_upgrade_names:
-                    valid = False
-                combined_roots = [get_root(i) for i in equipped_pilot_names + equipped_upgrade_names]
-                if upgrade_root in combined_roots:
-                    valid = False
-
-            restrictions = self.get_upgrade_restrictions(upgrade)
-            # TODO: Fill in the rest of the conditionals
-            for key, value in restrictions.items():
-                if key == "limit":
-                    restriction = {upgrade["name"]: value}
-                    upgrade_arr = [upgrade.name for upgrade in pilot.equipped_upgrades]
-                    if not limit_filter(restriction, upgrade_arr):
-                        valid = False
-                elif key == "pilot_limit":
-                    pass
-                elif key == "pilot_initiative":
-                    initiative_stat = {key: pilot.initiative}
-                    if not statistics_filter_simple(value, initiative_stat):
-                        valid = False
-                elif key == "factions":
-                    squad_include = upgrade.get("squad_include", [])
-                    if squad_include:
-                        if not name_filter(value, pilot.faction_name):
-                            squad_names = []
-                            for _, member in squad.squad_dict.items():
-                                squad_names.append(member.pilot_name)
-                                for val in member.equipped_upgrades:
-                                    squad_names.append(val.name)
-                            included = [name in squad_names for name in squad_include]
-                            if not any(included):
-                                valid = False
-                    elif not name_filter(value, pilot.faction_name):
-                        valid = False
-                elif key == "ships":
-                    if not name_filter(value, pilot.ship_name):
-                        valid = False
-                elif key == "base_sizes":
-                    if not name_filter(value, pilot.base_size):
-                        valid = False
-                elif key == "attacks":
-                    # NOTE: we decoupled attacks and arc_types in the filtering.  This may need to be changed in the future.
-                    attacks_stat = {key: pilot.max_attack}
-                    if not statistics_filter_simple(value, attacks_stat):
-                        valid = False
-                elif key == "arc_types":
-                    if not multiple_name_filter(value, pilot.arc_types):
-                        valid = False
-                elif key in ["agility", "hull"]:
-                    if not statistics_filter_simple(value, pilot.get_statistic(pilot.statistics, key)):
-                        valid = False
-                elif key in ["shield", "force", "energy", "charge"]:
-                    test_statistic = pilot.get_statistic(pilot.statistics, key)
-                    if not statistics_filter_adv(value, test_statistic[key]):
-                        valid = False
-                elif key == "actions":
-                    restricted_actions = [Action(**action) for action in value]
-                    if not actions_filter(restricted_actions, pilot.actions):
-                        valid = False
-                elif key == "keywords":
-                    if not multiple_name_filter(value, pilot.keywords):
-                        valid = False
-                elif key == "other_equipped_upgrades":
-                    if not name_filter(value, pilot.equipped_upgrades):
-                        valid = False
+        Results are cached per pilot and re-evaluated incrementally.  Upgrades fall into two
+        groups: those depending only on the pilot and its equipped upgrades, and those that also
+        depend on the rest of the squad (unique/solitary upgrades and squad_include).  The first
+        group is only recomputed when the pilot's equipment or the game mode changes, the second
+        only when the names in the squad change.
+        """
+        epic_mode = self.settings.epic
+        pilot_key = (epic_mode, pilot.version)
+        squad_key = self.squad_state_key(squad)
 
-            if valid:
-                # Create a copy so updated variable costs do not change in the full list.
-                upgrade_copy = upgrade.copy()
-                upgrade_copy["cost"] = self.get_filtered_upgrade_cost(upgrade, pilot)
-                filtered.append(upgrade_copy)
+        state = self.__filter_cache.get(pilot)
+        if state is None:
+            state = FilterState(pilot_key=None, pilot_ok=0, deferred=0, squad_key=None, filtered=[], copies={})
+        if state.pilot_key == pilot_key:
+            if state.squad_key == squad_key:
+                return list(state.filtered)
+            pilot_ok, deferred = state.pilot_ok, state.deferred
+        else:
+            pilot_ok, deferred = self.filter_pilot_dependent(pilot, squad, epic_mode)
 
-        return filtered
+        mask = pilot_ok | self.filter_squad_dependent(deferred, pilot, squad)
+        filtered = [self.costed_copy(i, pilot, state.copies) for i in UpgradeIndex.iter_bits(mask)]
+        self.__filter_cache[pilot] = FilterState(pilot_key, pilot_ok, deferred, squad_key, filtered, state.copies)
+        return list(filtered)
+
+    def filter_pilot_dependent(self, pilot: PilotEquip, squad: Squad, epic_mode: bool):
+        """
+        returns (pilot_ok, deferred) masks: upgrades that pass every check and depend only on the
+        pilot, and candidate upgrades that depend on the squad and still need filter_squad_dependent
+        """
+        # The index rules out everything the pilot's fixed attributes and slots do not allow,
+        # leaving only the equipment dependent checks to run per upgrade.
+        candidates = self.__index.candidates(pilot, epic_mode)
+        deferred = candidates & self.__squad_dependent
+        pilot_ok = 0
+        for i in UpgradeIndex.iter_bits(candidates & ~deferred):
+            if all(check(pilot, squad) for check in self.__compiled[i].checks):
+                pilot_ok |= 1 << i
+        return pilot_ok, deferred
+
+    def filter_squad_dependent(self, deferred: int, pilot: PilotEquip, squad: Squad) -> int:
+        """returns the mask of deferred upgrades that pass every check for the current squad"""
+        passed = 0
+        squad_roots = None
+        for i in UpgradeIndex.iter_bits(deferred):
+            compiled = self.__compiled[i]
+            if compiled.unique:
+                if squad_roots is None:
+                    squad_roots = self.squad_unique_names(squad)
+                equipped_upgrade_names, combined_roots = squad_roots
+                if compiled.name in equipped_upgrade_names or compiled.root in combined_roots:
+                    continue
+            if all(check(pilot, squad) for check in compiled.checks):
+                passed |= 1 << i
+        return passed
+
+    def costed_copy(self, i: int, pilot: PilotEquip, copies: Dict[int, dict]) -> dict:
+        """returns a copy of upgrade i with its cost resolved for the pilot, reusing earlier copies"""
+        upgrade_copy = copies.get(i)
+        if upgrade_copy is None:
+            upgrade = self.upgrades_list[i]
+            # Create a copy so updated variable costs do not change in the full list.
+            upgrade_copy = upgrade.copy()
+            upgrade_copy["cost"] = self.get_filtered_upgrade_cost(upgrade, pilot)
+            copies[i] = upgrade_copy
+        return upgrade_copy
+
+    @staticmethod
+    def squad_state_key(squad: Squad):
+        """
+        returns the part of the squad state that squad dependent upgrades are filtered on, as symbol ids.
+        Names come from the loaded definition, which registered them (see XWing.reindex).
+        """
+        table = symbols()
+        pilot_names = []
+        upgrade_names = []
+        for _, member in squad.squad_dict.items():
+            pilot_names.append(table.find(PILOT, member.pilot_name))
+            upgrade_names.extend(table.find(UPGRADE, upgrade.name) for upgrade in member.equipped_upgrades)
+        return frozenset(pilot_names), frozenset(upgrade_names)
+
+    @staticmethod
+    def squad_unique_names(squad: Squad):
+        """returns the ids of the equipped upgrade names and of the name roots of every pilot and
+        upgrade in the squad, used to filter unique and solitary upgrades"""
+        table = symbols()
+        equipped_upgrade_names = set()
+        combined_roots = set()
+        for _, member in squad.squad_dict.items():
+            combined_roots.add(table.root(member.pilot_name))
+            for val in member.equipped_upgrades:
+                equipped_upgrade_names.add(table.find(UPGRADE, val.name))
+                combined_roots.add(table.root(val.name))
+        return equipped_upgrade_names, combined_roots
 
     def filtered_upgrades_by_pilot_and_slot(self, pilot: PilotEquip, slot: str) -> List[dict]:
         filtered = []
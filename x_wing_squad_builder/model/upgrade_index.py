@@ -0,0 +1,179 @@
+"""
+Bitset index over the upgrade list.
+
+Bit i of every mask stands for upgrades[i].  Each static restriction dimension (faction,
+ship, base size, keywords, arc types, initiative/agility/hull/attack ranges, upgrade slots
+and the epic flag) maps a pilot's value to the mask of upgrades that allow it, so the
+upgrades a pilot can take are narrowed down by AND-ing a handful of integers.  Only the
+surviving upgrades need the remaining per-upgrade (dynamic) checks.
+"""
+from collections import Counter, defaultdict
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional
+
+from .pilot_equip import PilotEquip
+from .upgrade_filters import bool_string_filter
+from .upgrade_restrictions import is_null_range, range_bounds, in_range
+
+
+class NameDimension:
+    """Masks for a restriction given as a list of names, an empty list meaning no restriction."""
+
+    def __init__(self):
+        self.unrestricted = 0
+        self.by_name: Dict[str, int] = defaultdict(int)
+
+    def add(self, bit: int, names: Optional[list]):
+        if not names:
+            self.unrestricted |= bit
+            return
+        for name in names:
+            self.by_name[name] |= bit
+
+    def query(self, name: str) -> int:
+        """mask of upgrades allowing name (name_filter)"""
+        return self.unrestricted | self.by_name.get(name, 0)
+
+    def query_any(self, names: Iterable[str]) -> int:
+        """mask of upgrades allowing any of names (multiple_name_filter)"""
+        mask = self.unrestricted
+        for name in names:
+            mask |= self.by_name.get(name, 0)
+        return mask
+
+
+class RangeDimension:
+    """Masks for a {'low': ..., 'high': ...} restriction, bucketed lazily by the tested value."""
+
+    def __init__(self):
+        self.unrestricted = 0
+        self.ranges = []
+        self.buckets: Dict[int, int] = {}
+
+    def add(self, bit: int, restriction: Optional[dict]):
+        if not restriction or is_null_range(restriction):
+            self.unrestricted |= bit
+            return
+        self.ranges.append((bit, range_bounds(restriction)))
+
+    def query(self, value) -> int:
+        if value is None:
+            value = 0
+        mask = self.buckets.get(value)
+        if mask is None:
+            mask = self.unrestricted
+            for bit, bounds in self.ranges:
+                if in_range(bounds, value):
+                    mask |= bit
+            self.buckets[value] = mask
+        return mask
+
+
+class SlotDimension:
+    """Masks of upgrades needing at least n of a given slot type (upgrade_slot_filter)."""
+
+    def __init__(self):
+        self.at_least: Dict[str, List[int]] = {}
+
+    def add(self, bit: int, slots: Optional[List[str]]):
+        for slot, count in Counter(slots or []).items():
+            masks = self.at_least.setdefault(slot, [0])
+            while len(masks) <= count:
+                masks.append(0)
+            for n in range(1, count + 1):
+                masks[n] |= bit
+
+    def excluded(self, pilot_slots: List[str]) -> int:
+        """mask of upgrades needing more slots of some type than pilot_slots provides"""
+        counts = Counter(pilot_slots)
+        mask = 0
+        for slot, masks in self.at_least.items():
+            available = counts.get(slot, 0)
+            if available + 1 < len(masks):
+                mask |= masks[available + 1]
+        return mask
+
+
+class UpgradeIndex:
+    """Bitset index answering which upgrades a pilot can take on static grounds."""
+
+    # Restrictions answered by the index, which therefore need no per-upgrade check.
+    NAME_RESTRICTIONS = {
+        "factions": "faction_name",
+        "ships": "ship_name",
+        "base_sizes": "base_size",
+    }
+    MULTIPLE_NAME_RESTRICTIONS = {
+        "keywords": "keywords",
+        "arc_types": "arc_types",
+    }
+    RANGE_RESTRICTIONS = ["pilot_initiative", "agility", "hull", "attacks"]
+
+    def __init__(self, upgrades: List[dict]):
+        self.all = (1 << len(upgrades)) - 1
+        self.epic = 0
+        self.slots = SlotDimension()
+        self.names = {key: NameDimension() for key in self.NAME_RESTRICTIONS}
+        self.multiple_names = {key: NameDimension() for key in self.MULTIPLE_NAME_RESTRICTIONS}
+        self.ranges = {key: RangeDimension() for key in self.RANGE_RESTRICTIONS}
+
+        for i, upgrade in enumerate(upgrades):
+            bit = 1 << i
+            restrictions = upgrade.get("restrictions") or {}
+            indexed = self.indexed_restrictions(upgrade)
+            if bool_string_filter(upgrade.get("epic", "False")):
+                self.epic |= bit
+            self.slots.add(bit, upgrade.get("upgrade_slot_types"))
+            for key, dimension in self.names.items():
+                dimension.add(bit, restrictions.get(key) if key in indexed else None)
+            for key, dimension in self.multiple_names.items():
+                dimension.add(bit, restrictions.get(key))
+            for key, dimension in self.ranges.items():
+                dimension.add(bit, restrictions.get(key))
+
+    @classmethod
+    def indexed_restrictions(cls, upgrade: dict) -> FrozenSet[str]:
+        """returns the restriction keys of an upgrade answered by the index"""
+        keys = set(cls.NAME_RESTRICTIONS) | set(cls.MULTIPLE_NAME_RESTRICTIONS) | set(cls.RANGE_RESTRICTIONS)
+        # Factions can be overridden by squad_include, which depends on the squad.
+        if upgrade.get("squad_include"):
+            keys.discard("factions")
+        return frozenset(keys)
+
+    @staticmethod
+    def pilot_range_values(pilot: PilotEquip) -> Dict[str, Optional[int]]:
+        try:
+            max_attack = pilot.max_attack
+        except ValueError:
+            # pilot without any attack
+            max_attack = None
+        return {
+            "pilot_initiative": pilot.initiative,
+            "agility": pilot.get_statistic(pilot.statistics, "agility")["agility"],
+            "hull": pilot.get_statistic(pilot.statistics, "hull")["hull"],
+            "attacks": max_attack,
+        }
+
+    def static_candidates(self, pilot: PilotEquip, epic_mode: bool) -> int:
+        """mask of upgrades allowed by the pilot's fixed attributes, ignoring slots"""
+        mask = self.all
+        if not epic_mode:
+            mask &= ~self.epic
+        for key, attribute in self.NAME_RESTRICTIONS.items():
+            mask &= self.names[key].query(getattr(pilot, attribute))
+        for key, attribute in self.MULTIPLE_NAME_RESTRICTIONS.items():
+            mask &= self.multiple_names[key].query_any(getattr(pilot, attribute))
+        for key, value in self.pilot_range_values(pilot).items():
+            mask &= self.ranges[key].query(value)
+        return mask
+
+    def candidates(self, pilot: PilotEquip, epic_mode: bool) -> int:
+        """mask of upgrades the pilot can take on static grounds with its current upgrade slots"""
+        return self.static_candidates(pilot, epic_mode) & ~self.slots.excluded(pilot.upgrade_slots)
+
+    @staticmethod
+    def iter_bits(mask: int) -> Iterator[int]:
+        """yields the index of every set bit, lowest first"""
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
@@ -0,0 +1,182 @@
+"""
+Compiles the "restrictions" dictionary of an upgrade into a short list of checks.
+
+Every upgrade in definition.json carries every restriction key, most of them empty
+lists or {"low": null, "high": null} ranges.  Compiling once at load time drops the
+restrictions that can never fail and pre-builds anything the remaining checks need
+(sets, Action objects, range bounds), so filtering only runs the checks that matter.
+"""
+from typing import Callable, Collection, Dict, List, Optional
+
+from .definition import action_record
+from .pilot_equip import PilotEquip
+from .squad import Squad
+from .upgrade_filters import actions_filter, name_filter
+
+RestrictionCheck = Callable[[PilotEquip, Squad], bool]
+
+# Defaults used by statistics_filter_simple for open ended ranges
+RANGE_LOW = 0
+RANGE_HIGH = 100
+
+
+def is_null_range(value: dict) -> bool:
+    """returns True if a {'low': ..., 'high': ...} range places no restriction"""
+    return value.get("low") is None and value.get("high") is None
+
+
+def range_bounds(value: dict):
+    """returns the (low, high) bounds of a range, following statistics_filter_simple"""
+    low = value.get("low")
+    high = value.get("high")
+    return (RANGE_LOW if low is None else low, RANGE_HIGH if high is None else high)
+
+
+def in_range(bounds, test_val) -> bool:
+    low, high = bounds
+    if test_val is None:
+        test_val = 0
+    return low <= test_val < high
+
+
+def squad_names(squad: Squad) -> List[str]:
+    """returns the names of every pilot and equipped upgrade in the squad"""
+    names = []
+    for _, member in squad.squad_dict.items():
+        names.append(member.pilot_name)
+        names.extend(upgrade.name for upgrade in member.equipped_upgrades)
+    return names
+
+
+def _compile_limit(key: str, value: int, upgrade: dict) -> Optional[RestrictionCheck]:
+    if value == 0:
+        return None
+    upgrade_name = upgrade["name"]
+
+    def check(pilot: PilotEquip, squad: Squad) -> bool:
+        count = sum(1 for equipped in pilot.equipped_upgrades if equipped.name == upgrade_name)
+        return count < value
+    return check
+
+
+def _compile_pilot_initiative(key: str, value: dict, upgrade: dict) -> Optional[RestrictionCheck]:
+    if is_null_range(value):
+        return None
+    bounds = range_bounds(value)
+    return lambda pilot, squad: in_range(bounds, pilot.initiative)
+
+
+def _compile_factions(key: str, value: list, upgrade: dict) -> Optional[RestrictionCheck]:
+    if not value:
+        return None
+    factions = frozenset(value)
+    squad_include = upgrade.get("squad_include", [])
+    if not squad_include:
+        return lambda pilot, squad: pilot.faction_name in factions
+
+    def check(pilot: PilotEquip, squad: Squad) -> bool:
+        # Out of faction upgrades are allowed if one of the included names is in the squad
+        if pilot.faction_name in factions:
+            return True
+        names = set(squad_names(squad))
+        return any(name in names for name in squad_include)
+    return check
+
+
+def _compile_name(attribute: str) -> Callable:
+    def compile_name(key: str, value: list, upgrade: dict) -> Optional[RestrictionCheck]:
+        if not value:
+            return None
+        names = frozenset(value)
+        return lambda pilot, squad: getattr(pilot, attribute) in names
+    return compile_name
+
+
+def _compile_multiple_name(attribute: str) -> Callable:
+    def compile_multiple_name(key: str, value: list, upgrade: dict) -> Optional[RestrictionCheck]:
+        if not value:
+            return None
+        names = frozenset(value)
+        return lambda pilot, squad: any(test_case in names for test_case in getattr(pilot, attribute))
+    return compile_multiple_name
+
+
+def _compile_attacks(key: str, value: dict, upgrade: dict) -> Optional[RestrictionCheck]:
+    if is_null_range(value):
+        return None
+    bounds = range_bounds(value)
+    return lambda pilot, squad: in_range(bounds, pilot.max_attack)
+
+
+def _compile_simple_statistic(key: str, value: dict, upgrade: dict) -> Optional[RestrictionCheck]:
+    if is_null_range(value):
+        return None
+    bounds = range_bounds(value)
+    return lambda pilot, squad: in_range(bounds, pilot.get_statistic(pilot.statistics, key)[key])
+
+
+def _compile_adv_statistic(key: str, value: dict, upgrade: dict) -> Optional[RestrictionCheck]:
+    sub_bounds = [(sub_key, range_bounds(sub_range)) for sub_key, sub_range in value.items()
+                  if not is_null_range(sub_range)]
+    if not sub_bounds:
+        return None
+
+    def check(pilot: PilotEquip, squad: Squad) -> bool:
+        test_statistic = pilot.get_statistic(pilot.statistics, key)[key]
+        return all(in_range(bounds, test_statistic.get(sub_key)) for sub_key, bounds in sub_bounds)
+    return check
+
+
+def _compile_actions(key: str, value: list, upgrade: dict) -> Optional[RestrictionCheck]:
+    if not value:
+        return None
+    restricted_actions = [action_record(action) for action in value]
+    return lambda pilot, squad: actions_filter(restricted_actions, pilot.actions)
+
+
+def _compile_other_equipped_upgrades(key: str, value: list, upgrade: dict) -> Optional[RestrictionCheck]:
+    if not value:
+        return None
+    return lambda pilot, squad: name_filter(value, pilot.equipped_upgrades)
+
+
+RESTRICTION_COMPILERS: Dict[str, Callable] = {
+    "limit": _compile_limit,
+    "pilot_initiative": _compile_pilot_initiative,
+    "factions": _compile_factions,
+    "ships": _compile_name("ship_name"),
+    "base_sizes": _compile_name("base_size"),
+    "attacks": _compile_attacks,
+    "arc_types": _compile_multiple_name("arc_types"),
+    "agility": _compile_simple_statistic,
+    "hull": _compile_simple_statistic,
+    "shield": _compile_adv_statistic,
+    "force": _compile_adv_statistic,
+    "energy": _compile_adv_statistic,
+    "charge": _compile_adv_statistic,
+    "actions": _compile_actions,
+    "keywords": _compile_multiple_name("keywords"),
+    "other_equipped_upgrades": _compile_other_equipped_upgrades,
+}
+
+
+def compile_restrictions(upgrade: dict, exclude: Collection[str] = ()) -> List[RestrictionCheck]:
+    """
+    returns the checks an upgrade's restrictions reduce to.  A pilot may equip the
+    upgrade (restriction-wise) if every check returns True for the pilot and squad.
+
+    Restrictions that can never fail (empty lists, null ranges, a limit of 0, and the
+    currently unused pilot_limit) are dropped entirely, as are the keys in exclude
+    (restrictions the caller evaluates some other way).
+    """
+    checks = []
+    for key, value in (upgrade.get("restrictions") or {}).items():
+        if key in exclude:
+            continue
+        compiler = RESTRICTION_COMPILERS.get(key)
+        if compiler is None:
+            continue
+        check = compiler(key, value, upgrade)
+        if check is not None:
+            checks.append(check)
+    return checks
@@ -1,9 +1,9 @@
-import json
-
 from typing import List, Optional
 
 from .faction import Faction
 from .ship import Ship
+from .definition_snapshot import load_definition
+from .symbols import symbols
 
 from ..utils import prettify_name
 
@@ -11,9 +11,29 @@ from collections import defaultdict
 
 
 class XWing:
+    """
+    Entry point into the definition data.
+
+    Faction, ship and pilot lookups are served from an index that is built once, so the
+    same Faction and Ship instances are handed out on every call.  If self.data is mutated
+    in place, call reindex() to rebuild it; reloading from disk creates a new instance.
+
+    Data loaded with launch_xwing_data shares its repeated values (see share_definition) and
+    must not be mutated in place.
+    """
 
     def __init__(self, data):
         self.data = data
+        self.__faction_index = {}
+        self.reindex()
+
+    def reindex(self):
+        """(re)builds the faction -> ship -> pilot lookup index from self.data"""
+        symbols().add_definition(self.data)
+        index = {}
+        for faction_data in self.data["factions"]:
+            index.setdefault(faction_data["name"], Faction(faction_data))
+        self.__faction_index = index
 
     @property
     def faction_names(self) -> List[str]:
@@ -24,32 +44,28 @@ class XWing:
         return self.data["upgrades"]
 
     def get_faction(self, faction_name: str) -> Optional[Faction]:
-        for i, test_faction in enumerate(self.data["factions"]):
-            if faction_name == test_faction["name"]:
-                return Faction(test_faction)
-        return None
+        return self.__faction_index.get(faction_name)
 
     def get_ship(self, faction_name: str, ship_name: str) -> Optional[Ship]:
         faction = self.get_faction(faction_name)
-        ship = faction.get_ship(ship_name)
-        return ship
+        if faction is None:
+            return None
+        return faction.get_ship(ship_name)
 
     @classmethod
     def launch_xwing_data(cls, data_path: str):
-        with open(data_path) as file:
-            data = json.load(file)
-        return cls(data)
+        return cls(load_definition(data_path, shared=True))
 
-    def get_pilot(self, faction_name: str, ship_name: str, pilot_name: str):
-        faction = self.get_faction(faction_name)
-        ship = faction.get_ship(ship_name)
+    def get_pilot(self, faction_name: str, ship_name: str, pilot_name: str) -> Optional[dict]:
+        ship = self.get_ship(faction_name, ship_name)
+        if ship is None:
+            return None
         return ship.get_pilot_data(pilot_name)
 
     @property
     def faction_ship_pilot_dict(self):
         d = defaultdict(lambda: defaultdict(list))
-        for faction_name in self.faction_names:
-            faction = self.get_faction(faction_name)
+        for faction_name, faction in self.__faction_index.items():
             for ship in faction.faction_ships:
                 for pilot_name in ship.pilot_names_for_gui:
                     d[faction_name][ship.ship_name].append(pilot_name)
@@ -0,0 +1,76 @@
+from bisect import bisect_left
+from enum import Enum
+from typing import Iterable, List, Optional, Set, Tuple
+
+Path = Tuple[str, ...]
+
+
+class SearchMode(Enum):
+    SUBSTRING = "substring"
+    PREFIX = "prefix"
+    TOKENS = "tokens"
+
+
+class SearchIndex:
+    """
+    Lowercase index of the leaves of a catalog tree, each leaf given by its path of row texts
+    (e.g. faction, ship, pilot).  Leaves are matched on their own text:
+
+    - SUBSTRING: the query appears anywhere in the text
+    - PREFIX: a word of the text starts with the query, looked up in a sorted word list
+    - TOKENS: every whitespace separated token of the query appears in the text
+
+    The result of the last search is kept, and a query that extends it (the user typing another
+    character) only checks the leaves that matched before.
+    """
+
+    def __init__(self, paths: Iterable[Path]):
+        self.paths: List[Path] = list(paths)
+        self.texts = [path[-1].lower() for path in self.paths]
+        self.words = sorted((word, i) for i, text in enumerate(self.texts) for word in set(text.split()))
+        self.__last: Optional[Tuple[SearchMode, str, Set[int]]] = None
+
+    def __len__(self):
+        return len(self.paths)
+
+    def search(self, query: str, mode: SearchMode = SearchMode.TOKENS) -> Set[int]:
+        """returns the positions of the matching leaves, every leaf for an empty query"""
+        query = query.lower()
+        if mode is SearchMode.PREFIX:
+            query = query.strip()
+        if not query.strip():
+            return set(range(len(self.paths)))
+
+        candidates: Iterable[int] = range(len(self.paths))
+        if self.__last is not None:
+            last_mode, last_query, last_matches = self.__last
+            if last_mode is mode and query.startswith(last_query):
+                candidates = last_matches
+
+        if mode is SearchMode.SUBSTRING:
+            matches = {i for i in candidates if query in self.texts[i]}
+        elif mode is SearchMode.PREFIX:
+            matches = self.prefix_matches(query) & set(candidates)
+        else:
+            tokens = query.split()
+            matches = {i for i in candidates if all(token in self.texts[i] for token in tokens)}
+        self.__last = (mode, query, matches)
+        return matches
+
+    def prefix_matches(self, prefix: str) -> Set[int]:
+        """returns the positions of the leaves with a word starting with prefix"""
+        matches = set()
+        for word, i in self.words[bisect_left(self.words, (prefix,)):]:
+            if not word.startswith(prefix):
+                break
+            matches.add(i)
+        return matches
+
+    def matching_paths(self, query: str, mode: SearchMode = SearchMode.TOKENS) -> Set[Path]:
+        """returns the paths of the matching leaves and of every row above them"""
+        paths = set()
+        for i in self.search(query, mode):
+            path = self.paths[i]
+            for depth in range(1, len(path) + 1):
+                paths.add(path[:depth])
+        return paths
@@ -2,6 +2,7 @@
 import os
 from enum import Enum
 from pathlib import Path
+from typing import Optional
 
 from PySide6 import QtCore
 
@@ -38,8 +39,10 @@ class Settings:
         EPIC = "Epic"
         FREEDOM = "Freedom"
     
+    # LOCALAPPDATA is only set on Windows, batch jobs may run elsewhere
+    local_app_data = Path(os.getenv("LOCALAPPDATA", Path.home() / ".local" / "share"))
     defaults = {
-        Key.LOG_FILE_DIR: Path(os.getenv("LOCALAPPDATA")) / organization_name / application_name,
+        Key.LOG_FILE_DIR: local_app_data / organization_name / application_name,
         Key.THEME: Theme.LIGHT,
         Key.MODE: Mode.STANDARD,
         Key.SCALE: 1,
@@ -72,6 +75,11 @@ class Settings:
     def log_file_dir(self, val: Path):
         self.q_settings.setValue(self.Key.LOG_FILE_DIR.value, str(val))
 
+    @property
+    def cache_dir(self) -> Path:
+        """Directory for regenerable data (snapshots, thumbnails).  Not user configurable."""
+        return self.defaults[self.Key.LOG_FILE_DIR] / "cache"
+
     @property
     def theme(self) -> Theme:
         return self.Theme(self.q_settings.value(self.Key.THEME.value, self.defaults[self.Key.THEME]))
@@ -95,3 +103,50 @@ class Settings:
     @scale.setter
     def scale(self, val: float):
         self.q_settings.setValue(self.Key.SCALE.value, val)
+
+
+class SettingsSnapshot:
+    """
+    In-memory copy of the settings for hot code paths.
+
+    Reading a Settings property queries QSettings every time.  The snapshot reads every
+    setting once and is reloaded when the SettingsWindow saves, so code running per pilot,
+    upgrade or pixmap only reads plain attributes.  generation is incremented on every
+    reload and can be used to invalidate values derived from the settings.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None):
+        self.generation = 0
+        self.reload(settings)
+
+    def reload(self, settings: Optional[Settings] = None):
+        if settings is None:
+            settings = Settings()
+        self.log_file_dir: Path = settings.log_file_dir
+        self.theme: Settings.Theme = settings.theme
+        self.mode: Settings.Mode = settings.mode
+        self.scale: float = settings.scale
+        self.generation += 1
+
+    def update(self, **values):
+        """overrides settings in this snapshot only (e.g. the mode of a batch job), without saving them"""
+        for name, value in values.items():
+            if not hasattr(self, name):
+                raise AttributeError(f"Unknown setting {name}")
+            setattr(self, name, value)
+        self.generation += 1
+
+    @property
+    def epic(self) -> bool:
+        return self.mode == Settings.Mode.EPIC
+
+
+_settings_snapshot: Optional[SettingsSnapshot] = None
+
+
+def settings_snapshot() -> SettingsSnapshot:
+    """returns the process wide settings snapshot, reading the settings on first use"""
+    global _settings_snapshot
+    if _settings_snapshot is None:
+        _settings_snapshot = SettingsSnapshot()
+    return _settings_snapshot
@@ -2,7 +2,7 @@ import logging
 from pathlib import Path
 from PySide6 import QtGui, QtCore, QtWidgets
 from .ui.settings_window_ui import Ui_SettingsWindow
-from .settings import Settings
+from .settings import Settings, settings_snapshot
 
 
 class SettingsWindow(QtWidgets.QDialog):
@@ -16,6 +16,8 @@ class SettingsWindow(QtWidgets.QDialog):
         self.ui.log_file_directory_line_edit.setReadOnly(True)
 
         self.settings = Settings()
+        # Connected first so every other saved_signal slot sees the new settings.
+        self.saved_signal.connect(settings_snapshot().reload)
         self.populate_combo_boxes()
         self.populate_values()
         self.connect_buttons()
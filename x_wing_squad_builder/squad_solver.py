@@ -0,0 +1,158 @@
+"""
+Searches for the best squad of a faction under a points budget, see solve_squad.
+
+Every pilot is reduced to the Pareto frontier of its loadouts (see model.loadouts), and the
+squad is searched by branch and bound over those loadouts.  Loadouts are sorted by value per
+point, so the value still reachable below a node is bounded by the remaining points times the
+best ratio left, and by the remaining pilots times the best value left.  The top level branches
+are split over a process pool, sharing the best value found so far to prune each other.
+"""
+import multiprocessing
+from collections import namedtuple
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
+
+from .model import Upgrades, XWing
+from .model.loadouts import Loadout, LoadoutTable, loadout_table_path
+
+SquadSolution = namedtuple('SquadSolution', ['value', 'cost', 'loadouts'])
+
+# (loadout, pilot limit) pairs sorted by value per point
+Option = Tuple[Loadout, int]
+
+# Nodes searched between reads of the shared best value
+SYNC_INTERVAL = 1024
+
+# Search state of the process, see init_search
+_search = None
+
+
+class SearchState:
+    def __init__(self, options: List[Option], budget: int, max_pilots: int, shared_best):
+        self.options = options
+        self.budget = budget
+        self.max_pilots = max_pilots
+        self.shared_best = shared_best
+        self.ratios = [ratio(loadout) for loadout, _ in options]
+        # Best value from each option to the end of the list
+        self.suffix_best = [0.0] * (len(options) + 1)
+        for i in range(len(options) - 1, -1, -1):
+            self.suffix_best[i] = max(self.suffix_best[i + 1], options[i][0].value)
+
+
+def ratio(loadout: Loadout) -> float:
+    return loadout.value / loadout.cost if loadout.cost > 0 else float("inf")
+
+
+def init_search(options: List[Option], budget: int, max_pilots: int, shared_best):
+    """initializer of the search pool, also used to search in this process"""
+    global _search
+    _search = SearchState(options, budget, max_pilots, shared_best)
+
+
+def search_branch(first: int) -> Tuple[float, List[int]]:
+    """returns the best (value, option indices) of the squads whose first option is options[first]"""
+    state = _search
+    options = state.options
+    # Best value known to any process, and the best squad found by this branch
+    best_value = state.shared_best.value
+    found_value = float("-inf")
+    best_picks: List[int] = []
+    picks: List[int] = []
+    counts: Dict[str, int] = {}
+    nodes = 0
+
+    def visit(start: int, remaining: int, pilots_left: int, value: float, uniques: FrozenSet[str]):
+        nonlocal best_value, found_value, best_picks, nodes
+        nodes += 1
+        if nodes % SYNC_INTERVAL == 0:
+            best_value = max(best_value, state.shared_best.value)
+        if value > best_value:
+            best_value = found_value = value
+            best_picks = list(picks)
+            with state.shared_best.get_lock():
+                if value > state.shared_best.value:
+                    state.shared_best.value = value
+        if pilots_left == 0:
+            return
+        for i in range(start, len(options)):
+            # Later options are worth less per point and in total
+            if value + min(state.ratios[i] * remaining, state.suffix_best[i] * pilots_left) <= best_value:
+                break
+            loadout, limit = options[i]
+            pilot_name = loadout.pilot[2]
+            if loadout.cost > remaining or counts.get(pilot_name, 0) >= limit or loadout.uniques & uniques:
+                continue
+            counts[pilot_name] = counts.get(pilot_name, 0) + 1
+            picks.append(i)
+            visit(i, remaining - loadout.cost, pilots_left - 1, value + loadout.value, uniques | loadout.uniques)
+            picks.pop()
+            counts[pilot_name] -= 1
+
+    loadout, _ = options[first]
+    counts[loadout.pilot[2]] = 1
+    picks.append(first)
+    visit(first, state.budget - loadout.cost, state.max_pilots - 1, loadout.value, loadout.uniques)
+    # Empty if nothing in this branch beats what was already found
+    return found_value, best_picks
+
+
+def sort_options(options: List[Option]) -> List[Option]:
+    return sorted(options, key=lambda option: (-ratio(option[0]), -option[0].value, option[0].cost))
+
+
+def squad_options(table: LoadoutTable, faction_name: str) -> List[Option]:
+    options = []
+    for pilot_key in table.pilot_keys(faction_name):
+        limit = table.pilot_limit(pilot_key)
+        options.extend((loadout, limit) for loadout in table.loadouts(pilot_key))
+    return sort_options(options)
+
+
+def search(options: List[Option], budget: int, max_pilots: int,
+           processes: Optional[int] = None) -> Tuple[float, List[int]]:
+    """returns the best (value, option indices) of the squads of options, options sorted as by squad_options"""
+    shared_best = multiprocessing.Value("d", float("-inf"))
+    branches = range(len(options))
+    if processes == 1:
+        init_search(options, budget, max_pilots, shared_best)
+        results = list(map(search_branch, branches))
+    else:
+        with Pool(processes, initializer=init_search, initargs=(options, budget, max_pilots, shared_best)) as pool:
+            results = list(pool.imap_unordered(search_branch, branches, chunksize=8))
+    return max(results, key=lambda result: result[0], default=(float("-inf"), []))
+
+
+def solve_squad(xwing: XWing, upgrades: Upgrades, faction_name: str, budget: int = 200,
+                weights: Optional[Dict[str, float]] = None, max_pilots: int = 8,
+                processes: Optional[int] = None, table: Optional[LoadoutTable] = None,
+                data_path: Optional[Union[str, Path]] = None) -> Optional[SquadSolution]:
+    """
+    returns the squad of the faction with the highest total value costing at most budget, None if
+    no pilot fits.  weights maps metric names (see model.loadouts.METRICS) to non negative
+    weights, by default the points spent are maximized.  processes=1 searches in this process.
+
+    Pass a LoadoutTable (for the same weights and budget) to reuse loadouts between searches.
+    Otherwise, pass the definition file xwing was loaded from as data_path to keep the loadouts in
+    the cache directory (see model.loadouts.loadout_table_path): only the pilots whose loadouts
+    changed since the last search are computed again.
+    """
+    cache_path = None
+    if table is None:
+        weights = weights or {"points": 1}
+        table = LoadoutTable(xwing, upgrades, weights, budget)
+        if data_path is not None:
+            cache_path = loadout_table_path(data_path, weights, budget)
+            table.load(cache_path)
+    cached = len(table)
+    table.compute(table.pilot_keys(faction_name), processes)
+    if cache_path is not None and len(table) > cached:
+        table.save(cache_path)
+    options = [option for option in squad_options(table, faction_name) if option[0].cost <= budget]
+    if not options:
+        return None
+
+    best_value, best_picks = search(options, budget, max_pilots, processes)
+    loadouts = [options[i][0] for i in best_picks]
+    return SquadSolution(best_value, sum(loadout.cost for loadout in loadouts), loadouts)
@@ -0,0 +1,208 @@
+import bisect
+from collections import namedtuple
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from PySide6 import QtCore
+
+from .model import PilotEquip, Squad
+from .model.pilot_equip import Upgrade
+from .utils import prettify_name
+from .utils_pyside import image_path_to_qpixmap
+
+SlotRow = namedtuple('SlotRow', ['slot', 'upgrade'])
+
+
+class SquadTreeModel(QtCore.QAbstractItemModel):
+    """
+    Tree model of the squad: one top level row per equipped pilot with a child row per upgrade slot.
+
+    Pilots are addressed by their squad pilot id.  The model holds on to the pilot data of its rows
+    so that a pilot can be removed from the squad before its row is removed.  The slot rows of
+    every pilot are kept so that refresh_pilot can compare them with the pilot's current slots and
+    only emit the rows that changed (dataChanged for a slot that was equipped or emptied, row
+    inserts/removals for slots granted or taken away by an upgrade) instead of rebuilding the tree.
+    """
+
+    HEADERS = ["Squad", "Upgrade"]
+    # internalId of top level indexes, child indexes store their pilot id + 1.
+    PILOT_ROW_ID = 0
+
+    def __init__(self, squad: Squad, upgrade_slots_dir: Path, parent: Optional[QtCore.QObject] = None):
+        super().__init__(parent)
+        self.upgrade_slots_dir = upgrade_slots_dir
+        self.__squad = squad
+        self.__pilot_ids: List[int] = []
+        self.__pilot_data: Dict[int, PilotEquip] = {}
+        self.__slot_rows: Dict[int, List[SlotRow]] = {}
+
+    @property
+    def squad(self) -> Squad:
+        return self.__squad
+
+    def set_squad(self, squad: Squad):
+        self.beginResetModel()
+        self.__squad = squad
+        self.__pilot_ids = list(squad.squad_dict)
+        self.__pilot_data = dict(squad.squad_dict)
+        self.__slot_rows = {pilot_id: self.slot_rows(pilot_data)
+                            for pilot_id, pilot_data in self.__pilot_data.items()}
+        self.endResetModel()
+
+    @staticmethod
+    def slot_rows(pilot_data: PilotEquip) -> List[SlotRow]:
+        """returns the pilot's upgrade slots, each equipped upgrade assigned to the first free slots of its types"""
+        rows = [[slot, None] for slot in pilot_data.upgrade_slots]
+        for upgrade in pilot_data.equipped_upgrades:
+            for slot in upgrade.attributes['upgrade_slot_types']:
+                for row in rows:
+                    if row[1] is None and row[0] == slot:
+                        row[1] = upgrade
+                        break
+        return [SlotRow(*row) for row in rows]
+
+    def add_pilot(self, pilot_id: int) -> QtCore.QModelIndex:
+        """
+        adds a row for a pilot already added to the squad, returns its index.  Rows are in the
+        order of the pilot ids like the squad, so new pilots are appended.
+        """
+        row = bisect.bisect(self.__pilot_ids, pilot_id)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.__pilot_ids.insert(row, pilot_id)
+        self.__pilot_data[pilot_id] = self.__squad.get_pilot_data(pilot_id)
+        self.__slot_rows[pilot_id] = self.slot_rows(self.__pilot_data[pilot_id])
+        self.endInsertRows()
+        return self.pilot_index(pilot_id)
+
+    def remove_pilot(self, pilot_id: int):
+        """removes the row of a pilot that was removed from the squad"""
+        row = self.__pilot_ids.index(pilot_id)
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self.__pilot_ids[row]
+        del self.__pilot_data[pilot_id]
+        del self.__slot_rows[pilot_id]
+        self.endRemoveRows()
+
+    def refresh(self):
+        for pilot_id in self.__pilot_ids:
+            self.refresh_pilot(pilot_id)
+
+    def refresh_pilot(self, pilot_id: int) -> bool:
+        """updates the rows of a pilot to its current slots and upgrades, returns True if anything changed"""
+        old = self.__slot_rows[pilot_id]
+        new = self.slot_rows(self.__pilot_data[pilot_id])
+        if old == new:
+            return False
+        parent = self.pilot_index(pilot_id)
+
+        # Rows keep their place as long as their slot is unchanged, only the slots in between the
+        # unchanged head and tail are removed and inserted.
+        head = 0
+        while head < min(len(old), len(new)) and old[head].slot == new[head].slot:
+            head += 1
+        tail = 0
+        while tail < min(len(old), len(new)) - head and old[-1 - tail].slot == new[-1 - tail].slot:
+            tail += 1
+
+        if len(old) - tail > head:
+            self.beginRemoveRows(parent, head, len(old) - tail - 1)
+            self.__slot_rows[pilot_id] = old[:head] + old[len(old) - tail:]
+            self.endRemoveRows()
+        if len(new) - tail > head:
+            self.beginInsertRows(parent, head, len(new) - tail - 1)
+            self.__slot_rows[pilot_id] = new
+            self.endInsertRows()
+        self.__slot_rows[pilot_id] = new
+
+        changed = [row for row in range(head) if old[row] != new[row]]
+        changed += [len(new) - tail + i for i in range(tail) if old[len(old) - tail + i] != new[len(new) - tail + i]]
+        if changed:
+            self.dataChanged.emit(self.index(min(changed), 0, parent),
+                                  self.index(max(changed), len(self.HEADERS) - 1, parent))
+        # The pilot row shows the cost with upgrades
+        self.dataChanged.emit(parent, parent.siblingAtColumn(len(self.HEADERS) - 1))
+        return True
+
+    def pilot_index(self, pilot_id: int, column: int = 0) -> QtCore.QModelIndex:
+        try:
+            row = self.__pilot_ids.index(pilot_id)
+        except ValueError:
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, self.PILOT_ROW_ID)
+
+    def is_pilot(self, index: QtCore.QModelIndex) -> bool:
+        return index.isValid() and index.internalId() == self.PILOT_ROW_ID
+
+    def pilot_id(self, index: QtCore.QModelIndex) -> Optional[int]:
+        """returns the pilot id of a pilot row or of the pilot a slot row belongs to"""
+        if not index.isValid():
+            return None
+        if self.is_pilot(index):
+            return self.__pilot_ids[index.row()]
+        return index.internalId() - 1
+
+    def pilot_data(self, index: QtCore.QModelIndex) -> Optional[PilotEquip]:
+        pilot_id = self.pilot_id(index)
+        return None if pilot_id is None else self.__pilot_data[pilot_id]
+
+    def slot_row(self, index: QtCore.QModelIndex) -> Optional[SlotRow]:
+        if not index.isValid() or self.is_pilot(index):
+            return None
+        return self.__slot_rows[self.pilot_id(index)][index.row()]
+
+    def slot(self, index: QtCore.QModelIndex) -> Optional[str]:
+        slot_row = self.slot_row(index)
+        return None if slot_row is None else slot_row.slot
+
+    def equipped_upgrade(self, index: QtCore.QModelIndex) -> Optional[Upgrade]:
+        slot_row = self.slot_row(index)
+        return None if slot_row is None else slot_row.upgrade
+
+    def index(self, row: int, column: int, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, self.PILOT_ROW_ID)
+        return self.createIndex(row, column, self.__pilot_ids[parent.row()] + 1)
+
+    def parent(self, index: QtCore.QModelIndex = QtCore.QModelIndex()) -> QtCore.QModelIndex:
+        if not index.isValid() or self.is_pilot(index):
+            return QtCore.QModelIndex()
+        return self.pilot_index(index.internalId() - 1)
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self.__pilot_ids)
+        if self.is_pilot(parent) and parent.column() == 0:
+            return len(self.__slot_rows[self.__pilot_ids[parent.row()]])
+        return 0
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if self.is_pilot(index):
+            if role == QtCore.Qt.DisplayRole and index.column() == 0:
+                pilot_data = self.pilot_data(index)
+                return (f"({pilot_data.initiative}) {prettify_name(pilot_data.pilot_name)} "
+                        f"({pilot_data.cost}) ({pilot_data.cost_with_upgrades})")
+            return None
+
+        slot, upgrade = self.slot_row(index)
+        if index.column() == 0:
+            if role == QtCore.Qt.DisplayRole:
+                return prettify_name(slot)
+            if role == QtCore.Qt.DecorationRole:
+                # Equipped slots are shown in green
+                color = None if upgrade is None else "green"
+                return image_path_to_qpixmap(self.upgrade_slots_dir / f"{slot}.png", color=color)
+        elif role == QtCore.Qt.DisplayRole:
+            return "" if upgrade is None else f"{prettify_name(upgrade.name)} ({upgrade.cost})"
+        return None
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
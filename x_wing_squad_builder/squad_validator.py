@@ -0,0 +1,163 @@
+"""
+Validates squad lists without the GUI, see validate.py.
+
+A squad list is a JSON object:
+
+    {"name": "Vonreg", "faction": "First Order",
+     "pilots": [{"ship": "TIE/ba Interceptor", "pilot": "Major Vonreg", "upgrades": ["Composure"]}]}
+
+Names are written as in the GUI (or the definition file).  A pilot may give its own "faction"
+for lists mixing factions in freedom mode.  Lists are read from a JSONL file (one list per line),
+a JSON file (one list) or a directory of JSON files.
+"""
+import argparse
+import json
+import logging
+from collections import namedtuple
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from .model import Squad, SquadBuilder, Upgrades, XWing
+from .model.squad_builder import PilotEntry
+from .settings import Settings, settings_snapshot
+from .utils import gui_text_encode
+
+SquadReport = namedtuple('SquadReport', ['source', 'name', 'pilot_cost', 'upgrade_cost', 'total_cost', 'errors'])
+
+# Definition used by validate_squad_list, one per process
+_context: Optional[Tuple[Path, XWing, Upgrades]] = None
+
+
+def load_context(definition_path: Path, mode: Optional[Settings.Mode] = None):
+    """
+    loads the definition used by validate_squad_list in this process, and sets the squad mode.
+
+    Also the initializer of the validation pool: workers forked after the parent loaded the
+    definition keep the parent's copy instead of loading it again.
+    """
+    global _context
+    if mode is not None and settings_snapshot().mode != mode:
+        settings_snapshot().update(mode=mode)
+    if _context is not None and _context[0] == definition_path:
+        return
+    xwing = XWing.launch_xwing_data(definition_path)
+    _context = (definition_path, xwing, Upgrades(xwing.upgrades))
+
+
+def squad_list_error(squad_list) -> Optional[str]:
+    """returns why squad_list is not laid out as a squad list (see the module docstring), None if it is"""
+    if not isinstance(squad_list, dict):
+        return "expected a JSON object"
+    if not isinstance(squad_list.get("name", ""), str) or not isinstance(squad_list.get("faction", ""), str):
+        return "name and faction must be strings"
+    pilots = squad_list.get("pilots", [])
+    if not isinstance(pilots, list):
+        return "pilots must be a list"
+    for number, pilot in enumerate(pilots, 1):
+        if not isinstance(pilot, dict):
+            return f"pilot {number} must be an object"
+        if not all(isinstance(pilot.get(key, ""), str) for key in ["faction", "ship", "pilot"]):
+            return f"faction, ship and pilot of pilot {number} must be strings"
+        upgrades = pilot.get("upgrades", [])
+        if not isinstance(upgrades, list) or not all(isinstance(name, str) for name in upgrades):
+            return f"upgrades of pilot {number} must be a list of strings"
+    return None
+
+
+def build_squad_list(xwing: XWing, upgrades: Upgrades, squad_list: dict) -> Tuple[Squad, List[str]]:
+    """
+    builds the squad list with the GUI rules, returns the squad and every rule it breaks.
+    squad_list must be laid out as a squad list, see squad_list_error.
+    """
+    builder = SquadBuilder(xwing, upgrades)
+    faction_name = squad_list.get("faction", "")
+    errors = builder.add_pilots(PilotEntry(gui_text_encode(pilot.get("faction", faction_name)),
+                                           gui_text_encode(pilot.get("ship", "")),
+                                           gui_text_encode(pilot.get("pilot", "")),
+                                           [gui_text_encode(name) for name in pilot.get("upgrades", [])])
+                                for pilot in squad_list.get("pilots", []))
+    return builder.squad, errors
+
+
+def validate_squad_list(squad_list: dict, source: str = "") -> SquadReport:
+    """builds the squad list with the GUI rules, returns its costs and every rule it breaks"""
+    _, xwing, upgrades = _context
+    squad, errors = build_squad_list(xwing, upgrades, squad_list)
+    return SquadReport(source, squad_list.get("name", ""), squad.total_pilot_cost, squad.total_upgrade_cost,
+                       squad.total_pilot_cost + squad.total_upgrade_cost, errors)
+
+
+def validate_source(item: Tuple[str, str]) -> SquadReport:
+    """validates the squad list text read from source"""
+    source, text = item
+    try:
+        squad_list = json.loads(text)
+    except json.JSONDecodeError as e:
+        return SquadReport(source, "", 0, 0, 0, [f"Invalid squad list: {e}"])
+    error = squad_list_error(squad_list)
+    if error is not None:
+        name = squad_list.get("name", "") if isinstance(squad_list, dict) else ""
+        return SquadReport(source, name if isinstance(name, str) else "", 0, 0, 0, [f"Invalid squad list: {error}"])
+    return validate_squad_list(squad_list, source)
+
+
+def read_squad_lists(path: Path) -> Iterator[Tuple[str, str]]:
+    """yields the (source, text) of every squad list in path, the text is parsed by the workers"""
+    if path.is_dir():
+        for file_path in sorted(path.glob("*.json")):
+            yield file_path.name, file_path.read_text(encoding="utf-8")
+    elif path.suffix.lower() == ".jsonl":
+        with open(path, encoding="utf-8") as file:
+            for line_number, line in enumerate(file, 1):
+                if line.strip():
+                    yield f"{path.name}:{line_number}", line
+    else:
+        yield path.name, path.read_text(encoding="utf-8")
+
+
+def validate_squad_lists(items: Iterable[Tuple[str, str]], definition_path: Path,
+                         mode: Optional[Settings.Mode] = None, processes: Optional[int] = None,
+                         chunksize: int = 16) -> Iterator[SquadReport]:
+    """
+    validates squad lists over a process pool, yielding the reports in the order of items.
+    processes=1 validates in this process.
+    """
+    load_context(definition_path, mode)
+    if processes == 1:
+        yield from map(validate_source, items)
+        return
+    with Pool(processes, initializer=load_context, initargs=(definition_path, mode)) as pool:
+        yield from pool.imap(validate_source, items, chunksize)
+
+
+def format_report(report: SquadReport) -> List[str]:
+    status = "legal" if not report.errors else f"{len(report.errors)} error(s)"
+    lines = [f"{report.source}: {report.name} - pilots {report.pilot_cost}, upgrades {report.upgrade_cost}, "
+             f"total {report.total_cost} - {status}"]
+    lines.extend(f"    {error}" for error in report.errors)
+    return lines
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validates squad lists with the squad builder rules.")
+    parser.add_argument("path", type=Path, help="JSONL file, JSON file or directory of JSON files of squad lists")
+    parser.add_argument("--definition", type=Path, default=Path(__file__).parents[1] / "data" / "definition.json",
+                        help="definition file (default: the bundled definition)")
+    parser.add_argument("--mode", choices=[mode.value.lower() for mode in Settings.Mode],
+                        help="squad mode (default: the mode set in the GUI)")
+    parser.add_argument("--processes", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--json", action="store_true", help="write one JSON report per line")
+    options = parser.parse_args(args)
+    # The reasons are reported, don't log them as well
+    logging.getLogger().setLevel(logging.WARNING)
+
+    mode = None if options.mode is None else Settings.Mode(options.mode.capitalize())
+    illegal = 0
+    for report in validate_squad_lists(read_squad_lists(options.path), options.definition, mode, options.processes):
+        illegal += bool(report.errors)
+        if options.json:
+            print(json.dumps(report._asdict()))
+        else:
+            print("\n".join(format_report(report)))
+    return 1 if illegal else 0
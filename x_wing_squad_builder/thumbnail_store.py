@@ -0,0 +1,91 @@
+import hashlib
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+from PIL import Image
+from PySide6 import QtGui
+
+from .settings import Settings
+
+
+class ThumbnailStore:
+    """
+    Downscaled copies of the card images, stored in the cache directory.
+
+    Cards are shown at their pixel size divided by the scale setting, so with a scale above the
+    screen's device pixel ratio most of a full resolution card is thrown away when it is drawn.
+    The store keeps copies reduced by that factor (see display_factor), keyed by the source mtime
+    so edited cards are regenerated.  Full resolution images are only needed when zooming in.
+    """
+
+    JPEG_QUALITY = 90
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        if cache_dir is None:
+            cache_dir = Settings().cache_dir / "thumbnails"
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def display_factor(scale: float, device_pixel_ratio: float = 1) -> float:
+        """returns the fraction of a card's pixels that end up on screen, at most 1"""
+        if scale <= 0:
+            return 1
+        return min(1.0, device_pixel_ratio / scale)
+
+    def thumbnail_path(self, source: Path, factor: float) -> Path:
+        source = Path(source).absolute()
+        key = hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:12]
+        mtime_ns = source.stat().st_mtime_ns
+        return self.cache_dir / f"{factor:.2f}" / f"{source.stem}-{key}-{mtime_ns}.jpg"
+
+    def load(self, source: Path, factor: float) -> Tuple[QtGui.QImage, int]:
+        """
+        returns the image to display for source reduced by factor, and the width of the source.
+        The thumbnail is generated on first use.  Safe to call off the GUI thread.
+        """
+        source = Path(source)
+        if factor >= 1 or not source.exists():
+            qimage = QtGui.QImage(source)
+            return qimage, qimage.width()
+        thumbnail_path = self.thumbnail_path(source, factor)
+        source_width = QtGui.QImageReader(str(source)).size().width()
+        if not thumbnail_path.exists():
+            self.write_thumbnail(source, thumbnail_path, factor)
+        qimage = QtGui.QImage(thumbnail_path)
+        if qimage.isNull():
+            qimage = QtGui.QImage(source)
+        return qimage, source_width
+
+    def write_thumbnail(self, source: Path, thumbnail_path: Path, factor: float) -> bool:
+        """writes a copy of source reduced by factor, replacing thumbnails of older versions of source"""
+        # Thumbnails may be written from several worker threads at once.
+        tmp_path = thumbnail_path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            thumbnail_path.parent.mkdir(parents=True, exist_ok=True)
+            with Image.open(source) as im:
+                size = (max(1, round(im.width * factor)), max(1, round(im.height * factor)))
+                im = im.convert("RGB").resize(size, Image.LANCZOS)
+                im.save(tmp_path, "JPEG", quality=self.JPEG_QUALITY)
+            os.replace(tmp_path, thumbnail_path)
+        except OSError as e:
+            logging.debug(f"Unable to write thumbnail for {source}: {e}")
+            return False
+        key = thumbnail_path.stem.rsplit("-", 2)[1]
+        for stale in thumbnail_path.parent.glob(f"*-{key}-*.jpg"):
+            if stale != thumbnail_path:
+                stale.unlink(missing_ok=True)
+        return True
+
+    def generate(self, sources: Iterable[Path], factor: float) -> int:
+        """generates every missing thumbnail, returns the number written"""
+        if factor >= 1:
+            return 0
+        written = 0
+        for source in sources:
+            thumbnail_path = self.thumbnail_path(source, factor)
+            if not thumbnail_path.exists() and self.write_thumbnail(source, thumbnail_path, factor):
+                written += 1
+        return written
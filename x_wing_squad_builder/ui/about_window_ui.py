@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'about_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QApplication, QDialog, QHBoxLayout, QLabel,
+    QPlainTextEdit, QPushButton, QSizePolicy, QSpacerItem,
+    QVBoxLayout, QWidget)
+from . import resources_rc
+
+class Ui_AboutWindow(object):
+    def setupUi(self, AboutWindow):
+        if not AboutWindow.objectName():
+            AboutWindow.setObjectName(u"AboutWindow")
+        AboutWindow.resize(400, 300)
+        icon = QIcon()
+        icon.addFile(u":/images/icon.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        AboutWindow.setWindowIcon(icon)
+        self.verticalLayout_2 = QVBoxLayout(AboutWindow)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout = QVBoxLayout()
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.title_label = QLabel(AboutWindow)
+        self.title_label.setObjectName(u"title_label")
+
+        self.verticalLayout.addWidget(self.title_label)
+
+        self.author_label = QLabel(AboutWindow)
+        self.author_label.setObjectName(u"author_label")
+
+        self.verticalLayout.addWidget(self.author_label)
+
+        self.company_label = QLabel(AboutWindow)
+        self.company_label.setObjectName(u"company_label")
+
+        self.verticalLayout.addWidget(self.company_label)
+
+        self.version_label = QLabel(AboutWindow)
+        self.version_label.setObjectName(u"version_label")
+
+        self.verticalLayout.addWidget(self.version_label)
+
+        self.info_plain_text_edit = QPlainTextEdit(AboutWindow)
+        self.info_plain_text_edit.setObjectName(u"info_plain_text_edit")
+
+        self.verticalLayout.addWidget(self.info_plain_text_edit)
+
+
+        self.verticalLayout_2.addLayout(self.verticalLayout)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.ok_push_button = QPushButton(AboutWindow)
+        self.ok_push_button.setObjectName(u"ok_push_button")
+
+        self.horizontalLayout.addWidget(self.ok_push_button)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout)
+
+
+        self.retranslateUi(AboutWindow)
+
+        QMetaObject.connectSlotsByName(AboutWindow)
+    # setupUi
+
+    def retranslateUi(self, AboutWindow):
+        AboutWindow.setWindowTitle(QCoreApplication.translate("AboutWindow", u"About", None))
+        self.title_label.setText(QCoreApplication.translate("AboutWindow", u"Application Name", None))
+        self.author_label.setText(QCoreApplication.translate("AboutWindow", u"Author Name", None))
+        self.company_label.setText(QCoreApplication.translate("AboutWindow", u"Company Name", None))
+        self.version_label.setText(QCoreApplication.translate("AboutWindow", u"Version", None))
+        self.ok_push_button.setText(QCoreApplication.translate("AboutWindow", u"OK", None))
+    # retranslateUi
+
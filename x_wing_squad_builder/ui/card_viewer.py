@@ -1,3 +1,6 @@
+from pathlib import Path
+from typing import Optional
+
 from PySide6 import QtWidgets, QtCore, QtGui
 
 # Thanks to https://stackoverflow.com/questions/35508711/how-to-enable-pan-and-zoom-in-a-qgraphicsview
@@ -16,6 +19,8 @@ class CardViewer(QtWidgets.QGraphicsView):
         self._scene.addItem(self._photo)
         self._scene.addItem(self._second_photo)
         self._second_photo.moveBy(320, 0)
+        # Full resolution images of the displayed cards, loaded when zooming in on a thumbnail.
+        self._sources = {}
         self.setScene(self._scene)
         self.setTransformationAnchor(QtWidgets.QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QtWidgets.QGraphicsView.AnchorUnderMouse)
@@ -45,8 +50,11 @@ class CardViewer(QtWidgets.QGraphicsView):
                 # self.scale(factor, factor)
             self._zoom = 0
 
-    def set_card(self, pixmap: QtGui.QPixmap = None):
+    def set_card(self, pixmap: QtGui.QPixmap = None, source: Optional[Path] = None):
+        """shows pixmap as the first card.  source is the full resolution image pixmap may be
+        a thumbnail of, loaded when the user zooms in."""
         self._zoom = 0
+        self._sources[self._photo] = source
         if pixmap and not pixmap.isNull():
             self._empty = False
             self.setDragMode(QtWidgets.QGraphicsView.ScrollHandDrag)
@@ -57,8 +65,10 @@ class CardViewer(QtWidgets.QGraphicsView):
             self._photo.setPixmap(QtGui.QPixmap())
         self.fitInView()
 
-    def add_card(self, pixmap: QtGui.QPixmap = None):
+    def add_card(self, pixmap: QtGui.QPixmap = None, source: Optional[Path] = None):
+        """shows pixmap as the second card, see set_card"""
         self._zoom = 0
+        self._sources[self._second_photo] = source
         if pixmap and not pixmap.isNull():
             self._empty = False
             self.setDragMode(QtWidgets.QGraphicsView.ScrollHandDrag)
@@ -69,11 +79,27 @@ class CardViewer(QtWidgets.QGraphicsView):
             self._second_photo.setPixmap(QtGui.QPixmap())
         self.fitInView()
 
+    def load_full_resolution(self):
+        """replaces thumbnails with their full resolution image, keeping the displayed size"""
+        for photo, source in self._sources.items():
+            pixmap = photo.pixmap()
+            if source is None or pixmap.isNull():
+                continue
+            self._sources[photo] = None
+            if QtGui.QImageReader(str(source)).size().width() <= pixmap.width():
+                continue
+            full = QtGui.QPixmap.fromImage(QtGui.QImage(source))
+            if full.isNull():
+                continue
+            full.setDevicePixelRatio(pixmap.devicePixelRatio() * full.width() / pixmap.width())
+            photo.setPixmap(full)
+
     def wheelEvent(self, event):
         if self.has_card:
             if event.angleDelta().y() > 0:
                 factor = 1.25
                 self._zoom += 1
+                self.load_full_resolution()
             else:
                 factor = 0.8
                 self._zoom -= 1
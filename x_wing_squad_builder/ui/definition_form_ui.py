@@ -0,0 +1,939 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'definition_form.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QCheckBox, QDialog,
+    QDialogButtonBox, QHBoxLayout, QLabel, QLineEdit,
+    QSizePolicy, QSpacerItem, QSpinBox, QVBoxLayout,
+    QWidget)
+from . import resources_rc
+
+class Ui_DefinitionForm(object):
+    def setupUi(self, DefinitionForm):
+        if not DefinitionForm.objectName():
+            DefinitionForm.setObjectName(u"DefinitionForm")
+        DefinitionForm.resize(944, 820)
+        icon = QIcon()
+        icon.addFile(u":/images/icon.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        DefinitionForm.setWindowIcon(icon)
+        self.verticalLayout_16 = QVBoxLayout(DefinitionForm)
+        self.verticalLayout_16.setObjectName(u"verticalLayout_16")
+        self.verticalLayout_15 = QVBoxLayout()
+        self.verticalLayout_15.setObjectName(u"verticalLayout_15")
+        self.horizontalLayout_35 = QHBoxLayout()
+        self.horizontalLayout_35.setObjectName(u"horizontalLayout_35")
+        self.verticalLayout_7 = QVBoxLayout()
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.label_19 = QLabel(DefinitionForm)
+        self.label_19.setObjectName(u"label_19")
+        font = QFont()
+        font.setPointSize(16)
+        font.setBold(True)
+        self.label_19.setFont(font)
+
+        self.verticalLayout_7.addWidget(self.label_19)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label = QLabel(DefinitionForm)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.faction_name_line_edit = QLineEdit(DefinitionForm)
+        self.faction_name_line_edit.setObjectName(u"faction_name_line_edit")
+
+        self.horizontalLayout.addWidget(self.faction_name_line_edit)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.label_2 = QLabel(DefinitionForm)
+        self.label_2.setObjectName(u"label_2")
+
+        self.horizontalLayout_2.addWidget(self.label_2)
+
+        self.ship_name_line_edit = QLineEdit(DefinitionForm)
+        self.ship_name_line_edit.setObjectName(u"ship_name_line_edit")
+
+        self.horizontalLayout_2.addWidget(self.ship_name_line_edit)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_2)
+
+        self.ship_exists_label = QLabel(DefinitionForm)
+        self.ship_exists_label.setObjectName(u"ship_exists_label")
+        font1 = QFont()
+        font1.setBold(True)
+        font1.setItalic(True)
+        self.ship_exists_label.setFont(font1)
+
+        self.verticalLayout_7.addWidget(self.ship_exists_label)
+
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.label_3 = QLabel(DefinitionForm)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayout_3.addWidget(self.label_3)
+
+        self.base_size_line_edit = QLineEdit(DefinitionForm)
+        self.base_size_line_edit.setObjectName(u"base_size_line_edit")
+
+        self.horizontalLayout_3.addWidget(self.base_size_line_edit)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_3)
+
+        self.verticalLayout = QVBoxLayout()
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.label_4 = QLabel(DefinitionForm)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout_4.addWidget(self.label_4)
+
+        self.attacks_line_edit = QLineEdit(DefinitionForm)
+        self.attacks_line_edit.setObjectName(u"attacks_line_edit")
+
+        self.horizontalLayout_4.addWidget(self.attacks_line_edit)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout_4)
+
+        self.horizontalLayout_5 = QHBoxLayout()
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.label_5 = QLabel(DefinitionForm)
+        self.label_5.setObjectName(u"label_5")
+
+        self.horizontalLayout_5.addWidget(self.label_5)
+
+        self.arc_types_line_edit = QLineEdit(DefinitionForm)
+        self.arc_types_line_edit.setObjectName(u"arc_types_line_edit")
+
+        self.horizontalLayout_5.addWidget(self.arc_types_line_edit)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout_5)
+
+
+        self.verticalLayout_7.addLayout(self.verticalLayout)
+
+        self.horizontalLayout_7 = QHBoxLayout()
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.label_6 = QLabel(DefinitionForm)
+        self.label_6.setObjectName(u"label_6")
+
+        self.horizontalLayout_7.addWidget(self.label_6)
+
+        self.agility_spinbox = QSpinBox(DefinitionForm)
+        self.agility_spinbox.setObjectName(u"agility_spinbox")
+
+        self.horizontalLayout_7.addWidget(self.agility_spinbox)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_7)
+
+        self.horizontalLayout_8 = QHBoxLayout()
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.label_7 = QLabel(DefinitionForm)
+        self.label_7.setObjectName(u"label_7")
+
+        self.horizontalLayout_8.addWidget(self.label_7)
+
+        self.hull_spinbox = QSpinBox(DefinitionForm)
+        self.hull_spinbox.setObjectName(u"hull_spinbox")
+
+        self.horizontalLayout_8.addWidget(self.hull_spinbox)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_8)
+
+        self.verticalLayout_2 = QVBoxLayout()
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.horizontalLayout_9 = QHBoxLayout()
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.label_8 = QLabel(DefinitionForm)
+        self.label_8.setObjectName(u"label_8")
+
+        self.horizontalLayout_9.addWidget(self.label_8)
+
+        self.shield_spinbox = QSpinBox(DefinitionForm)
+        self.shield_spinbox.setObjectName(u"shield_spinbox")
+
+        self.horizontalLayout_9.addWidget(self.shield_spinbox)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_9)
+
+        self.horizontalLayout_10 = QHBoxLayout()
+        self.horizontalLayout_10.setObjectName(u"horizontalLayout_10")
+        self.label_9 = QLabel(DefinitionForm)
+        self.label_9.setObjectName(u"label_9")
+
+        self.horizontalLayout_10.addWidget(self.label_9)
+
+        self.shield_recharge_spinbox = QSpinBox(DefinitionForm)
+        self.shield_recharge_spinbox.setObjectName(u"shield_recharge_spinbox")
+
+        self.horizontalLayout_10.addWidget(self.shield_recharge_spinbox)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_10)
+
+
+        self.verticalLayout_7.addLayout(self.verticalLayout_2)
+
+        self.verticalLayout_3 = QVBoxLayout()
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.horizontalLayout_11 = QHBoxLayout()
+        self.horizontalLayout_11.setObjectName(u"horizontalLayout_11")
+        self.label_10 = QLabel(DefinitionForm)
+        self.label_10.setObjectName(u"label_10")
+
+        self.horizontalLayout_11.addWidget(self.label_10)
+
+        self.force_spinbox = QSpinBox(DefinitionForm)
+        self.force_spinbox.setObjectName(u"force_spinbox")
+
+        self.horizontalLayout_11.addWidget(self.force_spinbox)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_11)
+
+        self.horizontalLayout_12 = QHBoxLayout()
+        self.horizontalLayout_12.setObjectName(u"horizontalLayout_12")
+        self.label_11 = QLabel(DefinitionForm)
+        self.label_11.setObjectName(u"label_11")
+
+        self.horizontalLayout_12.addWidget(self.label_11)
+
+        self.force_recharge_spinbox = QSpinBox(DefinitionForm)
+        self.force_recharge_spinbox.setObjectName(u"force_recharge_spinbox")
+
+        self.horizontalLayout_12.addWidget(self.force_recharge_spinbox)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_12)
+
+
+        self.verticalLayout_7.addLayout(self.verticalLayout_3)
+
+        self.verticalLayout_4 = QVBoxLayout()
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.horizontalLayout_13 = QHBoxLayout()
+        self.horizontalLayout_13.setObjectName(u"horizontalLayout_13")
+        self.label_12 = QLabel(DefinitionForm)
+        self.label_12.setObjectName(u"label_12")
+
+        self.horizontalLayout_13.addWidget(self.label_12)
+
+        self.energy_spinbox = QSpinBox(DefinitionForm)
+        self.energy_spinbox.setObjectName(u"energy_spinbox")
+
+        self.horizontalLayout_13.addWidget(self.energy_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_13)
+
+        self.horizontalLayout_14 = QHBoxLayout()
+        self.horizontalLayout_14.setObjectName(u"horizontalLayout_14")
+        self.label_13 = QLabel(DefinitionForm)
+        self.label_13.setObjectName(u"label_13")
+
+        self.horizontalLayout_14.addWidget(self.label_13)
+
+        self.energy_recharge_spinbox = QSpinBox(DefinitionForm)
+        self.energy_recharge_spinbox.setObjectName(u"energy_recharge_spinbox")
+
+        self.horizontalLayout_14.addWidget(self.energy_recharge_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_14)
+
+
+        self.verticalLayout_7.addLayout(self.verticalLayout_4)
+
+        self.verticalLayout_5 = QVBoxLayout()
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.horizontalLayout_15 = QHBoxLayout()
+        self.horizontalLayout_15.setObjectName(u"horizontalLayout_15")
+        self.label_14 = QLabel(DefinitionForm)
+        self.label_14.setObjectName(u"label_14")
+
+        self.horizontalLayout_15.addWidget(self.label_14)
+
+        self.charge_spinbox = QSpinBox(DefinitionForm)
+        self.charge_spinbox.setObjectName(u"charge_spinbox")
+
+        self.horizontalLayout_15.addWidget(self.charge_spinbox)
+
+
+        self.verticalLayout_5.addLayout(self.horizontalLayout_15)
+
+        self.horizontalLayout_16 = QHBoxLayout()
+        self.horizontalLayout_16.setObjectName(u"horizontalLayout_16")
+        self.label_15 = QLabel(DefinitionForm)
+        self.label_15.setObjectName(u"label_15")
+
+        self.horizontalLayout_16.addWidget(self.label_15)
+
+        self.charge_recharge_spinbox = QSpinBox(DefinitionForm)
+        self.charge_recharge_spinbox.setObjectName(u"charge_recharge_spinbox")
+
+        self.horizontalLayout_16.addWidget(self.charge_recharge_spinbox)
+
+
+        self.verticalLayout_5.addLayout(self.horizontalLayout_16)
+
+
+        self.verticalLayout_7.addLayout(self.verticalLayout_5)
+
+        self.verticalLayout_6 = QVBoxLayout()
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.horizontalLayout_6 = QHBoxLayout()
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.label_16 = QLabel(DefinitionForm)
+        self.label_16.setObjectName(u"label_16")
+
+        self.horizontalLayout_6.addWidget(self.label_16)
+
+        self.actions_line_edit = QLineEdit(DefinitionForm)
+        self.actions_line_edit.setObjectName(u"actions_line_edit")
+
+        self.horizontalLayout_6.addWidget(self.actions_line_edit)
+
+
+        self.verticalLayout_6.addLayout(self.horizontalLayout_6)
+
+        self.horizontalLayout_17 = QHBoxLayout()
+        self.horizontalLayout_17.setObjectName(u"horizontalLayout_17")
+        self.label_17 = QLabel(DefinitionForm)
+        self.label_17.setObjectName(u"label_17")
+
+        self.horizontalLayout_17.addWidget(self.label_17)
+
+        self.colors_line_edit = QLineEdit(DefinitionForm)
+        self.colors_line_edit.setObjectName(u"colors_line_edit")
+
+        self.horizontalLayout_17.addWidget(self.colors_line_edit)
+
+
+        self.verticalLayout_6.addLayout(self.horizontalLayout_17)
+
+
+        self.verticalLayout_7.addLayout(self.verticalLayout_6)
+
+        self.horizontalLayout_18 = QHBoxLayout()
+        self.horizontalLayout_18.setObjectName(u"horizontalLayout_18")
+        self.label_18 = QLabel(DefinitionForm)
+        self.label_18.setObjectName(u"label_18")
+
+        self.horizontalLayout_18.addWidget(self.label_18)
+
+        self.upgrade_slots_line_edit = QLineEdit(DefinitionForm)
+        self.upgrade_slots_line_edit.setObjectName(u"upgrade_slots_line_edit")
+
+        self.horizontalLayout_18.addWidget(self.upgrade_slots_line_edit)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_18)
+
+        self.horizontalLayout_40 = QHBoxLayout()
+        self.horizontalLayout_40.setObjectName(u"horizontalLayout_40")
+        self.epic_checkbox = QCheckBox(DefinitionForm)
+        self.epic_checkbox.setObjectName(u"epic_checkbox")
+        self.epic_checkbox.setLayoutDirection(Qt.RightToLeft)
+
+        self.horizontalLayout_40.addWidget(self.epic_checkbox)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_40.addItem(self.horizontalSpacer)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_40)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_7.addItem(self.verticalSpacer_2)
+
+
+        self.horizontalLayout_35.addLayout(self.verticalLayout_7)
+
+        self.verticalLayout_8 = QVBoxLayout()
+        self.verticalLayout_8.setObjectName(u"verticalLayout_8")
+        self.label_20 = QLabel(DefinitionForm)
+        self.label_20.setObjectName(u"label_20")
+        self.label_20.setFont(font)
+
+        self.verticalLayout_8.addWidget(self.label_20)
+
+        self.horizontalLayout_20 = QHBoxLayout()
+        self.horizontalLayout_20.setObjectName(u"horizontalLayout_20")
+        self.label_22 = QLabel(DefinitionForm)
+        self.label_22.setObjectName(u"label_22")
+
+        self.horizontalLayout_20.addWidget(self.label_22)
+
+        self.pilot_name_line_edit = QLineEdit(DefinitionForm)
+        self.pilot_name_line_edit.setObjectName(u"pilot_name_line_edit")
+
+        self.horizontalLayout_20.addWidget(self.pilot_name_line_edit)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_20)
+
+        self.horizontalLayout_37 = QHBoxLayout()
+        self.horizontalLayout_37.setObjectName(u"horizontalLayout_37")
+        self.label_39 = QLabel(DefinitionForm)
+        self.label_39.setObjectName(u"label_39")
+
+        self.horizontalLayout_37.addWidget(self.label_39)
+
+        self.cost_spinbox = QSpinBox(DefinitionForm)
+        self.cost_spinbox.setObjectName(u"cost_spinbox")
+        self.cost_spinbox.setMinimum(0)
+        self.cost_spinbox.setMaximum(9999)
+        self.cost_spinbox.setValue(0)
+
+        self.horizontalLayout_37.addWidget(self.cost_spinbox)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_37)
+
+        self.horizontalLayout_39 = QHBoxLayout()
+        self.horizontalLayout_39.setObjectName(u"horizontalLayout_39")
+        self.label_41 = QLabel(DefinitionForm)
+        self.label_41.setObjectName(u"label_41")
+
+        self.horizontalLayout_39.addWidget(self.label_41)
+
+        self.initiative_spinbox = QSpinBox(DefinitionForm)
+        self.initiative_spinbox.setObjectName(u"initiative_spinbox")
+        self.initiative_spinbox.setMinimum(0)
+        self.initiative_spinbox.setValue(0)
+
+        self.horizontalLayout_39.addWidget(self.initiative_spinbox)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_39)
+
+        self.horizontalLayout_21 = QHBoxLayout()
+        self.horizontalLayout_21.setObjectName(u"horizontalLayout_21")
+        self.label_23 = QLabel(DefinitionForm)
+        self.label_23.setObjectName(u"label_23")
+
+        self.horizontalLayout_21.addWidget(self.label_23)
+
+        self.limit_spinbox = QSpinBox(DefinitionForm)
+        self.limit_spinbox.setObjectName(u"limit_spinbox")
+        self.limit_spinbox.setMinimum(0)
+        self.limit_spinbox.setValue(0)
+
+        self.horizontalLayout_21.addWidget(self.limit_spinbox)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_21)
+
+        self.verticalLayout_9 = QVBoxLayout()
+        self.verticalLayout_9.setObjectName(u"verticalLayout_9")
+        self.horizontalLayout_22 = QHBoxLayout()
+        self.horizontalLayout_22.setObjectName(u"horizontalLayout_22")
+        self.label_24 = QLabel(DefinitionForm)
+        self.label_24.setObjectName(u"label_24")
+
+        self.horizontalLayout_22.addWidget(self.label_24)
+
+        self.pilot_attacks_line_edit = QLineEdit(DefinitionForm)
+        self.pilot_attacks_line_edit.setObjectName(u"pilot_attacks_line_edit")
+
+        self.horizontalLayout_22.addWidget(self.pilot_attacks_line_edit)
+
+
+        self.verticalLayout_9.addLayout(self.horizontalLayout_22)
+
+        self.horizontalLayout_23 = QHBoxLayout()
+        self.horizontalLayout_23.setObjectName(u"horizontalLayout_23")
+        self.label_25 = QLabel(DefinitionForm)
+        self.label_25.setObjectName(u"label_25")
+
+        self.horizontalLayout_23.addWidget(self.label_25)
+
+        self.pilot_arc_types_line_edit = QLineEdit(DefinitionForm)
+        self.pilot_arc_types_line_edit.setObjectName(u"pilot_arc_types_line_edit")
+
+        self.horizontalLayout_23.addWidget(self.pilot_arc_types_line_edit)
+
+
+        self.verticalLayout_9.addLayout(self.horizontalLayout_23)
+
+
+        self.verticalLayout_8.addLayout(self.verticalLayout_9)
+
+        self.horizontalLayout_24 = QHBoxLayout()
+        self.horizontalLayout_24.setObjectName(u"horizontalLayout_24")
+        self.label_26 = QLabel(DefinitionForm)
+        self.label_26.setObjectName(u"label_26")
+
+        self.horizontalLayout_24.addWidget(self.label_26)
+
+        self.pilot_agility_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_agility_spinbox.setObjectName(u"pilot_agility_spinbox")
+        self.pilot_agility_spinbox.setMinimum(-1)
+        self.pilot_agility_spinbox.setValue(-1)
+
+        self.horizontalLayout_24.addWidget(self.pilot_agility_spinbox)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_24)
+
+        self.horizontalLayout_25 = QHBoxLayout()
+        self.horizontalLayout_25.setObjectName(u"horizontalLayout_25")
+        self.label_27 = QLabel(DefinitionForm)
+        self.label_27.setObjectName(u"label_27")
+
+        self.horizontalLayout_25.addWidget(self.label_27)
+
+        self.pilot_hull_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_hull_spinbox.setObjectName(u"pilot_hull_spinbox")
+        self.pilot_hull_spinbox.setMinimum(-1)
+        self.pilot_hull_spinbox.setValue(-1)
+
+        self.horizontalLayout_25.addWidget(self.pilot_hull_spinbox)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_25)
+
+        self.verticalLayout_10 = QVBoxLayout()
+        self.verticalLayout_10.setObjectName(u"verticalLayout_10")
+        self.horizontalLayout_26 = QHBoxLayout()
+        self.horizontalLayout_26.setObjectName(u"horizontalLayout_26")
+        self.label_28 = QLabel(DefinitionForm)
+        self.label_28.setObjectName(u"label_28")
+
+        self.horizontalLayout_26.addWidget(self.label_28)
+
+        self.pilot_shield_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_shield_spinbox.setObjectName(u"pilot_shield_spinbox")
+        self.pilot_shield_spinbox.setMinimum(-1)
+        self.pilot_shield_spinbox.setValue(-1)
+
+        self.horizontalLayout_26.addWidget(self.pilot_shield_spinbox)
+
+
+        self.verticalLayout_10.addLayout(self.horizontalLayout_26)
+
+        self.horizontalLayout_27 = QHBoxLayout()
+        self.horizontalLayout_27.setObjectName(u"horizontalLayout_27")
+        self.label_29 = QLabel(DefinitionForm)
+        self.label_29.setObjectName(u"label_29")
+
+        self.horizontalLayout_27.addWidget(self.label_29)
+
+        self.pilot_shield_recharge_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_shield_recharge_spinbox.setObjectName(u"pilot_shield_recharge_spinbox")
+        self.pilot_shield_recharge_spinbox.setMinimum(-1)
+        self.pilot_shield_recharge_spinbox.setValue(-1)
+
+        self.horizontalLayout_27.addWidget(self.pilot_shield_recharge_spinbox)
+
+
+        self.verticalLayout_10.addLayout(self.horizontalLayout_27)
+
+
+        self.verticalLayout_8.addLayout(self.verticalLayout_10)
+
+        self.horizontalLayout_42 = QHBoxLayout()
+        self.horizontalLayout_42.setObjectName(u"horizontalLayout_42")
+        self.label_45 = QLabel(DefinitionForm)
+        self.label_45.setObjectName(u"label_45")
+
+        self.horizontalLayout_42.addWidget(self.label_45)
+
+        self.pilot_shield_decharge_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_shield_decharge_spinbox.setObjectName(u"pilot_shield_decharge_spinbox")
+        self.pilot_shield_decharge_spinbox.setMinimum(-1)
+        self.pilot_shield_decharge_spinbox.setValue(-1)
+
+        self.horizontalLayout_42.addWidget(self.pilot_shield_decharge_spinbox)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_42)
+
+        self.verticalLayout_11 = QVBoxLayout()
+        self.verticalLayout_11.setObjectName(u"verticalLayout_11")
+        self.horizontalLayout_28 = QHBoxLayout()
+        self.horizontalLayout_28.setObjectName(u"horizontalLayout_28")
+        self.label_30 = QLabel(DefinitionForm)
+        self.label_30.setObjectName(u"label_30")
+
+        self.horizontalLayout_28.addWidget(self.label_30)
+
+        self.pilot_force_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_force_spinbox.setObjectName(u"pilot_force_spinbox")
+        self.pilot_force_spinbox.setMinimum(-1)
+        self.pilot_force_spinbox.setValue(-1)
+
+        self.horizontalLayout_28.addWidget(self.pilot_force_spinbox)
+
+
+        self.verticalLayout_11.addLayout(self.horizontalLayout_28)
+
+        self.horizontalLayout_29 = QHBoxLayout()
+        self.horizontalLayout_29.setObjectName(u"horizontalLayout_29")
+        self.label_31 = QLabel(DefinitionForm)
+        self.label_31.setObjectName(u"label_31")
+
+        self.horizontalLayout_29.addWidget(self.label_31)
+
+        self.pilot_force_recharge_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_force_recharge_spinbox.setObjectName(u"pilot_force_recharge_spinbox")
+        self.pilot_force_recharge_spinbox.setMinimum(-1)
+        self.pilot_force_recharge_spinbox.setValue(-1)
+
+        self.horizontalLayout_29.addWidget(self.pilot_force_recharge_spinbox)
+
+
+        self.verticalLayout_11.addLayout(self.horizontalLayout_29)
+
+
+        self.verticalLayout_8.addLayout(self.verticalLayout_11)
+
+        self.horizontalLayout_43 = QHBoxLayout()
+        self.horizontalLayout_43.setObjectName(u"horizontalLayout_43")
+        self.label_46 = QLabel(DefinitionForm)
+        self.label_46.setObjectName(u"label_46")
+
+        self.horizontalLayout_43.addWidget(self.label_46)
+
+        self.pilot_force_decharge_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_force_decharge_spinbox.setObjectName(u"pilot_force_decharge_spinbox")
+        self.pilot_force_decharge_spinbox.setMinimum(-1)
+        self.pilot_force_decharge_spinbox.setValue(-1)
+
+        self.horizontalLayout_43.addWidget(self.pilot_force_decharge_spinbox)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_43)
+
+        self.verticalLayout_12 = QVBoxLayout()
+        self.verticalLayout_12.setObjectName(u"verticalLayout_12")
+        self.horizontalLayout_30 = QHBoxLayout()
+        self.horizontalLayout_30.setObjectName(u"horizontalLayout_30")
+        self.label_32 = QLabel(DefinitionForm)
+        self.label_32.setObjectName(u"label_32")
+
+        self.horizontalLayout_30.addWidget(self.label_32)
+
+        self.pilot_energy_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_energy_spinbox.setObjectName(u"pilot_energy_spinbox")
+        self.pilot_energy_spinbox.setMinimum(-1)
+        self.pilot_energy_spinbox.setValue(-1)
+
+        self.horizontalLayout_30.addWidget(self.pilot_energy_spinbox)
+
+
+        self.verticalLayout_12.addLayout(self.horizontalLayout_30)
+
+        self.horizontalLayout_31 = QHBoxLayout()
+        self.horizontalLayout_31.setObjectName(u"horizontalLayout_31")
+        self.label_33 = QLabel(DefinitionForm)
+        self.label_33.setObjectName(u"label_33")
+
+        self.horizontalLayout_31.addWidget(self.label_33)
+
+        self.pilot_energy_recharge_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_energy_recharge_spinbox.setObjectName(u"pilot_energy_recharge_spinbox")
+        self.pilot_energy_recharge_spinbox.setMinimum(-1)
+        self.pilot_energy_recharge_spinbox.setValue(-1)
+
+        self.horizontalLayout_31.addWidget(self.pilot_energy_recharge_spinbox)
+
+
+        self.verticalLayout_12.addLayout(self.horizontalLayout_31)
+
+
+        self.verticalLayout_8.addLayout(self.verticalLayout_12)
+
+        self.horizontalLayout_44 = QHBoxLayout()
+        self.horizontalLayout_44.setObjectName(u"horizontalLayout_44")
+        self.label_47 = QLabel(DefinitionForm)
+        self.label_47.setObjectName(u"label_47")
+
+        self.horizontalLayout_44.addWidget(self.label_47)
+
+        self.pilot_energy_decharge_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_energy_decharge_spinbox.setObjectName(u"pilot_energy_decharge_spinbox")
+        self.pilot_energy_decharge_spinbox.setMinimum(-1)
+        self.pilot_energy_decharge_spinbox.setValue(-1)
+
+        self.horizontalLayout_44.addWidget(self.pilot_energy_decharge_spinbox)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_44)
+
+        self.verticalLayout_13 = QVBoxLayout()
+        self.verticalLayout_13.setObjectName(u"verticalLayout_13")
+        self.horizontalLayout_32 = QHBoxLayout()
+        self.horizontalLayout_32.setObjectName(u"horizontalLayout_32")
+        self.label_34 = QLabel(DefinitionForm)
+        self.label_34.setObjectName(u"label_34")
+
+        self.horizontalLayout_32.addWidget(self.label_34)
+
+        self.pilot_charge_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_charge_spinbox.setObjectName(u"pilot_charge_spinbox")
+        self.pilot_charge_spinbox.setMinimum(-1)
+        self.pilot_charge_spinbox.setValue(-1)
+
+        self.horizontalLayout_32.addWidget(self.pilot_charge_spinbox)
+
+
+        self.verticalLayout_13.addLayout(self.horizontalLayout_32)
+
+        self.horizontalLayout_33 = QHBoxLayout()
+        self.horizontalLayout_33.setObjectName(u"horizontalLayout_33")
+        self.label_35 = QLabel(DefinitionForm)
+        self.label_35.setObjectName(u"label_35")
+
+        self.horizontalLayout_33.addWidget(self.label_35)
+
+        self.pilot_charge_recharge_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_charge_recharge_spinbox.setObjectName(u"pilot_charge_recharge_spinbox")
+        self.pilot_charge_recharge_spinbox.setMinimum(-1)
+        self.pilot_charge_recharge_spinbox.setValue(-1)
+
+        self.horizontalLayout_33.addWidget(self.pilot_charge_recharge_spinbox)
+
+
+        self.verticalLayout_13.addLayout(self.horizontalLayout_33)
+
+
+        self.verticalLayout_8.addLayout(self.verticalLayout_13)
+
+        self.horizontalLayout_45 = QHBoxLayout()
+        self.horizontalLayout_45.setObjectName(u"horizontalLayout_45")
+        self.label_48 = QLabel(DefinitionForm)
+        self.label_48.setObjectName(u"label_48")
+
+        self.horizontalLayout_45.addWidget(self.label_48)
+
+        self.pilot_charge_decharge_spinbox = QSpinBox(DefinitionForm)
+        self.pilot_charge_decharge_spinbox.setObjectName(u"pilot_charge_decharge_spinbox")
+        self.pilot_charge_decharge_spinbox.setMinimum(-1)
+        self.pilot_charge_decharge_spinbox.setValue(-1)
+
+        self.horizontalLayout_45.addWidget(self.pilot_charge_decharge_spinbox)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_45)
+
+        self.verticalLayout_14 = QVBoxLayout()
+        self.verticalLayout_14.setObjectName(u"verticalLayout_14")
+        self.horizontalLayout_19 = QHBoxLayout()
+        self.horizontalLayout_19.setObjectName(u"horizontalLayout_19")
+        self.label_21 = QLabel(DefinitionForm)
+        self.label_21.setObjectName(u"label_21")
+
+        self.horizontalLayout_19.addWidget(self.label_21)
+
+        self.pilot_actions_line_edit = QLineEdit(DefinitionForm)
+        self.pilot_actions_line_edit.setObjectName(u"pilot_actions_line_edit")
+
+        self.horizontalLayout_19.addWidget(self.pilot_actions_line_edit)
+
+
+        self.verticalLayout_14.addLayout(self.horizontalLayout_19)
+
+        self.horizontalLayout_34 = QHBoxLayout()
+        self.horizontalLayout_34.setObjectName(u"horizontalLayout_34")
+        self.label_36 = QLabel(DefinitionForm)
+        self.label_36.setObjectName(u"label_36")
+
+        self.horizontalLayout_34.addWidget(self.label_36)
+
+        self.pilot_colors_line_edit = QLineEdit(DefinitionForm)
+        self.pilot_colors_line_edit.setObjectName(u"pilot_colors_line_edit")
+
+        self.horizontalLayout_34.addWidget(self.pilot_colors_line_edit)
+
+
+        self.verticalLayout_14.addLayout(self.horizontalLayout_34)
+
+
+        self.verticalLayout_8.addLayout(self.verticalLayout_14)
+
+        self.horizontalLayout_36 = QHBoxLayout()
+        self.horizontalLayout_36.setObjectName(u"horizontalLayout_36")
+        self.label_38 = QLabel(DefinitionForm)
+        self.label_38.setObjectName(u"label_38")
+
+        self.horizontalLayout_36.addWidget(self.label_38)
+
+        self.pilot_upgrade_slots_line_edit = QLineEdit(DefinitionForm)
+        self.pilot_upgrade_slots_line_edit.setObjectName(u"pilot_upgrade_slots_line_edit")
+
+        self.horizontalLayout_36.addWidget(self.pilot_upgrade_slots_line_edit)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_36)
+
+        self.horizontalLayout_38 = QHBoxLayout()
+        self.horizontalLayout_38.setObjectName(u"horizontalLayout_38")
+        self.label_40 = QLabel(DefinitionForm)
+        self.label_40.setObjectName(u"label_40")
+
+        self.horizontalLayout_38.addWidget(self.label_40)
+
+        self.traits_line_edit = QLineEdit(DefinitionForm)
+        self.traits_line_edit.setObjectName(u"traits_line_edit")
+
+        self.horizontalLayout_38.addWidget(self.traits_line_edit)
+
+
+        self.verticalLayout_8.addLayout(self.horizontalLayout_38)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_8.addItem(self.verticalSpacer)
+
+
+        self.horizontalLayout_35.addLayout(self.verticalLayout_8)
+
+
+        self.verticalLayout_15.addLayout(self.horizontalLayout_35)
+
+        self.buttonBox = QDialogButtonBox(DefinitionForm)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_15.addWidget(self.buttonBox)
+
+
+        self.verticalLayout_16.addLayout(self.verticalLayout_15)
+
+
+        self.retranslateUi(DefinitionForm)
+        self.buttonBox.accepted.connect(DefinitionForm.accept)
+        self.buttonBox.rejected.connect(DefinitionForm.reject)
+
+        QMetaObject.connectSlotsByName(DefinitionForm)
+    # setupUi
+
+    def retranslateUi(self, DefinitionForm):
+        DefinitionForm.setWindowTitle(QCoreApplication.translate("DefinitionForm", u"Definition Form", None))
+#if QT_CONFIG(tooltip)
+        self.label_19.setToolTip(QCoreApplication.translate("DefinitionForm", u"Fill out every line item below.\n"
+"Once a ship is entered into the definition file, it can only be updated manually in the definition file regardless of the inputs below.\n"
+"Use a \",\" to separate list items, and a \">\" to indicate linked actions.", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_19.setText(QCoreApplication.translate("DefinitionForm", u"Ship", None))
+        self.label.setText(QCoreApplication.translate("DefinitionForm", u"Faction Name: ", None))
+        self.faction_name_line_edit.setText("")
+        self.faction_name_line_edit.setPlaceholderText("")
+        self.label_2.setText(QCoreApplication.translate("DefinitionForm", u"Ship Name: ", None))
+        self.ship_name_line_edit.setText("")
+        self.ship_name_line_edit.setPlaceholderText("")
+        self.ship_exists_label.setText(QCoreApplication.translate("DefinitionForm", u"Ship does not exist - please continue entry.", None))
+        self.label_3.setText(QCoreApplication.translate("DefinitionForm", u"Base Size:", None))
+        self.base_size_line_edit.setText("")
+        self.base_size_line_edit.setPlaceholderText("")
+        self.label_4.setText(QCoreApplication.translate("DefinitionForm", u"Attack(s):", None))
+        self.attacks_line_edit.setPlaceholderText(QCoreApplication.translate("DefinitionForm", u"separate with commas", None))
+        self.label_5.setText(QCoreApplication.translate("DefinitionForm", u"Arc Type(s):", None))
+        self.arc_types_line_edit.setPlaceholderText(QCoreApplication.translate("DefinitionForm", u"separate with commas", None))
+        self.label_6.setText(QCoreApplication.translate("DefinitionForm", u"Agility:", None))
+        self.label_7.setText(QCoreApplication.translate("DefinitionForm", u"Hull:", None))
+        self.label_8.setText(QCoreApplication.translate("DefinitionForm", u"Shield: ", None))
+        self.label_9.setText(QCoreApplication.translate("DefinitionForm", u"Shield Recharge:", None))
+        self.label_10.setText(QCoreApplication.translate("DefinitionForm", u"Force: ", None))
+        self.label_11.setText(QCoreApplication.translate("DefinitionForm", u"Force Recharge:", None))
+        self.label_12.setText(QCoreApplication.translate("DefinitionForm", u"Energy: ", None))
+        self.label_13.setText(QCoreApplication.translate("DefinitionForm", u"Energy Recharge:", None))
+        self.label_14.setText(QCoreApplication.translate("DefinitionForm", u"Charge:", None))
+        self.label_15.setText(QCoreApplication.translate("DefinitionForm", u"Charge Recharge:", None))
+        self.label_16.setText(QCoreApplication.translate("DefinitionForm", u"Action(s): ", None))
+        self.actions_line_edit.setPlaceholderText(QCoreApplication.translate("DefinitionForm", u"separate with commas", None))
+        self.label_17.setText(QCoreApplication.translate("DefinitionForm", u"Action Color(s): ", None))
+        self.colors_line_edit.setPlaceholderText(QCoreApplication.translate("DefinitionForm", u"separate with commas", None))
+        self.label_18.setText(QCoreApplication.translate("DefinitionForm", u"Upgrade Slot(s): ", None))
+        self.upgrade_slots_line_edit.setText("")
+        self.upgrade_slots_line_edit.setPlaceholderText(QCoreApplication.translate("DefinitionForm", u"separate with commas", None))
+        self.epic_checkbox.setText(QCoreApplication.translate("DefinitionForm", u"Epic", None))
+#if QT_CONFIG(tooltip)
+        self.label_20.setToolTip(QCoreApplication.translate("DefinitionForm", u"Required fields are pilot name, cost, initiative, and limit.\n"
+"Text Fields can be left blank and numerical fields can be left as none if there is no change from the ship.\n"
+"Pilot data can be overwritten if the name already exists, but the software will warn the user in this case.", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_20.setText(QCoreApplication.translate("DefinitionForm", u"Pilot", None))
+        self.label_22.setText(QCoreApplication.translate("DefinitionForm", u"Pilot Name:", None))
+        self.pilot_name_line_edit.setText("")
+        self.pilot_name_line_edit.setPlaceholderText("")
+        self.label_39.setText(QCoreApplication.translate("DefinitionForm", u"Cost:", None))
+        self.cost_spinbox.setSpecialValueText("")
+        self.label_41.setText(QCoreApplication.translate("DefinitionForm", u"Initiative", None))
+        self.initiative_spinbox.setSpecialValueText("")
+        self.label_23.setText(QCoreApplication.translate("DefinitionForm", u"Limit:", None))
+        self.limit_spinbox.setSpecialValueText("")
+        self.label_24.setText(QCoreApplication.translate("DefinitionForm", u"Attack(s):", None))
+        self.pilot_attacks_line_edit.setPlaceholderText(QCoreApplication.translate("DefinitionForm", u"separate with commas", None))
+        self.label_25.setText(QCoreApplication.translate("DefinitionForm", u"Arc Type(s):", None))
+        self.pilot_arc_types_line_edit.setPlaceholderText(QCoreApplication.translate("DefinitionForm", u"separate with commas", None))
+        self.label_26.setText(QCoreApplication.translate("DefinitionForm", u"Agility:", None))
+        self.pilot_agility_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_27.setText(QCoreApplication.translate("DefinitionForm", u"Hull:", None))
+        self.pilot_hull_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_28.setText(QCoreApplication.translate("DefinitionForm", u"Shield: ", None))
+        self.pilot_shield_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_29.setText(QCoreApplication.translate("DefinitionForm", u"Shield Recharge:", None))
+        self.pilot_shield_recharge_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_45.setText(QCoreApplication.translate("DefinitionForm", u"Shield Decharge:", None))
+        self.pilot_shield_decharge_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_30.setText(QCoreApplication.translate("DefinitionForm", u"Force: ", None))
+        self.pilot_force_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_31.setText(QCoreApplication.translate("DefinitionForm", u"Force Recharge:", None))
+        self.pilot_force_recharge_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_46.setText(QCoreApplication.translate("DefinitionForm", u"Force Decharge:", None))
+        self.pilot_force_decharge_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_32.setText(QCoreApplication.translate("DefinitionForm", u"Energy: ", None))
+        self.pilot_energy_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_33.setText(QCoreApplication.translate("DefinitionForm", u"Energy Recharge:", None))
+        self.pilot_energy_recharge_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_47.setText(QCoreApplication.translate("DefinitionForm", u"Energy Decharge: ", None))
+        self.pilot_energy_decharge_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_34.setText(QCoreApplication.translate("DefinitionForm", u"Charge:", None))
+        self.pilot_charge_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_35.setText(QCoreApplication.translate("DefinitionForm", u"Charge Recharge:", None))
+        self.pilot_charge_recharge_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_48.setText(QCoreApplication.translate("DefinitionForm", u"Charge Decharge:", None))
+        self.pilot_charge_decharge_spinbox.setSpecialValueText(QCoreApplication.translate("DefinitionForm", u"none", None))
+        self.label_21.setText(QCoreApplication.translate("DefinitionForm", u"Action(s):", None))
+        self.pilot_actions_line_edit.setPlaceholderText(QCoreApplication.translate("DefinitionForm", u"separate with commas", None))
+        self.label_36.setText(QCoreApplication.translate("DefinitionForm", u"Action Color(s):", None))
+        self.pilot_colors_line_edit.setPlaceholderText(QCoreApplication.translate("DefinitionForm", u"separate with commas", None))
+        self.label_38.setText(QCoreApplication.translate("DefinitionForm", u"Upgrade Slot(s):", None))
+        self.pilot_upgrade_slots_line_edit.setText("")
+        self.pilot_upgrade_slots_line_edit.setPlaceholderText(QCoreApplication.translate("DefinitionForm", u"separate with commas", None))
+        self.label_40.setText(QCoreApplication.translate("DefinitionForm", u"Keyword(s):", None))
+        self.traits_line_edit.setText("")
+        self.traits_line_edit.setPlaceholderText(QCoreApplication.translate("DefinitionForm", u"separate with commas", None))
+    # retranslateUi
+
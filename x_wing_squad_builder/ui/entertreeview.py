@@ -1,6 +1,6 @@
 from PySide6 import QtWidgets, QtGui, QtCore
 
-class EnterTreeWidget(QtWidgets.QTreeWidget):
+class EnterTreeView(QtWidgets.QTreeView):
     enter_signal = QtCore.Signal()
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
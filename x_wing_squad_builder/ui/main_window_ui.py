@@ -0,0 +1,498 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'main_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
+    QCursor, QFont, QFontDatabase, QGradient,
+    QIcon, QImage, QKeySequence, QLinearGradient,
+    QPainter, QPalette, QPixmap, QRadialGradient,
+    QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QFormLayout, QGridLayout,
+    QHBoxLayout, QHeaderView, QLabel, QLineEdit,
+    QListWidgetItem, QMainWindow, QMenu, QMenuBar,
+    QPlainTextEdit, QPushButton, QSizePolicy, QSpacerItem,
+    QStatusBar, QVBoxLayout, QWidget)
+
+from .card_viewer import CardViewer
+from .enterlistwidget import EnterListWidget
+from .entertreeview import EnterTreeView
+from . import resources_rc
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        if not MainWindow.objectName():
+            MainWindow.setObjectName(u"MainWindow")
+        MainWindow.resize(1232, 865)
+        icon = QIcon()
+        icon.addFile(u":/images/icon.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        MainWindow.setWindowIcon(icon)
+        self.action_about = QAction(MainWindow)
+        self.action_about.setObjectName(u"action_about")
+        self.action_exit = QAction(MainWindow)
+        self.action_exit.setObjectName(u"action_exit")
+        self.action_open_settings_window = QAction(MainWindow)
+        self.action_open_settings_window.setObjectName(u"action_open_settings_window")
+        self.action_definition_form = QAction(MainWindow)
+        self.action_definition_form.setObjectName(u"action_definition_form")
+        self.action_upgrade_form = QAction(MainWindow)
+        self.action_upgrade_form.setObjectName(u"action_upgrade_form")
+        self.action_reload_data = QAction(MainWindow)
+        self.action_reload_data.setObjectName(u"action_reload_data")
+        self.action_viewer = QAction(MainWindow)
+        self.action_viewer.setObjectName(u"action_viewer")
+        self.action_pilot_viewer = QAction(MainWindow)
+        self.action_pilot_viewer.setObjectName(u"action_pilot_viewer")
+        self.action_export_as_excel_3 = QAction(MainWindow)
+        self.action_export_as_excel_3.setObjectName(u"action_export_as_excel_3")
+        self.action_import_excel = QAction(MainWindow)
+        self.action_import_excel.setObjectName(u"action_import_excel")
+        self.action_export_as_excel = QAction(MainWindow)
+        self.action_export_as_excel.setObjectName(u"action_export_as_excel")
+        self.centralwidget = QWidget(MainWindow)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.gridLayout = QGridLayout(self.centralwidget)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.horizontalLayout_7 = QHBoxLayout()
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.data_selection_layout = QVBoxLayout()
+        self.data_selection_layout.setObjectName(u"data_selection_layout")
+        self.data_view_layout_2 = QHBoxLayout()
+        self.data_view_layout_2.setObjectName(u"data_view_layout_2")
+        self.faction_list_widget = EnterListWidget(self.centralwidget)
+        self.faction_list_widget.setObjectName(u"faction_list_widget")
+
+        self.data_view_layout_2.addWidget(self.faction_list_widget)
+
+        self.ship_list_widget = EnterListWidget(self.centralwidget)
+        self.ship_list_widget.setObjectName(u"ship_list_widget")
+
+        self.data_view_layout_2.addWidget(self.ship_list_widget)
+
+        self.pilot_list_widget = EnterListWidget(self.centralwidget)
+        self.pilot_list_widget.setObjectName(u"pilot_list_widget")
+        self.pilot_list_widget.setDragEnabled(False)
+        self.pilot_list_widget.setDragDropMode(QAbstractItemView.NoDragDrop)
+        self.pilot_list_widget.setAlternatingRowColors(False)
+        self.pilot_list_widget.setSelectionBehavior(QAbstractItemView.SelectItems)
+        self.pilot_list_widget.setModelColumn(0)
+
+        self.data_view_layout_2.addWidget(self.pilot_list_widget)
+
+
+        self.data_selection_layout.addLayout(self.data_view_layout_2)
+
+        self.horizontalLayout_8 = QHBoxLayout()
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.ship_aggregate_2 = QVBoxLayout()
+        self.ship_aggregate_2.setSpacing(6)
+        self.ship_aggregate_2.setObjectName(u"ship_aggregate_2")
+        self.ship_name_label = QLabel(self.centralwidget)
+        self.ship_name_label.setObjectName(u"ship_name_label")
+        font = QFont()
+        font.setPointSize(11)
+        font.setBold(True)
+        self.ship_name_label.setFont(font)
+
+        self.ship_aggregate_2.addWidget(self.ship_name_label)
+
+        self.ship_information_3 = QGridLayout()
+        self.ship_information_3.setObjectName(u"ship_information_3")
+        self.ship_information_3.setVerticalSpacing(10)
+        self.ship_information_3.setContentsMargins(-1, -1, -1, 6)
+        self.initiative_label = QLabel(self.centralwidget)
+        self.initiative_label.setObjectName(u"initiative_label")
+
+        self.ship_information_3.addWidget(self.initiative_label, 2, 1, 1, 1)
+
+        self.pilot_upgrade_slot_layout = QHBoxLayout()
+        self.pilot_upgrade_slot_layout.setObjectName(u"pilot_upgrade_slot_layout")
+        self.pilot_upgrade_slot_layout.setContentsMargins(-1, -1, -1, 0)
+
+        self.ship_information_3.addLayout(self.pilot_upgrade_slot_layout, 7, 1, 1, 1)
+
+        self.label_13 = QLabel(self.centralwidget)
+        self.label_13.setObjectName(u"label_13")
+
+        self.ship_information_3.addWidget(self.label_13, 2, 0, 1, 1)
+
+        self.ship_action_layout = QHBoxLayout()
+        self.ship_action_layout.setObjectName(u"ship_action_layout")
+
+        self.ship_information_3.addLayout(self.ship_action_layout, 4, 1, 1, 1)
+
+        self.label_17 = QLabel(self.centralwidget)
+        self.label_17.setObjectName(u"label_17")
+
+        self.ship_information_3.addWidget(self.label_17, 7, 0, 1, 1)
+
+        self.points_label = QLabel(self.centralwidget)
+        self.points_label.setObjectName(u"points_label")
+
+        self.ship_information_3.addWidget(self.points_label, 3, 1, 1, 1)
+
+        self.label_11 = QLabel(self.centralwidget)
+        self.label_11.setObjectName(u"label_11")
+
+        self.ship_information_3.addWidget(self.label_11, 6, 0, 1, 1)
+
+        self.label_14 = QLabel(self.centralwidget)
+        self.label_14.setObjectName(u"label_14")
+
+        self.ship_information_3.addWidget(self.label_14, 4, 0, 1, 1)
+
+        self.label_16 = QLabel(self.centralwidget)
+        self.label_16.setObjectName(u"label_16")
+
+        self.ship_information_3.addWidget(self.label_16, 1, 0, 1, 1)
+
+        self.pilot_action_layout = QHBoxLayout()
+        self.pilot_action_layout.setObjectName(u"pilot_action_layout")
+
+        self.ship_information_3.addLayout(self.pilot_action_layout, 5, 1, 1, 1)
+
+        self.label_12 = QLabel(self.centralwidget)
+        self.label_12.setObjectName(u"label_12")
+
+        self.ship_information_3.addWidget(self.label_12, 3, 0, 1, 1)
+
+        self.label_15 = QLabel(self.centralwidget)
+        self.label_15.setObjectName(u"label_15")
+
+        self.ship_information_3.addWidget(self.label_15, 5, 0, 1, 1)
+
+        self.base_label = QLabel(self.centralwidget)
+        self.base_label.setObjectName(u"base_label")
+
+        self.ship_information_3.addWidget(self.base_label, 1, 1, 1, 1)
+
+        self.ship_upgrade_slot_layout = QHBoxLayout()
+        self.ship_upgrade_slot_layout.setObjectName(u"ship_upgrade_slot_layout")
+
+        self.ship_information_3.addLayout(self.ship_upgrade_slot_layout, 6, 1, 1, 1)
+
+        self.label_18 = QLabel(self.centralwidget)
+        self.label_18.setObjectName(u"label_18")
+
+        self.ship_information_3.addWidget(self.label_18, 8, 0, 1, 1)
+
+        self.pilot_keyword_label = QLabel(self.centralwidget)
+        self.pilot_keyword_label.setObjectName(u"pilot_keyword_label")
+
+        self.ship_information_3.addWidget(self.pilot_keyword_label, 8, 1, 1, 1)
+
+
+        self.ship_aggregate_2.addLayout(self.ship_information_3)
+
+        self.maneuver_image_label = QLabel(self.centralwidget)
+        self.maneuver_image_label.setObjectName(u"maneuver_image_label")
+
+        self.ship_aggregate_2.addWidget(self.maneuver_image_label)
+
+        self.verticalSpacer_6 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.ship_aggregate_2.addItem(self.verticalSpacer_6)
+
+
+        self.horizontalLayout_8.addLayout(self.ship_aggregate_2)
+
+        self.main_card_viewer = CardViewer(self.centralwidget)
+        self.main_card_viewer.setObjectName(u"main_card_viewer")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(5)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.main_card_viewer.sizePolicy().hasHeightForWidth())
+        self.main_card_viewer.setSizePolicy(sizePolicy)
+
+        self.horizontalLayout_8.addWidget(self.main_card_viewer)
+
+
+        self.data_selection_layout.addLayout(self.horizontalLayout_8)
+
+        self.logging_plain_text_edit = QPlainTextEdit(self.centralwidget)
+        self.logging_plain_text_edit.setObjectName(u"logging_plain_text_edit")
+        self.logging_plain_text_edit.setReadOnly(True)
+
+        self.data_selection_layout.addWidget(self.logging_plain_text_edit)
+
+        self.data_selection_layout.setStretch(0, 3)
+        self.data_selection_layout.setStretch(1, 6)
+        self.data_selection_layout.setStretch(2, 2)
+
+        self.horizontalLayout_7.addLayout(self.data_selection_layout)
+
+        self.squad_layout = QVBoxLayout()
+        self.squad_layout.setObjectName(u"squad_layout")
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label = QLabel(self.centralwidget)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.squad_name_line_edit = QLineEdit(self.centralwidget)
+        self.squad_name_line_edit.setObjectName(u"squad_name_line_edit")
+        self.squad_name_line_edit.setFrame(True)
+
+        self.horizontalLayout.addWidget(self.squad_name_line_edit)
+
+
+        self.squad_layout.addLayout(self.horizontalLayout)
+
+        self.horizontalLayout_9 = QHBoxLayout()
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.verticalLayout_7 = QVBoxLayout()
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.verticalSpacer_10 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_7.addItem(self.verticalSpacer_10)
+
+        self.equip_pilot_push_button = QPushButton(self.centralwidget)
+        self.equip_pilot_push_button.setObjectName(u"equip_pilot_push_button")
+
+        self.verticalLayout_7.addWidget(self.equip_pilot_push_button)
+
+        self.unequip_pilot_push_button = QPushButton(self.centralwidget)
+        self.unequip_pilot_push_button.setObjectName(u"unequip_pilot_push_button")
+
+        self.verticalLayout_7.addWidget(self.unequip_pilot_push_button)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_7.addItem(self.verticalSpacer)
+
+        self.copy_pilot_push_button = QPushButton(self.centralwidget)
+        self.copy_pilot_push_button.setObjectName(u"copy_pilot_push_button")
+
+        self.verticalLayout_7.addWidget(self.copy_pilot_push_button)
+
+        self.verticalSpacer_8 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_7.addItem(self.verticalSpacer_8)
+
+        self.equip_upgrade_push_button = QPushButton(self.centralwidget)
+        self.equip_upgrade_push_button.setObjectName(u"equip_upgrade_push_button")
+
+        self.verticalLayout_7.addWidget(self.equip_upgrade_push_button)
+
+        self.unequip_upgrade_push_button = QPushButton(self.centralwidget)
+        self.unequip_upgrade_push_button.setObjectName(u"unequip_upgrade_push_button")
+
+        self.verticalLayout_7.addWidget(self.unequip_upgrade_push_button)
+
+        self.verticalSpacer_9 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_7.addItem(self.verticalSpacer_9)
+
+        self.verticalLayout_7.setStretch(8, 10)
+
+        self.horizontalLayout_9.addLayout(self.verticalLayout_7)
+
+        self.squad_tree_view = EnterTreeView(self.centralwidget)
+        self.squad_tree_view.setObjectName(u"squad_tree_view")
+
+        self.horizontalLayout_9.addWidget(self.squad_tree_view)
+
+        self.upgrade_list_widget = EnterListWidget(self.centralwidget)
+        self.upgrade_list_widget.setObjectName(u"upgrade_list_widget")
+
+        self.horizontalLayout_9.addWidget(self.upgrade_list_widget)
+
+        self.horizontalLayout_9.setStretch(1, 2)
+        self.horizontalLayout_9.setStretch(2, 1)
+
+        self.squad_layout.addLayout(self.horizontalLayout_9)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_2.addItem(self.horizontalSpacer_3)
+
+        self.formLayout_3 = QFormLayout()
+        self.formLayout_3.setObjectName(u"formLayout_3")
+        self.label_24 = QLabel(self.centralwidget)
+        self.label_24.setObjectName(u"label_24")
+        font1 = QFont()
+        font1.setPointSize(12)
+        font1.setBold(True)
+        self.label_24.setFont(font1)
+
+        self.formLayout_3.setWidget(0, QFormLayout.ItemRole.LabelRole, self.label_24)
+
+        self.total_pilot_cost_label = QLabel(self.centralwidget)
+        self.total_pilot_cost_label.setObjectName(u"total_pilot_cost_label")
+        font2 = QFont()
+        font2.setPointSize(12)
+        self.total_pilot_cost_label.setFont(font2)
+
+        self.formLayout_3.setWidget(0, QFormLayout.ItemRole.FieldRole, self.total_pilot_cost_label)
+
+        self.label_25 = QLabel(self.centralwidget)
+        self.label_25.setObjectName(u"label_25")
+        self.label_25.setFont(font1)
+
+        self.formLayout_3.setWidget(1, QFormLayout.ItemRole.LabelRole, self.label_25)
+
+        self.total_upgrade_cost = QLabel(self.centralwidget)
+        self.total_upgrade_cost.setObjectName(u"total_upgrade_cost")
+        self.total_upgrade_cost.setFont(font2)
+
+        self.formLayout_3.setWidget(1, QFormLayout.ItemRole.FieldRole, self.total_upgrade_cost)
+
+        self.label_26 = QLabel(self.centralwidget)
+        self.label_26.setObjectName(u"label_26")
+        self.label_26.setFont(font1)
+
+        self.formLayout_3.setWidget(2, QFormLayout.ItemRole.LabelRole, self.label_26)
+
+        self.total_cost_label = QLabel(self.centralwidget)
+        self.total_cost_label.setObjectName(u"total_cost_label")
+        self.total_cost_label.setFont(font2)
+
+        self.formLayout_3.setWidget(2, QFormLayout.ItemRole.FieldRole, self.total_cost_label)
+
+
+        self.horizontalLayout_2.addLayout(self.formLayout_3)
+
+
+        self.squad_layout.addLayout(self.horizontalLayout_2)
+
+
+        self.horizontalLayout_7.addLayout(self.squad_layout)
+
+        self.horizontalLayout_7.setStretch(0, 5)
+        self.horizontalLayout_7.setStretch(1, 3)
+
+        self.gridLayout.addLayout(self.horizontalLayout_7, 0, 0, 1, 1)
+
+        self.gridLayout.setRowStretch(0, 6)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QMenuBar(MainWindow)
+        self.menubar.setObjectName(u"menubar")
+        self.menubar.setGeometry(QRect(0, 0, 1232, 22))
+        self.menuFile = QMenu(self.menubar)
+        self.menuFile.setObjectName(u"menuFile")
+        self.menu_excel = QMenu(self.menuFile)
+        self.menu_excel.setObjectName(u"menu_excel")
+        self.menuHelp = QMenu(self.menubar)
+        self.menuHelp.setObjectName(u"menuHelp")
+        self.menuTools = QMenu(self.menubar)
+        self.menuTools.setObjectName(u"menuTools")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QStatusBar(MainWindow)
+        self.statusbar.setObjectName(u"statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        QWidget.setTabOrder(self.faction_list_widget, self.ship_list_widget)
+        QWidget.setTabOrder(self.ship_list_widget, self.pilot_list_widget)
+        QWidget.setTabOrder(self.pilot_list_widget, self.squad_tree_view)
+        QWidget.setTabOrder(self.squad_tree_view, self.upgrade_list_widget)
+        QWidget.setTabOrder(self.upgrade_list_widget, self.squad_name_line_edit)
+        QWidget.setTabOrder(self.squad_name_line_edit, self.equip_pilot_push_button)
+        QWidget.setTabOrder(self.equip_pilot_push_button, self.unequip_pilot_push_button)
+        QWidget.setTabOrder(self.unequip_pilot_push_button, self.equip_upgrade_push_button)
+        QWidget.setTabOrder(self.equip_upgrade_push_button, self.unequip_upgrade_push_button)
+        QWidget.setTabOrder(self.unequip_upgrade_push_button, self.logging_plain_text_edit)
+
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuTools.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.menu_excel.menuAction())
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.action_open_settings_window)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.action_exit)
+        self.menu_excel.addAction(self.action_import_excel)
+        self.menu_excel.addAction(self.action_export_as_excel)
+        self.menuHelp.addAction(self.action_about)
+        self.menuTools.addAction(self.action_viewer)
+        self.menuTools.addAction(self.action_definition_form)
+        self.menuTools.addAction(self.action_upgrade_form)
+        self.menuTools.addAction(self.action_reload_data)
+
+        self.retranslateUi(MainWindow)
+
+        QMetaObject.connectSlotsByName(MainWindow)
+    # setupUi
+
+    def retranslateUi(self, MainWindow):
+        MainWindow.setWindowTitle(QCoreApplication.translate("MainWindow", u"Template", None))
+        self.action_about.setText(QCoreApplication.translate("MainWindow", u"About", None))
+        self.action_exit.setText(QCoreApplication.translate("MainWindow", u"Exit", None))
+        self.action_open_settings_window.setText(QCoreApplication.translate("MainWindow", u"Settings", None))
+        self.action_definition_form.setText(QCoreApplication.translate("MainWindow", u"Definition Form", None))
+#if QT_CONFIG(shortcut)
+        self.action_definition_form.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+D", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_upgrade_form.setText(QCoreApplication.translate("MainWindow", u"Upgrade Form", None))
+#if QT_CONFIG(shortcut)
+        self.action_upgrade_form.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+U", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_reload_data.setText(QCoreApplication.translate("MainWindow", u"Reload Data", None))
+#if QT_CONFIG(shortcut)
+        self.action_reload_data.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+R", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_viewer.setText(QCoreApplication.translate("MainWindow", u"Card Viewer", None))
+#if QT_CONFIG(shortcut)
+        self.action_viewer.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+V", None))
+#endif // QT_CONFIG(shortcut)
+        self.action_pilot_viewer.setText(QCoreApplication.translate("MainWindow", u"Pilot Viewer", None))
+        self.action_export_as_excel_3.setText(QCoreApplication.translate("MainWindow", u"Export Squad as Excel", None))
+        self.action_import_excel.setText(QCoreApplication.translate("MainWindow", u"Import...", None))
+        self.action_export_as_excel.setText(QCoreApplication.translate("MainWindow", u"Export...", None))
+#if QT_CONFIG(tooltip)
+        self.faction_list_widget.setToolTip(QCoreApplication.translate("MainWindow", u"Faction list", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.ship_list_widget.setToolTip(QCoreApplication.translate("MainWindow", u"Ship List", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.pilot_list_widget.setToolTip(QCoreApplication.translate("MainWindow", u"Pilot List\n"
+"(Initiative) Pilot Name (Cost)", None))
+#endif // QT_CONFIG(tooltip)
+        self.ship_name_label.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.initiative_label.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.label_13.setText(QCoreApplication.translate("MainWindow", u"Initiative:", None))
+        self.label_17.setText(QCoreApplication.translate("MainWindow", u"Pilot Upgrade Slots:", None))
+        self.points_label.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.label_11.setText(QCoreApplication.translate("MainWindow", u"Ship Upgrade Slots:", None))
+        self.label_14.setText(QCoreApplication.translate("MainWindow", u"Ship Actions:", None))
+        self.label_16.setText(QCoreApplication.translate("MainWindow", u"Base: ", None))
+        self.label_12.setText(QCoreApplication.translate("MainWindow", u"Points:", None))
+        self.label_15.setText(QCoreApplication.translate("MainWindow", u"Pilot Actions:", None))
+        self.base_label.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.label_18.setText(QCoreApplication.translate("MainWindow", u"Pilot Keywords:", None))
+        self.pilot_keyword_label.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.maneuver_image_label.setText(QCoreApplication.translate("MainWindow", u"TextLabel", None))
+        self.label.setText(QCoreApplication.translate("MainWindow", u"Squad Name:", None))
+        self.squad_name_line_edit.setText(QCoreApplication.translate("MainWindow", u"The Best Squad", None))
+        self.equip_pilot_push_button.setText(QCoreApplication.translate("MainWindow", u"Equip Pilot", None))
+        self.unequip_pilot_push_button.setText(QCoreApplication.translate("MainWindow", u"Unequip Pilot", None))
+        self.copy_pilot_push_button.setText(QCoreApplication.translate("MainWindow", u"Copy Pilot", None))
+        self.equip_upgrade_push_button.setText(QCoreApplication.translate("MainWindow", u"Equip Upgrade", None))
+        self.unequip_upgrade_push_button.setText(QCoreApplication.translate("MainWindow", u"Unequip Upgrade", None))
+#if QT_CONFIG(tooltip)
+        self.upgrade_list_widget.setToolTip(QCoreApplication.translate("MainWindow", u"Upgrade List\n"
+"Upgrade Name (Cost)", None))
+#endif // QT_CONFIG(tooltip)
+        self.label_24.setText(QCoreApplication.translate("MainWindow", u"Pilot Cost:", None))
+        self.total_pilot_cost_label.setText(QCoreApplication.translate("MainWindow", u"pilot_cost", None))
+        self.label_25.setText(QCoreApplication.translate("MainWindow", u"Upgrade Cost:", None))
+        self.total_upgrade_cost.setText(QCoreApplication.translate("MainWindow", u"upgrade_cost", None))
+        self.label_26.setText(QCoreApplication.translate("MainWindow", u"Total Cost:", None))
+        self.total_cost_label.setText(QCoreApplication.translate("MainWindow", u"total_cost", None))
+        self.menuFile.setTitle(QCoreApplication.translate("MainWindow", u"File", None))
+        self.menu_excel.setTitle(QCoreApplication.translate("MainWindow", u"Import/Export Squad from Excel", None))
+        self.menuHelp.setTitle(QCoreApplication.translate("MainWindow", u"Help", None))
+        self.menuTools.setTitle(QCoreApplication.translate("MainWindow", u"Tools", None))
+    # retranslateUi
+
@@ -0,0 +1,7869 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.12.0
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00%\xde\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\xc4\x00\x00\x01\xc4\x08\x06\x00\x00\x00\xa7_Z\x1f\
+\x00\x00\x00\x06bKGD\x00\xff\x00\xff\x00\xff\xa0\xbd\
+\xa7\x93\x00\x00 \x00IDATx\x9c\xed\xddy\x98\
+%U\x99\xe7\xf1oV\x15\xfbR,\x05\xc8\xa2\xa5\xd8\
+\xec;\xc5\xea\xd8\xad\xa2\xe3\xa8\xd3\x9b\x8a\xa3\xdd\xda\xd2\
+\x8a\xad\xd2\xb6\x8a\x02\x22\xa0-n\x88\xa2\xb8!\x82\x8a\
+=j\xbb/3\xd3\xe3\xd8\xda\xb6\xad\xed\x02*[\xb1\
+\x14\xbbP\x08\xc8V\xec;EU\xce\x1f\xa7\xee\x937\
+\xb3nf\xc6\xbd\x19\x11o\x9c\x88\xef\xe7y\xceSR\
+\x95\x19\xf7\xbdaU\xfe\xee\x898\xf1\x1e\x90\xd4e\xf3\
+\x81]\x81W\x00\xa7\x02\xbf\x02\xc6\xd7\x8c;\x81\x7f\x05\
+^\x0d\xac\x17U\xa0$Ie[\x1f8\x10\xf8;\xe0\
+L\xe0\x5c\xe0A&\x02p\xa6q\x13pX\xfd%K\
+\x9247\x9b\x93\x02\xec\x18\xe0+\xc0e\xc0J\x8a\x85\
+\xdftc\x15\xf0\xc6:\xdf\x84T\xa7\xb1\xe8\x02$\xcd\
+\xd9b`_`\xbf5\xbf\xee\xbb\xe6\xf7\xaa\xb0\x1ax\
+\x09\xf0\x7f*:\xbe\x14\xc6@\x94\xf2\xd1\xbb\xdf\xb7;\
+\xb0\x07\xb0\x048\x08\xd8\xba\xe6:n\x07v\x01\xee\xab\
+\xf9u%I\x1d\xb4\x11p(p\x14p6\xf0[\xe0\
+\x11\xe6v\xc9\xb3\xccqBuo]\x8a\xe1\x0cQ\x8a\
+\xb7\x19\xb0'i\xc6\xd7\x1b\xbb\x90f\x84M\xb5\x94t\
+\x89Vj\x0d\x03Q\xaa\xcf\x18\xf04R\x90\xf4\xdf\xef\
+\xdb>\xb2\xa89\xd8\x84\xb4JUj\x85\x05\xd1\x05H\
+-\xb5\x804\xcb[\xc2\xc4=\xbfC\x80E\x91E\x95\
+l[\xe0\xda\xe8\x22\xa4\xb2\x18\x88\xd2\xdcm\x0a\xec\xc3\
+\xc4\x8co?R\x00\xae\x1bYT\x0d6\x8d.@*\
+\x93\x81(\x0dgs&Vx\xf6\xc6\xae\xc0\xbc\xc8\xa2\
+$\xcd\x9d\x81(Mo;&\x07\xdf\x12\xd2eBI\
+-d J\xb0\x0e\xb03\x93\x83o\x1f`\xe3\xc8\xa2\
+$\xd5\xcb@T\xd7l\x0a\xec\xcd\xe4\xc5.\x07`\xf3\
+j\xa9\xf3\x0cD\xb5Y\xef\x92g\x7fg\x97\xdd\xf0q\
+#I\x03\x18\x88j\x83\xf9\xa4\xde\x9d\xfd\x8b]\x0e\x04\
+\xb6\x89,JR^\x0cD\xe5f]`'&\xdf\xef\
+\xdb\x0f\xd80\xb2(I\xf93\x10\xd5d9\xb64\x93\
+\x94)\x03QM\xd1\xff\x88C\xef\x9e\x9f\xf7\xfb$\xd5\
+\xc6@T\xdd\xd6!\x05\xde\xbeS\xc6f\x91Eu\xc8\
+\xcd\xa4\xed\xa2\xda\xdeEG\x1a\x9a\x81\xa8*mL\xba\
+\xc4\xd9\xbf\xd8e\x7f`\x83\xc8\xa2:\xe4V\xe0\xc2\xbe\
+q>p\x1b\xb0\x9c\xea6\x10\x96\xb2e \xaa,\xb6\
+4\x8b\xb3\x92\xd4d\xbb\x17|\xcb\x80\x8b\x80\xbb#\x8b\
+\x92rc j\x14\xb64\x8b\xf3\x00p))\xf4\xae\
+ \x05\xe0\x05\xc0\xa3\x91EIm` j&S[\
+\x9a\xedNz\xc4a\xcb\xc8\xa2:\xe4\x1e&B\xaf7\
+\xae\x04VG\x16%\xb5\x95\x81\xa8\x9eA-\xcd\x96\x00\
+\xebG\x16\xd5!S\xef\xf7-\x03\xae\x0f\xadH\xea\x18\
+\x03\xb1\x9b\xb6cr\xe8y\xbf\xaf>O\x00\xd70\x11\
+zW\x00\xe7\x01+\x22\x8b\x92d \xb6\x9d-\xcdb\
+=\x0e\x5c\xc7\xe4\x99\xdf\x85\xc0#\x91EI\x1a\xcc@\
+l\x8fA[\x18\xed\x0bl\x14YT\x87\xdcK\x9a\xf1\
+\xf5\x07\xdfU\xc0\xaa\xc8\xa2$\x15g \xe6i!\xb0\
+\x17\x93\x17\xbb\xec\x85\x0f[\xd7\xa5\xff~_\xef\xb2\xe7\
+\x15\xc0xdQ\x92\xe6\xc6@l>[\x9a\xc5Y\x05\
+\xdc\xc8\xe4\x95\x9e\xbf\x06\xee\x8c,JR5\x0c\xc4\xe6\
+X@\xea\xea\xd2\xbf\xd8\xe5``\xab\xc8\xa2:d\xea\
+\xc3\xed\x17\x92\x1en\x7f8\xb2(I\xf51\x10c\x0c\
+ji\xe6\x16F\xf5\xb9\x0f\xb8\x9c\xc9\x97=/#-\
+\x82\x91\xd4Q\x06b\xf5li\x16\xebV&wu\xb9\
+\x10\xef\xf7I\x1a\xc0@,\xd7\xd4\x96f\xbb\x03;\x86\
+V\xd4-S\x1fn\xff-p{hE\x92\xb2a \
+\x8e\xa6w\xbf\xcf\x96f1\x06\xdd\xef\xbb\x18x(\xb2\
+(Iy3\x10g\xb7\x09\xb0\x0fkwv\xb1\xa5Y\
+=lf-\xa9\x16\x06\xe2d\xb64\x8be3kI\
+a\xba\x1c\x88S\xef\xf7\x1d\x00<)\xb4\xa2n\x99z\
+\xbf\xef\x825\xbf'I!\xba\x10\x88\xb64\x8b5\xa8\
+\x99\xf5\xb9\xc0]\x91EI\xd2Tm\x0b\xc4A-\xcd\
+\xf6\x04\xd6\x8b,\xaaC\x1e\x04\xaef\xed\xcb\x9e6\xb3\
+\x96\xd4x9\x07b\xef\x92g\xff=?[\x9a\xd5g\
+P3k\xef\xf7I\xcaV\x0e\x818\x9f\xb4\xb0\xa5?\
+\xf8\x0e\x02\xb6\x8e,\xaac\x065\xb3^\x16Z\x91$\
+\x95\xaci\x81\xb8.\xb0\x13\x93\xef\xf7\xd9\xd2\xac>\xbd\
+\xfb}\xfd\x8f8\xd8\xccZR'D\x06\xe2f\xa4\xfb\
+{\xfd\xe1\xb7\x0biF\xa8\xea\x0d\xda\xbc\xd6f\xd6\x92\
+:\xab\xae@\xb4\xa5Y\xac\xa9\xcd\xac\xdd\xbcV\x92\xa6\
+(;\x10\xfb[\x9a\xf5\xee\xf9\x1d\x02,*\xf9u4\
+\xbd\xde\xfd\xbe\xfe\xcb\x9e6\xb3\x96\xa4Y\xcc%\x10\x07\
+\xb54\xdb\x1f\xd8\xa0\x84\xba4\xbbA\x9b\xd7\xda\xccZ\
+\x92FT4\x10\xdd\xc2(\x96\xcd\xac%\xa9b\xd3\x05\
+\xe2\xd3\x80\x97\x02\x87\x91f}\xdb\xd4V\x91\xee\x05\x96\
+\x92\x02\xaf\xf7\xeb\x95\xa4\x15\xa0\x92\xa4\x8aL\x0d\xc4\x85\
+\xc0\xc7\x80#\x06\xfc\x99\xcaw\x0b\x13\xa1\xd7\x0b\xc0\xeb\
+C+\x92\xa4\x8e\xea\x0f\xbd\xa7\x03?&\xcd\x0eU\xae\
+\xd5\xa4G\x1c\x96\x92\x1em\xe8\x85\xe0\x1d\x91EI\x92\
+&\xf4\x02q\x11\xf0\x13`q`-m\xf18\xe9\x11\
+\x87\xfe\xcb\x9e\x97\x90\xf6\xf5\x93$5T/\x10\xcf\xc4\
+0\x1c\xc5\x03\xa4\xc0\xeb\xbf\xec\xb9\x8c\xb4\x08F\x92\x94\
+\x91\x05\xc0\xde\xc0\xe1\xd1\x85d\xc0\xcdk%\xa9\xc5\x16\
+\x00G\xe2\x0e\x11\xfd\xc6\x81\x1b\x98|\xafo)\xf0\x87\
+\xc8\xa2\xa4\x06:\x13\xb8?\xba\x08u\xc2\xbd\xc0r\xd2\
+\xa4\xe4g\xa4\x9f\xd1\xa5[\x00<\xa7\x8a\x03gb%\
+i\x96\xd7\xff\x88\xc3RR\xab3I3;(\xba\x00\
+u\xd6\x15\xc0\x97\x80/\x00w\x97u\xd01R\xf2.\
+,\xeb\x80\x0d\xf6\x10p)\x13\xa1w\x11i\xf1\xcbc\
+\x91EI\x01\x96\xe3\x9a\x01\xb5\xc3\x03\xc0\xa7\x80S(\
+ac\x821\xd2=\xb0\xb6]2]\xc1\xda\x8f8\x5c\
+\x8b\xcd\xac%0\x10\xd5>7\x02\xaf\x06~>\x97\x83\
+\x8c\x91\x7f\xd3\xe7\x1b\x99\xfc`\xfb\xc5\xc0M\xa1\x15I\
+\xcdf \xaa\x8dV\x01\xef\x00N\x1f\xf5\x009\x05\xe2\
+*\xd2\x96E\xfd\xf7\xfa.\x22\xad\xfe\x94T\xcc\xe6\xa4\
+\x1dQ\xd6\x8b.D\xaa\xc8\xa9\xc0\x09\xa3|cS\xdb\
+\xb3=\x02\x5c\xc6\xe4\xcb\x9e\x97\xae\xf9}I\xa3{)\
+\x86\xa1\xda\xed\x9d\xa4\x85\x91\xa7\x0e\xfb\x8dM\x08\xc4\xfb\
+I\xe1\xd7{\xb6o\x19.v\x91\xaa\xf2\x8c\xe8\x02\xa4\
+\x1a\x9cBZ\x89\xfa/\xc3|S\xdd\x81x3k?\
+\xe2P\xc9\xf3$\x92\x06\xda>\xba\x00\xa9\x06c\xa4G\
+2v\x03\xee*\xfaMU\x05\xe2j\xd2\xaa\xce\xfe{\
+}K\x81;+z=I\x92\xfam\x05|\x08x}\
+\xd1o(sQ\xcdW\x80\xdf\x90B\xf0R\xe0\xc1\x92\
+\x8e+\xa9<\xe7\x00\xaf\x8d.B\xaa\xc9\x13\xa4\xcd\xec\
+\x7fW\xf4\x1b\xc6K\x1a\x8b\xcaz\x07\x92*s$\xe5\
+\xfd\x9bw8r\x18gPP\x993\xc4\xadH\x0f\xc4\
+Kj\xae\xcd\x80\xdbp\xa5\xa9\xba\xe3n`;\x0a,\
+\xd4\x9cW}-\x92\x1a\xe4^R J]\xb1\x05\xf0\
+\xc7E\xbe\xd0@\x94$\xb5\xdds\x8b|\x91\x81(I\
+j\xbb\xbd\x8a|\x91\x81(Ij\xbb\x9d\x8a|\x91\x81\
+(Ij\xbb\xcd\x8b|Q\x13Z\xb7I\xca\xd3;\x81\
+\xeb\xa3\x8bP\xabm\x05|\xa6\x84\xe3lX\xf4\x0b\xcb\
+z\xd6\xc3\xe7\x10\xa5<,\xa7\x9c\x7f\xf3K\xea.\x5c\
+\x9d\xb3\x98r\xfe\xae>T\xe4\xc5\xbcd*I\x12\x06\
+\xa2$I\x80\x81(I\x12` J\x92\x04\x18\x88\x92\
+$\x01\x06\xa2$I\x80\x81(I\x12` J\x92\x04\
+\x18\x88\x92$\x01\x06\xa2$I\x80\x81(I\x12` \
+J\x92\x04\x18\x88\x92$\x01\x06\xa2$I\x80\x81(I\
+\x12` J\x92\x04\x18\x88\x92$\x01\x06\xa2$I\x80\
+\x81(I\x12` J\x92\x04\x18\x88\x92$\x01\x06\xa2\
+$I\x80\x81(I\x12` J\x92\x04\x18\x88\x92$\
+\x01\x06\xa2$I\x80\x81(I\x12` J\x92\x04\x18\
+\x88\x92$\x01\x06\xa2$I\x80\x81(I\x12` J\
+\x92\x04\x18\x88\x92$\x01\x06\xa2$I\x80\x81(I\x12\
+` J\x92\x04\x18\x88\x92$\x01\x06\xa2$I\x80\x81\
+(I\x12` J\x92\x04\x18\x88\x92$\x01\x06\xa2$\
+I\x80\x81(I\x12\x00\x0b\xa2\x0b\x90\x94\xad#\x80\xe7\
+E\x17\xd1\xe7\xfb\xc0\xb2\x12\x8es\x18p`\x09\xc7i\
+\xab\x9b\x81\xafF\x17Q\x05\x03Q\xd2\xa8\xde\x1c]\xc0\
+\x14\xb7PN \xfe)\xf0\xb6\x12\x8e\xd3V\xbf\xa0\xa5\
+\x81\xe8%SI\x920\x10%I\x02\x0cDI\x92\x00\
+\x03Q\x92$\xc0@\x94$\x090\x10%I\x02\x0cD\
+I\x92\x00\x03Q\x92$\xc0@\x94$\x090\x10%I\
+\x02\x0cDI\x92\x00\x03Q\x92$\xc0@\x94$\x090\
+\x10%I\x02\x0cDI\x92\x00\x03Q\x92$\xc0\x0d\x82\
+%\x8d\xee{\xc0\x8a\xe8\x22\xfa\x5c[\xd2q\xce\x036\
+*\xe9Xmt]t\x01U\x1a/i,\xaa\xbbp\
+I#YN9\xff\xe6\x97\xd4]\xb8:g1\xe5\xfc\
+]}\xa8\xc8\x8by\xc9T\x92$\x0cDI\x92\x00\x03\
+Q\x92$\xc0@\x94$\x09\xe8\xe6*\xd3m\x81\xed\xa2\
+\x8b\x18\xc1#\xc0\x15\xd1E\x04XD\xba\xb1\xdet\xe3\
+\xc0E\xd1EH\x1a]\x17\x03q3\xd2\xb2\xeau\xa2\
+\x0b\x19\xd2*`WZ\xbe\xe4y\x80\xaf\x00/\x88.\
+\xa2\x80s\x80\xd7E\x17!it]\xbcdz%\xf0\
+\x99\xe8\x22F0\x1f8&\xba\x88\x9a\xfd\x09y\x84\xe1\
+\xdd\xc0\x09\xd1EH\x9a\xbb.>\x87\xb8)p+\xe5\
+\xbd\xf7\xba\xc6\xa3\xc0\xf6\x15\x9c\x8f\xa6:\x97\xf8s^\
+d\xbc\xa1\xaa\x13P\x11\x9fCT.|\x0e\xb1\x06\xf7\
+\x03\xef\x8e.b\x04\xeb\x01o\x8f.\xa2&\x87\x03\x87\
+F\x17Q\xc0\x85\xc0\x17\xa2\x8b\x90T\x8e\xb2>%\xe7\
+4C\x84\xf4a\xe07\xc4\xcf.\x86\x1d\x0f\x02[U\
+p>\x9ad>i\x01Q\xf4\xb9\x9em\xac\x02\x0e\xae\
+\xe8\x1cT\xc9\x19\xa2r\xe1\x0c\xb1&\xab\x81\xa3I'\
++'\x1b\x01o\x89.\xa2b\xaf\x03v\x8b.\xa2\x80\
+\xb3I\x1f\xaa$\xb5DY\x9f\x96s\x9b!\xf6|\x99\
+\xf8\x99\xc6\xb0\xe3^\xd2j\xd96\xda\x00\xb8\x89\xf8s\
+<\xdbX\x01lY\xd19\xa8\x9a3D\xe5\xc2\x19b\
+\xcd\x8e#\xddS\xcc\xc9B\xe0\xa8\xe8\x22*r4\xb0\
+Ct\x11\x05\x1c\x07\xdc\x15]\x84\xa4r\x95\xf5\x899\
+\xd7\x19\x22\xc0\xf1\xc4\xcf8F\x99\xa1l\x5c\xc5\xc9\x08\
+\xb49)d\xa2\xcf\xedl\xe3W\xc0XE\xe7\xa0\x0e\
+\xce\x10\x95\x0bg\x88\x01>\x0e\x5c\x1d]\xc4\x90\xb6\x04\
+\x8e\x8c.\xa2d'\x01[D\x171\x8bU\xc0\x9bH\
+\xff\xc8$\xb5\x88\x81\x98<N\x9e\x0bU\x8e%=\x8a\
+\xd1\x06\xdb\x03\x7f\x1f]D\x01g\x00K\xa3\x8b\x90T\
+>\x03q\xc2\xbf\x01\xff/\xba\x88!\xed\x00\xbc:\xba\
+\x88\x92|\x80\xb4\xa0\xa6\xc9n\x07N\x8e.BRu\
+\xca\xba\xaf\x92\xf3=\xc4\x9e\xa7\x93\xba\xc1D\xdf\xa3\x1a\
+f\xfc\x8e\xfc{\xd2\xee\x0a\xac$\xfe\x5c\xce6^Y\
+\xd5\x09\xa8\x99\xf7\x10\x95\x0b\xef!\x06\xfa\x1d\xf0\xc9\xe8\
+\x22\x86\xb4#\xf0\xf2\xe8\x22\xe6\xe8\xc34?\xd4\x7f\x01\
+|-\xba\x08I\xd5*\xeb\xd3s\x1bf\x88\x00\x9b\x00\
+\xb7\x10?\x1b\x19f\x5cA\xbe\x1fn\x0e&5I\x88\
+>\x873\x8d\x95\xc0\xdeU\x9d\x80\x00\xce\x10\x95\x0bg\
+\x88\xc1\x1e \xbf\x9d\x0bv\x03\xfe\x22\xba\x88\x11\x9dJ\
+\xf3\x1fa\xf88pit\x11\x92\xaaW\xd6\xa7\xe8\xb6\
+\xcc\x10!\xfd\x80\xfe9\xf13\x93a\xc6E4?X\
+\xa6\xfas\xe2\xcf\xdbl\xe3&\xda\xf7\xbc\xa73D\xe5\
+\xc2\x19b\x03\x8c\x93:\xa6\xac\x8e.d\x08\xfb\x01\xcf\
+\x8f.b\x08\xf3\x81S\xa2\x8b(\xe0m\xa4\x86\xea\x92\
+Z\xce@\x9c\xdeE\xc0?E\x171\xa4\xf7D\x170\
+\x84W\x03{D\x171\x8b\x7f\x07\xbe\x13]\x84\xa4\xfa\
+\x94ui\xa9M\x97L{\xb6\x06\xee!\xfe\xb2\xdd0\
+\xe3\x8f+9\x13\xe5Z\x1f\xb8\x91\xf8s5\xd3x\x8c\
+\xf48H\x1by\xc9T\xb9\xf0\x92i\x83\xdc\x01\xbc/\
+\xba\x88!\x9d\x14]@\x01\xff\x00<%\xba\x88Y\x9c\
+\x06\x5c\x15]\x84\xa4z\x95\xf5\x89\xba\x8d3DH\xcf\
+\xc7]J\xfc\x8ce\x98q`%g\xa2\x1c\x0bI\x8d\
+\xc9\xa3\xcf\xd1L\xe3F\xd2\xbe\x93m\xe5\x0cQ\xb9p\
+\x86\xd80O\x90\x16V\xe4\xa4\xc9\x8f\x8d\x1cO\xf3\xf7\
+\x11|3\x05\xff\x01Ij\x97\xb2>U\xb7u\x86\xd8\
+\xf3=\xe2g.E\xc7j`\xcfjN\xc3\x9clK\
+Z\xb1\x19}~f\x1a?\xac\xec\xdd7\x873D\xe5\
+\xc2\x19bC\x1d\x0d<\x1c]DAc\xc0;\xa3\x8b\
+\x18\xe0d\x9a})\xf2\x11\xf2\xd8qCR\x05\x0c\xc4\
+\xe2~\x0f\x9c\x1e]\xc4\x10^\x01\xec\x14]D\x9f\x9d\
+\x81\xd7D\x171\x8bS\x81\xeb\xa3\x8b\x90\x14\xa7\xacK\
+Mm\xbfd\x0ai{\xa2\xb2.7\xd51>W\xcd\
+i\x18\xc9w\x88?\x1f3\x8d\xebH\x8f\x83t\x81\x97\
+L\x95\x0b/\x996\xd8#4\xf3R\xe4t\xfe\x96f\
+<\xdep \xf0\x92\xe8\x22f\xf1V\xd2\xd6_\x92:\
+\xca@\x1c\xde7\x80\x9fE\x17Q\xd0:\xc0\xdb\xa3\x8b\
+\x00>D\xb3\xfb\xac~\x8f\xfc6\x87\x96T\x81\xb2.\
+9u\xe1\x92i\xcf\x1e\xe4\xb1\xa1m\xefR\xc1\xd6\xd5\
+\x9c\x86B^0M]M\x19\x0f\x01O\xad\xec\xdd7\
+\x93\x97L\x95\x0b/\x99f`\x19\xf0\xf9\xe8\x22\x0a\xda\
+\x90\xb4B6\xc2<\xe0\x83A\xaf]\xd4\xfbI\x01!\
+I\xa5}\xd2\xee\xd2\x0c\x11`\x0b\xe0N\xe2g8E\
+\xc6}\xc0\xe6\xd5\x9c\x86\x19\xbdr\xc4z\xeb\x1a\xd7\x00\
+\xebU\xf6\xee\x9b\xcb\x19\xa2r\xe1\x0c1\x13w\x93\x9e\
+\xab\xcb\xc1\xa6\xc0\x9bj~\xcdu\x80\xf7\xd6\xfc\x9a\xc3\
+z\x0b\xa9\x89\xb7$\x01\xe5}\xda\xee\xda\x0c\x11\xd2\x9e\
+~K\x89\x9f\xe9\x14\x19+\xa8w\xa3\xdb\xb7T\xf4>\
+\xca\x1a_\xaf\xee\xad7\x9e3D\xe5\xc2\x19bFV\
+\x91vn\x18\x8f.\xa4\x80-\x81\xd7\xd7\xf4Z\x1b\x03\
+'\xd6\xf4Z\xa3x\x0086\xba\x08I\xcdb \xce\
+\xdd/\x81oE\x17Q\xd0q\xa4\xe6\x02U;\x16\xd8\
+\xa6\x86\xd7\x19\xd5\xc9\xc0-\xd1EHj\x9e\xb2.A\
+u\xf1\x92i\xcf\x0e4\xbfiuo\xbc\xb1\xa2s\xd0\
+\xb3\x15p\x7f\x03\xde\xe7t\xe3r\xd2\xfd\xcd.\xf3\x92\
+\xa9r\xe1%\xd3\x0c\xdd\x0c|$\xba\x88\x82N\xa0\xda\
+@\xf8G`\x93\x0a\x8f?\x17\xe3\xa4K\xdc+\xa3\x0b\
+\x91\xd4<\x0b\xa2\x0bh\x91\xd3H\xad\xd2\x9e\x16]\xc8\
+,\x9e\x02\xfc\x15\xf0\xe5\x0a\x8e\xbd#\xf5\xdd\xa7\x1c\xc5\
+?\x93O\x97\xa1\x1c\xec\x16]\xc0\x147\x90V\x7f\xcf\
+\xd5\x0e4\xfb\x92\x7f\xb4\x07\x81\xab\xa3\x8b\xa8JY\x97\
+\xa2\xba|\xc9\xb4\xe7%\xc4_\x12,2\xae\xa4\x9a\xab\
+\x03_k\xc0{\x9bn\xdcG\xda\x8fQy5\xa8\x1f\
+f\xbc\xaa\xa4\xf3sz\x03\xdeK\x93\xc7\xcfG?\xb5\
+C\xf3\x92i\xc6\xbe\x07\xfc(\xba\x88\x02v\xa5\xfcf\
+\xdb\xfb\x00//\xf9\x98e:\x09\xb85\xba\x08I\xcd\
+e \x96\xefm\xe4q\x8f\xea]\x94\xdbp\xfb#4\
+\xf7\xef\xd3e\xc0Y\xd1EHj\xb6\xa6\xfe\x00\xcb\xd9\
+\x95\xc0g\xa2\x8b(`\x1f\xe0\x85%\x1d\xebY\xc0\xf3\
+K:V\xd9V\x03o\x00\x9e\x88.DR\xb3\x19\x88\
+\xd5x\x0fp[t\x11\x05\xbc\xbb\x84c\x8c\x91v\x9a\
+o\xaa/\x02\xe7E\x17!\xa9\xf9\x0c\xc4j\xdcOz\
+\xfc\xa0\xe9\x0e!\xcd\xee\xe6\xe2\xf05\xc7i\xa2\xbbi\
+v\xc7\x1cI\x0db V\xe7\x1c\xe0\xb7\xd1E\x14p\
+\xd2\x1c\xbew\x01\xcdn\xe0}\x02iG\x12I\x9a\x95\
+\x81X\x9d\xd5\xa4}\x08\xc7\xa3\x0b\x99\xc5\x7f\x05\x0e\x1d\
+\xf1{_G\xf3\x9eE\xeb\xb9\x00\xf8Bt\x11\x92\xf2\
+a V\xeb<\xd2\xc3\xe0Mw\xfc\x08\xdf\xb3\x01s\
+\x9b]Vi5i\xbb\xab\xd5\xd1\x85H\xca\x87\x81X\
+\xbd\xe3H\xf7\x14\x9b\xec\xcf\x81\xbd\x86\xfc\x9e\xb7\x93:\
+z4\xd1Y\xe4q\xb9ZR\x83\x18\x88\xd5\xbb\x1d8\
+%\xba\x88Y\x8c1\xdc\xe2\x93-HA\xdfDw\x90\
+\x9e\xb1\x94\xa4\xa1\x18\x88\xf5\xf8\x04pmt\x11\xb3x\
+\x19\xf0\xf4\x82_{\x04\xb0\xb0\xc2Z\xe6\xe2x\xe0\x9e\
+\xe8\x22$\xe5\xc7@\xac\xc7c\xa4K\x8cM6\x9f\xb4\
+\xcb}\x11GTY\xc8\x1c\xfc\x0a\xf8Rt\x11\x92\xf2\
+d \xd6\xe7\xfb\xc0\x0f\xa2\x8b\x98\xc5k\x80\xcdf\xf9\
+\x9a%\xa4.7M\xb3\x8a\xb4\xb5S\xd3W\xf5Jj\
+(\x03\xb1^o\x03\x1e\x8f.b\x06\x9b\x90Bq&\
+\xb3\xfdy\x94O\x03K\xa3\x8b\x90\x94/\x03\xb1^\xd7\
+\x90\xee'6\xd9\x913\xfc\xd9\xba4sG\x8b\xdb\x80\
+\x93\xa3\x8b\x90\x947\x03\xb1~\x1f\x00\xfe\x10]\xc4\x0c\
+\xf6\x00\x0e\x98\xe6\xcf\xfe\x92f\xee{y\x0ci\xbfC\
+I\x1a\xd9\x82\xe8\x02:\xe8\x01\xd2#\x0e\xff3\xba\x90\
+\x19\xbc\x96\xd4\xe9e\xaa\xbf\xad\xbb\x90\x02~\x0a|=\
+\xba\x88\x8e\xba\x85\xb4`\xac)\x1e(\xe98w\x01\xd7\
+\x97t\xac6j\xf2\x07\xfa9+k\x17\xe5&\xce\x1c\
+\x9aj\x0c\xf8\x05\xf1;_O7V\xb0\xf6\x87\xa5\xed\
+I[(E\xd7\xd6?V2|C\x01\xc1r\xca9\
+\xffK\xea.\x5c\x9d\xb3\x98r\xfe\xae>T\xe4\xc5\xbc\
+d\x1ac\x9c\xf4\x18FS[\x8bm\x09<{\xca\xef\
+\xbd\x8a\xf4hF\x93\x9cN\xda\xfcW\x92\xe6\xcc@\x8c\
+s>\xf0O\xd1E\xcc\xe0\xa5S\xfe\xbbi\x8bin\
+\x06\xde\x1f]\x84\xa4\xf60\x10c\x9dHs\x17\x83\xbc\
+\x98\x89\x19\xe1\xd3\x81\xfd\x02k\x19\xe4m\xc0\x83\xd1E\
+Hj\x0f\x031\xd6\x1d4w?\xc1m\x98Xm\xfa\
+\xb2\xc8B\x06\xf81\xf0\x9d\xe8\x22$\xb5\x8b\x81\x18\xef\
+\xd3\xc0\xe5\xd1EL\xe3\x85k~=<\xb4\x8a\xc9\x1e\
+\x07\xde\x1c]\x84\xa4\xf61\x10\xe3=A\xdaH\xb8\x89\
+^\x04<\x15\xd8?\xba\x90>\x1f\x01\xae\x8e.BR\
+\xfb\x18\x88\xcd\xf0\x13\xe0\x7fG\x171\xc0\x12\xe0\x1d\xa4\
+\xc7D\x9a`9\xcd\xdfJKR\xa6\x0c\xc4\xe68\x06\
+x4\xba\x88)\xe6\x01GE\x17\xd1\xe7-\xc0#\xd1\
+EHj'\x03\xb19\xae\x07>\x1a]D\x83\xfd\x10\
+\xf8\xbf\xd1EHj/\x03\xb1YN\x01n\x8c.\xa2\
+\x81\x1e\x01\xde\x14]\x84\xa4v3\x10\x9b\xe5\x11\xe0\x84\
+\xe8\x22\x1a\xe8C\xd8[RR\xc5\x0c\xc4\xe6\xf9:\xf0\
+\x9f\xd1E4\xc8u\xc0i\xd1EHj?\x03\xb1\x99\
+\xfe\x81\xf48\x86\xe0\xad4o\xb1\x91\xa4\x162\x10\x9b\
+\xe9r\xe0\xf3\xd1E4\xc0w\x81\x1fD\x17!\xa9\x1b\
+\x0c\xc4\xe6z\x17i\x1b\xa6\xaez\x1886\xba\x08I\
+\xdda 6\xd7\xdd\xc0\xc9\xd1E\x04z\x1f\xe9A|\
+I\xaa\x85\x81\xd8lg\x01\x97D\x17\x11\xe0\x1a\xe0\x13\
+\xd1EH\xea\x16\x03\xb1\xd9V\x91\x16\xd8\x8cG\x17R\
+\xb3\xa3\x80\xc7\xa2\x8b\x90\xd4-\x06b\xf3\xfd\x12\xf8v\
+t\x115\xfa:\xf0\x1f\xd1EH\xea\x1e\x031\x0f\xc7\
+\x00\x0fE\x17Q\x83\x07\x80\xe3\xa2\x8b\x90\xd4M\x06b\
+\x1en&m{\xd4v\xef\x01n\x89.BR7\x19\
+\x88\xf9\xf8\x08pCt\x11\x15Z\x06\x9c\x11]\x84\xa4\
+\xee2\x10\xf3\xf1(\xed}.o\x9c\xb4xhet\
+!\x92\xba\xcb@\xcc\xcb\xf7\x80\x1fE\x17Q\x81/\x03\
+?\x8b.BR\xb7\x19\x88\xf9y;\xed\x9aI\xdd\x8f\
+;|Hj\x00\x031?W\x00gF\x17Q\xa2\xef\
+\x00\xb7F\x17!I\x06b\x9e\xfe=\xba\x80\x12\xfd5\
+\xf0G\xd1EH\x92\x81\x98\x9f\xf5h\xd7\xfe\x80\xeb\x03\
+\x9f\x89.B\x92\x0c\xc4\xfc\x9c\x0c\xec\x1a]D\xc9\x9e\
+\x0f\x1c\x1e]\x84\xa4n3\x10\xf3\xb27\xa9kM\x1b\
+}\x1c\xd88\xba\x08I\xdde \xe6c\x1ei\xf7\x8b\
+u\xa2\x0b\xa9\xc8\x0e\xa4N5\x92\x14\xc2@\xcc\xc7\xd1\
+\xc0\xa1\xd1ET\xech`\x9f\xe8\x22$u\x93\x81\x98\
+\x87\xc5\xc0{\xa3\x8b\xa8\xc1\x02R\xfb\xb6\xb1\xe8B$\
+u\x8f\x81\x98\x873\xe8\xce\xfd\xb5g\x02GD\x17!\
+\xa9{\x0c\xc4\xe6{\x15\xf0\xa7\xd1E\xd4\xec\xa3\xc0\xa2\
+\xe8\x22$u\x8b\x81\xd8l[\x02\x1f\x8b.\x22\xc0\x96\
+\xc0\xfb\xa3\x8b\x90\xd4-\x06b\xb3}\x02\xd8:\xba\x88\
+ \xaf\x07\x0e\x89.BRw\x18\x88\xcdu\x18\xf0\xca\
+\xe8\x22\x02\xcd#u\xb0\x99\x1f]\x88\xa4n0\x10\x9b\
+iC\xe0\xf3\xb8\xdar\x7f\xe0\x8d\xd1EH\xea\x06\x03\
+\xb1\x99\xde\x0f\xec\x18]DC\x9c\x02l\x1b]\x84\xa4\
+\xf63\x10\x9b\xe7\x00\xe0\xad\xd1E4\xc8\xa6\xc0\x87\xa3\
+\x8b\x90\xd4~\x06b\xb3,\x00\xce\xc6\xfbfS\xfd\x0d\
+\xe9\x9e\xaa$U\xc6@l\x96cI\xf7\xcd\xb4\xb6\xcf\
+\x92\xb6\xbe\x92\xa4J\x18\x88\xcd\xb1\x13\xf0\x8f\xd1E4\
+\xd8\xce\xa4^\xa7\x92T\x891`\xbc\xa4cm\x05\xac\
+(\xe9X]3\x06\xfc\x04xNt!}\xbeO\xf3\
+:\xe4<\x04\xec\x0e\xfc>\xba\x90\xcc-'\xf5\xc7\x9d\
+\xab\xfb\x81U%\x1c\xa7,o\x04\xbeU\xc2q>\x08\
+\x1cU\xc2q\xda\xea<\xe0\xbf\xd7\xf4Z\x8bI\x7f_\
+\xe7\xeaa`\xa3\xd9\xbehA\x09/\xa4\xb9{-\xcd\
+\x0aC\x80\xe3\x80g\x01\x9bD\x17\xd2g#R\xb3\x82\
+\x97D\x17\x22 -xj\x92uK:\xce\x06\xc0\xe6\
+%\x1d\xab\x8d\x9a\xf43\xa1T^2\x8d\xf7$\xe0\xb4\
+\xe8\x22\xa6\xb8\x06\xb8\x0a87\xba\x90\x01^L\xf3f\
+\xae\x92Z\xc0@\x8c\xf7)\x9a\xf7i\xf4\x07k~\xfd\
+\xcf\xd0*\xa6w\x06\x05.\x7fH\xd20\x0c\xc4X/\
+\x02^\x16]\xc4\x00\xff\xba\xe6\xd7\xa6\x06\xe2b\xe0\xf8\
+\xe8\x22$\xb5\x8b\x81\x18gS\xe0\xac\xe8\x22\x06\xb8\x97\
+\x89 <\x9f\xb4\x90\xa5\x89\xdeAZy*I\xa50\
+\x10\xe3\x9c\x02<9\xba\x88\x01\xbe\x05<\xb6\xe6\x7f\xaf\
+$\xad(k\xa2\xf5H\xcd\xbf%\xa9\x14\x06b\x8cg\
+\xd0\xdce\xdd\xff<\xe5\xbf\x7f\x1cRE1\xcf\x03^\
+\x1e]\x84\xa4v0\x10\xeb\xb7.\xf09\x9ay\xeeo\
+\x04~9\xe5\xf7\xbeMy\xcf\xaaV\xe1\x13\xc0\xc2\xe8\
+\x22$\xe5\xaf\x89?\x94\xdb\xee\x04`\x8f\xe8\x22\xa6\xf1\
+e\xd6\x0e\xbf\x1b\x80\x0b\x02j)\xeaI\xc0\xc9\xd1E\
+H\xca\x9f\x81X\xaf]\x80wF\x171\x83\xafN\xf3\
+\xfb\x9f\xad\xb5\x8a\xe1\xbd\x19\xd87\xba\x08Iy3\x10\
+\xeb3\x0f8\x07X?\xba\x90i\xfc\x1a\xb8z\x9a?\
+\xfb\x1apk\x8d\xb5\x0ck>i\x81M\xd77T\x96\
+4\x07\x06b}\xde\x00\xfc\x97\xe8\x22fp\xe6\x0c\x7f\
+\xf6\x18i\xd3\xe2&{\x06\xa9\x05\x9e$\x8d\xc4@\xac\
+\xc7\xb6\xa4\xc7,\x9a\xea2\xa6\xbf\x5c\xda\xf3\x05\xe0\xba\
+\x1aj\x99\x8b\x8f\x00\x8b\xa2\x8b\x90\x94'\x03\xb1\x1eg\
+\x02\x9bE\x171\x83\xe3\x81\xd5\xb3|\xcdJ\xe0\xdd5\
+\xd42\x17[\xd0\xec\x0f\x1e\x92\x1a\xcc@\xac\xde\xe1\xc0\
+_F\x171\x83\x9f3\xd1\xaam6\xdf\x04.\xaa\xb0\
+\x962\x1c\x09\x1c\x1a]\x84\xa4\xfc\x18\x88\xd5ZHz\
+N\xae\xc9\x86Y\xf5:\x0e\x9cXU!%\x99\x07\x9c\
+\x8d[\x9bI\x1a\x92\x81X\xad\x8f\x02\xdbG\x171\x83\
+\xef0|k\xb6\x1f\x01\xffQA-e\xda\x0bxS\
+t\x11\x92\xf22Fy]H\xb6\x02V\x94t\xac6\
+x6)8\x9a\xfa(\xc0\x13\xc0\x9eL\xff\xa8\xc5L\
+\x0e&\x05iS\xdf\x1b\xa4\xdd\xdcw\xa5\xd9\x8f\x8bD\
+YN\xda1d\xae\xfe\x02\xb8\xbc\x84\xe3\x94\xe5\x0e\xe0\
+\xc1\x12\x8e\xb3%v?\x9a\xc9\xa3\xc0\x1fjz\xad\xc5\
+\xa4\xbf\xafs\xf50\x05\xb7\x8c\x1b/i\xb8\xbao\xc2\
+z\xc0\x15\x94wn\xab\x18s}\xd8\xfe\xbb\x0dx\x0f\
+\xb3\x8d\xaf\xcd\xf1=\xb6\xd5r\xca9\xbfK\xea.\x5c\
+\x9d\xb3\x98r\xfe\xae\x16\xde\xb5\xa7\xac\x1f>\x06\xe2\x84\
+S\x88\x0f\x83\x99\xc6\xc3\xc0\x0es|\x8f\xbb\x90V\x9e\
+F\xbf\x97\xd9\xc6s\xe7\xf8>\xdb\xc8@T.j\x0d\
+D\xef!\x96o/\xe0\xd8\xe8\x22f\xf11\xe0\xe69\
+\x1e\xe3j\xe0K%\xd4R\xb5\xcf\x92f\xec\x924\xab\
+\xb2>\x89;CL\x1f0\xce%~V4\xd3\xb8\x93\
+\xf2\xee\x8flO\xfa\xe4\x15\xfd\x9ef\x1b'\x95\xf4~\
+\xdb\xc2\x19\xa2r\xe1\x0c1co\xa5\xf9\xcf\xc0}\x10\
+\xb8\xaf\xa4c\xdd\xc2\xcc-\xdf\x9a\xe2$`\xc7\xe8\x22\
+$5_Y\x9f\xc2\xbb>C|\x0a\xf0\x00\xf1\xb3\xa1\
+\x99\xc6\x0d\x94\x7f\xf9ps\xe0\xee\x06\xbc\xb7\xd9F\xd1\
+\xe6\x03]\xe0\x0cQ\xb9p\x86\x98\xa93\x80\x8d\xa3\x8b\
+\x98\xc5\xbbI\x8d\xba\xcbt\x0f\xe9y\xcb\xa6{\x01\xe9\
+1\x01I\x9aVY\x9f\xc0\xbb<C|%\xf13\xa0\
+\xd9\xc6%T\xf7\x01h\x03\xd2\x22\x9d\xe8\xf78\xdb\xb8\
+\x91\x82\xcf\x22\xb5\x9c3D\xe5\xc2\x19bf\xb6\x04N\
+\x8f.\xa2\x80\x22\x0d\xbcG\xf5\x08\xe9\xded\xd3=\x05\
+\x17\xd8H\x9aAY\x9f\xbe\xbb:C\xfc2\xf13\x9f\
+\xd9\xc6\xcf*{\xf7\x13\xd6\x01\xae\x0dz\x7f\xc3\x8c\xc7\
+\x80\xdd*:\x07\xb9p\x86\xa8\x5c8C\xcc\xc8a\xc0\
+\xab\xa2\x8b\x98\xc58\xc35\xf0\x1eU\x0e\xdbC\x01\xac\
+\x0b\x9cE\xb3\xdb\xceI\x0a` \x8enC\xe0s4\
+\xff\x07\xeb\xb7\x81_\xd7\xf4Z9l\x0f\x05\xf0'\xc0\
+_E\x17!\xa9Y\x0c\xc4\xd1\xbd\x0fxzt\x11\xb3\
+x\x02xO\x8d\xaf7N\xf3\xb7\x87\xea9\x9dfo\
+\xda,\xa9f\x06\xe2h\xf6!=\x84\xdft\x9f\x03\xae\
+\xaa\xf95s\xd8\x1e\x0a`\x1b\xe0\xbd\xd1EHj\x96\
+\xb2\x16+teQ\xcd\x02\xe0B\xe2\x17\x87\xcc6\x1e\
+\x04\x9eT\xd19\x98\xcd\x81\xa4\x15\xad\xd1\xe7`\xb6\xb1\
+\x0a8\xa8\xa2s\xd0d.\xaaQ.\x5cT\xd3p\xc7\
+\x00\xfbG\x17Q\xc0\xe9\xc0mA\xaf}>\xf0\xbf\x82\
+^{\x18\xf3H\x0d\x15\xfcw \x09(\xef\xd3v\x17\
+f\x88O#\xcd\xbc\xa2g6\xb3\x8d;\x81M+:\
+\x07E\xedL\x1e\xdbC\x8d\x03\xaf\xaf\xe8\x1c4\x953\
+D\xe5\xc2\x19bC\x8d\x91\xee\xc9\xe5\xd0\xe9\xe4\x03\xa4\
+\x1d\xe3#]C\x1e\xdbC\x01|\x08\xd8*\xba\x08I\
+\xf1\xca\xfa\x94\xdd\xf6\x19\xe2k\x89\x9f\xc9\x14\x19U4\
+\xf0\x1e\xd5v\xe4\xb1=\xd48pNE\xe7\xa0\x89\x9c\
+!*\x17\xce\x10\x1bh\x11\xf0\xe1\xe8\x22\x0az\x17\xe5\
+7\xf0\x1e\xd5\x1f\xc8c{(\x80\xd7\x00\xcf\x8a.B\
+R\xac\xb2>a\xb7y\x86\xf8M\xe2g0EF\x95\
+\x0d\xbcG\x95\xcb\xf6P\xe3\xc0e\xa4\x16tm\xe7\x0c\
+Q\xb9p\x86\xd80/\x02\xfeGt\x11\x05\xbd\x83\xea\
+\x1ax\x8f*\x97\xed\xa1\x00\xf6\x04\xde\x1c]\x84\xa48\
+e}\xban\xe3\x0cq\x13\xe0\xf7\xc4\xcf\x5c\x8a\x8c:\
+\x1ax\x8f*\x97\xed\xa1\xc6I\x8b\x91\xb6\xaf\xe644\
+\x863D\xe5\xc2\x19b\x83\x9c\x02<9\xba\x88\x02\xc6\
+\xa9\xa7\x81\xf7\xa8r\xd9\x1e\x0a\xd2\x87\xa0\x1c\xb6\xf3\x92\
+T\x81\xb2>Y\xb7m\x86x0\xa9\x17h\xf4\x8c\xa5\
+\xc8\xf8FE\xe7\xa0L\xb9l\x0f\xd5\x1b/\xaa\xe64\
+4\x823D\xe5\xc2\x19b\x03\xacKZ\x86??\xba\
+\x90\x02r\xd9v)\x97:{>\x09\xac\x1f]\x84\xa4\
+\xfa\x18\x88\x83\xbd\x13\xd8#\xba\x88\x82>G\x9ay\xe5\
+\xe0\x9b\xa4>\xb09\xf8#\xd2\x22%I\x1dR\xd6%\
+\xa6\xb6\x5c2\xdd\x85t\xcf+\xfa\x92]\x91\xf1\x00q\
+\x0d\xbcG\xf5\xdf\x88?oE\xc7\xa3\xa4\x16tm\xe3\
+%S\xe5\xc2K\xa6\x81\xe6\x01_ \x9fKe\x1f#\
+\xae\x81\xf7\xa8~\x04\xfc$\xba\x88\x82\xd6\x03>\x15]\
+\x84\xa4\xfa\x94\xf5i\xba\x0d3\xc4\xa3\x88\x9f\x95\x14\x1d\
+w\x10\xdf\xc0{T\xb9l\x0f\xd5\x1b/\xa9\xe64\x84\
+q\x86\xa8\x5c8C\x0c\xb2-\xe91\x8b\x5c\xbc\x9f\xf8\
+\x06\xde\xa3\xcae{\xa8\x9eO\x00\x1bG\x17!\xa9Z\
+\x06\xe2\x84\xcf\x00\x9bE\x17Q\xd0r\xd2b\x9a\x9c\x9d\
+@z\xac%\x07O&\xaf\x15\xb2\x92F` &/\
+\x05^\x1c]\xc4\x10N\xa29\x0d\xbcG\x95\xd3\xf6P\
+\x00o\x07\xf6\x8e.BR\xb5\xca\xba\xcf\x92\xeb=\xc4\
+\x85\xe4\xd3Vl\x1cXJ{>\xc8\xe4\xb4=\xd48\
+\xf0\x0b\xd2\xbe\x98\xb9\xf3\x1e\xa2r\xe1=\xc4\x9a\x9dF\
+^\xbd+\x9b\xd8\xc0{T9m\x0f\x05\xf0L\xe0o\
+\xa2\x8b\x90T\x9d\xb2>=\xe78C\xfc\x13\xf2Z\xed\
+\xf8\xd3jNC\xa8\xcd\x81\xbb\x88?\xb7E\xc7\xedk\
+j\xce\x993D\xe5\xc2\x19bM\xd6\x03\xce\x22\x9fK\
+`\xe3\xc0\xb1\xd1ET\xe0\x1e\xd2\xf3\x94\xb9\xd8\x1a\xf8\
+@t\x11\x92\xaaQ\xd6'\xe7\xdcf\x88\x1f$~\xb6\
+1\xcc\xf8z5\xa7\xa1\x116\x00n\x22\xfe\x1c\x17\x1d\
+\xabH\xcd\xdfs\xe5\x0cQ\xb9\xa8u\x86HI/6\
+N^\x81\xb8\x17\xf08\xf1?X\x8b\x8e\xc7I\xbd5\
+\xdb,\xa7\xa6\x08\xe3\xc0\x05\xe4\xd1\xfc}\x10\x03Q\xb9\
+\xf0\x92i\xc5\xe6\x01g\x93\xb6#\xca\xc5\xd9\xc0u\xd1\
+ET\xec\xf3\xc0U\xd1E\x0ca\x09\xf0\x86\xe8\x22$\
+\x95\xab\xacO\xcc\xb9\xcc\x10\x8f&~v1\xcc\xc8\xb1\
+\x81\xf7\xa8^A\xfc\xf9\x1ef\xdcG\xeap\x94\x1bg\
+\x88\xca\x853\xc4\x0a=\x85\xd4\xf2,'96\xf0\x1e\
+UN\xdbCA\xea%{jt\x11\x92\xcaS\xd6\xa7\
+\xe5\x1cf\x88\xffB\xfc\xacb\x98\x91s\x03\xefQ\xe5\
+\xb4=\xd48\xe9\xb1\x9d\xe7Tr&\xaa\xe3\x0cQ\xb9\
+p\x86X\x91\xbf\x06\xfe,\xba\x88!\xbd\x8f|\x1bx\
+\x8f*\xa7\xed\xa1 =\xb6s\x06y\xdd\x93\x964\x8d\
+\xb2>)7y\x86\xb8%\xe9\x81\xea\xe8\xd9\xc40\xe3\
+z`\xdd*NF\x06r\xdb\x1ej\x9c\xd4A(\x17\
+\xce\x10\x95\x0bg\x88\x158\x9d\xf4@uNN$=\
+n\xd1E\xb9m\x0f\x05\xf0\x1e\xe0\xa9\xd1EH\x9a\x9b\
+\xb2>!7u\x86\xf8\x1c\xf2\x9bm\xb4\xa9\x81\xf7\xa8\
+v\x06V\x12\xff\xff\xc50\xe3\xbb\x95\x9c\x89\xf29C\
+T.j\x9d!.(\xb7\xf6\xc6\x19#-\xe5\xcf\xe9\
+\x9e\x14\xa4.:mi\xe0=\xaakH-\xd2\x9e\x19\
+]\xc8\x106\x05v\x01\xae\x8e.D\xd2h\xca\xfat\
+\xdc\xd4\x19\xa2\xa4\xc9\x9c!*\x17\xdeC\x94$\xa9n\
+\x06\xa2$I\x18\x88\x92$\x01\x06\xa2$I@\xfbW\
+\x99J\xaa\xce\x89\xc0\x8a\xe8\x22\xfa|\x11\xf8M\x09\xc7\
+y\x19\xf0\xbc\x12\x8e\xd3V\xd7\x01\xa7E\x17Q\x15W\
+\x99J\xddR\xd6*\xd3\xa6\x8dW\x95t~No\xc0\
+{i\xf2\xf8\xf9\xe8\xa7vh\xae2\x95$\xa9n\x06\
+\xa2$I\x18\x88\x92$\x01\x06\xa2$I\x80\x81(I\
+\x12` J\x92\x04\x18\x88\x92$\x01\x06\xa2$I\x80\
+\x81(I\x12` J\x92\x04\x18\x88\x92$\x01\x06\xa2\
+$I\x80\x81(I\x12` J\x92\x04\x18\x88\x92$\
+\x01\x06\xa2$I\x00,\x88.@R\xb6>\x0d\xdc\x12\
+]D\x9f\x8bK:\xce\xf7\x81\xdbK:V\x1b\xdd\x1c\
+]@\x95\xca\xdaEyQ\xdd\x85K\x1a\xc9r\xca\xf9\
+7\xbf\xa4\xee\xc2\xd59\x8b)\xe7\xef\xeaCE^\xcc\
+K\xa6\x92$a J\x92\x04\x18\x88\x92$\x01\x06\xa2\
+$I\x80\x81(I\x12` J\x92\x04\x18\x88\x92$\
+\x01\x06\xa2$I\x80\x81(I\x12` J\x92\x04\x18\
+\x88\x92$\x01\x06\xa2$I\x80\x81(I\x12` J\
+\x92\x04\x18\x88\x92$\x01\x06\xa2$I\x80\x81(I\x12\
+` J\x92\x04\x18\x88\x92$\x01\x06\xa2$I\x80\x81\
+(I\x12` J\x92\x04\x18\x88\x92$\x01\x06\xa2$\
+I\x80\x81(I\x12` J\x92\x04\x18\x88\x92$\x01\
+\x06\xa2$I\x80\x81(I\x12` J\x92\x04\x18\x88\
+\x92$\x01\x06\xa2$I\x80\x81(I\x12` J\x92\
+\x04\x18\x88\x92$\x01\x06\xa2$I\x80\x81(I\x12`\
+ J\x92\x04\x18\x88\x92$\x01\x06\xa2$I\x80\x81(\
+I\x12` J\x92\x04\x18\x88\x92$\x01\xb0 \xba\x00\
+I\xd9z\x1e\xb0ct\x11j\xb5\xadJ:\xcex\x91\
+/2\x10%\x8d\xea\xd4\xe8\x02\xa4\x82\x1e*\xf2E^\
+2\x95$\xb5\xdd\xbdE\xbe\xc8@\x94$\xb5\xdd\xb5E\
+\xbe\xc8@\x94$\xb5\xdd\xa5E\xbe\xc8@\x94$\xb5\xdd\
+O\x8a|\x91\x81(Ij\xb3\xbb\x81_\x16\xf9B\x03\
+Q\x92\xd4f_\x03\x1e+\xf2\x85c\x14|>\xa3\x80\
+\xaf\x00\xbf\x01.&]\xaf}\xb0\xa4\xe3J*\xd7\x0a\
+`\xcb\xe8\x22\xa4\x1a\xac\x04v\x01n(\xf2\xc5e\x06\
+b\xbf\xd5\xa4U=\x17\x03K\x81\x8b\xd6\xfczg\x05\
+\xaf%\xa9\xb8\xf5\x81\x87I\xff\xf6\xa5\xb6\xfb,\xf0\xf7\
+E\xbf\xb8\xaa@\x9c\xce\xcdL\x84d\xef\xd7B\xc9-\
+\xa9\x14\xf3I\x97\x8f\xe6G\x17\x22U\xecv`7\xe0\
+\x9e\xa2\xdfPw \x0er\x0f\x13\x01\xd9\x0b\xc9\xab\x80\
+'\x22\x8b\x92Z\xec\x0f\xc0\xb6\xd1EH\x15Z\x0d\xbc\
+\x10\xf8\xb7a\xbe\xa9\x09\x818\xc8#\xc0eL\xbe\xdc\
+z\xe9\x9a\xdf\x9747\xcb\x81\xc5\xd1EH\x15z\x07\
+p\xda\xb0\xdf\xd4\xd4@\x1cd\x15i\xe6\xd8\x7f\xb9\xf5\
+\x22\x86\x98\x0eK\x02\x0cD\xb5\xdb\x87\x80\x13G\xf9\xc6\
+\x9c\x02q:72\xf9r\xeb\xc5\xc0M\xa1\x15I\xcd\
+f \xaa\x8d\x9e\x00\x8e\x05>9\xea\x01\xc6H\xd7Z\
+\xdb\xb6\xe2l\x05\x93/\xb7^LZ\xf5\xba*\xb2(\
+\xa9!\x0cD\xb5\xcd\x0d\xc0\xab)\xf8\x00\xfet\xc6H\
+]\xc0\x17\x96QQ\xc3=D\xba\x0f\xd9\x7f\xb9\xf5r\
+\x0a>\xb0)\xb5\x88\x81\xa8\xb6\xb8L(\x0a\x10\x00\x00\
+\x05\x87IDAT\x1f\xf88\xf0aJXc2\x06\
+\x5c\x02\xec=\xd7\x03ej%p%k?\x0ar_\
+dQR\xc5\x0cD\xe5\xeeRR3\x98s(q\x1d\
+\xc9\x18\xe9z\xeb[\xca:`\x0b\x8c\x93\xa6\xdf\xfd\x97\
+[\x97\x92\x96\xaaKmPV \xfe\x96\xf4\x09]\xaa\
+\xda\xdd\xa4\xf5\x22\xcb\x80\x9f\x02\xbf\xaf\xe2E\xc6\x80\xbd\
+H\xb3\xc4\xb6\xddG,\xdb=\xc0\x15\xc0\x85}\xe3J\
+\xd2=X)'e\x05\xe2\x01\xa4\x7f\x07R+\xf4B\
+\xf0\x1b\xc0\xcb#\x0b\xc9\xd4\x03\xa4\xd9c\x7fc\x81e\
+\xa4K\xb1RS\x19\x88\xd2\x00\xbd@\x5c\x04\x9c\x0f<\
+5\xb0\x96\xb6x\x9c\xb4X\xa7\xffr\xeb%\xa4\xf0\x94\
+\x9a\xc0@\x94\x06X\xb0\xe6\xd7\x15\xc0s\x81\x1f\x03;\
+\xc6\x95\xd3\x0a\xeb\x02\xfb\xaf\x19=\xab\x81\xebX\xfbQ\
+\x90;j\xafN\x924\xd0\xd4\xfb\x86\x0b\x81\x8f\x02G\
+\x00\xeb\xd4_N\xe7\xdc\xc2\xda}\x5c\xaf\x0f\xadH]\
+\xe0\x0cQ\x1a`\xba\x854O\x05\x0e\x07\x0e#\xcdt\
+\xb6\xa9\xad\x22\xdd\xcb\xe4\xcb\xad\x17\x93\x16\xef\xd8\xec\x5c\
+e1\x10\xa5\x01\x8a\xae,\xdd\x1c\xd8\x03X\xd27v\
+\x05\xe6UT\x97&[I\xea\xb4\xd3\xbf\xc2\xf5bR\
+\xb3\x01iX\x06\xa24\xc0\x5c\x1e\xb5\xd8\x04\xd8\x07\xd8\
+\x9d\x89\xb0\xdc\x1f\xd8\xa0\x84\xbaT\xcc\xadL\x0e\xc9\xdf\
+\x92\xf6\x00\x93fb J\x03\x94\xfd\xec\xe1\x02`\x17\
+R8\xf6\x82\xf2\x10\xd2*V\xd5\xa3\x17\x92\xcb\x98x\
+n\xf2\x0a\xf2o\xe2\xae\xf2\x18\x88\xd2\x00u=\x8c\xbf\
+\x1d\x93/\xb7\xee\x8e\xabY\xebt\x1f\xe9Q\x90\xdeL\
+r\x19i\xbf\xc9\xc7#\x8bR\x18\x03Q\x1a \xb2;\
+\xcdf\xc0\x9eL\x0e\xca]\x80\xf9\x815u\xc9\xe3\xa4\
+GA\xfa/\xb9^\x04<\x1cY\x94ja J\x03\
+4\xad]\xdb\xba\xc0NL\x0e\xc9\xfd\x80\x0d#\x8b\xea\
+\x90'\x80k\x98|\xb9\xf5\xd7\xc0\x9d\x91E\xa9t\x06\
+\xa24@\xd3\x02q\x90\xf9\xa4\x15\xad\xfd\x8bw\x0e\x02\
+\xb6\x8e,\xaac\xfa\x17\xef\xf4\xc2rYhE\x9a\x0b\
+\x03Q\x1a \x87@\x9cN\xef\xbed\x7fP\xeeF\xde\
+\xef)'\xf7\x92B\xd1f\xe7\xf91\x10\xa5\x01\xda\x16\
+\x1e\x0bI\xbbw\xf4/\xde\xd9\x13X/\xb2\xa8\x0ey\
+\x10\xb8\x9a\xb5w\x05\x99\xf3\xc6\x9d*\x95\x81(\x0d\xd0\
+\xb6@\x1cd\x1d`g&\xdf\x97\xdc\x17\xd8(\xb2\xa8\
+\x0e\xe9\xdd\x97\xec\xbf\xdcz.pWdQ\x1dg \
+J\x03t!\x10\xa73\xf5Q\x90\x03\x80'\x85V\xd4\
+-S\x9b\x0a\x5c\xb0\xe6\xf7T=\x03Q\x1a\xa0\xcb\x81\
+8\x88-\xeab\xb9\x09s=\x0cDi\x00\x03qv\
+\x83Z\xd4-\x01\xd6\x8f,\xaaC\x1e\x00.e\xf2\xa3\
+ \x17\x00\x8fF\x16\x959\x03Q\x1a\xc0@\x1c\xcd\xa0\
+\x16u\x87\x02[F\x16\xd5!6;\x9f\x1b\x03Q\x1a\
+\xc0@,\x97-\xeab\xd9\xec\xbc\x18\x03Q\x1a\xc0@\
+\xac\xde\xa0\xfb\x92\xb6\xa8\xab\xcf\xadL\xbe\xdcj\xb3s\
+\x03Q\x1a\xc8@\x8ca\x8b\xbaX]ovn J\
+\x03\x18\x88\xcd\xd1\xbb/\xd9\xbfx\xe7``\xab\xc8\xa2\
+:d\xd0}\xc9\xb66;7\x10\xa5\x01\x0c\xc4\xe6\xb3\
+E]\x9cU\xc0\x8dL\xbe\xdc\xda\x86f\xe7\x06\xa24\
+\x80?T\xf34\xa8E\xdd^\xa4K\xb1\xaa\xde\xa0f\
+\xe79\xdd\x974\x10\xa5\x01\x0c\xc4\xf6\xb0E]\xacA\
+\xcd\xce\xaf\x22\xcd2\x9b\xc6@\x94\x060\x10\xdbo\xea\
+\xa3 \x07\x02\xdb\x84V\xd4\x1d\x836anB\xb3s\
+\x03Q\x1a\xc0@\xec\xa6\xedX\xbb\xf3\x8e-\xea\xea1\
+\xa8\xd9\xf9y\xc0\x8a\x1ak0\x10\xa5\x01\x0cD\xf5l\
+\x0a\xec\x8d-\xea\xa2Lm*\xb0\x0c\xb8\xbe\xa2\xd72\
+\x10\xa5\x01\x0cD\xcdd\xea}\xc9\xddI\xcfK\xda\xa2\
+\xae\x1eU5;7\x10\xa5\x01\x0cD\x8d\xc2\x16uq\
+\xcahvn J\x03\x18\x88*\x8b[g\xc5\x99\xda\
+T`\x19\xa9\xa9\xc0\xdd\xd3|\xbd\x81(\x0d` \xaa\
+J\x1b\x93\xba\xef\xf4\x07\xe5\xfe\xc0\x06\x91Eu\xc8\xd4\
+\xfb\x92\xe7\x03\xb7a J\x03\x19\x88\xaa\xdb:\xa4K\
+\xac\xfbN\x19\x9bE\x16\xd5!7\x03[SN\x13\x07\
+\x03Q\xadb \xaa)\xfa\xefK\xf6V\xba\xda\xa2\xae\
+\xd9\x0cD\xb5\x8a?l\xd4d\x9b\x01{b\x8b\xba\xa6\
+2\x10\xd5*\x06\xa2r3h\xeb,[\xd4\xc50\x10\
+\xd5*\x06\xa2\xda`>i\x91H\xff\xe2\x1d[\xd4U\
+\xcf@T\xab\x18\x88j\xb3A-\xea\xbc/Y\x1e\x03\
+Q\xad\xe2\x0f\x06uM\xafE]\xff\xe2\x9d\x03\x80\xf5\
+\x22\x8b\xca\x94\x81\xa8V1\x10\xa5\xc1-\xea\xf6\x07\xb6\
+\x88,*\x03\x06\xa2Z\xc5@\x94\xa67\xb5E\xdd\x12\
+`\xdb\xd0\x8a\x9a\xc5@T\xab\x18\x88\xd2plQ7\
+\xc1@T\xab\x18\x88\xd2\xdcm\x0a\xec\xc3D\xd7\x9d\xfd\
+H\xa1\xd9\xf6\xe7%\x0dD\xb5\x8a\x81(Uc\x01\xa9\
+\x8fk\xff\xe2\x9dC\x80E\x91E\x95lG\xe0\x86\xe8\
+\x22\xa4\xb2\x18\x88R}\xc6\x80\xa7\x91f\x90\xfb11\
+\xa3\xdc>\xb2\xa8\x11=\x01lH\xdaiCj\x05\x03\
+Q\x8a7\xb5E\xdd\x12\xd2\xecr~dQ\xb3\xf8)\
+pXt\x11R\x99\x0cD\xa9\x996\x22=/\xd9\x7f\
+_r/`\xfd\xc8\xa2\xfa\x1c\x09|1\xba\x08\xa9L\
+\x06\xa2\x94\x8fA-\xea\x0e\x22m\xe7T\xa7\xcb\xd6\xbc\
+\xb6\x97K\xd5*\x06\xa2\x94\xbf\xc5L\xcc\x22{3\xca\
+26\x00\x1e\xe4A\xe0\xd9\xb8\xbaT-d J\xed\
+\xb49k/\xde\xd9\x95\xb4\xfauT\x0f\x01\x7fF\xba\
+\x7f(IR\xb6\xd6'\xed\x02\xf2w\xc0\x99\xc0\xb9\xa4\
+\x19\xdfx\x81\xf1C\xd2\x0aY\xa9\xb5\x9c!J\xdd6\
+\x9f\xb4\xbfdo\x16\xb9'i\xdb\xac\x8d\x81\xe5\xc0%\
+\xc0WI\xf7\x0d\xa5V\xfb\xffL\x04x\xc5G\xb6\x05\
+\x96\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00;\x1d\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00 \
+\x00IDATx^\xed\xdd\x09\xd8\xb6\xe5\x9c\xf8\xf1\
+\xef$\x89\xb4\x90Tc\xc9\xd8\xc6X\xb3\xb5H\x84B\
+\xb2\x85!\xc6\x12\xa2,\xc3\xd8\x1a\xd9\xb3'\xfc\x99A\
+([v\x86\xac%\x85\x14EY\xb2\x0c\x86B\xc8R\
+\x88Jh\xfd\x1f\xbf\x9c\x0f\xaf\xb7\xf7}\x9e\xfb\xba\xef\
+k9\x97\xefy\x1c\xcf\xd1\x1c\xd3u\x9d\xe7\xef\xf79\
+/\xdd\xbf\xfb\xba\xaf\xeb<\xff\x01\x9b\x02\x0a(\xa0\x80\
+\x02\x0a4'\xf0\x0f\xcdel\xc2\x0a(\xa0\x80\x02\x0a\
+(\x80\x05\x80\x17\x81\x02\x0a(\xa0\x80\x02\x0d\x0aX\x00\
+48\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\
+\x0a(\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\
+\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0a\
+X\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\
+\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\
+\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\
+\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\
+\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\x0048\xe9\
+\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\
+\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\
+\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\x004\
+8\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a\
+(\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a\
+(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\
+\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\
+\x02\x0a(\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\
+\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\
+\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\
+\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\
+\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\
+\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\
+\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\x0048\
+\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\
+\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a(\
+\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\x00\
+48\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\
+\x0a(\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\
+\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0a\
+X\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\
+\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\
+\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\
+\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\
+\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\x0048\xe9\
+\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\
+\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\
+\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\x004\
+8\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a\
+(\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a\
+(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\
+\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\
+\x02\x0a(\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\
+\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\
+\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\
+\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\
+\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\
+\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\
+\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0aX\x0048\
+\xe9\xa6\xac\x80\x02\x0a(\xa0\x80\x05\x80\xd7\x80\x02\x0a(\
+\xa0\x80\x02\x0d\x0aX\x0048\xe9\xa6\xac\x80\x02\x0a(\
+\xa0\x80\x05\x80\xd7\x80\x02\x0a(\xa0\x80\x02\x0d\x0a\xd4T\
+\x00l\x00\x5c\x17\xb8~\xfa\xdb\x02\xb8\xf2\x1a\xfe\xd6\x03\
+j\xca;\x87\xcb\xf6\x12\xe0\xcf\xc0\x1f\x80sW\xfb\xfb\
+%pJ\xfa\xfba:&\x87\x98\x8dA\x01\x05\x14h\
+Z\xa0\xd4\x0f\xc2\x8d\x81\x1d\x81\x9d\x80m\xd2\x07\xfe\x96\
+M\xcfd9\xc9\xff\x22\x15\x03'\x02\xc7\x00\xc7\x01\xbf\
+/'|#U@\x01\x05\xea\x10(\xa5\x00X\x17\xb8\
+\x0b\xb0K\xfa\xd0\xdf\x1a\xb8\x5c\x1dS\xd0|\x16\x17\x01\
+'\xa7b\xe0(\xe03\xc0\x85\xcd\xab\x08\xa0\x80\x02\x0a\
+\x0c,\x90s\x01\x10\xb1\xdd\x0ex\x08\xf0@\xe0j\x03\
+[\xd8}\x1e\x02\xbf\x06>\x00\xbc\x078\x1e\x88\x9f\x17\
+l\x0a(\xa0\x80\x02=\x0b\xe4X\x00\x5c\x0bx\x5c\xfa\
+\xe0\xdf\xaa\xe7|\xed\xae,\x81\xd3R!p\x10\xf0\xd3\
+\xb2B7Z\x05\x14P o\x81\x9c\x0a\x80\xeb\x01\xcf\
+\x04\x1e\x0e\xc4\x83z6\x05\x96\x04\xce\x07\x0e\x05^\x0e\
+\x9c*\x8b\x02\x0a(\xa0\xc0\xe2\x029\x14\x007\x01\xf6\
+\x03\xf6\xf0w\xfd\xc5'\xb4\xf2\x1e\xe2y\x81\xf7\x01/\
+\x03\xfe\xb7\xf2\x5cMO\x01\x05\x14\x18T`\xca\x02`\
+S\xe0@`O_\xcb\x1bt\x8ek\xec<\x9e\x0bx\
+;\xf0\x0c\xe075&hN\x0a(\xa0\xc0\xd0\x02S\
+\x14\x001\xe6#\x81W\x00Q\x04\xd8\x14\x98W >\
+\xfc\xf7\x05\xde\xe6\xc3\x82\xf3\x12z\x9e\x02\x0a\xb4*0\
+v\x01\x10\xb7\xfb\xdf\x08\xdc\xbeUp\xf3\x1eD\xe0\x0b\
+\xc0>\xfe,0\x88\xad\x9d*\xa0@\xa5\x02c\x15\x00\
+1N|S{\x11p\xf9J-MkZ\x81\x0b\x80\
+\xe7\xa6;K\xbe:8\xed\x5c8\xba\x02\x0a\x14 0\
+F\x01p\xd5\xf4\x04\xf7n\x05x\x18b\xf9\x02\x9fL\
+o\x92\xfc\xb6\xfcT\xcc@\x01\x05\x14\x18N`\xe8\x02\
+`\xdb\xb4\xa8\xcb\xb5\x87K\xc1\x9e\x15\xb8\x8c\xc0O\xd2\
+\xe2Q_\xd6F\x01\x05\x14P`\xcd\x02C\x16\x00O\
+NO\xf9{\xcb\xdf\xabo\x0a\x81\xf8I \xde\x12x\
+\xed\x14\x83;\xa6\x02\x0a(\x90\xbb\xc0\x10\x05\xc0:\xc0\
+k\x80\x7f\xcf=y\xe3kB\xe0\xbf\x80\xff\xf0-\x81\
+&\xe6\xda$\x15P\xa0\x83@\xdf\x05@\xac\xe0\x17+\
+\xb6=\xa8C\x0c\x1e\xaa\xc0\xd0\x02\xef\x05\x1e\x01\xc4]\
+\x01\x9b\x02\x0a(\xa0@\xcf\x0b\xf0l\x08\x1c\x96v\xed\
+\x13W\x81\xdc\x04>\x0d\xdc\x0f\xf8Cn\x81\x19\x8f\x02\
+\x0a(0\x85@_w\x006\x07\x8e\x00n9E\x12\
+\x8e\xa9\xc0\x8c\x02'\x01\xf7\x00b\xc7A\x9b\x02\x0a(\
+\xd0\xb4@\x1f\x05\xc0\xc6\xc0\xb1\xc0\xcd\x9b\x964\xf9R\
+\x04\xbe\x06\xec\x04\x9cSJ\xc0\xc6\xa9\x80\x02\x0a\x0c!\
+\xb0h\x01\xb0>\x10\xb7Vw\x1c\x228\xfbT` \
+\x81\xcf\x01\xbb\x02\x7f\x1e\xa8\x7f\xbbU@\x01\x05\xb2\x17\
+X\xa4\x00\xb8\x1c\xf0!\xe0>\xd9gi\x80\x0a\x5cV\
+\xe0\xc3i\xad\x80\xd8a\xd0\xa6\x80\x02\x0a4'\xb0H\
+\x01p\x08\xf0\xe8\xe6\xc4L\xb8&\x81\x83\x81\xc7\xd6\x94\
+\x90\xb9(\xa0\x80\x02\xb3\x0a\xcc[\x00<\x0f\xd8\x7f\xd6\
+A<N\x81\x8c\x05\x9e\x0f\xbc0\xe3\xf8\x0cM\x01\x05\
+\x14\x18D`\x9e\x02\xe0\xae\xe9\x89\xffX\xf0\xc7\xa6@\
+\xe9\x02\x17\xa7\xe7\x01\xe2Y\x16\x9b\x02\x0a(\xd0\x8c@\
+\xd7\x02\xe0\x1a\xc0\xd7\x81\xcd\x9a\x112\xd1\x16\x04\xceL\
+\xaf\xb0\x9e\xdeB\xb2\xe6\xa8\x80\x02\x0a\x84@\x97\x02`\
+] \x9e\x9e\xbe\xbdt\x0aT(\xf0\x05\xe0N\xc0\x85\
+\x15\xe6fJ\x0a(\xa0\xc0e\x04\xba\x14\x00/\x07\xfe\
+SC\x05*\x168\x00xf\xc5\xf9\x99\x9a\x02\x0a(\
+\xf0W\x81Y\x0b\x80;\x00\xc7t\xbcc \xb3\x02\xa5\
+\x09\x5c\x92\x16\x09\x8a\x85\xadl\x0a(\xa0@\xd5\x02\xb3\
+\x14\x00\xb1\x9d\xef\xc9\xc0\x8d\xab\x9609\x05\xfe\x22\xf0\
+\xed\xf4<\x80?\x05xE(\xa0@\xd5\x02\xb3\x14\x00\
+q\xdb?n\xff\xdb\x14hE\xe0\xe9\xc0\xabZI\xd6\
+<\x15P\xa0M\x81\x95\x0a\x80\xad\x80\xef\x00Wj\x93\
+\xc7\xac\x1b\x158\x17\xb8\x11\xe0[\x01\x8d^\x00\xa6\xad\
+@\x0b\x02+\x15\x00\x1f\x05\xee\xdd\x02\x849*\xb0\x9a\
+\xc0\x07\xd3R\xc1\xc2(\xa0\x80\x02U\x0a,W\x00\xc4\
++Q\x9f\xad2k\x93R`6\x81\x1d\x80\xe3g;\
+\xd4\xa3\x14P@\x81\xb2\x04\x96+\x00\x8e\x02v.+\
+\x1d\xa3U\xa0W\x81\xc3\x81\xddz\xed\xd1\xce\x14P@\
+\x81L\x04\xd6V\x00\xdc\x1681\x93\x18\x17\x09#\xf6\
+|\xffU\xfa\xfbe\xfa\xa7\xfb\xc0/\x22\xba\xf6s7\
+\x04\xb6\x006_\xe5/\xfe\x7f\xa5\xb7[\xa5\xd5/K\
+\xcf\xc3\xf8\x15P@\x81\xbf\x13X[\x01p\x18p\xdf\
+\x02\xad\xfe\x94V+\xfc\x04\xf0I\xe0\xb4\x02s\xa8)\
+\xe4\x7fJ\xdf\xa0\xe3[\xf4N\xc0\xfa\x05&\x17[^\
+?\xa0\xc0\xb8\x0dY\x01\x05\x14XV`M\x05@\xbc\
+\xef\x1f\xefB\xaf\xf4\x80`N\xb4\xb1pK\xbc\xb6u\
+4p^N\x81\x19\xcb_\x05\xe2M\x92\xf8I)^\
+\xb1\xdb\xb1 \x97X\x1c\xe8&\xc0w\x0b\x8a\xd9P\x15\
+P@\x81\x15\x05\xd6\xf4!\x7f\x08\xf0\xe8\x15\xcf\xcc\xe3\
+\x80o\x01\xfb\xa5o\xfbyDd\x14\xb3\x08\xdc3\xad\
+-\x11\x1f\xac%\xb4\xb7\x00{\x95\x10\xa81*\xa0\x80\
+\x02\xb3\x0a\xac^\x00\xc4-\xda\xf8\xcd|\xa3Y;\x98\
+\xe8\xb8\x9f\xa75\xdb\xdf\x0d\xc4v\xae\xb6\xf2\x04b;\
+\xe9G\x00/M\xcf\x0e\xe4\x9c\xc1\xd9\xe9\xb9\x86\xf8\x89\
+\xc9\xa6\x80\x02\x0aT!\xb0z\x01\xf0\xaf\xc0\x072\xcf\
+\xec\xcb\xe9\xf9\x84x\xa8\xcfV\xbe@l1\x1d\xebM\
+\xdc:\xf3T\x1e\x08\xc4\xda\x006\x05\x14P\xa0\x0a\x81\
+\xd5\x0b\x80\xdc\x17\xfeyO\xfay\xc2obU\x5c~\
+\x7fM\xe2\x8a\xc0\xdb\x80\x07e\x9c\xd6\xc7\x80\xfbd\x1c\
+\x9f\xa1)\xa0\x80\x02\x9d\x04V-\x006\x05~\x01\xc4\
+\xe6?\xb9\xb5x\x10\xeb\xb9\xc0Kr\x0b\xccxz\x15\
+\x889\xde?\xd3\x07P/\x00\xb6\x04~\xd3k\xc6v\
+\xa6\x80\x02\x0aL$\xb0j\x01\xb0\x0fp\xd0Dq\xac\
+4\xec3\x80W\xaet\x90\xff\xbe\x0a\x81xK\xe0\xc0\
+L3y\x1c\xf0\xc6Lc3,\x05\x14P\xa0\x93\xc0\
+\xaa\x05\xc0G2\xbd\xc5\x19\xb7\x86\x1f\xd5)+\x0f.\
+]\xe0\xad\xc0#3L\x22\xfe7\xb2{\x86q\x19\x92\
+\x02\x0a(\xd0Y`\xa9\x00\x88'\xb2\x7f\x0d\x5c\xa5s\
+\x0f\xc3\x9ep\x5czw\xfc\xfca\x87\xb1\xf7\xcc\x04\xd6\
+Kk:\xe4\xb6^@\xdc\xfe\xdf\x0c\x88\x9f\xa4l\x0a\
+(\xa0@\xd1\x02K\x05\xc0\xd6\x19.w\xfac`\x1b\
+\xe0\xcc\xa2\x85\x0d~^\x81\xf8\xa0\x8d\xe5\xa8\xaf3o\
+\x07\x03\x9dws \xd6\x9f\xb0)\xa0\x80\x02E\x0b,\
+\x15\x00O\x01^\x9dY&w\x07\x8e\xcc,&\xc3\x19\
+W\xe0n\xc0\xa7\xc6\x1dr\xc5\xd1\x9e\x08\xbc~\xc5\xa3\
+<@\x01\x05\x14\xc8\x5c`\xa9\x00\xc8\xed\xf5\xbf\xd8\x86\
+\xf8.\x99\xdb\x19\xde8\x02\x9f\x01\xee<\xceP3\x8d\
+\x12k\x01\xc4\x9a\x006\x05\x14P\xa0h\x81\xa5\x02 \
+n\xb3_-\xa3L\xe2\xd6\xffI\x19\xc5c(\xd3\x09\
+\xe4\xb63\xe5\xe9\xc05\xa7\xe3pd\x05\x14P\xa0\x1f\
+\x81(\x00\xe2\xc1\xbf\xdf\xf6\xd3]/\xbd\xfc\x0f\x10+\
+\x12\xda\x14X\x12\x88o\xdd9\xed\xc8we\xe0\x0fN\
+\x8f\x02\x0a(P\xb2@\x14\x00\xb7\xc9\xec\xdbv<\x90\
+\xf8\x8d\x92Q\x8d\xbdw\x81[\x00'\xf7\xde\xeb\xfc\x1d\
+z\x8d\xceo\xe7\x99\x0a(\x90\x89@\x14\x00{\x00\xef\
+\xcd$\x9e\xd32|\xea;\x13\x9a\xe6\xc3\x88\xb7B\xb6\
+\xcaD!\xeeP\xc5\x9d*\x9b\x02\x0a(P\xac@\x14\
+\x00\xcf\x06^\x9cI\x06\xf1tu<emS`u\
+\x81\xd7\x01O\xc8\x84\xe5Y\xc0\xcb2\x89\xc50\x14P\
+@\x81\xb9\x04\xa2\x00\x88\x95\xf6\xf6\x9c\xeb\xec\xfeO\xda\
+5\xc3\xd7\xbe\xfa\xcf\xd2\x1e\xe7\x11\x88\xd7B\x8f\x98\xe7\
+\xc4\x01\xcequ\xca\x01P\xedR\x01\x05\xc6\x15\x88\x02\
+\xe0\xa8\xb4\xda\xde\xb8#_v\xb4x\xa8*\xdeDp\
+\xa7\xbf\xa9g\x22\xcf\xf1\xd7O\xabUn\x90Ax\xf1\
+\xbf\x99\xbbf\x10\x87!(\xa0\x80\x02s\x0bD\x01p\
+\x02\xb0\xdd\xdc=\xf4wb\xc4q\xbb\xfe\xba\xb3\xa7\x0a\
+\x05\x8e\x07\xb6\xcf \xaf\x88c\x87\x0c\xe20\x04\x05\x14\
+P`n\x81(\x00bY\xd3\x9b\xce\xddC\x7f'\xba\
+\xd1J\x7f\x96\xb5\xf6t\x18p\xdf\x0c\x92\x8b\xb7T\xe2\
+M\x00\x9b\x02\x0a(P\xac@\x14\x00?\xca\xe4\xc9\xfb\
+\xd8f5\xb6[\xb5)\xb06\x81\xb8F\xf6\xce\x80\xe7\
+\x07\xc0\x0d3\x88\xc3\x10\x14P@\x81\xb9\x05\xa2\x00\xc8\
+e\x15\xc0\xfd\x81\x17\xcc\x9d\x89'\xb6 \x10\xd7\xc7\xf3\
+3H\xf4\xe7\xc052\x88\xc3\x10\x14P@\x81\xb9\x05\
+\xa2\x00\xf8#\x10\x0fXM\xdd\x1e\x0f\x1c4u\x10\x8e\
+\x9f\xb5@\xdc!zC\x06\x11\xfe\x1e\xd8$\x838\x0c\
+A\x01\x05\x14\x98[ \x0a\x80\x5c\xf66\x7f0\xf0\xbe\
+\xb93\xf1\xc4\x16\x04rY\xb4*\xdeT\xb9b\x0b\xe0\
+\xe6\xa8\x80\x02\xf5\x0aX\x00\xd4;\xb75f\x96K\x01\
+\xf0\xe7L\xee\x9a\xd58\xc7\xe6\xa4\x80\x02#\x09X\x00\
+\x8c\x04\xed0\xbd\x08X\x00\xf4\xc2h'\x0a(\xa0\x00\
+X\x00x\x15\x94$`\x01P\xd2l\x19\xab\x02\x0ad\
+-`\x01\x90\xf5\xf4\x18\xdcj\x02\x16\x00^\x12\x0a(\
+\xa0@O\x02\x16\x00=A\xda\xcd(\x02\x16\x00\xa30\
+;\x88\x02\x0a\xb4 `\x01\xd0\xc2,\xd7\x93\xa3\x05@\
+=si&\x0a(0\xb1\x80\x05\xc0\xc4\x13\xe0\xf0\x9d\
+\x04,\x00:qy\xb0\x02\x0a(\xb0v\x01\x0b\x00\xaf\
+\x8e\x92\x04r)\x00\xce\x07nQ\x12\x9c\xb1f)\x10\
+k\xb0\xc4+\xa5\xe7\xa6?wB\xcdr\x9a\xea\x0d\xca\
+\x02\xa0\xde\xb9\xad1\xb3\x5c\x0a\x80\x1am\xcdiz\x81\
+\x8b\x80\xd8\x16=\x0a\x82Xn\xfaT\xe0\x94U\xfe\x19\
+\xff\xf7/\xa6\x0f\xd3\x08j\x11\xb0\x00\xa8e&\xdb\xc8\
+\xc3\x02\xa0\x8dy6\xcb\xb5\x0b\xfc\x04\xf8<pL\xfa\
+\xfb\xa1X\x0a\xcc+`\x010\xaf\x9c\xe7M!`\x01\
+0\x85\xbac\xe6,\x10\x05\xc1\xd1\xc0{\x80\xcf\x01\x17\
+\xe7\x1c\xac\xb1\xe5%`\x01\x90\xd7|\x18\xcd\xf2\x02\x16\
+\x00^!\x0a\xac] ~6x/\xf0.\xe0d\xa1\
+\x14XI\xc0\x02`%!\xff}N\x02\x16\x009\xcd\
+\x86\xb1\xe4,\xf0\xbf\xc0k\x80C\x81xh\xd5\xa6\xc0\
+e\x04,\x00\xbc(J\x12\xb0\x00(i\xb6\x8c5\x07\
+\x81\xd3\x81W\x02o\x06\xce\xcb! c\xc8G\xc0\x02\
+ \x9f\xb90\x92\x95\x05,\x00V6\xf2\x08\x05\xd6$\
+\xf0k\xe0\xb5\xe9\xae@\xbce`S\xc0\xcd\x80\xbc\x06\
+\x8a\x12\xb0\x00(j\xba\x0c6C\x81\xb8#\xf0d\xe0\
+C\x19\xc6fH#\x0bx\x07`dp\x87[H\xe0\
+\x01\xc0\x07\x17\xea\xc1\x93\x15P \x04\x0e\x07\x9e\x08\xfc\
+H\x8ev\x05,\x00\xda\x9d\xfb\x123\xbfcz\xf7\xb9\
+\xc4\xd8\x8dY\x81\xdc\x04\xfe\x08\xbc\x088\x10\xb80\xb7\
+\xe0\x8cgx\x01\x0b\x80\xe1\x8d\x1d\xa1?\x81\x1b\x01\xdf\
+\xed\xaf;{R@\x01\xe0\x8b@\xfc\xbc\xf635\xda\
+\x12\xb0\x00hk\xbeK\xcfv\x13\xe0\xac\xd2\x930~\
+\x052\x14\x88\x87\x04\x1f\x0a\x1c\x99al\x864\x90\x80\
+\x05\xc0@\xb0v;\x98@l\x98r\x85\xc1z\xb7c\
+\x05\xda\x15\x88\xcd\x89^\x0a<\x1f\x88}\x09l\x95\x0b\
+X\x00T>\xc1\x15\xa6\x17\x1b\xa4\x5c\xb7\xc2\xbcLI\
+\x81\x5c\x04>\x0b\xdc\x1f\xf8].\x01\x19\xc70\x02\x16\
+\x00\xc3\xb8\xda\xebp\x02\x07\x03{\x0d\xd7\xbd=+\xa0\
+\x00\xf0M\xe0\xee\xee>X\xf7\xb5`\x01P\xf7\xfc\xd6\
+\x98\xdd}\x80\x8f\xd4\x98\x989)\x90\x99\xc0\x8f\x81\xbb\
+\x02?\xc8,.\xc3\xe9I\xc0\x02\xa0'H\xbb\x19M\
+`\x03\xe07>\x070\x9a\xb7\x03\xb5-p&\xb0+\
+\xf0\xd5\xb6\x19\xea\xcc\xde\x02\xa0\xcey\xad=\xab#\xd2\
+\xed\xc9\xda\xf34?\x05r\x10\x88\xa5\x83\xef\x09|>\
+\x87`\x8c\xa1?\x01\x0b\x80\xfe,\xedi<\x81\x87\x03\
+\xef\x18o8GR\xa0y\x81\xb3\x81\x9d\x80\xaf7/\
+Q\x11\x80\x05@E\x93\xd9P*\x97\x03\xbe\x05\xfcK\
+C9\x9b\xaa\x02S\x0b\x9c\x01\xec\x00\x9c2u \x8e\
+\xdf\x8f\x80\x05@?\x8e\xf62\xbe\xc0}\x81\xc3\xc6\x1f\
+\xd6\x11\x15hZ \x1e\x0c\x8c\x22\xe0\xe7M+T\x92\
+\xbc\x05@%\x13\xd9h\x1a\xc7\x03\xdb7\x9a\xbbi+\
+0\x95@\xdc}\xbb\x83\xeb\x04L\xc5\xdf\xdf\xb8\x16\x00\
+\xfdY\xda\xd3\xf8\x02\xb7\x07\x8e\x85K\xb7\xb5\xb6)\xa0\
+\xc0x\x02G\xa5\x07q/\x1eoHG\xea[\xc0\x02\
+\xa0oQ\xfb\x1b[`\xbf\xb4|\xe9\xd8\xe3:\x9e\x02\
+\xad\x0b<\x17xq\xeb\x08%\xe7o\x01P\xf2\xec\x19\
+\xfb\x92\xc0;\xd3F&\x8a(\xa0\xc0x\x02\xb1_\xc0\
+\xcen\xd1=\x1ex\xdf#Y\x00\xf4-j\x7fS\x08\
+\xc4\xe6@\x9f\xf3y\x80)\xe8\x1d\xb3q\x81_\x00[\
+\x03\xf1\x86\x80\xad0\x01\x0b\x80\xc2&\xccp\xd7*\xb0\
+y\xda\xd7\xfcz\x1a)\xa0\xc0\xa8\x02G\xa7%\x83c\
+7A[A\x02\x16\x00\x05M\x96\xa1\xae(\xb0)\xf0\
+\xe1\xf4\x84\xf2\x8a\x07{\x80\x02\x0a\xf4&\xb0\x0f\xf0\xa6\
+\xdez\xb3\xa3Q\x04,\x00Fav\x90\x11\x05.\x0f\
+\x1c\x04<z\xc41\x1dJ\x81\xd6\x05\xce\x02n\xe4O\
+\x01e]\x06\x16\x00e\xcd\x97\xd1\xce.\xf0T\xe0@\
+`\x9d\xd9O\xf1H\x05\x14X@\xe0]\xc0\xc3\x168\
+\xdfSG\x16\xb0\x00\x18\x19\xdc\xe1F\x15\xb89\xf02\
+\xe0\x1e\xa3\x8e\xea`\x0a\xb4+p\xe7\xf4@n\xbb\x02\
+\x05en\x01P\xd0d\x19\xea\xdc\x02\xb1\x89\xc9\x01\xc0\
+6s\xf7\xe0\x89\x0a(0\x8b\xc0\xff\x017\x03.\x98\
+\xe5`\x8f\x99V\xc0\x02`Z\x7fG\x1fW`7\xe0\
+~\xe9\x8e\xc0\x16\xe3\x0e\xedh\x0a4#\xb0\x17\xf0\x96\
+f\xb2-8Q\x0b\x80\x82'\xcf\xd0\xe7\x16\x88\xeb\xfe\
+\xd6@\x14\x04;\x02[\x02\xf1\x1a\xe1U]Vxn\
+SOT`I\xe0\x07\xe9\x81@\x97\x09\xce\xfc\x9a\xb0\
+\x00\xc8|\x82\x0coT\x81x\x83`3\xe0j><\
+8\xaa{\xcb\x83m\x94\x8a\xcf(@\x97\xfen\x01\xdc\
+\xb6\xf0bt\x0f\xe0\xfd-Ol\x09\xb9[\x00\x940\
+K\xc6\xa8\x80\x02\xad\x09\x5c=\xfdTu\xcf\xb4\xc8\xce\
+\x86\x85\x01|#\xad\x10XX\xd8m\x85k\x01\xd0\xd6\
+|\x9b\xad\x02\x0a\x94'\x10K]\xef\x0d\xc4\xe6;q\
+w\xaa\x94\x16\xc5\xcb'K\x09\xb6\xc58-\x00Z\x9c\
+usV@\x81\x12\x05\xe2.\xc0\xbe\xc0S\x80\x0d\x0a\
+H\xe0\xf0\xf4\x9cM\x01\xa1\xb6\x19\xa2\x05@\x9b\xf3n\
+\xd6\x0a(P\xae@\xbc\xc1\x12\xab]\xde7\xf3\x14.\
+\x04\xfe\x1183\xf38\x9b\x0d\xcf\x02\xa0\xd9\xa97q\
+\x05\x14(X \xfe\xdb\xfd\x22\xe0\xd9\x99\xe7\xf0$\xe0\
+\xbf3\x8f\xb1\xd9\xf0,\x00\x9a\x9dz\x13W@\x81\x0a\
+\x04\xe2i\xfb\xb7\x02W\xcc4\x97\x13\x81m3\x8d\xad\
+\xf9\xb0,\x00\x9a\xbf\x04\x04P@\x81\xc2\x05n\x03\xc4\
+\xef\xed\xf1\x0ak\x8e\xed\x86@\xac\x0d`\xcbL\xc0\x02\
+ \xb3\x091\x1c\x05\x14P`\x0e\x81\xdb\xa55\xf8\xd7\
+\x9b\xe3\xdc\xa1Oy\x0e\xf0\x92\xa1\x07\xb1\xff\xee\x02\x16\
+\x00\xdd\xcd<C\x01\x05\x14\xc8Q`O\xe0m\x19\x06\
+\xf6\x19`\xe7\x0c\xe3j>$\x0b\x80\xe6/\x01\x01\x14\
+P\xa0\x22\x81W\x02O\xcb,\x9f\xf3\x80M\xdc (\
+\xb3YIKM^\x92IX\x0f\x06\xde\x97I,\x86\
+\xa1\x80\x02\x0a\x94(\xb0\x0e\xf0)`\x97\xcc\x82\x8f\x9f\
+(N\xc8,\xa6\xe6\xc3\xf1\x0e@\xf3\x97\x80\x00\x0a(\
+P\x99\xc0?\x03\xdf\x06\xd6\xcd(\xaf\xfd\x80\x97g\x14\
+\x8f\xa1x\x07\xc0k@\x01\x05\x14\xa8R\xe0M\xc0c\
+3\xca\xec\x88\xb4\xb7AF!\x19\x8aw\x00\xbc\x06\x14\
+P@\x81\xfa\x04b\x8b\xebS\x80+e\x92\xda\x19i\
+\xb7\xc3L\xc21\x8c\x10\xb0\x00\xf0:P@\x01\x05\xea\
+\x14\x88W\xef\x9e\x95Qj\x1b\x03gg\x14O\xf3\xa1\
+X\x004\x7f\x09\x08\xa0\x80\x02\x95\x0a\x5c\x03\xf8YF\
+\xb9\xc5\x82E_\xcd(\x9e\xe6C\xb1\x00h\xfe\x12\x10\
+@\x01\x05*\x16\xf8\x1ap\xcbL\xf2\xf3M\xafL&\
+b)\x0c\x0b\x80\xcc&\xc4p\x14P@\x81\x1e\x05^\
+\x08<\xb7\xc7\xfe\x16\xe9\xeayi\x03\xa3E\xfa\xf0\xdc\
+\x1e\x05,\x00z\xc4\xb4+\x05\x14P 3\x81m\x80\
+/g\x12\xd3\xa1\xc0#2\x89\xc50|\x08\xd0k@\
+\x01\x05\x14\xa8Z \xbe\xe4\xfd*\x93\x8d\x82b\x81\xa2\
+]\xab\xd6.,9\xef\x00\x146a\x86\xab\x80\x02\x0a\
+t\x148\x1e\xd8\xbe\xe39C\x1c\xfe\x05`\xc7!:\
+\xb6\xcf\xf9\x04,\x00\xe6s\xf3,\x05\x14P\xa0\x14\x81\
+\xc3\x80\xfbf\x10\xec\xc9\x19=\x90\x98\x01\xc7\xf4!X\
+\x00L?\x07F\xa0\x80\x02\x0a\x0c)\xf0F`\xef!\
+\x07\x98\xb1\xefX\x98\xe8\x063\x1e\xeba#\x08X\x00\
+\x8c\x80\xec\x10\x0a(\xa0\xc0\x84\x02\xfb\x03\xf1\x04\xfe\xd4\
+\xed\x97@\xacPh\xcbD\xc0\x02 \x93\x890\x0c\x05\
+\x14P` \x81\xc7\x03\xaf\x1f\xa8\xef.\xdd\x9e\x0bl\
+\xd8\xe5\x04\x8f\x1dV\xc0\x02`X_{W@\x01\x05\
+\xa6\x16\xd8\x13x\xdb\xd4A\x00\x7f\x06\xd6\xcf \x0eC\
+H\x02\x16\x00^\x0a\x0a(\xa0@\xdd\x02\x16\x00u\xcf\
+\xef\xdc\xd9Y\x00\xccM\xe7\x89\x0a(\xa0@\x11\x02\x16\
+\x00EL\xd3\xf8AZ\x00\x8co\xee\x88\x0a(\xa0\xc0\
+\x98\x02\x16\x00cj\x174\x96\x05@A\x93e\xa8\x0a\
+(\xa0\xc0\x1c\x02\x16\x00s\xa0\xb5p\x8a\x05@\x0b\xb3\
+l\x8e\x0a(\xd0\xb2\x80\x05@\xcb\xb3\xbfL\xee\x16\x00\
+^\x18\x0a(\xa0@\xdd\x02\x16\x00u\xcf\xef\xdc\xd9Y\
+\x00\xccM\xe7\x89\x0a(\xa0@\x11\x02\x16\x00EL\xd3\
+\xf8AZ\x00\x8co\xee\x88\x0a(\xa0\xc0\x98\x02\x16\x00\
+cj\x174\x96\x05@A\x93e\xa8\x0a(\xa0\xc0\x1c\
+\x02\x16\x00s\xa0\xb5p\x8a\x05@\x0b\xb3l\x8e\x0a(\
+\xd0\xb2\x80\x05@\xcb\xb3\xbfL\xee\x16\x00^\x18\x0a(\
+\xa0@\xdd\x02\x16\x00u\xcf\xef\xdc\xd9Y\x00\xccM\xe7\
+\x89\x0a(\xa0@\x11\x02\x16\x00EL\xd3\xf8AZ\x00\
+\x8co\xee\x88\x0a(\xa0\xc0\x98\x02\x16\x00cj\x174\
+\x96\x05@A\x93e\xa8\x0a(\xa0\xc0\x1c\x02\x16\x00s\
+\xa0\xb5p\x8a\x05@\x0b\xb3l\x8e\x0a(\xd0\xb2\x80\x05\
+@\xcb\xb3\xbfL\xee\x16\x00^\x18\x0a(\xa0@\xdd\x02\
+\x16\x00u\xcf\xef\xdc\xd9Y\x00\xccM\xe7\x89\x0a(\xa0\
+@\x11\x02\x16\x00EL\xd3\xf8AZ\x00\x8co\xee\x88\
+\x0a(\xa0\xc0\x98\x02\x16\x00cj\x174\x96\x05@A\
+\x93e\xa8\x0a(\xa0\xc0\x1c\x02\x16\x00s\xa0\xb5p\x8a\
+\x05@\x0b\xb3l\x8e\x0a(\xd0\xb2\x80\x05@\xcb\xb3\xbf\
+L\xee\x16\x00^\x18\x0a(\xa0@\xdd\x02\x16\x00u\xcf\
+\xef\xdc\xd9Y\x00\xccM\xe7\x89\x0a(\xa0@\x11\x02\x16\
+\x00EL\xd3\xf8AZ\x00\x8co\xee\x88\x0a(\xa0\xc0\
+\x98\x02\x16\x00cj\x174\x96\x05@A\x93e\xa8\x0a\
+(\xa0\xc0\x1c\x02\x16\x00s\xa0\xb5p\x8a\x05@\x0b\xb3\
+l\x8e\x0a(\xd0\xb2\x80\x05@\xcb\xb3\xbfL\xee\x16\x00\
+^\x18\x0a(\xa0@\xdd\x02\x16\x00u\xcf\xef\xdc\xd9Y\
+\x00\xccM\xe7\x89\x0a(\xa0@\x11\x02\x16\x00EL\xd3\
+\xf8AZ\x00\x8co\xee\x88\x0a(\xa0\xc0\x98\x02\x16\x00\
+cj\x174\x96\x05@A\x93e\xa8\x0a(\xa0\xc0\x1c\
+\x02\x16\x00s\xa0\xb5p\x8a\x05@\x0b\xb3l\x8e\x0a(\
+\xd0\xb2\x80\x05@\xcb\xb3\xbfL\xee\x16\x00^\x18\x0a(\
+\xa0@\xdd\x02\x16\x00u\xcf\xef\xdc\xd9Y\x00\xccM\xe7\
+\x89\x0a(\xa0@\x11\x02\x16\x00EL\xd3\xf8AZ\x00\
+\x8co\xee\x88\x0a(\xa0\xc0\x98\x02\x16\x00cj\x174\
+\x96\x05@A\x93e\xa8\x0a(\xa0\xc0\x1c\x02\x16\x00s\
+\xa0\xb5p\x8a\x05@\x0b\xb3l\x8e\x0a(\xd0\xb2\x80\x05\
+@\xcb\xb3\xbfL\xee\x16\x00^\x18\x0a(\xa0@\xdd\x02\
+\x16\x00u\xcf\xef\xdc\xd9Y\x00\xccM\xe7\x89\x0a(\xa0\
+@\x11\x02\x16\x00EL\xd3\xf8AZ\x00\x8co\xee\x88\
+\x0a(\xa0\xc0\x98\x02\x16\x00cj\x174\x96\x05@A\
+\x93e\xa8\x0a(\xa0\xc0\x1c\x02\x16\x00s\xa0\xb5p\x8a\
+\x05@\x0b\xb3l\x8e\x0a(\xd0\xb2\x80\x05@\xcb\xb3\xbf\
+L\xee\x16\x00^\x18\x0a(\xa0@\xdd\x02\x16\x00u\xcf\
+\xef\xdc\xd9Y\x00\xccM\xe7\x89#\x0a\xac\x07l\x9c\xfe\
+\xd6\x1dq\x5c\x87R\xa0\x06\x81\xdd\x81\x97f\x90\xc8\xf9\
+\xc0-2\x88\xa3\xaf\x10.\x02\xce\x01\xce\x06\xce\xeb\xab\
+\xd31\xfb\xb1\x00\x18S\xdb\xb1V\x17\xd8\x00\xb89\xb0\
+5p\x13\xe0j\xe9C~\x13 \xfe\xe2C?\xfey\
+E\xe9\x14P@\x81\x8c\x05.\x04~\x9f\x8a\x81\xf8\xe7\
+o\x81\xef\x02\xdfL\x7f\xdf\x06\xce\xcd-~\x0b\x80\xdc\
+f\xa4\xdex\xb6H\x1f\xf4\xf1a\x1f\x7f\xb7\x04\xae\x0f\
+\xacSo\xcaf\xa6\x80\x02\x0a\x5c*p\x09\xf0\xc3T\
+\x0c\x9c\x04|$\x15\x08\x93\xf2X\x00L\xca_\xf5\xe0\
+\xf1\xed\xfd\xee\xc0\xbd\x80\x9d\x81\xcd\xab\xce\xd6\xe4\x14P\
+@\x81n\x02\xdf\x03\x0e\x03>\x0c|\xa5\xdb\xa9\xfd\x1c\
+m\x01\xd0\x8f\xa3\xbd\xfcE\xe0:\xc0\xbd\xd3\x87\xfe\x1d\
+\x81\xcb\x0b\xa3\x80\x02\x0a(\xb0\xa2\xc0OS!\xf0F\
+ \x0a\x83Q\x9a\x05\xc0(\xcc\xd5\x0e\x12\xd7\xcf6\xe9\
+\x03?>\xf8oVm\xa6&\xa6\x80\x02\x0a\x0c/\x10\
+?\x15|\x148\x00\xf8\xd2\xd0\xc3Y\x00\x0c-\x5cg\
+\xff\x9b\x02{\x01\x8f\x03\xb6\xaa3E\xb3R@\x01\x05\
+&\x1586\x15\x02\x87\x0f\x15\x85\x05\xc0P\xb2u\xf6\
+{+\xe0\x89\xc0\x83\x81\xf5\xebL\xd1\xac\x14P@\x81\
+\xac\x04\xbe\x05<\x0d8\xaa\xef\xa8,\x00\xfa\x16\xad\xaf\
+\xbf\xf8\x1d\xff\x01\xe9\x83\xffv\xf5\xa5gF\x0a(\xa0\
+@\x11\x02o\x07\x9e\x0a\x9c\xd5W\xb4\x16\x00}I\xd6\
+\xd7\xcf\x96\xc0\xde\xe9/^\xe1\xb3)\xa0\x80\x02\x0aL\
++\xf0\xab\xf4e\xec\x7f\xfa\x08\xc3\x02\xa0\x0f\xc5\xba\xfa\
+\x88\x0f\xfb\xe7\xa5\xdf\xf8}\x8a\xbf\xae\xb95\x1b\x05\x14\
+\xa8C \xd6\x11x<\xf0\x8bE\xd2\xb1\x00XD\xaf\
+\xaes7\x02\x9e\x01<\x05\x88\x15\xfal\x0a(\xa0\x80\
+\x02\xf9\x0a\xfc&\xbd\x81u\xc2\xbc!Z\x00\xcc+W\
+\xcfy\xb1\xce~T\x92\xcfNK\xf1\xd6\x93\x99\x99(\
+\xa0\x80\x02u\x0b\xfc\x11\xd8\x03\xf8\xd8<iZ\x00\xcc\
+\xa3V\xc79\xb1\x04\xefC\x80\x17\xa5\x05|\xea\xc8\xca\
+,\x14P@\x81\xb6\x04bS\xa2'\x00o\xea\x9a\xb6\
+\x05@W\xb1:\x8e\xdf\x15xy\xda\x88\xa7\x8e\x8c\xcc\
+B\x01\x05\x14h[\xe0\xc5\xc0s\xbb\x10X\x00t\xd1\
+*\xff\xd8x\xc0/\xaa\xc4X\xb5\xcf\xa6\x80\x02\x0a(\
+P\x97\xc0\xeb\xd3[\x023ee\x010\x13S\x15\x07\
+\xc5\xefD\xaf\x03b\x15?\x9b\x02\x0a(\xa0@\x9d\x02\
+\xf1s\xc0\x1bfI\xcd\x02`\x16\xa5\xb2\x8f\xd9\x0c8\
+\x08\xb8\x7f\xd9i\x18\xbd\x02\x0a(\xa0\xc0\x0c\x02\x17\x00\
+\xbb\x00\x9f_\xe9X\x0b\x80\x95\x84\xca\xfe\xf7\xf7\x03b\
+w\xa9(\x02l\x0a(\xa0\x80\x02m\x08\x9c\x09\xdc\x06\
+\xf8\xc9r\xe9Z\x00\xd4y1\x5c5\xdd\xee\x8f5\xfb\
+m\x0a(\xa0\x80\x02\xed\x09|\x1d\xd8\x01\x88W\x05\xd7\
+\xd8,\x00\xea\xbb(\xee\x06\xc4\x9a\xd1.\xdf[\xdf\xdc\
+\x9a\x91\x02\x0a(\xd0E\xe0\x1d\xc0\x9e\x16\x00]\xc8\xca\
+=\xf6I\xc0\xab\x81\xcb\x95\x9b\x82\x91+\xa0\x80\x02\x0a\
+\xf4(\x10w\x01\x8e_S\x7f\xde\x01\xe8Qy\xc2\xae\
+\xd6\x05\xfe\x1b\xd8g\xc2\x18\x1cZ\x01\x05\x14P ?\
+\x81\x93\x80m\x81KV\x0f\xcd\x02 \xbf\xc9\xea\x1a\xd1\
+&\xc0\x07\x81\x9d\xbb\x9e\xe8\xf1\x0a(\xa0\x80\x02M\x08\
+<\x1cx\xa7\x05@]s}=\xe0\x13\xc0\x8d\xeaJ\
+\xcbl\x14P@\x01\x05z\x148\x1d\xb8!p\xde\xaa\
+}z\x07\xa0G\xe1\x91\xbb\xba#\xf0!\x17\xf6\x19Y\
+\xdd\xe1\x14P@\x812\x05^\x08<\xdf\x02\xa0\xcc\xc9\
+[5\xeaG\x00\x07\x03\x97/?\x153P@\x01\x05\
+\x14\x18A ^\x07\xbc\x16\x10\xdb\x08_\xda\xbc\x030\
+\x82z\xcfC<\x1484\xcd]\xcf]\xdb\x9d\x02\x0a\
+(\xa0@\xc5\x02\xcf\x00^i\x01P\xe6\x0c\xdf\x0b\xf8\
+0\x10O\xfd\xdb\x14P@\x01\x05\x14\xe8\x22p*p\
+\x83\xa57\x02\xbc\x03\xd0\x85n\xdacw\x02\x8e\x00\xd6\
+\x9f6\x0cGW@\x01\x05\x14(X \x16\x8b\xfb\xb4\
+?\x01\x943\x83\xb7\x06>\x07lXN\xc8F\xaa\x80\
+\x02\x0a(\x90\xa1@\xdcE\xbets8\xef\x00d8\
+;\xab\x85\x14\xaf\xf8\x1d\x07\x5c-\xffP\x8dP\x01\x05\
+\x14P s\x81?\xa4\xb7\xc7\xfel\x01\x90\xf7Lm\
+\x05|\x01\xb8f\xdea\x1a\x9d\x02\x0a(\xa0@A\x02\
+\xb1p\xdcg,\x00\xf2\x9d\xb1M\x81\x13\xd2\x03\x1b\xf9\
+Fid\x0a(\xa0\x80\x02\xa5\x09\x1c\x08\xeck\x01\x90\
+\xe7\xb4\xc5S\xfe\xf1\x90\xc6\x9d\xf2\x0c\xcf\xa8\x14P@\
+\x01\x05\x0a\x16\xf8&p\x0b\x0b\x80<g06\xf6y\
+b\x9e\xa1\x0d\x1a\xd5\xc5\xc0)\xc0\xc9\xc0\xf7\xd3\x82\x15\
+g\x01\xbf\x05\xe2\x9f\xf1w\xd1\xa0\x11\xd8\xb9\x02\x0a(\
+0\x9b@\xec\xbaz\xf5\xb4\xf5\xfa\x96\xe9\x9f\xb1\x0d{\
+,\xb6\x13;\xf0\xe5\xbeP\xdb\xc6\x16\x00\xb3M\xf4\x98\
+G=\x1a8d\xcc\x01'\x1c\xeb\x0c\xe0p v\xab\
+\x8a\x0f\xfd\xa8J\xcf\x9d0\x1e\x87V@\x01\x05\xfa\x10\
+\xd8\x1c\x88\x15[\xf7\xca\xf8g\xdc\xed,\x00\xfa\x98\xea\
+\xfe\xfa\xd8\x1e8\x06X\xaf\xbf.\xb3\xeb\xe9\x07\xc0G\
+\x81\x8f\xa4g\x1c\xe2[\xbfM\x01\x05\x14\xa8Q >\
+cc\xdf\x96W\x00\xb7\xcd,\xc1GY\x00\xe43#\
+\xd7\x00\xbe\x92n#\xe5\x13U?\x91\xfc\x02x3\xf0\
+~\xe0\xbb\xfdti/\x0a(\xa0@1\x02W\x04\xde\
+\x0d\xec\x9eQ\xc4\x07Z\x00\xe41\x1b\xb1\xba\xdf\xb1\x19\
+V\x88\x8b\xea\xc4+\x8c\xafK\xcb\x17_\xb0hg\x9e\
+\xaf\x80\x02\x0a\x14,p\x05\xe0\xab\xc0M2\xc9\xe1\x13\
+\x16\x00y\xcc\xc4;\x81\xd8\xe4\xa7\x86\x16;NE\xa5\
+\x1b\x1f\xfc\xdf\xa8!!sP@\x01\x05z\x12\x88%\
+\xddcU\xd7\x1c\xda\x89\x16\x00\xd3O\xc3\xd3V\xdd\x9d\
+i\xfap\xe6\x8e\xe0\xfct\x9b\xff%\xc0/\xe7\xee\xc5\
+\x13\x15P@\x81z\x05\xe2\xcd\x80s\x80\xb8\x1b0u\
+\xfb\x9e\x05\xc0\xb4Sp\xd7\xf4\x14|\xbcNRj\x8b\
+\xd7\xf2\xde\x05\xbc\x00\xf8q\xa9I\x18\xb7\x02\x0a(0\
+\x92@,\xf0\xb6\xddHc-7\xcc\xe9\x16\x00\xd3\xcd\
+\xc2\xf5\x81\x13\x81\xabL\x17\xc2\xc2#\x7f\x08x\xae\x0f\
+\xf6-\xech\x07\x0a(\xd0\x8e\xc0k\x81'e\x90\xee\
+\xd9\x16\x00\xd3\xccB\xec\xea\xf7e\xe0_\xa6\x19~\xe1\
+Q\x7f\x94\xdeo\xfd\xec\xc2=\xd9\x81\x02\x0a(\xd0\x96\
+@.k\xbd\x5ch\x010\xfe\x85\x17\xe6\xf1\x1e\xfc\xbd\
+\xc6\x1fz\xe1\x11/I\x0f\xf7\xed\x07\xc4\x8eR6\x05\
+\x14P@\x81n\x02O\x07b-\xfe\xa9\xdb\x19\x16\x00\
+\xe3O\xc1\x8b\x80\xe7\x8c?\xec\xc2#\xc6\x02>Q\xb9\
+\xc6\xd6\xc46\x05\x14P@\x81\xf9\x04rY\xea\xfd\x9b\
+\x16\x00\xf3M\xe0\xbcg\xfd+\xf0\x81yO\x9e\xf0\xbc\
+\x83\x81'\x03\xf1\x8a\x9fM\x01\x05\x14P`~\x81\xef\
+d\xf2\xf3\xef\x91\x16\x00\xf3Ob\xd73o\x01|\x11\
+\xd8\xa0\xeb\x89\x13\x1e\x7fa\xfa\xe0\x7f\xc3\x8418\xb4\
+\x02\x0a(P\x8b\xc0\xad\xd2b@9\xe4\xf3\x0e\x0b\x80\
+q\xa6\xe1ji\xc3\x9b\xeb\x8c3\x5c/\xa3\xfc\x06\x88\
+;\x16\xb9,Z\xd1KRv\xa2\x80\x02\x0aL(\xf0\
+&\xe0\xb1\x13\x8e\xbf\xea\xd0\x07X\x00\x0c?\x13\xeb\x02\
+G\x01\xb1\x02T)\xed[\xc0}\x80x\xda\xdf\xa6\x80\
+\x02\x0a(\xb0\xb8\xc0\xed\xd23T\xeb,\xdeU/=\
+<\xc5\x02\xa0\x17\xc7e;\x89%q\x9f0\xfc0\xbd\
+\x8d\xf0u\xe0N\xc0\xef{\xeb\xd1\x8e\x14P@\x81\xb6\
+\x05b\xe5\xbf\xf8okN\xaf~\xefa\x010\xecE\
+\x19{A\xc7\x03t\xa5\xb4x8%\xb6\xae\xfcu)\
+\x01\x1b\xa7\x02\x0a(P\x80\xc0\x8b\x81gg\x16\xe7\x1d\
+-\x00\x86\x9b\x91\xb8\xdd\x13\xbf\x9f\xaf7\xdc\x10\xbd\xf6\
+|*\xb0#\x10[\xf7\xda\x14P@\x01\x05\xfa\x11\x88\
+\x07\xc0O\x02b\x1f\x80\x5cZ\xec\xdd\xb2\xa9\x05\xc00\
+\xd3qM\xe0+\xc0\xe6\xc3t\xdf{\xaf?M\x1f\xfe\
+\xa7\xf5\xde\xb3\x1d*\xa0\x80\x02\xed\x0a\xc4>/\xb1\xea\
+\xeb\xad3#\xf8\x0c\xb0\xb3\x05@\xff\xb3\xb2~z\xd0\
+\xe36\xfdw=H\x8f\xe7\x02\xdb\x03\xdf\x1e\xa4w;\
+U@\x01\x05\xda\x158\x00\xd87\xc3\xf4c5\xc2W\
+Y\x00\xf4?3\xb13\xde\xbf\xf5\xdf\xed =\xc6\xd2\
+\xbe\x0f\x00><H\xefv\xaa\x80\x02\x0a\xb4+\xf0`\
+\xe0=\x99\xa6\x7f\x13\xe0;\x16\x00\xfd\xceN.k<\
+\xcf\x9a\xd5\x0b\x81\xe7\xcfz\xb0\xc7)\xa0\x80\x02\x0a\xcc\
+$p\xcb\xb4\xf0\xdb\x15g:z\xdc\x83\xe2\xa7\xdeK\
+\xd7\xa4\xb1\x00\xe8\x0f\xfen\xc0\xe1@.\xefx\xae\x94\
+YlH\xb4;\x10w\x01l\x0a(\xa0\x80\x02\xfd\x08\
+l\x96\x9e\x01\xbbv?\xdd\xf5\xdeK,F\xb4\x8f\x05\
+@\x7f\xae7\x00N\x046\xe9\xaf\xcbA{\x8a\xd7\xfd\
+\xb6\x03\xce\x19t\x14;W@\x01\x05\xda\x12\x88'\xfd\
+\x8f\x06\xee\x90q\xda\xb1\xc8\xdb\xc7,\x00\xfa\x99\xa1\x8d\
+\x80/e\xb6\xc0\xc3r\x99\xfd\x0e\xb8-pJ?\xe9\
+\xdb\x8b\x02\x0a(\xa0@\x12x=\xf0\xf8\x8c5.}\
+\xfd\x0f\x88\x87\xbf\xfd\x09`\xc1\x89\x8a\xdb\xfdq+\xfd\
+\x9e\x0b\xf63\xd6\xe9\x17\x03\xf7\x00\x8e\x1ck@\xc7Q\
+@\x01\x05\x1a\x11x\x0c\xf0\xe6\xccs}\x1b\xf0\xa8\xa5\
+\x18}\x06`\xb1\xd9z\x09\xf0\xac\xc5\xba\x18\xf5\xecx\
+\x1d\xe5\xc0QGt0\x05\x14P\xa0~\x81\x12\x16~\
+\x8b/\x80\xb1\x14\x9f\x8a\xad\x5c\x00\x00\x1a\xcbIDA\
+T\xf1\xf7-\x00\x16\xbf \x1f\x08\xbc\x7f\xf1nF\xeb\
+!^G)\xe5\xf5\xc4\xd1P\x1cH\x01\x05\x14XP\
+\xe0\x1ai\x8b\xdf\xdc\x17~\x8b\xcf\xab=V\xcd\xd5;\
+\x00\xf3\xcd\xfc\xd6\xe9\x15\x8f+\xcdw\xfa\xe8g}\x0d\
+\xb8=\xf0\xc7\xd1Gv@\x05\x14P\xa0^\x81X\xf8\
+\xed\xd8\xf4\x5cU\xeeY\xc6\x92\xc4\xdf\xb4\x00Xl\x9a\
+\xe2\x15\x8fX\xd7y\xab\xc5\xba\x19\xed\xec3\x80X\x95\
+0\x96\xfb\xb5)\xa0\x80\x02\x0a\xf4'p(\xf0\xb0\xfe\
+\xba\x1b\xac\xa7\x8f\x03\xf7^\xbdw\xef\x00t\xf3^7\
+\xbd\xe2\x11;\xe6\x95\xd0.\x00\xee\x92\x96&.!^\
+cT@\x01\x05J\x11xj,\xa7[H\xb0\xb1\xdc\
+{\xbc\xad\xf6w\xcd\x02\xa0\xdb\xec\xe5\xfe\x8a\xc7\xea\xd9\
+<\x0exc\xb7\x14=Z\x01\x05\x14P`\x05\x81\x9d\
+\x81O\x01\xb1\xd9O\xee\xed\xd2\x8d\x7f\xd6\x14\xa4\x05\xc0\
+\xecSW\xc2+\x1e\xabf\x13\xaf\xa3\xec={z\x1e\
+\xa9\x80\x02\x0a(0\x83\xc0u\xd3\xcf\xc0W\x9d\xe1\xd8\
+\x1c\x0e\xb9s\xda\x9a\xfe2\xb1X\x00\xcc6=;\x00\
+\x9f\x05\xd6\x9b\xed\xf0\xc9\x8f\xfa\x22\x10\x93\x1e\x8b>\xd8\
+\x14P@\x01\x05\xfa\x11\xb82p\x02p\xd3~\xba\x1b\
+\xbc\x97\xf7\x01\xb1)\xd1\x1a\x9b\x05\xc0\xca\xfe\xd7J\xd5\
+^\xee\xafx,e\xf2\xb3\xf4\xd0\xdf\xafVN\xcd#\
+\x14P@\x01\x05f\x14\x88\xcf\xcb\x0f\xa5=Tf<\
+e\xd2\xc3~\x9e\x0a\x95\xb3,\x00\xe6\x9b\x87\xd8\xc9\xe9\
+8\xe0\xd6\xf3\x9d>\xfaY\x7f\x02vL\x1bQ\x8c>\
+\xb8\x03*\xa0\x80\x02\x15\x0b<\x0f\xd8\xbf\xa0\xfc\xee\xbe\
+\xd2\xaa\xaf\xde\x01X~6\xdf\x0d<\xa4\xa0\x09\x8f\xd7\
+Q\xdeUP\xbc\x86\xaa\x80\x02\x0a\x94 \x10\x1b\xe8\x1c\
+\x96\x96\xcf/!\xde7\x00OX)P\x0b\x80\xb5\x0b\
+\xc5\xb2\xb9\x07\xac\x04\x98\xd1\xbf\x7f5\xf0\xb4\x8c\xe21\
+\x14\x05\x14P\xa0\x06\x81\x1b\xa7W\xe86,$\x99\x1f\
+\x00\xb1X\xddy+\xc5k\x01\xb0f\xa1\xb8u\xf2I\
+ 6\xfb)\xa1\x1d\x05\xec\x0a\x5cTB\xb0\xc6\xa8\x80\
+\x02\x0a\x14\x22p\x95\xb4\xd5\xfb\xf5\x0b\x897>\x03b\
+\xd5\xd7\xcb\xbc\xf3\xbf\xa6\xf8-\x00.\xabrC\xe0\xcb\
+\xc0&\x85L\xf8\xa9i\x19\xca\xb5>\xe8QH\x1e\x86\
+\xa9\x80\x02\x0a\xe4$\x10\xef\xf8\x1f\x0e\xdc5\xa7\xa0V\
+\x88%6\xa8{\xce\xac\xf1Z\x00\xfc\xbd\xd4F\xe9\xc3\
+\xffF\xb3\x02N|\x5c\xec\xe9\x1c+<}{\xe28\
+\x1c^\x01\x05\x14\xa8M vN}zAI\xc5\x9e\
+/\xdb\x01\xb1\x02\xecL\xcd\x02\xe0oLq\xbb\xffc\
+\xc0n3\xc9M\x7f\xd0%\xc0\xfd\xd3\x83)\xd3Gc\
+\x04\x0a(\xa0@=\x02\xb1sjI\x0fT\xff:\xdd\
+\x09\xfeq\x97)\xb0\x00\xf8\x9b\xd6K\x81\xfd\xba\xe0M\
+|l\xbc\x8e\xf2\x82\x89cpx\x05\x14P\xa06\x81\
+x\xed;^\xff\x8e\xd7\xc0Kh\x17\x02\xbb\x00\xc7t\
+\x0d\xd6\x02\xe0/b\x0f\x02b\xc5\xa4R\xdaG\xd3b\
+\x14q\x17\xc0\xa6\x80\x02\x0a(\xd0\x8f\xc0\xd5\xd3:*\
+\xb1\x00\x5c)\xed\x89@\xecS\xd3\xb9Y\x00\xfc\xe5u\
+\x89X:\xf7J\x9d\xf5\xa69\xe1;\xe9w\x9es\xa6\
+\x19\xdeQ\x15P@\x81*\x05.\x9f\x96|\x8f\xa7\xe8\
+Ki\x87\x00\xb1O\xcd\x5c\xad\xf5\x02`\xb3T\xed]\
+{.\xbd\xf1O\x8a'\xfd\xb7\x01N\x19\x7fhGT\
+@\x01\x05\xaa\x16\x88\x9dSK\xda@\xedx\xe0N\x8b\
+\xec\xf9\xd2r\x01\x10\xd5\xde\xd1\xc0\x1d\x0a\xb9\xa4\xe3\xfd\
+\xce{\x00\x9f.$^\xc3T@\x01\x05J\x11\x88\x0f\
+\xfe\x92\xb6N\xefe\xcf\x97\x96\x0b\x80X*\xf1q\xa5\
+\x5c\x9d\xc03\x80W\x16\x14\xaf\xa1*\xa0\x80\x02%\x08\
+\xc4-\xff\xd8\xed5\xbe\x14\x96\xd0z\xdb\xf3\xa5\xd5\x02\
+\xe0\xb1\xc0\x9bJ\x98\xe9\x14c\xecI\xf0\xd0\x82\xe25\
+T\x05\x14P\xa0\x04\x81x\xd8\xef+@<\xfcWJ\
+\x8b\xcf\x82\xf8LX\xb8\xb5X\x00\x94V\xed}5\xed\
+\xf0\xf7\xc7\x85g\xdb\x0e\x14P@\x01\x05\x96\x04J\xdb\
+\xed5\xe2\x8e\xbb\xc0q7\xb8\x97\xd6Z\x01PZ\xb5\
+w\x06p\x1b\xe0\xa7\xbd\xcc\xb6\x9d(\xa0\x80\x02\x0a,\
+\x09\xc4B?\xb1\xe0O)\xed\xc8\xf4\x1c\xd8\xc5}\x05\
+\xdcR\x01\x10\xd5\xde\x17\x80[\xf5\x857p?\xb1\x9c\
+\xe3\x9dS\xcc\x03\x0fe\xf7\x0a(\xa0@S\x02\xb1\xc4\
+o,\xf5[J\x8b\x1d\xfe\xe2\x0d\xb0\xdf\xf5\x19pK\
+\x05\xc0{\x80\x07\xf7\x897p_\xf1\x80bIO\xa5\
+\x0e\xcca\xf7\x0a(\xa0@/\x02\xb1\xb9Ol\xf2\x13\
+\x9b\xfd\x94\xd0\xceNk\xbf|\xb7\xef`[)\x00\xfe\
+\x13xy\xdfx\x03\xf6\x17\x0f(\xee3`\xffv\xad\
+\x80\x02\x0a\xb4(\x10\xdb\xfa\x9e\x08\xc46\xbf%\xb4\xb8\
+\xdd\x7f\x1f\xe0\x13C\x04\xdbB\x01\xb0k\xc2\x8b\xcd~\
+Jh\xf13E\xdc\xfa\x9fyG\xa7\x12\x922F\x05\
+\x14P`b\x81\x0d\x81/\x017\x9e8\x8e.\xc3?\
+\x1b\x88}j\x06i\xb5\x17\x00\xff\x9c\xb6\xf7\xddx\x10\
+\xbd\xfe;\xedeq\x87\xfe\xc3\xb2G\x05\x14P\xa0h\
+\x81\xf8\xac;,}\x9b.%\x91\x0f\xa4}j\x06\x8b\
+\xb7\xe6\x02 >\xf4\xbf\x0cD\x11PB\x8b\xc5\x1d\xe2\
+\x15\xc5x\xed\xcf\xa6\x80\x02\x0a(\xd0\x9f@\xec\x9e\xfa\
+\xbc\xfe\xba\x1b\xbc\xa7\x93\x81\x1d\x80\xf3\x86\x1c\xa9\xd6\x02\
+ n\xf7\x7f<\xbd21\xa4_\x9f}?\xac\xb0\xfd\
+\xa7\xfb\xcc\xdd\xbe\x14P@\x81\xa1\x04v\x07>\x04\xc4\
+\xe7]\x09\xedL\xe0\xb6\xc0iC\x07[k\x01\xf02\
+\xe0\x99C\xe3\xf5\xd8\xff\xab\x80x-\xc5\xa6\x80\x02\x0a\
+(\xd0\x9f\xc0M\x81\x13\x80+\xf7\xd7\xe5\xa0=]\x08\
+\xec\x0c|~\xd0QR\xe75\x16\x00{\x00\xef\x1d\x03\
+\xaf\xa71bs\x9f\xd8\xe4'6\xfb\xb1)\xa0\x80\x02\
+\x0a\xf4#p\xd5\xf4\xc4\xff\xf5\xfa\xe9n\x94^\x9e\x00\
+\xc4>5\xa3\xb4\xda\x0a\x80[\x02_\x04b\xd1\x9f\x12\
+\xda\xa9\xe9VOl\xf3kS@\x01\x05\x14\xe8G \
+\xde\xf1?\x02\xd8\xa5\x9f\xeeF\xe9\xe5` \xf6\xa9\x19\
+\xad\xd5T\x00\xc4f\x0e'\x01\xd7\x1eMo\xb1\x81\xce\
+M\x8b;\xfc\xefb\xddx\xb6\x02\x0a(\xa0\xc0j\x02\
+\xf1\xb3\xeaS\x0bR\x89/\xae\xf1\xfa\xf7\xf9c\xc6\x5c\
+K\x01\x10\xdb8~&m\x9a3\xa6\xdf\xbcc]\x02\
+\xdc\x0f\xf8\xc8\xbc\x1dx\x9e\x02\x0a(\xa0\xc0\x1a\x05\xe2\
+\x81\xeaC\x0b\xb2\x89\xbd^\xe2\xa1\xbf_\x8d\x1ds-\
+\x05@,\x99\xbb\xf7\xd8x\x0b\x8c\xf7\x02 ^K\xb1\
+)\xa0\x80\x02\x0a\xf4'\x10\x9b\xa7\x1d\x07\xac\xdf_\x97\
+\x83\xf6\x14\xbb\xbc\xee8\xd5\xeb\xdf5\x14\x00\xb1d\xee\
+A\x83NQ\xbf\x9d\xc7\xb7\xfe\xf8\xf6\x1fw\x01l\x0a\
+(\xa0\x80\x02\xfd\x08l\x0e|\x05\xb8f?\xdd\x8d\xd2\
+K\xecF\x18\xfb\xd4L\xd2J/\x00\xa2r\x8a[\xff\
+\xf1\x13@\x09-~\xef\xdf\x0e\x88\xdf\xffm\x0a(\xa0\
+\x80\x02\xfd\x08\xac\x07|6-\x9e\xd3O\x8f\xc3\xf7\xf2\
+\x0a \xf6\xa9\x99\xac\x95\x5c\x00\xc4\xc3~\xf1\xd0_<\
+\xfcWB\x8b'\xfd\xe3w\x9ex\xf2\xdf\xa6\x80\x02\x0a\
+(\xd0\x9f\xc0\x9b\x81\xc7\xf4\xd7\xdd\xe0=}\x0a\xd8\x0d\
+\x88\xcd~&k\xa5\x16\x00\xf1\x9a_<5\x19\xaf\xfd\
+\x95\xd0\xe2\x1d\xffx\xd7?\xde\xf9\xb7)\xa0\x80\x02\x0a\
+\xf4'\x10[\xa7\x8f\xf6\xee|\x0fa\x7f\x1f\xd8\x16\xf8\
+]\x0f}-\xd4E\xa9\x05@,\xf4\x13\x0b\xfe\x94\xd2\
+b\x95\xbfx-\xc5\xa6\x80\x02\x0a(\xd0\x9f\xc0\x1d\x80\
+\xa3\x0b\xfa\x19\xf8\xec\xf4\xe1\xff\xbd\xfe\x08\xe6\xef\xa9\xc4\
+\x02 \x96\xf8\x8d\xa5~Ki\xef\x02\xe2\xb5\x14\x9b\x02\
+\x0a(\xa0@\x7f\x02\xf13p<\xf4\xb7Y\x7f]\x0e\
+\xdaS\xdc\xee\xbf7\xf0\xc9AG\xe9\xd0yi\x05@\
+\xdcF\x8fM~b\xb3\x9f\x12Z\xec\xec\x17;\xfc\xc5\
+N\x7f6\x05\x14P@\x81~\x04J\xfb\x198\xb2~\
+Vn_^K*\x00b[\xdf\xd8\xde7\xb6\xf9-\
+\xa1\xc5\xa2\x0e\xf1N\xea\xcfJ\x08\xd6\x18\x15P@\x81\
+\x82\x04\xe2\xd5\xb9\x07\x17\x14\xef\xfbs\xfc\xd9\xba\x94\x02\
+ >\xf4O\x04nX\xc8\x84_\x90\x96u\xfcB!\
+\xf1\x1a\xa6\x02\x0a(P\x8a\xc0\xbe\xc0\x01\xa5\x04\x0b|\
+=\xdd\x09>/\xb7\x98K(\x00\xe2v\xff'\x80]\
+s\xc3[&\x9eX\x9c\xe8M\x05\xc5k\xa8\x0a(\xa0\
+@\x09\x02wO\xbf\xa1\x97\xf23\xf0\x99\xe9N\xf0O\
+r\xc4-\xa1\x00x\xf9\xd4\x8b%t\x9c\xb8X\x968\
+^K\xb1)\xa0\x80\x02\x0a\xf4'p\x83t'x\x93\
+\xfe\xba\x1c\xb4\xa7\xb8\x13\xbc3p\xec\xa0\xa3,\xd0y\
+\xee\x05@\xfc\xc63\xd92\x89s\xb8\xc6\x1a\xd4w\x01\
+b\xe2m\x0a(\xa0\x80\x02\xfd\x08l\x04|\x09\xf8\x97\
+~\xba\x1b\xa5\x97\xf8\x22\x18_\x08\xb3m9\x17\x00\xb7\
+\x02\xe27\xf4x\xda\xb3\x84\x16;:\xc5C\x7fg\x94\
+\x10\xac1*\xa0\x80\x02\x85\x08\xc4\xe7\xd4G\x81{\x15\
+\x12o\x84\x19?\x01\xc7O\xc1Y\xb7\x5c\x0b\x80X\xde\
+7\xde\xef\xbcV\xd6z\x7f\x0bn\xd2\x1d\x9d\x0a12\
+L\x05\x14P`\x1e\x81\x17\x01\xcf\x99\xe7\xc4\x89\xce\x89\
+/\xaew.\xe1Np\x8e\x05@l\xec\x13\x9b:\xc4\
+\xfb\xf3\xa5\xb4\x87\x02\xef.%X\xe3T@\x01\x05\x0a\
+\x11\xb8?\xf0A >\xabJhE\xdd\x09\xce\xb1\x00\
+\x88['\x8f-a\xa6S\x8c\xaf\x04\x9eQP\xbc\x86\
+\xaa\x80\x02\x0a\x94 p3\xe0\x04`\x83\x12\x82\x05\xe2\
+Np|q\xfdZ!\xf1^ZU\xe5\xb2/}<\
+\xf0w\x95\xc26u\x88\xcd}bu\xc2\xd8\xec\xc7\xa6\
+\x80\x02\x0a(\xd0\x8f\xc0\xa6i\xb7\xd7\x7f\xea\xa7\xbbQ\
+zy\x08\x10\xfb\xd4\x14\xd3r*\x00\x0e\x02\xf6*h\
+S\x87S\x80m\x80\xd8\xe6\xd7\xa6\x80\x02\x0a(\xd0\x8f\
+\xc0\xe5\x80#\xd3\x1bU\xfd\xf48|/\xb10Q\xec\
+SST\xcb\xa9\x00(\x09\xee\x1c`;\xe0;%\x05\
+m\xac\x0a(\xa0@\x01\x02\xaf\x01\x9e\x5c@\x9cK!\
+\x1e\x9e\xdeP\x88\xcd~\x8aj\x16\x00\xdd\xa7+~2\
+\xd9=\xbd\x96\xd2\xfdl\xcfP@\x01\x05\x14X\x9b\xc0\
+#\x80\xb7\x17\xc4\xf3\x7fi{\xdf\xdf\x17\x14\xf3_C\
+\xb5\x00\xe8>k/\x00\xf6\xef~\x9ag(\xa0\x80\x02\
+\x0a,#\x10?\xa9\xc6\xaayW(D)>\xf4\xb7\
+\x05\xa2\x08(\xb2Y\x00t\x9b\xb6\xc3\x80x-%\x97\
+\x07'\xbbE\xef\xd1\x0a(\xa0@\x9e\x02[\x00\xb1}\
+\xfa?\xe6\x19\xdee\xa2\x8a\xdb\xfd\xb10Q\xdc\xfe/\
+\xb6Y\x00\xcc>u\xdf\x06\xb6\x07\xce\x9d\xfd\x14\x8fT\
+@\x01\x05\x14XA`=\xe0\x98\xf4\xdf\xd7R\xb0\xf6\
+\x03b\x9f\x9a\xa2\x9b\x05\xc0l\xd3\xf7\xdb\xf4\xc4\xff\xa9\
+\xb3\x1d\xeeQ\x0a(\xa0\x80\x023\x0a\x1c\x02<z\xc6\
+cs8\xec}@\xbc\xb6^|\xb3\x00Xy\x0a\xe3\
+\x1d\xff\xd8\x8a\xf8\xa8\x95\x0f\xf5\x08\x05\x14P@\x81\x0e\
+\x02O\x04\xfe\xbb\xc3\xf1S\x1f\xfau`\x87\xb4\xe8\xcf\
+\xd4\xb1,<\xbe\x05\xc0\xca\x84O\x03^\xbd\xf2a\x1e\
+\xa1\x80\x02\x0a(\xd0A`\xa7\xf4\xc5j\xdd\x0e\xe7L\
+yhl\xf4v[\xe0'S\x06\xd1\xe7\xd8\x16\x00\xcb\
+k\xbe\x0bxX\x9f\xe0\xf6\xa5\x80\x02\x0a(\xc0Vi\
+\xc3\xb7\xab\x15b\x11[\xbc\xc7V\xef\xb1\xe5{5\xcd\
+\x02`\xedS\x19\xbb\x11\xee\x08\xfc\xa9\x9a\xd96\x11\x05\
+\x14P`z\x81+\x01_\x04\xb6\x9e>\x94\x99#\x88\
+\xad}c\x9f\x9a\xaa\x9a\x05\xc0\x9a\xa7\xf3W\xc0m\x80\
+\x9fU5\xdb&\xa3\x80\x02\x0aL/\x10\x0f\xd1=h\
+\xfa0f\x8e\xe0\x8d\xc0\xe3f>\xba\xa0\x03-\x00.\
+;Y\xe7\xa7\xbd\x9c\xa3B\xb5)\xa0\x80\x02\x0a\xf4'\
+\x10\xeb\xe5\xbf\xac\xbf\xee\x06\xef)\x16&\xda\x19\x88\x9f\
+\x00\xaak\x16\x00\x97\x9d\xd2\xbd\x817W7\xd3&\xa4\
+\x80\x02\x0aL+\x10;\xa7~\x1cXg\xda0f\x1e\
+=\x1e\xf6\x8b;\xc1g\xce|Fa\x07Z\x00\xfc\xfd\
+\x84\xc5\x8e\x84\x8f/l\x0e\x0dW\x01\x05\x14\xc8]\xe0\
+\x9f\x81/\x03\x1b\xe7\x1eh\x8a\xef<\xe0\xf6@\xbc\xf6\
+Wm\xb3\x00\xf8\xdb\xd4\xc6\xd3\x9d\xf1\x94g\x95\xb7z\
+\xaa\xbd\x82ML\x01\x05r\x17\xd8\x088\x11\x88\x22\xa0\
+\x94\xb6\x07\xf0\xfeR\x82\x9d7N\x0b\x80\xbf\xc8\xfd4\
+\xdd\xea\x89\xf7<m\x0a(\xa0\x80\x02\xfd\x08\xc4\xed\xfe\
+\x8f\x01\xbb\xf5\xd3\xdd(\xbd\xc4\x12\xbf\xb1\xd4o\xf5\xcd\
+\x02\x00\xfe\x98n\xf5|\xad\xfa\xd96A\x05\x14P`\
+\x5c\x81\x97\x00\xcf\x1aw\xc8\x85F\xfb$po 6\
+\xfb\xa9\xbeY\x00\xc0\xbf\x01\xef\xa9~\xa6MP\x01\x05\
+\x14\x18W\xe0_\x81\x0f\x8c;\xe4B\xa3}/m\xef\
+{\xf6B\xbd\x14tr\xeb\x05\xc0\x81\xc0\xbe\x05\xcd\x97\
+\xa1*\xa0\x80\x02%\x08\xdc\x028\x1e\x88E\x7fJh\
+\xbfO\x1b\xbe}\xbf\x84`\xfb\x8a\xb1\xe5\x02\xe0H \
+^Ki\xe2VO_\x17\x8c\xfd(\xa0\x80\x02+\x08\
+\xc4\xf2\xbe'\x01\xd7)D*>\x03\xee\x09\x1cQH\
+\xbc\xbd\x85\xd9j\x01pJ\xda\xd4\xe1w\xbdI\xda\x91\
+\x02\x0a(\xa0@l\xec\xf3i\xe0N\x05Q\xfc'\xf0\
+\x8a\x82\xe2\xed-\xd4\x16\x0b\x80s\x80\xed\x80\xef\xf4\xa6\
+hG\x0a(\xa0\x80\x02!\xf0_\xc0\xbf\x17D\xf1^\
+\xe0!\x05\xc5\xdbk\xa8\xad\x15\x00\x97\x00\xbb\x03\x1f\xed\
+U\xd1\xce\x14P@\x01\x05\x1e\x09\xbc\xb5 \x86x\xf3\
++\x16\xfb\x897\xc1\x9al\xad\x15\x00\xcf\x07^\xd8\xe4\
+L\x9b\xb4\x02\x0a(0\x9c@\xdcU=\x06\xb8\xc2p\
+C\xf4\xdas\xac\xf9\x12\xcb\xfc\xc6\x1a0\xcd\xb6\x96\x0a\
+\x80\x0f\x03\x0f\x00\xe2.\x80M\x01\x05\x14P\xa0\x1f\x81\
+\x7f\x04b\xfb\xf4-\xfb\xe9n\xf0^b\xb5\xd7;\x03\
+_\x18|\xa4\xcc\x07h\xa5\x00\xf86\xb0=pn\xe6\
+\xf3ax\x0a(\xa0@I\x02\xf1\x8d\xff\xf3\xe9\xfd\xf9\
+R\xe2v\xc3\xb74S-\x14\x00\xbfMO\xfc\xff\xb0\
+\x94\xab\xd38\x15P@\x81B\x04\xde\x06\xecYH\xac\
+\x11\xa6\x1b\xbe\xad2Y\xb5\x17\x00\x17\x01w\x07\x8e.\
+\xe8\x025T\x05\x14P\xa0\x04\x81'\x01\xaf-!\xd0\
+\x14c\xdc\xa9\xd8\xc5\x0d\xdf\xfe6c\xb5\x17\x00O\x05\
+\xfe_A\x17\xa8\xa1*\xa0\x80\x02%\x08\xc4o\xe8\xb1\
+\x98Z\xbc\xf7_B;-\xdd\x09>\xb3\x84`\xc7\x8a\
+1\x0a\x80x\x05b\xfd\xb1\x06\x1cq\x9cw\x02\x0f\x1f\
+q<\x87R@\x01\x05Z\x10\x88\x15\xfe\xe2\xa1\xbfM\
+\x0bI\xf6<`\x07\xe0\xe4B\xe2\x1d-\xcc(\x00\xa2\
+\x22\x8a\xa5\x1bkj\xb1\x0c\xe5\x1d\x80?\xd5\x94\x94\xb9\
+(\xa0\x80\x02\x13\x0bl\x90\xd6\xf8\xbf\xf9\xc4qt\x19\
+\xfeA\x85mJ\xd4%\xb7\x85\x8e\x8d\x02\xe0G\x05\xad\
+\xd9<K\xb2\xbf\x02n\x0d\x9c>\xcb\xc1\x1e\xa3\x80\x02\
+\x0a(0\xb3@\xec\xee\x17\xbb\xfc\x95\xd2^\x0a<\xbb\
+\x94`\xc7\x8e3\x0a\x80o\x017\x1d{\xe0\x81\xc6;\
+?\xadA\x1d\xbbP\xd9\x14P@\x01\x05\xfa\x13\x88\x0f\
+\xd2\x17\xf7\xd7\xdd\xe0=}\x02\xb8\x8f\x1b\xbe\xad\xdd9\
+\x0a\x80\x13\xd2\xda\xf8\x83\xcf\xc6\x08\x03<\x168x\x84\
+q\x1cB\x01\x05\x14hI v\xcb\x8b%\xd4\xd7)\
+$\xe9\xef\xa5\xb5\x09\xce.$\xdeI\xc2\x8c\x02\xe0(\
+`\xe7IF\xefw\xd0\xb7\x03\xb1\x16\xb5M\x01\x05\x14\
+P\xa0?\x81\xf8\xbd\xff8`\xa3\xfe\xba\x1c\xb4\xa7\xd8\
+\xe5u\x1b\xe0\x07\x83\x8eRA\xe7Q\x00\x94\xb6\x90\xc3\
+\x9a\xd8\x7f\x0d\xdc\x08\xf8M\x05sb\x0a\x0a(\xa0@\
+.\x02\xd7KK\xe6n\x91K@+\xc4q1\xb0\x1b\
+\xf0\xa9B\xe2\x9d4\xcc(\x00J\xfb]gM`\x8f\
+.l\x17\xaaI'\xdd\xc1\x15P@\x81\x19\x04b\x8d\
+\xff/\x16\xf6\x90\xf8\xbe\xc0\x813\xe4\xe6!@\x14\x00\
+\xf1\x8a\xc4\xfb\x0a\xd6\x88\x0d\x1d\xe2\x95?7\xf9)x\
+\x12\x0d]\x01\x05\xb2\x12\xb8*p,p\x93\xac\xa2Z\
+>\x98w\x03\x0f-(\xde\xc9C\x8d\x02 \xb6D\x8c\
+\xf7\xe6Kl\x17\x02\xb7\x04b\xb3\x1f\x9b\x02\x0a(\xa0\
+\xc0\xe2\x02W\x07>\x99>\x1b\x16\xefm\x9c\x1e\xbe\x0a\
+\xdc\xde\xb5_\xbaaG\x01\xb0\x09pV\xb7\xd3\xb29\
+:n\xf5\xc4-\x1f\x9b\x02\x0a(\xa0\xc0\xe2\x02\xf1J\
+x\xbc>\xb7\xd5\xe2]\x8d\xd6C\xac\xfd\x12_d\x7f\
+6\xda\x88\x95\x0c\x14\x05@\xb43\x80\xcd\x0a\xcb\xe9\x1c\
+ ~\xa3r\x8b\xdf\xc2&\xcep\x15P K\x81{\
+\xa4\x9f\x837\xcc2\xba5\x07\x15k\xbf\xc4\xbe\x04\xf1\
+\xac\x82\xad\xa3\xc0R\x01\xf0\x91\xb4`B\xc7\xd3'=\
+\xfc\x1d\x85mC9)\x96\x83+\xa0\x80\x02\xcb\x08<\
+\x19x\x15p\xb9\xc2\x94\x1e\x03\x1cRX\xcc\xd9\x84\xbb\
+T\x00\xfcG\x81\xbb\xe6\xdd5\xada\x90\x0d\xa6\x81(\
+\xa0\x80\x02\x85\x09\xc4>0\xafK\x0f\x83\x17\x16:\xaf\
+\x07\x9eXZ\xd09\xc5\xbbT\x00l\x0d|=\xa7\xc0\
+f\x88%v\xa2\xfa\xed\x0c\xc7y\x88\x02\x0a(\xa0\xc0\
+e\x05bM\xff\xf8\x10-\xed\xe7\xdf\xc8\xe4\x18`\x17\
+ \x1e\x04\xb7\xcd)\xb0T\x00\xc4\xf2\x8e\xb1\x98\xceU\
+\xe6\xecg\xec\xd3\xe2\xf7\xffRV\xa5\x1a\xdb\xc6\xf1\x14\
+P@\x81\xe5\x04\xe2)\xff\xf8\xe0\x7f@\xa1L?\x06\
+n\x9b>\xb3\x0aM!\x8f\xb0\x97\x0a\x80\x88\xa6\xa4\xe7\
+\x00\xe2\xc1\xbf\x8d\xdd\xe4!\x8f\x8b\xc8(\x14P\xa0\x08\
+\x81\xf8}\xff\x11\xc0\x01\x05o\x01\x7f\x1ep;\xe0\x1b\
+E\x88g\x1e\xe4\xaa\x05\xc0>\xc0A\x99\xc7\xbbjx\
+7\xf3\xfd\xff\x82f\xcbP\x15P`J\x81\xd8\x15/\
+\xb6\xc6\xbd\xf1\x94A\xf40\xf6\x03\x81\x0f\xf6\xd0\x8f]\
+\xa4\x95\x00\x97 \xe27\xf5_\x00\x97/Df/\xe0\
+-\x85\xc4j\x98\x0a(\xa0\xc0\x14\x02\xb1J\xea\xcb\x81\
+\xed\xa7\x18\xbc\xe71_\x02<\xa7\xe7>\x9b\xeen\xd5\
+;\x00\x01\x11\xdb=\xde\xbb\x10\x91\xd8\xf67\xb6\xff\xb5\
+)\xa0\x80\x02\x0a\xfc\xbd\xc0v\xc0s\x81x\xb7\xbf\x86\
+\xf6\xf1\xf4\xaa\xbaK\xbe\xf78\x9b\xab\x17\x00\xf1T\xe8\
+\x07z\xec\x7f\xc8\xae~\x99\xd6\xa9\xf6M\x80!\x95\xed\
+[\x01\x05J\x11X\x1f\xd8#\xbd\x1aw\xebR\x82\x9e\
+!\xce\xef\x02\xdb\x02\xf1\xf0\xb7\xadG\x81\xd5\x0b\x80\xb8\
+\x80bY\xc5R\x9e\xb0\x8fb%63\xb2)\xa0\x80\
+\x02\xad\x0a\x5c\x1bx\x1c\x10?\x8b\xc6{\xfd5\xb5\xdf\
+\xa5'\xfeO\xa9)\xa9\x5crY\xbd\x00\x88\xb8bU\
+\xa5\xd8^\xb7\x94\xf6\x1e\xe0Q\xc0\x9fK\x09\xd88\x15\
+P@\x81\x05\x05b\x19\xf4x\xb0o\xf7\xb4\x14ni\
++\xf8\xcd\x92\xfeE\xc0n\xc0\x91\xb3\x1c\xec1\xdd\x05\
+\xd6T\x00\xc4S\xa2\xb1\xbb\xde\x9a\xfe]\xf7\x11\xc69\
+\xe3\xff\xd2\x1b\x0c\x87\x16\xbc\xb1\xd18R\x8e\xa2\x80\x02\
+\xa5\x0a\xdc\x08\xb8o\xfa\xdb\xa6\xb0\xffF\xcfc\xfe\xf4\
+\xb4<\xf1<\xe7z\xce\x0c\x02k\xfb\x90?,]d\
+3t\x91\xd5!\x7fJ\xaf\x88\xbc\x19\xf8\x8a[Cf\
+57\x06\xa3\x80\x02\xb3\x0b\xc47\xfc\xf8\x1d\x7f\xd5\xbf\
+-g?\xbd\xf8#\xdf\x05<\xac\xf8,2O`m\
+\x05@\xac\xb2tb\xe6\xb1\xcf\x12\xde\xd9\xe9\x99\x86x\
+\xaea\xe9\xcf\x07If\x91\xf3\x18\x05\x14\x18C\xe0J\
+iK\xf6\xd8\x96}\xe9os V\xebk\xb5\xc5\x97\
+\xb7\x1d\xfd\x027\xfc\xf4/w\x9b\xff(`\xe7\xe1C\
+p\x04\x05\x14P@\x01\x05.\x15\x88\xb7\xbbn\x03\x9c\
+\xae\xc7\xf0\x02\xcb\x15\x00w\x02>;|\x08\x8e\xa0\x80\
+\x02\x0a(\xa0\x00\xb1\xc4{|\xee\xc4\x1d\x00\xdb\x08\x02\
++=\xe8W\xd2\xfe\x00#p9\x84\x02\x0a(\xa0\xc0\
+\x00\x02\xf1\x16W<\xf1\xff\x99\x01\xfa\xb6\xcb\xb5\x08\xac\
+T\x00\xc4\xfb\xa5\xdf\x016PP\x01\x05\x14P@\x81\
+\x01\x04\xe2u\xbfX\xcf\xe5C\x03\xf4m\x97\xcb\x08\xac\
+T\x00\xc4\xa9\xf1*\xc6\x81**\xa0\x80\x02\x0a(0\
+\x80\xc0c\xd2\xfa3\x03tm\x97\xcb\x09\xccR\x00\xac\
+\x0b|\x0d\x88\xdd\xf7l\x0a(\xa0\x80\x02\x0a\xf4%\xb0\
+_\xda\xac\xa8\xaf\xfe\xec\xa7\x83\xc0,\x05@t\x17\xfb\
+/\x1f\x07\xac\xd3\xa1o\x0fU@\x01\x05\x14P`m\
+\x02\xafJw\x98\x15\x9aH`\xd6\x02 \xc2{a\xda\
+]j\xa2P\x1dV\x01\x05\x14P\xa0\x12\x81\xb7\xa5%\
+\xe7\xdd\xddo\xc2\x09\xedR\x00\xc4\xb7\xff\xa3\xd3k\x1a\
+\x13\x86\xec\xd0\x0a(\xa0\x80\x02\x05\x0b\xbc\x02x&\xe0\
+\x87\xff\xc4\x93\xd8\xa5\x00\x88Pc\x85\xaa\x93\x81-&\
+\x8e\xdb\xe1\x15P@\x01\x05\xca\x12\xb8 \xedZ\xf8\x96\
+\xb2\xc2\xae7\xda\xae\x05@H\xec\x94\xee\x04\xd4\xb8\xfb\
+T\xbd3mf\x0a(\xa0\xc0t\x02g\x01\x0fpq\
+\xb9\xe9&`M#\xcfS\x00D?q\xfb\xe6ey\
+\xa5b4\x0a(\xa0\x80\x02\x19\x0a\x9c\x9a\x16\xf9\x89]\
+[m\x19\x09\xcc[\x00D\x0aoH\xb7s2J\xc7\
+P\x14P@\x01\x052\x12\x88\xb7\xc7v\x07~\x93Q\
+L\x86\x92\x04\x16)\x00\xe2\xa1\xc0\x0f\x00\xf7WS\x01\
+\x05\x14P@\x81\xd5\x04\xde\x09\xec\x05\x9c\xafL\x9e\x02\
+\x8b\x14\x00\x91\xd1\x15\x80#\x81;\xe6\x99\x9eQ)\xa0\
+\x80\x02\x0a\x8c,\x10[\xae?\x0d8x\xe4q\x1d\xae\
+\xa3\xc0\xa2\x05@\x0c\xb71p,p\xf3\x8ec{\xb8\
+\x02\x0a(\xa0@]\x02\xb1\x99\xcf\xa3\x81\xd3\xeaJ\xab\
+\xcel\xfa(\x00B&^\x0f<\x02\xb8e\x9dLf\
+\xa5\x80\x02\x0a(\xb0\x8c\xc0\x1f\x80g\x00o\xf4\xfd\xfe\
+r\xae\x93\xbe\x0a\x80\xc8xC\xe00\xe0.\xe5\xa4o\
+\xa4\x0a(\xa0\x80\x02\x0b\x0a|\x1ex$\xf0\xa3\x05\xfb\
+\xf1\xf4\x91\x05\xfa,\x00\x22\xf4\xf5\x80C\xd3\xd6\x8e#\
+\xa7\xe2p\x0a(\xa0\x80\x02#\x0a\x9c\x97^\x09\x7f\x9d\
+\xdf\xfaGT\xefq\xa8\xbe\x0b\x80\x08-\xde\x0ex\x0d\
+\xf0\xef=\xc6iW\x0a(\xa0\x80\x02\xf9\x08\xc4o\xfd\
+\xfb\x00\xa7\xe4\x13\x92\x91t\x15\x18\xa2\x00X\x8a\xe1\xc9\
+\xc0\x81\xc0\xe5\xbb\x06\xe5\xf1\x0a(\xa0\x80\x02Y\x0a|\
+\x15\x88-|\x8f\xca2:\x83\xea$0d\x01\x10\x81\
+l\x9b\xd6\x0a\xb8v\xa7\xa8<X\x01\x05\x14P '\
+\x81\x1f\x00\xcf\x01>\xe8\xed\xfe\x9c\xa6e\xb1X\x86.\
+\x00\x22\xba\xab\xa6\xe7\x02v[,T\xcfV@\x01\x05\
+\x14\x18Y\xe0\xe7\xc0\xfe\xc0[\x81\x0bG\x1e\xdb\xe1\x06\
+\x16\x18\xa3\x00\x88\x14b\x9c}\x81\x17\xf9\x93\xc0\xc03\
+j\xf7\x0a(\xa0\xc0\xe2\x02\xb1y\xcf\x01\xc0\x7f\x01\x7f\
+\x5c\xbc;{\xc8Q`\xac\x02`)\xf7\x9b\xa4\xf7D\
+o\x9f#\x861)\xa0\x80\x02\x8d\x0b\xc4\x9a\xfd\xf1.\
+\xff+\x81\xdf5nQ}\xfac\x17\x00Kw\x03\xe2\
+\x9d\xd1W\x00\x9bV/l\x82\x0a(\xa0@\xfe\x02_\
+\x01\xe2u\xbe\xf7\x03\x7f\xca?\x5c#\xecC`\x8a\x02\
+`)\xee\xf8\xf0\x8f\xb7\x04\xf6L?\x11\xf4\x91\x8f}\
+(\xa0\x80\x02\x0a\xcc&\xf0\xe7\xf4\x90v|\xf0\x9f8\
+\xdb)\x1eU\x93\xc0\x94\x05\xc0\x92\xe3\x8d\xd3b\x12\x0f\
+\x06\xd6\xad\x09\xd7\x5c\x14P@\x81\x0c\x05~\x02\x1c\x04\
+\x1c\x02\xfc:\xc3\xf8\x0ci$\x81\x1c\x0a\x80\xa5T\xaf\
+\x93\x1e\x14\x8c\x9f\x07\xd6\x1f)\x7f\x87Q@\x01\x05Z\
+\x10\x88\x07\xf9\x8e\x06\xde\x02|\x02\xb8\xa8\x85\xa4\xcdq\
+y\x81\x9c\x0a\x80\xa5H\xb7\x00\xf6\x06\xfe\x0d\xb8\x81\x13\
+\xa8\x80\x02\x0a(0\x97\xc0/\xd3\x87\xfd\xc7\xd3\x87\x7f\
+,\xddkS\xe0\xaf\x029\x16\x00\xabNO,$\x14\
+\x85\xc0\x1e\xc0f\xce\x9b\x02\x0a(\xa0\xc0\xb2\x02\xdf\x04\
+\xe2\x03\xffc\xc0I.\xda\xe3\xd5\xb2\x9c@\xee\x05\xc0\
+R\xec\xf1l@\xec2\xb8\x0b\xb0\x13\xb05p9\xa7\
+V\x01\x05\x14hX n\xe3\x7f\x0f8\x198!}\
+\xdb?\xada\x0fS\xef(PJ\x01\xb0zZ\x1b\x03\
+;\xa6b`\x1b\xe0\xfa\xc0\x96\x1ds\xf7p\x05\x14P\
+\xa0\x14\x81s\x81\xf8v\x1f\x1f\xf6K\x7f\xdf\xf2\x95\xbd\
+R\xa6/\xcf8K-\x00\xd6\xa4\xb9\x01p\xddT\x0c\
+DA\x10\xcf\x12\x5cy\x0d\x7f\xb1eqMy\xe7y\
+e\x19\x95\x02\x0a\xac$pIZe/\x16\xdcY\xfd\
+\xef\xf7\xab\xfc\xff~\x94v\xdd\xbbx\xa5\x0e\xfd\xf7\x0a\
+t\x11\xf0\x83\xb0\x8b\x96\xc7*\xa0\x80\x02\x0a(P\x89\
+\x80\x05@%\x13i\x1a\x0a(\xa0\x80\x02\x0at\x11\xb0\
+\x00\xe8\xa2\xe5\xb1\x0a(\xa0\x80\x02\x0aT\x22`\x01P\
+\xc9D\x9a\x86\x02\x0a(\xa0\x80\x02]\x04,\x00\xbah\
+y\xac\x02\x0a(\xa0\x80\x02\x95\x08X\x00T2\x91\xa6\
+\xa1\x80\x02\x0a(\xa0@\x17\x01\x0b\x80.Z\x1e\xab\x80\
+\x02\x0a(\xa0@%\x02\x16\x00\x95L\xa4i(\xa0\x80\
+\x02\x0a(\xd0E\xc0\x02\xa0\x8b\x96\xc7*\xa0\x80\x02\x0a\
+(P\x89\x80\x05@%\x13i\x1a\x0a(\xa0\x80\x02\x0a\
+t\x11\xb0\x00\xe8\xa2\xe5\xb1\x0a(\xa0\x80\x02\x0aT\x22\
+`\x01P\xc9D\x9a\x86\x02\x0a(\xa0\x80\x02]\x04,\
+\x00\xbahy\xac\x02\x0a(\xa0\x80\x02\x95\x08X\x00T\
+2\x91\xa6\xa1\x80\x02\x0a(\xa0@\x17\x01\x0b\x80.Z\
+\x1e\xab\x80\x02\x0a(\xa0@%\x02\x16\x00\x95L\xa4i\
+(\xa0\x80\x02\x0a(\xd0E\xc0\x02\xa0\x8b\x96\xc7*\xa0\
+\x80\x02\x0a(P\x89\x80\x05@%\x13i\x1a\x0a(\xa0\
+\x80\x02\x0at\x11\xb0\x00\xe8\xa2\xe5\xb1\x0a(\xa0\x80\x02\
+\x0aT\x22`\x01P\xc9D\x9a\x86\x02\x0a(\xa0\x80\x02\
+]\x04,\x00\xbahy\xac\x02\x0a(\xa0\x80\x02\x95\x08\
+X\x00T2\x91\xa6\xa1\x80\x02\x0a(\xa0@\x17\x01\x0b\
+\x80.Z\x1e\xab\x80\x02\x0a(\xa0@%\x02\x16\x00\x95\
+L\xa4i(\xa0\x80\x02\x0a(\xd0E\xc0\x02\xa0\x8b\x96\
+\xc7*\xa0\x80\x02\x0a(P\x89\x80\x05@%\x13i\x1a\
+\x0a(\xa0\x80\x02\x0at\x11\xb0\x00\xe8\xa2\xe5\xb1\x0a(\
+\xa0\x80\x02\x0aT\x22`\x01P\xc9D\x9a\x86\x02\x0a(\
+\xa0\x80\x02]\x04,\x00\xbahy\xac\x02\x0a(\xa0\x80\
+\x02\x95\x08X\x00T2\x91\xa6\xa1\x80\x02\x0a(\xa0@\
+\x17\x01\x0b\x80.Z\x1e\xab\x80\x02\x0a(\xa0@%\x02\
+\x16\x00\x95L\xa4i(\xa0\x80\x02\x0a(\xd0E\xc0\x02\
+\xa0\x8b\x96\xc7*\xa0\x80\x02\x0a(P\x89\x80\x05@%\
+\x13i\x1a\x0a(\xa0\x80\x02\x0at\x11\xb0\x00\xe8\xa2\xe5\
+\xb1\x0a(\xa0\x80\x02\x0aT\x22`\x01P\xc9D\x9a\x86\
+\x02\x0a(\xa0\x80\x02]\x04,\x00\xbahy\xac\x02\x0a\
+(\xa0\x80\x02\x95\x08X\x00T2\x91\xa6\xa1\x80\x02\x0a\
+(\xa0@\x17\x01\x0b\x80.Z\x1e\xab\x80\x02\x0a(\xa0\
+@%\x02\x16\x00\x95L\xa4i(\xa0\x80\x02\x0a(\xd0\
+E\xc0\x02\xa0\x8b\x96\xc7*\xa0\x80\x02\x0a(P\x89\x80\
+\x05@%\x13i\x1a\x0a(\xa0\x80\x02\x0at\x11\xb0\x00\
+\xe8\xa2\xe5\xb1\x0a(\xa0\x80\x02\x0aT\x22`\x01P\xc9\
+D\x9a\x86\x02\x0a(\xa0\x80\x02]\x04,\x00\xbahy\
+\xac\x02\x0a(\xa0\x80\x02\x95\x08X\x00T2\x91\xa6\xa1\
+\x80\x02\x0a(\xa0@\x17\x01\x0b\x80.Z\x1e\xab\x80\x02\
+\x0a(\xa0@%\x02\x16\x00\x95L\xa4i(\xa0\x80\x02\
+\x0a(\xd0E\xc0\x02\xa0\x8b\x96\xc7*\xa0\x80\x02\x0a(\
+P\x89\x80\x05@%\x13i\x1a\x0a(\xa0\x80\x02\x0at\
+\x11\xb0\x00\xe8\xa2\xe5\xb1\x0a(\xa0\x80\x02\x0aT\x22`\
+\x01P\xc9D\x9a\x86\x02\x0a(\xa0\x80\x02]\x04,\x00\
+\xbahy\xac\x02\x0a(\xa0\x80\x02\x95\x08X\x00T2\
+\x91\xa6\xa1\x80\x02\x0a(\xa0@\x17\x01\x0b\x80.Z\x1e\
+\xab\x80\x02\x0a(\xa0@%\x02\x16\x00\x95L\xa4i(\
+\xa0\x80\x02\x0a(\xd0E\xc0\x02\xa0\x8b\x96\xc7*\xa0\x80\
+\x02\x0a(P\x89\x80\x05@%\x13i\x1a\x0a(\xa0\x80\
+\x02\x0at\x11\xb0\x00\xe8\xa2\xe5\xb1\x0a(\xa0\x80\x02\x0a\
+T\x22`\x01P\xc9D\x9a\x86\x02\x0a(\xa0\x80\x02]\
+\x04,\x00\xbahy\xac\x02\x0a(\xa0\x80\x02\x95\x08X\
+\x00T2\x91\xa6\xa1\x80\x02\x0a(\xa0@\x17\x01\x0b\x80\
+.Z\x1e\xab\x80\x02\x0a(\xa0@%\x02\x16\x00\x95L\
+\xa4i(\xa0\x80\x02\x0a(\xd0E\xc0\x02\xa0\x8b\x96\xc7\
+*\xa0\x80\x02\x0a(P\x89\x80\x05@%\x13i\x1a\x0a\
+(\xa0\x80\x02\x0at\x11\xb0\x00\xe8\xa2\xe5\xb1\x0a(\xa0\
+\x80\x02\x0aT\x22\xf0\xff\x01\x1e?\x9ah\x10D\xef \
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x84\x16\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x02\x00\x00\x00\x02\x00\x08\x06\x00\x00\x00\xf4x\xd4\xfa\
+\x00\x00\x83\xddIDATx\xda\xed]\x09\x98\x1cE\
+\xd9\xce\xb2\xb3\xd9\xc9d]\x8e\x10v\xfb\xaa\xee\x9e\x99\
+\xddMv\x93lHB\x0eH`Q\x04\x05\x119\x04\
+\x05\xe4\xf0\xbeo\x7f\xc53\xf8\x83\x80\x80\x8a'`@\
+\xc2\x8d\xf7\xc5!*\x82r\x0b\x82x\x00\x22x\xa0\x80\
+\xdcrC\x8e\xff\xff*\xd3\x1d:\x9b\xd9\x9e\xea\xd9\xee\
+\xae\xea\xeew\x9f\xa7M\x0c\xb3\xefT}_\xd5\xf7\xbe\
+\xd5U\xf5}S\xa6\xe0\x07?\xf8\xc1\x0f~\xf0\x83\x1f\
+\xfcD\xfd\xd9m\xb7\xb1\x0ez\xb6\x08<\x1d\xc0\x03\x1e\
+\xf0\x80\x07<\xe0\x01/[xQ\xbf\xbcs\xfc\x03<\
+\xe0\x01\x0fx\xc0\x03\x1e\xf0\xb2\x85\x17Uu\x94\xe8\xe9\
+\x0a<\xa5v\xd5\x07\xf0\x80\x07<\xe0\x01\x0fx\xc0K\
+\x1f\xaf\x9d/\xe7_85\xf0tM\xb23\xc0\x03\x1e\
+\xf0\x80\x07<\xe0\x01/E\xbcv\xbe\xbc\x9b\x9er\xe0\
+\xe9\x9edg\x80\x07<\xe0\x01\x0fx\xc0\x03^\x8ax\
+\xed|9\xff\xc2i\x81\xa7<\xc9\xce\x00\x0fx\xc0\x03\
+\x1e\xf0\x80\x07\xbc\x14\xf1|L\xd1\x0f\xf2\xd3\x85\x15z\
+\xa6\x07\x1e\xfe\xff\xb7h\xf3\x8b\x81\x07<\xe0\x01\x0fx\
+\xc0\x03^\xfax\x1d\xde\xa1\xc1-D\xbf\x9c\x7faO\
+\xe0\x99>\xc9\xce\x00\x0fx\xc0\x03\x1e\xf0\x80\x07\xbct\
+\xf1\xfc\x03\x84\xad\x05@\xe0\xcb{\x03O\xcf$;\xd3\
+\x03<\xe0\x01\x0fx\xc0\x03\x1e\xf0R\xc5\xeb\x08\xdc\x1a\
+\x08\x17\x00\xde\x87+\x81\x06l\xe9\xfd9\x99\xce\xf88\
+[\x02\x0fx\xc0\x03\x1e\xf0\x80\x07\xbcT\xf0\xfc\x03\x84\
+S\x03\x02\xa0#\xec\xc3\xe5\xc0\xab\x87^\x18\x1bx\xc0\
+\x03\x1e\xf0\x80\x07\xbcL\xe2\xf9\xb7\x066\x0a\x80VJ\
+a\xda\xb8\xbd\x07\x18\x1bx\xc0\x03\x1e\xf0\x80\x07\xbcl\
+\xe1U\x02\xb7\x06\xb8\x00(\xb5\xda#(\x07\x04\xc0t\
+\x18\x1bx\xc0\x03\x1e\xf0\x80\x07\xbc\xcc\xe1\xf9\x1c\xee\x0b\
+\x80\xae\xb0W\xff%O!\xf8\x02\xa0\x02c\x03\x0fx\
+\xc0\x03\x1e\xf0\x80\x979\xbc\xe0\xad\x81i\xa1I\x83\xbc\
+C\x01]\x01\x01P\x86\xb1\x81\x07<\xe0\x01\x0fx\xc0\
+\xcb$^o@\x00\x94[\x1d\xfa\x0b\x0a\x80\xc9\xa4+\
+\x84\xf3\x80\x07<\xe0\x01\x0fx\xc0\x93\x8b\xe7\x0b\x80J\
+(\x9f{\xbf\xd4\x19\xb8#\x08\xf2\x07\x1e\xf0\x80\x07<\
+\xe0\x01/\xbbx\xbdBg\xf8\x02\x02\xa0\x04\xf2\x07\x1e\
+\xf0\x80\x07<\xe0\x01/\xf3xb\xb7\xf7\x02\x02\x00\xe4\
+\x0f<\xe0\x01\x0fx\xc0\x03^Q\xf0&YQ\x08\xc6\
+\x06\x1e\xf0\x80\x07<\xe0\x01/\xe3x0\x0e\xf0\x80\x07\
+<\xe0\x01\x0fx \x7f\x18\x07x\xc0\x03\x1e\xf0\x80\x07\
+<\x90?\x8c\x0d<\xe0\x01\x0fx\xc0\x03\x1e\xc8\x1f\xc6\
+\x06\x1e\xf0\x80\x07<\xe0\x01\x0f\xe4\x0f<\xe0\x01\x0fx\
+\xc0\x03\x1e\xf0@\xfe\xc0\x03\x1e\xf0\x80\x07<\xe0\x01O\
+E\xf2\x17\xbe\xfd\x07c\x03\x0fx\xc0\x03\x1e\xf0\x80\x97\
+\x0b<?\xf5\xbfp\x92\xa0\x1e\x18\x1bx\xc0\x03\x1e\xf0\
+\x80\x07\xbc\xcc\x93\x7fIH\x00\x04\xea\x09\xf7\xc2\xd8\xc0\
+\x03\x1e\xf0\x80\x07<\xe0e\x9a\xfc\xfdz?\xe1\x02\xc0\
+\xfbp\xc5[\xfd\xf7\xc2\xd8\xc0\x03\x1e\xf0\x80\x07<\xe0\
+e\x96\xfc\xbb\xbdj\xbf]\xa1\xa9\xff\xbd\x0f\x97\xbd\xd5\
+\x7fO\xa0\xb60\x8c\x0d<\xe0\x01\x0fx\xc0\x03^\xb6\
+\xf0\xca\xde\xb3Q\x00\xb4R\x0a\xd3\x02\x02\xa0\x07\xc6\x06\
+\x1e\xf0\x80\x07<\xe0\x01/sx\x15\x8f\xcf}\x01P\
+j\xb5GP\x0e\x08\x80\xe906\xf0\x80\x17\x1f\xde\xcc\
+\x993{\x0c\xc3XbY\xc6\xeb]\xd7\xfe\x0c=\xa7\
+\xd0\xf3M\xd7e\xe7\xda6;\x8f\xfe}\xb5i\x1ag\
+E}\xf8\xef\xf1\xdfw\x1cv\xbe\xff\xa8\x84\xc7\x98\xf9\
+-\xfa\xfdU\x84\xf3\x85Z\xcd\xf9h\xbd\xee\x1c<8\
+X_P\xab\xb9%\x8c\x17\xe0\x01/\x11<\x9f\xc3}\
+\x01\xd0\x15\xf6\xea\xbf\xe4)\x04_\x00T`l\xe0\x01\
+orx\x9a\xa6U,K\x7f\xb5ij\xa7\xd2\x9f\x7f\
+ \x02]K\xcf\xff\xd9\xb6\xb5\xd9\xc3\xff\xbd\xdd'\xc3\
+xO\x92m~I\xb6\xf9\x84\xae\xeb\xf31\xfe\x80\x07\
+\xbcX\xf0\xfc\xb7\xf7\xbe\x00\xe8\x0e#\xffNO\x1dL\
+\x0d\xec\x17\xc0\xd8\xc0\x03^{x\x1d\x8c\xe9\xbb\xd1J\
+\xffB\xcb\xd2\x9e\xc9\x11Y\xa7\x80\xa7\xdde\x9a\xfag\
+\xc8v&\xc6\x1f\xf0\x80\xd76^o@\x00\x94[\x1d\
+\xfa\x0b\x0a\x80n\xe1,A06\xf0\x80\x17\xfc)\xd1\
+J\xf6p\x22\xb2;\x8bA\xd6\x89\xe2\xad\xa1\xe7|\xd3\
+4\xe7`\xfc\x01\x0fx\x91\xf1|\x01P\x09\xe5s\xef\
+\x97:\x03w\x04A\xfe\xc0\x03^D<Z\xb9\xee\xc3\
+W\xaf\x05%\xeb$\xf1\xd6\x99\xa6~\xb6M\xbf\x8c\xf1\
+\x07<\xe0\x09\xe3\xf5\x0a\x9d\xe1\x0b\x08\x80\x12\xc8\x1fx\
+\xc0\x8b\x86\xa7i\x1a#\xe2\xbf\x18d\x9d8\xde\xd3\xd5\
+\xaas\xd4\x8a\x15\xcb\xb6\xc6\xf8\x03\x1e\xf0Z\xe2\x89\xdd\
+\xde\x0b\x08\x00\x90?\xf0\x80\x17\x01\xcf\xb2\xf4\x83\x0cC\
+{\x0cd\x9d\x1e\x9e\xe3XW\x0f\x0f\xcf\x1e\xc2\xf8\x03\
+\x1e\xf0b\xc0k\x97\xf8al\xe0\x15\x18\xaf\x93\x88\xe9\
++ kix\x0f\x1a\x861\x86\xf1\x0c<\xe0\xa1D\
+0\xf0\x80\x97\x1a^\xbd\xbeM/\x91\xcf\xe5 k\xb9\
+x\x86\xa1\xbd@\x7f\x1e\x86\xf1\x0c<\xe0\x81\xfc\x81\x07\
+\xbc\xc4\xf1l\xdb\xde\xca\xb2\xb4\x1b@\xd6\xca\xe0\xad7\
+M\xf3=\x18\xcf\xc0\x03\x1e\xc8\x1fx\xc0Kx\xe5\xaf\
+\xff\x16d\xad\x22\x9e\xfe\x0e\x8cg\xe0\x01\x0f\xe4\x0f<\
+\xe0%\x81W2\x0c\xe3g ke\xf1\xd6\x99\xa6\xb9\
+/\xc63\xf0\x80\x07\xf2\x07\x1e\xf0b\xc5#\x82\xf9\x1a\
+\xc8Zy\xbc\xa7H\xa4\xcd\xc3x\x06\x1e\xf0@\xfe\xc0\
+\x03^,x\x8c\x19\x07\x80\x5c\xb3\x82\xa7\xfd\x85\x17[\
+\xc2x\x06\x1e\xf0Zbv\xc08\xc0\x03^\x08\x9e\xae\
+\xeb\x16\xee\xf9g\x0b\x8f\x04\xdb*\x8cg\xe0\x01ob\
+\xe2\xf7\xf2\xfe\x08'\x09\xea\x81\xb1\x81WD<\xc30\
+~\x08r\xcd\x1e\xde\xe0`uo\x8cg\xe0\x01\xaf)\
+\xf9\x97\x84\x04@\xa0\x9ep/\x8c\x0d\xbc\xa2\xe1\xd1J\
+r/\x90k6\xf1\x18cw,Y\xb2p\x06\xc63\
+\xf0\x80\xb7\x09\xf9\xfb\xf5~\xc2\x05\x80\xf7\xe1\x8a\xb7\xfa\
+\xef\x85\xb1\x81W0\xbc-h\xf5\xff'\x90kv\xf1\
+\xaaU\xe7}\x18\xcf\xc0\x03\xdeF>\xef\xf6\xaa\xfdv\
+\x85\xa6\xfe\xf7>\x5c\xf6V\xff=\x81\xda\xc206\xf0\
+\x0a\x81\xc7s\xfc\x83\x5c3\x8f\xf7\xcf\xe1\xe1\xe1\xa9\x18\
+\xcf\xc0\x03\xde\x06>/\x07\x05@+\xa50- \x00\
+z`l\xe0\x15\x09\xcf\xb2\xb4\xdf\x83\x5c\xf3\x80\xa7\x1f\
+\x81\xf1\x0c\xbc\x82\xe3U<>\xf7\x05@\xa9\xd5\x1eA\
+9 \x00\xa6\xc3\xd8\xc0+\x12\x9ea\x18KA\xae\xf9\
+\xc0#_\xde\x84\xf9\x01\xbc\x02\xe3\xf9\x1c\xee\x0b\x80\xae\
+\xb0W\xff%O!\xf8\x02\xa0\x02c\x03\xafhxD\
+\x1cg\x80\x5c\xf3\x83\x17L\x0e\x84\xf9\x01\xbc\x02\xe1\xf9\
+o\xef}\x01\xd0\x1dF\xfe\x9d\x9e:\x98\x1a\xd8/\x80\
+\xb1\x81W4\xbcR\xb3{\xff \xd7\xec\xe2\x99\xa6~\
+<\xe6\x07\xf0\x0a\x88\xd7\x1b\x10\x00\xe5V\x87\xfe\x82\x02\
+\xa0[8K\x10\x8c\x0d\xbc\x1c\xe1\xd1jqW\x90k\
+\xbe\xf0\xc8\xa7\xf7`~\x00\xaf\x80x\xbe\x00\xa8\x84\xf2\
+\xb9\xf7K\x9d\x81;\x82 \x7f\xe0\x15\x12\x8f\xc8\xe2d\
+\x90k\xfe\xf0\x18\xd3\x16b~\x00\xaf`x\xbdBg\
+\xf8\x02\x02\xa0\x04\xf2\x07^\x91\xf1\x82\xa7\xffA\xae\xb9\
+\xc2;\x01\xf3\x03x\x05\xc3\x13\xbb\xbd\x17\x10\x00 \x7f\
+\xe0\x15\x16O\xd3\xb4m\x89(\xd6\x83\x5c\xf3\x87\x17\xdc\
+\x06\xc0\xfc\x00\x1e\xf0\xc6\x9d\x01\x98\xd2\xe6\x0f\x8c\x0d\xbc\
+\xbc\xe01f\xbc\x16\xe4\x9a_<\xbe\x0d\x80\xf9\x01<\
+\xe0\xc5\xf4\x03c\x03/Ox\x96e\x9e\x0ar\xcds\
+\x95@\xf3\xf3\x98\x1f\xc0\x03\x1e\xc8\x1fx\xc0\xdb\x0c\x8f\
+\xc8\xe5.\x90k~\xf1\x18\xb3\xfe\x8e\xf9\x01<\xe0\x81\
+\xfc\x81\x07\xbcM\xf0\x86\x87g\x0f\x81\x5c\xf3\x8f74\
+T\xdd\x05\xf3\x03x\xc0\x03\xf9\x03\x0fx\x1b\xf1\xeau\
+\xf7m \xd7\xfc\xe3\xb9\xae\xfd%\xcc\x0f\xe0\x01\x0f\xc6\
+\x01\x1e\xf06\xe2\xd96;O>yi\xbf\xa2?W\
+\xfa\x0fc\xe6\xd1DX\xc7\xd1s|\xe09\x8e\xff{\
+\xf0s\xa2\x8f\x02xO\xcb\x16\x13\xde6\x00\xe6\x07\xf0\
+@\xfe0\x0e\xf0\x80\xd7\xc0r\x1c\xeb^\xf9+W}\
+\xef<\xfb\xc34\xb5\xef\xa8\xf0&\xa1YR \xcc\x0f\
+\xe0\x15\x8d\xfc\x85o\xff\xc1\xd8\xc0\xcb3\xde\xec\xd9\xb3\
+\xe6+\xf0\xdazm\xbd\xbeMo\x9e\xfdA\x02\xe7@\
+E\xb6\x11N\xc0\xfc\x00^\x81\xf1\xfc\xd4\xff\xc2I\x82\
+z`l\xe0\xe5\x15\xcfq\x9c\xf7\xc8\xdf\xb3\xd6n\xc8\
+\xbb?4M\xab4\xdb\x06\x90P\x22\xf8\x9e<\x8c\xe7\
+\xe1\xe1\xe1\xa9\x8c\xb1\x99\xa3\xa3\x83\xb5\x91\x91\xd9\xb5\x05\
+\x0bFu\xc4\x03\xe0\x09\x90\x7fIH\x00\x04\xea\x09\xf7\
+\xc2\xd8\xc0\xcb+\x1ec\xc6\x85\xb2\x0f\xac\x99\xa6~\x5c\
+\x11\xfc1~\x1b@\xd6\x01B\x91m\x00U\xec7s\
+\xe6\xcc\x1e\xd34\xf7\xa01\xf2i\xcb\xd2\xbfGb\xf1\
+6\xc3\xd0\x1eo\xd6_\xfa\xb7\xe7I\xe0\xfc\xcd4\x8d\
+_\xd0\xe7O\xa1\xcf\x1fnYV\x0d\xf1\x00x\x1e\xf9\
+\xfb\xf5~\xc2\x05\x80\xf7\xe1\x8a\xb7\xfa\xef\x85\xb1\x8b\x85\
+\xd7\xd7\xd77\x9d\x02\xc9R\x1e@\x1a\x81\xc7\xf8*\xfd\
+\xfd\x5c\x0a,\xdf\xa6\xe7\x22\x0a\xe4\xab\xe9\xdf\xbfD\x7f\
+\xfe\x0f\xcf\xa0g\xdb\xf6\xdc\x1dvX\xb0u\x16\xfbK\
+\xfd|@~\x92\x1a}\x8fb\xd4Zxq\x1b@\xf2\
+\xed\x81\x13T\xb6\x9f\xebn\xd7G\xa4\xff\x1e~0\x94\
+\xc8\xfe\x85\xc9\xf6\x97\xbf\xf5\xe0\x82\x80\x84\xcfN\x88\x7f\
+\x85%\xffn\xaf\xdaoWh\xea\x7f\xef\xc3eo\xf5\
+\xdf\x13\xa8-\x0cc\xe7\x14o\xf9\xf2\x1dg\xd0Ja\
+\xcf\xc6\xaaaCA\x9cum\x04\xdfg\x1c\xc7\xfc\x8d\
+\xeb\xb2c\xea\xf5\xdaNY\xb0\x1f\xf5yD6\xf9S\
+\x80\x7f\x9e\xc4\xd3vE\x18\x7f\xfe6\x00J\x047\xc7\
+#\xd2\xdf\x85D\xd2\xf7\xa9\x8dk\x12\x1c\x7fw\xd2\xf3\
+\xfe\x193f\xbc\x04\xf1\xaf0xe\xef\xd9(\x00Z\
+)\x85i\x01\x01\xd0\x03c\xe7\x13oh\xa8\xb6\xb3m\
+\x9bg\x12\x09=\x16\x7f\xf0\xd5\xfeB\x82\xe2S\x8c\x96\
+\x1d\xaa\xda\xaf\xb1\xca\x92{O\xddq\xac\xab\x8b\x95q\
+\xd1\xfc!J\x04o\x8aG\x82dW\xd34\xaeIs\
+\xfc\xd1\x9c\x7f\x94\xfe\xfc\xd4\xf6\xdb\xcf\xebG<\xcd5\
+^\xc5\xe3s_\x00\x94Z\xed\x11\x94\x03\x02`:\x8c\
+\x9d?\xbcZ\xad\xb6?\x11\xf3ui\x04_\xfe\x0a\x93\
+\x82\xdbY\xba\xae\x0f\xaaf?j\xdf\x0fd'\xa9q\
+]v\x5c\x91\xc6_\xad\xe6\x1c\x81\x12\xc1\x8d\x1f\xc6\xfa\
+\xdc(c0\x89\xf1\xc7\x98y\x7f\xb5\xea\xbe\x05\xf14\
+\x97x>\x87\xfb\x02\xa0+\xec\xd5\x7f\xc9S\x08\xbe\x00\
+\xa8\xc0\xd8\xf9\xc2\x1b\x1c\x1c\x18#\xe2\xbfVR\xf0]\
+\xcb\xcf\x114\x13\x02\x92\xec\xb7\x85\xb7\x0a\x92\x9a\xa1n\
+`\xc0}e\x91\xc6\xf3\xa2E\xdbk|\xbb\xa8\xc8%\
+\x82M\xd3\x9cFm8\x9a\xc6\xdf\xb3\xaad\x5ct\x1c\
+\xeb\xe7\x8e\xe3\x98\x88\xa7\xb9\xc1\xf3\xdf\xde\xfb\x02\xa0;\
+\x8c\xfc;=u05\xb0_\x00c\xe7\x04ott\
+\x8e\xe6\xba\xf6i4\xd1\xd7)\xb0\xf2\xdaD\x08\xc8\xb2\
+\x1f\x7f\x05\xac@\xf0}fll\xc5\xb6E\x1b\xcf|\
+\x1b\xa0\xa8%\x82Ix\xecg\x9a\xc6\xdf\x15M\xb7\xfc\
+\x10\x89\x93W \x9e\xe6\x02\xaf7 \x00\xca\xad\x0e\xfd\
+\x05\x05@\xb7p\x96 \x18[y\xbcz\xbd\xbe+c\
+\xe6=\x0a\xe6j_\xcb\x98~\xde\xe0`}\x81\x9c\x03\
+W\xfaGd\x07_\xc6\xd8/\x0bz\xf5\xf2\xa0\xa2\x95\
+\x08\xb6mm\x16\x91\xff\xe5\x19\xa8\xb5\xb0\x8e\xcf\x0d\xc4\
+\xd3\xcc\xe3\xf9\x02\xa0\x12\xca\xe7\xde/u\x06\xee\x08\x82\
+\xfcs\x82\xc7\x93\xdcP\xb0}^\xf1B-k]\xd7\
+\xbahhh`a\x9a\xf6\xb3,\xfdR\xd9\xc1\xd7u\
+\xedO\x17q<\xf3k\xa6\x22\xb5\x01\xf2P\x22X\xd7\
+\xb5-\xe9\xbbN\x9c\xe8:\x9f\xaa\x85\x96\xf8\x8d \xea\
+V\x07\xe2if\xf1z\x85\xce\xf0\x05\x04@\x09\xe4\x9f\
+\x0f\xbc\xd1\xd19\x9d\xbc\xf2Y\xc6\xaa\xbe\xad%\xb1r\
+n\xab\xc3\x82q\xd8o\xe1\xc2\x85]\xd4\x86'e\x07\
+_\x22\xa0%E\x1d\xcf\xadj\x03\xe4\xa1D\xb0i\x9a\
+o \xe2\xbf/\xabU\x16I\x04\x9c\xd6L\x04 >\
+g\x02O\xec\xf6^@\x00\x80\xfcs\x80W\xab\xb9%\
+\xc7\xb1\xce\xcap\xc9W~F\xe0\x1cQ!\xd0\x8e\xfd\
+xB\x14\xd9\xfd\xe5W/\xa9)\x9dE\x1d\xcfa\xb5\
+\x01\xb2^\x22x`\xa0\xbe\xa3a\x18W\xe7\xa3\xc4\xb2\
+~zP\x04 >\xe7\x0c\xaf]\xe2\x87\xb1U%\x7f\
+vNN\xea\xbd\xb7\x14\x02\xed\xda\x8f\xe7'\x90\xdd_\
+\x22\x88\x1f\x15y<\x8bn\x03d\xa9D\xf0\xf6\xdb\x8f\
+\xda4\xff\xbe\xd9\x18\xbby \xffME\x00\xe23J\
+\x04\xc3\xd8 \xff\xb4\xf1\x9a\x0a\x81v\xedG\xc4;@\
+\x98\xb7\xc8\xee/c\xc6{\x8b>\x9eU)\x11\xcc\x13\
+\xf1L\xa6\xbf+V,\xdb\xbaVs\xdeGx\x0f\xe7\
+`\xbeMp^\xc2\xf8\xe6\xd8\xd8\xf2-\x11\x9fA\xfe\
+06\xc8_J\xc9\x5c.\x048\x81G\xb5\x9fw\xef\
+\xfa0\xfa\xdd_\xab\xd2_j\xd3\x9c\xa2\x8fg\x85J\
+\x04\xf3U\xeeU4>\x0e\xb5m\xbb\x1c\xa5\xbf\xf5z\
+m7\xc6\xd8-9\x9co\xcd\x92V\x9dE\x22`+\
+\xc4g\x90?\x8c\x0d\xf2\x97\x85\xb7\x96~\xff\x82Y\xb3\
+\x06\x17\xb4\xb2\x1f\x7fk`\x9a\xfa\x17[%\xfcI\x9f\
+\xfc\x8d\xff`<O\xbc\x0d w\xfci\x8f\x90\x108\
+\x99\x04Z=\xac\xbf\xf3\xe7\xcf\xaa\xdb6;\x8f\xb0\xd6\
+\x17\x81\xfc_<3\xb1A\x04l\x89\xf8\x0c\xf2\x87\xb1\
+A\xfe2\xf1\xd6:\x8eu\xe1\xd0\xd0\xc0\xf6\xe33\xfc\
+1\xa6\xbf\xca\xbbs\xbd^\xc5\xfeR\xdb.\xc4xn\
+\xbe\x0d\xa0\xd0\xf8\xa3\xb1\xa3_\xc6\x98\xb1\x97\x7f\x08\x8e\
+\xf7\x8bW\xbd\xacV\x9d\xa3\xe8\xdf\xff[\xb0\xf9\x168\
+7a|sJ\xc8\x15A\xc4g\x90?\xf0@\xfei\
+\xe1\xad\xa5U\xfe\xd9D\xaa\xa3\xf4\xe7\xbbh\x05w\x97\
+\xea\xfd\xa5\x00\xfaV\x8c\xe7\xcd\xb7\x01\xd4\x1d\x7f\xda_\
+\xa8\x9d\xef\xa9\xd5\xaa\xfb2f\xdd^\xf0\xf9\xd6\xf4v\
+\x00\xc63\xc8\x1fx \x7f\xe0\x09%Yi\xfez\xb9\
+\x88\xe3\xb9\xb1\x0d\xa0=\x83\xf1\x92E<1\x11\x80x\
+\xaf\x1e\xf9\x0b\xdf\xfe\x83\xb1A\xfe\xc0\x8b\x15\xef\x1f\x18\
+\xcf\x9b\xe29\x8e\xf5C\x8c\x97\xac\xe2\x85\x8b\x00\xc4{\
+\xe5\xf0\xfc\xd4\xff\xc2I\x82z`l\x90?\xf0\xe2\xc1\
+\xe3\xa5\x911\x9e7\xc5S\xa8D0\xf0\xda\xc2k.\
+\x02\x10\xef\x95$\xff\x92\x90\x00\x08\xd4\x13\xee\x85\xb1A\
+\xfe\xc0\x8b\x0d\xef0\x8c\xe7M\xf1\x16,\x18\xd5m\xdb\
+x\x16\xe3\x05\x19\x03\x11\xef\x13%\x7f\xbf\xdeO\xb8\x00\
+\xf0>\x5c\xf1V\xff\xbd06\xc8\x1fx\xf1\xe0\x19\x86\
+ab~l\x8e\xc7\xb7\x010^\x901\x10\xf1>1\
+\xf2\xef\xf6\xaa\xfdv\x85\xa6\xfe\xf7>\x5c\xf6V\xff=\
+\x81\xda\xc206\xc8\x1fx\x93\xc2\xd3\xfe\x82\xf9\xa1v\
+\x89`\xe0!c`\x0e\xf1\xca\xde\xb3Q\x00\xb4R\x0a\
+\xd3\x02\x02\xa0\x07\xc6\x06\xf9\x03o\xf2x\xa6\xa9\x9d\x8a\
+\xf9\x11V\x22X{\x06\xe3\x05\x19\x031?b\xc5\xab\
+x|\xee\x0b\x80R\xab=\x82r@\x00L\x87\xb1A\
+\xfe\xc0\x8b\x0bO?\x10\xf3cb<\xb2\xcfw1^\
+\x901\x10\xf3#6<\x9f\xc3}\x01\xd0\x15\xf6\xea\xbf\
+\xe4)\x04_\x00T`l\x90?\xf0b\xc3[\xdf\xdf\
+\xdf?\x13\xf3C\xfd\x12\xc1\xc0C\xc6\xc0\x1c\xe0\xf9o\
+\xef}\x01\xd0\x1dF\xfe\x9d\x9e:\x98\x1a\xd8/\x80\xb1\
+A\xfe\xc0\x8b\x0dO\xbb\x0d\xf3C\xa4Dp\xebm\x00\
+\x8c?d\x0c\x04^K\xbc\xde\x80\x00(\xb7:\xf4\x17\
+\x14\x00\xdd\xc2Y\x82`l\x90?\xf0\x04\xf7\xff\xf5/\
+a~\xb4\xc6k\xb5\x0d\x80\xf1\x87\x8c\x81\xe0\x0f!<\
+_\x00TB\xf9\xdc\xfb\xa5\xce\xc0\x1dA\x90?\xc8\x1f\
+x\xf1\x9f\x8e\xde\x07\xf3C\xa8D\xf0A\x18/\xc8\x18\
+\x88\xf91i\xbc^\xa13|\x01\x01P\x02\xf9\x83\xfc\
+\x81\x97L\x09\xe3\x85\x0b\xb771?DK\x04o\xbe\
+\x0d\x80\xf1\x87\x8c\x81\x98\x1f\x91\xf0\xc4n\xef\x05\x04\x00\
+\xc8\x1f\xe4\x0f\xbc\x04\xf0\x1c\xc7\xbc\x09\xf3C\x1co\xfc\
+6\x00\xc6\x1f2\x06b~$\x84\xd7.\xf1\xc3\xd8 \
+\x7f\xe0\x89\xe1\x91\x8f\xbf\x80\xf9!\xfe\x13\xdc\x06\xc0\xf8\
+C\xc6@\xcc\x8ft\xf0`\x1c\x90?\xf0\x12\xc0\xab\xd7\
+\x9d\xd7`~\x88\xff\xa0D\xb0(\x9e\xf6+\xc30\x96\
+\xd2\xf3\x1bd\x0c\x04\x1f\x81\xfcA\xfe\x89\xe2\x99\xa6q\
+\x0d\x05\x9d\xeb\x10|\xc5\xf1(\xd0=\xbfx\xf1\xc2~\
+\xcc\x8fhx(\x11\x1c\x86\xa7\xfd\xcb4\xf5\xd7\xf9\xf6\
+\x9a9sf\x0f\xcd\xcd\xab\x911\x10|\x04\xf2\x07\xf9\
+'\x84\xa7_\xc5Wf\xbc\x0f\xa6i\xbe\x22\x8a\x10(\
+\xf2J\x8e\x88\xec\x1a\xcc\x8f\xe8x\xb5\x9as$\xc8\x7f\
+|!)\xedy\x22\xfe\xe3\xfcy\x18\xfc\x09\x8a\x00d\
+\x0c\xc4|\x03\xf9\x83\xfc\x13!\xff\xe0\x8f\x88\x10(\xfa\
+k\x5c\xf2\xf7\xe70?\xa2\xe3\xa1D\xf0f\xfb\xe6\x97\
+\xea\xba>\x18f?\x9a\x8f\xbd\xb6\xcd\xaeC\xc6@\xcc\
+7\x90?\xc8?Q\xf2\x17\x11\x02\xd8\xc3\xe5\xc1M\xdf\
+\x05\xf3\xa3=<\x94\x08\xdeP>\xfa\x1e\x9a[\xfb\x88\
+\xdao\xfe\xfcy\x06\x89\x80\xeb\x911\x10\xf3\x0d\xe4\x0f\
+\xf2O\x9c\xfc'\x12\x02 \x7f\x8b\x07\xef?-\x5c\xb8\
+\xb0\x0b\xf3\xa3=<Z\x19\xbe\xae\xb8\xe4\xaf=c\x9a\
+\xfa\xa7m\xdb.G\xb5\x9f'\x02\xae\xcb\xde|C\xc6\
+\xc0\xb4\xc8_\xf8\xf6\x1f\x8c\x0d\xf2\x8fj\xbfZ\xad\xba\
+\x9f\xe3\x98\xbf-\xde\x81?\xeb\x09Z\xb5\xfe\xd8u\xd9\
+\xbbH\x0c9\x98\x1f\x93\xc3\xe3\xe4G\x22\xea-4\x16\
+\xbfGv~\xa28\xe4\xaf\x7f\xdfq\xfa\xed\xc9\xd8\x8f\
+o\x07\x8c?\x18\x88\x8c\x81\xc0\x0b\xa4\xfe\x17N\x12\xd4\
+\x03c\x83\xfc\xdb\xb1_\xb5Z=\x80\x0b\x81<\x93?\
+\x91\xfe?\xc9\xc7\xa7\x0e\x0c\xb8\xaf\x1e\x1b[\xb1-\xe6\
+G2x\xfcM\x0ac\xfan46\xbfLv\xffG\
+N\xc9\xff\x0eZ\xf9\xef\x1e\x97\xfd\x9a\xdd\x0e@\xc6\xc0\
+\xc2\x93\x7fIH\x00\x04\xea\x09\xf7\xc2\xd8 \xff\xc9\xd8\
+\x8fVq\xaf\xa4\xc0v}^\xc8\xbf\xb1/k\x9c0\
+00\xb0\x0b\x82\x91\x1c<\xc6\xb4\x85\xa6\xa9\x1fo\x18\
+\xfa\xdd9 \xff'\xa9/\x1f\x89\xb2]$j\xbf(\
+\x22\x00\x19\x03sO\xfe~\xbd\x9fp\x01\xe0}\xb8\xe2\
+\xad\xfe{al\x90\x7f\x1c\xf6\x8b\x22\x04T\x0b\xe6\xd4\
+\xf6\x07(H\x7f\xd14\xcd\xc5\x08Fj\xe1Y\x96\xb9\
+\xccq\xac\xaf3f\xfd'{\xe4\xaf\x9fg\xd1\xff$\
+i?\x11\x11\x80\x8c\x81\xb9'\xffn\xaf\xdaoWh\
+\xea\x7f\xef\xc3eo\xf5\xdf\x13\xa8-\x0cc\x83\xfcc\
+\xb1_+!\xa0J02\x0c\xed9\x0a\x9c\xdf\xe6\xed\
+\xa5fw\x82\xac\xd5\xc6[\xb6l\xf16\xd5j\xf5\xb5\
+\xb6\xcd~\xc0\xef\xcc\xab=\xdf\xb4[\xe9Y\x91\x96\xfd\
+f\xcc\x98\xf1\x92\x89D\x002\x06\xe6\x1e\xaf\xec=\x1b\
+\x05@+\xa50- \x00z`\xec\xdc\x93\xff\xaf\xd3\
+\x22\xffVB@\x85`D\xed\xfa3\xfd\xf9>Z\xed\
+o\x83\xe0\x91M<]\xd7g\x90\x0f\xdf\xef\xf9R\x99\
+\xf9F\xff\xf6\x18\xcd\xb7\xf7\xf8\x822M\xfb5\x13\x01\
+\xc8\x18\x98{\xbc\x8a\xc7\xe7\xbe\x00(\xb5\xda#(\x07\
+\x04\xc0t\x18\x1b\xe4\x9f\xb4\xfd|! 3\x18\xd1\x8a\
+\xf1\x05\x0a\x8e\x17\x11\xe9\xef\x8c\xf1\x9c/<\xf2\xe9.\
+\xfcM\x0e\xf9y\x8d\xc4\xf9\xb6\x9e\xe2\xc3jjK\x9f\
+L\xfb\x05E\x002\x06\xe6~~\xf8\x1c\xee\x0b\x80\xae\
+\xb0W\xff%O!\xf8\x02\xa0\x02c\x83\xfc\xd3\xf4\x87\
+\x7fk e\xfb=D\x02\xe4\x98\xb0}X\x90k>\
+\xf0\x88|\x0d\xd3\xd4\x8f%\x9f?\x9cr:\xe8\x9b\xeb\
+\xf5\xfa\xae\xaa\xd8O\xd7\xb5-\x9110\xf7\xf3\xc3\x7f\
+{\xef\x0b\x80\xee0\xf2\xef\xf4\xd4\xc1\xd4\xc0~\x01\x82\
+\x07\xc8_\x8a?\xaaUw\xffvn\x0dD\xb3\x9f\xf6\
+\x17\xfa\xf3mD\x0a\xd30\x9e\x8b\x85\xc7}N\xe3\xff\
+\xed4\x06\xeeJr\xbe\x11\xf1?T\xad\xda\xefVq\
+\xe5:o\xde\x1c\x13\x19\x03s=?z\x03\x02\xa0\xdc\
+\xea\xd0_P\x00t\x0bg\x09\x02\xf9\x83\xfc\x13\xf4G\
+;\xd7\x07[\xd9\x8f\x16\x81\xbf\xa3\x95\xc4\x01\x04\xbf\x05\
+\xc63\xe6o\xbd\xee\x1cFD\xf8\xfb\x98\xe7\xdbZ\xd7\
+e\xa7-X0\x9f\xa9l?O\x04 c`>\xe7\
+\x87/\x00*\xa1|\xee\xfdRg\xe0\x8e \xc8\x1f\xe4\
+\xaf\x94?<!p\xc3\xe4\xec\xa7\xdd@8{b<\
+\x03\xaf\x19\xde\xc0@\xf5@\xc71o\x9a\xec|\xe3\xd5\
+\x1f\x07\x07\x07v\xca\x8a\xfd\xf8v\x002\x06\xe6r~\
+\xf4\x0a\x9d\xe1\x0b\x08\x80\x12\xc8\x1f\xe4\xaf\xb2?8\x81\
+O$\x04&\xb2\x9fa\xe8\xbf\xf5\xae\xf1a<\x03\xaf\
+%\x1e\x1fc\xf4\xb4#\x04\xee\xabV\xabo\xce\xa2\xfd\
+\xc2\xae\x08\xaa|U\x97\xda\xfc\x0d\x8c\xe7\x09\xf1\xc4n\
+\xef\x05\x04\x00\xc8_\xe0gttN'?\xcd\x0b\xf2\
+\x97\xe7\x8f\xf1B`\x82B<\x7f6Ms_\x8cg\
+\xe0\xb5\x83G\xe3g\x7f\x22\x98\xdb\x05rE\xbc\xe0\xba\
+\xf6\x17y\x01\x9e,\xf77\x8a\x08P\xe9\xf6\x00?\xd4\
+\x89\xf1<\x09\xbcv\x89\xbf\xa8\xc6\xb6m\xf6\x15\x90\xbf\
+\x1a\xfe \x82\x7f\x15\x7fm;\xcev\xf7Q\x7f\xdf<\
+E\xc2=k\xe0\xe5\x0e\xaf\x93\xc6\xd8\x9b\x89\xe4\xef\x9b\
+ _\xc4\xe5\x03\x03\xf5\x85y\xe9\xaf'\x02\xae\xc9`\
+\xc6\xc0#0\x9eQ\x228q<Z\xf9\x7f\x12\xe4\xaf\
+\x9e\x7fy\xf67\xc6\xd8\xb5\xb4\x12;\x9e\xfe|\x09\xc6\
+3\xf0\xe2\xc4\xe3\xf3\x87\xe6\xd7Jz\x9e\xf6\x88\xffo\
+\x96e\xed\x97\xc7\xfe\x86\x89\x00uks\xf0\x8c\x9d\xe6\
+\x02\x8cg\x90\x7fbx\xbc\xda\x1b\x0d\xd0u \x7f\x8c\
+\x17\xe0\x15\x13\x8f\x88\x9fxF\x7fW\xbd^\x9b\x9e\xe7\
+\xfe6\x13\x01\x19H\x1a\xf4\x97\xc5\x8b\x17\xf6c<\x83\
+\xfcc\xc7\x1b\x1e\x9e=\xe48\xd6\xc3Y\x22\x7f\x0aV\
+\xbf\x01\xf9\x03\x0fx\xc0\x9bD\xc6\xc0k\xb2\x951\xd0\
+\xfe*\xfc\x0b\xf2\x8f\x1d\xcf\xb6\xd9e \x7f\x8c\x17\xe0\
+\x01\xafHx^\xc6\xc0\xeb3\xb4\xed\xb9v`\xa0\xbe\
+\x0c\xfe\x05\xf9\xc7\x98\x9e\xd6~\x13\xc8\x1f\xe3\x05x\xc0\
++\x22^\xd62\x06\x9a\xa6\xf1K\xf8\x17\xe4\x1f\x0b\x1e\
+\xdfSb\xcc\xbc\x1f\xe4\x0f<\xe0\x01\xaf\xa8x\xbe\x08\
+\xc8J\xc6@\xc6\x8c\x97\xc2\xbf-1;`\x9c\x16x\
+\xb4\xfa?\x1a\xe4\x0f<\xe0\x01\xaf\xe8x^\xc6\xc0k\
+\xb2\x901\x90\xda\xf9\x0b\xf8wb\xe2\xf7\xf2\xfe\x08'\
+\x09\xea)\xe2\xe0\xe7\x89=HI>\x0e\xf2\x07\x1e\xf0\
+\x80\x07<\xb1<\x01\xaa\x5c\x1d4Ms\x0e\xfc\xdb\x94\
+\xfcKB\x02 PO\xb8\xb7\x88\x83\xdfu\xed\x0f\x83\
+\xfc\x81\xa7:\xde\xc2\x85\x0b\xbb(\xd8\xd5\xe9\xd9\x99\xc6\
+\xc2~\xf4\xbc\x85\xc6\xcaQ\xf4\xff\xbf`\xdb\xec<\xc6\
+\xd8%\xf4\x5c\xe18\xd6\xd5\x8e\xc3n\xa0\x00~\xb3e\
+\xe9\x7f\xa0\xcf\xdc\xd9x\xf4?4\xfe\xcd\xb8\x96\xfe~\
+%OnC\xcf\x8f\xe8\xdf\xce\xa2\x7f;\x89cqL\
+\xc2\xdb\xbf^w\xf6\x98={\xd6\xfc\xb1\xb1\x15\xdb\xc2\
+\x1f\xc5\xc4\x8b\x22\x02d\xde\x1e0M\xfd\x14\xf8w3\
+\xf2\xf7\xeb\xfd\x84\x0b\x00\xef\xc3\x15o\xf5\xdf[\xc4\xc1\
+\xcf\xef\x95\x82\xfc\x81\xa7\x02\xde\xf0\xf0\xf0T]\xd7\xe7\
+3f\xbc\x81\xc6\xc2\xd1\x14\xdc\xce&\xdf\xff\xda\xb2\xb4\
+{\xe9\xff\xaf\x930\xfex>\x8c\x7f\xf1\xf1g\x9a\xda\
+j\xde&\xfa\xfb\xa1\xf4\x8c\xf2\xb6\xc2\xbf\xf9\xc6\xcbB\
+\xc6@j\xdf\x7f\xa6L\x90\x0d\xb4\xa0\xe4\xdf\xedU\xfb\
+\xed\x0aM\xfd\xef}\xb8\xec\xad\xfe{\x02\xb5\x85\x0b3\
+\xf8\xeb\xf5\xfa\xae \x7f\xe0\xc9\xc0\xdb~\xfbQ\xbbV\
+\xab\xee\xc7\x98y\x14\xf9\xfe|\xc3\xd0\xffH\x7f\xae\xc9\
+J\xa1\x16\x9e\x1b\xbf\xf1\x86A?\x8f\xfe\xff\xc7L\xd3\
+\xdc\xc3\xb6\xed\xad\xe0\xdf\xfce\x0cl\xbc5R7c\
+ \x7f+\x06\xffn\xc0+{\xcfF\x01\xd0J)L\
+\x0b\x08\x80\x9e\xa2\x0d~\xfe\xfa\x14\xe4\x0f\xbc4\xf0f\
+\xcd\x1a\x1a\xad\xd5\x9c\xb7;\x0e\xfb\x16c\xd6\xed\xe4\xdf\
+\xf5\xd9\xab\xcf\xde\xf2Y\xef\x89\x82\xd3\xa8\xafo\x1d\x1e\
+\x9e=\x8a\xf1\x92}\xbcf\x22@\xb1BA\xc7\xc3\xbf\
+\x1b\xde\xe4O\x0b\x08\x80R\xab=\x82r@\x00L\xdf\
+\xad\x90%A\xb5\xbf\xaaL\xfe3g\xce\xecA0\xca\
+&\x9e\xae\xeb3LS{=\xf9\xf7\x1c\xcb2\x1f\xc8\
+^m\x89x\xf0\x1a\xd7k\xf9\x19\x05\xe3u\x8c\xb1\xad\
+1^\xb2\x89\x17\x14\x01\xea\x8d?\xed\x86\x82\xfb\xd7\xe7\
+p_\x00t\x85\xbd\xfa/y\x0a\xc1\x17\x00\x95\x22\x0e\
+~\x0a\xd0\x16\xc8\x1fx1\xe2u\x98\xa6\xb9\x03\xadF\
+>C\x01\xe9:\x7f\xcf>Kd\x9d\x02\xdeZN\x22\
+d\xa3O1\xa6-\xc4\xf8\xcb\x16\x1e\xbf\x22\xc8\x0f\x98\
+\xaa6\xfe\xf8vT\xbd^\xef.\xa8\x7f\xfd\xb7\xf7\xbe\
+\x00\xe8\x0e#\xffNO\x1dL\x0d\xec\x17\x14r\xf0S\
+\xb0>\x04\xe4\x0f\xbc\xc9\xe2\x91\x8a\x5cD\xbe<\x91\x9e\
+\x7f\xe4\x8c\xac\x13\xc7kT\xdb3N 1\xb0\x00\xe3\
+/;\x19\x03\x83\x22@\x95\xf1\xe7\xba\xe6\xc2\x82\xfa\xb7\
+7 \x00\xca\xad\x0e\xfd\x05\x05@\xb7p\x96\xa0\x1c\x0e\
+~/h\x83\xfc\x81\x17\x19\x8f\xfc4\x8fV\xb1\xc7\x19\
+\x86~wQ\xc8:\x85\xd7\xb8w\x91M\x8f\xe5\xf7\xba\
+1\xfe\xd4\xcf\x18\xc8E\x80J\xe3\xafV\xb3\x8f(\xa8\
+?|\x01P\x09\xe5s\xef\x97:\x03w\x04;\x8a<\
+\xf8-K\xbf\x04\xe4\x0f\xbc(\xf7\xa2\x193\xdeJ~\
+\xba\x09d\x9d,\x9e\xe3X7W\xab\xee{x\x92.\
+\x8c?5\xf1\xf8v\xc0D\xb7\x03d\x8c?\xd7\xb5?\
+UP\x7f\xf4\x0a\x9d\xe1\x0b\x08\x80R\xd1\xc9\xbf!\x00\
+\xb4\xbf\x80\xfc\x81\xd7\x0a\x8fV\xa4\x8b\xc9o\xab\xe8y\
+\x12d\x9d:\xde\x93$\x06\xbee\xdbl1\xc6\xb3z\
+xaW\x04\xd3\x1e/$\x00\xbe\x5cP\x7f\x88\xdd\xde\
+\x0b\x08\x80\x0e\x0c\xfe\x0d\xafq\xff\x0b\xf2\x07\xde\x04x\
+%~F\xc4\xcb\x9c\x97\x05r}\xb2\xb1\x9f\xae\xdd\xe6\
+\xbd\xa1\xa0\xa0\xac\xfd\x8a\xfe\xfe3\xea\xc3O\xf8\xc33\
+\xff9\x8e\xf9k\xfe\xea\x961v\x0b\xfd\xfdO\x8cY\
+\xff\x14\x156\xb2\xfbk\x18\xfao\xf9\xad\x0a\xee\x1b\x8c\
+g\xb5\xde\x8c\x89\x8a\x80$\xc7\x8b\xeb\xb2\xb3\xe0\x8fp\
+\x80\xb6\x88?\x8f\xc6\xe1Y\xcc@\xfe\xc0\x1b\x8f7k\
+V\xffV\xa6\xa9\x7f\x98\xfc\xf5OE\xc8p\x0d\x91\xf5\
+\xdf=\xe2>\x9b\xfe\xfd\xd3^&\xbe]I\xa0\xcc\xb5\
+,K\x8f##\x1f?A\xcd\xb1\xf8\xd9\x06\x8e\xcd3\
+\x11\xf2\x93\xfa\xf4}g\x92\x90\xb8\xc2;\xac\xb7F\x8d\
+\xdc\xef\xc6\xdf\xe9\xcf\x0fp\xe2\xc1xV\x03\xaf!\x02\
+\xf4\x1b%\xc7\xd3\x0b\xe0\x8f\x04~\xf2h\x9cj\xb5\xba\
+%\xc8\x1fx\xfe3g\xce\xf0\x00c\xe6\xc9\x22o\x85\
+\x12\x1c/\xff\xa4\x15\xeeO\xe9\xcf\xe3\xaaU\xfb\xc8\xd9\
+\xb3kK\x96,Y8C!\xfb\x95H$\x8cP\xa0\
+?\x98\xc4\xc8\xc9$J~F\xcf\xbfem#\x18\x86\
+\xf68\xbfA\xe0\xba\xdb\xf5a<K\xc7\xeb _\xdc\
+\x22\xf9M\xd1j\xf8\x03\xe4/\x84\xc7S\x96\xca\x7f\xad\
+\xa9\xad\x80?\xe4\xe2\x8d\x8c\xcc\xae\xd96\xfb\x0a\xf9\xe2\
+\x99\x94\xc9\xebY\x9e\xe3\x9f\xdf$`L\x7f\x15O\x1a\
+\x94a\xf1\xe40f\xec\xc3\xb3\xb1qQK}{.\
+e\xf1\xf44=\x9f\xe76\xc4\xfc\x90\x83G\xc2\xf55\
+\xb2\xe3)\x8d\xbd\xaf\xc3\x1f \x7f!\xbcz}\x9b^\
+\xd9{\x9a\xbc\xc8\x06W\xce\xf0G\xfax<\x0f?_\
+\xc5\x92?\x9eJi\xe5\xba\xa6Q\xd4gC\xc5\xbd\xa5\
+\xcd^\xdb\xe7\xc5\x1f^A\xa3e\x96\xa5\x7f\x82\xc6\xf8\
+\xd5^\xf2\x9f4\xc8\xe1\x09\xd7\xb5?\xbf`\xc1|\x86\
+\xf9\x91*\xde\x84\xab\xfft\xe3\xa9~,\xfc\x01\xf2\x17\
+\xc5\xebPdO\xf30\xf8#=\xbc\xc5\x8b\x17\xf6\xbb\
+.;\x86V\xac\xffM\xda\xbf\xb4\x12\xbe\x8f\xfe<\x83\
+\xbe\xeb\x00\xbe\xe5TT\x7f\xf0\xf4\xbf$\x06\x0e\xe4\xe7\
+\x09\x0cC\xbf?\xe9\xf9F\xf6~\xbcZ\xb5?\xbbd\
+\xc9\xa2\x99\x98\x1f\xc9\xe3M\xb4\xfaO;\x9eR;\xde\
+\x0d\x7f\x80\xfc\x85\x7fx\x19I\xd9\x07\x9ax@\xe4o\
+#\xe0\x8f\xe4\xf1\xaaU\xe7\x8d\x8ec\xdd\x9b\xeck\xc8\
+\x0d\x04\xc7\xb7\x14\x96\x8b\xbe\xdd)\x98?\xb6\xb0,k\
+\xccq\xd87\x19\xb3\xfe\x93\xf0\x19\x9b\xbfq\xf1\x85\xf9\
+\x91(^\xd3\xd5\xbf\x8cxJ\xbe\xde\x0b\xfe\x00\xf9\x0b\
+\xff\xf8\x09]\xe4\xd7\xb3\xd6\xbe\x00\x7f$\x8778X\
+\xdd\x99V\xa1\xd7%\xe5_\xfa\xb7\xc7,\xcb<\x95\xc6\
+\xd3\x18'8\xf8C\x0co\xd9\xb2\xc5\xdb\x90o\xf6&\
+\x1b\x9ei\x18\xdac\xc9\xcd7\xfdJ]\xd7\xe7\xc3\x1f\
+\xf1\xe35[\xfd\xcb\x8a\xa7\x8c\xf5\xb9\xf0oS\xcc\x0e\
+\x0c\xd6\xa6\xaf&\x8ds\x15I\x8a\xb2\x86\xb1\xfea\x04\
+\xa3x\xf1\x1c\xc7\xd9\x96V\x9a\xab\xc9\x07\xeb\x92\xf0\xaf\
+\xe3XW\xbb\xae\xfb\xe6\xa1\xa1\xc1\x0a\xfc19<\xd3\
+4\xa7\xf1\xab\x87\xde9\x89$\xe6\xdb:\xd3\xd4O\x0b\
+\xabF\x08\x7f\xb4\xb5\x8dz\x8b\x1ay0\xb4G\xe0\x8f\
+\xcd\x89\xdf\xcb\xfb#\x9c$\xa8\xa7H\x83\xdfu\xedO\
+\xabS\xcf\xda\xf8\x05\x82Q|x\xfc\xaa\x1ac\xd6\x83\
+q\xfb\x97H\xffa\x9eqlpp`\x11\xfc\x91\x0c\
+\x9emk\xb3\xc8\xde'\xd1\xf3p\xfc\xb7/\x8c\x07H\
+h\xbc\x16\xfe\x98<\xde\xf8\xd5\xbf\xcc\xc5\x14Ot\x85\
+\xf9\xb6\x19\xf9\x97\x84\x04@\xa0\x9epo\x91\x06\xff\xc0\
+\x80\xfbJ\x95\xd2\xa1\xfa\x81\x09\xc1\xa8}<^\xe2\x99\
+\x02\xd3\xc5\x09\x04\xa3\xbb\xaaU\xe7\xfd\xfc\x10!\xfc\x91\
+\x0e\x9e\xa6i\x15Z\xb5\xbf\x93\x17\x09\x8a{\xbe\x91\x10\
+\xf8\xa1I\xac\x01\x7f\xb4\x8d\xb7\xc9\xea_\x817\xa9\xef\
+\xc7|\xdb\x84\xfc\xfdz?\xe1\x02\xc0\xfbp\xc5[\xfd\
+\xf7\x16i\xf0\xef\xb8\xe3\xd2\xed\x88t\x9fU(\x17\xfa\
+?]\xd7\xe9A0j\x0b\xaf\x83\xc8\xe2]\xfc*X\
+\x9c\xc1\x88\xdfk\xaf\xd5\xec\xd7\x8d\x8d-\xdf\x0a\xfe\x90\
+\x86\xc7\xb7\x08\xf6\xe5\xd7f\xe3\x9co<\xe9\x13\xcd\xff\
+w\x90o\xb7\x84?\xa2\x1e\xa0~q\xf5\xaf\xc26*\
+\x8d\x8f:\xe6\xdbF>\xef\xf6\xaa\xfdv\x85\xa6\xfe\xf7\
+>\x5c\xf6V\xff=\x81\xda\xc2\x85\x19\xfc\x8ec\xfdB\
+\xadB(\xf6\x89\x08F\xd1\xf0\x18c\x1a\xcfs\x1f3\
+9\x5cN\x84\xb3\x13\xc8Z-\xbc\x81\x01ww\x9e\x16\
+9\xe6m\x9d\x9f\xcf\x9b7g\x10\xfe\x88\xbe\xfaW\xe4\
+\x0c\xd5-\x98\x1f\x1b\xf1\xca\xde\xb3Q\x00\xb4R\x0a\xd3\
+\x02\x02\xa0\xa7h\x83\xdf\xb2\xf47\xabT\x08\x85V$\
+\xcf\xcd\x9e=k>\x82Q\xa4\x95\xc8\xc3\xf1\xf9C\xbf\
+\x8aV\x13;\x83\xac\xd5\xc6\xab\xd5\xaa\xaf\xb2mv]\
+\x8c\x07:\x1f\xaa\xd5\x9c\x83\xe0\x0f\xf1\xd5\xbfBU%\
+\xdf\x87\xf9\xb1\x01\xaf\xe2\xf1\xb9/\x00J\xad\xf6\x08\xca\
+\x01\x010\xbd\x88\x83\x9f\x9f\x0a6\x0c\xedy\xb5\xaa\xa0\
+\xb1\xcb@\x0e\xe1?|\x7f\x98\xc8\xfa\xf4\xf8\xfc\xc1\x0b\
+\x99h/\x07\xb9f\xee\xf6\xc0+\xa2Vll\x95N\
+\x96\xdfH\x80?\xc2W\xff\x0a\x91\xff\xd3\xe3ov\x14\
+t~\xf8\x1c\xee\x0b\x80\xae\xb0W\xff%O!\xf8\x02\
+\xa0R\xe4`D\xc1\xff\x5c\xd5J\xa0\xda\xb6\xb97\xc8\
+a\xa2\x15\x889\x87\xecvG\x1c\xfe \xf1\xf7o~\
+\xfdl\x8a\x97\xb4\x07\xe4\x9aI<~\xfe\xe3\xc8`\x96\
+\xc1\xc9ep4\xfed\xdb\xfd\xb3\xe1\x8f\xcd\x7f(V\
+\xee\xab\x10\xf9\xf3\xe7\xab\x98\x1f\x1b\xdf\xde\xfb\x02\xa0;\
+\x8c\xfc;=u05\xb0_P\xe8`D\x84\xb2\x83\
+z\xf5\xcf\xb5\xbbx\x89V\x90\xc3x\xf2\xd7_G\xf6\
+yj\xb2\xfe\xe0\xc5x\xe8\xcf\xff\xed\xeb\xeb\x9b\x0er\
+\xcdOIZ^\x5c)\xac\x18Q\x84\xf1\xf2d\xab,\
+\x82E\xf3\xc7\xe8\xe8\x9cN\xc7\xb1nS\x85\xfc\xc9\xcf\
+/8N\xbf\x8d\xf9\xb1\xe1\xf1\x05@\xb9\xd5\xa1\xbf\xa0\
+\x00\xe8\x16\xce\x12\x94\xf3\xc1\xcfk\x9e\xabC\xfe\x1b\x9f\
+\x8f\x83\x1c6\xfe\x94(\xb8\x7f1&\x7f\xfc\xc0\xb6\xfb\
+\x1c\x90knk\x0fT\xf9\xbd\xf0\x98\xe6\xef\xe7\x09\xb2\
+\x13\xfe\x18\xdb\xa2Z\xb5_\xaf\xd0\xca\x9fo\xdb\x9d\x8e\
+\xf9\xb1\x11\xa7\xc7{\x93\xdf\xd1\xea\x97:\x03w\x04A\
+\xfe/\xbe\x05X\xac\x18\xf9o\xd8\xdf\xe2\xf7\xda\x8bN\
+\x0e\xbc\xde;O\xe7:\xf9$0\xfa\xfd\x86a\xec\x8f\
+`^\x0c<\x1a3\x07\xf9\xf5>&\x97\xa4K\xfbe\
+\x7f\x7f\xff\xcc\x22\xfb\x83_\x95t\x1cv\x9b*\xe4\x1f\
+\x5c\xfdc~l\xf8{\xeb3|\x01\x01P\x02\xf97\
+\x13\x01\xc6\xb7\x15\x22\x7f?\xc3\xd5EE\x0e\xe6D\xd8\
+\xf3,K\xbb7\x06\x7f\xac\xb2m{\xab\x02\xd9\xaf\x83\
+\xfa[\xe6U\x089y\xf1\x87\xff\x9d\xa7-.\xd2\xbd\
+w\x9e\x0e\xda\xb6\xd9y1\xcc\xdf\x7fX\x965RT\
+\xb2\xa9\xd5\x9c\x83UJ\x9a\xe6\xaf\xfeA\xfe\x1b\x1e\xb1\
+\xdb{\x01\x01\x00\xf2o\x1a,\xfam\x22\x9bgT!\
+\xff\xc0\xa1\xa4]\x8b\xe8\x0f~\xc2\x9b'\xf6\x99\x8c\xfd\
+\xbc\x8ap/\xcd\x83\xfd\xc6\xc6VlK\x04>\xdf\xb6\
+\x8d\xdd\xa9_o\xe1\xf5\xcfI \x9eE+\xd4\x9f\xd2\
+\xb8\xbd\x8e\x9f\x1b\xa1\x95\xd1\xa3\xe3\xcb\x5cO`\xbf5\
+d\x97\xc7\x08\xebn\xfe\xbb\x1c\xa3\x81\xc51\xcd73\
+\xa6\xefF\x84W[\xb8paW\x1e\xe2A\xbd\xee\xbc\
+\xc6q\xac\x7fM.)\x94\xf6\xf8\xc0\x80\xbbw\xd1\xc8\
+\x86'\xc1\x0a\xae\xfee\x93\xbf\xbf\xfa\x07\xf9G\xc4k\
+\x97\xf8\x8b\xa4\xb4(\x00~Z%\xf2\xf7^]\xff\x91\
+\xef\x81\x17l\xe5\xff\x96\xf1D\x16\xdd~\xfa\xb9\x13\x95\
+ZV\xdd~\xae\xabWy\x06B\xd7e\xc7\xda\xb6\xf9\
+C\x0a\xc0wQ\x7f\xd7J\x18\x7f\xfc;\xef\xe0o\xc7\
+hn|\x8a\xc4\xc2>Y\x0d\xbe\xdbo?J\x9a\xa6\
+\xf9[\xbe\x08y:^\xa8V\xedw\x16\x89l\x82\xab\
+\x7f5\x92\xa6\xe9\xa7\x83\xfcQ\x228\x11<\xfe\xda\x94\
+\xc8\xe7\x1e\xc5\xae\xbal\x92\xeb:\xef\xf5\xc5\x89h\x8e\
+\x9f\x8c\xfd\xf8J\x8dV\xb1\x87dh\xfc\x95\xbc3(\
+\x1f\xa0\xe0\xf6]~VA\xc1\xf17\xfe\xb9\x9f\x0b\x93\
+j\xd59j`\xa0\xbe\xeb\x0e;,\xd8:+\xe3\x8f\
+l|\xf8\xf87KQ\xed\xe7\xba\xf6\xe7\x8b@6\xc1\
+\xd5\xbf\x0a\xe3\x8f\xaf\xfe\xabU\xc3\x05\xf9\x83\xfc\x13\xc3\
+\xe3+/\xd5\x82/'5~\x18.\xe7\xfe\xe84M\
+m\xf5$\xcfL\x5c=\xfe\x84\xbf\x8a\xfd\xe5\x87;i\
+5\xf9V~#a\xb2\xdb\x1c*\xdc^\xe1y\xf5\x89\
+X\xbf\xc7\xb7\x0f\xe8\xef\xa6\xea\xe3\x8fooX\x96v\
+\xfd$\xedw\x06Am\x91\xe7x\xea\xaf\xfeU\x19\x7f\
+4g\xbe\x09\xf2\x07\xf9'\x8e\xe78\xd6\xe5\x0a\x06\xdf\
+\xd5y\xf5\x07\xdfk\xe6\xab\xdf\xc9\x91\xbf\xfe\xc5\xf1[\
+%*\xf5\x97\x1f\x22\xa3v~\x96o\xe9(v\xdb$\
+\x89\xfa\xec\xb7\xd1\x9f+\xc3\x12\xea\xc8\xf6Gc\xcc\x19\
+_\x9dd\x7f/\x08\x1bs\xd9>s\xc2W\xff\xd6m\
+\xaa\x8c?\xbe\xfa\x1f\x19\x19\x18\x01\xf9\x83\xfc\x13\xc7\x9b\
+5kp\x01\x0d\xba\xe7\x15\x0b\xbe\xebk\xb5\xea\xcb\xf3\
+\xe6\x0f\xbe\xedB\x84q\xf1$\xec\xf74O\x10\xa4b\
+\x7fy\x952\xbew\x1eF\xfa\xf9#\xfffb@\xff\
+\x04\xbf\x9f\xaf\xe2\xf8\xe3\x99 \xc7\x1f\xfe\x8d\xd2_\xc3\
+0~\xd4*iW\x16\xe3)\xbf\xf7\xaf\xd2\xf8#1\
+\xf2-\x90?\xc8?\xc5BA\xc6\xf1\xaa\x05_\x0a\xa2\
+\xb7\xacX\xb1l\xeb\xbc\xf8c\xe6\xcc\x99=\xcd\x920\
+EXi\xdeE$;W\xa5\xfer2\xa06\x1dL\
+m\xfb\x15\xb5q}\xb6\xc8:Q\xbc\xf5\xfcN=\xfd\
+\xf9\xfa\xe5\xcbw\x9c\xa1R<\xd0u}>?\xfb3\
+\x89\xdb&\x97\xf3\xfa\x14y\x89\x7f\xfc\xaa\xa8_\xf1O\
+\x913'/\xcc\x9938\x07\xe4\x0f\xf2O\x0d\x8f\xa7\
+\x89\x1d\x7f\x07]\x85\xe0[\xad:\xef\xcb\x0b\xf9\xfb5\
+\xde\xdb\xb1\x1f\xfd\xee\xcf\x9b\xdd\xed\x97\xd5\xdfF\x06:\
+\xed\x0b~u\xc2\x8c\x93u\xa2x\xb4\x9a{\x84|\xf7\
+\xd5\x91\x91\x81y\xeaT\xb93\xb7\xa1\xf9~e\xfb\xfd\
+\xd5\xaf\x1a/\x022\x5c%u_\x95\xc6\x8b\xeb\xb2\xb3\
+@\xfemsz\x07\x8c\xd3&\x9e\x97{^\xb5\xe0\xfb\
+0\x0fV9x\xed?\x89\x95\xbfqf\xd8\x1d\xf5t\
+\x83\xa5\xb9\x8c\x88\xff;\xde\x95\xb9\xff\x03\xf9G\xc2\xe3\
+6\xfb\x0e\xaf\xc7\xa1\xc2x\xe6o&H\x9c\x5c\xd8~\
+\x86:\xe3r\x7f; \xab\xf1\x8f\xe7\xfcow\xf5\x9f\
+P\x89\xf4\xe0\xea\x1f\xe4\x1f\x81\xf8\xbd\xbc?\xc2I\x82\
+z@\xfe\x9b\xe3y\xafr\x95\x0a\xbe\xbcliV\xfd\
+1<<<\x95V\x18\x97\xb4\xbf\xf2\xd7?\xa9\xc6\x1e\
+\xa9\xbb?\xbfuP \xb2N\x14\x8f\xc6\xf4\xafi\xae\
+\xed\xae\xc2xv]\xfb\x84\xf6\xaf\xaa\x19?\xea\xef\xef\
+\x9b\x9a\xdd\x12\xcb\xdakT\x1a/\xb4\xfa_\x0d>j\
+\x8b\xfcKB\x02 PO\xb8\x17\xe4\xdf\xf4\xd5\xe0\x9c\
+\xb0\xecj\x92\x82\xef:\xdb\xd6\xb7\xcf\xa0?:\xdb=\
+\xedo\x18\xda\xf3a\xf7\xfb\xd3\xea\xef\xe0`uo\xdb\
+f\xd7\x17\x99\xac\x93\xc4#\x02\xfd\x0d\xf9y\x17\xd9\xe3\
+\x99V\x9eG\xf0\x93\xe7\xed\x1dXc\xdf\xf5\xce\xead\
+-\xfeu\xb4\xb3\xfaO\xee\xcc\x93\xc1O\xfe\xcf\x05\x1f\
+E&\x7f\xbf\xdeO\xb8\x00\xf0>\x5c\xf1V\xff\xbd \
+\xff\x89\xf6\x07\xf5/\xa9\x16,\xf9\xea3c\xfe\xe0I\
+~\xcen\xaf\xbf\xfc\x94v\xeb\xd5a\xb2\xe9dk/\
+s\x1c\xf3\xd7 \xebt\xf0h|\xffb\xfc\xd6@\xda\
+\xe3\x99\xc4\xc8\x9e^\xe9\xe8vV\xaegg-\xfe\xb5\
+\xb3\xfaOr\xbcx\xab\x7f\xf0Q4\xf2\xef\xf6\xaa\xfd\
+v\x85\xa6\xfe\xf7>\x5c\xf6V\xff=\x81\xda\xc20\xf6\
+\xb8\x1f^H\xc5\xaf,\xa6R\xb0\xe4W\x98\xb2\xe2\x8f\
+Id\xf8{\x82\x88`gY\xe3eddx\xb6\xeb\
+Z\x17\xf1k\x98 \xeb\xd4\xf1\xf8\xcd\x81\xd5\x8c1M\
+\xd6x\xe6\xb58\xa8\x1dO\xb6\x991\xf0\xf8\x0c\xc5\xbf\
+\xc8\xab\xff$\xc7Kc\xf5_\x9f\x03>\x8a\x84W\xf6\
+\x9e\x8d\x02\xa0\x95R\x98\x16\x10\x00=0v(\x81\x1d\
+\xa9^\xa1 \xfd\xfe\x193f\xbcDu\xfbyY\xef\
+\xday\xed\xff(O\x93+c\xbc\xec\xb0\xc3\x82\xed\x1a\
+\xb9\xf8\xad\xa7A\xd6\xd2\xf1\x9e$2=z\xc7\x1d\x97\
+n'c<\xeb\xba\xbe\x8c\xc6\xe2c\xed\xf5W?<\
+\x0b\xf1/\xea\xea?\xe9\xf1\xe28\xd6Y\xe0\xa3Hx\
+\x15\x8f\xcf}\x01Pj\xb5GP\x0e\x08\x80\xe90v\
+\xebW\xd8\x8d\xaak\xca\x05\xcb\x93\xd4^\xf9o\xa8\xea\
+\xd7Na\x9f\x07i\xf55*c\xbc\xf0\xaao\x8cY\
+\x7f\x03Y\xab\x85\xe78\xe6_\xeb\xf5\xda^2\xc63\
+?sCmy(\xfa\x81]\xed\x85\x89*R*\x14\
+\xff\x22\xad\xfe\x93\x1e/\xfc\xde?/\x88\x05>\x12\xc6\
+\xf39\xdc\x17\x00]a\xaf\xfeK\x9eB\xf0\x05@\x05\
+\xe4/\xf6\xe38\xc6\x0e4@\xd7\xa9\x14,y\x80\xf1\
+S\xae*X\xd5o\xb4\x9d\x5c\xf7|\xe5O\xbf;/\
+m\xffV\xab\xd5\x19\x8e\xc3\xce\x01Y+\x8d\xb7\x9e\xe7\
+\x84\xe7\xdbri\x8fg.\x02\xc6\xbf\x09\x10\x1c\xcf\x8f\
+\xf3T\xd0\xaa\xc6\xbf(\xab\xff4\xc6\x0b\xf9w\x15\xf8\
+H\x18\xcf\x7f{\xef\x0b\x80\xee0\xf2\xef\xf4\xd4\xc1\xd4\
+\xc0~\x01\xc8?\x02\x1e\x11\xc4\xb7T\x0b\x96<)\x8e\
+j\xf6\xe3\xc5\x8b\xc6'R\x8a\xb0\xe7\x9f\xfak\xffF\
+\xf2\x13\xeb? \xebl\xe0\x11\xa9\xdeG>\xdb;\xed\
+x\xc0\xb7\x03\xfc3\x01\x11\x0bU\xfd]\xd3\xb4m\x15\
+\x8c\x7f\xc2\xab\xfft\x0aK\xf1\x05\xcd\xc4\x05\xbd\xc0G\
+\x9b\xe1\xf5\x06\x04@\xb9\xd5\xa1\xbf\xa0\x00\xe8\x16\xce\x12\
+\x04co\xc4\x9b;w\x8e\xeb8\xe6\xa3\xaa\x05K\xd7\
+u\x0eU\xa9\xc4-\xcf\x8c\xd6F\x7f\x9fN\xfb\xc0\x1f\
+\xcf\xf8\xc8W\x1c \xd7l\xe2\x11\xb1~\x83\xc6\xcc\xb4\
+4\xe3\x01}\xdf\xcb\xe8\xbb\x9f\x8d\xda_~\xb3\x81~\
+\xbdS\xa5\xf8'\xba\xfaO\xcf\xbf\xfa7\xc1G\x91\xf0\
+|\x01P\x09\xe5s\xef\x97:\x03w\x04A\xfem\xe2\
+\xb9\xae\xfdA\x05\xd3\xab\xde\xbbx\xf1\xc2~E\x0eL\
+~\xa9\x9d{\xfei_\xf5\xa3\x15\xff\x22\xfa\xee;A\
+\xae\xd9\xc6#b\xbd}\xa2\xbc\x18I\xc5\x83j\xb5\xfa\
+Z~R=j\x7f\xf9m\x18\x85\xe2\x9f\xd0\xea?-\
+\xff\xb6\xb3\xfa\x07\x1fm\xf8\xfbt\xd1\x84?\x9d\xde\x19\
+\x00\x90\xff$\xf0j5\xb7DA\xe7w\xaa\x05K\xd7\
+e\x1f\x91O\xfe\xda\xeb\xdb[\xc9\xa5\x9b\xe4\x87\xbe\xf3\
+\xfd\x8d\x80\x03r\xcd\x03^#Q\x94\xfe\xae4\xe3A\
+\xad\xe6\xbc\xb3\x9d\xfe\x1a\x86\xb1\x9f\x0a\xf1Od\xf5\x9f\
+\xae\x7f\xa3\xad\xfe\xc1G\x1b\x1e\xb1\xdb{\x01\x01\x00\xf2\
+\x8f\x01\x8f\x9f\xecU,X>=<<{H.\xf9\
+\x9bs\xf9k\xfc6\xd2\xfb~*-\xff\xf2\x82-\xf4\
+\x9d\xe7\x83\x5c\xf3\x89\xc7\x93M\xf1-\x81\xf42\x06\x9a\
+\xff\xdbF_\x9fp]cXv\xfc\xf3o5\xa9\xe2\
+_\xff03\xf8(\x01\xbcv\x89\x1f\xc6\x9e\xb0P\xd0\
+;\xd5\xba7\xcb\x8e\x95i\xbfF\xf5D\xe3\xcev\x0a\
+\xfb\xa4\xe5_\x22\x86z\xa3>=\xc85\xe7x\xb7\x0c\
+\x0f\xd7\xe6\xa6\x15\x0fh\xe5zN\xd46\x92p\xf8s\
+`\xcbNJ\xfc\xa3v\xfc\xafb\xfe}\x1b\xf8(y\
+<\x18g\xf2x<'\xc0_\x14\xba7{\x9f\xeb:\
+=2\xed\xc7_\xdf\xb5S\xd27\xad\xaa~\x86a\x8c\
+\xf1\xeb\x85 \xd7\xa2\x94\x1c6\x1f\x1d\x18p_\x99F\
+<\xf0\x0a\x5c]\x19=]\xb0}\xba\xec\x92\xdc<\x99\
+\x98*\xfe\xa59\xfag\x1e[\xc1G \x7f\xa5\xf1\x18\
+3\xf6R,X\xbeI\xa6\xfdhe\xbdo\xf4\xc9\xae\
+\xfd\xd5\xb6\xed\xad\xd2h\x1fO\x99\xdc8d\x08r-\
+\x12\x1e\xf9\xfd\xb9j\x95\xbd1\x9d\xd3\xf4\xe66D`\
+\x7f\x8b\xda\xdfz\xdd}\xad\xcc\xf8G\xc2\xe5\xedj\xf9\
+w\xe2\x83\xc0\xe0#\x90\xbf\x12x4i.S\xe7\xde\
+\xac\xf1'j\xd2\x16\xb2\xecg\x911\xa8m\x0fG\xec\
+/\xbf\xee77\x1dq\xa2\x7f\x1adXh\xbc\xf5\xf4\
+|<\x8d\xf9\xe1%\x0az6J\xfbx\x8d\x91j\xb5\
+o;\x89\xf1\xaf\xe4o\xdd\xa9\xe0_\xb2\xc7\x8f\xc1G\
+ \x7fe\xf1\x1a\xfb\xc8\x1b\x82\x8a\x12\xc1\x92\xaf\xbe%\
+\xda\xaf\x83\xdfm\x8e\x9e\x14\xc5<8\x85\xf6mA\xe4\
+\x7f\x1a\xc8\x10x\xde\xf3\xb5V\xaf\x97\xe3\x18\x7f<\xf7\
+\x7f\xf4\xf6i\x17\xcb\x8c\x7f\x8c\x19\x07)\xe4\xdfu\xe3\
+\xaf\x02\x82\x8f@\xfe\xca\xe0\xd1\x8a\xfbdu\xee\xcd\xea\
+\xbf\x95i?\xd3\xd4\xde\x1d\x9d\xfc\xf5/\xa5\xd0\xbeN\
+\x0a\xc4\xe7\x82\x0c\x817nuy\xd6\x94&\x89x\xe2\
+\x1e\x7f\x14#\xbe\x1e=\x0f\x86\xf1\x16Y\xf1oll\
+\xf9\x96\x8e\xc3nS\xc5\xbf\xc1\x5c\x09\xe0#\x90\xbf2\
+x\xb6m\x97\xfd\x83dj\xa4C5\xf6\x94e?]\
+\xd7-\x9e\x125b\x7f\xaf\xe5\xaf\x1c\x93l\x9fw \
+\xeb{ C\xe05'\x17\xed;\x13\x1d<\x8dk~\
+xc\xf0\xc6\x88gb\x1e\xe7e\x8fe\xc5\xbfz\xdd\
+}\xbd:W9\x8d\xffp\x1b\x82\x8f&O\xfe\xc2\xb7\
+\xff`\xec\xd6xD\xb8\x87\xaa\x13\xdc\xb4\xebe\xda\x8f\
+\xbe\xff\x92(\xfd%\xdb\xfd\x97\xb1>7i\xf2\xa7\x00\
+\xffS\x90!\xf0Z\x10\xccO\xc6\x8b\x80\xf8_\xab\xb3\
+Aj\xcfS\xd1\xda\xa7\x7f_f\xfc\xa3\xf6\xdd\xaa\x8a\
+\x7f\xf9\xb6\x04\xf8hRx~\xea\x7f\xe1$A=0\
+v\xab{\xb3\x13_\xf5I;\xb8\xf1\x9b\x08\xf2\xc8\xdf\
+:$j\x7f\xf9I\xfc\x14^\xfbc\xe5\x0f<Q\x11\
+\xf0m\x7f; \xb9t\xc1\xf6\xbb\xa2g4ld\x09\
+\x94\x11\xff\x18\xd3_\xa3\x8a\x7fI@]\x01>\x9a\x14\
+\xf9\x97\x84\x04@\xa0\x9ep/\x8c\x1d\xa6\xe8\xf5\x97\xa9\
+\x12\xdc(x\xdd,\xef\xc0\x10\x9bI\xedy(b\x7f\
+\xcfO\xfa\xc0\x1f\xf6\xfc\x81\xd7\xc6\xab\xe6\xb3FG\xe7\
+t&\x19_l\xdb\xfca\x94\xf6\xf1*\x87\xc1\xeb\xb1\
+)\xc7\xbf\x0e\x9aG\x7fP\xc4\xbf\xebGF\x06\xe6\x82\
+\x8f\xda\x22\x7f\xbf\xdeO\xb8\x00\xf0>\x5c\xf1V\xff\xbd\
+0\xf6f\xaf\xfc\x97\xd0\x80<\x89\x97\xf2T)\xb8\xd1\
+j\xfa\xb5\xb2\xec\xe78\xec\xec\x88\x85Z\xfe>Q\xed\
+\xf6\xf8\xae\xfai\xa7\x82\x0c\x81\xd7\xceC\xe3\xf9\x9bI\
+\xc6\x97\xd1\xd1yl|Yl\x81\xb7\x00_\x97\x15\xff\
+xM\x0eu\xfc\xcbn%\xff\xfc\xafm\x1b\xcb\xc3\xce\
+\x0e\x81\xfc7\xe1\xf3n\xaf\xdaoWh\xea\x7f\xef\xc3\
+eo\xf5\xdf\x13\xa8-\x5ch\xf2\xe7\xa4\xef\x9d\xf4\xff\
+\x87\x9a\xc1M\xfb\xcb\x14\x81{\xffI\xd8o```\
+\x17\xae\xcc\xa3\xf4\x971}\xb7d\xc9\xbf\xa8\xf7\xfc\xb5\
+{\xf9kR\x0a\x90\xdf\xaaV\xed\x95$\xb2\xde\x5c\xaf\
+;\xafq\x1cc\x07~\x8d\xcau\xb7\xeb\xa3\xff\xbe5\
+O\xd1\xdc(y\xcc\xb6\xe6\xff\xc6\xff\x1bc\xdaB\x9e\
+p\xc5\x0b\xf6G\xf1\xeb\x924\xe6\x7fN\x81\xf6\xdfE\
+\x14\x13d\xbf\xcf&\x19_\xc8\xce\xaf\x88\xd8\xb6\xb5\xe4\
+\xafQI\xf1\xb4S$\xa1\x91\x04\xff>iY\xfa%\
+4V?L\xe3wA\xab\x18X\xd03me\xef\xd9\
+(\x00Z)\x85i\x01\x01\xd0ST\xf2\x8fB\xfa\xf2\
+\x83\x9b\xfevY\xf6#E~}\x94\xfe\x92M\xbf\x95\
+d\xfb\xf8\xb9\x82\x22\x90\x7f#]+?\xdf\xa0\x7f\x90\
+\xc8d\x17\x22\xfb\x19I\xcd\x8f\xed\xb7\x1f\xb5\xeb\xf5\xda\
+^\xae\xcb>\xce\x0f\xa5\x91\x0f\x1f(\xc0\x9b\x84\xf5I\
+g\x0c\x0cnQ\x89\xb5\xcf\xbcJV<\xa5y\xf5^\
+\xf5\xfd\xab=\xc2\xc7'\xbf\x8a<\xbe\x88PA\xc9\xbf\
+\xe2\xf1\xb9/\x00J\xad\xf6\x08\xca\x01\x010\xbdh\xe4\
+oY\xe6\xb2\xa8\xa4\xaf\xc0\xe0\x7f\x88W:\x93a?\
+Z%\xbd)\x22\xf9?\xc0W\x9dI\xb5\xcf\xcb\xed\x9f\
+\xcb\xf4\xbe\x8dlr\x1b\xb2M\xbeO\xd7\xf5!\xd9\xf3\
+\xcd\xb6\xb5Y\xd4\x96\x0f\x90\xcd/\xa7\xb6=\x97\xc7m\
+\x84F\xbf\xb4\x15I\xc5+M\xd3\xb6\xe5\xf37J\xfb\
+j5\xe7`\x19\xf1\x94\xbf1\x22{<\x96%\xff\xf2\
+\xb3\x134g\xce\xa3\xe7\xcd##\xf59\x05#\x7f\x9f\
+\xc3}\x01\xd0\x15\xf6\xea\xbf\xe4)\x04_\x00T\x8aB\
+\xfe\xb4\xb2\xd9\x8dV\xb1_i\x87\xf4U\x18\xfc\x14\x80\
+\x8f\x91a\xbfE\x8b\xb6\xd7\x1c\xc7\xfaW\xb4\xfe\xea\x07\
+&\xd5>\xcb\xb2jy+\xec\xc3\xc5\x0c\xf9\xf7G\xfc\
+\xb5\xfc\x8c\x193^\xa2\xea|\xab\xd7\xb7\xe9\xe5\xd7a\
+\xf9U:_\x80\xe5\xe7\x0c\x81\xf6H\xd8U\xd5\xc9\xda\
+Od\x7f}\xd3Z\x06\xe6=\xcb\x97\xef8CF<\
+\xa5\xb6|>\xcb\xe2\x8e\x16\x1f\xffp]v\x8e\xeb\xba\
+o\xa6\xc7\xc81\xbf\xf9o\xef}\x01\xd0\x1dF\xfe\x9d\
+\x9e:\x98\x1a\xd8/\xc85\xf97H\xdf\xfe*\x11\xd8\
+\xbd\x19_\x19\xae\xa1\x00b\xc8\xf0\x07M\xa4c#\xde\
+\xb3\xfeqR\xed\xa3\x95T\x85\x02\xf5\xef\xf3B\xfe\xbc\
+\x96\x03\xfd\xf9~^L&k\xf3M\xd7\xf5\x19\xde\x9b\
+\x81?\xe7\xc5\x1f4v\x7f\xd7\xea-\xdbd\xecG\xc2\
+\xf8\xd2\x88\xed\xfb\x1f\x19\xfe\xa5y\xc6\xf8Y\x84\xbc\x88\
+;\xf2\xeb\xed<\x1d4\x8d\xd5\xfd[\xcd\xb5\x8c-n\
+{\x03\x02\xa0\xdc\xea\xd0_P\x00t\x0bg\x09\xca\x96\
+q:,\xcb\xdc\x91\xaf\xf4}\xd2\xcfG\x06\xb3\x0d\xf7\
+\x96S\xf7\xc7\xe8\xe8\x5c\x871\xeb\x09\xf1{\xcc\xdas\
+\xe3WQq\xb6\xaf\xf1\x9a/\xf3d\xb3\xde[\xed\xef\
+\x92\x17\xb1]\xabU\xf7\xa49wY\xf0\x90hV\xe7\
+\x9bij\xab\x93\xb2\x1f\x89\xa6A\x9a#/\x88\xb7O\
+{\x84\xbfu\x91\xe1_\xbe\xc7\x9e\xd336\xeb\xb8\xd0\
+\xa3?O$\xfb\xbe\x9c'\x10\xcb\xf0\x9bm_\x00T\
+B\xf9\xdc\xfb\xa5\xce\xc0\x1d\xc1<\x91\x7f\x07\x05\xd4\xa5\
+\xfe\x9e~\x1e\x0f\x84\xf1=o\x19\xfep\x1c\xf6\x85(\
+\xfd5M\xfd\xb8\xa4\xda\xe7\x1fN\xca\xb0\x7f\xd7\xd0s\
+\x06'\x81\xbcn\xb3\x0d\x0f\xd7w\xb0m\xf3\xfc\xf1\xab\
+\xc7\xac\xcd7\x1a\xc7\xefL\xca~\xe3\xeb\x89\xb4\xce\xfb\
+\xa1\x7fZ\x86\x7f\xfd\xdc'y\xbf]\xe3\x9dw8\x83\
+1m\xa7\x0c\x9ei\xeb\x15:\xc3\x17\x10\x00\xa5\xbc\x90\
+?M\xa4y\xfc\x9e~pO?\xa7\xe4\xff'\x19\xfe\
+\x98?\x7fV\x9d\xda\xf7t\x94\x8383g\xce\xecI\
+&\x18i\x0b\xf9\xca)\xa3\xfe]\xc7O\x81\x93\x1f\x07\
+\x8ap\xc0\x96\xff;?\xbcH\xfd\xbe@\xa4r\xa6\x8a\
+\xe4\xe0\x9d\xc9\x18M\xc2~</\x06}\xc7\x83\xe2\xdb\
+D\x1b\xea\x04l\x9d\xb6\x7fy\x92$\xdb6\xfeZ\xb0\
+\xab\xa1\xbf\xafV\x9d7\xaeX\xb1l\xeb\x8c\xcc\xb7\x9e\
+(\xe9~;\xb3N\xfe\x8d|\xef\xfa\x1b\xbdW8E\
+Ib\xf2\x01\x19\xfep\x1c\xeb\xab\xd1\xfa\xa8\x1f\x91D\
+\xfb\x1a\xfb\xfe\xc6\x1d\xd9<]n\x5c\xed\xdd[\x9eR\
+\x14\xf2\x1fw\xf0m1/\x02\x95\xcd\x95\xa1\xf1'\xff\
+<@\xdc\xf6\xb3m\xf3m\x11\xabh\x1e+\xc3\xbf\xae\
+\xcb>]\xc4$S\x14\xfb\xfe\x5c\xabU\xf7\xcb\xcd\x19\
+\xb9v\x89_\xa1\xce\x94\x1a\xe5g\x9bg\xd5\xca+\xf9\
+\xf3\x95\x08?l\x95\xb6?FF\x86\x07\x1b\xd7\xd1\x84\
+\x83\xe5MS\xbcz\xeb\xf1\xd7\x1e0N\xcf\x9a\x7f-\
+\xcb|\x801\xe3uy>`\x1b\x05\x8f\x9f\x80\xe7U\
+\xde2H\x0e_K\xc2~\xcb\x97/\xdd\xcaq\xcc?\
+Fh\xdf\x93\xfc*a\xda\xfe\xf5\xde\x02\xae)p\x86\
+\xc9\x1fX\xb4\xb2\xc9\xd3\xfc\xcd\x5c\xf0hd-\xdbp\
+\x8a\xb3p\xe9Ky\xf9R\x19\xfe`\xcc<9Z^\
+u\xf3\x15I\xb4\x8f\x17(\xc9\x9a\x7fy\xbad\x9e\xac\
+\x07\xe4\xbf\x99\x08\xd8\x86\xe7\xdf\xcf\xda\xfc\xad\xd7\xdd\xd7\
+\xaaP\x82\xb7\xd95\xe0t\xde\x04\xb2\x9f\x14;\xbd\xb4\
+\xf6\x08\xbf=\x00\xf2O\xb93\xfc>49`U\x91\
+s\x97\xd3\xc0\xdb3m\x7f\x0c\x0e\x0enM\xdf\xfdD\
+\x84\xa2*W'\xd1\xbeZ\xad\xb6\x0d_Ig\xc5\xbf\
+$\x9a\xee\xaf\xd5\xaa\xfb\xa2\x96F\xcb\xb3;{\xfao\
+\x03\xb20\x7f\xb9_\x17-Z`%C\xae\xe6M\x11\
+\xd2??\xc2\xb7\xc3\xd2_\x0c\xa8S%P\xee\xed\x10\
+\xfd\x8bS\xbc\x0a\x92 \xff\x84\xf1\xf8\x01?\xc3\xd0\xef\
+.8\xf9?0%\xe1\x92\xa5\xcds\x97\xeb\x1f\x8e\xd8\
+\xce]\x13*<\xb4:;\xe4\xcf.\x19\x19\x99\xed\x82\
+\xfc\xc5~\x06\x06\x8c~\x22\xbf\x9fehO\xf8\xccd\
+2\x92Z\xaf\x8c\xf6\xa6M{w\xda\xfe]\xb8pa\
+\x17}\xf7\xc3(,\xb5\xe1\x9c\xd3\xa5\xc1\x83\xce \xff\
+\x04\xf0\x183\x0e c?]\xf4\xaaeD\xc4\xa7\xc8\
+\x99\xecQ\xaa\x97iW$Sx\xa8\xfa\xaa\x8c\xf8w\
+\xad\xeb\xda\x9f@!\xad\xe8xcc\xcb\xb7\xaaV\xed\
+\xa3\xc9\x86\xeb20\x7f\xd7\x13Y\x8f%a?\x12\xd0\
+\xbf\x89P\x17\xe2\xeeZ\xcd-\xa5\xed_~\x16\x02\xe4\
+\xbf1\xe6]\x17\xacp\x0a\xf2\x8f\x11\x8f\x14\xd6;\x1a\
+\xd7\xa6P\xb2\x94\x17)\x92P\x18\xe9\xd0(mdL\
+\xdf9\xee\xf6-Y\xb2h&O\x83\xaa\xba\x7fiU\
+\xf8P\xadV}\x15\xc8\x7frx\xf5\xba\xb3O;+\
+L\x09\xf3\xf7\xcez\xbd\xde\x1d\xb7\xfd\xf8\x1b\xb4hg\
+\x12\x9c7\xa4\xed_~G\x1e\xe4\xbf\xa9\x08\xe0o\x02\
+@\xfe\xb1\x92\xbf\xf1~\x0c\xae\x8d\xe4\x7f\x8f\x9cz\xe0\
+\x9b_\xaf\x0c\xd9\xfb\xbf&\xa1\xabG\xc7\xa8\xef_v\
+\xe7\xc8\xc8\xc0<\x90\x7f\x5c\xdbNf\x9d\x97\xba\xce\xc0\
+\xfc\xfdX\x12\xf6\xa3\x85\xcf\x8d\xa2\xeds\x1c\xf3F\x09\
+\xfe\xed\x10y3X\xac\x92\xdc\xfae;\xec\xb0`k\
+\x95\xc9_\xf8\xf6\x9f\x02\xe4\x7fX\xab\xa4!E\x1a\x5c\
+\xb4\x02\xfe|\xda\xfe\xe0o\x1c\xa2\xb4\xd1u\xddC\xe2\
+n\xdf\x9c9\xc3\xb3x\xf2!\xc5W\xfe\xd7\xf0\xb2\xb9\
+ \xffx\xf1\xf8uW~\xa0T\xf1\xf9\xfb\xa4m\xdb\
+\xfd\x09\xbc\xf9<(J\xfb\x06\x07\x07vJ\xdb\xbf\xe3\
+3\x18\x16\x9b\xfc}1\xc6\xbe\xa1\xe8|\xf3S\xff\x0b\
+'\x09\xea\x91x\xe0oW/M*\x06\x97\xf7\x0c\x0c\
+\xd4\xc7\xd2\xf6G\xab\x1b\x17\x9b\xf6\xd7\xb8;\x90-+\
+\xb6\xf6\x11\xb9^\xa8\xf8\xca\xff\xb2\xa5Kw\xe8\x03\xf9\
+'\x83\xc7\x13\xef\x10\x19^\xa2\xf8\xfc=3\x01\xfbu\
+R\x1c\xfc[\x84\xab\xa6\xa7\xa7\xed_\x12h\xcb\x10\x9f\
+7\xc7\xab\xd7\xdd\xc3\x15$\xff\x92\x90\x00\x08\xd4\x13\xee\
+\x95\x11<x\x85\xbb\xb0\x04!\x05\x1d\x5c\xffJ;\xf8\
+zW.\x9f\x12\xed\xaf\xeb\xda\x1f\x8e\xbb}$z^\
+\xea\x17\x93Q\x94\xfc\x7f06\xb6b[\x90u\xb2x\
+<\xdb'\x89\x80\xef)<\x7f\xd7\xf3\xd4\xd4q\xdb\x8f\
+p\xdf'\x9eaR{L\xa4ja\xcc\xfe\xed\xe0\xe9\
+\xbe\x11\x9f7\xc3z\xdc\xa6\xbf(D\xfe~\xbd\x9fp\
+\x01\xe0}\xb8\xe2\xad\xfe{%L\xf6\x0e\x9a\xe8W\x81\
+\xfc\xc7\x93+;-\xed\xe0K\xdf\xfd\xb6\x08{\x90\x8f\
+.Z\xb4\xbd\x16w\xfbl\xdb\xbcJe\xf2_\xb6l\
+\xf16 \xeb\xd4\xf0:\x9b\x89\x00u2t\x1a?\x8b\
+\xdb~}}}\xd3\x89`\x1f\x8d\xd0\xbe\xc3\xd2\xf6/\
+-\xd6\xbe\x01\xf2\xdf\x1c\x8fW\xf7T\x84\xfc\xbb\xbdj\
+\xbf]\xa1\xa9\xff\xbd\x0f\x97\xbd\xd5\x7fO\xa0\xb6pj\
+\x93\xdd\xaf\xee\x06\xf2\xdf\x14\xaf^w^\x93\xfe\x9b\x18\
+\xe3\xe6\x08{\xe0_\x8b\xbb}\xb5Zm/\x95_\xfb\
+c\xe5\x9f>\x9e\xf7&\xe0Ru\xe7\xaf\xb6<n\xfb\
+\xf1\xab\xbf\xa2\xed\xe3\xd7\x07\xd3\xf6/}\xe7+A\xfe\
+\xcd\xf1\x88\xcf\xf6\x92<\xdf\xca\xde\xb3Q\x00\xb4R\x0a\
+\xd3\x02\x02\xa0'\xe5\x03%f\xd8]\xff\xa2\x0e.\xc6\
+\xac'\xd2&\x1b^\xf5,J\x7f\x87\x87k\x8b\xe3n\
+\x1fc\xecZU\x0f\xfca\xcf_\x1e\x1e\x7f\xcd\xcd\x0f\
+\x06*z\x15\xecW\x09\xf4wN\x94\xf6\x89\x94\x96\x8e\
+\xb3}\xfc\x1a$\xdf*\x04\xf97\xab\xdah\xfc\x99L\
+\xb4\x85\xa4\xf9V\xf1\xf8\xdc\x17\x00\xa5V{\x04\xe5\x80\
+\x00\x98\x9e\xf6d7Mm5\xc8\xbfi\xc6\xb1\x9f\xa4\
+_\xa8E?N\xbc\xbf\xec\xfa\x04\xee\x81\xbfF\xd1\x95\
+\xff\x9d8\xed/\x1fo\xce\x9ca\xc7q\xcc\xbbU\x9c\
+\xbf\xb6m\xbc<\xfe\x0c\x98\xe6\x8d\x11\xd2\xd3~*m\
+\x7f\xd0\xbc\xb8\x04\xe4?aM\x94C$\xcc7\x9f\xc3\
+}\x01\xd0\x15\xf6\xea\xbf\xe4)\x04_\x00T\xd2'\x7f\
+s\xeeDW\xfe\x8a\xae,)\xd2\xbd'm\x7f\xf0\x9c\
+\x03\xa2\xed\xabV\x9d\xb7\xc5\x9f\x0eU\xff\xb5\x82+\xff\
+\x87\x87\x87g\x8f\x82\xac\xd5\xc0\x9b5kh{~\xf6\
+D\xb5\xf9Km\xba*\xee\xfeV\xab\xf6\xbbD\xdbg\
+\x18\xfa\x1f\xd3\xf6\x07\xb5\xef\x83 \xff\x09\xdf\x0a\xdd\x96\
+\xb2?\xfc\xb7\xf7\xbe\x00\xe8\x0e#\xffNO\x1dL\x0d\
+\xec\x17\xa4>\xd9)\xe0\x9f\x0b\xf2\xdf\x04\xef)\xc7a\
+\xdf\xe5\xf7\xea\xe7\xcc\x19\x99\x96\xb2\x18\xdb!\xcai\xd7\
+z\xbd6=\xce\xf61f-Q\xd0\x1fk\x07\x07\xab\
+{\x83\xac\xd5\xc2\xf3\xde\x14\xadSm\xbc\x0c\x0d\xd5v\
+\x8e\xb3\xbf\x0b\x16\x8c\xea\x84\xfb\xa4x\xfb\xac\x914\xfd\
+\xc1\x851\xc8?\xf4\x80\xe8X\x8a\xfe\xe8\x0d\x08\x80r\
+\xabC\x7fA\x01\xd0-\x9c%(\xc6\xce\xe8\xban5\
+\xbb\xf3_@\xf2\xdf@\xfa\xd5\xaa{\xe8\xe2\xc5\x0b\xfb\
+e\x05_j\xcbI\xa2\xfde\xccX\x15w\xfbL\xd3\
+\xb8H5\xff\xba\xae\xfd)\x90\xb5\x9ax\xe4\xab\x8f\xab\
+\xb7m\xc7\xbe\x93\xc0\x99\x98s#\xb4\xe7\xb3i\xfb\xc3\
+\xb6\x8d\xbf\x82\xfc'\xcc\x10xN\x8a\xfe\xf0\x05@%\
+\x94\xcf\xbd_\xea\x0c\xdc\x11\xec\x901\xd9MS\xffd\
+\x81\xc9\xffI\x22\xd1\x0b\xf9J\xdf#}\xd9\xc1\xb7\x83\
+\xda\xf4\x0f\xd1\xfe2\xa6\xef\x16g\xfbl\xbb\xcf!\xdc\
+\xb5j\xf9\x97]\x06\xb2V\x1a\xafC$QP\xca\xf1\
+`\x8di\x9aN\xbc\xdbb\xd6\x9e\x11\xdatg\xda\xfe\
+\xd8~\xfb\xf9e\xea\xf3\xce\xf4\xdd+i\xc5\xfbk\xc3\
+\xd0\x9e\x07\xf9o|\x9e\xb2m\xbb\x9c\x92?z\x85\xce\
+\xf0\x05\x04@I\x16\xf97V\x9c\x9b\xe6\xfb.\xc0`\
+x\x92\x9e\x0bh\xb2\xec\xcb_\x9f\xab\x14|\x9b\xbd\xfe\
+\x9f\xa8\xbf<Y\xd3\x94\x90Z\xd8\xed\xb4o\xa2\xb7\x0f\
+\xf2J\xfaZ\xff\x19\x1e\x9eU\x05Y\xab\x8d\xe7\xba\xdb\
+\xf5\x91\xef\x1eT,\x1e\x9c\x10s\x7fKQ\x0a$\xf1\
+sU2\xfd\xabiZ\x85b\xfb\xee\xdc\x0e\x86\xa1\xff\
+v\x22a_\x94\xc5\x1e-\x96^\x95\x92?z\xa2\xa4\
+\xfb\xed\x94I\xfe\xe3\xaf\x9b\xe5x0l$\xfd\x14\x95\
+`\x1bI=\xf4\xcf\x88\xf6\x97|\xf7\xf58\xdb\xd7\xb8\
+\xe3m<\xa4\x92\x7f\xabUw\x7f\x90u6\xf0,K\
+\xdf[\xa5x\xc0\x052/\xa5\x1dg\x7f\xa9\x8f\xa7G\
+x\xed\xfcQ\x95\xfcKqo+\x12\x04\xfb4\xf2\x1a\
+\xe8\x7f\xe0\x87\xbe\x8bU\xcb\xc5\xf8\x8aR\xf3\xad]\xe2\
+\x8fs\xb2\xf3JZ9&\xff\xcdH_\xf5\xe0K\x13\
+\xf4z\xd1\xfeR\xbfv\x899\xb8\x1d\xa4\x96\x7f\xd9y\
+ \xd7l\xe1\xd1\x18:O\xb1{\xe0\xfb\xc7\xd9_Z\
+E\xbe,\xc2m\x84_\xab\xec\xdf\xd1\xd1\xa1j\xad\xe6\
+\x1c\xe98\xec[\xfe\x95\xce<\x9f!p\x1c\xeb6\x94\
+\x08\xdel\xc5\xa9\xfd2g\xe4?!\xe9\xab\x1e|5\
+M\xdb\xd6?Q-\x90q\xec\x81)\x02\x09.\xa2\xb4\
+\x8fVL\xbfP\xc5\xbf\x8cY\x0f:\x8e\xb3-\xc85\
+[x\xde\x18~H\x95x\xd0,=\xf0$\xfb\xdb)\
+\xf2\x96\xcc;\xa0\xfb\xc2\xbcys\xcc\xac\xf8\xd7\xb2,\
+\x9b\x04\xdc\xe1\x8d|0\xad\xcb\x0cg\xf0\xcd\xf1\xda\xc0\
+9/\x90\xff\x94\x0d\x85$\x8c\xff\xe6\x80\xfc9\xe9\x9f\
+\x1fF\xfaY\x08\xbe\xd4\xfe\x83E\xedGd}V\xbc\
++\x1bVmU\xfa9]\xffZ\x87\x80\x5c\xb3\x89G\
+$r\x84B\xe4\xb0\xdeq\xfa\xed8\xfb\x1b\xf6\x96c\
+|\xfbj\xb5\xea!Y\xf5/q\xc3\x00\xafGB\xb1\
+\xe6\xdba\xe7;\xb2\xc4\x1fCC\xd5]@\xfe\x1b\x07\
+\xb25\x94a\xf2\x17&\xfd\xac\x04_\xea\xcf9\xe2\xf6\
+\xd3\x0f\x8a\xb3}\xa2W\xb9\xd2\xf0/\x05\x9ck@\xae\
+\x99\xc6\xe3\xb7\x02nT\x85\x1chE\xfb?q\xf6\x97\
+\x88\xf1\xd0\x08\xed;3'\xfe\xe5\x8b\xc5y\xd4\xc7\xf7\
+\xd3\xfc\xfc\xb1ah\x8fg\xf1\xcdq\xadf\x1f\x01\xf2\
+\xf7\xf0\xeau\xe7\xc0\x8c\x91\xffS\x8c\x85\xbf\xde\xcfr\
+\xf0\xb5,\xf3\x01A\xfb\xad%\x1bl\x13\xef\x01.\xed\
+\xf7\x8a\x88\xbb\xf5$L\x17\x81\x5c\xb3\x8dG$\xb1\x93\
+*\xe4\xc0\x8bj\xc5\xd9\xdf\xfe\xfe\xfe\x99\xcd\xde\x965\
+/\x11l\xfc-\x8f\xfe\xa5\xfev\xd5\xeb\xf5]\xabU\
+{%c\xec\x0a\xea\xeb3\x19Y<~\x04\xe4\xef\xe1\
+\xf1\xfa\xf1\x19\xc9\xc8\xf7\x9dj\xd5=xhh\xb0\x92\
+\xd7\xe0K}\x9b\x1f\xc1~\xd7\xc6\xd9>\xdb\xd6f)\
+\xf4f\xe7\x02\x90k>\xf0\x1c\xc7\xfa\x91*\xf1\x85\x04\
+s=\xce\xfez\xd7\xea\x04o#\x98F\xde\xc7\xcb\xf2\
+\xe5;\xce \xe1>\xd6N\x0e\x824\xe3\x8bi\xea\xc7\
+\x83\xfc=<\x22\xd6\x93\x14\xce\xc8\xf7\x1d\xbe\x7fV\x94\
+\xaao\xb5\x9a\xf3\x0eQ\xfb\x85\x15\x1bi\xb3\xf0\xd0g\
+\x14!\xff\xb5\xba\xae\x0f\x81\x5c\xf3\x817k\xd6\xd0R\
+\xf2\xed:5\xe2\x8b\xfe\x898\xfb\xcb3\xfd\x89\xb7\xaf\
+\xf5v]\xde\xc6\x8bh\x0e\x02\x09\xdb\x08_\x93M\xfe\
+\xc2\xb7\xff\x92v\x1e\x91\xec\xa9\x8ae\xe4\xbb\x80\xaf\xf4\
+=\xd2/T\xb0t]v\x96\xb8\xfd^\xacy\x1eG\
+\xfb\xc2^\xff\xa7|o\xfb,\x90k\xbe\xf0\x1c\xc7\xfa\
+\xb6\x0a\xf1\x85V\xa57\xc5\xd9_\x9e[^\xbc}\xfa\
+\x97\x8b>^\xfc\x1c\x04\xfc\xed\x80\xdc\x03\x84\xfa\xe9\x12\
+\xed\xe7\xa7\xfe\x17N\x12\xd4\x93\xf0\xe4<K\x81\x8c|\
+\x1b\x0e\xf2\xf1\xd7\xfbE\x0e\x96\x8c\xb1;D\xecg\x18\
+\xdas\xbc\xfew\x5c\xed\xe3\xaf'\x15Q\xe6\xeb\xf9V\
+\x04\xc85_x4\xae\xe7)\xf2fq\xfd\xe8\xe8`\
+-\xae\xfe\xba\xae\xd3\xc3\xd3\x0d\x8b\xb4\xaf\xd9\x19\x84\xa2\
+\x8e\x17\x12\x00\xc7H\xbe=\xb0J\x22\xf9\x97\x84\x04@\
+\xa0\x9epo\xb2\xf7>\x8d\xd5\x92'\xe7J\x04\xcb\xb1\
+-y}{\xb2\xdfz\xc1\x03M\xd7\xc4\xd9>\xd3\xd4\
+\xde\xa4\xc2\xd5\x1ej\xc7OA\xae\xf9\xc4\xa3U\xd7e\
+*\x9c)\xaa\xd5\x9c\xb7\xc7|\xc6\xe1f\xc1\xf6\xad\x9d\
+9sf\x0f\xc6\xcb\x8b\x02@\xe2\x01\xd1U\x92\xc8\xdf\
+\xaf\xf7\x13.\x00\xbc\x0fW\xbc\xd5\x7fo\x92\xce\xe3\xaf\
+\x5c%+\xf3\x95\x08\x96c[\xf2t\xb7\x11l\xf6\xf9\
+8\xdbG\xc1\xf9\xbb\x8adl\xdb\x15\xe4\x9aO<^\
+\xb0J\x85\x03a\xbc\xd2g\xbcg\xa8\xac\xaf\x89\xb6\x8f\
+1\xe3\xa5\x18/\x1b\xde8\x1e+\xf9v\xc8*\x09\xe4\
+\xdf\xedU\xfb\xed\x0aM\xfd\xef}\xb8\xec\xad\xfe{\x02\
+\xb5\x85\x13q^;\x02 \xde\xdc\xcc\xe6\xd1\x08\x96\xfc\
+5\xa9\x19\xa1\x9c\xaa\xb6O\x8c\xed\xeb\xf4\xef\xf3\xca$\
+\x7f\x1a\x87\xb7\x83\x5cs\x8d\xd7A\xe3\xf6.\xf9%\x82\
+\xcdG\x97/_\xbaU\x5c\xfd%\xe1\xfe\x86\x08\xed\xfb\
+\x00\xc6\x0b\xaf6j\x9f(\xf9j\xe8\xaa\x94\xedW\xf6\
+\x9e\x8d\x02\xa0\x95R\x98\x16\x10\x00=I:/\xaa\x00\
+\x88{r\xba\xae}\x1c\x82\xe5\x86z\xea\x17\x88\xda\xac\
+Z\xed\xdb.\xae\xf61\xa6-T!\xa3\x97i\xea\x1f\
+\x02\xb9\xe6\x1b\x8f\xfc\xfcQE2L\xce\x8f\xab\xbfs\
+\xe7\x8e\xd4#\x1cB\xfc\x16\xc6\x0b\xdf6\xd9T\x00H\
+8\x83\xb6*\xc5\xfeV<>\xf7\x05@\xa9\xd5\x1eA\
+9 \x00\xa6'\xed\xbc(\x02 \x89\xc9I\x02\xe0x\
+\x04\xcb\x0d\xfbb\x7f\x12\x0b\x22\xda}q\xb6\x8f1\xe3\
+\xbd\xf2s\xb5k/\xf0\xfc\xf1 \xd7|\xe3y\xe5\x82\
+\xd7(p\x0f\xfc\x9d1o\xa3\xfe'j2\xa2\x22\x8f\
+\x97\xa0\x00\x90t\x00}UJ\xfd\xf59\xdc\x17\x00]\
+a\xaf\xfeK\x9eB\xf0\x05@%\x0d\xe7\x89\x0a\x80\xa4\
+&g@\x00\x146X\xf2\x13\xfda\x81q\xdc\x15\x96\
+\xcb\xe2\xad=`\x5c$;\x9dg\xab\xc3\x7f \xd7\xfc\
+\xe0\xf1\xc2<\xf2\x0f\x9c\xea\xe7\xc5\xbc\x8d\xfasA\xf1\
+\xfe,\xdfr+\xfax\xf1\x05\x80\xc4\xdbg\xabR\xe8\
+\xaf\xff\xf6\xde\x17\x00\xdda\xe4\xdf\xe9\xa9\x83\xa9\x81\xfd\
+\x82T\x9c'\x22\x00\x92\x9c\x9c\x9e\x00(t\xb0\xb4m\
+}\xfb\x08g&N\x8c7\x9d\xa7\xf6/\x05\xd2\xb5\x1e\
+\x06r-\x06\x1e\xad\xbe\xdf\xa8\xc0\x81\xd3\x7f\xc4\xd9_\
+\x125'\x8boy\xea#E\x1f/\xfc\x0c\x80\xe4\xab\
+\xe7\xabR\xe8oo@\x00\x94[\x1d\xfa\x0b\x0a\x80n\
+\xe1,A18\xaf\x95\x00Hzrzg\x00\x0a\x1d\
+,\x193\xde \x1e@\x9c\xb7\xc4\xd5>F?\xb2\xc9\
+\x9f\xa7\x0b\xadV\xab[\x82\x5c\x8b\x81GCnk\xbe\
+\xe5#\xbf\x8a\x9c\xa5\xc7\xd5_^>W\xb4}\xb5\x9a\
+}x\xd1\xc7\x0b\xbf\x05 \xf9\xea\xf9\xaa\x14\xfa\xeb\x0b\
+\x80J(\x9f{\xbf\xd4\x19\xb8#\xd8\x91\xa6\xf3\xc2\x04\
+@\x1a\x93\x93\xdf\x02(z\xb0\x0c\xa6\x14me\xbf\xc1\
+\xc1\x81\x9d\xf2T\x08\x8a\xbf>\x05\xb9\x16\x0b\x8f\x08\xf3\
+J\xd9\xdbN\xb4j\x7fe\x5c\xfdeL[ \xda\xbe\
+j\xd5\xfel\xd1\xc7K0\x11\x90\xa4\x03\xe8\xabR\xe8\
+o\xaf\xd0\x19\xbe\x80\x00(\xa5M\xfea\x02 \xc5\xc9\
+\xb9\xb2\xe8\xc1\xd24\xf5\xb3\x05\xed\xb7n\xc5\x8a\x1dg\
+\xc6\xd5>\x1e\x8c\xe4\x17j\xd1?\x08r-\x16\x1e\x89\
+\xfe\x8f)\xb0\xed\xf4\xd1\xb8\xfa\xcb\xab\x926\xab\x0c\xd8\
+\xfc\xcc\x13;\x0b\x07\x9e\xa3\x0b\x80\x98\xaf\x9e\x9f\x91B\
+\x7f\xc5n\xef\x05\x04@\x87\x0c\xe75\x13\x00)O\xce\
+\x95E\x0f\x964!~#\x96\xc4\xc4\xfaW\x9c\xed\xb3\
+m\xf6=\xd9\x85\xa0\x18\xeb\x1f\x06\xb9\x16\x0bo`\xa0\
+\xbeL~\x89`\xfd\xdc8\xfb\xcbo\xe7\x88\xb5\x8f\xfd\
+\xaa\xe8\xe3%\xaa\x00\x88\x9b\x8f\x1c\x87\xadV\xc6~\xed\
+\x12\x7f\x5c\xce\x1b/\x00$(\xf3\x95E\x0f\x96\x96\xa5\
+\xdd+\x96\xc4\xc4\xbaFF\xed\x81\x04'\xe7\x83 \xd7\
+\xe2\xe1\x8d\x8d-\xdf\x8a1\xe31\xb9\xe2S\xbb-\xe6\
+7\xa9\xd7\x88\xb4\x8f\xfa}O\xd1\xc7K\x14\x01\x90\xcc\
+\xd5sv\xb6\x8a\xf6\x93\xf2\xe5A\x01 \xe9\xb5\xdc\xca\
+\x22\x07\xcb\xe1\xe1\xe1\xa9d\x83ub\xf63\xcf\x8f\xab\
+}\xcb\x96-\xde\x86\x172\x91y\x1a\x97\x02\xc1\x0fA\
+\xae\xc5\xc4\xa3\xb1|\x99L\xf1\xc9\x0f\x9fR\xb3\xb6\x88\
+\xab\xbf\xfc\x8d\x82H\xfb\xc6\x7fo\x11\xc7\x8b\xa8\x00H\
+\xee\xea\xf9F\x01Pl\xf2\x0f\x0a\x00\x89{r+\x8b\
+\x1c,M\xd3\xac\xcb8092R\x9f#\xbbD\xab\
+i\xea\x1f\x01\x19\x16\x13\xcfu\xed\xcf\xc8\x1e\x7fDD\
+f\x5c\xfd\x1dOja\xed\xd3u\xdd*\xf2x\x11\x11\
+\x00\xc9^=\xdf \x00@\xfe\x0d\xe5j\xac\x96| \
+ge\x91\x83%\x09\x80\x9d\xc5\xed\xa7\x1f\x11W\xfb\xe8\
+{_&\xbbD+/\x8e\x022,j\xed\x0b}\x0f\
+\xf9%\x82\xb5\x15\xf1\xbdI}\xb1\xa2f\xab\xf6\x11\x01\
+.)\xf2xi%\x00\x92\xe6#\xef\x0c\x00\xc8\xbfQ\
+\x98\x81\x9d'\xf9@\xce\xca\x22\x07K\x9a\x0c\xfb\x89\xdb\
+O{y\x5c\xed\xa3\xd5\xf7\x91\xf2\xeb\xb3[\xdb\x81\x0c\
+\x8b\x89g\xdbv\xbf\xec\xf1\xc7\x98yx|oR\xcd\
+=D\xdbG\xc2w\xaf\x22\x8f\x970\x01\x90\xd2\xd5\xf3\
+3@\xfe\x1b\x0b3\xb0\xf3%_\x05[Y\xe4`I\
+\xc1\xe0\xad\xa2\xf6\xe3\x19\x03\xe3j\x9fh\xee\x81\xa4&\
+'?5\x0d2,6\x9eh\x0e\xfd\x04O\x83\x7f.\
+\xae\xfe\xd2Bj\xb1x\xfb\xf4\xc3\x8b<^&\x12\x00\
+)\xbe\x89^\x05\xf2\xdfX\x98\xe1E\x01 iOn\
+e\x91\x83%\xf5\xff(Q\xfbi\x9a\xc6\xe2j\x1f\x9f\
+\x04r\xeb\xb3\x9bW\x81\x0c\x8b\x8dGDx\x95\xe4\xd3\
+\xe0g\xc5\xd5\xdf\xe1\xe1\xda\x5c\xf1\xf6m\x9e\xfb\xa2H\
+\xe3\xa5\x99\x00Hy\x1bz\x95l\xf2\x17\xbe\xfd\x97|\
+a\x86\x86\x00\x90x ge\x91\x83\xa5i\x9a_\x10\
+\xb5\x1f\x09\x80J\x5c\xed\xe3'\xf0%\x07\xdfs@\x86\
+\xc5\xc6\x93]\x88\xccq\xac\x9f\xc4\xd5\xdfy\xf3\xe6\x98\
+\xa2\xed3M\xfds\x05\xdf\xf6<F\xf2\xd5\xf3U\x12\
+\xed\xe7\xa7\xfe\x17N\x12\xd4\x93la\x06v\x9e\xe4\xd3\
+\xb8+\x8b\x1c,\xc5\xcf`h\xcf\xc4\x1c|\xaf\x96|\
+\x15\xe7\x18\x90a\xb1\xf1\x88\x08?#\xf34x\xfcy\
+5\x8c\xe7\xc5\xd2_\xeb\xa7\x15y\xbc\x04\x05\x80\xa4\x03\
+\xe8\xab$\x92\x7fIH\x00\x04\xea\x09\xf7&\xe9<~\
+\x0b@\xf2i\xdc\x95E\x0e\x96\x8c\xb1K\xc4\xec\xa7\xdd\
+\x1bo\xf05n\x97\x19|k5\xe7\xed \xc3b\xe3\
+\xb5:\x88\x9a490f\xdd\x1eg\x7f\xe9;\xee\x17\
+\xbb\xfe\xaa}\xa7\xc8\xe3\xc5\x17\x00\x12o\x9f\xad\x92D\
+\xfe~\xbd\x9fp\x01\xe0}\xb8\xe2\xad\xfe{\x93t\x9e\
+\xe8k\xb8\x04'\xe7\xca\x22\x07K\x12\x00W\x88U\xcd\
+3\xfe\x1cg\xfbx\x16>\x99\xc1\xb7Zu\x0f\x00\x19\
+\x16\x1b\xcf\xb2\xf4\xbde\x9e\x06\xe7\x87\x10c^L\xdd\
+)&\x00\x8c\x9f\x14|\xdb\xf3X\xc9W\xcfWI \
+\xffn\xaf\xdaoWh\xea\x7f\xef\xc3eo\xf5\xdf\x13\
+\xa8-\x9c\x88\xf3\xda\x11\x001_\xc59\xba\xc8\xc1\xd2\
+q\xac\xab\xc5\xec\xa7\xdd\x1ag\xfb\x0cC{N\xeeU\
+\x1ck)\xc8\xb0\xd8x\xba\xae/\x93{\x1a\xbc\xf5\xb6\
+Z\x94\xfe\xf2\xf4\xc2\x82\x09\x88./\xf6\xb6\xa7}\xa2\
+\xe4\xab\xe7\xabR\xb6_\xd9{6\x0a\x80VJaZ\
+@\x00\xf4$|\x15\xe7,\x99\xa7\xc1]\xd7>\xae\xc8\
+\xc1\xd2q\xd8\x0d\x82IKn\x88\xb3}\xe2\xe9\x87\x93\
+\x99\x9c<\x03\x22\xc8\xb0\xd8x$\x00\x06%\x9f\x06_\
+\x1bg\x7f\x0dC\xff\xad`\x05\xcc+\x8b<^\x1cg\
+S\x01 \xe1\x0c\xda\xaa\x14\xfb[\xf1\xf8\xdc\x17\x00\xa5\
+V{\x04\xe5\x80\x00\x98\x9e\xb4\xf3\xa2\x08\x80dN\x83\
+\xdb\xc7\x179X\x92\xfdo\x16\x5c5\xfc&\xc6\xf6\x95\
+$\xdf\xc3\xe5\x02\xc0\x00\x19\x16\x1b\x8f\xa7\xc4\x95|\x1a\
+\xfc\xff\xa8\x19\x9d1.\xa6\xae\x11\x14\xf3\xd7\x15y\xbc\
+\x04\x05\x80\xa4\x03\xe8\xabR\xea\xaf\xcf\xe1\xbe\x00\xe8\x0a\
+{\xf5_\xf2\x14\x82/\x00*E\xb8\x8a\x13\x10\x00\x85\
+\x0c\x96\xb4\x1a\xf8\x83\xe0\xc1\xa1_\xc6\xd5\xbe\xbe\xbe\xbe\
+\xe9\x92W^\xff\xd7\xdf\xdf?\x13dXl\xbcj\xb5\
+o;\xc9\xa7\xc1\xb9\x10\x9d\x16W\x7f\x89\xd8\xaf\x10<\
+\x03ps\xb1\xb7=\x1b\x02@\xe2\xed\xb3U)\xf4\xd7\
+\x7f{\xef\x0b\x80\xee0\xf2\xef\xf4\xd4\xc1\xd4\xc0~A\
+JWqZ\x0b\x80d\x0b3l\x10\x00\x85\x0d\x96\xa2\
+\x07\x87H(\x5c\x12W\xfb\x18c[\xcb^y\xd5\xeb\
+\xdb\xf4\x82\x0c\x8b\x8dW\xadV\xb7\x94|\x1a\x9c\xfe\x9b\
+\xbdU\x5c\xfd\xa59z\xa9\xe0\xb9\xa7?\x17y\xbc\xf0\
+3\x00\x92\xaf\x9e\xafJ\xa1\xbf\xbd\x01\x01Pnu\xe8\
+/(\x00\xba\x85\xb3\x04\xc5\xe0\xbcV\x02 \xe9\xc9\xe9\
+\x9d\x01(l\xb0\x8c \x00.\x8d/\xfd\xf0\x8b\x02@\
+V\xf0\xe5\xc1\x1fdXl\xbcZ\xad\xb6\x8d\xe4\xd3\xe0\
+\xa1\x02 j\x7fi\x8e^&\xd2>\xef\xfaa\x81\xb7\
+=\xcdc%_=_\x95B\x7f}\x01P\x09\xe5s\
+\xef\x97:\x03w\x04;\xd2t^\x98\x00H\xa90\xc3\
+\xd1E\x0e\x96\x11\xb6\x00\xae\x88\xab}\xfe\x16\x80\xcc\xe0\
+\xdbj\x0b\x00\xe4\x9a\x7f\xbc\xd1\xd1\xc1\x9a\xe4\xd3\xe0\x13\
+n\x01\xb4w\xb56|\x0b\xe0\xc5v\xb1[\x8b<^\
+D\xca\x01'\xccG\xabR\xe8o\xaf\xd0\x19\xbe\x80\x00\
+(\xa5M\xfea\x02 ErXY\xe4`)z\x08\
+\x90V\xed\xd7\xc6\xd5\xbe\xfe\xfe\xbe\xa9\xb2W^a\x87\
+\x00A\xae\xc5\xc0\x9b={\xd6\x88\xe4\xd3\xe0M\x0f\x01\
+Nb1u\x8dX\x06B\xf3\xc6\x22\x8f\x97v\x04@\
+\xccW\xcf\xcfH\xa1\xbfb\xb7\xf7\x02\x02\xa0C\x86\xf3\
+\x9a\x09\x80\x94\xc9ae\x91\x83%\xf5\xffZ\x11\xfb9\
+\x8eus\x9c\xed#\xccu\x92W^u\x90a\xb1\xf1\
+\x06\x07\x07\x16I>\x0d\xbe6\xce\xfe\x12\xb1\xdd$V\
+\x8f\xde\xfaM\x91\xc7KT\x01\x90@\x15\xc8\xd5\xca\xd8\
+\xaf]\xe2\x8f\xcby\xe3\x05\x80\x84\x95\xe1\xca\x22\x07K\
+~'X\xacp\x89\xf9\x87x3\x10\x1a\xcf\xca\x0c\xbe\
+\x14\x04\x96\x80\x0c\x8b\x8d78X\xdd]\xf2i\xf0\xa7\
+\xe3\xeco\xb3D@\xcd\xda\x17L\x04T\xc4\xf1\x12E\
+\x00$T\x88\xecl\x15\xed'\xe5\xcb\x83\x02@\xd2k\
+\xe1\x95E\x0e\x96<\x18\x88\xd8\x8f1vG\xcc\x19\x08\
+\x1f\x92\x19|I\x80\xec\x052,6^\xad\xe6\x1c$\
+\xf348\xcd\xbd\x07\xe2\xec\xef\xf8\x03\xbd\x13'\xc1\xda\
+4\x15p\xd1\xc6\x8b\xa8\x00H\xb0\x10\xd9\xd9 \xffq\
+\x02@\xe2\x9e\xf0\xca\x22\x07K\x9a\x0c?\x12\xb3\x9f\xf1\
+\xef8\xdb\xc7\x98u\x87\xdc\xab8\xfa\xe1 \xc3b\xe3\
+\xd18x\x93\xcc\xd3\xe0\x86\xa1\xff1\xce\xfe\x12\xde\xfd\
+bI\xb06/\x06T\xa4\xf1\x22\x22\x00\x92\xbdz\xbe\
+A\x00\x80\xfc=\xd5\xbaZ\xf2\x81\xb0\x95E\x0e\x96\xa2\
+g0\x0cC{6\xce\xf6\xd1$\xbcZf\xf05M\
+\xfdS \xc3b\xe3\xf1\xb9/\xf74\xb8~e\xbcU\
+\xee\xb4\x17D\xda7Q9\xe0\xa2\x8c\x97V\x02 i\
+>\xf2\xce\x00\x80\xfc\xa3\xd5\xa3Olr\xae,r\xb0\
+\xa4\xfe\x9f$j?~}/\xc6\xe0\xfb\x03\xc9Wq\
+\xce\x04\x19\x16\x1b\x8fV\xc2\xabe\x9e\x06'\x01\xf0\xfd\
+\xb8\xfa\xcb\x13[\x89\xb6\x8f\x04\xc0\xb1\x05\xdf\xf6<F\
+\xf2\xd5\xf33@\xfe\x1b\x0b3\xb0\xf3%_\xc5YY\
+\xe4`I\xfd?J\xd4~\x9a\xa6\xb1\xb8\xdaG\xc1\xef\
+\x9br\x83\xaf\xf6+\x90a\xb1\xf1\x88\x08~-\xf34\
+8\xfd\xfe\x99q\xf5\xd7q\xf4\x9ax\xfb\xf4\x0f\x16|\
+\xdb\xf3\x18\xc9W\xcfW\x81\xfc7\x16fxQ\x00H\
+\xda\x13^Y\xe4`I\x93\xe1-\xa2\xf6cL[\x10\
+W\xfb\xa2\xbe~\x8d{rZ\x96\xf5\x1f\x90a\xb1\xf1\
+h\x1c<$\xf94\xf8\xb1q\xf5w`\xa0>\x16\xa1\
+}\x87\x15y\xbc4\x13\x00)oC\xaf\x92M\xfe\xc2\
+\xb7\xff\x92/\xcc\xd0\x10\x00\x12\x0f\x84\xad,r\xb0$\
+\x22\xdcO\xdc~\xda\xee\xf1\x05_\xfd\x08\x99\xc1\x97?\
+\xf3\xe7\xcf\xaa\x83\x0c\x8b\x89\xc7H\xcd\xca\x1e\x7f\xae\xeb\
+\xbe5\xae\xfe\xd6j\xb5\xfdE\xdbG\x04\xb8g\x91\xc7\
+\xcbx\x01 \xe1\x0c\xda*\x89\xf6\xf3S\xff\x0b'\x09\
+\xeaI\xb60\x03;Ora\x86\x95E\x0e\x96\xf5\xba\
+\xb3\x87\xa8\xfdLS?2\xae\xf6\x99\xa6\xb9\x8b\xcc\xe0\
+\xcb\x9f\x81\x01w\x1f\x90a1\xf1h\xfc\xed\xa1\xc0\xf8\
+{E\x5c\xfd\xadV\xdd\xf7\x88\xb6\xafY\x0e\x8c\x22\x8d\
+\x97\xa0\x00\x90t\x00}\x95D\xf2/\x09\x09\x80@=\
+\xe1\xde\x84\xaf\xe2\xac\x96y\x1a\xdc\x17\x00\x05N\x87:\
+?\x82\xfd>\x1bW\xfb\x1c\xa7\xdf\x96\x19|\xbdBP\
+\x9f\x06\x19\x16\x13\x8f\xc6\xc3\xc7e\x8f\xbf\xe1\xe1\xd9C\
+1\xbeI=)B\x12,\xb3\xe0\xdb\x9e\xc7H\xbez\
+\xbeJ\x12\xf9\xfb\xf5~\xc2\x05\x80\xf7\xe1\x8a\xb7\xfa\xef\
+M\xd2y\x22\xe5\x80\x13\x9e\x9c+\x8b\x1c,\xc7\xc6V\
+l\xeb\xa7\xe5\x15\xb8:wv\x8c\xed\xeb\xf4\xaf-\xc9\
+:\x90\xd3NB\x14\x90kn2`^\x22\x93\xfc\xe9\
+\xdf\x9e\x1b\x1d\x9d\xd3\x19W\x7fI\x00|G\x8c\xfc\xb5\
+\xe7\x09b\x8b\x22\x8f\x17^\x0dP\xf2\xd5\xf3U\x12\xc8\
+\xbf\xdb\xab\xf6\xdb\x15\x9a\xfa\xdf\xfbp\xd9[\xfd\xf7\x04\
+j\x0b't\x15'\xba\x00\x88\xb90\xc3\xd1E\x0f\x96\
+d\xbf\x7f\x09\xae\x1c~\x13g\xfbx\x22\x14\xc9\xa7q\
+\x1f\xa6ft\x80\x5c\x0b\x87\xb7\x05\x11\xe1c2\xc5\xa7\
+ei\xb7\xc6\xfc&\xf5Z\xc1\xdb/\x7f)\xfax\xb1\
+m\xfbD\xc9W\xcfW\xa5l\xbf\xb2\xf7l\x14\x00\xad\
+\x94\xc2\xb4\x80\x00\xe8I\xd2yQ\x05@\xdc\x93\xd3u\
+\xed\xe3\x90\x11M\x17\xbc\x0e\xa5\xdd\x1bg\xfb\x08\xf3|\
+\xc9\xa7qyQ\xa0\xb9 \xd7b\xe1\xd9\xb6\xbe\xbd\x5c\
+\xf2\x9f\xf8mZ\xbb\xfd\x0df\x01l!\xe2//\xfa\
+xq\x9cM\x05\x80\x843h\xabR\xeco\xc5\xe3s\
+_\x00\x94Z\xed\x11\x94\x03\x02`z\xd2\xce\x8b\x22\x00\
+\x92\xb9\x8ac\x1f_\xf4`\x19!!\xca\xbaz\xbd\xde\
+\x1dW\xfb\x08\xefc\x92O\xe3\xf2@\xfc\x11\x90k\xb1\
+\xf0&\xda\xffOs\xfc\x89\x8e;\xb1\xf9kN#\xcc\
+\xf5\x82\x190O+\xfax\x09\x0a\x00I\x07\xd0W\xa5\
+\xd4_\x9f\xc3}\x01\xd0\x15\xf6\xea\xbf\xe4)\x04_\x00\
+TR\xaaG\x7f\x96\xdc\xab8\x1b\x05@a\x83e\x94\
+;\xf9\xba\xae\xcf\x8f\xf14\xee\x9e\x92O\xe3\xf2\xb7\x1a\
+W\x80\x5c\x8b\x85\xc7\xb7\xb2\x14x\xf3\xb4G\x5c\xfde\
+L[\x18\xa1m\x1f+\xfax\xf1\x05\x80\xc4\xdbg\xab\
+R\xe8\xaf\xff\xf6\xde\x17\x00\xdda\xe4\xdf\xe9\xa9\x83\xa9\
+\x81\xfd\x82T\x9c'\x22\x00\x92-\xcc\xb0A\x00\x14=\
+#\xda\xa1\x11\xceL\x1c\x1eW\xfb,\xcb\xd2%\x9f\xc6\
+\xe5\x87\xa2^`\x8cm\x0dr-\x06\x1e\x09\xd8\x19\xe4\
+\xf75\xb2\xdf<\xd9\xb6\xdd\x1f\xdf6\xaa~\xa4x\xdb\
+\xcc\xd7\xe2\xcc\x93}\xa2\xe4\xab\xe7\xabR\xe8oo@\
+\x00\x94[\x1d\xfa\x0b\x0a\x80n\xe1,A18\xaf\x95\
+\x00H\xe1*\xd8qE\x0f\x96$\x00F\xc5\xcfL\xb0\
+/\xc7{ \xc7\xbaW\xf2\x81\x9c\x09\xf3\x1b\x80\x5cs\
+\x99\x04\xe6-\xb2\xc9\x9f\xdapO\xbc\xdb\xa8\xfa\x17E\
+\xdb70P_X\xf4\xf1\xc2o\x01H\xbez\xbe*\
+\x85\xfe\xfa\x02\xa0\x12\xca\xe7\xde/u\x06\xee\x08v\xa4\
+\xe9\xbc0\x01\x90Ra\x86\xa3\x8b\x1e,\x87\x87\x87\xa7\
+\x86]\xc9\x0b\xda\x8fV\xcbW\xc4\x5c\x0b\xe2;\x92\x0f\
+\xe4\xf0\xdc\xe8\x97\x82\x5c\x8b\x81G\xf1\xe6\x17\xf2\xb7\x9d\
+\xf4s\xe2\xddF\xd5~)\xd6>\xe3\x99\x15+\x96m\
+]\xf4\xf1\x22R\x0e8a>Z\x95B\x7f{\x85\xce\
+\xf0\x05\x04@)m\xf2\x0f\x13\x00)N\xce\x95\x08\x96\
+\x1b\xeeE\xffA\xc4~\x8cm\xcc\xa1\x1fK\xfb\x5c\xd7\
+\xfe\xb0\xe4\x039\xfcYS\xad\xf6m\x07r\xcd7\x9e\
+\x97\xfew\xad\xecm'z\xde\x16g\x7fEj\x1ax\
+\xe2\xfd\x16\x8c\x97\xd6\xe5\x80S\xb8z~F\x0a\xfd\x15\
+\xbb\xbd\x17\x10\x00\x1d2\x9c'Z\x8f>\xc1\xc9\xb9\x12\
+\xc1r\x83\x008O\xd4~s\xe7\x8e\xd4\xe3j\xdf\xc0\
+@}\xb9d\xf2\xf7\xb6\x01\xb4\xff\x01\xb9\xe6\x1b\xcf?\
+\xfd/\x99\xfc\xf9\x01\xc09\xf1\x91\x7f\xe3\x1c\x8d\xd8\x81\
+gv.\xc6Kt\x01\x10\xf7xq\x1c\xb6Z\x19\xfb\
+\xb5K\xfcq9o\xbc\x00\x9009W\x22Xn\x08\
+\x8e\x1f\x15\xcf\xa0g\xee\x1fW\xfb\x96/_\xba\x95a\
+h\x8fJ\xde\x93\xdb\x90 \x05\xe4\x9ak\xbc\x0e\xc3\xd0\
+\xef\x96M\xfe\xf4<8e\x82\xe4S\xed\xf4\x971\xe3\
+\xb5\xa2\xed\xabV\x9d\xa30^\xa2\x09\x80\x84\xaa@\x9e\
+\xad\xa2\xfdd\xed\xc9\x9d%yOn%\x82e\xf3\xe2\
+(\x13\xd9\x8f&\xd0\xc9q\xb6\x8f\xc6\xc0E\x92\xf7\xe4\
+6<\xf5\xba\xb3\x0f\xc85\xb7U/_\xa9\x00\xf9\xf3\
+\xfd\xffs\xe3\xec\xafi\xea\xa7\x88\xb6\xafV\xab\xee\x89\
+\xf1\x22.\x00\x92\xbbz\xbeQ\x00\x14\x9b\xfc\x83\x02@\
+\xe2\xe4\x5c\x89`\xc9\xb3\xa3\xd9[\x05\x93\x89\x84\xdbO\
+\xbb>\xce\xf6E)\x0d\x9c\xe4\xe4t\x1c\xeb\x17 \xd7\
+|\xe2\xd96\xbbR>\xf9ox\xfd\x7fH\x9c\xfd%\
+2\xbbI\xb0}k\x18c/\xc1x\x11\x13\x00\xc9^\
+=\xdf \x00@\xfe\xde\xab\xe7\xd5\x92\x95\xf9J\x04\xcb\
+\x8d\xe7\x00\xfe b?~c\x80g\x1f\x8b\xab}\xfc\
+N\xb4h&\xb3\xa4'\xe7\xd0\xd0\xe02\x90k\xbe\xf0\
+\xea\xf5\xdaN*\x90?\xcf\xa4\xa9i\xda\xb6q\xf5\xb7\
+\xaf\xafo\xfa\xf8\x9c\x06\x13\xb5\xcf0\xf4\xdf\x16y\xbc\
+4l\xa5\x1fD\xcfwi\x01\xf3\x8c\xcc\xab\xe7\xf4\x9c\
+\x09\xf2\xf7\xf0H\x95\x9e+wr\xeaW\x91\x22\xdc\x8f\
+\x08m\x1b\xbc&\xd5O\x13\xb5\x1f\xd9k\xe78\xdbg\
+\x9a\xc6\xefd\x93\xbf\xf7\x16\xe0\xdb \xd7|\xe1\xd1\xea\
+\xff\x07\x0a\x90?\x7fsvC\x9c\xfdeL\x7fY\x84\
+\xda\x03_*\xdax\x89B\xfa)oC\x9f\x02\xf2\xf7\
+\xf0\x5c\x97\xadVcr\x1a\xeb<\x12:\x89\xa7\xa8%\
+\x82\xeb-Z\xb0\xac\xd5\x9c\xb7\xcazsB\x01\xea\x93\
+\x8aL\xceu\x96e\x8d\x80\x5c\xf3\x81788\xc0W\
+\xff\xeb\x15\x88/\xfc\xf9h\x9c\xfd\x1d\xff*;\xac}\
+\xfc\xb0`\x11\xc6\x0b\xdf\xe6\x88J\xfaE\xbcz\xae\x8c\
+\xf3\x1c\x87}]\x91\xc99\x1eo\x0d\xb5\xed\x06\x9e7\
+zp\xb0\xba\xf7\x92%\x8bf\xe6=X\x0e\x0f\xcf\x1e\
+\x15\xb7\xdf\xa6\xab\x99\xc9\xb6\x8f\x82\xd9\x80\x22\x93\x93\xbf\
+\x15\xfa.\xc85\x1fxD\x08\x17\xab\x12_\x18\xebs\
+\xe3\xec/-Xn\x16m\x1f\xcf\x81\x90\xd7\xf1\xb2`\
+\xc1\xa8^\xab\xd9G\xd0\xbc\xfd~T\xd2\x97\x14_\xde\
+.\x9b\xfc\x85o\xff%\xed\xbcj\xd5\xfe\xac\x82\xe4\xdf\
+d\x0fM{\x96\x17\x8e\xe1+U]\xd7\x97QWJ\
+y\x9cL\x8c\x99\xf7\x0b\xdao\xb3\xfd\xcc\xc9\xb6o\xa2\
+m\x00\x19gD<\x1f\x83\x5c3\x8cW\xaf\xd7\xf6T\
+gq\xd1\x10\xccq\xf5\xd7u\xb7\xeb\xf3\xcf\xcd\xb4>\
+\xb3\xa3\xdf\x9d7\xff6H\xdf9\xd2q\xac\x1f\xf3\x0c\
+\x87\xaa\xf3\xc7\xb8\xed\xd3WH\xb4\x9f\x9f\xfa_8I\
+PO\x92\x83\xa1Zu\xde\x96%\xe7\x05\x9e'hR\
+_L\x82\xe0C\xbc\xbe\xf8\x94&w{\xb3Y(\x83\
+\x9d'\x9e<\xc7<8\xce\xf65\xcbE 1]\xeb\
+\x8dS&\xb8\xaf\x0drU\x1f\x8f\xa7\xbcu\x1cv\x9b\
+*\x8b\x0b\x1e'b>\xb0{\xb8x\xc9k\xe3\x1by\
+\xf0/\x7f\xbd\xcfW\xfa\x1e\xe9?\xab\xe8\x9b\xe3\x96x\
+\x8e\xd3oK$\xff\x92\x90\x00\x08\xd4\x13\xeeM\xb60\
+\x83\xb1S\x06\xc9\xbf\xd9\xf30M\xca\xef\xd1D\x7f\x97\
+m\xf7\xcf\xce\xee\x1e\x9a\xf1:\xf1>\xbf\x98\xd3<\x8e\
+\xf6i\x9a\xc6\x1a{\xf0\xaa\xf8W?\x02\xe4\x9aM<\
+\xd7u\xde\xab\x109\xac%\xf2b\xf1\x92\xa1qa\x04\
+1\xfb\xea\xac\xfa\x97\x1f\xe4\xa3\x98\xfa:\xfez\x9f\xaf\
+\xf4\x15\x8a\xf7m\x16\x82\xd2\x1e\x95H\xfe~\xbd\x9fp\
+\x01\xe0}\xb8\xe2\xad\xfe{\x93\x1c\x0c3f\xccxI\
+\x94+`\x8a\x92\x7f\xb3\xe7~\xd7\xb5\xbe]\xad\xda\xef\
+\x1e\x19\x19\x98\x9b\x95\xe0\xcbK\xe3\xfa\xf9\xd2\x05\x9e\x87\
+\x08\xae3\xe6\x95\xcde\x0a\xf9\xf7\xe1\xfe\xfe\xfe\x99 \
+\xd7l\xe1\xcd\x9f?\xc4\xcf\x93<\xa6J<0M\xed\
+\xe28\xfb\xdb\xdf\xdf7\x95\xc8\xf0Q\x91\xf6\x11\xe1<\
+?s\xe6\xcc\x9e,\xf97@\xfa\xdf\xf3\xf7\xf4U\x8f\
+\xf7\xe2x\xda\xc5\x92\xc8\xbf\xdb\xab\xf6\xdb\x15\x9a\xfa\xdf\
+\xfbp\xd9[\xfd\xf7\x04j\x0b'6\x18L\xd3\xb8=\
+O\xe4\xdf\xfc\x0c\x81\xf17\xfaog\xf0D \xaa\x1f\
+\xc8\xa1v^+\xdeW\xe3\xe5q\xb6\x8f\xecs\x80Z\
+\xfe\xd5\xcf\x03\xb9fn\x1b\xeb\xfb*\xc5\x03Z\x04\xbc\
+>\xde\xdb:\xd5}E\xdb\xc7+\x05f\xc1\xbf\xcdH\
+?\xcb\xf1>l+H\x82?\xca\xde\xb3Q\x00\xb4R\
+\x0a\xd3\x02\x02\xa0'\xe9\xc1@\x83\xf4\xd4<\x93\x7fs\
+en\xfc\x99\xfe\xfc\xeaD9\x08dNN\x1a\xa4\x9f\
+\x8a\xd0\xdf3\xe3l\xdf\xd8\xd8\x8am\x08\xf3A\xb5\xfc\
+\xdbx\x85\x0arU\x1f\xcfu\xddC\xd4z\x13h>\
+\xb0d\xc9\xc2\x191_\x9d>G\xbc\xf0\x90\xfeaU\
+\xfd\x1bF\xfay$\xff\xc6\xe7\xfbg\xa7\xec\x8f\x8a\xc7\
+\xe7\xbe\x00(\xb5\xda#(\x07\x04\xc0\xf44\x06\x03\x11\
+\xe0\xbeE\x22\xffV9\x08\xf8+;\x99\x93\x931m\
+a\x84\xf4\xb9\x8f\x04\x02\x5c\x5cWC\xbf\xa8\x98\x7f\x1f\
+\xacV\xab:\xc8Zm\xbc\xe1\xe1\xd9CD$\x8f\xa8\
+\x14\x0fh,\x9f\x1cg\x7fI o\xcb\x98\xf1\x98h\
+\xfb\x18\xeb\x1fV\xc9\xbf<\xb6\xb5\x22\xfd\xbc\xc6{\xc3\
+\xd0\xff\x98\xf2\xfc\xf09\xdc\x17\x00]a\xaf\xfeK\x9e\
+B\xf0\x05@%\xad\xc9\xaeiZ\x85\x0c\xf4tA\xc9\
+\xbfi}\xfa`\x0e\x82\xa5Kw\xe8K;\xf8z[\
+\x16B\xfd\xad\xd5j\xfb\xc5\xd9\xbe\xd9\xb3g\x8d\xf0<\
+\x0c*\xf9\x97\xd7\x09\x18\x1b[\xbe\x15\xc8ZM<^\
+U\x92D\xf4/U\x8a\x07D\xd4/\x8c\x8c\x0c\xcf\x8e\
+\xb3\xbf\x03\x03\xd5\x03E\xdb\xc7\xdf2\xaa\xe0\xdf(\xa4\
+\x9f\xe7x\xef\x97\x1cO\xc9\x1f\xfe\xdb{_\x00t\x87\
+\x91\x7f\xa7\xa7\x0e\xa6\x06\xf6\x0bR\xaeGo\x5c\x00\xf2\
+\x9f\x10\xefN\x09\xfe8A<}.;'\xfe\xdb\x08\
+\xfa\xf9\xaa\xf9\xc3u\xd91 k5\xf1\x183?\xab\
+\xdax!\xd1xA\xdc\xfd%\xcc\x0b\xc5\x0b\x0f\xe9\x9f\
+\x91\xe5\x0f\x9eI5*\xe9\xe79\xde\x1b\x86\xf6\x5c\xb5\
+\xda\xb7]\x8a\xfe\xe8\x0d\x08\x80r\xabC\x7fA\x01\xd0\
+-\x9c%(\xc6\xceP\xc0\xdf\x0d\xe4?1\x9e\xae\xeb\
+V\xba\xfe\xd0\x16Dh\xdf\x13|?/\xce\xf6\xf1\xdc\
+\x0a\x0a\xfac]\xadV\xdd\x0fd\xad\x16\x9em\x1b\xaf\
+n\xe7&Q\x0a\x85\xa5v\x8c\xb3\xbf\xf3\xe6\xcd1\x09\
+\xf7i\xf1\xb6l\xba\xdf\x9c\xb4?\x16/^\xd8_\xad\
+\xdaGf'#_\xaaxg\xa6<?|\x01P\x09\
+\xe5s\xef\x97:\x03w\x04;$M\xf6\x0e\xef`\x1c\
+\xc8\xbf\x09\x9eijoJ;\xf8\xd2$\xbeK\xbc}\
+\xfa\x1b\xe3n\x1f?\xc1\xac\x9e?\xb4GH\x8c\x0d\x82\
+\xac\xd5\xc0s]}\x84VW\x8f\xa96\x7f\x19c\xbf\
+\x8c\xbb\xbf\x8e\xe3\xbc'B\xe6\xc1\xdb\xd2?\x80i\x7f\
+\xa8\xa8\xf1\xb9U\x1e\x88\xf11#\x05\x7f\xf4\x0a\x9d\xe1\
+\x0b\x08\x80\x92D\xf2\xf7\x08\xe7\xc5\xba\xf0 \xff\xf1x\
+\xe2\xf9\xe9\xe3\xcb5\xae\x1f+\xde>\xed\xba\xb8\xdbG\
+\x82pW\x15\xfdA\x84\xf3\xd7fi\x90A\xd6\xe9\xe2\
+\x0d\x0c\x18\xfd4F\xeeQq\xfe\xd6\xeb\xb5W\xc4\xdd\
+_\x9e\x9d2\xc2\xcd\x95O\xa4\xff\xda_\xbb\x18\xe4\xdf\
+\xd4\x17\xa7K\x98\x1fb\xb7\xf7\x02\x02\xa0C\x81\xc9\xde\
+I\x06\xbb\x13\xe4\xdf,\x83\x94\xf1\xdf\x85\x0b\x17v\xa5\
+\xe9\x0f\xd34\xe7D\xe9/\xff|\xdc\xed\xe3\xf5\x17T\
+\xf4\x87i\x1a\xd7P\x7f\xa7\x81\xace\xed\xf9\xf3\xaao\
+\xda\x0d*\xce_j\xdb\x15\xf1\x93\xbf\x15iK\x8c\xc6\
+f=M\x7f\x90\xe0\x99\x8e\xd7\xfeM\xf7\xfe\x1f\x0f\xee\
+\xfd+7\xdf\xda%\xfe\xa4:S\xab9\x07\x81\xfc'\
+\xba\xd2\xa3\xef\x96\xb6?\x1c\xc7\xbc)B\x92\x8bS\xe2\
+n\x1fc\xdaN\xea\xfaW\xbflxxx*\xc8:\
+]\xbc9sF\xa6\x91\x00\xfb\x85\xba\xf3\xd7\x5c\x16\xb7\
+\xfdx\xce\x90\x08+\xce+\xd3\xf6/\xc5\xa6W\x81\xfc\
+\x9b>o\xcb\xca|Sf\xb2\xdb6\xbb\x0c\xe4\xdft\
+b\x7f9m\x7fT\xab\xee{\xc4\xef\xb9j\x8fMt\
+\x18p2\xed\xa3~_\xaa\xb0\x7f\x7f0\xa5IeH\
+\x90u2x<\x0d\xaea\x18?Ru\xfe\x920\xf9\
+i\xdc\xf6\xe3\xe9\xd2\xf9J2\xc2\xea\xff\x90\xb4\xfdK\
+\xe2\xff4\xc4\xe7\xcd\xde\xda^>\xc5+(\x06\xf2\x8f\
+\x807<<{\x98\x0c\xf88\xc8\x7f\xb3\xe7\x1fi\xfb\
+c\xfe\xfcy\x06\xb5\xedI\xd1\xfe2f\xbc7\xee\xf6\
+y7\x02\xd6)\xec\xdf\x1f\x04\xdf\x04\x80\xac\x93[\xf9\
+\xabL\xfe\xfc\xb0\x17\xb5o^\xdc\xf6#\x01\xfc\xc1\x08\
+\xaf\x9c\x1f\x1d\x1a\x1a\xac\xa4\xec\xdf-\xa8\xdf\x0f >\
+o\xe2\x87\xfbx\xc9f\x90\x7f\xdb{|\xc6A \xff\
+f\x8f\xb5(m\x7f\xf0t\xbf\x11T\xef=\xfc,G\
+\xfc\x07D\x8dUj\xfbW\xbf\x8c\x9f\x09\x00Y'\xb7\
+\xe7O\xab\xeb\x9f\xab<\x7fyJ\xf3\x04\xecW\xe2\xc2\
+?B\xfb\xbe\x9c~\xed\x10m\x05\xe2\xf3\xa6w\xfeu\
+]_\x06\xf2\x9f\xfck\xa5S@\xfe\x9b='\xa4\xed\
+\x0f\xdbf\x8b#\x92\xe1\x81q\xb7\x8f\xabi~\x10R\
+q\xff^;<<\xab\x0a\xf2\x8f\xff\xb4\xbf\xaa\x07\xfe\
+|<\xbe\xfd\x15\xe5f\x88\xa8\xfd\xf8\xeb\xfc(\xed\x1b\
+\x1c\x1cX\x22\xa1v\xc8)\x88\xcf/\xa6uO\x22\xfe\
+\x15\x8e\xfc_T\xbf\xcd\xf7\x7f\x8b\x9a4\xc8[a\xa7\
+\xee\x0f\xc3\xd0\x7f\x1b\xe1\x0e\xf2\x0d\xc9\x1cHd\x9fT\
+\xdd\xbf\x8c\x99\xf7\x0c\x0d\x0d,\x04\xf9\xc7\x83\xd7\xb8\xe7\
+\xaf\xe6U\xbfqx\x1fH\x86\x5c7\xd4\x08\x11l\x1f\
+\xbbN\x82\x7f\xb7 \xf1\xf3o\xc4\xe7\x0d\xcfz\x1a\xab\
+o\x01\xf9\xc7\x88\xc7\xf3H\xf3;\xe6\x18\x5c\x9bT\x18\
+[\x96\xb6?\x1ai=\xc5\xdbX\xabU\xf7\x8c\xbb}\
++V\xec8\x93\x82\xdc\x9d\xaa\xfb\x97\x17kA\xc6\xc0\
+8\xde<\x19\xafV1\xc9\xcf\xe6y!\xf4?\x8a\x5c\
+\xd1\x8dj?\x8a{\xbbGi\x1f\x8d\xb9C\xd2\xf6\xaf\
+i\x9a;\x83\xfc\x1b\xc9~(F\x1e\x99\x15\xf2\x17\xbe\
+\xfd\xa7Bg\xaa\xd5\xea\x96a5\xea\x8b\x967\xc0q\
+\xacoH\xf0G\x89V#\x7f\x17_\x09\xb3k\x93h\
+\xdf\xc0\x80\xfb\x0a\xc2_\x9f\x01\xff\xae\xa3\x80\xf0I\xff\
+\x140\xc8_\x1c\x8f\x17\xf6a\xcc\xfc_\x15\xd3\xfb6\
+\xc1[G\xab\xbe\xa5I\xd8\x8f\x04\xc0\xf5\xe2U\x07\xcd\
+\xbf\xaeX\xb1l\xeb\xb4\xfd+r\xfa\xbf\x00\xf1\xf9\x09\
+\x12\xfd{ed\xbe\xf9\xa9\xff\x85\x93\x04\xf5\xa8\xd0\x19\
+~\xbd\x8c&\xc4\xc5\xa8\x15\xb0\x01\xe3\xc1\xb8K\xf0\x8a\
+%\xe51>\x10\xa5\xbf\xf5\xba\xb3oB\x85F\xbe\x91\
+\xa1\x0c\x8e\x97\xd9\xb6\xdd\x0f\xf2\x17\xc3\x1b\x19\x19\x1eT\
+\xad\xaa_\x0b\xff~9\x09\xfb\x89\xde\xab\xf7\xdbT\xad\
+\xda\x1fL\xdb\xbf\xf5z\xbd\x9b\xdf:(2\xf9\xd3X\
+\xbd\xdd\xaf\xb9\x90\x11\xf2/\x09\x09\x80@=\xe1^\x85\
+:\xd3Ij\xfbd\xa4\x0b\xb6\xfe\x8f\x97\x05M\xdb\x1f\
+\xad\xee#o^%\xd0\xbc)\x89\xf6\xd5\xeb\xdb\xf4\x92\
+\x18\xbc7C\xfe}\x88\x88\xe2\xd5 \xffp\xbcj\xd5\
+=\x98l\xf5p\x86\xe6\xef?\xf8\x16e\x02\xf6\xeb\x10\
+\xd9\xfb\x0fT\x1d|\x98\x17\xe2I\xdb\xbf\xb4\xea=\xa0\
+\xc0\xe4\xcf\xf7\xfb\xbf\xceK\xd9g\x88\xfc\xfdz?\xe1\
+\x02\xc0\xfbp\xc5[\xfd\xf7\xaa\xd6\x19\xcb\xb2\xf6#g\
+=R\xec\x8c\x81\xe6\x0fe\xf8c\xa22\xc1\x13\xf5\x97\
+\xafd\x92h\x1fM\xbeWf\xd0\xbf\xe7\xf7\xf7\xf7\xcf\
+\x04\xf9o\x8a7\x7f\xfe\xd0\x80m\xb3\xefgl\xfe\xae\
+\xe7{\xf4I\xd8\x8f\xc6\xf6~Q\xda\xe7\xba\xf6\x092\
+\xfck\x9a\xdaO\x0b\x9a\xdb\xff\x0f\xfc\xecC\x86\xe6[\
+\x87W\xe5wj@\x00\x84\x96\x07.{\xab\xff\x9e@\
+ma\xa5\x82\xc7\xbcys\x069\x09\x165c \xad\
+\xc4\x9f\x8fz\xed(\x0e\x7f\xf0\xebx\xd4\xa6\xa7\xc5\xfb\
+\xab\xdd\xcaO\x0a'\xb3Gj|%\x83\xfe}\xd8;\
+,\xd4Qt\xf2\xe7{\xd6\xae\xeb\xbc\x97l\xf2X\xd6\
+\xe6/\x91\xdf\x17\x12\xb2\x1f\x7f\xcb\xf9'\xf1\x03\xa7\xd6\
+\x13\x14\x0b\xed\xb4\xfd\xcb\x18\xd3\xf8\xc1\xb7\x22\x91??\
+\x03\xe5Ue\xed\xcc\xd8|+{\xcfF\x01\xd0J)\
+L\x0b\x08\x80\x1e\x95\x83Q\xbd\xee\xec\xc3I\xa6\xa0I\
+\x83> \xc3\x1f\xc1\xb7\x00\x82\x85\x8c\xde\x92D\xfbl\
+\xdb.\xf3\x13\xd8Y\xf4/\xbfVi\xdb\xc6\xf2\xa2\x92\
+\xff\xc0\x80\xfbJZ\xf5\xff>\x9b\xe4\xa0\xdd\xca\xf7\xbf\
+\x93\xb0\x1f\x89\xc3wEi\x1f\xad\xfe\x8f\x93\xf4&\xf0\
+\xa8\xe2\x90\xbfv\x03\xc5\xb0C\xc7\xdf\xf4\xc8\xc8|\xab\
+x|\xee\x0b\x80R\xab=\x82r@\x00L\xcfH0\
+\xea \x07\xed\x1f\xad\x5cf\xf6\x07+?\x80\x22\xc3\x1f\
+\xba\xae\xcf\xe0'_\xc5\xab\x04\x1a\xff\xe1\xfb\xf6\xc9\xbc\
+\x864\xe7\xf2\xcc[Y\xf5\xaf\xe3X?\x1e\x1a\x1a\x5c\
+V\x14\xf2\x1f\x1c\x1c\xd8\x89V\x8f\x17g\x97\x1c\xb4g\
+\x18\xeb\x1fNfO\x9dm\x1dv\x06\xa2I\xdb\x1e\x1b\
+\x1c\x1c\xdcZ\x82\x7f)\xde\xeaw\xe7\x99\xfcy\xc9o\
+\x12c\xc7\xf1\xf8\x92\xe1\xf9\xe6s\xb8/\x00\xba\xc2^\
+\xfd\x97<\x85\xe0\x0b\x80J\x16\x83\x119l1O\xc9\
+\xd9\xea0Q^\x06+\x09\x9f1\x19\xfe\xa0\x95\xc7\xe7\
+#\xf6\xf7\xa4\xa4\xda\xc7+ne\xdc\xbf\xeb\x1c\x87}\
+\x87\x08`4\xaf\xe4_\xaf\xd7v\xa2>~\x9f_\xe1\
+\xcc\xf2|#RxcR\xf6\xe37\x0a\xa2\xb4\x8f1\
+\xf3\x132\xfcK1v\x8f|\x96\x5co\x90>c\xda\
+\x82\x1c\x88m\xff\xed\xbd/\x00\xba\xc3\xc8\xbf\xd3S\x07\
+S\x03\xfb\x05Y_\x89\x94h\xa0\xeeB\x0e=\xde\xcb\
+b\xb7.\x8fJ\x95V\xd7\xdf\x96\xe1\x8f\x05\x0b\xe6\x13\
+_\x19\x8f\x8b\xf6\x97&\xd7\x0b$V\x06\x12\xdc\x968\
+#\x0f\xfe%\x1b\xfd\xcc;\x5c\xd6\x91\x03\xf2\xef\xb0,\
+\x8b\xbf\xea\xffU\x1e\xe6\x1b\xbf\xf3\x9e\xdc\x9ez?/\
+\x80\xb6&B\xfb\x1e\x14\xbd\x81\x10\xb7\x7f\xc7\x17d\xca\
+\xf6|\x13#\xfd\x0cn\xb3\xf5\x06\x04@\xb9\xd5\xa1\xbf\
+\xa0\x00\xe8\x16\xce\x12\x94!\xe3\xd8\xb6\xbd\x15c\xfak\
+x\x12\x1dz\xfe\x9c\xf5\x95H\xe0YCB\xc7\x90\xe1\
+\x8fj\xd5>:\xe2\xe9\xd9K\x13\xf4o\x99\x02\xd3M\
+\xf9\x11w\xda]\xf4\xe7\xc7\xc2r\x08\xa8:\xdf\xbc\x03\
+b\x1f\xe7\xc15G\xfe\xb8!X\xf11n\xfb\xd1\x14\
+\xfeE\xc4\xf6}@\x86\x7f\x19\xebs\xb3\xbe\x98\x8aJ\
+\xfaY<c\x13\x10\x00\x95P>\xf7~\xa93pG\
+0w\xe4\xdf\x0co\xfe\xfcY\xf5Z\xcd>\x82\x06\xc9\
+\xe9^\xb0\xcd\xf0\xe9T\xfdX\x19\xfeX\xb2d\xd1L\
+\x22\xdd\xbfEK\x9ca\x1e\x92T\xfbFF\x06F\xf8\
+\x9d\xe8\x9c\x9d>^\xc3\xeb\x8a\xf3\xd3\xc7|\x8fX\xd5\
+\xf9\xc6\xcf\x85\xf0\xc3\x9e^\xc5\xbe\xb5yz\xd3\xc6\xcf\
+\xb0P\xff\xac\xe4\xc8_?2b\xfb\xee\x8c\x92z8\
+\xce\xf1\xc2o?d\x91\xfcy\x8d\x0e\xc7a';\x8e\
+\xb1\xa8\x08\xfc\xe6\xfd}\xbah\xc2\x9fN\xef\x0c@G\
+A\x8c\xb3\x19\x1e\x9f\xe0\xb4B=\x9c&\xe3\xd9\x22I\
+fT\xbbZ\xe6'\xa4H\xdb~\xad\x92\x814O\x8a\
+cm\x97T\xfb\x06\x07\xab\xbbS\x9b\x9e\xcdg!(\
+\xed\x05\x1a\xa3WQ0;j`\xa0\xbe\xe3\xd8\xd8\xf2\
+\xad$\xce\xb7\x0e\x9a3\xf3\xf9ip\x22\xfe_\x8f\x7f\
+}\x9d\xa3\x95\xff3\xd4\xbf%I\xc5\xab\xc6\xb5Z\xed\
+\x91(\xed\xf3\xd3\xce\xa6\x1dO\xf9A^^\x913+\
+\xfe\xf5H\xff\x0bCC\xb5\x9d\x0bXK\xa3'J\xba\
+\xdf\xce\x22\x93\xff\x04+\x9aA\x0a\xb6o\xe7{\xec|\
+\xbfM\xfd\xe0\xa6\xbfC\x96\xfd\xe8\xbb\xaf\x8cX\xcb\xe0\
+\xa2\x84\xaf\x86\x1e\xd6n\x1e\xf9,\x91\x17/:\xe48\
+\xe6\xcf\x5c\xd7^\xc9\x98\xfe\x0a\xd1\x94\xc3\xed\xcc\x8f\xc6\
+k\xfd\x0d\xc5i\x8e\x22\x7f_\x12V\xa4'Ggl\
+x\x9e\xff\xfd\x92=Pg\x5c\x14\xad}\xfae\xb2\xe2\
+)}\xf7\x07U\xf7/\x7f\xbd\xcfW\xfa\x1e\xe9\xa3$\
+\xb7\x00@[\xc4_\x08\xe3\x04V;\x14\x08\xe6\x91\xa2\
+\xfc\x80m\xb3K(\xf0\xfeW\xbd\xc1\xaf\xddU\xab\xb9\
+%\x19\xf6\xf3V\x82\xeb\xa2\xe5.\xaf\x1e\x90d\xfbL\
+S\xfb\x9f\x02\xe6\x85\xf8\xbf\x86X\xd5\xaf\x22b9\xcb\
+4\xf5\xcf4^/\xeb{\x93@\xd8\x91\x8bZ\xfe\xa6\
+\xabZ\xed\xdb\x8e\x17\xd8\xe2W\xc8FG\x87\xaa\xb3g\
+\xcf\x1a\xe1%\x8c\xf9\xdb\x93Z\xcd9\x880\xdeH\xcf\
+J\xb2\xe1jou\xff`1Kr\xeb\x1fL2\xbe\
+p\xbfDl\xdf\x1a?\xef|\xda\xf1\x94o9\xf0\xd4\
+\xc7\x8a\xbe\x19\xdb\xb0\xa7\xcf_\xef\xa3\x8af\x01J\x04\
+\xcb\xc6[\xb6l\xf16\x03\x03\xf5\x97\xd2\xca\xeb3\xfc\
+\xe0\x99*\xc1\x8d\xaf|e\xd9/jU0Z\xb9\xde\
+\x97t\x063j\xd3)\x05#\x7f\xe0\xc5v\xbb&<\
+\xd3\xdfd\xe3\x0b\xcf\xe2I\xc4u_\xb4\xbc\x1f\xfa)\
+\xb2\xe2\x1f-~\x0eW\xc9\xbf\xe3\x0f\xf2\xa1\x96\x06\xc8\
+_\x0a\x9eeY\xb5v^7'3\x99\xd8\xefe\xd9\
+\x8f\x1fP3\x0c\xfd\xfeh\xfd\xd5\xbf\x9fp\xfb:\x82\
+\xd7\x03A\x86\xc0\x13\x5c\xf9\x9f\x9et|\x89~\x95N\
+\xbb\xb7U2\xad\xa4\xe2\xdf\xe8\xe8\x9cN\xc6\xac\xdb\x15\
+\xf1\xef\xfa`\x1e~\xf0\x11\xc8_:\x1eM\xce_\x15\
+\xb9J\xe0\x8b\x22\xc0xm\xd4\xfez\xb9\xb5\x93l\x1f\
+\x894\xe3\x02\x90!\xf0\x04\xc9\xff\xbc)!\xb5+\xe2\
+\x88/\xfclQ\xf4\xf6\xe9{\xcb\x8a\x7f\xae\xeb\x1c\xaa\
+\xce\xca\xdf\xb8\x1c|\x04\xf2W\x0a\x8f\x14\xe9\xc1\xaa\x04\
+7\xc71\x7f+\xd3~4A\x7f\x18\xb1\xbfO5K\
+\x10\x14s\xfbJ\xe3\xdb\x052\x04^\x13\x92\xfd\x1e\x1f\
++I\xce\x0f\xdb\xd6f\x05\x8bi\x89\x15\x1e2.\x92\
+\x15\xff\xc6\xc6\x96o\xe98\xec6u\xfc\xab\x1f\x08>\
+\x02\xf9+\x85\xc7\x0b\x83\x88\xd41O+\xb8\xf1R\xb9\
+\xb2\xec\xc7\x93\x12E\xbd*\xc435&\x99d% \
+\x02.\x04\x19\x02o\x02b97y\xf2\xb7\xcb4=\
+~\x17\xb1\xf6\xc0#\xfc\xd0\xa6\xac\xf8W\xad\xba\x87\xaa\
+\xe2_\x9a\xbf\x0f\xf8\xf9\x0f\xc0G \x7f\xa5\xf0h\x80\
+\x9e\xa8P:\xd9\x9bd\xda\x8f1\xf3\xedQ\xfbK\x81\
+\xf1\x1b)\xb4\x8fo\x07\x9c\x092\x04^\x93=\xff-\
+\x92\x1e\x7f\xed\xa4\xab\xf6JGK\x89\x7f\xbc\x5c\xb3\x97\
+5U\x09\xff\x92->\x07>\x8a\x87\xfc\x85o\xff\xc1\
+\xd8\xc2U\xe9\xea\x13\x1d\x06\x94S\xd8\x22\xfc\xfer\xf2\
+\xaf\x0d\xad\x9fG\xef\xaf~D\x1a\x07\x9a\x5c\xd7:\x15\
+d\x08\xbc4N\xfb\x07\xce\xc7\xbc\xb5\x8dB_?\x94\
+\x19\xffh\xf5\xff\x16\x85\xfc\xbb\xd6\xb6\xfb\x1c\xf0\xd1\xa4\
+\xf1\xfc\xd4\xff\xc2I\x82z`l\xe1{\xbd\x97*\x94\
+\xbe\x94\x97\x0a\xee\x94e\xbf\xf9\xf3\x87\x06H\x04<\x14\
+\xf1j\xcf\xb3\xc1\xfc\xdcI\xb6\xcfu\xd9\xa7\xfdz\x10\
+ \xc3B\xe2\xadK\xfa\x9e\x7f`q\xb0\x98\xc6\xf6\xf3\
+\xd1\xc8_\xbb\x8f_\x15\x945\x7f\xc7\xc6Vl\xcb\x98\
+\xf57U\xfc\xcb\xc5\x10\xc8?\x16\xf2/\x09\x09\x80@\
+=\xe1^\x18[\xf8\x00\xdc\x9e*\x05K\x9e\x9b]\xa6\
+\xfd\xeau\xe7\xc06&\xfa\xdfx^\xf94\xdaW\xab\
+\xd9\x87s\xd1\x012,\x1a\xde\x86\xf4\xbe\xfb\xa5\x11_\
+\xfa\xfb\xfbg\xfa\xa9\xc5#\xf4w=\xfd\xce\xcbe\xc6\
+?\xd7\xb5?\xac\x92\x7fm\xdbx9\xc8\x7f\xd2\xe4\xef\
+\xd7\xfb\x09\x17\x00\xde\x87+\xde\xea\xbf\x17\xc6\x16\xfe\xe9\
+\xa0\x89\xfb\x17U\x82%_E\xf4\xf5\xf5M\x97i?\
+\x0a\xb4_o#\xad\xf1\xaf\x97/\xdfqF:\xb5\x0c\
+\xf4\x1d\x1b\xf5\x09@\xae\x05\xc1{\x90\xc6\xe4\xd24\xe2\
+\x81w\xe8\xef\x1aU\xb7%&\xc2\xdba\x87\x11\x93\xda\
+\xf7\x90:\xfe\xd5n\x03\xf9O\x9a\xfc\xbb\xbdj\xbf]\
+\xa1\xa9\xff\xbd\x0f\x97\xbd\xd5\x7fO\xa0\xb60\x8c-v\
+\xd0\xe7]\x8a\x05\xcb\xa3e\xda\xcf4\xcdi\x14p\xff\
+\x14\xb5\xbf\xaek};P\xec&Q\xff:N\xbfM\
+\x81\xfaf\x90k\xde\xf1\xf4\x1b\x93\xac\xea7~1\xe0\
+\xe7\xf9\x8f\xd6_\xedV~\xabHf\xfc\xe3\xb9\xf4U\
+\xf2\xaf\xeb\xda\xef\x00\xf9O\x0a\xaf\xec=\x1b\x05@+\
+\xa50- \x00z`lq<^\xa5M\xa5`\xc9\
+s\xb9\xcb\xb6\x1f\xcf_Nmy2j\x7f\x1d\xc7>\
+1-\xff\xf2\xd5\x9a\x7fC\x00\xe4\x9aK\xf2?=\x8c\
+X\xe3\x9e\x1f\xf4\x9d'D\xed\xafah\x8f\xf3\xc3\xc4\
+2\xe3\xdf\xc8H}\x0e\xb5\xe39\x95\xfc[\xaf\xd7\xf6\
+\x02\xf9\xb7\x8dW\xf1\xf8\xdc\x17\x00\xa5V{\x04\xe5\x80\
+\x00\x98\x0ecG\xc3s\x1c\xebB\xb5\x0ae\x18{\xaa\
+`?\x91\xb2\xc1\x13\xf4\xf7\x8di\xfa\x97\xbe\xefm\x13\
+\x05@\x90k\xf6\xf0\xf8\x19\x0f\x91l\x93q\xce\x0f\xff\
+\xc4\x7f\xc4\xfe\xae\x0f\xcb\xf6\x97\xd6\xfc\xe5\x05\xcf\xd4\xf3\
+/\xbb\x95_I\x04\xf9G\xc6\xf39\xdc\x17\x00]a\
+\xaf\xfeK\x9eB\xf0\x05@\x05\xc6\x8e\x867k\xd6\xe0\
+\x02\x1a\xb0k\xd5\x09\x96\xda\x0d*\xd9\x8f\xda\xf4\xf96\
+\xfa\xbb\x861\xfdUi\xfa\x97Vas\x0dC\xff#\
+\xc85\xebx\xda\xef\x19\xeb\x1fN3\x1e\x90\xd8xM\
+\xa3j_\xe4\xfe~V\x85\xf8\xa7iZ\x85\xda\xf2O\
+\xd5\xfc[\xad:\xef\x03\x1fE\xc2\xf3\xdf\xde\xfb\x02\xa0\
+;\x8c\xfc;=u05\xb0_\x00cG\xc4\x0b\xae\
+\xfe\x15\xb9:\xb3\xa7b\xf6\xeb\xa4\x00\xf9\xcb\xa8\xfdm\
+\x5c\x0f\xd4_\x96\xa6\x7f\xbd-\x81\xaf\x80\x5c3\x89\xb7\
+\xde4\xf5/\xb6z\xe5\x1f\xffk\x7fmw~\xdd/\
+z\x7f\xf5K\xa7L\x90\x88HNm\x13\xfd@\x05\xfd\
+\xfb0\x09\xf3m\xc0G\xc2x\xbd\x01\x01Pnu\xe8\
+/(\x00\xba\x85\xb3\x04\xc1\xd8\x1b\xf1\x82\xab\x7f5\x82\
+\xa5v\x83\x8a\xf6\xe3w\x9bM\xd3\xf8{\x1b\xfd}\x8a\
+\x9f\xd8O\xdb\xbf\xd5\xaa\xbb\xbf\xe3\x98\xff\x06\xb9f\x06\
+\xef\x9f\x9c\x88\xd3\x8e\x07\xf4\x9d+x\x8e\xff\xe8Wu\
+\xf5\xbby%M\xd5\xe2_3\xa1.\xdb\xbfa\xd9B\
+\xc1G\x9b\xe1\xf9\x02\xa0\x12\xca\xe7\xde/u\x06\xee\x08\
+\x82\xfc\xdb\xc0\xf3W\xff\xaa\x04KR\xcb\xafR\xd5~\
+\x96e\x8d\xf0\x03O\xd1\x83\xa5\xf6x0QPZ\xfe\
+m\x5c\x8b\xb2W\xf1\xc4A ke\xf1xb\x9f/\
+\xcf\x9c9\xb3G\xc2x^\xc4\xeb_D\xef\xaf\xf6\x88\
+\xae\xebC*\xc6?>G\xf9V\x86b\xe3e\x9dm\
+\xeb\xdb\x83\x8f\x84\xf0z\x85\xce\xf0\x05\x04@\x09\xe4\xdf\
+\x1e\x9e\xbf\xfaW\xe8\xde\xec\x0d\xea\xdf\x96p\xf7f\xcc\
+x\xa1\x8d\xfe><^\x04\xa4w@J\xdf\x99gX\
+\x04Y\xab\x85\xc7\xaf\x99\x12\x91.\x93$f\x17q\x22\
+oC\xcc>\xc7\xdf\x1a\xa8\x1c\xff\xf86\x8aj\xe3\x85\
+\xe7U\xa0\xa6u\x80\x8fZ\xe2\x89\xdd\xde\x0b\x08\x00\x90\
+\x7f\x9bx4X/P)XV\xab\xee\x01Y\xb0_\
+\xad\xe6\xbc\xb3\xbd\xab\x8d\xfcM@c; \xed\xf1\xc2\
+\xab\x16\x9a\xa6\xf6?\xd4\x8e'@\xd6\xb2\xab^j\x8f\
+\xf3t\xbe~\x858\x19\xaf\xfd\xdb[\xf9\xf33\x0a\xda\
+\xebU\x8f\x7f\xf5\xfa6\xbd\xbc\x02\x9f\x82\xe3\xe50\xf0\
+QLx\xed\x12?\x8c\xddx\x86\x86\x06\xb6\xe7\x85*\
+T\x09\x96\x8ec\xde\x94%\xfb\xb9\xae}B\x9b}}\
+\xca\xb6\xcd\xddd\x8d\x17\xd7\xdd\xae\x8f\xda\xb0\xaa\xf1\xea\
+\x19d\x9d2\xde:Z\x9d\x9e\xc6\xd3\xec\xca\xdb\xc6\xd2\
+vog\xcf\xdf;\xf4\xf7\x89\xac\xc4?^\xa0K\xb5\
+\xf1b\x18\xfa\xfd\x5c\x9c\x80\x8fP\x22X:\x1e\x0d\xc8\
+sT\x0a\x96\xd5j\xf5\xb5Y\xf3G\xb0Lj\xc4\xe7\
+\xd9\x81\x81\xea\x812\xfb\xcb\xf7$\x9b\x15\x81\x02Y'\
+\x83G+\xe7\x8biU:*\xf7\x0c\x8b\xb6\x0f\x7f\x85\
+\xdfN\x7f':\xc8\xa6vzs\xe3Z\xd5\xc6\xcb\xf8\
+t\xc9\xe0#\x90\xbf\x04\xf2\xb7\x86\xda]\xfd'1\x99\
+\xc6\xad\xfe\xb3\xe4\x0f.\x02.h\xc7~\xfc\x1cA\xb5\
+j\xbfSv\x7f\x1b5\x05\xb4+@\xd6I\xe1\xb1_\
+Y\x96\xb9\xa3\xec\xf1\xcc\x0bl\xb5y\xcf\x9f\x93\xd6\xea\
+f\xfb\xd7\xaa\xc7?\xc71\x16Q\xff\xd6)6^\xd6\
+\xf89\x1e\xc0G \x7f)x\xa6\xa9\x9f\xadR\xb0\x0c\
+\xac\xfe\xb3\xe8\x8f\x12\x05\xd7\x1f\xb5k?\xc6\xcccT\
+\xe8\xafi\x9a/#\xb2\xba\x12\xe4\x1f\x0f\x1ec\xec\x8a\
+Z\xad\xf6J\x15V\xc24\xdf\x8fo\xbf\xbf\xfaw\xa7\
+4)\xcf\x9d\x9d\x0c\xa7\xec[\xaa\x8d\x17~U\x11|\
+\x04\xf2\x97\x82Gd5\xd0\xce\xea?\xa9`\x19X\xfd\
+g\xd6\x1f<q\x0b\xd9\xf5\xf2\xf6\xed\xa7\x9f\xcb\x0f\xe9\
+\xa9\xd0\xdf\x81\x81\xfar\xd7\xb5.\xa2\xf6\xad\x01\xf9G\
+\xc3\xe3ou\xf8\xb5\xda\xc1\xc1\x81\x9dT\x18\xcf^U\
+\xbf\x8b&A\xfe\x974;\xa8\x98\xa5\xf87w\xee\x1c\
+\x97b\xcc\xa3\xaa\x8d\x97z\xdd9\x0c|\x04\xf2\x97P\
+\xe5N[\xadR\xf0\xf5V\xff\x99\xf7G#\x15\xa9~\
+U\xfb\xf6\xd3\xaf\xd2u}\x86B\xdbD6_96\
+;M\x0d\xf2\x1f\xff\x98\x0f\xf0Jt##\xc3\xb3U\
+\x89\x07\xfc\xa0!\x91\xff\xd5\xed\xf7W\xbb\x82W\xc4\xcc\
+C\xfc\xabV\xed\x0f\xa86\xfeH(\xfek\xd1\xa2\xed\
+5\x90?\xc8?\xcd\x12\xb7\xf5\xa8\xab\xff$\x83\xaf\xb7\
+\xfa\xcf\x8d?\xb8\x08 \xc2\xfcY\xbb\xf6\xa3\xdf\xfd\xdb\
+D\x09\x83d\xf5\x97\xaf\x00\xa9]\xfby\x07\x06\xd7\x81\
+\xfc\x83\x09|\xb4K\x88\x5c^\xbfd\xc9\xc2\x19*\xc5\
+\x03\x9a\xe7\x8b\xfd\xbc\xf8\xed\xae\xfc\xf3B\xfe\xfc\xff\xd7\
+jn\x89\xc4\xd0\xefT\x1b\x7f$\x1aO\x02\xf9G\xc6\
+\xec\x80q\xda\xc4\x8b\xba\xfaO\xbeP\xc6\x86{\xff\xb9\
+\xf2\x87\xb7\x1d\xf0\xc3\xf6\xaf\x0a\xf1*p\xfa\x91*\xf6\
+\x97\x04\x0e\xa3\xb6}\x84\xfawSq\xc9_\xbf\x91l\
+\xf0!F?*\x8e?^\xd1\xcf\xaf\x0a\xd9\xee\x9e\x7f\
+\xb3\xed\xa8\xac\xc7\xbf\xc6aWc\xbdJ\xe3\x8f\xfe\xed\
+9\xdb\xb6\x07@\xfeb\xc4\xef\xe5\xfd\x11N\x12\xd4\x03\
+\xf2\x0f\x92\x7f\xb4\xd5\x7f\xd2\x83\xdf[\xfd\xe7\xd2\x1f\xfd\
+\xfd}SI\xdd\x7fg2\xf6#\xb1v\xaa\x1f\x88\xd5\
+\xbcgm\xd5\xa8\x9dG\x19\x86\xfe[\x1eXsL\xfe\
+|\xa5\x7f\x03\xfd\xf9Q\xc6\xfa\x5cU\xfd\xe1\x15\x81:\
+c2\xfd\xf5N\xfbw\xe6\x95l\xa2\x1c~Nk\xfc\
+\x91\xcd\x7f\x0a\xf2\x17\x22\xff\x92\x90\x00\x08\xd4\x13\xee\x05\
+\xf9\x07\x07\xbf\xf8\xea?\x9d{\xd1\xe6\xab\xf2\xec\x0f^\
+\x07\xdcu\xd9\xea\xc9UE\xe4\xe4j\x0d\xa9\xde\xdf\xd1\
+\xd1\xa1j\xbd\xee\xbe\x8d\x8b\x1e\xc7\xb1\x1e\xc9\x01\xf9?\
+\xc4\x0ff\xd2\x18=d|\xd2\x1e5\xc9_\x9b\x15|\
+\xc5\xdd\xde\x9b'\xe3\xebS2x\xd5/\x0a\x1e\x89\xa4\
+~\x91L\x98i\x8f\xbf(e\xc3\x0bJ\xfe~\xbd\x9f\
+p\x01\xe0}\xb8\xe2\xad\xfe{A\xfe\xd1W\xff\xe9\x0c\
+~\xed\x86\xa2\xf8\xc3u\xed\xe3&i\xbf\xa7\xabU\xfb\
+\xddY\xe9\xef\xf2\xe5K\xb7b\x8c\x8d\x12\x81\xbe\xa3A\
+\xa2/VPT\x95\xfc\x89\xfc\xee\xa1\xb6\x9eC\xcf\xdb\
+i\xae\xcc\x992A\xcevE3\xde\xbd\x9dg\xf6\x9b\
+\x84\xfd\xd6g)\xc3\xdfd\xf1\xf8\xf6\x8dz\xe3O\xfb\
+k\xda%\xa03D\xfe\xdd^\xb5\xdf\xae\xd0\xd4\xff\xde\
+\x87\xcb\xde\xea\xbf'P[\xb8\xf0\x07,DW\xff\xe9\
+\xe5B7\xf6,\x92?x\x0ep\x9a\xe4/L\xee\xc0\
+\x90\xf5\xa3y\xf3\xe6\xd8Y\x1c\x7f$\x084\x22\xd6W\
+4j\x11p\xa2\xd5~\xcf\xeb\xcf\xcb\xd8s\xa5\xef\xbe\
+\x95\xb7\x81\x9fe\xa06\xed\xc1W\x85Y\x1c\x7f\xbc<\
+\xb5\x7f\xd6\xa4]\xfbq\x1f\x90\x0d\x0e.\x12\xd9x\x87\
+Z\xff\xac\xda\x9b'\x1a\x8f\x9f\x04\xf9o\x86W\xf6\x9e\
+\x8d\x02\xa0\x95R\x98\x16\x10\x00= \x7f\xf1\xd5\x7fz\
+\x83?\xfa\xea?\x0f\xfe`\xccx)\x05\xdc\xc7&\xf9\
+\xe6\xe4_\x9cHsb?\x9e\x93\xc2\xe4\x85il\xdb\
+<\xccq\xd8\xb1\xae\xcb\xce\x22\xa1\xf3cz\xaea\xcc\
+\xba\xdd\xbb\x82\xf8t\x8b\xf1\xcb\xff\xdb\xd3\xfc\xb3\x86\xa1\
+\xff\xb1q\x15S\xff>\xd9\xebL\xc2\xfb\x1c\xdf\x9a\x18\
+\x18p_1<<{httNg\x1e\xe2\x01\x7f\
+eLc\xe9\xbe\xc9\xcd_\xed\x11\x1aK;\x17\x91l\
+\xc8~\xbb)\xb8\xed\xf44?d\x0b\xf2\xdf\x88W\xf1\
+\xf8\xdc\x17\x00\xa5V{\x04\xe5\x80\x00\x98\x0e\xf2\x17_\
+\xfd\xa7\x5c\x02u\xcf\xa2\xfa\x83\x16\x9b\xb3\xf9U\xbf\xc9\
+\xfbC?\x8f\xaf\x00\x0bf\xbfN~5\x8dV\xec[\
+\xf1\xc7\xbb\xa6\xd6Y\xa4`Y\xad\xf6m\xe7'\xf6\x99\
+\xdc\xca_\xbf[\xd7\xf5\xa1\x22\x93\x0d\xbf\xed\xa0\xda\x81\
+S\xee[\x90\xff\xc63|\xd3\x03\x02\xa0+\xec\xd5\x7f\
+\xc9S\x08\xbe\x00\xa8\x80\xfc\xc5W\xff\xe9\x0e\xfeh\xab\
+\xff<\x0e~\x9e\xec',k`\x04\x7f<\xc4\x98\xf1\
+\x06\xbc6,\x06\x1e\xbf\x1a\xcaW\xed\x93\x9f\xbf\xfa%\
+\x8c\xb1\xad\x8b\xee\x0f\xbe\xdan\xbf*br\xf1\x94\xe2\
+\xc3\xb2\x82\xcf\x0f\xff\xed\xbd/\x00\xba\xc3\xc8\xbf\xd3S\
+\x07S\x03\xfb\x05\x08\x1e\x82\xab\xff\xb4\x07\x7f\x94\xd5\x7f\
+\xce\x07?\xaf\xc7\xf0\xb9\xf1\xf7\x92\xdb\xbc\xb7}\x19\x05\
+\x8dA\x90k>\xf1\xf8[#Z\x19\xfe\x22\x86\xf9\xcb\
+\xc7\xda\xd1|\xec\xc1\x1f\x0d<\xc7a\xc7\xa8vu\x95\
+\xfb\xba\xe0\xf3\xa37 \x00\xca\xad\x0e\xfd\x05\x05@\xb7\
+p\x96\xa0B\x90\x7f\xf8\xea?}\xe5+\xbe\xfa/\xca\
+\xe0'\x1f\xed\xeb_K\x9a\x8c?\xf8\x01C^f\xb4\
+Z\xadn\x09r\xcd\x07\x1e_\xa5\x93\xb8\xfb2\xaf\x1e\
+7\xd9\xf9K\xe3\xe3q\xc2\xda\x1b\xfe\xd8\x14o\xc7\x1d\
+\x97n\xc7\x98y\x8fjy+\x18\xb3\x96\x14x~\xf8\
+\x02\xa0\x12\xca\xe7\xde/u\x06\xee\x08\x82\xfc7\xd9\xe3\
+2V)v\xd5jO\x90CS\x110\xdbq\xcc?\
+\xc5\xe4\x8f\x07)\xa0\xbd\x9d_\xc5\x03\xb9f\x16\xaf\xd3\
+4\xf5w\x91/\x1f\x8eg\xfej\xb7\xf2\xc5\x00\xfc\xd1\
+\x1c\xaf^w_\xa7Z\xde\x0a\xc7\xb1.*\xf0\xfc\xe8\
+\x15:\xc3\x17\x10\x00%\x90\xff\xa6?\xae\xbb]_\xb3\
+kV\xf2\x0e\xbc\x88\xad\xfe\x8b\x1a\x8c\x96.\xdd\xa1\xcf\
+q\xd8\xa9\xf1\x15\x1a1\xffX\xaf;\x07\x83\x5c3\x85\
+\xd7\xc1k.4n2\xc4B6\xeb\x09\xef\xe4\xb0*\
+\x93\xf0\x87_\xf8J\xbbD\xb1\xaa\x92\xcf-X0\x9f\
+\x15\xd4\x1fb\xb7\xf7\x02\x02\x00\xe4\xbf\xf9\xea\xff(\x95\
+\xee\xb9\x8a\xac\xfe\x11\x8cx\xd52w\xffv\xaa\xefM\
+\x9cn\xd9\xba\xd9\xb2\xac=1?\xd4\xc6\xe3\xd7\xfaD\
+\x8a\xd5\x88\xcf7~EP{9\xfc!\x86\xc7\xdf\x90\
+\xf8\xf5\x13\xd4\xa9\x92\xba!\xf9\x17\xe6G\x08@[\xc4\
+_\x04\xe3\xd0`\xbaC\x9d{\xae\xadW\xff\x08F/\
+\xe2ye\x5c\x7f\x12\xa7?xYX\x9e\x87\x00\xf3C\
+-<N\xd2\xf4\x5c\x17\xb3\xd8\xfea\xab+\xa2\xf0G\
+\xb3Z)\x1b\x0e\xe5*\x94\xb1\xd2\xbc\x0c\xf3-\x81\x9f\
+\xbc\x1b\x87\xd4\xec\x5c\x95\x92\x5c\xb4Z\xfd#\x18MX\
+\xbb\xe1M\xa2\x89\x83\xc4\xc9A\xff-\x05\xba\xd7Mi\
+r\x7f\x1e\xfeH\x0d\xaf\xc4\xb3\xefE)O+\xb8\xcd\
+\xf6\x88e\xe9G\xc0\x1f\xed\xe1\xf5\xf5\xf5M'\x1b\xde\
+\xabP\xc6\xd4\xa7E\xd2\x03\x83\xfca\x9c\xf1\xab\xff\x8f\
+\xab\x93\xe1*|\xf5\x8f`\x14\x8e\xd7(^\xf2b\xc2\
+\x92\xb8\x82\x91\x97\x8c\xe8}3g\xce\xec\x81?\xd2\xc1\
+\x9b1c\xc6K\xc8\x97\x1f$\xbb\xff#\xee\xf9\xc6\x13\
+\xc8\xf0s?\xf0\xc7\xe4\xf0\xc8?\x07\xa9U\xabB[\
+\x8e\xf9\x06\xf2\x8fx\xb5L\xfb\xa5*\x19\xae\xc2V\xff\
+\x08FQ\x92\xc0h\xaf1\x0c\xed\xdfq\x07\xa3\xc6\x1b\
+\x06\xfd\xcb\xfc\xad\x11\xfc\x91\xd4\x013k{\xb2\xf5W\
+\x1bW\xf1b\xbfZ{o\xd8\xf5>\xf8\xa3\x9d\xdbS\
+\xda\x15\xaa\xdc\x9e\xe2\x85\x8b0\xdf@\xfeQ~:i\
+\xe0<\xa5Fz\xcb\x89W\xff\x08F\xd1\xf1\xf8\x1d\x7f\
+N$~n\x87\xf8\xaf\x1e\x99\xbf\xe5\x07\x8f\x16,\x18\
+\xd5\xe1\x8f\xc9\xe1\xcd\x9f?\xcfp\x1c\xe7=D\xce7\
+&4\xdf\xd6\x109\x9c\xc2\xdf*\xc0\x1fq\x8bms\
+N\xb3\xdc\x0b2\xe2)O\xe4\x06\xff\x82\xfc\x85\x7f\x18\
+\xeb\x1fV%\xb7\xf5D\xab\x7f\x04\xa3\xc9\xe11\xc6\xe6\
+\xd96\xfbU\x82\xfe}\x92\xbe\xe3\x5c\xef\xf6@\x09\xfe\
+\x10\xc3\x1b\x1b[\xb1-\x89\xb4\xd7:\x8eu\x01\xd9\xf0\
+\xa9\xe4\xe6\x9b~)\xcf\x0e\x08\x7f$\x87G\xe2\xeaK\
+\x8al\xa3^\x0b\x7f\x80\xfc#\xbc\xfe7\x0fP#\xb7\
+u\xf3\xd5?\x82Q|x\xf5\xba\xfbzZ\xb5\xdf\x9d\
+\xb0\x7f\x1f&\xc2\xf9&\xaf\x9e6%\xe4\xe0`Q\xfd\
+\xd1\xdf\xdf7\xb5^w^\xe3\xba\xec\x1c\xf2\xc5\xa3\x09\
+\xcf\xb7;\x8a\x5cH+M<\xfe\xb6\xcd4\x8d\xff(\
+p\x86\xea^\xf8c3\xcc\x0e\x0c\xd6\x09\xf0\x1c\x87}\
+R\x85\xdc\xd6\xcd\x02\x15\x82Q\xfcx\xcb\x97\xef8\x83\
+\xec\xfd\xe1\xb0\xacq1\xfa\xf7!^\x85\x90|{(\
+\xbf\xaaX\x5cr\xe8\xdb\x8elq\x18c\xc6\x85d\xaf\
+GR\x98o\x0f\xd2\xf3~^\xc7\x1e\xf3#=<\xb2\
+\xf9\x1b\xe5\x9f\xa1\xd2\x9e\x87?^$~/\xef\x8fp\
+\x92\xa0\x9e\xa2\x0d~\xc7\xb1\xbe&\xbf\xb0\xc5\xe6\xab\x7f\
+\x04\xa3d\xf1\xf8^\xb0i\xea\x9f\x14\xbd6\x18\xc3\xca\
+f=\xbfRH\x7f~\x96\x04\xc1\xae\xae\xeb\xf4\xe4\xd5\
+\x1f\xfcz\x18\xcf\xa1@\xfd<\x86V\x857\xfb\x05\x9c\
+\x92&\x07\xfa\xb7\xc7\x183?>\xfe\xa6\x06\xe6G:\
+xcc\xcb\xb7t\x1c\xf3F\xd9\xf1\xd4\xb6\xed2\xfc\
+\xb1\x81\xfcKB\x02 PO\xb8\xb7h\x83\xdf\xb6\xd9\
+y\xb2\x0b[\x8c_\xfd#\x18\xa5\x87G\xc1b+\xf2\
+\xc1\xff\xfa\x05\x86R<\xcd\xbc\x86g\x1dt\x1c\xf6\xf5\
+j\xd5}\xc3\x9c9\xc3\x03\xd9\xbd\x0af\xe9D\xf8\x07\
+\xf0}`O\xe4\xa4z \x8c1\xeb\x09\xd7\xb5\x8f\x1b\
+\x1c\x1c\xdc\x1a\xf3C.^\xadV}\x95\xecx:\xfe\
+\xa0gA\xc9\xdf\xaf\xf7\x13.\x00\xbc\x0fW\xbc\xd5\x7f\
+o\xd1\x06?\x09\x80\xef\xc9-l\xb1\xe9\xea\x1f\xc1H\
+\x0e\x9e\xae\xeb|k\xe0\xb3\xcd\xb6\x06\xd2z\xad\xc9\xf7\
+PyiS^\xa5\x90'\xa8aL[\xd0l5#\
+\xcb~\xa6iN\xa36-$\xa2?\x92\xb7\xb1\xd1\xd6\
+\xc6\xbe\xaf\x8c{\xe0$\xa0\x1e&\xe2?~\xde\xbc9\
+6\xc6\xb3|\xbcE\x8b\x16X\xfcf\x8c\xecBA\x9a\
+\xa6U\x0aN\xfe\xdd^\xb5\xdf\xae\xd0\xd4\xff\xde\x87\xcb\
+\xde\xea\xbf'P[\xb80\x83\x9f1\xf6=\xb9U\xad\
+\xf4\x1b}\xc5\x8a`$\x1f\x8f\x07\x0f^Y\xce0\xb4\
+\xbf*r;d=\xcfSOD{\x8dw\x9e\xe0\x18\
+\x9e\xf1\x90\xc8x\x0f\x12\xaf\x8b\x87\x87ks\x89\x00\xcd\
+\xc9\xda\xaf^\xdf\xa6\xd7q\xf4\xda\xc0@}\xacV\xab\
+\xed_\xad\xba\xefq\x1c\xfbD\x22\xd9o\xf3\x93\xd5\x8d\
+\x5c\xf9\x8dW\xf9\xb2\xd3\xbf\x12\xc9\xfc\xb5Z\xb5?\xb8\
+x\xf1\xc2~\x8cg\x90\xff\xf8\xf9BM\xdb\xa2\xc0\xfe\
+({\xcfF\x01\xd0J)L\x0b\x08\x80\x9e\xdd\x0a\x97\
+tD?[vU+\x1e\xdcu]\xdb\x12\xc1H\x1d\
+\xbcZ\xcd-\xb9\xaes\xa8\xe3\xb0\x1b\xe4\x9f\x11\x11y\
+\x0dn\xf0J\x96\xf7\xd3s\xa7ei\xb7\x91P\xb8\xa9\
+!\x1ax\x92\x16\xfd\xd2\xc6\xa3]\xc1\xff\x8d\xff7\xfe\
+\x19\xfeY\xc3\xd0\xef\xf7\xab`\xaaq\x1b&\x0c\x8f]\
+W\xabU\x0fY\xb1b\xd9\xd6\x18\xcf \xff\x89\x12u\
+\x15\xd8\x1f\x15\x8f\xcf}\x01Pj\xb5GP\x0e\x08\x80\
+\xe9E\x1c\xfc<\xab\x9b\x22\xc1\xed\xfa8Vr\x08n\
+\xf1\xe3\x0d\x0e\x0e\xecDB\xe0\xf4(\x07\x06U\xaa-\
+\x91e<\xb2\xf9\xa3$n\xbeB>X\x8a\xf1\x0c\xf2\
+\x178O\xf5\xa7\x82\xfa\xc3\xe7p_\x00t\x85\xbd\xfa\
+/y\x0a\xc1\x17\x00\x95\xa2\x0e~\x12\x00\x9fP'X\
+n\x14\x01\x08F\x0a\xe25\xf6\xc0\x8d7P\x90\xf95\
+\xc8:i<\xfdJ\xb2\xf7!CC\x83\x15\x8c?\x90\
+\x7f\x84\xb7\xa9?)\xa0?\xfc\xb7\xf7\xbe\x00\xe8\x0e#\
+\xffNO\x1dL\x0d\xec\x17\x14v\xf0\xf3;\xdaj\x05\
+Kv=\xdf\x0e@0R\x1bO\xd7\xf5A\xd3\xd4?\
+e\x18\xfa\x1fA\xd6\xb1\x1d\x88\xbd\x8d\x0br^k\x1e\
+\xe3\x0f\xe4\xdf^znvr\x01\xfd\xd1\x1b\x10\x00\xe5\
+V\x87\xfe\x82\x02\xa0[8KPN\x07?\x05\x9b\x1d\
+T\x0b\x96|\x9fV4g9\x82\x91|<\xcb\xb2F\
+\xbc\x1b\x04w\x82\xfc\xa3\xe1\xd1X\xbf\x9d\xfe\x5c9>\
+U/\xc6\x1f\xc8\xbf\x1d\xbcz\xdd=\xac\x80\xfe\xf5\x05\
+@%\x94\xcf\xbd_\xea\x0c\xdc\x11\xec(\xfa\xe0\xe7\xa7\
+\xbe\xfdb1*\x05\xcb(\x22\x00\xc1M\x1d\xbcFa\
+\x14\xfd\xa3\x14 \xafb\xccx\x01\xe4\xbfy\xa66^\
+}\xd34\xf5\x0fs\xe1\x84\xf1\x07\xf2\x8fs\xfc\xcd\x9b\
+7g\xb0\x80\xfe\xed\x15:\xc3\x17\x10\x00%\x90\x7fp\
+\x05g\xdc\xa2b\xb0\x14\x11\x01\x08n\xea\xe2\xf1\xf3\x1c\
+\xb5\x9as0\xf9\xf7L\xc30\xfeVT\xf27\x0c\xfd\
+n\x1a\xcb\xdf a\xf4\xeaVY\xfa0\xfe@\xfe\xed\
+\xe21f\xdd^P\xff\x8a\xdd\xde\x0b\x08\x00\x90\xff&\
+\xab6\xfd\x8b\xaa\x06\xdf0\x11\x80\xe0\x96-<\x93\x9c\
+I$x \xbfy\xe2\xa5\xc8]\x9bC\xf2_\xd3\xb8\
+\x82\xa8\x7f\x891\xe3\xb5\x8c1\x0d\xe3\x05\xe4\x9f\xc6\xf8\
+s\x1c\xf6\x05\xf87\x1c\xa0-\xe2\xcf\xff\x1e\xae\xf6r\
+\x95\x83o3\x11\x80\xe0\x96}<\xbe\x1a\xe69\xf3\xc9\
+\xc7\x1f \xd2\xfc\x16\x17\x05\x86\xa1=\x9b\x1d\xf27\x9e\
+!\x82\xbf\xc5u\xd9\xb9\xd5\xaasT\xb5Z\xdd\x8b\xfe\
+\xffK\xe0_\x90\xbf\x8cxZ\xaf\xd7v\x82\x7f\x13\xf8\
+\xc9\xbbqx\xd50\x12\x01\x8f\xa8\xbc\xf2\x0a\x8a\x00\x04\
+\xb7\x5c\xe3u\xba\xae>R\xab\xd9\x87W\xab\xf6\xd1D\
+\xaeg\xd96\xfb\x15\x91\xed\xdd$\x0e^H\xbfJ%\
+O\x12\xa4\xddE\x02\xe5rZ\xd5\x9fF\xffv\x94m\
+\x9b\x07\xce\x9e][\xb4l\xd9\xe2m\xe0_\x90\xbf\x0a\
+\xe4Om\xfc\x03\xfc\x0b\xf2o\x1b\xaf\xb1G\xa9\xf6\xca\
+\x8b\xdax52\x06\x16\x1ao\x0b]\xd7-\x22\xe3%\
+\x8c\x19{\xf1\x12\xbb\x96\xa5\x7f\x90\x88\xf9s\x9c\x9cM\
+S\xfb\x0e\xbf\x07\xcd\xc9\x9a\xdf\xa3'\xe2\xbe\x8e\xbfU\
+`\xcc\xfc3\xdf\x1f%!q+\xaf\xd6\xe68\xd6o\
+\x1a\x84n\xfc\xa4\xf1;\xfcw\xf5c9\x96W\xb6w\
+/\xfe\x1d\xf4\x98S\xbc\xb4\xaa\xf0\x07\xc8_\xe53'\
+4\xc6\xdf\x0e\xff\x82\xfc\xdb\xc6\xb3m}\xfb\xac\xa4C\
+E\xc6@\xe0\x01\x0fx \xff\x8dx\x0f\xf2$]\xf0\
+/\xc8\x7fRx\xb42\xba:\x1b\x07\xae\x901\x10x\
+\xc0\x03\x1e\xc8\xbf\xf1fT\xff0\xfc\x0b\xf2\x9f4^\
+\xbd\xee\xec\x9b\x9d\xd3\xd6\xec:d\x0c\x04\x1e\xf0\x80W\
+l\xf27\xfe\xde\xaad6\xc8\x1f\xc6\x11\xc6s\x1c\xeb\
+\x9a\x0c\x0d\xfe\xab\x911\x10x\xc0\x03^\x11\xc9\xbf\x11\
+\x03\xcd}\xe1\xdf\x96\x98\x1d0\x8e \xde\xd0Pu\x05\
+\x0d\xacuYI\xb2\x12E\x04\xc0\xbf\xc0\x03\x1e\xf0\xf2\
+B\xfe\x96\xa5\x7f\x1f\xfe\x0d'~/\xef\x8fp\x92\xa0\
+\x1eL&\x95J\x04\x0bg\x0c\xbc\x1a\x19\x03\x81\x07<\
+\xe0\x15\x85\xfc\x0dC\xbf\xbfZ\xed\xdb\x0e\xfe\x0d%\xff\
+\x92\x90\x00\x08\xd4\x13\xee\xc5d\x9a2\xa5\xaf\xafo\xba\
+ei\x7f\xc9R\xba\xd60\x11\x90\x97\xc1\xdf\xf0\x8b\xf1\
+~M\xd3\x18&;\xf0\x80W\xd4\x95\xbf\xc1\xb3M\xee\
+\x0a\xff\x86\x92\xbf_\xef'\x5c\x00x\x1f\xaex\xab\xff\
+^L\xa6\xc6\x0fc\xda\x02\xc3\xd0\x9e\xcbR\xae\xf6f\
+\x22 ?U\x1b\xb5\xd7\x93(\xfb\x97W6\xf6\x19\x0a\
+\x00\xc74\xcb+\x0fr\x00\xded\xf0v\xd8a\xc4\xe4\
+%ei\x9c]\xcbk\x17\x80\xfcU\xdc\xf64\xdf\x83\
+\xf1\x1c\xca\xe7\xdd^\xb5\xdf\xae\xd0\xd4\xff\xde\x87\xcb\xde\
+\xea\xbf'P[\x18\xc1c\x03\xe9\xe8Gf-W;\
+\x17\x01>1\xe6\xc1\x1f^u\xbd+\x9bg\xa93\x1e\
+\xa0\xff\xc6\x13\x80\x94@^\xc0\x9b\x0c\xde\xd8\xd8\x8am\
+]\x97}\x84\xe6\xdbC\xe3\xe6\xd3\xcd\xa2B\x00\xe4\x9f\
+J\xfc\xfb<\xc6s(^\xd9{6\x0a\x80VJa\
+Z@\x00\xf4 xl&\x02>\x97\xb5B-\x5c\x04\
+\x10q\xf6f\xd9\x1f\xd5juK\xb2\xfd)\xfcu\x9f\
+@\x9f\xefd\xcc8hll\xf9\x96 C\xe0E\xc1\
+[\xb1b\xd9\xd6\xd5\xaa\xfd&\xc6\xcc{\xc2\xe6[+\
+!\x00\xf2O\xa3\xaa\xa4\xf1u\x8c\xe7P\xbc\x8a\xc7\xe7\
+\xbe\x00(\xb5\xda#(\x07\x04\xc0t\x04\x8f\x89D\xc0\
+\x8bi\x82\xb3S\xa8\x85]7\x7f\xfe<#\x83\xfe\xe8\
+ \xe2\x7f#\xd9\xfc?Q\xed\xe78\xec\xb6z\xdd}\
+=\xc8\x10x\xad\xf0\xb8X\xacV\xddC\x1d\xc7\xfas\
+\xc4m\xb6\xcd\x84\x00\xc8?5\xf2\xef\xc0x\x9e\x10\xcf\
+\xe7p_\x00t\x85\xbd\xfa/y\x0a\xc1\x17\x00\x15\x04\
+\x8f\xd0\x9f\x0e\x9a\xf4\xa7g\xafD+\xbb\xde\x13\x01\x19\
+\xb9}a-\xb2,\xed\xfa\x18\xecw+\xf9k_\xd1\
+\x80\x81\xe0Q\x1c\xbc\xd1\xd19\x9d\xae\xeb\x1e\xc2\x8b\xc7\
+Lf\xbe\xf9B\x00\xe4\x0f\xf2W\x00\xcf\x7f{\xef\x0b\
+\x80\xee0\xf2\xef\xf4\xd4\xc1\xd4\xc0~\x01\x82\x87\x80\x08\
+`\xcc\xf8f\xf6\xea\xb3\xb3\xeb\xf8v\x80\xca\xfe \xe2\
+\xdf\xce\x13X\xeb\xe2\xb5\x9fv\x1b\xf5\xfd`\xfa\xeaN\
+\x8c\xe7b\xe3\xf1\x8a\x9f\x8c\x99\x873f\xdd\x11\xf3|\
+\xbb5\xf0\xd6\x09\xe4\x0f\xf2\x97\x81\xd7\x1b\x10\x00\xe5V\
+\x87\xfe\x82\x02\xa0[8K\x10\x8c\xbd\xe1\xb5a\xa3<\
+kV\xc8\xdf\xda\xec`\xa0J\xfeX\xbat\x87\xad\xa9\
+}\xef6\x0c\xed\xd1$\xedGA\xe4o$\xde\xde\x1b\
+f\x03\x90k>\xf1\xf8\xad\x18\xaf\xca\xe1?\x93\x9do\
+\xec\xd6Z\xcd9\x08\xe4\x0f\xf2\x97\x80\xe7\x0b\x80J(\
+\x9f{\xbf\xd4\x19\xb8#\x08\xf2\x8f\x88G\x22`+_\
+\x04d\xeb\xea\x8c\xb8\x08H\xc3\x1f\x03\x03\xee\xee\xd4\xae\
+[\xd2\xb4\x1f\x09\x8d\xc7\xe8\xcf\x13\x1d\xa7\xdf\xc6x\xce\
+7\x1ec}.\x11\xc8\xc9\xf4\xfc7e\xb1}s\xd4\
+\xeb\x83 \x7f\x90\xff$\xf1z\x85\xce\xf0\x05\x04@\x09\
+\xe4\xdf>\x1e\x7f\x13\xc0\xb7\x032tuFX\x04$\
+m\xbf\xb9sG\x86\x1c\xc7\xbaPr0Z\xcb\xd3\x88\
+2\xa6\xef\xc6\xf7\x84A\xae\xb9\xc1\xeb\xb0,mw\x22\
+\x8f\x1f\x05\xb7\x93d\xcc7Q!\x00\xf2\x07\xf9\xc7\x80\
+'v{/ \x00@\xfe\x93\xc7\xdb\xe4``\x962\
+\x06N$\x02\x92\xbfgm\x7f\x92\xda\xf7\xa4Z\xc1\xc8\
+\xf8\xab\xeb\xb2O\xcf\x9f?4\x00r\xcd&\x9em\xdb\
+\xfd\xe4\xcb\xa3\x0cC\xfb\xab\x82\xf3mB!\x00\xf2\x07\
+\xf9\xa7\x8a\xd7.\xf1\xc3\xd8\x13\xe2E\x12\x01*e\x0c\
+\x1c/\x02\x92\xb4\xdf\xc0\x80\xbb\x0fc\xec\x0e\xc5\x83\xd1\
+\x1aj\xe3\xc5\x96e\xed\xc7\x0f\x8ca~\xa8\x8d7<\
+<<\x95\xc8b?\x1a\xcb?\x9e(W\x84J\x07v\
+\xc7\x0b\x01\x90?\xc8_&\x1e\x8c\x13\x1f\x9e\x90\x08(\
+b\xc6\xc0Y\xb3\x86\xe68\x8e\xf5\xe3,\x1d\x98\xf4\x9e\
+\x87\x1b\xb9\x1f\xb4\xe5\x22\x01\x09\xf3#5\xbc\x0e\xd34\
+w1M\xed\xd4V\x07G\x15N\xd2u3c\xc6>\
+ \x7f\x90?\xc8??x\xa1\x22@\xd5`D\x93\xee\
+7Id\x0c\xdcq\xc7%<\xad\xea\xb1\xb6m<\x9b\
+A\xf2\x1f\xf7h\xf7\x9a\xa6\xfeE\xc6\xb4\x9d\x9a\x05(\
+\xcc\x8f\xc4\xf1\xb6\xe0B\x8c\xfb\xe0\xc5Z\x10\xd9\x12\xdb\
+\xcd\xf1\xd8\xadq'\xad\x02\xf9c\xbe\x81\xfc%\x1e@\
+\xa2 uZ\xd6\x82\x11c\xec\xda83\x06\xf2\xabP\
+~Z\xd5\xec\x93\xfff\xb7\x08\xee\xe3o\x06(`\xed\
+i\xdbv\x19\xf3#\x19\xbc\xa1\xa1\xc1\x0a\xad\x92\xf7\xe2\
+\xf3\x89\x97}\xcd\xeax\x11MZ\xc5\xdf\x08\x80\xfc1\
+?@\xfe\xd9\xc7\xdbD\x04d%\x18\x91\x08\xb8n\xb2\
+\x19\x03\x09c\x90\x02\xd0\xcf2\x16|'\x83\xf74\xad\
+\xe2.q]\xfbC;\xee\xb8t;\xcc\x8f\xc9\xe1\xcd\
+\x9a5\xb4=\xb7\xa5ij\x17s\xdb\xe6p\xbc\x84\xe2\
+E\xbd>\x08\xf2\xc7|\x03\xf9+\x9a1\x90\x06\xf7\xe9\
+Y\x0bF\xfcM@;\x19\x03\xfb\xfa\xfa\xa6\x13\xdeq\
+\xf4<W \xf2\xdf\x04\xa7Zu\xdf\x80\xf9\xd1\x1e\xde\
+\xd2\xa5;\xf4\xb5*\xc4\x93w\xf2\x8fz}\x10\xe4\x0f\
+>\x02\xf9+\x9e1\xd0q\xd8\xb7\xb2\x16\x8c\xf8\x99\x80\
+(\x19\x03)P\x1d\xc4\xf7\xc8\xf3\x12|'!\x9e\xbe\
+\x87\xf9\xd1\x1e\xde\xc0\x80\xfbj\x90\xbf\xb8\x10\x00\xf9\x83\
+\x8f\xda\xc0\xec\x80qR\xc6\xe3\x19\x03}\x11\x90\xb1\xc9\
+\xd9R\x04X\x965B\xc4\x7fE^\x83o\x1bxO\
+\x99\xa69\x0d\xf3#:\x1e\xcd\x91\x93@\xfebB\x00\
+\xe4\x0f>\x8aJ\xfc^\xde\x1f\xe1$A=0v\xbc\
+\x19\x03\xf9v@\xd6\x82\xd1D\x22\xa0^\xdf\xa6\xb7q\
+\x1a\xbbq\xef\x1a\xe4o\x05m\xb6?\xe6Gt<\x12\
+\x92\xd7\x81\xfc\xc5\x84\x80Wk\x00\xe4\x0f>\x12%\xff\
+\x92\x90\x00\x08\xd4\x13\xee\x85\xb1c\xc7kz;@\xf5\
+`4N\x04\xf0k\x8eG\xd0\xbf=P\xc4\xe0+\x18\
+\xdc.\xc4\xfc\x88\x86\xa7\xeb\xda\x96\x13%\xf1\x01\xf9O\
+X\xe2\xfbV\xc6\xd8- \x7f\xf0Q\x0b\xf2\xf7\xeb\xfd\
+\x84\x0b\x00\xef\xc3\x15o\xf5\xdf\x0bc'\x82\x17I\x04\
+\xa8\x12\x8c\xbc<\x01;\xd3\xdf\xafE\xf0m\x89'\xb4\
+\x0d\x80\xf9\xf1\x22\x1e\xbf\xea\x07\xf2/\x848\x06\xf9\xa7\
+K\xfe\xdd^\xb5\xdf\xae\xd0\xd4\xff\xde\x87\xcb\xde\xea\xbf\
+'P[\x18\xc6\x8e\x1fOH\x04 xd\x17\xaf\xd5\
+6\x00\xe6\xc7\xa6x\xbcZ\x1f\xc6\x1f\xc8\x1f\xf3#V\
+\xbc\xb2\xf7l\x14\x00\xad\x94\xc2\xb4\x80\x00\xe8\x81\xb1\x13\
+\xc5\x0b\x15\x01\x08\x1e\xd9\xc6\x0b\xdb\x06\xc0\xfc\xd8\x1c/\
+j9h\x8c?\x90?\xf8(\x14\xaf\xe2\xf1\xb9/\x00\
+J\xad\xf6\x08\xca\x01\x010\x1d\xc6N\x05\xaf\x83\xe72\
+G\xf0\xc8%^\xd3m\x00\xcc\x8f\xcd\xf1t]\x9fA\
+\xf6Z\x8f\xf1\x07\xf2\xc7\xfc\x88\x05\xcf\xe7p_\x00t\
+\x85\xbd\xfa/y\x0a\xc1\x17\x00\x15\x18;U\xbcMD\
+\x00\x82G\x9e\xd2\x05o\xba\x0d\x80\xf9\xd1\x1c\x8f1\xe3\
+\x00\x8c\x17\x90?\xe6G,x\xfe\xdb{_\x00t\x87\
+\x91\x7f\xa7\xa7\x0e\xa6\x06\xf6\x0b`\xec\xf4\xf1\xf8\xc9\xfa\
+\xd3\x10<\xf2\x85\x17\xdc\x06\xc0\xfc\x98\x18\x8f\x93\x04\xc6\
+\x0b\xc8\x1f\xf3#\x16\xbc\xde\x80\x00(\xb7:\xf4\x17\x14\
+\x00\xdd\xc2Y\x82`\xec\x842\x06Zg\x22x\xe4\x0a\
+o\xc36\x00\xe6G8\x1e\xd9\xe9\x0e\x8c\x17\x90?\xe6\
+G,x\xbe\x00\xa8\x84\xf2\xb9\xf7K\x9d\x81;\x82 \
+\x7f\xc9x\x8d\x8c\x81\x0d\x11\x80`\x94\x97\xa4-\xe6\x01\
+\x98\x1fa\xe4o\xe9\x18/ \x7f\xcc\x8f\xd8\xf0z\x85\
+\xce\xf0\x05\x04@\x09\xe4\xaf\x0e^#c`\xf4dA\
+\x08F\xca\x96X\xfe\x1e\xe6\xc7\xc4xD\x16\x87b\xbc\
+\x80\xfc1?b\xc3\x13\xbb\xbd\x17\x10\x00 \x7f\xf5\xf0\
+\x9a\xde\x0e@0\xca$\xde\xd3\x8b\x17/\xec\xc7\xfch\
+\xfeCv:\x13\xe3\x05\xe4\x8f\xf9\x912^\xbb\xc4\x0f\
+c\xa7\x991P\x5c\x04 \x18\xa1Dp\x16\xf1L\xd3\
+\xf8;\xc6\x0b\xc8\x1f\xf3C\x1e\x1e\x8c\xa3.\x9e\x90\x08\
+@0B\x89\xe0,\xe2\x91]\xaa\x18/ \x7f\xc4{\
+\x90?\xf0&\xfe\x09\x15\x01\x08F(\x11\x9cU<\xb2\
+\xc9\x9b1^@\xfe\x88\xf7 \x7f\xe0\x85\xff\x90\x080\
+\xbe\x81`\x84\x12\xc1y\x9a\x1fd\x97\xf31^@\xfe\
+\x88\xf7 \x7f\xe0E\x14\x01\x08F(\x11\x9cu<\xc3\
+\xd0\xef\xc7x\x01\xf9#\xde\x83\xfc\x81'(\x02,\xcb\
+<\x15\xc1\x08%\x82\xb3>\x9e\x19\xeb\x1f\xc6x\x01\xf9\
+#\xde\x83\xfc\x81\x17\x01\xaf\x911\xd0>\x03\xc1\x88?\
+\xda\xad\x8c\xe9/\xa3\xbf\xbf\xcd4\x8d\xdb3P\x22x\
+?\x8cg\x7f\xff_{\xb7\xfa\xe3O\xff\x83\xeb\xba\xef\
+\x9e=\xbb\xb6\xc4u\xd9\xb9\x84\xb5\x06\xe4\x0f\xf2\xcf2\
+\xf9\x0b\xdf\xfe\x83\xb1U\xcf\x18\xd8\x10\x01E\x0cF\x86\
+\xa1=j\x9a\xfa\xbb\xc8,\x9d\x9bn\x91\x98{\x10\xb1\
+\xfc\x94>\xb3\x0e%\x82\xd5\xc6#r\xfd\x81\xa2\xe3o\
+-\xf9\xe9\x87\xb6m\xec>\xbe\xbf\xb3g\xcf\x9a\xc7\x98\
+\xf9-\xfa\xcc\x1a\x90?\xe2s\xc6\xf0\xfc\xd4\xff\xc2I\
+\x82z`l\xd53\x06\x9a\xa7\x16\x8c\xfc\x89\xd8\xf5o\
+j\x9a\xb6m\xf8\xeb\xe5\x0d\xd7\xcbN\xa0\xe7A\x94\x08\
+V\x0f\xafVsKD\xb0\x8f\xaa4\xfeL\xd3\xf8\x0f\
+\x89\xca\xe3l\xbb\xcfi\xd5_\xcb\xb2jD\x86\x91\x84\
+\x00\xc8\x1f\xf1^2\xf9\x97\x84\x04@\xa0\x9ep/\x8c\
+\xad<^\xd3\xdb\x01\xf9\x0cF\xda\xf5\x14x\x17E\xb1\
+\xdd\xf0\xf0\xf0T\xc2{\xbdm\x9bW\x11\xc6zEJ\
+\x04\xefW\xf4\xf1<4T]\xa1\xc8\xf8[G\xfe\xb8\
+\x9cD\xe5\x81\x0b\x17.\xec\x8a\xda_Q!\x00\xf2G\
+\xbc\x97L\xfe~\xbd\x9fp\x01\xe0}\xb8\xe2\xad\xfe{\
+a\xecL\xe0E\x12\x01\xd9K\xa2c\xf1U\xfc\x9bD\
+\x03\xd0D\xf6\x1b\x1c\xac\xee\x8d\x12\xc1j\xe0\xb9\xae\xfd\
+)\xf9\xe3O\xbf\xd1q\xfa\xed8\xfa\x1b&\x04@\xfe\
+\x88\xf7\x92\xc9\xbf\xdb\xab\xf6\xdb\x15\x9a\xfa\xdf\xfbp\xd9\
+[\xfd\xf7\x04j\x0b\xc3\xd8\xea\xe3\x09\x89\x80\x8c\x05\xa3\
+\xb5\xaek\x9dZ\xab\xd5\xb6\x89\xcb~$&\xfe\x89\x12\
+\xc1\xf2\xf1\x1c\xc7\xfa\xb9\x02\xe3\xef\xa3q\xf7\x97\xfcZ\
+\xa7yx\x16?G\x00\xf2G|V\x00\xaf\xec=\x1b\
+\x05@+\xa50- \x00z`\xecL\xe1\x85\x8a\x80\
+,\x05#\x22\x88\xab\x07\x07\x07\x96\xc6m?\xc6\xcc\x93\
+\x15)\x11\xbc\x7fq\x0f\xb0\xae\xd8\x96l\xf7\x94\xfc=\
+\x7fs\x87\xa4\xfa\xcb\x18\x1b\xb4mv\x1e\x17\xb1\x19\xbe\
+\xad\xf3U\x90\x7f\xa6\xf1*\x1e\x9f\xfb\x02\xa0\xd4j\x8f\
+\xa0\x1c\x10\x00\xd3a\xecL\xe2up\xd5\x9eU\xf2w\
+\x1c\xf3\xbej\xd5~SR\xf6#\xdb,A\x89`\xb9\
+x\x83\x83\xee\x1e\xf2\xb7a\xb4\xc7\xa6x7H\x92\xec\
+\xef\xacYC\xdb;\x0e;\x9f\x0b\x81\x8c\x91\xff\xd1\x88\
+\xa7\x99\xc6\xf39\xdc\x17\x00]a\xaf\xfeK\x9eB\xf0\
+\x05@\x05\xc6\xce6\x1e\x11\xdd\xc9Y\x22\x7f\xc6\x8c\xe7\
+)P~q\xfe\xfcyF\xd2\xf6\x9b\xa8\xfa\x1cJ\x04\
+\xa7\x83G~>F\xf6\xf8\xa3\xf9\xf1\xa34\xed\xc7\xdf\
+\x08\x98\xa6\xb6\xda\xdf\x1aP8\xaf\xc63d\x9bC\x11\
+O3\x8d\xe7\xbf\xbd\xf7\x05@w\x18\xf9wz\xea`\
+j`\xbf\x00\xc6\xce\x01\x1ec\xe6\x07\xc6\xbf\x82T\x91\
+\xfc\x1d\xc7\xfa\xc5\xd0\xd0\xc0\xc2\xb4\xecG\xdf{\x92\x22\
+%\x82\x0f-\xe2x&\x92\xb9R\x81\xf1\xf7>\x19\xf6\
+k\x9c\x11\x10\x17\x02i\x92?O\xa4E\xe4?\x8ax\
+\x9ay\xbc\xde\x80\x00(\xb7:\xf4\x17\x14\x00\xdd\xc2Y\
+\x82`\xecL\xe0\x0d\x0c\xb8\xfb\xd0$\x7fPE\xf2\xb7\
+,\xeb\x1f\xb5\x9asp\xda\xf6\x13\xdd\x06H:\xf8\xd2\
+J\xf8\xbbE\x1b\xcfCC\x83\x15\xc3\xd0\x9e\x93=\xfe\
+hE>*\xd3~\x22B E\xf2\xe77\x17N\x8a\
+R\xad\x12\xf1Yi<_\x00TB\xf9\xdc\xfb\xa5\xce\
+\xc0\x1dA\x90\x7f\x0e\xf1\xe6\xcd\x9b\xc3\x0f$]\xaa\x0e\
+\xf9k\xcf\x10\xf9}n\xe9\xd2\x1d\xfad\xd9\xaf\xd56\
+@J\xc1\xf7\xc9\xa2\x95\x08\xf6\xd26K>\x80i\xfc\
+\x87'\xd1R\xc1~$F\x07LS?{\xbc\x10H\
+/\xa3\xa6q9\x8d\xc19\x88\xa7\xb9\xc2\xeb\x15:\xc3\
+\x17\x10\x00%\x90\x7f\xfe\xf1(\xd0\xbc\x8e\xc8\xf7^\xc9\
+\xb9\xd5\xbf?2R\x9f#\xdb~a\xdb\x00)\x97\x08\
+\xde\xafH\xe3\x99\xc6\xe0\xb1\xf2\xb7\x9d\xd8\xf7\x15<\xb3\
+3@m;\xc30\xb4\xe7\xd3\x18\x7f\xf4}?'\xe2\
+\xdf\x05\xf14\x97xb\xb7\xf7\x02\x02\x00\xe4_\x10<\
+M\xd3*\x14\x14>F\xcf\xc3\xe9\x06_\xfdJZ\xfd\
+\xed\xac\x8a\xfd&\xda\x06\x90p`\xf2\x82\x22\x8d?\x12\
+\xa0\xd7\xc9>sR\xad:\xefW\xd5~\xa3\xa3\x83\xb5\
+j\xd5^\xc9\x18\xbb#\x81\xf1\xf7\xa0\xe3X_'\xec\
+y\x88\xa7\xc0\x9b\xd2.\xf1\xc3\xd8\xd9\xc7\xeb\xeb\xeb\x9b\
+\xce\xab\xb1\x11\x11\xfe)\xc1\xabV\xcfs\x82\xd3u}\
+\x99\x8a\xf6\x1b\xbf\x0d \xe9\xb6\xc4\x93E)\x11<c\
+\xc6\x8c\x97\xa8\x90;\x7f\xd6\xac\xc1\x05Y\xb0\xdf\xd0\xd0\
+\xe0b\xc6\xcc\xa3h\x9c\xfe\x9c\x8f\x936\xfa\xfc\x82\xe3\
+\x987\xf1\xdb5\xf5zm\xaf\xa5Kw\xd8\x1a\xf1\x0f\
+x\x93\xfe\x81\xb1\xf3\x85\xc7\x13\xa2P\xb08\x91\x9e;\
+&\x1b|\x1b\x07\xbc\xf4\xcb\x183\xdeJ\xb8\xdb\xa8l\
+\xbf\xe06\x00J\x04'\x8fGcb/\xf9y&\xac\
+\x7fe\xd4~[\x90\x90\x1e\xb2,m\x1f\x9a_\x1f\xa4\
+>}\x9e\x17\xc5\xa2\xe7\x5c\xfa\xfb\xf9\xf4\x9ci\x9a\xfa\
+\x17\xbd\xb7{\xaf\x1f\x1a\xaa-\x97y\xc6\x06x \x7f\
+\xe0e\x10\xcf\xb2,\xbbZ\xb5\x8ft]\xfb+\x14,\
+/\xa7\xd5\xc3]<k\xdb\x04ET\x1e\xe0\xf9\xd4\xe9\
+9\x87\x82\xcfG\x88\xf0w\xb6m\xbb\x9c\x95\xfe\xfa\xdb\
+\x00\x0a\xe4I\xb8\xa0\x08\xe3/\x98\x9bBb\x86\xc9\x0b\
+\x10\x0f\x80\x07<\x18\x07x\x11\xf0x\xa5\xb4j\xb5\xba\
+%_\xd5\xcf\x9c9\xb3g\x8a@\x8a\xd0,\xf4\x97\xd7\
+\x06P O\xc2\x93E(\x11L\xfd\xbcE\xf6\xd5K\
+\x12\xb7oG<\x00\x1e\xf0`\x1c\xe0\x01\x8fW\xa5\xfb\
+\x0aJ\x04'\x8f\xc7\x85#\xf5s\xbd\xfc\xab\x97\x96\x8d\
+\xf9\x01<\x90?\x8c\x03<\xe0mY\xaf\xd7^\xa6H\
+\x92\xa4\x0b\xf2\xec\x0f\x128\xfb\xcb'\x7f\xed.\xcc\x0f\
+\xe0\x81\xfca\x1c\xe0\x01O\xb5\x12\xc1O\x12I\x1eC\
++\xe5cm\xdb>\xd1q^|\xf8\xff\xe7\xff\xce\xff\
+{\xd4G\x15<\xd34\xae\x96\x9dw\xc14\xf5\xd30\
+?\x80Wt\xf2\x17\xbe\xfd\x07c\x03\xaf\x08x\xaa\x94\
+\x08\x06^\xd2x\xfaA\x98\x1f\xc0+0\x9e\x9f\xfa_\
+8IP\x0f\x8c\x0d\xbc\xbc\xe3\xa9R\x22\x18x\x89\xe2\
+\xad\xafV\xfb\xb6\xc3\xfc\x00^\x81\xc9\xbf$$\x00\x02\
+\xf5\x84{al\xe0\x15\x01O\x91\x12\xc1\xc0K\x0cO\
+\xff\x03\xe6\x07\xf0\x0aL\xfe~\xbd\x9fp\x01\xe0}\xb8\
+\xe2\xad\xfe{al\xe0\x15\x01O\x95\x12\xc1\xc0K\x06\
+\xcf4\xf5S0?\x80WP\xf2\xef\xf6\xaa\xfdv\x85\
+\xa6\xfe\xf7>\x5c\xf6V\xff=\x81\xda\xc206\xf0r\
+\x8d\xa7J\x89`\xe0%\x85\xa7\xed\x83\xf9\x01\xbc\x02\xe2\
+\x95\xbdg\xa3\x00h\xa5\x14\xa6\x05\x04@\x0f\x8c\x0d\xbc\
+\xa2\xe0)R\x22\x18x\xf1\xe3\xad\xe5I\xac0?\x80\
+W0\xbc\x8a\xc7\xe7\xbe\x00(\xb5\xda#(\x07\x04\xc0\
+t\x18\x1bxE\xc2S\xa5D0\xf0\xe2\xae\xb5\xa0\xff\
+\x16\xf3\x03x\x05\xc3\xf39\xdc\x17\x00]a\xaf\xfeK\
+\x9eB\xf0\x05@\x05\xc6\x06^\xd1\xf0\x14*\x11\x0c\xbc\
+\x18\xf1LS?\x1e\xf3\x03x\x05\xc2\xf3\xdf\xde\xfb\x02\
+\xa0;\x8c\xfc;=u05\xb0_\x00c\x03\xaf\x90\
+x\x8a\x94\x08\x06^\x8cx\xa6i\xee\x82\xf9\x01\xbc\x02\
+\xe1\xf5\x06\x04@\xb9\xd5\xa1\xbf\xa0\x00\xe8\x16\xce\x12\x04\
+c\x03/\x87x^Yd\x90k~\xf0\x1e\x22\xb7v\
+b~\x00\xaf@x\xbe\x00\xa8\x84\xf2\xb9\xf7K\x9d\x81\
+;\x82 \x7f\xe0\x15\x1a\x8f1m\x01\xc85?x\xa6\
+i|\x03\xf3\x03x\x05\xc3\xeb\x15:\xc3\x17\x10\x00%\
+\x90?\xf0\x80\xd7\xc0s\x1c\xf3\x0f \xd7|\xe0\x99\xa6\
+\xb9\x03\xe6\x07\xf0\x0a\x86'v{/ \x00@\xfe\xc0\
+\x03\x9e\x87W\xad\xda\xef\x06\xb9\xe6\x01O\xbb\x01\xe3\x19\
+x\xc0\x9b\x18\xa0-\xe2\x87\xb1\x81\x97g\xbc\x1dw\x5c\
+\xba\x1dc\xe6\xfd \xd7l\xe3\x19\x86\xb1\x1f\xc63\xf0\
+\x80\x17\xf3\x0f\x8c\x0d\xbc\xbc\xe3\xb9\xae\xfd!\x90kv\
+\xf1L\xd3\xf8\x1d\xb9\xb6\x03\xe3\x19x\xc0\x03\xf9\x03\x0f\
+x\x91\xf0\x96.]\xd2MDr\x07\xc85\x9bx\x8c\
+\x19/\xc5x\x06\x1e\xf0@\xfe\xc0\x03^[x\x96\xa5\
+\xbd\x1c\xe4\x9a=<Z\xfd_\x84\xf1\x0c<\xe0\x81\xfc\
+\x81\x07\xbcI\xe1\x11\xa1\x9c\x09r\xcd\x14\xdeC\xae\xbb\
+]\x1f\xc63\xf0\x80\x07\xf2\x07\x1e\xf0&\x857c\xc6\
+\x8c\x97\x18\x86\xf6W\x90kV\xf0\xf4Wc<\x03\x0f\
+x \x7f\xe0\x01/\x16<\xc30F\x89\x5c\x9e\x06\xb9\
+*\x8fw\x02\xc63\xf0\x80\xd7\x12\xb3\x03\xc6\x01\x1e\xf0\
+\xa2\x15\x0a\xda\x8f\x08f\x1d\xc8ZM<\xf2\xcf\x8fj\
+5\xb7\x84\xf1\x0c<\xe0ML\xfc^\xde\x1f\xe1$A\
+=06\xf0\x80\xe7\x9f\x07\xd0\xdf\x01\xb2V\x0f\xcf4\
+\x8d\xab]\xd7\xe9\xc1x\x06\x1e\xf0B\xc9\xbf$$\x00\
+\x02\xf5\x84{al\xe0\x01\xef\xc5\x1f\xd34\xdfC\xa4\
+\xb3\x1ed\xad\x0e\xf9\xcf\x9a\xd5\xbf\x15\xc63\xf0\x80\x17\
+J\xfe~\xbd\x9fp\x01\xe0}\xb8\xe2\xad\xfe{al\
+\xe0\x01oS\xbcj\xd5y\x1bc\xc6\x0b k\xd9\xe4\
+\xaf\xfd\x941\xf6\x12\x8cg\xe0\x01/\x94\xcf\xbb\xbdj\
+\xbf]\xa1\xa9\xff\xbd\x0f\x97\xbd\xd5\x7fO\xa0\xb60\x8c\
+\x0d<\xe0\x05\xf0\xea\xf5\xda^\x8ec=\x04\xb2\x96F\
+\xfe_\xa0?\xbb0\x9e\x81\x07\xbcP\xbc\xb2\xf7l\x14\
+\x00\xad\x94\xc2\xb4\x80\x00\xe8\x81\xb1\x81\x07\xbc\xe6x\xc3\
+\xc3\xb3\x87,K\xbb\x12d\x9d&\x9e\xf6\x88a\x18\xfb\
+c\xfc\x01\x0fx-\xf1*\x1e\x9f\xfb\x02\xa0\xd4j\x8f\
+\xa0\x1c\x10\x00\xd3al\xe0\x01\xaf%^\x07c\xc6{\
+\x89\x9c\x9e\x04Y'\x8d\xa7\x7f\x9f1\xa6a\xfc\x01\x0f\
+x-\xf1|\x0e\xf7\x05@W\xd8\xab\xff\x92\xa7\x10|\
+\x01P\x81\xb1\x81\x07\xbc(\x19\x03-\xdd4\x8d\xb3\x9a\
+]\x15\x04\xf9O\xb6\xaa\x9f\xfeGZ\xf5\xbf\x12\xe3\x0f\
+x\xc0\x13\xc2\xf3\xdf\xde\xfb\x02\xa0;\x8c\xfc;=u\
+05\xb0_\x00c\x03\x0fxm\xe01\xd6?LZ\
+\xe0\x1c\xc3\xd0^\x00\xf9O\x1a\xef\x16\xd3\xd4_Gf\
+\xdd\x02\xe3\x0fx\xc0\x13\xc6\xeb\x0d\x08\x80r\xabC\x7f\
+A\x01\xd0-\x9c%\x08\xc6\x06\x1e\xf0\xa6L,\x04\x98\
+FB\xe0\x13\xc1\x8a\x82 \x7f!\xbc'LS[m\
+Y\xda\x0a\x8c?\xe0\x01\xaf-<_\x00TB\xf9\xdc\
+\xfb\xa5\xce\xc0\x1dA\x90?\xf0\x80\x173\x1e\x89\x81y\
+\x8ec}\x8a\x9e\x9f3f<\x0e\xf2\xdf\xe4Yc\x9a\
+\xc6\xefh\xa5\xff%\xfe\x9a\xbf^\xafwc\xfc\x01\x0f\
+x\x93\xc2\xeb\x15:\xc3\x17\x10\x00%\x90?\xf0\x80\x97\
+<\xde\xd8\xd8\xf2\xad\x86\x87ksM\xd3\xdc\xcb\xcb,\
+x4\x91\xdf)\xf4\x9cF\x7f_\xd5\xeaa\xcc<\xc3\
+q\xd8j\xd7eg\xfb\x0f\xff\xff\xfc\xdfE~_\x1e\
+\x9e\xf1M\xfa\xef_\xa3~\x1eO\xcf\x87\xa8\xef\x072\
+\xa6-\xb0m\xbb\x8c\xf1\x02<\xe0\xc5\x8a'v{/\
+ \x00@\xfe\xc0\x03\x1e\xf0\x80\x07<\xe0\x15\x05\xaf]\
+\xe2\x87\xb1\x81\x07<\xe0\x01\x0fx\xc0\xcb\x07\x1e\x8c\x03\
+<\xe0\x01\x0fx\xc0\x03\x1e\xc8\x1f\xc6\x01\x1e\xf0\x80\x07\
+<\xe0\x01\x0f\xe4\x0fc\x03\x0fx\xc0\x03\x1e\xf0\x80\x07\
+\xf2\x87\xb1\x81\x07<\xe0\x01\x0fx\xc0\x03\xf9\x03\x0fx\
+\xc0\x03\x1e\xf0\x80\x07<\x90?\xf0\x80\x07<\xe0\x01\x0f\
+x\xc0S\x91\xfc\x85o\xff\xc1\xd8\xc0\x03\x1e\xf0\x80\x07\
+<\xe0\xe5\x02\xcfO\xfd/\x9c$\xa8\x07\xc6\x06\x1e\xf0\
+\x80\x07<\xe0\x01/\xf3\xe4_\x12\x12\x00\x81z\xc2\xbd\
+06\xf0\x80\x07<\xe0\x01\x0fx\x99&\x7f\xbf\xdeO\
+\xb8\x00\xf0>\x5c\xf1V\xff\xbd06\xf0\x80\x07<\xe0\
+\x01\x0fx\x99%\xffn\xaf\xdaoWh\xea\x7f\xef\xc3\
+eo\xf5\xdf\x13\xa8-\x0cc\x03\x0fx\xc0\x03\x1e\xf0\
+\x80\x97-\xbc\xb2\xf7l\x14\x00\xad\x94\xc2\xb4\x80\x00\xe8\
+\x81\xb1\x81\x07<\xe0\x01\x0fx\xc0\xcb\x1c^\xc5\xe3s\
+_\x00\x94Z\xed\x11\x94\x03\x02`:\x8c\x0d<\xe0\x01\
+\x0fx\xc0\x03^\xe6\xf0|\x0e\xf7\x05@W\xd8\xab\xff\
+\x92\xa7\x10|\x01P\x81\xb1\x81\x07<\xe0\x01\x0fx\xc0\
+\xcb\x1c\x9e\xff\xf6\xde\x17\x00\xdda\xe4\xdf\xe9\xa9\x83\xa9\
+\x81\xfd\x02\x18\x1bx\xc0\x03\x1e\xf0\x80\x07\xbc\xec\xe1\xf5\
+\x06\x04@\xb9\xd5\xa1\xbf\xa0\x00\xe8\x16\xce\x12\x04c\x03\
+\x0fx\xc0\x03\x1e\xf0\x80\xa7\x1a\x9e/\x00*\xa1|\xee\
+\xfdRg\xe0\x8e \xc8\x1fx\xc0\x03\x1e\xf0\x80\x07\xbc\
+\xec\xe2\xf5\x0a\x9d\xe1\x0b\x08\x80\x12\xc8\x1fx\xc0\x03\x1e\
+\xf0\x80\x07\xbc\xcc\xe3\x89\xdd\xde\x0b\x08\x00\x90?\xf0\x80\
+\x07<\xe0\x01\x0fxE\xc1k\x97\xf8al\xe0\x01\x0f\
+x\xc0\x03\x1e\xf0\xf2\x81\x07\xe3\x00\x0fx\xc0\x03\x1e\xf0\
+\x80\x07\xf2\x87q\x80\x07<\xe0\x01\x0fx\xc0\x03\xf9o\
+\xfa\xe5\xc1\x1a\x01\xbd1\xa4\x0b\x06\x1e\xf0\x80\x07<\xe0\
+\x01\x0fx)\xe2\xb5\xf3\xe5\xc1\x1a\x01=1\xa4\x0b\x06\
+\x1e\xf0\x80\x07<\xe0\x01\x0fx)\xe2\xb5\xf3\xe5\x95@\
+~\xe1\xe91\xa4\x0b\x06\x1e\xf0\x80\x07<\xe0\x01\x0fx\
+)\xe2E\xfd\xf2\x8e@\x8d\x80i\x81\xe2\x02\x1d\xc0\x03\
+\x1e\xf0\x80\x07<\xe0\x01/\x1bx>f\x94/\xef\x0e\
+\xd4\x08(O2]0\xf0\x80\x07<\xe0\x01\x0fx\xc0\
+\x93\x83\xd7)\x9a$\xa8#P#\xc0\x7f\xba&\xf9\xe5\
+\xc0\x03\x1e\xf0\x80\x07<\xe0\x01/}\xbc\x92\x90\x00\x08\
+|\xb8+\xf0\x94b\xf8r\xe0\x01\x0fx\xc0\x03\x1e\xf0\
+\x80'\x07OH\x00t\x8e\x7f\xa6L\xe2\x07x\xc0\x03\
+\x1e\xf0\x80\x07<\xe0)\x81\xd7\xd1J-l\x11x:\
+&\xf9\xe5\xc0\x03\x1e\xf0\x80\x07<\xe0\x01O\x11\xbc\xff\
+\x07@\xd4O\x89(\xdd\xcc[\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x01\x02\xb6\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\xf4\x00\x00\x01\xf4\x08\x06\x00\x00\x00\xcb\xd6\xdf\x8a\
+\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x09\x99iTXtXML\
+:com.adobe.xmp\x00\x00\
+\x00\x00\x00<?xpacket beg\
+in=\x22\xef\xbb\xbf\x22 id=\x22W5M\
+0MpCehiHzreSzNTc\
+zkc9d\x22?> <x:xmpm\
+eta xmlns:x=\x22ado\
+be:ns:meta/\x22 x:x\
+mptk=\x22Adobe XMP \
+Core 6.0-c006 79\
+.dabacbb, 2021/0\
+4/14-00:39:44   \
+     \x22> <rdf:RDF\
+ xmlns:rdf=\x22http\
+://www.w3.org/19\
+99/02/22-rdf-syn\
+tax-ns#\x22> <rdf:D\
+escription rdf:a\
+bout=\x22\x22 xmlns:xm\
+p=\x22http://ns.ado\
+be.com/xap/1.0/\x22\
+ xmlns:dc=\x22http:\
+//purl.org/dc/el\
+ements/1.1/\x22 xml\
+ns:xmpMM=\x22http:/\
+/ns.adobe.com/xa\
+p/1.0/mm/\x22 xmlns\
+:stEvt=\x22http://n\
+s.adobe.com/xap/\
+1.0/sType/Resour\
+ceEvent#\x22 xmlns:\
+stRef=\x22http://ns\
+.adobe.com/xap/1\
+.0/sType/Resourc\
+eRef#\x22 xmlns:pho\
+toshop=\x22http://n\
+s.adobe.com/phot\
+oshop/1.0/\x22 xmln\
+s:tiff=\x22http://n\
+s.adobe.com/tiff\
+/1.0/\x22 xmlns:exi\
+f=\x22http://ns.ado\
+be.com/exif/1.0/\
+\x22 xmp:CreatorToo\
+l=\x22Adobe Photosh\
+op 22.4 (Windows\
+)\x22 xmp:CreateDat\
+e=\x222022-03-26T13\
+:59:44-05:00\x22 xm\
+p:MetadataDate=\x22\
+2022-03-26T14:15\
+:27-05:00\x22 xmp:M\
+odifyDate=\x222022-\
+03-26T14:15:27-0\
+5:00\x22 dc:format=\
+\x22image/png\x22 xmpM\
+M:InstanceID=\x22xm\
+p.iid:dff7eb2d-2\
+a8b-1a42-a931-db\
+2ac9d6fe0e\x22 xmpM\
+M:DocumentID=\x22ad\
+obe:docid:photos\
+hop:ec70335c-90f\
+c-154a-bc04-4648\
+212370cc\x22 xmpMM:\
+OriginalDocument\
+ID=\x22xmp.did:1d2b\
+b9be-ae85-8f4f-b\
+8d6-ac9729f3754e\
+\x22 photoshop:Colo\
+rMode=\x223\x22 tiff:O\
+rientation=\x221\x22 t\
+iff:XResolution=\
+\x22720000/10000\x22 t\
+iff:YResolution=\
+\x22720000/10000\x22 t\
+iff:ResolutionUn\
+it=\x222\x22 exif:Colo\
+rSpace=\x2265535\x22 e\
+xif:PixelXDimens\
+ion=\x22500\x22 exif:P\
+ixelYDimension=\x22\
+500\x22> <xmpMM:His\
+tory> <rdf:Seq> \
+<rdf:li stEvt:ac\
+tion=\x22created\x22 s\
+tEvt:instanceID=\
+\x22xmp.iid:1d2bb9b\
+e-ae85-8f4f-b8d6\
+-ac9729f3754e\x22 s\
+tEvt:when=\x222022-\
+03-26T13:59:44-0\
+5:00\x22 stEvt:soft\
+wareAgent=\x22Adobe\
+ Photoshop 22.4 \
+(Windows)\x22/> <rd\
+f:li stEvt:actio\
+n=\x22saved\x22 stEvt:\
+instanceID=\x22xmp.\
+iid:1889666a-2ea\
+9-de49-8c37-5789\
+a1bd3877\x22 stEvt:\
+when=\x222022-03-26\
+T14:15:27-05:00\x22\
+ stEvt:softwareA\
+gent=\x22Adobe Phot\
+oshop 22.4 (Wind\
+ows)\x22 stEvt:chan\
+ged=\x22/\x22/> <rdf:l\
+i stEvt:action=\x22\
+converted\x22 stEvt\
+:parameters=\x22fro\
+m application/vn\
+d.adobe.photosho\
+p to image/png\x22/\
+> <rdf:li stEvt:\
+action=\x22derived\x22\
+ stEvt:parameter\
+s=\x22converted fro\
+m application/vn\
+d.adobe.photosho\
+p to image/png\x22/\
+> <rdf:li stEvt:\
+action=\x22saved\x22 s\
+tEvt:instanceID=\
+\x22xmp.iid:dff7eb2\
+d-2a8b-1a42-a931\
+-db2ac9d6fe0e\x22 s\
+tEvt:when=\x222022-\
+03-26T14:15:27-0\
+5:00\x22 stEvt:soft\
+wareAgent=\x22Adobe\
+ Photoshop 22.4 \
+(Windows)\x22 stEvt\
+:changed=\x22/\x22/> <\
+/rdf:Seq> </xmpM\
+M:History> <xmpM\
+M:DerivedFrom st\
+Ref:instanceID=\x22\
+xmp.iid:1889666a\
+-2ea9-de49-8c37-\
+5789a1bd3877\x22 st\
+Ref:documentID=\x22\
+xmp.did:1d2bb9be\
+-ae85-8f4f-b8d6-\
+ac9729f3754e\x22 st\
+Ref:originalDocu\
+mentID=\x22xmp.did:\
+1d2bb9be-ae85-8f\
+4f-b8d6-ac9729f3\
+754e\x22/> </rdf:De\
+scription> </rdf\
+:RDF> </x:xmpmet\
+a> <?xpacket end\
+=\x22r\x22?>\xe8\xcc|\x13\x00\x00\xf8\xc3ID\
+ATx\x9c\xec\x9dw\x9c\x1cG\x99\xbf\x9f\xb7\xba{\
+\xc2\x06\xe5d\xc9\x8a\x96lY\xb6\x9c\xb3\x8d\x03\xd1d\
+0pp\xa4\xe38\xc2\x1d\x1c\xf0;\xb8;8\x82\x09\
+G6\x98x\xc0\x911\x87m26\xb6q\xc49\xcb\
+\x92\xad\x9c\xc3*k\xb5y'vw\xbd\xbf?zf\
+\x15\x90vW\xbb\x93v5\x8f?c\xadF\xb3]\xd5\
+=\xdd\xf5\xadz\xeb\x0d\xa2\xaa\xd4\xa9S\xa7N\x9d:\
+uF6\xa6\xda\x1d\xa8S\xa7N\x9d:u\xea\x0c\x9f\
+\xba\xa0\xd7\xa9S\xa7N\x9d:\xa3\x80\xba\xa0\xd7\xa9S\
+\xa7N\x9d:\xa3\x80\xba\xa0\xd7\xa9S\xa7N\x9d:\xa3\
+\x80\xba\xa0\xd7\xa9S\xa7N\x9d:\xa3\x80\xba\xa0\xd7\xa9\
+S\xa7N\x9d:\xa3\x80\xba\xa0\xd7\xa9S\xa7N\x9d:\
+\xa3\x00\xb7\xda\x1d\xa83X\x14\x90\xe8'\xb5X?\x83\
+\x86y\xdc\xe4x\xd4\xfa\x04\xd9\x1e\xdc\xf8\x18\xc4q\x09\
+\xf3\xbd\x84\xf94\xe2x\xb8\xf1F\x82l\x0f^\xc3\x04\
+\xd4\x86\x88q\x00\x08s=(\x8a\x1b\x1f\x8b\x0d\xf3\x18\
+'\x86\xb5\x01A\xb6\x13\xc7k@m\x80\xaa\xc5\xb8\x09\
+4\xc8\xe1&\xc6b\x83,a\xae\x07\x13kD\xc3<\
+\x00N|\x0c\xa8%\xc8v\xe1\xc4\x9a\x08r=8^\
+\x03N,\x89\xda0\xea\xba\x18\xd4\x06\x18\xe3\xe2g\xda\
+q\xe2\xcd\x84\xf9\x14\xc6\x89\xe1\xc4\x9a\xb0A\x06\x1bd\
+q\xbcF\x82\x5c7nb\x0cbb\x04\xd9N\xc48\
+8\xb1\xe6\xa8\xed|\xaap\x8e\x1e~\xba=\xfa\xfdx\
+\x13\xa1\x9fB\x83<N\xac\x11qb\xa0J\xe8\xa7\x00\
+\xc1\x895\x12\xe6S\xd80\x8f\x1bk\x021\x04\xd9.\
+\xc48\x85c7\x11\xe4zQ\xebGWW\x0c\xc6K\
+b\x8c\x87\x9f\xed\x88\xba\xef\xc4p\xbc$\x22\xd1\xb5\xb3\
+a>:\x86\xe3\xe2x\x8d\x18\xc7\xeb\xfbnB?E\
+\x98O!\xe2 \xc6\xc5\x8d\x8f\x01\x91\xbeo1\xcc\xf7\
+b\xfd\x14`\xa2\xb6\xdc\x04N\xac\xf1\x90o:\xfa\xfe\
+R\x88\x18\xa2\x0fb@\x1c\x05\x07\xd4u\xbc\x06\xc7x\
+I\x111RhX\xfa:\xf0\xb7?\x1f\xe9F:\xf8\
+\xe7\xe2\xdfm\xe1\xe5\x87\xf9\xde0\x0cr\x81\xa8\x86\xa0\
+\x16\xb5*n\x1c71\xee\xa8w\xa7\xf5\xb3\x04\xf9^\
+@\x11\x11\xbc\xe4\x04\x90\x03\xeb\x05\xb5>jC\x8c\x9b\
+8\xf2\xef\x079\xc2|ot\xcd\x12c\x0f\xbb\x1e)\
+l\x98C\xd5\xe28q\x1c/I\x90O\x1d\xf29k\
+}\x04\xd3w\x7f\xa3\x1a\xdd\xd7n\xbc\xd0~\x80\x0d\xb2\
+\x88\xe3a\x9c8\xaa6\xba'\x9dX\xdf\xbf\x87~\x1a\
+\xe3&\xa2g!\xc8\xa26\xc0\x895E\xf7w\xbe\x17\
+\xc7kD\x8cC\xe8g\x10\x0111B?\x8d\x1bo\
+\x06\x88\xee\xfdX\x036\xc8#\x22\xd1\xb3c}\xc2|\
+\x1a71\x96 \xdb\x89\x1b\x1fK\xe8\xa7\xb1~\x06\x11\
+\x83\x0a\x88\x98\xa3_[U\xb4\xf05\x85\xd9n\xdc\xe4\
+8\x8e\xf4\xb5\xaa\x86\xd8 \x1f]\x9b\xc2\xb3(\xc6\xc1\
+\x06Y\x80\xa8/\x1ab\xfdLtND\xf7\x99q\xe2\
+\x88\xe3\xa1a\x1ek\x03\x1c\xaf!j\xabp\xbe\x88\x81\
+b\xae\x129\xd2\xedT\xa7\x96\xa8\x0b\xfa\x08@\xadO\
+4P\xba\x87\x0c\x92uF\x05G\x1a%] \x014\
+\x03\xe3\x81\x09\xc0\x09\xc0\x89\xc0B`F\xe1\xdf\x1a\x80\
+d\xe1\xb3\x09\xc0\x03\xe2\x85?\x9d\xc2q\x0e\xbea\x14\
+\x08\x0b\xaf\x00\xc8\x1f\xf4J\x01{\x80\xd5\xc0\x06`+\
+\xb0\x1bh\x05:\x80\x9e\xc2\xef\x1d\x8dz\x86\xaaQ\xc5\
+\x81\xdb2\xc8\xf7 b\xfa&\x02uj\x97\xba\xa0\xd7\
+ \xd1\xea!,\xac\xfc\xea\x8c.\xb4\xb0\xe2\xd1\x89\xa0\
+'\x82\x9e\x04, \x12\xea\x99\xc0\x89\x8e\xd78\xd6x\
+\x0dF\xa2Q\xd5\x14_Z\x10iA\x1cD\x8e\xb6:\
+\xef\x0f!z\xe6]\x22\xe1/\x9a\x06\x8a+\xf5\xf9\xc0\
+E\x8e\xd7\x18\x18\xaf!\x94H\xc0\x0b+w\x09\x89D\
+}/\xd0E$\xf2mD\xa2\xbf\x05t\x0b\xaa;@\
+\xf7\x13M\x16\xea\x8c\x12\x04\xc1\x86>\x12\xfa\xf51\xa9\
+\xc6\xa9\x0bz\x0d\xa1jAm4\xe0\xd7\xad[#\x13\
+\xd5\xe8{D&\x8a\xda\x93\x80\xd3\x813\x81y\xc0\x14\
+\xe35:\xc6M8 \x1e\x10CL\x92h\x95\x9d$\
+\x12Y\x07\x11\xe4\x087@\x19o\x89\xe2\xa4\xc0\x00\xee\
+\xd1\xda'\xb2\x12, \x12\xec\x00\xf0\x89V\xf7Y\xe3\
+\xc6s\x9e\xe3\xe5\x0a\xef\x85\x88\xb1D\xc2\xbf\x0ax\x06\
+\xf41\xd0\x8d\xe5;\x85:\x95B\xd5\x12\xe6\xbaA\xc1\
+I4\xf7mE\xd5\xa9>uA\xaf)\xf4\xa0W]\
+\xd1k\x17-N\xbe\x1aA\xe7\x10\xad\xae\x17\x00s\x8c\
+\x9b\x98\xe8\x19/\x89H\xa3 c\x11\x99\x08L\x222\
+\x8fG\xfb\xe2#{\xdbD\x88L\xfa\x1e\xd1$\xa4\xf0\
+\xae)\xee\xf9\x1f\xce\xc5\xc0\xabD\xdc\xdd8\xce>\x22\
+\x91o/\xbc\xda\x88L\xfa\xbb@\xb7\xaa\xda\x9d\xa2\xb6\
+\xcc\xdd\xafS\x0a4\xf4\xfb\xfe\x14\xc7\xd4\xf7\xd7k\x84\
+\xba\xa0W\x09\xb5\x01 \x07\x9cx\xea\xd4\x1cZ\x10\x17\
+Qm\x00\xe6\x12\x09\xf7Ib\xdcIn\xbc\xb9I\xc4\
+\x8c\x13\xe3N\x019\x91h\xf5:F\x8c\x8b\x98\xfac\
+u\x10\x0d\xc0\x1c\xc4\xcc9l\xc8O\x11\x99\xf0\xbb\x81\
+v1\xde>7\xd6\xb4\x1f1\xdd\x1c0\xed\xb7\x01[\
+Q\xdd\xa6j\xf7\xa8Z\xa5^L\xaa6\x90\xa2\x83n\
+\xfd\xfb\xa8%\xea#O\xa5Q\xc5j\x006$2m\
+\xd6\x05\xbd\xeahq_\x1b@\xa7\x82\xce\x02\xe6:^\
+\xc3d`\xac\x18g\x1a\xc8<`\x110W\xc4)x\
+\x03\xd7\x19\x06\x8d\x85\xd74\xa0\x10u\x90<\xf8\xdfs\
+\xc0~`\xb3\xb8\xb1-\x8e1\xbbP\xdb!\xc6\xdd\x8b\
+\xea\xa3h\xdd|_\xb3\xa8-D\xce\xc4\xeb+\xf7\x0a\
+S\x17\xf4\x0a\xa3j\xc1\x06D\xdb\x95\xf5\x9b\xbd*h\
+\xdf\xd6\xc68\xd0\x19\xe2x302V`*\xc8\x02\
+\x11s6\x22\x178^C\xbc\xca==\x9e\x89\x13y\
+\xf3\xcf0N\xecy\x14\xc2\xcb\x00\xd4\x067\x8b\xe3\xfd\
+\x92\xc8|\xdfId\xbe\xdfG\xff^\xf8u*\x84\x16\
+\xc2\xfc\xbc\x84W\xdf_\xaf0uA\xaf\x0au!\xaf\
+\x0e\xda\x042^\x1cw\x82\x883]\xc4\x9c\x89\xea\xcb\
+\x1c/\xf1\xbcj\xf7\xac\xce\xe0\x11\xe3\xbe\xc9\x89\xb9o\
+\x22\xf2\xb4_\x01<\x07\xf20\xc8Z\x22s}\x0a\xe8\
+\x052U\xec\xe6q\xcdQ\xfc)\xea\x94\x99\xba\xa0\xd7\
+\x19\xcd\xb8@\x0c\xc4Cd\xa6\xa2\xcf3\xc6\xbc\xd1M\
+\x8c\xbd\xa2\xda\x1d\xabS\x12\xc6\x03\x97\x03\x97\x1b\xe3~\
+\xa0\xf0\xde\x0a\xe0q\xe0\x91\xc2k?\xd1\xca\xdd'\xf2\
+\xcc\xafo\xfa\xd6\x19\xb5\xd4\x05\xbd\xcehe\x1cp\xbe\
+\xaa}\xb3\x13kx\x89C_\xea\xb2\xba\x0dpts\
+\x1a\xb0\x08\x91\x7f4n< J\x92\xf3$\xf0\x00p\
+/\x91i\xbeN\x9dQI]\xd0\xeb\x8c\x02\xfa\x9c\xda\
+N\x07\xaeA\xe4U\x8e\xd70\x05$\x8eH3\x90\xac\
+os\x1c7\x14m\xbd\x0eQh\xdd\xe9\xc0|1\xce\
+5\x8e\xd7\x90Ad3\x07\xc4\xfd\xe1\xeat\xb1N\x9d\
+\xf2P\x17\xf4:#\x92(\x0e\x5c\xe3\xa8\xbd\xd2\xb8\xc9\
+kp\x12\xa7\x8b8c\x89\xbc\xa6'\x8e\xf0X\xef:\
+\xa5\xc3\x00\x0d \x0d\x05\x8f\xeb\x13\x81\xd3E\xcc\x9b\xc4\
+x\xfb\x88\x12\xdf<\x06\xdc\x83\xda\xddu\x8b|\x9d\x91\
+L]\xd0\xeb\x8c\x10\xa2d.\x8a\x9e(\xf0|7\xde\
+|\xa9\x88s\x02\x22s\x05sj=\xfe\xaf\xce10\
+\x01\x98\x80\xc8\xc9D\x89o^,\xe2\xbc\xdd\xf1\x1a\xb7\
+a\x9c\x82\xc0\xeb\x13\xf5\x98\xf7:#\x8d\xba\xa0\xd7\xa9\
+]\xa2\xf8\xf0I\xa0\xe7\x89\xf1NqcM\xd3\xc5\xb8\
+\xf3\x81\xf3\x8c\x1b\x9fU\xed\xee\xd5\x19\x158\xc0\x5cD\
+\xe6J\x94\xa7\xbc\x07xN\x8c\xb7B\xc4\xd9\x08\xac\x07\
+\x96\xa3\xdaR\xcdN\xd6\xa93\x18\xea\x82^\xa7\xb6\x88\
+VE1\xe0tq\xe3\xa7\x8b\x98\x0b\x81\xab\xc4\xb8\xa7\
+\xd63\xb0\xd5\xa9\x00\xcd\xc0eb\xdc\xcb\x0a\x7f\xdf\x00\
+\xf2\xb8\xb8\xb1\xe5\x88l\x05\x9e\xab\xe7\xa4\xafS\xab\xd4\
+G\xc8\xa3\xd0\x97\xf6S\x0e.fU\xa7l\xa8\x022\
+C\xdc\xd8)\x889\x1dx\x83\xe35\x5c6\xd0\xaf\xd5\
+\xa9Sf\x16 \xb2\xc0q\xfb\xb2\xd8\xfdF\xc4\xf9\x83\
+\x08\x1b@\xb7\x81\xb6U\xb3su\xea\x1cL]\xd0\x0f\
+\xa7\xb0o\xa6a.\xfa\xbb\x13/\x88z\x9d2\xd1\x88\
+\xc88\x11s\xb2\x18\xe7\xadn|\xec;\xab\xdd\xa1:\
+u\xfa\xe1\xef\x8c\x1b\xff;`\xb7\xda\xe0'\x22\xce\x1f\
+\x88\xea\xc8w\x01\xe9\xeav\xad\xce\xf1N]\xd0\xfbP\
+TCl\x90+\xa4+\xac\x8bx\x191 .0A\
+\xd5\xbe\xd68\x89\x0f\xe1$N\xa9v\xa7\xea\xd49\x06\
+N\x10\xe3~\xd2\x89\xb9\x9f\x04\x9e\x00~\x04\xdcAT\
+P\xa6XG\xbeN\xd9\xa9W\xa6<\x98\xba\xa0\x03a\
+\x90!\xcc\xf7b\xc4C\xbcz\xfa\xee\xf2\xa2\xa0z\x86\
+\x97\x18\xfb_\x88<\x1f\xa4\x91(ow\x9d:#\x95\
+\xf3\x813\xdcx\xd3\x97A\xee\x06\xfd.\xc8\x13\xd5\xee\
+\xd4hG\xc3<\x81\x9f\xc2K\x8c\xafvWj\x86\xe3\
+Z\xd0\x83|/\x1a\xfah_\xeci=L\xa5l\xa8\
+\x8eA\xcc[\xdc\xc4\x84w\x88\x98)\x88L\x03\x12\xd5\
+\xeeV\x9d:%\xc0\xa1\x18\xeb\x0e\xd7\x187\xf1<A\
+v\x02\xb7\x00?B\xb5\xbd\xba\xdd\x1b\xad\x08XK\x90\
+\xe9\x00U\xdc\xe4X8\xce\x8b\xc1\x1c\x97\x82\x1e\xe4\xba\
+\x01\xb0\xa1\x1f\xed\x99\xd7\x1d\xdf\xca\x87\xea\xd9b\xe4m\
+8\xde\x05\xc0\x5c1\xce\xf4jw\xa9N\x9d2\x92\x14\
+1\xb3\x80Y\xc0|\x11\xf7\xd5N\xbci-\xf0\x1b\xd4\
+\xdeY\xe5\xbe\x8dJ4\x8cR\xf4\x07\xd9\x1e\x00\x9cX\
+\x03rPu\xbe\xe3\x89\xe3F\xd0U-a>\x05\x22\
+\xd8 \x1f\xbd)R\xaf\xd7[b\x0a\x19\xdc\x04\xe5u\
+\x22\xe6J\x843A.\x12\x91\xe3\xe6^\xabS\xa7\xc0\
+dD&\x8b\xb8\x17\x03\xe7\x9aX\xe3[\x11Y\xaaj\
+oS\xb5\xeb\x85\xfa\xf8S\x12\x0a\x0b\xb2\xc8\xdaj!\
+\xaf\x88\xc9#\x8e\x8bq\x8f/#\xe0\xa8\x1fd\xd5\x06\
+\xd80\x8fjH\xe8g@\xa4^\xda\xaf\x1cDa~\
+\xd3\xddX\xe3K\xc4\x89-\x06^\x89\x98\xf9U\xeeU\
+\x9d:\xb5\xc2\x19\xc6\x89\x9f\x01\x5cc\xdc\xd8\xe5\x22f\
+)\x1a.\xd10\xf7\x00H\xdd;\xbe\x14\x88 8h\
+\x18`\x83H\xd0\x8bQK\xc6K\x0e\xf0\xcb\xa3\x83Q\
++\xe8\xd6\xfa`-6\xc8\x12\x06YD\x1c\xc4\x1c\xdf\
+\xfb+\xa5\xa5\xcf\xef`\x06\x22s\x8d\x9b\x98+\xe2\x5c\
+jb\xf1\xf7V\xb5[\xa3\x80>O\x0e\x0b\xaa\x0a\x84\
+\xa0\x01h\xd1y\xba\xf8\xf7\xa0\xf0\xf7bU\xd0\xe2g\
+C\xfa\xf7\x07\x91\xc2^c1\x9aC\x00\xf7\xa0\xf7\xdc\
+\x03\x85\xe9\xa4\xf0\xbe\xb8};S\xf55\xe5\xb0H\x1a\
+'\xfej\x9c\xf8\xabU\xc3-\xe4\xf9%\xc6y\x0a\xb8\
+\x0f\xc8V\xbbs\xa3\x02\x91(RI-A\xae\x07\x10\
+\xdc\xc2\x22\xce8\xb1Qm\x15\x19u\x82\xae6\x00 \
+\xc8E\x0eob\x0c\xf5\x0cc\xa5$\x12\x0e\x11w*\
+\xc2\x99(\xaf\x16\xe3\xbc\xca\x897\x9fX\xed\x9e\x8d\x04\
+T\x8b\xff\x0b\x0e\x12\xe5\x03\x7f\xaa\xcdA\xd8\x01\xb6\x0b\
+\x0d3\xa8\xcd\x82f\xc0fP\xcd\x81\xe6\x00\x1fl\x1a\
+l\x06\xc1\x8f\xfe\xbdO\xe8\x8b\x9f\xe9/j\xca\x80\xc4\
+Q\x89\x03\x0e\x82\x01\x12\xa8I\x82\xc4@\x12 1\x84\
+\x04\x98d\xe1\x95@LC\xe1\xcf\x04\xe2N*\xf8\x80\
+\x15D\x1f\xafO\xf8\xa3\xf7\xcch\x1e7K\x82\x883\
+\xd7\x89\x8f\xb9\x96\xa8V\xfb\xfb\x80;\x81\x9d\xd4\xbds\
+K\x84\xf4\xe5\x10\x09\xb2]\xa0\x16716Z\xb9\x8b\
+3*-\xb5\xa3D\xe9\x14\xd5\xa8xG\x90\xe9\x8c\xde\
+\x12\xa9\xaf\xc8K\x8f N#\xb0\xc0\xc4\x9b\xde#\xc8\
+;\xa8{\xaa\xff-\xaa(aA\xb8\xa3U\xb5\x10\xa2\
+a\x1a\xeb\xb7\xa3A\x17\x1avB\xd8\x8e\x86m\xa0\x1d\
+\x88\xed\x01\xedD\xe8\xc1\xe4\x97\x22\xe1f\x8c\xb8Q\xad\
+0)\xac\xbe\x8b\x7f\xf6\xad\x91\xe5\xb0\x17\xa0\xc2\x81\x0a\
+\xa2\xfd \x96Cu\xa3xl{\xe0\xefz\xd0\xb1\xd5\
+\x14,\x06\x82UA\x13W\xa0f\x16V\x9a\xc1\x8c\x05\
+3\x11\x9cq\x88\x19\x838\xe3\x10g\x0c\xc6\x9d\x80\xb8\
+\xcd\xa8\xb8\x85>\x15\x84\x1e3\xaaWIC\xc0#\x8a\
+c\xff=\xf0M`5\xd0Mdz\xa9S\x02D\x0c\
+\x88!\xcc\xf5\xa2jqb\x0d8\xb1\xc6\xc2?\x8e\x1e\
+a\x1f\x15\x82n\x83<~\xae\xbb\xf0\xa5\xd5\x07\x8a2\
+!\xa0\xd3\xbd\xe4\x84\x0f\x22\xf2n\xa0\x1e\xfcy8\x1a\
+b\x83\xde\x82h\xef\x87\xa0\x1d\x0d\xf7\x22v\x0fb[\
+\x11m\xc5\xf8K\x10\xbb\xa3\xb0\x9a\xb5\x87\x8a\xb4\x9a\xe8\
+O\x11p\xc7q\x88X+\x05\x81-U_\x8f\xf1C\
+\x028\x16AqP\xb0O\x80>\xce\x81\x89@a\x22\
+\xa1\xd1y\xa8\x05\x8d]A\xe8\xcc\xc7\xca$p\xa6\x81\
+3\x15q' \xee$\x8c7\x1e\xe36\xd7\x9f\xd7C\
+y]\xe1u;\xf0\x05\xe0\xf1\xeavg\x14R0\xc7\
+\xdb \x87\xf5\xb3\x88\xe3\xe1&\xc7U\xbbW%cD\
+\x0bz\xe8\xa7\xeb\x8en\x95@u,\xf0\xaf\xc6M\xbc\
+\x0fd\x1c\xd0P\xe5\x1eU\x15\x05\xac\xef\xa3A;\x1a\
+\xb4\xa2\xc1\x1e$\xdc\x89\xd8\xbd\x98\xdcc8\xe1\xcah\
++\x1a?r\x16\x94\x10\x89*\xc7E\xa6\xf5\xe2^\xb5\
+-Z\x90\x84\x03\xe2)\x87\xfdYM\x0e\xea\x83\x02}\
+\x15j\xb5\xf0\xf7\x83\xad\x05\x07\xe5r\x10E\x8cE\xc2\
+G0\xf6QT\x04\xfc\xc29\xab\x83h3a\xfcr\
+\x023\x0dkf\x803\x13\xdc\xa9\x18o*\xc6\x9bD\
+\xdd\xb0\xc6\x8b\x80\x8b\x80\x87\x81/\x03OV\xb7;\xa3\
+\x14\x11\xd4\x06\xf8\xe9(M\x80\xd70\x9e\xdax\xee\x86\
+\xce\x88\x14\xf4 \xd7\x8bjP\x0c\x91\xaavwF'\
+\xaa\xa8\x0d\x8d\x18\xf7\xfd&\xde\xfc.`\x06\xc8\xc4j\
+w\xab\x1aX_\xb1\xc1~\xd4\xdf\x05\xe1N\xc4\xeeF\
+\x82\xf58\xf9G@\xf2@\x164\x0f\x9aGlo\xf4\
+\xf7\xd0\x1cf\xfe.\xae\xb6\x0d\x7fk\x12?X\xd0G\
+\x02\x87O:\x0e\xeb\x7fQ\xec\xb5\xb8\xddpp\xe2&\
+\x05\xda0\xf96\xc0\xc1\x91\x18H\x1cH\xa06\x8eu\
+\xe6a\x93/\x01\x99\x8c:S\x11w\x1a\xe2M\xc4\xf1\
+F\xe4P5Tb\xc0D\xe0e\x88\x9c.\xc8\xfdj\
+\xc3o\xa1vU\xb5;6*\xd1\x10\x80 \xd3\x85\xa2\
+8\xf1&\x8c\xf1\xaa\xdc\xa9\xa11\xa2\x9e\x92\xc8c\x11\
+l\x98/\xac|\xea&\xf6R\xa3jQ\x0d1^\xc3\
+[\x0d\xfafc\x9c\xb3@N\xa8v\xbf*\x85\xb5`\
+\xfd^\xd4\xdf\x85\x84{\x11\xbb\x0b\xcd\xdc\x8f\xb1;\x81\
+\x14h7\x90Al\x0fb\xf7\xd1\xe7).&2\x99\
+\x8b\x0b4\x1c\xa3y|$\x89\xf9\x918R\xff\x85\xe8\
+\xda\x1ci\xb9\xadH\x98\x02l\xb4\xed\xa0\xd1\xd6\x83\xd8\
+\x00\x09V\xa2\xe12\x90$H\x13\x90Dc\xe7\x13z\
+\xa7a\xcd\x09\xe0NG\xdc\xa9\x18\xaf\x113\xfa\x8dr\
+1`>0K\xc4\x9c\xe6\xc4\x9b\xef\x03\xf9%\xb0\xa1\
+\xca\xfd\x1aeD\xcf\xaa\x86>\xaa!\xc4\x9b\xaa\xdc\x9f\
+\xa1S\xf3\x82\xde\x17?\xae\x10\x06QTG\xd1\xc1\xa1\
+N\x89Q\x8b\x1bkz\x99\x18\xf7%\xc6\xf1^\x05\xcc\
+\xa9v\x97\xca\x8d\x0d\xc1\xfa\xed\x10\xee\x03\xdb\x0a\xf9\x15\
+Hn\x09b;\x81v\xc4vb\x82\x8d\x08\x99\x03!\
+\x5c}\xa1]c\x0f8\x8e\xf5-BG\xba8W\x02\
+!\xd2\xaa\xc3\xae\x9b\x89\x9c\x07%\xdc|@\xe8\xd5G\
+\xc3\xe5hn2F\xc6\x02\xe3\xc1\x9d\x85\xc6/$t\
+g\xa0f2\xe2LF\xdc\xf1\x18w\xd4\xda\xeac\x88\
+\x5c\x22N\xec<\xe0\x02\xe0~\xe0\xd7\xc0\xd6\xaa\xf6j\
+\xb4Q\xdc_\xcf\xa7\x11\xaf\x01qF\xde*\xbd\xa6\x05\
+]mP\xd8'\xcf\xd6\xf7\xc9\xcb\xcf\xd9\x22\xe6E\xc6\
+kx;pZ\xb5;S.l\xa8h\xd0\x89\xd8\xfd\
+\x10\xb6a3OB\xb0\x05\xc2=\x88\xee\x8b\xbc\xcb\xc3\
+m\xe0\x14\x85\xdb\x89\xc2\xb6h,8|\x1d\xbeg|\
+\xf8\xcfu\x06\xcfa\xd7M\x0b\x9e\xf0\xc4\x0e\x98\xed\x8d\
+\x22\xda\x83\x84m@\x00\xd6\x07?\x89\xe6\x1f\xc42\x0e\
+\xcc\x140\x93\xd1\xf89\x84\x89\xd3\xc1L\x02g\x22\xc6\
+\x1d;\x1a\xe7\xfc1\xe0%\x85\xd7\xd9\xc0mD\xf1\xeb\
+\xbb\xab\xd9\xa9\xd1\x85`\xfd\x0c\xc6\x89\xd5\x05\xbd\xd4\xd8\
+0G\xe0g0\xf58\xf22\xa0\xc5\xd5\xe4l\x11s\
+%\xf061\xee\x0b\xaa\xdb\xa7\xd2\xa3\x0a\x1a\xa6\xc1v\
+\x83\xed\xc0f\xd7\xa3\x99\xa5H\xb8\x0dc\xf7\xe0\xf8\x8f\
+ \x92*l\xdf\xb8@\x02\x9c\xc9\xf4yl\x1f8\xd2\
+a\x7f\xd6)\x0f\x87\x8b\xbc\x10EF\x162}\x89\x82\
+\xf8\x88\xdd\x80C\x00a!\xc9N~\x1ea\xfad\xac\
+\xcc\x00w6\xc4O\xc54\x9e\x8d\xd2\x08f,\xe2$\
+G\xdb\xee\xdc\x1b\x81k\x80\x1f\x027\x02k\x81z\x11\
+\x98R \x0ej\x03\xd4\x86#.\xf4\xb9f\x952\xda\
+\xcb\xd5\xfa\xaa\xbc\x5c\x883^\xd0\xd3\x81\xf7\x88q\xdf\
+Z\xed\xee\x94\x12\xb5A!\xc1J\x06\x9b\xdb\x85\xcd,\
+\x87\xfcr\xc4n\xc2\x09\xd7!\xe1*0QR\x15\x9c\
+\x04\xd1\x9ewQ\xc0\xeb+\xef\xda\xe4`\xa7;\x8f(\
+t\xbb\xa0\xd0\xc6\x02\xfbq\xc2=8\x84\xe0\xfb\xd8\xd4\
+8l\xfaEX\x99\x0d\xdeBL\xf2,$~b!\
+9Nr\xb4\x8c+\x1e\xf0~\xe0-\xc07\x10\xf9\x15\
+\xb0\x0f\xe8\xa9j\xafF8\x22B\x98O\x83\x08Nl\
+d\xed\xa7\xd7\xac\xa0\x87\xf9\x14a\x90\x89R\xf8\xd5)\
+%\x9e\xaa\x1dk\xbc\x86\x7f\x171\x1f\xadvgJ\x86\
+\x86@\x88\xda\x0caz\x1d6\xb3\x02\x13<\x87\xb0\x0d\
+\xd7_\x86\xd8V01\xc0Df\xd9b\xcc\xf7\xa1\x07\
+\xa9|\xbf\xeb\x0c\x83\xc2\xf7\xa5B\xdf\x0a\x1e\x05\xb1\x18\
+\xc7B\xf0\x17\x1ck\xd1l\x80f/\xc2\xbag\xa0\xce\
+\xe9H\xf2\x02\x9c\xe4<\xc4)L\xeaF\xfe\x183N\
+\xc4\xf9\xac\xe3:\xff\x0c|\x19\xe4f\xa0\x83(\x03]\
+\x9d\xa1 \x07o\xad\x8d\x1c\xd3N\xcd\x0a\xfa!\xd9\xaf\
+\xea\x94\x0e\xd5\xd7\x898\x9f\x04N\xa9vWJ\x85\x0d\
+2\x04\xa9\x95H\xee)L\xb8\x0ac\xb7\xe0\xfa\xcb\x88\
+\xb2\xb4\x15\xef\xa11`\xeb\xf7\xd3\xe8G@\x8b1\xef\
+\x1eP\x8c\x89_\x89\xb1\xab\xc1\x06hv.6u\x05\
+\xd6\x9c\x02\x89\xf3p\x1a\x16\x8d\x96\xaa\x5c\xd3\x80\xeb\xdc\
+\xc4\x98\xff\x07|\x0e\xb8\x99z~\xf8!!b\xb0\xf9\
+4X\x8b\x93\x18S\xed\xee\x0c\x9a\x9a\x14\xf4 \xd7\x83\
+\x0d\xf3\xa3\xc5,V}\xd4\x82\xb2H\x8c\xf3M\x90\xb3\
+\x81\x09\x0c*?h\xed\x12\xfa!az\x15\xc6\x7f\x12\
+\x13\xae\xc3\x0b\x96\x81\xbf\x1e\x91b\xfcsPX\x85C\
+}rx<S\x14\xf8\x82\xcf\x88\x80\xd8\xad8\xb9\xbd\
+\x18<4;\x06\xd2\x97\xe2\xbbg\xa0\xde\xf9\xb8\xcd\xe7\
+\x8c\xe4p\xb8b\xf8\xc0\x5c\xe0k\xc0\xfb@\xbf\x0c\xfc\
+\xa1\xaa\xbd\xaaS1jR\xd0\xfb\x12\xc6\x8c2/\x96\
+\x8aR\xc8m/b\xaer\x13\xe3>\x8c\xc8l`q\
+\xb5\xbb5\x5c\x82\xdc\x06$\xf7\x08\xe47\xe3f\x1e+\
+\xa4Q\xcd!6\x03\x9a-\xac\xca\x0a\xd5\xc3\xea\xd4\xe9\
+\xe3\xa0\x9c\xf4X\xd04\x82\x22\xb4\xa1\xd96\x5c\xb9\x07\
+uOC\xf2g\x118\x8b\xd0\xd8\xd98\x0d\xf3G\xb2\
+\xb8O\x04&\x8a\x13\xff:p1\xf0E\x223|\x9d\
+\xc1\x22Q\x8d\xf50\xd7\x8b3Bb\xd3kn\xd4\x0b\
+\xf3\xa9(\xb8\xbf.\xe6CF\xd5\x22\x8e7\xc1\x897\
+\xfd3\xe2\xbcA\x1c9\xab\xda}\x1a\x0ea>\x8d\xdd\
+\xb7\x0dv?\x8e\xf4\xfc\x163{'\xd2\xd0\x05t\x14\
+\xf2\xb0\xbaD\xb7\xf2\xf1Q\xf3\xb8\xcep98[\x9f\
+\x22\x9a\x06\xedD\xfcN\xf0\x9f\xc3\xb8c\xc0.\x80\xe0\
+rB{\x0e$\x17\xe1$Gf\xe9\x02\x113\x07\xf8\
+\x17`\x1cp=\xaak\xaa\xda\xa1\x11\x85DZdG\
+\x8e+B\xcd\x09\xba\x0drD{\x9f#wj\x5cU\
+\x221\xbf\xc2\xb8\x89w\x19'\xf6j\xa0\xb9\xda]\x1a\
+\x0a\xd6\xfah\xc7\x1e\xb4}\x0f\xc1\xeaG\x08\xd7<\x06\
+][1\xb2\x0a==\x81\xb3@0\x93\x93\xe0IT\
+\x93\xaa\xbfj\xa1u\xea\x1c\x15!r\x16\xf7\xa2\xad\x1a\
+\xb7\x03#\xbba\xfff\x82m+\x09v\x9d\x82\x99\xfb\
+Zt\xda\x02\x98:\x1b3\xfe\x04\xcc\xc8\x1b\x9b\x1a\x81\
+\x7f\x029A\xdc\xf8\x8dDU\xddrU\xee\xd3\x08A\
+@5\x8aM\xf7j\x7f\xc1PC\x82\xae\xd8 _H\
+\x0b]_\x9d\x1f3Q\xa1\xedI\xc0\x8b\x1c7\xf1\x11\
+\x90s\xab\xdd\xa5\xa1`3]h\xc7^\xc2\xd6\xad\x84\
+\xcf\xde\x87\xdd\xb5\x01\xdd\xbe\x1a\xdd\xb7\x1d\xe2\xe3\x08\xdd\
+\xe9\x04]\x8a\xbb+\xc4]\xe4\xe3\xce\xb5H\x93F\xf3\
+\xbfz\xb1\xc9:C\xc5\x00\xc6\x81\xd0%\xdc\xddH\xb0\
+Z\x08W\xb6c[\x9f\xc4l\xecE\x93\x0d\xc8\x94\x99\
+8\xa7_\x85;\xf7,d\xdcdLrl\xb5{}\
+,\x88\x88y\xb98\xb1K\x80E\xc0\xad\xa0OU\xbb\
+S5\x8fHT\x96;\xdfK\xac.\xe8\x83GU\x0f\
+\x94@\xad;0\x1d3\xe2x\x8b\x10y\x0bb>\x02\
+\xc4\xab\xdd\x9fcAC\x1fMwc[\xb7\xe1\xaf\xb8\
+\x0f\xdd\xb6\x0az{\xb0\x1b\x97`3=HC3L\
+<\x01P$P\xb4\x17\xfc\xe5.v\x9f`\xdb\x03\xbc\
+SC\xcc$\x1b%\x19;\xbc\xccw\x9d:\x03QH\
+\xc7\xaf\x19\x08\xb79\xf8\xcfy\x04\xeb\x0d\xb67\x8e\x89\
++\xc1\xce5H\x18\xc0\xd2{`\xdd\x12\xc2yg`\
+\x16\x9c\x87w\xea\xf3\x90qS\x91\x86f\xc4\x89U\xfb\
+,\x06\xcbx\xe0\x13\xc0U\x22\xee\xf5\x88<\x04\xb4V\
+\xb9O5\x8f\x88AC\xbf\xe6\xb3\xc7\xd5\x88\xa0\xf79\
+pU\xbb##\x91&\x90\xd3\xdc\xc4\x98\x1f\x02gT\
+\xbb3\x83G\xd1 \x8ff{\x09\xb6>G\xb8\xfaQ\
+t\xc3\x12\xc2\xe7\xeeG\x12\x8d\xa8\xeb\x82\xe3!\xcd\x13\
+8(\xab\xdd\x81\xb0\xe1@\xb1;\x0d\xf9n\x0fm\x17\
+\xbcs\x02\x9c\x196\xba\xa3-u\x13|\x9d\xc1Q\x18\
+rl\x97\x10\xaeu\xf0\x97z\x84;\xa27MSt\
+\xcf\x09\x85\x90\xb6\x86f\xc2\xce=\xc8\xc3\xeb\xd1\xd5O\
+\xa0\xeb\x97\xc0\xf4\x930\x8b\xaf 6\xfdT\x88'\x11\
+w\xc4\xcc\xa5/1^\xf2\x12\xe0+D\xd9\xe6v\x00\
+\xf9\xeav\xa9\x86Q%\xc8t\xe06N\xaai\x9d\xaa\
+\x09AW\x1b\x12d:\xeb\x8ep\xc7\x86\x10\xcd\xb6\xdf\
+*\xc6\xbd\x9e#\x97\xb5\xaa=\x0au\xc1\xc3T\x1b\xc1\
+\xc6\xa7\xd1\xf5\xcf`\x97?@\xb8\xf9Yh\x1c\x03\xe3\
+&\x1f\xb6\xc0>\xcar\xdb%:\xe3\xb4\xe0?\xebb\
+\xbb\x85\xd8\xf9\x01\xee\xfc0\x0a\xdc\xd1\xa3\xffj\x9d:\
+}\x95lC\x08\xdb\x0c\xfer\x87\xe0Y\x17m7\xd1\
+\xfd\x13\x85\xb0\x1f\x8a*8.:f\x02\xea\xa7\xb0\xcf\
+\xfc\x05\xb3\xa2\x11\xd9\xbd\x85\xdc\xb8\xc9p\xca\xf9x\xa7\
+\x5c\x82\xd34\xb10\x96\x8d\x88\xf1\xec\xa3\xc0\xd5\xc0\xa7\
+\x80\xbfP\xdf\xb8::5,\xe4EDk\xa0:\x94\
+\xda\x10?\xd3QeAW\x8c8\x88\x97@\x0ez\x10\
+\xc5\x89\x95tF\xa66D\xadO\x14\x10+\x98\x83L\
+u\xaaa!f\x5cQ\x91\xbe\x9a\xbc\xd1\xe7\x15\x11\x17\
+\xc4\xa0\x1a\xa2\x1a.6\xe2}\x03\x91\x8b\x81\x86\x92u\
+\xb0\xcc\x04\xed;\x08\xd7?\x0e-\xeb\x09\x9e\xb9\x0b\xdb\
+\xb6\x1d\x1c\x17l0\xb4\x07F\x89\x86 \x05s\xa2%\
+v^\x80\xbb0@\x1a\xb5\xbeR\xafsd\x8a\x95]\
+\x03\x08w\x18\xfce\x1e\xf95.\x92\x22\x12\xf3B\xd8\
+\xfa\x80\x14Ck\x1d\x17\xb1\x8a\xf89\x9c\xf3_\x8e\x9c\
+\xffR\x9c\x93/\xc4\x193edHz\xe4\x85\xdc\x0d\
+\xfa\x7f \x1f\x03M\x87\xf9\x14\x8e\xd7\x00b\x08s=\
+X\x1b\xe0\xc4\x9a0\x8e\x17\xed)g\xa2\xb4\xf1\xc6k\
+\xc4q\x13\x87\x8c\xddj\x03\x82\x5c7n|lYs\
+\xa1k\xe8\x13\xe4\xba+\x5c\xe1Pq\x13\xe3j\xd6\xf4\
+^\xf5\x15\xba\xb5~T\xe7\xbc\xbe:\x1f4\x22\xe6\xbd\
+\x22\xe6c 'R\x03\xdf\xe1`\xf0\xf7n@7=\
+\x8b\xb6\xac!x\xfav4\xd3\x83\xfa\xb9h\x02c\xc3\
+\xa1\xcf~\x0bN\xca\xeaG\x83s>\xe7AJp\xcf\
+\xf0\x91qQ\x22\x91\xfa\xbez\x9d>\x8a)\x0ar\x10\
+nr\xc8>\xe3a7;\x88\xcf\xb1\x899\x1c\x18\xb3\
+\x82<Z\xc8\xfb\xa0\xcb\xff\x8a,\xbf\x1f]x\x11\xf6\
+\xd2\xd7aN:\x07w\xfc\xf4r\x9cI)q\x80\xf1\
+ \xff\x08\x9c\x03|\x03\xd5\xdfW\xb9O\xb5\x89\xda\x9a\
+\xd6\xaa\x9a\x10\x03\x0d\x83\x11W\xd5\xa6\xf2(\xc0,\xe0\
+\xc3 \xaf\x07fT\xb7?\x03cQ\x82]\xeb`\xfb\
+\x1a\xec\xba\xa7\xb1\xcb\xee\xc6\xda\x10\xed\xde_X%y\
+\xd1\xea|\xb8H\xa1PZ\x00v\xaf\x90{\xca\xc5\xa6\
+\x15\xef\x9c\x003\xb5 \xeauCb\x9dBuVM\
+\x0b\xc1:\x83\xff\xb4G\xd8\xe2\x82*\xe2\x15\xfe}(\
+\x13?1\x85\xfb\xd9E\xf3\x194\x9f\x85U\x0f\x13\xb6\
+\xacBf\x9c\x82\xbd\xe2M\xc8\xacSq'\xcf\xab\xf5\
+\x15{\x13p)\xc8T\xe3%\xaf@\xe4s\xc0\xfej\
+w\xaa\xa6\x10C\x90\xeb\xc1\x8d5\xd5\xe4*\xbd\xaa\x82\
+n\xadO\x98O##8\x1dSePD\xdcW#\
+\xf2\x8f\xc0\xcb\x88v\xf8j\x960\xcc\xa3\xad\xdb\xb0;\
+\xd7\x11>s7v\xc3\x124\x97\x86\xf6]h,\x0e\
+^\x89=\x82\x8b\xf5\x13\x0aI\xe2\xb4]\xf0\x97y\xa8\
+o\x88\x9d\xebc\xa6\xdb\xe8\xdfFN~\x88:\xa5\xc6\
+\x10Yrz\x05\x7f\xa5\x8b\xff\x94K\xb8\xd3\x80\x01\x89\
+Q\x9a\xed\xee\xc2\x1e;\x0d\xcd\xd80\x80=\x9b\xa1m\
+'\xda\xb6\x13\x19?\x15.\xfd;\xe4\xa431S\xe6\
+\xd4z,\xfb|1\xee\xfb\x80\xd9\xc0\x8fP\xbd\xad\xb2\
+f\xedZF\xd0 \x87\xc6\x1akrrVUAW\
+\x1b\x12\x06\xd9z\xbd\xf3\xfe\x89#\xce[\x11\xe7\xdf\x81\
+\x85\xd5\xeeL\x7f\xd8 \x13\xc5\x90o/\x98\xd5\xb7\xaf\
+\x85\xfd\xdb\xb1]\xad\xd0\xd0\x149\xbd\x95s`(\x8a\
+\xba\x01\xed\x89\x9c\xe5\xc8\x83wA\x8033\xac\x8b\xfa\
+\xf1J\xc1\xcc\xae\xa9\x82\x98?\xe1\x12\xeep \xa6H\
+\xac\x0c\xf7\xa3j\x14\xd3\xde4\x0el\x88\xdd\xba\x02\xd9\
+\xb4\x0c\xbf}7L\x9e\x89{\xde\xcbq\x16]\x82L\
+\x98\x81\xa9\xddJo\x0e\xf0*\xe0$q\xe3\xa7K(\
+7\xa1v[\xb5;U\x13\x88\x83\xf5\xb3\x88\x18\xa4\xc6\
+\xb4\xabj\xbd\x89\x9c\xc3\x82zy\xd4\xfe\x99\x0f\xbcI\
+\xc4\xf9\xefjw\xa4?l>\x8d\xf6\xb4\x11n[N\
+\xf0\xcc]\xb0w\x1bv\xd32l\xb6\x17i\x1a\x0bc\
+'\x82\xb5\xe5w^)\x1e\xde!\x8a\xc4OC\xb0\xc2\
+\x05\x15\xc4(ff!\xac\xadn~?~\xf8\x1b1\
+\xf7\x08wH$\xe6\x09\xca\xeb4\xa9\x1a\x99\xe3\x9b\xc6\
+\xa2@\xb8c\x0d\xb2\xf6q\x82\x1d\xeb\x09V?\x84\xb3\
+\xf8J\xdc\xd3\xaeD\x9a\xc7\xf79\xc0\xd6 \xa7\x197\
+\xfe%q\xdcS\xb0\xe1\xf7\x81\xa79\xce=RD\x84\
+\xd0Oc\x1c\xb7.\xe8El\x90)\x98\xdb\xeb\x82\xfe\
+\xb7H\xacP\x15\xed\x83\xc0\x9b\xab\xdd\x9b\xa3\xa1a\x1e\
+\xdb\x13\x85\x9f\xd9\x15\x0f\xc0\xce-Q<\xb9\x01I6\
+!E!\xb7\x15v5W\x22\x13k\x03h\x1a\xfcU\
+\x0ex\x1e1\xd7\xc7L+$\xa0\x09+\xdb\xa5:U\
+\xa0\xe8\x00\x97\x89\xee\x01\xff\x09\x97`\x97DOW\xb9\
+\xc5\xfc`\x8a\x13\xd9D\x13\x9a\x1cC\xd8\xb6\x03\xee|\
+\x0e]\xf9(\xf6\xa2\xe5\x98\x93\xcf\xc3[t\x05\x12o\
+\xa8\xd98v\x11\xe7\x1d8\xceE\xc0\xc7\x81\xc7@\xf7\
+\x8e\x90\xb0\xbc\xb2 b\x22'\xc8\x1a\xcb\x9fR\x9d\xb0\
+5UB?E\xe0gj\xe8b\xd4J\xd8Z\x98@\
+\x9c\x17\x898_\x07\x16\x94\xac\xe1RbCl\xae\x97\
+`\xcb\xb3\x84\xab\x1f\x81U\x8f\x12\xaez\x04m\x1c\x03\
+\xb1D\x85\xc3H\x06@\x89*B7*\xde\xd9\x01\xb1\
+\x8b|\xcc$=>\xf2\xbf\x1f>\xde\x0a\x07\xd6V5\
+\xf4\x15\x95\x85b\x9c\xb9\x0f\xc1\x1a\x97\xdcc1\xc2\x9d\
+\x12%&:R\x8cy\xc5\xfb'\x88\x9fGz\xbb`\
+\xfc4\xcc\xcb\xde\x839\xf5\x22\xbc\x99g`\xe2\x0d\x91\
+\xc9\xbe6\x09U\xed\x8f\x82l\xe7\xe7Q\xbb\xd7x\x8d\
+\xc1\xf1\x15\xb6vH\x070^\x03N\xbcv\xcaeT\
+E\xd0\x83\x5c\x0f6\xc8\xd6X\xa0~-\x08z\x00\xc8\
+?\x8b8\xd7S\xab\xa5\xc3T\xf1\xb7\xaf \xdc\xb0\x04\
+\xfb\xc8\xef\xb0\xeb\x9e\x82\x86f\xb4V\x1d\x1b\xa5\x10\xda\
+\x9f\x053N\x89\x9d\xef\x13\xbb @\xc6\xe8\xe8+O\
+Q\x141 \x0a\xcc?\xe8\x1f\x0e~\xccE\x0b\x89w\
+\xa4\xef\xa3\xa3*\x11\xcfAIc\x82M.\xf9G=\
+\x82\xad\x91'zM\x88\xf9\xe1\x04\x01\xe2\xc5q\xcf\xbd\
+\x1af/\xc49\xf52\xdc\xe9\xa7\x22n\xcd\x9a\xe1\x15\
+\xd8\xe9\xa7\xdb\xdff\xbc\xc4\xc3\x8e\x9b\x0c\x8fOA\xb7\
+\x05A\xaf\x9d\xd2\xaauA\xef\xa3\xea\x82\xee\x11\xd5,\
+~7P\x93U\x1f\xfc\xdd\xeb\xd0\x965\xf8w\xfc\x00\
+\xbbkC\xb4\xe0\xd3B\x0cy\x0d\xc7f\xf6\x85\xad\x85\
+`&[b\x17\x06\xb8\xe7\x06\x88\xa7}IiF,\
+\xc5\xd2\x07\xc5?5*\x1a&V!\x04\xb5\x12Y\x22\
+\xfc\xc2\xf7\xe3h\xb4\xe5\xe0\x808\x0a\xae\xa0r\xd0b\
+^\x19\xd9\x09y\x8aIc,\x84;\x1c\xf2\x0f{\x04\
+\x1b\x5c\xb0Z\xbb\xb1!\x851X\xdc\x18\x04>\xee\xf9\
+\xaf@\xce\xbc\x02g\xfe\xb9\xb8\x13gW\xb9sGE\
+Um\xbb\xda\xe0\x1f\xc4\xb8\xb7\x1f<F\x1e7\x82^\
+@\xdc8n\x8d\xac\xd2+.\xe8A\xbe'\xaa\xaaV\
+sTU\xd0\xcf\x02>\x03\x5c\x05\x8c)Yc%\x22\
+\xe8\xde\x8b\xdd\xfa\x1c\xbay\x05\xe1\x13\xb7\x10\xee\xdb\x1a\
+-{\x1d\xaf`\x1a\x1c!\x8aXp\x86s\xa6[b\
+\x97\xf9\xb8\xa7\x05\x91\x00\x8cD\xcf\xf7\x82(G\x93\x15\
+E\xf3\x82\xa6\x04\xed5ho\xe4\xe5oS\x06\xcd\x11\
+\x9d_x\x90\xa0\xbb q0\x0d\x0aM\x163F\x91\
+f\x90F\x8b\xc4\x15L\xe1\xb3\x96\x91\xe7@\xe8\x02\x02\
+v\xaf!\xff\x98\x87\xbf\xc2\x8d\xce\xbf\xf0~McC\
+\x08C$\xd9\x0c\x18\x9c\xb3^\x80s\xd95\x98Y\xa7\
+\xe16M\xaav\xef\x8e\x8c\xeaFD\xde\x0a<\xd9\xf7\
+\xd6\xf1$\xe8\xaa\x88\x1b\xc3M\xd4\xc6\x1a\xac\xe2Nq\
+j\x83B\xb6\x9dZZ\x9dW\x0b\x05x)\xf0\x1fD\
+b^S\xd8 G\xd0\xb2\x12\xbb\xeaa\xc2\xc7\xfe\x00\
+\xf9\x1c\xb6c7\x18\x03N\xac\xf0 \x8d\x101\x87>\
+\x0f\xf7p\x8f!\xbf\xd4E\x1a-\xce\xdc\x11\xe4\xf9^\
+\x5c}:\xa0\xaaH\xd6`\xdb\x85p\xaf\xc1\xee\x17\xb4\
+\xd3`{\x04\xcd\x08d\x05\x9b\x07\x02\x10[\xfce\xe8\
+3\xc5\x17\xf7\x92\x13\x8a4\x80iV\x18oq&\x86\
+\x98)\x16g\x02\xd0\xa0Q\xb4@H\xed_\x1f%\xba\
+6n!\x0f\xc1r\x87`\x8d\x13\x95\x1b\x19\x09b\x0e\
+\xd1\xe4\xd8q\xd1\x5c\x0ar\x19\xc2\xa7\xfe\x0c=m\xe8\
+\xf9/Cg\x9d\x8a9a~M\xed\xd7\x02 2\x1f\
+\xf8\x1e\xf0y\xe0\x8fU\xeeM\xe5\x11Am@\x98O\
+\xe1\xc4\x1a\xab\xdd\x9b\xca\x0az\xe8\xa7\xd1b(\xc7\xf1\
+L!\x11\x8a\x18\xf7-\xc0G\x80\xb3\xab\xdc\xa3C\xb0\
+\x1a\xa2m\xdb\x09\x96\xdc\x85\xff\xd4\xadH\xd7~\xec\xee\
+M\x10\x8bGNoPu3\xd7\x90)\xe6\xf0\xde\xea\
+\xe07zHc\xc1\xf3\xbd\x98\x13\xbeV\x07\xfe\x82X\
+a\xa3\xca`v\x8f\xc1\xeep\xb0\xbb\x1d\x82\xfd\xd1\xaa\
+\x9c\xbc\xa0Eg\xbfbm\x90b\xd2\x9d>\x0e\xec\xa7\
+[\xa5\xefY\x14G!\xe1\x1069\x98\x09\x16s\x82\
+\xe2\xcc\x0cq\xa6\x17\xea\xcd\xc7\x88\x84\xbdV\xa3\x03\x8a\
+)\x80\xd3\x10\xacs\xf0Wzh\xafD\xfd\x1eI\xc3\
+M19M\xe3\x184\x9b&\x5c\xff\x14\xb6}'2\
+\xf1D\x9c\xcb^\x87\xce^\x8c3\xf5\xa4Z\xbbM\xcf\
+\x01\xbe\x00L\x03~\x01\xa4\xab\xdb\x9d\x0a\xa3!\x1a\xe4\
+\xe0x\x13\xf4\xc0O\x1fb\xce>\x8eI\x88q\xdf&\
+\xe2\x5c\x0b\x9cX\xed\xce\x1cL\x98j'\xdc\xb5\x8e\xf0\
+\xe9;\x08\x1f\xbf\x05\xdd\xbd\x09m\x1c\x0bM\xb5aR\
+\x1a6\xc5P&\x1f\x82\x0d\x0e2N\x895\xf8\x91\x93\
+\x5cq\xef\xb8\x96nQC\xdf\xfe\xb8v\x0b\xe1NC\
+\xb8\xc5!l1\x84\xad\x06M\x1b4T\xc4)hs\
+q\xf5}\x88\x83\xdc\x11\xd0\xc87\x0e4r\x1a\xb4@\
+/\x84\xbd\x0ev\x8f\x81\xad`6:8sB\xdcy\
+!\xce\x096*x\xe3\x11\x89z\xad\xed\xb1{D\x93\
+\x9dm\x06\x7f\xb9\x8bm5\x88\xab#K\xcc\x0fF\x15\
+\x12\x0dQh\xe8\xb6\x95\x98\x9d\x1b\xd0t'\xe1\xf8i\
+\xb8\x97\xff=\xce\x9c\xc58\xcd\x93\xab\xdd\xcb\x839\x15\
+\xf8\x1c0\x05\xf8\x05\xaa[\xab\xdb\x9dJ\x12\x0d\x186\
+\xc8b\xdcDu{R\x99=t\xc5\x86\x01A\xbe\xa7\
+\x86Wv\x15\xdaCW;\x1e\xb5o\x17\xe3~\x89\x1a\
+\xf2d\xb7\xf94\xb6m'\xfeS\xb7\xa2[\x96\xa3\x1b\
+\x9e\xc1v\xee\x81\xa6\xf1\x85\xd1~\x94\xa1\x80\x0ff\x8a\
+%vy\x1e\xef\xf4B\xd9\xd5,\xb5#\xe8\x85=r\
+\xcd\x0aa\xab!\xdc\xe8\x10np\xb0\xbb\x0d6+`\
+\x0erp+:\xc5\xc1\xb1\xef\x82\x1c\xfc{EKE\
+\x109\xd4I\xc2\xe2LW\xbc\x93C\xcc\xfc(7\xbe\
+x5V\xc9\xce\x001\xb0{\x84\xfc#\x1e\xf9g\xbd\
+h\xab\xa16C\xba\x8f\x1d\x91(\x97C6\x05\xb9\x1c\
+\xcei\x97`.~5\xee\xe2\xabp&\xcdB\xbc\xea\
+\x8a\xc8\xe1\xa8\x86?\x0e\xf3\xe9\xaf9^\xc3\xbaQ\xbf\
+\x87~\x10\xaaJ\xacqrU\xc7\x8f\x8a\x08\xba\xaa%\
+\x9fn\xab\xa1\x98\xf3#Q\x11A\x9f\x00\xbc\x0f\xa8\x99\
+\xccojC4\xd5A~\xe3\xd3\xe8\xd3w\x12>q\
+\x0b\x9a\xe9\x86\x86fp\xbd\x9ayX\xcaB\x08(\xb8\
+\xa7\x84\xc4\xae\xf0qf\x87\x05\x07\xb2jw\x8c\xbe\xea\
+\xf6\xda%\x04\x9b\x1d\x82\x95.A\x8b\x0b\x19\xed\xcbK\
+>\xe4b\x22\x83E\x89\xf6\xa0C\x90\x06\xc5\x99\x1b\xe2\
+.\x0eq\xe6\x84\xd1\x9e;\xd4\x86\xa8\xc7\xc1\xa6!x\
+\xc6%\xffX\x0c\xdbn\x90\x84\xd6\xce\xc4\xac\xa4\x08\xd2\
+\xdb\x81\x99{62\xe74\xccY/\xc4;\xfdr$\
+\xdeTkI\xba\xeeS\x1b~P\x8c\xb3\x962\xdd%\
+\xb5&\xe8 \xb8\x89\xb1H)\x0aN\x0d\xb5\x07\x15\x11\
+t\x1b\xe2g;\xcb\xde\xce\xf0(\xbb\xa0'\x81\xcf\x12\
+9\xc0\xd5\x00\x8a\x86>\xe1\xaeu\xf8O\xdf\x8el_\
+O\xb0\xe2~\x14\x0b5\x96\xce\xb0l\x14V\xe9\xd2d\
+\x89\x9d\x1f\xe0]\x5c\x88OOS]1(\xdcn\xb6\
+52\x1f\x07\xcb\x1dl\xbb9\xb0\x8f^\xe9\xbe\x15\xae\
+\x13\x80\x99hq\xcf\x0c\xf0N\x0b\xa2\x04=P]Q\
+w\x00\xa3\x04\x1b]\xf2\x0fy\x84\x9b\x9c\x03\x13\x9e\xd1\
+L\x18Bo'\xce\xdc3q\xae\xfa\xfb(\x8d\xec\xd4\
+\xf9\xa5\xa9^X:6\x00\x7f\x0f<K\x19\xa6\xc9\xb5\
+'\xe8\x80\xb5\xb8\x8d\x13\xab6\xb9*\xbb\xa0\xab\x0d\xf0\
+3]#`\xb6\x5cVA7D\x9e\xa0\xef\xa4F\x86\
+\x9a0\xdbM\xb0\xea!\xec\xa3\x7f$\x5cz\x17\x1a\xaf\
+\xb1\x0co\x95\xc2\x82\x06\xe0\xcc\xb2\xc4\xaf\xf0qO\x0d\
+\xa2\xeb\x90\xaf\xc2\x0d[\xf0b\xd7P\x08w8\xf8K\
+\x5c\x82\xd5\x0e\x9a/x\xa4W\xfb\x19\xb2D\xab\xf5\x04\
+\xb8\xa7\x05x\xe7\xf98'\xd8\xa8_\xd5\xb0j\x08\x10\
+Sl\xa7\xc1\x7f,\x86\xbf\xc4E\xd3@mY\xa0\xcb\
+\x87*\x04y\x9c\xc9\xb31\xe7^\x8d\x9cr>\xde\xe9\
+Waj'}\xac\x05\xf6\x00o\x05\xee/\xf5\xc1k\
+R\xd0Uq\x1b&V\xad\x82\xa8\xf3\x99\xcf|\xa6\xcc\
+M(\xd6\xcf\xd4v\xe2\x91\x02\x22\x06q\xdcC\x05\xdd\
+8\xc8\xf0\xfa\xee\x02?\x01\xdeD\x8d\x0c5~\xebf\
+\xc2\xa5w\xa0O\xdcB\xb0\xea\xc1(\x0cM\x8an\xd1\
+\xc7\x19\x02\x12\x82f\x04\xf1\x14g\x8a\x8dV\xe9~\x85\
+\xafE\xd1Y\x0f\x087G1\xd4\xe1\x1a7\x12\xd0R\
+\x95\xf7\x1c.EG\xbb<\xe8~\x83\xa6\x043\xceb\
+\xc6)8R\xf9\x95\xba\x0b\x1a\x1a\xecF\x87`\xb9\x87\
+m\x97\xe8\x1a\xd6\xf2\xce^)\x11\x01\xc7\xa0\xb94\xba\
+}\x15l|\x1au\x0c\xda<\x16\xa7qB\xb5{\x07\
+\xd1\x1d\xd3\x0c\xbc\x04\xd8\x0a\xac)\xe9\xd1\xd5b\xc3\x1a\
+K\xf7(\x82\x06Y\xc4\xf1\xaa\xb2J/\xab}FC\
+\x9f \xdf;\x22\xc4\xbcL\x8c\x05\xfe\x07\xb8\x86\x1ap\
+\x80\x0b\x82\x1e\xc2g\x1f\xc2\xde\xf7k\xc2\x96\xe5\xa8\xcd\
+E\x0eon\xeco\x1d\xaa\x8e\x97\x9c\xdf\x10=\x059\
+\x08[\x1c\x82-\x16o\x9cB\xac\xc2\xabt\x17@\x09\
+7;\xf8\x8f\xbb\x04\x1b\x1d$,\xc4\x81\x1f\x9c\x83\xbd\
+\xda\x14\xab\x97\xe5 X\x1b\x05\xb3\xc7\x8d\x8f\x99\xa5\x95\
+\x8d\xe7/:\x01\xb6C\xb0\xd1!h\x8d\xd2\xddIM\
+Y\x9c\xcb\x80\x1c\xf6\xb3\x18P\x8b\xe6S\xd8}i\xec\
+\x1d?\xc4\xdd\xbd\x0d\xbb\xe8\x22\xbc\xb3\x9f\x8f\x91\xaa\x0f\
+;\x10\x85\xb3]G\x944\xebgU\xeeK\xd9\x89\xaa\
+\x88V\xa7\xed\xf2\x0a\xba*a\xe8cj\xcbY\xa3R\
+\xcc&\xba\x89_O\x95\xd7W\x0ad\x1f\xbb\x97\xe0\xf7\
+\x7fD\xd7\xae\x80\x8e\xed(YhJ \x89x\xb4\x09\
+\x10'\xf2^v9\x90\x81\xcc\x1ct\x80\xd1,\xf0\x85\
+\xd8t\xdb\x16y\x92\x9b\x19!\xce\x0c\x8d\xf6\x8d+q\
+\xbe\x85\xc7\xc3nq\xc9?\x16\x899!\x91\xd7}-\
+\x89y\x11\x01b\xa0y!X\xe3\x22\x06<'\xc09\
+\xd1V\xce\xfb\xdd\x80\xe6!\xd8\xe6\x10n3\x90=h\
+[\xa2\xd6\xae\xd7p)\x8e\x1e\x87?\x8f\xc5\x84?y\
+\x01?\x8e\xcd)\xda\xb2\x1b]\x7f\x1b\xea=Ln\xce\
+\xad\xb8oz\x0b\x89\x0b.\xaf\x05\xa3\xc5\x5c\xe0\xd3@\
+#\xf0\xdd*\xf7\xa5\xbc\x18C\x90K\xe1\xc4\x1b\x91\x0a\
+\x97\xc5-\x9b\xa0\xab\x0d\xb0a\xb6\xc6=\xdb\xcb\xc6\xe9\
+D\x0ep\xd7T\xbb#A\xd7>r\xbf\xfb\x0d\xf9?\
+\xdc\x02O/\x8f\x06\x81\xe6&\xf0\x9aa\xbfF+\x1a\
+\x97H\xd0\x13\x85?\x93\x85Z\xd1\x85\xbf\xf7\x09|q\
+\xb0\x1ca\x09\xe2\x06\x85[\x10\x88\x9d\x06\xb3\xd9\xc1L\
+\xd4H \xca\x9d\xa5\xb8\xb0\xd2\x0cw\x1a\xf2O\xb9\x04\
+\x1b\x0bf\xf6\xe26h\xad^g\x89\xb6\x024+\xf8\
+k\x5c\x88\x0b\x12\xf71\x93mT\xf4\xa6\x9c\xfd.x\
+\xf7\xdbVC\xb0\xd1`;L\x14\xb67\x82\xb2\x10\x0f\
+\x88\x1c\xf4g\xd1G\xc1\x8f^\x9a\x07\xcd\x02i\x81\x0c\
+\x90\x89&W\x84\x82\x86\x09l\xa6\x1dI\xef\xc2>\xb0\
+\x82p\xf5&\xf4\x1do!\xfe\xf2W\xe16O\xac\xd2\
+\xc9\xf41\x1b\xf8$\xd1\x88\xf3}F_y\xa4\x02B\
+\x18d1^\xb2\xe29\xd4\xca&\xe86\xf4\x09\xfc\x0c\
+\xe6x\xf1\x98>\xc0\xd9\xc0'\xa8\xb2\x98+\x90_\xf3\
+,\xb9\x9bo\xc4\xff\xf9\x8d8\xdd>\xda\xdc\x00\x9e\x17\
+\xa5\x08\xcbG\xb1\xc4}\xe3\x9f\x80:\x85\xf2\x92\xc5z\
+\xd1\x0d@\xa3B#H\xb2 2E/k9\xac\xb1\
+\x91\x8c\xd2\x97\xc0E\xbb\x0c\xc1\x16\x07g\x96\x8dV\x9c\
+\x86\xf2\xad8\x0bm\xda6!X\xea\x12\xacs\xa2A\
+\xbb\xd6\xcc\xecGC\xa2\xfbD\xb3B\xb0\xda\xc54)\
+\xde\xc5y$I\xf9\x8a\xde\x14,G\x9a\x11\xc2m\x86\
+p\x87\x13\xb5U\xbc/k\xfd\x9a\x0dD\xd12V,\
+\x92\x13\x10\x89x*\xca\x82GF\xd04h\x06\xc8J\
+t\xbfX\x0e\x9c\xb7\x00\x12C\x1b\xe3\x98 D\x1fz\
+\x9a\xdc\xb6\x1d\x84-\xdbI\xbe\xf6\xf5\xb8\x0b\x16U\xdb\
+\x1dc*\xd1b\xc7\x10\xf9\x16uU\xb7;\xe5A\xc4\
+A\xc3<j\x1c\xa4\x82\x1aX\x16\xa78\xd5\x10\x1b\xe6\
+Q\x1b\x0e\xd7\xa1\xac\xa2\x0c\xd3)N\x88R ^K\
+\x95\xc5\xdcfz\xc9?\xf5\x08\x99\xeb\xbf\x8e\xfe\xe4f\
+\x8c\xd7\x88\x8ei\x04\xaf0]4D\x03\xe0\xc1\xaf\xe2\
+L2\x00r\x85B\x1f=\x82v\x03=\x82\x16V\x03\
+\x1a\x142\x8c\x99\x83^\xa3a \xa5\xe0\xea\x11F^\
+\xe6\xa6Yq\xa6\xda\xf2\xad\xfa\x0a+JMEy\xc7\
+\xfd\xa5.\xa4Ldf\x1fI+\xcdb\x16\xbb\xc2\x8a\
+Q\x1a\x153%\xca\x5cW\x96\x89Pq{b\x9fC\
+\xf0\x9c\x8b\xdd\xe1\x1c\xb8\x9fG2\x07oqY \x07\
+\xb6\x1b\xb4\x1dt\x1f\xe8^\x81VA\xdb\x04z\xa2\x5c\
+\xfd\x84\x1c8w\x8f\x03\xcfr\xd1\xa2\x16\x13hlB\
+\xda{\xb0O<M\xb0k\x0b2\xf3\x04\xcc\xc4I\xd5\
+.\xcd\x1a\x07^\x00\xa4\x88\x1c\xe5\x86\x96*\xb6\x16\x9d\
+\xe2\x0a\x88\x086\xc8!\xc6\x1cR\x22\xbb\xdc\x94E\xd0\
+C?E\xe8g\x10\x19Y{\xe7\xc3\x10t\x078\x83\
+\xa8\xfc\xe9+\xca\xd7\xc3\x81P\xc2\x9en2\xb7\xfd\x8e\
+\xec\x17\xbe\x82yp)2i\x02\x9a\x1c\xc4\xc3[\x5c\
+u\x17c\x9d\x8b+\x9e\xa00xt\x09t\x0b\xf4\x82\
+d\x892q\x1d,\xec\xa3\xc4I^-H(\xe0)\
+\xceTE\x9a-\xa8\x94^`\x8b\x85b6\xbb\xf8K\
+<\xec~\x13\x89\xe0\xc8zd\x80\xc8/K\x88V\xea\
+\xea\x0bf\xb2b\xc6j\xe9'z\xc5\xb0\xbe,\x04\x9b\
+\xa2d;dd\xe4\x14_9\x1a\xc5\xeb\x14\x02Y\xd0\
+N\xd0}\x82\xee1\xb0G\xa0M\xa2\xbc\xf4\x81\x1c\xfa\
+|:\x1cx\xf6\x8eD\xf1\xf9L\xc6\x10\x0c\xac\xd9L\
+\xfe\xa1\x07\xd1\x13'\xe2L\x9b\x8eI4\x94\xff\xdc\x8e\
+\x8e\xe1\x80\xa8\xafe(\xa2^\xc3\x82^\xc4\x18\x0f\xe3\
+\xb8\x15s\x0c/\x8b\xa0\xdb\xd0/x\xfa\x8d\xac\xa7l\
+\x88\x82.\xc0\x22\xe0\x1b\xc0\x8b\xca\xdb\xc3~P\xc5\xef\
+\xd8M\xfa\x9b\xd7\x11|\xe3\x87\x98]\xed\xe8\xf8fp\
+\x87\xb1\x89S\x14\xf8\xe2+$2\xf9u\x0b\xf4\x14~\
+\xceGJ.\xc5\xc1e$\xbbLHal\x0d\xa3\xc9\
+\x8a\x19\xa78\x93l\x14\x92UJa*\xac\xa0l\xab\
+\xe0/\xf3\xb0\x9b\x9cC\xde\x1f\x91\x08\xd1\x16N6\xca\
+\xa1n\xa6\x85\xd1\x16M)\xaf[\xd1\x1a\xb0\xdf\xe0\xaf\
+r\x09\xb79\xd189R\xaf[Q\x8c\x83\xc8\x9c\xae\
+\xed\x82\xdd-\xd8\xdd\x06\xdd\x17M\x9e\xb1\x1cX\x81\x0f\
+\xe7<\x1d\x031\x0f\xe9Lc\xef\xb9\x1f_{\xf1\x16\
+\x9e\x86ih\xacv\x14\xd2UDv\xc1\x15\x1c\xab\xa8\
+\xd7\xb8\xa0\x8b\x08\x1a\xe6\x01\xadXn\x80\x92\x0bz\x90\
+\x8b\xea\x9d\x8f41\x87!\x0b\xfa\xc9\xc0w\x80+\xa8\
+\xa2\x9ce6.#\xf3\xb1O\xa2\x7f\xbc\x07\x09,\xda\
+\x18\x8f\x84\xa8T\x14M\x82\xc5\x97\x7f\x90Y>%\x05\
+\xe71\x89\x9c\xec\x0e^9\x8c\x14\xd3q\x11!*7\
+j\x05I\x82\x99j\x91\xe2B\xa6\x14\xe7\x22\x80\xa7h\
+F\x08\xd6\xbb\xf8\xcf\xb9Q\xb9\xd3\xd1\xb2\xca\x0c\x80P\
+p&(fba2\x14R\x9ass\xa3-\x9f\xb0\
+%\x12t\xed\x94\xda\x89\xd1\x1f,\x07?Ga\xb4\xe5\
+\xa2\xfb\x05\xdd%\xe8n\x81\x0e\x89\x5c\xc5\x8aN~\xa5\
+\x9c\xac\x14\xe2\xd6%\xb0\xb0t5\xf9\xcd\xab`\xfe\x1c\
+\xdc)\xd3K\xd4\xc0\x909\x8fh\xb3i)\xc7\x22\xea\
+5.\xe8\x11\x8a8\xde\xc8\x15t\x1b\xe6P\x1bV{\
+\xd67$\x86 \xe8\xa7\x10e\x80\xbb\x9c*f\x80\xeb\
+\xfd\xcbo\xf1\xff\xfb\xeb\xf0\xc4\xb3\xa8Z\x88{`\xca\
+t\xfd\xe5\xb0W\x08\xa4\x89L\x82)A\xf2D\xdf\xbd\
+G\xb4j\x1fi\xb7A\xa1\xbf\x1aF\xa6d3\xd5\x22\
+\xe3m\xe4\xadj\x87y2\x0a8Q.v\xbb\xa7\x90\
+\x0ce\xbbs\xc0\x122\xd2)\xac\xd2\xf1\x05iP\xdc\
+i6\x8a\x94(\xc5^z\xd1\x19\xaeW\x08\xd7:\x04\
+\x1b\x5c\xd0\x11v\x8f\x1dd\xc1\xd2L!9\xcf\xce\x82\
+\x90w\xc9\x81\xf2\xbd\x07oc\x95\x9a\x82\xa8\xe3\xfb\xc8\
+\x96\x9d\xf8K\x97`\xc7'qO>\xad\x9a\x97\xd1\x05\
+N#\x0ai{\x9a\xc8w\x7f`F\x82\xa0\x8bDz\
+\xa8aED\xbd\xa4\x82\x1e\xe6S\xa8\xf5Kv\xbcJ\
+s\x8c\x82~\x1a\xf0m\xe0\xf9T\xc9%'\xc8t\x91\
+\xfa\xf1\xf7\x08\x7f\xf0\x0bt\xc5\xba(\xe3[2V\x99\
+\xc9\xd4\x91\x84=\x07\xda\x13\x09\xbb\x86 \x8e 19\
+ V#e\xb5^\x14&[0\xbbO\xb6H\x5cJ\
+#L\x9e@N\x086\xb8\x04\xab<\xb4\x97\xc8\xaa1\
+RD\xa9?\x8a\xe7\xe0\x03\x18d\x92\x22\x13mTk\
+=\x90\xe1\x9dc\xc1Q\xd0\xee1\xf8\xab<\xecn'\
+2\xe9\x8f\x84\xebv\xf0\xb6@.rl\xd3\x9d\x91y\
+\x9dN\x22\xebV\xb9\x85\xfc\x90\xfe\x08\xb8\x0e\xf8\x16v\
+\xed#xn9\xa1Ma\xce<\x1d\xc7\xa9Z\xda\xd8\
+8\xb0\x90(\xb3\xdc3\x0cF\xd4G\x82\xa0C\xc11\
+\xc7`*P\x15\xaf\xa4Bd\x83<\xda\xe7z9\xaa\
+9\x17\xf8\x0a\x91SGU\xc8\xed\xd8D\xee\x87\xffK\
+\xf8\xfb\xdb\x91\xd6\x0e$\x99@c\xc5\x12]\x15\xec\xc8\
+\xc1\xcep\x05\xef\x5c\xcd\x03)\xc1v\x83L\x063^\
+\xa3<y.}\x15\xcej\x9a\xe2^zF\x08w;\
+8]!Nc!\x84\xad\xb8\x8a\x1a\x0a\x85h\x02\xdb\
+a\x08w\x18l\xa7D%PG\xd3\xe3R\xb86\xb6\
+M\x08\xb7\x1b\x9c\x13\x81&\x86/R\x06\xc8B\xb8\xcf\
+`[\xcd\x01\x87\xafZ\xbf\x97\x8a\x02\x1d\x82\xf6\x10\x99\
+\xd7[\xa3\x9f\xfb\xee\xa5jL\xe8D \x11C\x1c\x07\
+6l\xc3\xff\xce\x8f\xd0\xce.\xf4mo#6\xfd\xa4\
+\x0aw\xa6\x8f\xf1\xc0?\x11]\x8d\xeb\x80\xdd\xd5\xeaH\
+I\x11\x13E~\xe5\xd3\x98Xy\x1d\x11K\xb6B\x0f\
+\x83,j\x8b\xc1\xa7#a\xda\xfc\xb7\x0cr\x85~\x11\
+\xf0y\xaa\xe4\x00\xa7@n\xd9\xa3d\xaf\xbf\x9e\xf0\xe6\
+?azr\xd0\xdc\x10\x89y\xb5\x07\xb7\xe2J\xa4X\
+\x9d+\x15\xc5\xcf\xe2K\xb4J+:\xf6\x8c\x104\x04\
+\x10\x9c\xc9\x16g\xa2=0!\x19\xea\xed\xed\x11y\xb6\
+oq\x08V\xb9hg\x14\xa66\x02w\xa7\x8eN\xdf\
+^\xba\x221\xc5LU\xcc\xb8\xc2\xbf\x0d\xf5\xda\x15\xee\
++\xdbi\x08\xd68\x04[\x1c0R\xdbi^\x0f^\
+\x95g@[\xc1\xee4\xe8^\x0e8\xbb\x15=\xd6\xab\
+\x89+Q\xb6\xc8\xfd]\xe8\x8a\x95\x84\xdd\xed\xc8\xf4i\
+\xb8SN\xa8V\x8f\x12D\xb9<\x1a\x81\xd5\xf4\x17\xa7\
+>RV\xe8\x00X\xb0\xc1\xc8\x11t?\xd3Y\xf8i\
+\xe4\x8eN\x03\x08\xba\x01\x9eG\x944\xe6\xeaj\xf4\xcf\
+\xfaYr\x8f\xdeG\xf6+\xd7\xa1\x7f\xb8\x13\x93hD\
+\xc7$\xa3\xfd\xf2j\x8b\xf9\xc1\x14\x1dz,Q\x18N\
+*\xfa\x13\x0aNL\xc5A\xac\xd6o\x95\x90\xc8\xec>\
+V\xa3\xbd\xf4$C\xbf\xce\x85\x95\x98\xf6\x08\xc1:\x87\
+`\x93\x03y\x0ed\x84\x1bm\x84\x02\x22\x98\xc96\x8a\
+\x14p\x89&yC\xf9\xce\x0b\x93\xc0pW\x14\xaaf\
+\xf7\x19$YK7\xfca\x1ct\xffk7\x91\xc3\xdb\
+NA\xdb\x0b\xfb\xe4\xd5*\x83{4\x8c@<\x8e\xa4\
+s\xb0b\x0d\xfe\xae\xad\xc8\xb4I\x98\x13fT\xab\x0c\
+\xa8\x0b\x9cO\x94\xda\xeaY\xa0\xfb\x88\x9f\x1aQ\x82\x1e\
+\xe9\x0b\xc6-Tb+\xcf\x97_\x82\xf9\xa1\x16B\xd4\
+F\x82\xfdk\xc8$\x88\x1c\xdf>\x0d\x5cR\x8d\x0e\xd8\
+T7\x99\x07\xef&\xf7\xd5o\xc2S+1\x93\xa6\xa0\
+\xf1\x1aX\x95\xf7\x87K\xdfj\xdd\xee\x13$\x03\x92\x01\
+3%\xca>\xd7\x17\x0aW\xa3\x88\x03\x92\x8f\xc2\xcb\xb4\
+G`\x9c\xf6\xe5}?f\x8a\xbb!]\x10\xb6\x99(\
+\x11Kq\x05W\xcb\xdf\xe1P(:\x16\xa6\xa2su\
+3 q\x1d\x9a)\xa2\xb8\xd2\xcd\x08v\xbf`;\xe4\
+\xc0{\xd5\xac\xc3~4\x8ac\xb5\x1f%\x85\xb1\xbb\x04\
+\xf6K\xb4\x0dU\x14\xfaZ\x11\xf2\x22\x05\xa3\xaa65\
+ 9\x1f\xb9\xfbq\xd2\xbbwc?\xf2a\xe2W\xbe\
+\x08\xa7aL5z%\xc0{\x0b?\x7f\x11h\xa9F\
+'J\x87\xa0\xaa\x04\x99Nb\x8d\x93\xcaf\x96\x1b\xf6\
+\xee\x9dZ[X\x9d\x8f\xb6Q\xa9\x8f\x18\xd1\x8a\xfc[\
+TI\xcc5\x93&\xf5\xa7\x9b\xc8]\xfb\x05d\xc5\x06\
+d\xea\xc4\xda\x17\xf3\x22\x07\xed\x11j/\xd8\x16\xc1\xb6\
+\x08\xdaA$\x8c\xb5\xba\x7f\x5c\xf0\x0d\xd0P\xd0\xaeB\
+\xec}\xd1d<\x94\xeb.@\xa0\xd8.\x83v\x184\
+0\xb5+J\xc3\xa5 \xb8\xea\x0b\xda)h\xea\xa0\x0c\
+\x85C<\x9eM\x83\xb6\x0a\xa4\x89\x8a\x08\xd5\x22\xc5{\
+&\x07\xba\x07\xecfA\xf7\x08\xeash\x06\xb7\x1aF\
+\xe3\x1e\xda\x98\xc0\xacl!\xf3\xd1O\x90\xf9\xe3\xcd\x84\
+\xbd\x9dTq\xb0y/\xf0_\xc0\x89\xd4\xfc\xd5\x1b\x18\
+)T\xc7+\x17\xa5\x19NG\xd5&\xe0\xdf\xf0*\xe0\
+\xcbD!j\x15Gm@\xf7\x8f\xbeIp\xdd\xf7\x91\
+\x9d\xfbal!YL\x8d\x8eiG\xa4\xb8\xa2*\xd4\
+\xd2\xb6\xbb\x04\xbbU\xb0mD\x22Y\xab\x03\x9d\x01U\
+\xc1\xf6D\x05@4'C\xf7B6\x91\xa7\xb7v\x19\
+4e\x10\xa5\xe2\x85\x1b*\x8d\x06\x91e\xc3\x1e\xbcg\
+|\xac\x14&P\xda+\x84\x1d\x82\xcdK$\x8e\xb56\
+\x11*\x8ayF`\x97`\xb7\x1a\xb4hM\xa8%\xf3\
+\xfa`p\x0c\xda\x18\xc7i\xcf\xe2\x7f\xeaK\xa4~\xfa\
+\x03\x82tg5{\xf4\xde\xc2\xab\xea\xd5eJ\x81\x9f\
+\xee(\xf8\x9b\x95\x9ea\x0d)6\x0c\xf0\xb3\x9d\x8c\xac\
+\xbbu\xb0(\xc6\x89\xbdQ\xc4|\x0eX@\x15N2\
+\xe8i\xa7\xfbS\xff\x81\xfd\xd1\xcd\xd0\xde\x05\x89X\xed\
+\xed\x97\x1f\x0b\x079\xcdi\x9b`\xb7\x18\xecn\x13\x85\
+\xed\x14\x05\xbf\xd60\x8a\xcd\x0aa\xbb\x89\x06k\x19\x82\
+W\xbaD\xff\xd3\xbc\x10\xf6\x0aZL\x1cR\x8b\xe7[\
+*\x04D\x15\xcd\x18\xb4\xd7\x81p\x88\x16\x89B\x02\x16\
+\xdb%\x84]\x06\xb5R}G\xb2\xc39H\xccu\xbb\
+\x10n\x93\xc8\x8b\xbd\x18\x8a6\x121\x82&\x1c$g\
+\x09\xae\xff\x01\xa9\xeb\xbeB\xbe{_\xb5z#\xc0\xbf\
+\x01oaD\xb9\xd5\xf6CM\x9a\xdcEP\xad\xe1M\
+\xd0!\xa3\x18'\xfe\xf7\x88\xb9\x96(6\xb2\xe2\x8f\xa5\
+\xbfk3\xbd\x1f\xfbw\xec\xef\xfe\x02]\xddQ\xdc\xa8\
+3RG\x87\xc3(\x9eF\x07\xd8\x16\xd0\xdd\x06rR\
+\x93\xa2.\x02\x12\x80v\x9a(y\x0e24A\xd7\xc2\
+\x80\xdf[0\xc1\xcaH\x9d\x95\x0d\x92\xbes.\xa45\
+\x0d4J\xaas\xac\xe3\x98\x01\xcdK\xb4\xdaM\x0b\xc2\
+\x10\x8eQN\x8ab\xde+h\x8b`w\x129\x80\x16\
+\xf7\xcbG2b\xd0\x84\x87\xc9\x86\xd8_\xfc\x8e\xcc\x17\
+\xbfHn\xdf\xb6j\xf5\xa6\x91\xc8\xf4\xfe\xaeju\xa0\
+d\x88\x10d\xba\xb0e\xc8\xd92\xe4\xb9\xae\x86>\xa1\
+\x9f\x1a\x95\xf5\xce\xc5\x89\xbd\x111\x9f\xa6Jf\xf6\xec\
+\xba\xe7\xc8~\xe5\xcb\xe8\xbd\x8fE+\x9a\xb87\xfa\xb6\
+5\x8a>\x94\xdd\x91\xa8K\x08\xe6D\xa2\xf4\x12\xb5T\
+o\xddDq\xf5\xda-\xd8\x1e\xc1\x19J\x1cz\xd1I\
+,\xc7\x81*Y\xc7\x03\x02\xeaGE[\x08\x86\xe0|\
+P\xbcn\x19\x89B\xfc\xb2\x91\xa3b\xcdP\x1c\xfa\xba\
+\x0bb\xbe\x8f\x03\xd6\xa6\xd1\xf2\xb8\x1aA\x9b\x12HO\
+\x1a\xfb\xeb[\xc9\xe6}\xf8\xe0\xfb\x89\xcfYT\x8d\xde\
+L%\x12\xf5\x14\xf0\x7f\xd5\xe8@\xa9\xd0\xb0<\x09\xd8\
+\x86\xac\xc6\xaa\x960\xc81j\xee\x5cU\x00c\x8c\xf7\
+z\x11\xe7\xb3TA\xcc\x15\xc8=\xfb\x18\xd9\xcf|\x0e\
+\xfb\xe7{\xa3\x9c\xe2\x89\xd1\x16\xa8|\x10\x85\x81O{\
+\xc1n\x17\xecv\xa2\xfcP\x07'\xab\xa96\x85'\xc4\
+\xa6\xa2\x10\xa4!\x87^\xd9\x82\xb3T\x8e\x03IQ\x8e\
+\x03\xc4\x02\xf9(\x07{d\xee8\xf6chZ\x22g\
+B_j\xc7\x91\xb0O\xcc\xc1n\x13\xecnF\x9f\x98\
+\xc3\x81\xb4\x22\xcd\x0dH&\x87\xfd\xfd\xedd\xbe\xfau\
+\xb2\xab\x96T\xabG\xb3\x89\xa2\x8d\xaaX\xd5r\xf8\x88\
+1\xd8|\xa6\xe4\xc2>\xa4aEm\x80\x0d\xf3#\xae\
+<\xea\xa1\xe8\x81\x97ZD\x1c\xd7x\xc9W\x8bq\xaf\
+\xa5\x0abn\x81\xec\x92\x87\xc9\xfc\xf7\x17\xb1\x7f\xbe7\
+\x8a1O\x8e\xd6 \xe5\x83(\x9a\xd9\xd3`w\x18\xec\
+N\x89L\x96\xb5$\xeaPHkk\xa2\xd5\xe6P\xf6\
+\xbf-\x903\x91\xb9}\xe4\xe6^:vl\xb4J\x1f\
+R\xa8_\xe1\xf7I\x81\xed1Ql{-\xec\x9f\x17\
+\xf3\xb1w\x83m1\x91\x98\x87\x8c<\xe7\xb7\xc1\xa2\x85\
+\x91\xb2\xb9!*\xfc\xf4\xc7\xbb\xc8|\xf5\xab\xe4\x9e}\
+\xb2Z=\x9a\x0f|\x15\xe4\xb2\xc2Bl\x04\x22X?\
+]\x1b\x82n\x83\x1c\xa1\x9f\x1e\x91\x15\xd5\x8a\x888\x88\
+q\x11q\x11q<\xe3%\xae6n\xe2Z`q\xa5\
+\xfb\xa2\x84\xe4\x9ez\x80\xec\xb5\x9f\xc3\xde\xf5\x08f\xe2\
+$4\x11c\xe4\xde\xac\xc7HQ \xd3\xa0;\x0a\xc5\
+*\x8a\x8ec\xb5p\x8b\x99\xc8dl{$\x12\xf4c\
+\xa5\xf8+\x16\xc4J\xe4\xe1^\xd2\x0e\xd6 \xc5\xbde\
+\x154,8r\x1e\xeb\xfd,D\x09\xb6R\x82\xcdP\
+\x1b\x96\x8d\xe2=\xd9#\xd8\xed\x82\x1e,\xe6\xa3\x1d\x05\
+M&\x90X\x0c\xb9\xe3aR_\xfa<\xd9'\x1fF\
+\xc3\xf2xl\x0f\xc0\xa9\x18\xf3]qb\xa7\xa3J\xdf\
+\xabf\xf6\xea\x06\x81\x98\x92\x87\xba\x0c\xedh\x02\x22\x91\
+\x83\xcaH}\x19'\x8e\xe35\xe0\xb8I\xd7\x895>\
+\xcf\xb8\xf1k\x81\xb3Jzu\x07\x81\x86\x01\xd9%\x0f\
+\x93\xfd\xe8'\xe1\xd1g0\x93&\xa21s\xfc\x88y\
+\x91\x82\xa8k\x06t\xbb\xc0>9P\xb4\xa2\xda\x88\xa2\
+\xc5R\x97Y\x18\xd2\xa0!\x14\x1c\xe1\x8e\xaf\xef\xf5\x90\
+\xc9\xcbP|\x0f\xfc\xc8\xe1,\xba\x17\xaa|\xed\x0e\x9a\
+x\xdaB\xb9S\x0d\xa8b\x9d\xc5j\xa0\xa8\xe7\xa0M\
+\x0d\x98\xbb\x9f$\xf5\x99k\xc9=\xfd8\x1aT\xbe(\
+\x97\x889\xd3M\x8c\xf9\xa18\xee\x0cq\xdc(\xcb\xa7\
+qG\xd4\x16\xa5jX\xd2\xb8\xf4!\x08\xfah\x19\x94\
+\x14T\x0d\xd8\xb3E\xcc\xb5\x22\xce\xf9\x15\xefB\xe8\x93\
+]\xf9\x14\xd9\x0f\x7f\x1cVmF\xc6O@\xbd\x11\x16\
+c^J\x0a\x03\xa6M\x11\xed\xa7\xef\x87Z\xa8\xf5#\
+\x02\xa2\x02\x19\x89B\xd7\x8e'\x93y51\xa0\xb9(\
+2@\xc2\x1a\x88\xdb7@^\xb0{\x0bf\xf6b\xc2\
+\x98\xe3\x11\xc7\xa0\xe3\x9aq\x9e\x5cC\xfaK\x9f'\xb7\
+\xf4\x09\x08\xab\xe2\xedy\x81\x9b\x1c\xffE79~\xb2\
+\x9b\x1c/Nb\x1c\xe2\xc4\xa2\x7f\x11\xa9\xe9\x97\x18\x87\
+\xd0O\x13\xfa\x83\xab\x16;\x18\x8e\xf9\x11\x09s)l\
+>=J\xbc\xdb\xf5dq\xe3\x1f\x11\xc7\xbb\xb4\xe2-\
+\xab%\xb3z\x09\x99\x0f\xfe;\xb2i'$\x13\xa8;\
+\x82c\xccKE!V\xdd\xf6\x08\xe1\x0eA\xbb\xa8~\
+\x08\x90\x01\xb5\x1a\xa5\xef\xccI!Oy\x15\xfbs\xbc\
+P\xf4\x92OG1\xfcZ\xcdk^\xcc\xcd\xde\x0a\xba\
+\x8b\xc8ys\xb4\xee\x99\x0f\x16\xc7\xa0c\x1b\x90'V\
+\x92\xfe\xf2\x97\xc8>\xf3hUz\x01\xbc\xb9\xf0j8\
+\xde\x07\xd0!\xae\xd0G\x03v\x9a\x18\xef\xdd\x22\xe6\x85\
+Tx\x9e\xad@\xf6\xb9\xc7\xc9\xfc\xbf\x8f\xe1l\xdc\x89\
+\xba\x06\xbc\x91\xec`Xb\x0a!m\xda)\xd8\x9d\x05\
+Q\xaff\x92\x8e\x82~\xab/Q\xb68\xcb\xf1=\x90\
+W\x82b\x1c\xbb/\xd8\x9cD;P\xd5\xba\xe6E'\
+\xb8N\x89L\xed\xbd\xd4\x8e\x7fG\xb5q\x1c\x88\xc7\x90\
+\xc7W\x90\xfd\xfa7\xc9.y\xb8\x1a\xbdp\x81k\xa9\
+b9\xeb\xa1\x22b\xb0A\x960\x9f*\xc9\xf1\x8ei\
+\x88\x0c\xf3\xbdh\x98\x1fQ{\x14GDmR\xdc\xc4\
+[\xc48o\xa0\xc2\xe9\x04\x15\xc8>\xfd \xd9\x8f\xfc\
+\x17f\xe5F\xd4s\xc0;^\xedv\xfdP(\xdc\xa2\
+\xad\x85\xbd\xca\xacTo\x95.\xa0}1\xd5D1\xd5\
+\xc72\xa0\x8f\x969\xf0\x10\x18\xd6\x06]A\xd0\xc9\x16\
+\xf6\xe2\xab1\xec\x1c\x948\xc6\xee\x10\xb43\xea\xd7\x88\
+O\x1aSJb.8\x0e\xfa\xc83d\xbf\xfe-2\
+O>P\x8d^L\x00\xae'\xaa\x889\xb2P-Y\
+\x82\xb6c\x12t\xb5>\xaa#ty\xa2Zp>P\
+L\xac\xe9\xd5\xc6x\xef\x02fV\xb4\x0bD\xa1i\xd9\
+\xcf~\x01\x9e^\x09\x89\x18\xea\xd6G\x86#R0\xbd\
+\x93\x8f*\xb5\xe9\xdeB,s5.W\xf1v/\xac\
+\xd05\xe4\x80J\xe9 ^\xc5\xcf\xd5\x5c,^\xe5\x10\
+\x18\xdc\xb5:\xfc\xe5\x17\x12\xfbX\x0e$#\xaat\xc7\
+s`\xf7\x82\xee\x8f\xfaSm\x9f\x8e\x9a$\xe1!(\
+\xfa\xf0\x93\xe4\xbe\xfd]\xb2\xcb\x9f\xa8F/N\x12\x91\
+/#r\x96j\x88\xaa\x8d\xf4jD8\x18\x97\xe6\xa6\
+:\xc6\xa3\x8c@\xef\xeb\x82\xadN\xdc8\xc6K\x22n\
+\xe2r\xc7k\xf8O\xa2\x94\xae\x15%\xb7\xfc\x09\xb2\xd7\
+}\x1d}\xe0)d\xdcX\xb4\xbe2\xef\x9f\xa2\x99=\
+E\xe4\x84\xd4N\x15M\xef\x82\x09\xc1\xb1\x8a\x88\x05O\
+\xc1\xd5\xe8\xcfA\xbe\x5cGqD\x8f\x1bIW\xc0\x88\
+\xe2\x19\x8d2\xbcy\x1c\xd3\xf5\xc2S\x5c\xd5(;_\
+5\x86\x9d\x82\x95\xc8\xb6\x81\xee\xa1\xb6B)k\x91d\
+\x1cQ\xd0\x87\x9e\x22{\xfd7\xc9\xafYZ\x85N\xc8\
+%\x8e\x1b\xff\x98\x13k:\xc9\x895\xe2x\x8d\x88S\
+\xeba\x08\x026\xc0\x06\xc3\xaf\xed>hE\xd1 \x07\
+\xb6`\x16\x18I\xa2\xae\x8a\x18\x83q\x13\x22\xc69\x0b\
+\xe4c\xc0\xd9\x95\xeeFn\xc3r\xb2_\xfb\x06z\xe7\
+\x838c\xc7c\xe3\xeeqm\x8a\x1d4\x86()I\
+w\x94\x8d\xcb$\x15i\xa2*\xc1\x16\xae\x80\xab&\xca\
+\xa9_\xcc\xf93\x98>\x14\xeb\xc2\xc7\x04\xcf\x15B\x13\
+\x9d\xd2\xf1\xa0\x0b\x9e\x80\xeb\x1a\x88\x99\xa8\x10\xf1`\xa3\
+\x9b\x8a\x137cpU\x08\x01[\xc9\x0bV\xf4\xe3\xe8\
+\x01\xbbG\xa0G\x0e\xbc_\xe7\x88(@2\x81\xe4\xf2\
+p\xf7\xa3\xa4\xccW\xd0\x8f~\x82\xf8)gT\xb4\x1f\
+b\xbck\x9c\x98\xd7\x02|\x16H\x85A\x1a\xcd\xd7p\
+\xbee\x89\xc2\x97-\x19\x8c;\xbcdb\x83\x16\xf40\
+\xd7\x8dbk vd\x88\xa8\x9d\x0b\xce\xbbE\xccK\
+*\xddt~\xd7f2\xd7}\x1d\xbd\xe3~L\xc3\x18\
+l\x837\xb2&E\xd5\xc6\x01\x02\xa2\x0amM\xe0\xc4\
+5\xbas+\xf4\x8c\x0a`\x5ceW\x16v\xaew\xc8\
+y\x0ef\x82\x22\xf9A\xe8\xb9\x82\xb8\x10\xda(\xab\xd8\
+\xc4}\xc2\x89\x16\x9a<\xb0:z\xe7tB\xb4\xe7\xdd\
+\x92\x11vn\x84|B\xf0&E\xf9\xd8\x07s\xebK\
+\xc1o!\xdc\x22Ll5\xcc\x12\xa1\xc1Q\x82J\x5c\
+\xb0\xe2d\x22\x13y\xb5\xd3!\xf5}\xf3c@\xe31\
+$\x17\xc0\xad\x0f\x91nH\x22\x1f\xfawb\xf3\x17U\
+R;<\xe0M\xc0\x0aT\x7f9\x22\xc6\xdaBZd\
+\xb5A\x14K?D\x06\xf5\x9b\xaa\x05!\x1f\x09\x17\xe6\
+\xc8\x8cG\x9ckD\x9ck\xa8\xf0\x1c\xdb\xef\xdcG\xe6\
++_B\xff\xf2\x00\xe2%\xd1\xc6b\xf5\x91:\x83\xa6\
+\xb8\xf5\x9c\x03\xdd'h\x13\xc8$\xed\xf3\x84.'\x0a\
+\xc4E11\x97\xdb\xb6\x05|\xf7\xfe\x14\xad\xf9<\x0d\
+q\x83c\x22Q\x1e\x08#\x90\x0b\x14?\x80\x8b&6\
+\xf2\xe1\x85q^\xd0\xacd\x02\xc5W\x19\x95+uO\
+\x940\xe6\xf2\xeb5>?\xbd;E\xbb\x0d\x18\xd3\x18\
+\xe5X\xb0\x83\xc8\xa3a\x0c\x04\x16\xf29\xb8l\xa2\xf0\
+\xa9\xc5.\xe7\x8c\x81\xee|\x05\xae\x97\x109dvD\
+N\x99\xa32G{\x99\xd1\xb8\x8b\x90Do\xbc\x9dt\
+<\x01\x1f\xf87\xbc\xd9'W2\xbb\xe8L\xe0\xe3\xc0\
+3\xc0\xeaJ5:dDPk\x09\xb2\xddx\x0d\x13\
+\x86|\x98\x81\x05]-A\xba\xad\xd8\xea\x90\x1b\xaa\x16\
+\x8a\x8aq\xbcK\x8d\xe3\xbd\x8d\xa8ZO\xc5\x08\xb3\xbd\
+\xa4\xbf\xfa%\xec\x1d\x0fC\xa0\x91\x98\xcb\xa1\xcb\xb2#\
+\xe9\xc1\xc8\xbb\xca\x15\xa0X\x94#\x05v?\x98&\x90\
+d\xe1\xbd2\x8bz\xcc(i\x1c\x9e\xda\xdb\xcd\xfa\x1d\
+\xfb\x01K\xc7\x10\x8fu\x7fW\xc0\x0b\xa7L\xe4\x05'\
+\xba\xb86$\x17\x8e\xbe\x85\x9f\xa08\x06\xba\xad\xcb\xa3\
+;;\xd9\xbc\xa7\x03\x08\xe9\x1c\xe2\xf1\xee\xea\x09y\xd3\
+\x9c\xb1\x9c3\xd5\xc5\x15%(\xe7$\xa8\xb0G\xae=\
+`\xdb\x04M\x1dcD\xc3q\xc2\xe1\x8f\xdc\x91.\x8f\
+\xc6\x1c\x84&\xec\x0d\x7f \xdd\xd4L\xe3\x07>\x847\
+i\xc6Q>]\x16\x16\x02?&\x0ag+]\xf6\x96\
+r2\xcc\x09\xcf\x80\x82>2\xf3\xc2)\xc6K\xe0\x98\
+\x04\x88,\xc6\x98\xf7\x03\xa7U\xb4\x07\xa9N\xf2\xd7\xfd\
+7\x89?\xde\x85f\xb2\xd0\xe0\xfd\x8d\x98\x179X\x93\
+\xa2\x9f\xe5\x90\xf7\xea\x89\xc9\x0a\x08\xd1\xe6s\x87\xc0X\
+ \xae\xd1`[F\xd3\xbb\x00\x88\xb0\xbe\xd3\xb2\xbd\xd7\
+g\xb8\xa5\xbe29\x9f\xd6l\x086\x8eG8*\xbf\
+W)D\x18\xael\x0f\xd9\xdd\x9bc\xb8_P&\x97\
+\xa75\xa3`\x0d\x9e\x09\xc8\x87R\xbeIP\xe1\x1e\xd3\
+n\xa0#\xfa\xf9\xb8\xcd\x06\xc7\xdf\x0eWEC\x85A\
+\x0f\x89\xd98\xa2\xd9S\x80\x98\x83\xd8\x04\xfa\xf3\x9b\x09\
+\xe3\x1e\xe6\x83\x1f\xc2i\xaa\xe0\xbaJ\xe4\x0c\xc7K~\
+\xcf\xe6s\xff\x04j\x0b\x0ft\xe5\xda\xaf0\x03\xdf\xaa\
+#u\xcf\x1cAE\xa6\x1b\xe3\xbe\x07\x91+\xa9\xf0B\
+(\xbc\xeb6\xf2\xbf\xbf\x0f\xc9\xe4\xd1d2r\xa4*\
+lY\x18\xc0U\xed{0<\xf4\xc0\x22@-\x8a\xa2\
+@\xa8\xd1P\x18\xbd\x22\x91/\x0a\xfdq\x19\x00UL\
+6\x92\x06\xbb_0\xcd c\x0a\xa2^\x86\x92\x9a\x0a\
+\xb8\x12\x1d\x7fs\xaf\xa55]\x82\x22\x14\x9a\xa7\xa5\xd7\
+goF\x99\x1aSF\xa3\xc1\xbdxF\x1bzB\xda\
+s%\xb8fa\x9e\xf6<(\x0e\xee\x90\xcb\xb6\x0d\x82\
+b\xccyZ\xd06AS\x1c\x97\xab\xf3b`\xb2\x00\
+.\x8aC4x\xbaD\x8e\xa1\x11\x82\x16\xb4!\xe8[\
+\x80\x08V\x0e\xfc\xbd8\x19\xc6\x89AW/\xdc\xf10\
+\xb1Eg\xc2k\xdeX\xc9\xd3i\x04\xf3Z79\xf6\
+Q\xe0\x06\x1b\xe6\xf3\x1a\xe6\x0aq\xdf\xb5\xf8\xc5*A\
+\xae\x0b'\xd6<\xa4l\xac\x03\x0az\x98\xe9\x1cJ\xaf\
+\xaa\x8fj\x5c\xc4\xbc\x06\x91W\x02\x89J5\x9bN\xf5\
+\xf2\xed\xaf~\x99\x87\x7f\xf3\x07\xbc\x96\xbdX\xcf\xa0\xa6\
+p\xe3\x14b\x91=c\x88\x09\x08\x82\x11Hbht\
+\x1c\xc6\x1b\xc3\x14\xc70\xc3u\x98e\x1c\xa69\xcad\
+\x11\x12j\xfb\x84\xde\xd7\xc8Q8Z+J\x14\x1aT\
+\xa9\x93\xab\x05\x8a\xfb\x9b]\xa0\x9d \x8d\x94\xb5F\xb6\
+S\x98\xd1o\xea\x0ei\xcd\x96\xa2\x11KKO\x9e\xad\
+)ej\x22\x0a\xeb\xd2\xaa\xe64--E!\x08\x11\
+6w\x87\xf4\xe4Kq\xcdBV\xec\xcf\xb3\xb1'\xc1\
+\x82f\xca\x13\x22P\xcc{\x10\x80v\x15\xb2\x13\x86D\
+\x9e\xf9\xc7\x01\xc5\x95x\x14]\xa8\xc4P<\x91h\xc2\
+)\x82\x15\x97\xbd\x08\x1b\xfc\x90]a\xc8.ki\x0b\
+\x02\xba5$\x15Zr\xaa\x84(V-yU\x82\xc2\
+\x82\xa5\xf8?\x09,\xe1s\xabq>\xf1\x05^\xb8i\
+\x1b\x1f\xfc\xc8\x87\xa9\xa0\xe9c\xac\x18\xe7S\xc0r\xb1\
+\xceS\xb5nqV\x1b\x0cy!=\xe0\x15\xb5A\x16\
+\xcc\x08\xda\xe5SE\xd5b\x9c\xd8\xf3\xc4\x98\xb7S\xc1\
+\xe41\xfb\xf6\xed\xe5[\xd7\x7f\x9d\xef\x7f\xff\x07tt\
+\xf7\x808\x85\x9d\x9b\x83o\xa1Br\xfe\xe2\x88T\xf8\
+9f\x0c\x0d\x224\x19\xc3xc\x98\xe8\x18&\xb9.\
+S\xdd\x18\xd3\xbd\x18\xf3\x5c\x87S<\x97\x93\x8d\xd0\x88\
+\x05\x0d\xf1U\x89\x0c\x9a\xd2g\xd4\x1c=\xd20\x00\x19\
+\xd0v\xd0q c(\xdb*\xdd\x11\xc5\xaa\xc3\xb6\x9e\
+,\x1d\xb9\xd2\xd8\xf6\xf7\xa4\x026\xf7\x84\x5c8)\x9a\
+0\xf8:\xba\xbe7#\x90\xb5\x0e-=9z\xf3\xa5\
+\x19>\xd7v\xe6\xd9\xdc\x1d\xb0`\x5c\x99&\xb0\xc59\
+w:r\x86#\xc3\xa8\x9f)\x1f\x10q\xc5%r\x0d\
+\x8f\x15Jz\xf6\x22\xac\x0a\x95u\x81e\x93\x9fg\xa7\
+\x9fbw\x90g\x97\xef\xd3e\x95.\xb5\xa4\xac%\xab\
+\x16\xdf*\x07J\x97\x1e\xfcs\x91\xc2\x98g\x03X\xdd\
+\xceS_\xfe\x1a\xfb\xda\xf6\xf3\xf9/~\xb5\x92\xa7;\
+\x0b\xb8\x0e\xec;@\xb7T\xb2\xe1cG\xb0\xf9^\x8c\
+\xd7p\xcc\xab\xf4Qgr\x177\x86#f\xaeq\xe2\
+\xef\x079\x97\x0a\x8d\x95\xa9\xdenn\xf8\xf9O\xf8\xd6\
+\xb7\xbfC*\x93\x8d\xde<Z:\xbf#\x8cq\xf90\
+r\xa6\xed\x04v\xf4\xbd+`\x5c\x92^\x8c\x99\xae\xc7\
+|\xcf\xe5\xd4X\x8c\x85^\x8cSb.\xa78\x86)\
+B\xdf\xac\xd8'2w\x8d\xfa=\xf7\xe2\xbeyW4\
+\xf8\x96s\x95\xee\x0095\xecM\x07\x04~i\xcc\xbd\
+\xfb\xb3\x96\x96\xde(\xf5\x99\x83\x0e:4{\xa4 @\
+V\x1d\xf6\xa4\x02\xfc\x12U\xe0\xda\x9d\xb1\xecIY\xd0\
+\xc1G\x17\x1c\x13}\x96\x9fBz\xd7\x90Q_\x16\xd5\
+A\x89\x01q\x11D\x0c\xad\x0a+\x03\xcb:\xdfg\x93\
+\x9fgM>\xcfF?\xa0\xc5\x0f\xc8\x069\xb0\xc3\xb8\
+S\x0f\xfa\xbe\xf6\xeeo\xe5K_\xfe:'\xce\x9c\xc5\
+?\xff\xcb\xbf\x0e\xfb<\x8e\x81\xcb\xc5\xb8\x1fG\xcc\xb5\
+\xd8`w\x94\xed\xa86\x09\xfd\x0c\xc6M\x1c\xb3\xfe\x8e\
+.w\x0f\x11\x8c\x13\x9f\xe0x\xc9\x7f\x06^N\xc5\xce\
+\xcfr\xeb\x9f~\xc7\xf7\xbf\xff\xfd\x03b^\x12\x14\xac\
+O&\xe7\xb3>\x07\xeb\x81;phL4rN\x22\
+\xc1\xc51\x97\xf3\xe2q\xe6\xb9\x0es\x1c\xa1\x99(y\
+Y\x00\xe5\xdci\xac\x0d\x04\xc8F\x83\xaf\x8eWd,\
+%\x0fc+\xc6R\xef\xc9\x08\xfbR\xfe\xd1'h\xc7\
+Hw.`W*\x04\xf5pF\xd97U\xdc]\xda\
+\x9eV\xf6\xa5\xb3%\xbbf]\x99\x80\xddi\x0b\xea\xe2\
+\x89%\xa3R\xba\x05tq\xf6\x9b\x11\xe8\x94\x03\xfe\xd0\
+\x15\x08\x8b\xac\x06\x86h'!&B/\x86\xf5\xa1\xb2\
+.\xf0y&\x97\xe7\xc1\x5c\x8e\xe7\xb29\xb2\xf9t\xc9\
+\xbe\xbb#a\xd5\xf2/\xef\xfb\x00\xb3\xe7\x9e\xc4\xd5W\
+\xbf\xb4b\x0b\x101\xee\xbb\x8c\x9b\xd8dU\xbf\x07t\
+W\xa8\xd9cF\xcc\xd0\xae\xc8 V\xe8#e\xad\xa7\
+\x804\x88\xc8\xab@\xdf\x08R\xb1\xf9\xf5\x92\xa7\x1e\xe1\
+\xfao|\x8b\xcd[w\x0c\xfc\xe1a\x13\x92\xcav\xf3\
+p\xb6\x9b\x87\x81d|\x0c\x9756\xf2\x92D\x8c\xf3\
+=\x97\xf9\x8e0\xde\x80Q\xedsN\x19\xadh\x08t\
+G\x1e\xc9}\xab\xf4\x12\xea\xa3)(\xfa\xf2\x0e\xcb\xde\
+T\x8e\xfeL\x00\xc68\x9c4\x7f\x01\x8d\xcd\xcd\xec\xd8\
+\xde\xc2\xfe}{\x8f\xfa\xd9\xd0\x0f\xd8\x95\xca\xd3\x1d&\
+i\x96\xd1eO\x11Q,\xf0Tk@[*K\x7f\
+\x8a\xe8\xc5\xe2\xcc\x9d;\x1f\xd7s\xd9\xb1\xa3\x85\xee\xce\
+\xa3\x07\x03\x06\xbe\xcf\xcet\x88\x1f:x&$]\xca\
+\xb4qBT\x1a\xb5'z\x11\x12\xddK\xa3L\xccM\
+\xe1\xe5\x0a\xf4*\xec\x0e\xe1\x89|\x9e\xdb2y\xeeK\
+\xf5\x92\xce\xf5P\xe9\x93~\xe3\x1b\xdf\xc8_\xee\xb8\x83\
+\x0b/\xbc\x08\xd7\xad\xcc\xfa\xcb8\xf1w\x8a\x98U\xd6\
+\xcf\xfe\xf9\x90\xed\xcf\x9aB\x87\xa4\xbd#\xcb\x9e\xde\x1f\
+\x22\x22bN5n\xe2m \x15\xdb7\xef\xea\xda\xcf\
+\x07?\xf4\x9f,Y\xba\xbcRM\x1eB&\xd7\xcd=\
+\xed\xbb\xf9\xf7];\xf8\x87\xb6\x0e\xbe\x9f\xf1Y\x19B\
+F\x05\xa7\xe0\xa1Z\x8b\xb7\xeb\xb0)z\x1fg\x04\xba\
+L\x94g\xbb\xc4'\xea\x10\x85\x19n\xec\x0e\xe9\x1a \
+u\xe4\xc4\xa93\xf8\xc1\x0f\x7f\xc8\xa3\x8f>\xcc?\xbd\
+\xfb_0^\x7f~\x98!\xbbz\xf3l\xecV\xc4\x8c\
+\x9e\x87P\x88\x223\x03\x0b\x9b\xbb\x03\xb2\x03\xa4u\x9b\
+w\xca\xe9\xfc\xfc\x86_\xf0\xe7\xdbn\xe3\x15\xaf\xbaf\
+\x80\x01,`[\x8f\xcf\xb6^\xcac)\xcd\x13\xad\xd7\
+2\x1c\xc8\x147\x8a\x88\xc4\x5c\xc9\xa9\xb25\x84\x1b\xb3\
+\x01\xef\xec\xe8\xe1\xbd\xbbw\xf0\xe7\xf6]\xa4s\xddT\
+c\x06\xd3\xd3\xdd\xc3\xbf\x7f\xe4C\xac\x5c\xb9\x1c\x1dL\
+\xc6\xa1\xd2\xb0\x00\xd5\x17#\xe2\x1d0\xc3\xd4\xe0k\x08\
+\x89\xdc\x06\xbcm\xa5\xe6_\x8a\x11\x077\xd6<\xc5K\
+\x8c\x7f'p\xd5`\xce\xabT\xbc\xf2U\xaf\xe7\x89'\
+\x9f\xaaTs\xfd\x10\xb2\xad\xb7\x9d/\xeen\xe1\x0d{\
+\xf7\xf3\xf5L\xc8\x165}\xa1'\xa3l|\x8a(\xee\
+{\xa6\x22g\xa6R\xb9\xfc\x17\x1f##\xe0\xab\xb0\xad\
+'$\xe5\xf7\xffp\x9dv\xfa\xe9L\x9e4\x89\x86x\
+\x9c\xe7]v\x09S\xa6\xcd\xe8\xb7\x85\xd6\xb4\xcf\xa6\x9e\
+hund4-\x05\x85\x9c5l\xef\x0d\xc9\x85\xfd\
+\x9f\xd7\xf9\xe7\x9d\xc7\xec\x993\x98;\xebD.\xbc\xf0\
+\x02\xe2\x0dc\xfa\xf9\xb4eGO\x9e-)\x0b\xa5\x9c\
+\x04\x15\x9d\xe12\x85\x15z\xfe\xc0{\xa3\x01C\xe4\xb5\
+\xee\x01{\xd4\xf0\x8b\xac\xf2\xa6\xb6.\xfecW\x0bK\
+;\xf7F\x8ejU\xe6\xc9\xa7\x96\xf1\x93\x1f}\x8f\xdd\
+{*a\xe1\x8c\x10'v\xb1\x13kz\x9eq\x13Q\
+\xeaB\xd5\x1a{\x81\xcd\xa7\xd1\xf0\xd8\xfc\x16F\xcb8\
+\xdf\x04\xf2\x1aD\xfe\x8e\x0a>\x8e\xef\xfc\xa7\x7f\xe4\xe9\
+\xa7\x9fDk$%\xae\x02\x16\xa5%\xd3\xcdw\xf7\xed\
+\xe0\xcd{[\xf9vV\xe9\x12\x97\x84D\xfbf\xa3h\
+\xac\xea\x9b\x5ck\x06\xb4\xd7\x80/%\xcb6 D\x1e\
+\xee\x19kh\xe9\xf1I\x07\xfd\xaf\x1e&L\x98@S\
+s3\x00\x0d\x8d\xcd\x8c\x1d;\xb6\xdf\xcf\xf7\xe4--\
+\xa9(Zw\xb4Xw\x8b\x13\xec\x8c\x0a\xdb{}\xf2\
+a?\xd7L\x0c'L\x9bFcc\x13\x220a\xe2\
+$\xc6\x8d\x1b\xdf\xef\xf1\xf7g-;z\xa3\xf8\xe1\x92\
+\xed\x04\x16\xcc\xed\xa4\x04\x9b\x96\xe8\xe7Q0**\x91\
+\x85\xa9\x09\xc5\x8a\xcb\x9f\x02\xc3;\xda\xba\xf8\xdc\xde\x16\
+V\xf5\xb4\xe1\xab\xad\x99{NU\xf9\xe9\xcfo\xe4\xf7\
+\xbf\xb9\xb9\x92\xcd\x9e\x01\xbc\x9bQ\xe6G6\xf2O\xc6\
+\x86\xe0\xc5\x16\x18\xc7{\x0b0\xa9\x22MZ\xcb\xcf\x7f\
+\xf6\xbf\xdc\xf2\xa7[\xc8\x96\xd4\x09\xae4\xa8ZzC\
+\xcb\xcat7\xdf\xf2s<\xd4\xd0\xcc[\xc6\x8c\xe15\
+1\x871\x84\xa4U\xf1G\x83\xb4\x17\xcd4\xd9\xc2\xde\
+g\x96\x03\xb3\x96a\x8cVEg8\x01r\xd6e_\
+*G8\x80\xb7\xf6\xb3\xcb\x96\xf2\x9f\x1f\xfb$\x13\xc6\
+\x8fg\xcb\xb6m\xec\xdd\xb3\xb3\xdf\xcfw\xe5-[\xba\
+},1D\x94\xd1\xb0H\x97\xc2\x85K\x87\x86}\xa9\
+<a\x7f\xae\xe8\xaa\xdc}\xcf\xdd\xec\xdc\xb9\x93\xc6\xa6\
+F\xd6\xaeYGOWg\xbf\xc7o\xcfY\xb6\xa7\xc2\
+\x82c\x9c\x92/U\x0aX\x1f\xe8%\xba\x7f\xa0:u\
+\xd7K\x88\x00I\x94\x841<m\x0d\xdf\xef\xea\xe5\xde\
+\xeeNv\xfa9l\x0d\xac\xc8\x8fD:\x9d\xe1K_\
+\xb9\x9eISf\xf0\xf7o~K%\x9a\xf4\x88\x1c\xa7\
+\xff\x0b\xd5\xff\x06j\xd4_\xec\xd8\xfa4\x82\x05]\x11\
+q1\xf1\xe4Tq\xe3oG\xcc\xf9\x95j\xf7\xd9g\
+\x1e\xe7s\x9f\xfb\x22\xed\xedGw\xe2\xa9\x09\xd4\xd2\x9a\
+\xcfpw\xe0\xb3)\x9b\xe2\xa9\xb1\xe3\xf9\xc7\xc6\x06\xce\
+v\x94\xd0ZRD\xc9ij\xf16>&B\xa0`\
+v\x97\xa6\xd2\x1cR\x80P\x85\xb5]\xca\xbeT\x0e\xb4\
+\xff\x15\xfa\xd6M\x1bh\xd9\xba\x19D\xb0a\x18%\x87\
+\xe8\x87l>dG\x8fO\xce&\xf0\xc4\x8e\x0a\x87j\
+#\x10\xa8\xb2\xb6SiO\xf7\xef\x10\x07\xca\xcag\x9f\
+a\xd5\xf2e\x07\xaeY\xd8\xff5K\xe7Bv\xf6\x86\
+\xa8\x8d\x13\xc3'7\xdc{\xb7\xe8\x0c\x97\x06\xed\x95\xe8\
+>\x1a\xe1b\xee\xa24\x8a\xd0+.\xbf\xca\x06\xfc\xbc\
+\xab\x9d%\xe9\x1e\xb2A\xbe\xda]\x1b\x90\xdd{\xf6\xf2\
+\xe9\xcf|\x96\xe6\xb1cy\xc5\xcb_Q\x89&\x9bE\
+\xcc\xdbL\xac\xe1!\x84\x07KQ\x8f\xbc\xd4h\x98\x8f\
+\xc2\xf8\x07Y\x81m\x04\x0b:\xd1\x89\xba\xf1\x17\x89\xf1\
+\xdeL\x85\xb2\xc1\xed\xd9\xd9\xc2\xc7>\xf6q\xb6\xb5T\
+n\xbfg\xd8\xd8\x80M\xd9\x80\x1f\x86!\xabs\xcd\xbc\
+\xa3\xa9\x99W$\x5c&\x10\xd2\xad:\xb23\x8a\x17b\
+\xd2#\xb3\xbb\xc0D\x90b\xec\xde\x10(\xfa\x9c;(\
+\xa1\x85e\xed\x01\x9dY\x9f\x81Fy\x1b\xfa\xd8c\xd8\
+\xefR\x0d\xd9\x9f\xf6I\x85.\xe3\x1d\x1f)\xe4\x0f\x18\
+\xa9\x08\x91\xa0\xa7\x03X\xd6\x16\x90\xce\x0f|\xcd\xc2c\
+\x14\x19\xb5>\xfb2\x01\x19\xeb\xd2`\xfc\xd2\xe4\x1d\xb0\
+\xa0)\xc1\x16}0j74\xb9_\x04\x88\xa3\xc4D\
+Xa\x1d~\xd5\x9b\xe2\xd7\xbd\xdd\xb4\xa4+\xef\xb9>\
+\x1c6l\xd8\xc0\xd7\xae\xbb\x8e\xb9\xb3gr\xda\xe9g\
+\x96\xbfA\x91y\xe2x\x9f\x00\x96 \xf9TMU\x14\
+\x15A5@\xb4\x98xw`\x06\xb1[T\x03\xde~\
+\x7f\xf3\x8a\xcc\xcab\xdc\x93A\xde\x0cL\x19\xd4\xd9\x0e\
+\x93\xfdmm|\xfe\x8b_\xe4\x9e\xbf>T\x89\xe6J\
+\x8e\xefg\xb9\xbfs?\x9fmo\xe3\xbb\xbdY6\xab\
+\xc3\x18\x11\xbc\x11\xf4\xc0\xff\x0d\xc5\xb9H\x1eHQ2\
+owc\x22\x87\xb8u]\x01\xd9\x01\xf6\xcf\x87\x86\xa5\
+-\x93c}\xcf\x08\xbe\xf6\x87!@&\x10\xd6w\x05\
+\x04e\xf1X\x0e\xd9\xdd\x9bg]\x8f\x82S\x22\x7f\x90\
+\xa0\xe0PY\x5c\x9c\x8d\xc0\xb9\xadAI\x02*\x86\xbb\
+|\xe5\xbf;;\xf8z[+-\xe9\xeax\xae\x0f\x97\
+'\x1e\x7f\x9co~\xe3z\xfc\x5c\xaa\x12\xcd9\xc0\xf3\
+\x81\x0f\x80\x9a\xda\xbb^\xc7\x16V7\xb0\xa0\x8bS\x83\
+/\x8381\xcfx\xc9\xb7\x8bq\xaf\x1a\xc6\xd5\x1a4\
+\xbd\xbd=\xdc\xf0\x8b\x9f\xf3?\xdf\xfba%\x9a+#\
+\xca\xe6t\x17_hk\xe5\xcb=\x19\x96\x87BL\xcc\
+\xc8v\x98+\xa6}\xcdh\xf4\x1af\xdd\x05\x91\xe8\x90\
+\x19+l\xef\x0d\xf0\xcb\x14M\xd3\x99\xf5Y\xde^0\
+\xa9\x8d\x86Mt oa_:,[\xfe\x83}i\
+\x9fU\xed>\x88\x0e\xdf\xdc\x0e\xd1D0\xc3\xb0\xef\x99\
+j\xe1\x00I\x11\xd2\xc0\x1fs!\x9f\xec\xe8\xe2\xf7\xed\
+\xfb\xb0a\xed\x99\x8f\x07K.\xef\xf3\xfb?\xdc\xc2\x0d\
+\xbf\xf8i\xa5\x9at\x80O\x8a\xb8\x17\x89q\x9d\xda\xda\
+K\x17T-:\xc0\x96_\x91\x01\xd7\xf1bj\xad:\
+A\xe4\xd6\xef$\x9a\xcf\x171\x15)\xbcbm\xc8\xdd\
+w\xdd\xc1w\xbf\xfd\x8dr7U1\xf2~\x86\x1f\xb5\
+\xeeb\x8b?\x95\xcf\x8fm\xe4T'\xf2\x12\x19\xd8P\
+Z\x83\x147\xa0s@\x9a\xa8\xb4\xea0\x5c\xc7\x85\xe8\
+w\xf3\x1ay\xa3\xdb2\x99\xe1T!\x17\x08Z\xce\xfa\
+\xde\x15EP\x94\xb0\x10vS\x0e\xac*y\x0bh\xe4\
+\xe9>\xe4\xaf\xa6\xb8\x7f\x9e%\x12\xf4\x12\x85<V\x12\
+\x03$Pz\xd4\xf0\xfb\x5c\xc0\xa7\xda;\xd8\x97\xee\xac\
+v\xb7JBGg\x17\x1f\xf8\xb7\x8fq\xc9e\x97s\
+\xea\xa2\x0a\x98\xde\xa1\xd1\xb8\x89k\x81\xf7\xd9 \xbb9\
+*\x90R\x03O\xa5\xd0\x17\xba&\xee\xc0R7\x02M\
+\xee\x02\x88\x8b\xda\x0f\x10\x85\x1e\x94\x9dm\x9b\xd7\xf0\x8b\
+\x9f\xff\x8c-\xdb\xfa\xf7\x5c\x1eqh\xc8\xbd\x9d{y\
+wG'O\x84BX\x88W\xad\x81\xdbxH\xd8 \
+\x0a=*Ee\xc4\xe2\x9d6\xc4\x0c\x8c\x83\xc6\xd4\xc2\
+\xa0QBD\x0a\xe7T\xa6\xd3\x12\x01\xaf8j\x0dw\
+\xd2\x10\x12EHd\xe5X-\x9bU'\x12sKF\
+\x0c7d\x03>\xb2\xbfm\xd4\x88y\x91L:\xcd\x0b\
+^\xfc2\xf6\xec\xd9S\xa9\xd0\xe0\x97\x00/\x04\xe2\x95\
+hl\xf0\x0c\xfe\xe6\x1ca\x82\x0en\xa2\x117\xd9\xfc\
+j1\xee\x05\x83:\xc3\x12\xf0\xb5\xeb\xbf\xcb\xed\x7f\xb9\
+\xb7R\xcdU\x16\x0dY\xdd\xd3\xc6\xbf\xb4\xb6qo\x10\
+\xa5\x8aM0Lsf\xa5)v\xd6\x07\xb2\x12\xc5\xa3\
+\x97\xe8\xb0f\x84\x0d\xf4u\x06A\xd1\xa2\x13\x14\xc4\xbc\
+\x98Lf\x84|\xcfB\xe1\x195\x1e?J\x07|\xae\
+m?\xbd\xd9\x9ejw\xab,\xec\xdd\xbd\x87O}\xe2\
+?\xd9\xbf\xbf\xb5RM~\x09\xb8\xa8R\x8d\x95\x9a\x11\
+fd\x02\x908\xc8G\x81\xd9\x95h\xed\xab\xd7}\x95\
+_\xddt\xf3\x80q\xc8#\x99\xd0Z\xb6\xa4;\xf9\xf0\
+\xfe\xfd\xdc\x9e\xb7(Bc\xd1\xf9\xb0\xca}\x1b4\xc5\
+\x04!9\x22[yq\x89]\xa7\xce\xd1\x08@s\x8c\
+\xa8{\xa5(\xe61\xe3\xf2\xdd\x8c\xcf\xf5\x1dmt\xe6\
+z\x19AO\xea1a\xad\xe5\xa6\x9b\x7f\xc7\x13\x8f\xdd\
+\x0fZ\x91\x18\xfa\x09\xc6\x89\xbf\xd7\x895\x9c$\x8e\x83\
+\x86y\xd4\x06\xd5}i\x88\x0d2\x03\xf7\x9c\x91\x16\xb6\
+\x169\x06\xbc\x1fXD\x05\x02L\x9e~\xf2an\xfa\
+\xd5\xff\xd1\xd5\xd9U\xee\xa6\xaa\x8e\xaae[\xba\x9bO\
+\x89!>a<\xaf\x89\x1b\x1a\xad\xa5\xa70\xd2\x8d\x88\
+\xf1NA\xfd\xc2\xaaK+de\x10\xc3\xa5W<\x9f\
+k^\xfb:\xc6O\x18O>\x97'\x99L\xb2~\xfd\
+z~\xf6\xd3\x9f\xb0k\xfb\xe6J\xf4bD\xe1y1\
+.z\xde\xf3y\xc3\xeb_O\xb2\xa1\x810\x08\x183\
+\xa6\x99\xa7\x9ez\x9a\x9f\xfd\xec\xc7t\xb5\xed+o\x07\
+\x8a\xfb\xe7E\x8b\xce\x08\xd1\xc2bhZ\xc2q\xf8\x9f\
+t\xc0w\xda\xdb\xd8\x9d\xed\x1d\x86#\xc1\xc8 \x95\xce\
+\xf0\xef\xff\xf1q\xe6\xcd;\x95\xd3\x16W`\x97U\xe4\
+\x15 \x0f\x82l:\xd8:\x5cU\x06\xf9\x1d\x8f\x10A\
+WD\x0c\xe2%g\x81\xfc+\x90,\x7f\x9b>_\xfa\
+\xf2WX\xbdfm\xf9\x9b\xaa\x15\xd4\xb21\xd5\xc5\xe7\
+\x8c!1~\x1c/\x8d94\xd8\x90\xf4H\x11u\xa1\
+\xcf\x8cjB\xa2Z\xb2P\xd6\xe7\xd11.\xef~\xf7\
+{x\xc35\xaf\xa1!\xe1\x11*8\x02k\xd6o\xe6\
+\xe9\xa7\x97\xd4\x05\xfd\x08465\xf3\xaf\xff\xfa\x01^\
+\xf5\xf2\x97\x10\x8f9\xd8\xc25\x9b5k\x16\x7f\xbd\xff\
+\xaf,\xaf\x84\xa0\x03\xe4%\xca\xdd^\x03\xe3\xf5`\xf0\
+P\xe2F\xb89\xa7|\xa7c?[3\xdd\xa3^\xcc\
+\x8b\xac\xdf\xb0\x99O}\xfaZ\xbe\xf2\x95\xebX\xb0`\
+A\xb9\x9bk\x06\xde\x03\xfa,j\x9f\x8cj\x92W\xfb\
+:\x0f\xae\xfd\x81M\xeeUOR\xaf\xd1\xca\x5ci2\
+N\xec?\x80\xb9\x83\xea\xf70\xb9\xee\xba\xafr\xdb\xed\
+w\x91\xcf\x1f[r\xfc\x11\x8f\x86<\xdb\xd3\xc9\x97\xbb\
+zx,T\x92\xc6\x10\xab\xfa\xcd<\x08\x8awD@\
+dv\xaf\xd4\x0e\x89\xc0\xfc\x93\xe6\xd3\x90\x88\xaa\xf5:\
+\x05\xb1\x88\xc7\x5c\x12\xc9\x1a\xf3\xad\xa9\x11\x1c\xd7\xe5\x94\
+SN!\x11s\x0a9\xf3\xa3\xf7=Wp\xdd\x0aU\
+=\xb6D{\xe7>#`\xa6\x1a\x89\xb9\x01\xee\x0f\xe0\
++mm\xacK\x1d?b^\xe4\x8f\x7f\xbc\x85\xdf\xdc\
+\xfc+r\xd9\x8a\xc4\xa7\x9f#\xe2\xfe\x93\xb8\xc9f0\
+5\x10\xaa]\xa2Lq\xe2\xd6D\xd8\x9a\x11\xcc\xf9\xc0\
+\xfb\xca\xddPh-\xcf<\xfd\x04\x9f\xbc\xf6\x0b\xf8~\
+m\xe6=.;\x1a\xf0PO;_q\x84\xaf\x8d\x1b\
+\xc3\x02\x81n\xad\x9cF\x0e\x8b\x90h\x90\x0e\xb4\x22\xbe\
+\xaa\x8a\xd2\xd9\xd5E\x10*\xaes@\x192\xd9,=\
+\xbd\xbd\xe5\xef\xc0\x08\xc4\xda0\xbafA\x88\xeb\x1e\xd8\
+9\xcbd\xb2\xa4Re\x1e\xac\x8b_\x91%\x9a\xfc\x05\
+\xd4\xbc'\x91C\xd4\xc5\xf5V\xf8rg/\xcf\xf6\xb6\
+W\xbbKU\xe3\xa6\x1bo\xe4\xec\xb3\xcf\xe4e\xafx\
+m\xd9\xdb\x12\xe3^m<\xf3\x98\xcd\xa7\x7f^\xf5\xba\
+\xe9\x83\xbcG\x07\x14t\xc7k\x18nWJ\xc1\x89\xc0\
+{\xa8\xc0\xa3\xb7s\xfbV>\xf6\xd1\xff \x9f\x1d\x9c\
+\x13\xc2\xa8%\xf4\xf9Kg;S\x1c\x97\xaf4'i\
+\xc6\x92\xaa\xf5\xf4\xa4\x07{\xbb\x87T\xccJf\x8e\x10\
+\xdb&\x228e)\xdc=:\x90#\x84\xeb\x19cp\
+\x9c\x0a\xa9kq\xe2W\x0cq\xac\xd1U\xba\x01b(\
+\xfbT\xf8I:\xcf\xbd\xddm\xd5\xeeRUY\xb5v\
+\x03\xdf\xfe\xee\xf79\xf3\xec\x0b\x981\xa3\xbf\x12\xc5%\
+a&\xca{\xc58w\x01\xbb\xd5VqI3\xc8\xb1\
+l\x10&w[\xbdWt\x16.p%\xf0\xa6!_\
+\x8cA\x92I\xf7p\xeb\x1f~\xcb\xfd\x0f>V\xee\xa6\
+F\x04~\x98\xe7O\x9d\xfb\xf9q6\xc0\x12\x15~\xa8\
+y\x8a\xe1HE\xe3J\x8d\x0e\xd4u\xaa\x88r`\x85\
+\x0e5}\x8f\xc4P\xf2bx0o\xf9qg\x07\x1c\
+c}\xec\xd1\xc8]w\xdd\xc3\x17\xbf\xf8y\xfc|\xf9\
+\xb3\xe1\x891\xa7\x19/\xf9\x9f\xc6M\x9aj{\xbb\x0f\
+\x86\x01W\xe8A\xb6{\xd8\x17eH\xa8\xc5\xc4\x1a0\
+n\xe2T\xe0\x8deoN\x95'\x9f^\xca\x07>\xfc\
+\xb1r75\xa2\xd8\xef\xe7\xf9EW'\x17\xc5&s\
+\xbe\x89Rz\xd6\xbc\xe9\xbd8X\x8f\xa0p\xa4\xc1`\
+\xa8^\x8aX\xab5n\x9d9V,Q\x02\xa2\x1a>\
+)\x07\xf0\xc4\xf0t`\xf9fO\x8aLnt\xc6\x9a\
+\x0f\x85\x07\x1f\xb8\x9fG\x1e\xba\x97\xab^\xf8\xf2r7\
+\xd5\x0c\xbc\x02\xf4{\xc0Fj\xfa\x8e\xa9\xf9\xdd#b\
+\xc0\xeb\x89\xb2\xf7\x94\x95\xcd\x9b\xd6\xf1\xfd\xef^_\xee\
+fF\x1ej\xd9\x94\xe9\xe1\xba\xee\x14]8\xc4\xa9\xe1\
+\x0a\x93\xc5\x84!!\x155\xb9\x97\x1b\x01b\x06\x92\x0e\
+$\x0d$\x9c\xca\xbd\x92\x85W\xc2\xd1\x9a\x1f,\x06M\
+q\x85^\xbcGjp\xd2'@\x83(;\x15\xfe\x90\
+\xce\xf3\x5cw\xc5\x12\xab\x8c\x08\xd6\xae\xdb\xc8g\xfe\xfb\
++\x95jn\x0e\xf0\xadJ\xa5\xab\x1b\x0e\xb5\x1b\xb6\xa6\
+\x0a\xe8\xeb\x80\x7f!\x12\xf6\xb2\xf2\xf0C\x0fp\xdb\x1d\
+\xf7\x94\xbb\x99\x11I.\x0cx\xa8\xab\x95\x9f'b\xbc\
+7aH\x02\x99Z\x1c\x05\x0b\xa8\x8dL\xee\xd2\x97)\
+\x98\x11+\xeeB\xb4\xd5\xd1k=\xfe\xb2\xd3\xd2\x9a\xb1\
+8N\xe4\x19^\xee\xe1E\x04\xf2a\x94j\xf5\xcc\xf1\
+\x86\x8b'\x81\x1f\x86\x04Z\xbb\xdf\xfd\x80\x1c\xec\x14W\
+#!\xc6\x87\xa3D\xdf\xb9+\x0eO\xe5Cn\xec\xed\
+%\x1cdq\x8e\xe3\x850\x0cY\xba\xecY>\xf3\x99\
+O\xf2\x99\xcf|\xbe\xdc\xcd\xb9\x88\x5c\xe2$\xc6\xbc,\
+\xcc\xf7\xde\xa3\x1a\xfa59\x0bd0\x82^\x8d~\xab\
+bb\x0d\x13\xc4\x89\xbf\x0c\x98\x5c\xee\xe6\xee\xfb\xeb}\
+|\xf1K\xd7\x91N\x1f\xe7\x8ep\xfd\xd0\x1d\xe4\xf9q\
+g\x17WM\x9e\xc09\xae\xe0\xaa%\xaa\xe2]\x83\x8c\
+\x88}\x81\x81\x11\x94\xa4+t\xe4\x1d\xfe\xe3\xe94\x0f\
+\xef\xe8$\xed\x87\x941U\xfa\xdf`5J\x7f;g\
+L\x9c\x7f9s\x12o\x99#d\x03\xc5\xb75\xf9\xcd\
+\x0f\x8e\xa2\x90\xd7\xf0=\xd2$\xb02\x84\x9b{R\xb4\
+f\xaa\xb4\xedY\xe3\xf4\xf6\xf4\xf0\xd3\x9f\xfe\x9c\xb7\xbd\
+\xf9\xef\x987\xff4\xc4\x94\xd5\x09u\x8c\x18\xe7+\xa8\
+}\x12\xb4m\xe4\x0az5\xd0\x101\xde5\x22\xa6\xec\
+\xa6\xf6\xb6\xd6\xdd\xdc\xf0\xf3\x9f\xb1ac=\x01\xc8@\
+lJw\xf1\xd3t\x13\xd3\x9b\xe3L\x17\xe8VEk\
+U\xd4kt\xf55\x18\x94\xa8\xc6u\x93\x07\xed\xbep\
+\xfdj\x9f\xff[\xddJ\x10T\xaf$\xe6\xce\xee,9\
+5\xcck\x9a\xc8\x85\x13\x02P\xf0G\xe8\xf5\xed\xa3\x06\
+\xef\x11%r\x84C\x5c\xfe\x92\xc9roowa\xb3\
+\xbf\xce\x91\xd8\xbe}'\xff\xef\xc3\xff\xc1\xef\x7f\x7f+\
+\xb1xY\x05]\x80\xd3\x8d\xd7\xf0N\x1bf\x7f\x88\xb5\
+]5Q\x8d\xed0\x06\xb1-&\x15~\x81\xb8\x89&\
+D^\x03L\x1b\xfe)\xf6\xcfo\x7f\xfb\x1b\xee\xb9\xe7\
+\xeer73:\xd0\x90_ww\xf2D> Dj\
+\xad$\xd1\xa8\xa0\xb8K\xd0\xe0Bo`\xb8qs\xc8\
+w\x9fk\xab\xaa\x98\x17{\xb6dg\x07\x9f_\xda\xc3\
+\x96\x94\x83k\xc0\xad\xbd\xf1l\xc4#@#\xb0,\x84\
+;\xd3i\xba\xfdl\xb5\xbbT\xf3\xdcv\xfb\xdd\xfc\xfe\
+w\xbf&\x93)\xbf\x85\xd5\xb8\xf1\x0f\x898\xb3\x0b[\
+\xc2\x15~\x0d\xa2\x7f\x03~\xa2\xf2z\x8e\xf1\x1a_/\
+\xc6Y<\xa83\x18\x06\x1b6l\xe0\xc7?\xbb\x81\xdd\
+{\xea\x0e'\x83\xa5+\xdb\xc3\xef\xd296YH\x8a\
+\x8c\x1eG\xa9\x1a\x22\xe1(\x81\x1an\xdfa\xf9\xc6s\
+\x9d\xf4\xa4k%A\x8dr\xc7\xc66\xbe\xbb&\xcf\xfe\
+\xbc\x10wF\xb4{BM\xe2\x02\x18\xc3-\x99\x1cK\
+\xd2)\xa2\xfd\xa3:\x03\xf1\xb9\xcf}\x8e-\x9b7T\
+\xa2\xa9\x19b\xdcs\xc4\xf1bb\x5c*\xf9\x1a\x0c\x03\
+g\x8a\x1bd\xca\xb9\xd2\xa1IT\xdf\x8f\xc8\xacr\xb6\
+bC\x9f\xff\xfe\xdcgxv\xd9s\xe5lf\x14\xa2\
+\xdc\x96\xea\xe1EI\x8f\x05\xc98\x9e\x86\xe4j\xd5\xec\
+>\xc2P\x22\x074\xcf\x08\xf7\xef\x85o\xaf\xecf\xf3\
+\xfe\xcejw\xebP\xd4\xe7\x9b\xcf\xb62\x7f\xecT\xde\
+:\xd7\xa1\xd1\xb1d\xc2\xfa\xb7_*\x12(\x1b\xd4\xe1\
+\xe1to}u~\x0c\xac]\xbf\x89\xdbo\xfd\x13\xb3\
+\xe7\x9cDcccY\xdb2n\xe2\x8d\xea\xc6\x9eB\
+\xed\xea\xb264\x04\x06\xce\x14\x17+\xef\xc59\x02\xaf\
+\xa0\x02\xa6\xf6\xa5O?\xcac\x8f=6\xaa\xcb\xa2\x96\
+\x8bt\xb6\x87\xbff\x1ay^,\xce\x02\x13U+\xad\
+3|\x1c \xe9(\x9bS.?Z\xdb\xc3c-\x9d\
+\xd5\xee\xd2\x91\xf13|\xf2\xc9N\xa6\xc4\xc7\xf1\xdaY\
+\x0e\x9e\xb1#\xdbI\xaeF0D\xd1\x0b\x7f\xca\xf8\xac\
+\xce\xd4W\xe7\xc7\xca\xc7?\xfd\xdf,8\xf5\x0c^\xfd\
+\xeaW!RV\xdb\xe1\xd5\xa8\xfe\x11\xd5\xf5T\xa8\xa6\
++0(?\xbcZs\x8as\x80\xcf\x00e\xcf\xe9\xf7\
+\xae\xf7}\x98\xcd[\xb6\x95\xbb\x99Q\xcb_\xd3\x19^\
+\x9cLrJ\xd2\xc5\xa8\xd6\x87\x9ea\x22@\xc2\xb1\xa8\
+x\xfcp]\x86_\xaf\xef\xa4\x96\xdd\xb0;{:\xf9\
+\xca\xb3\x1e\x93\x12\xcd\x5cu\x82\xa0~\x8d\x06t\x8f\x10\
+\x84\xa8\x00K\xb7\xb8<\x9c\xeebop\x9c\xd6\x91\x18\
+\x06\x81\x1fp\xef]\xb7r\xe9E\xe72y\xda\xcc\xb2\
+\xb6%\xe2\xbc\xd1\x86\xc12\x1bd\x9e\xa6\xbc\x93\x87>\
+\xdc\xf8\xc0\xd1\xdb\x03g\x8a\xcbWh\xffN\xc4s\xbd\
+\xc6\xcb\x81\xa9\x94qd\xc8\xe5\xf3\xdc\xfc\x7f?e\xeb\
+\x96\xcd#!O@\xcd\xd2\x9aM\xf1L\xae\x81k\x1a\
+\xc6\x90  U7\xbb\x0f\x8b\x98Q\x8c\xe7\xf0\xad\xd5\
+\x017\xac\xee\xc2\xfa\xd5v\x82\x1b\x98\xe7v\xb7\xf1\x9d\
+\x95\xc2\xd4\xe4X\x16\x8d\x0b\x08\x03=\xde\x0a\x80\x95\x0c\
+!Z\xcd<\x1a\xc0\xaat\x17\x0c2\xd5g\x9dC\xf9\
+\xf9/\x7f\xcd\x99\xe7^\xc2\xbb\xdf\xf5\xaer7u\x19\
+\xe8\xa5\xa8>]K^$\x03\x0a\xfa`s\xc8\x0e\x1b\
+\x91$p\x1d0\xae\xac\xcdh\xc0g>\xf7%z\xba\
+\xebi\x14\x87\x83\xd5\x80\x872Y\x1enh\xe4e\x1e\
+\xa4j\xe7\x9e\xae8C\x151\x05B\xb58\xa2\x88\x03\
+\x7f\xdcf\xf8\xd1\x8a\xfd\xec\xeeN1\x98Ab\xfa\xac\
+\xf9\xcc\x99;\x97l6\x8b\xda\xd2\xd8H\x8c\xe3\x90\xcb\
+\xfblX\xbb\x8a\x5c\xba\xff\xf8\xe7\xc0Z\xee\xda\xdc\xc9\
+\xdc1\x1e\x9f=\xb7\x81&\xd7'\x0a\xb8\x1b\x1a\xaa\x8a\
+=\x0eg\x04Bt\xd5B\x84{39Z\xc3b\xde\
+\xe2:\xc7J*\x95\xe677\xff\x8a\xf3\xcf=\x93\xb3\
+\xce>\xbf\x9cM\xc5\x8c\x13{\x99\x18\xe7>`E9\
+\x1b:\x16\x06\x14t\xb72{\xe8.p.pv9\
+\x1b\xe9\xee\xee\xe1\xfa\xaf\x7f\x99\xad\xdbZ\xca\xd9\xccq\
+\xc3\xda\x5c\x96\xc7\xb2y^\x1eO\xe2\x86Q(\xdb\xf1\
+\x86\x00\x89x\xfco*\xae\xb9\x8e\x83\x19\xa0r\x98H\
+\xc1S\xdc(\xcb\xdac|mY\x1b\xab[{\x18\xcc\
+\xde\xe9\xeb\xde\xf8V\xfe\xf5}\xff\xcc\xb8q\xe3\x08\x82\
+\xd2\x09\x80\x88!\x08C\xee\xbe\xe7>\xfe\xe7\xbb\xdff\
+\xef\xae\xed\xfd~>\xed\xe7\xf9\xe5\xeaNf5\xb9|\
+\xe8\x9c8\x0dn~\xc0\x09\x8e\x88!\x91\x88#\xe6\xd0\
+\xebc\x8c\xc18\xc7W\x85\xba\xe2F\x85\x8b\xd2\x8a\xe1\
+\xb1L\x8at\x89&g\xc7+\x8f=\xfe\x04\x7f\xfa\xd3\
+\x9f\xca-\xe8 \xe6b\x11\xf3\x1aTG\x8e\xa0\x8b\xf1\
+*\xd1\x8f\xa9\xc0\xa7\xcb\xddH\xcb\xd6\xf5|\xf3\xdb\xdf\
+-w3\xc7\x0d\xf9 \xc7\xb2l\x9a\x9d\xcd\x0dL\x11\
+\xa5w$\xa7\x04\x1d2B[[\x1b\x87WPM&\
+\x93\xb8n\xff\xcf\x8e'\xd0\x1c3\xb4\xe5\x0c_~6\
+\xc5\x13;;\xd1A\xa4\xf8\xbc\xe2\x85/\xe5\xdaO}\
+\x823N[8\x9c\x8e\xf7\xcb\x05\xe7\x9dM\x18Z~\
+\xf0?\xdfb\xef\x9e]\xfd~\xb65\x95\xe6\xbb+:\
+9y\xdc\x14\xae\x9c\xec\xd0\xe0\xf6\xbf\xfd\xa2\xaa\xec\xd9\
+\xb3\x07\xe7\xacE\x87\xbc\xdf\xd4\xd4H\xcc\xab\xc8xS\
+S8D\x19\xf9\x96\x84\xca\xe6L\x0f\xb6.\xe8\xc3\x22\
+\x9d\xce\xf2\xfb?\xdc\xc2\x0b_t5\x97]\xf6\xbcr\
+6\xd5\x04\xbc\x14\xe1\xb7\xc0\xdar64X\x06v\x8a\
++w\x0ea\x11\x07\xe4l\xe0\x8ar6\xb3\x7f\xff>\
+\xbe\xf7\xfd\xef\xd1\xd5YO\xa3X2\xd4\xb2&\x97\xe1\
+\xaf\xf9\x80\xb7\x95=\xdb~m\xa2\xd6r\xef}\xf7\xd2\
+\xdc\xdcHsS3~>O\x22\x11g\xdd\x86\x8d\xec\
+\xde\xbd\xbb\xff\xdfE\xd9\xd4m\xf9FG\xc8\x1f7\xb4\
+\x0dj \x8f'\x9b9\xff\xfc\x0bI\xa53<\xf6\xc4\
+\x12\xb2\xb9\xfc\x11k\x8b\x0f\x9dhy=a\xfc8N\
+\x9a\xbf\x80\x99s\xe6\xb3w\xcfn\xfa\xb7\x00(\x1b\xf7\
+\xf7\xf0\xe9\xa7]>q\xcex\x5c\xc7\xf4+\xe8\xb9l\
+\x86\xbf\xdc\xf1\x17\x1a\x13q\xe2\xf18\xbe\x9f\xa7\xa1!\
+\xc93K\x9f\xa5\xbb\xb3\xb3\x84\xe7R\xfb\x14\xf7\xceS\
+\xc0\x039\x9f\xde O\xdd\xdc>|V\xae\x5c\xc5w\
+\xbe\xf3m.\xbb\xecR\xca\x5c\x83l1\xc8?\x02\x1f\
+-g#\x83e\xe0=\xf4\xb2\xa7\x1d4'\x8a8o\
+-k\x13j\xb9\xff\xfe\xfb\xf9\xfe\x0f~Z\xd6f\x8e\
+Gv\x05\x01\x8ff\xb2\xbc-\x96\xc4Ak\xd8/\xbb\
+<X\x1bp\xdb\xad\xb7\xf0\xe4\x13O\xe1\xba.\xaa\x16\
+\x11\xa1\xb7\xa7\x9b\x96\x96\xfe\xa3(\xba\xf3\x96?l\xea\
+fm[\x06\x7f\x90Np\xb1x\x8c\x87\x1fz\x80'\
+\x9fx\x9c\xee\xee\x1e\x8c)\xfd`\x15\x86!\xc9d\x82\
+x\x22N[\xdb\xbe\xa8J\xcb\x80{\xdb\x96e\xbb:\
+\xf8\xa45\xc4\xa4\xffM\x83L&\xc5\xad\xb7\xfe\x89\xa7\
+\x9fz\x12\x10\xac\xb5\xb8\x9eKGG;;\xb6m\x1d\
+t?u\x14d\xb51D\x82\xde\x8d\xf0L6Gp\
+\x1cn[\x95\x8b'\x9fx\x82\x07\xfez\x17W>\xff\
+\xa5\xe5l\xa6\x09x!\xe8T\xb5\xe1\xder64\x98\
+\xe42\xd5]\xa1GK\x8b\xf3)s\xbd\xf3\x9d;\xb6\
+q\xe7\xed\x7f*g\x13\xc7-\xf90`}.C\x87\
+4\x12\xd7\xd1\xb1\x8f^LZ\xe8\x0a8\x838\x9f]\
+\xdb\xb7\xb0k\xfb\x96cn\xa7'\xe7\xb3|W\x1b\xc7\
+\xa2J=\x9dm<\xf9\xe8\x03\xc7\xdcV%\x08\xace\
+\xe5\xaeV\x8c\xeb\xa1\xf6\xe8\xe7\xa4V\xd9\xb5m#\xbb\
+\xb6m<\xe66\x0c\x85\x94\xb3&\xaa\xa6g\x19\xb9\xc1\
+r\x0a8(\x08\xec\x0e\x85\x8d\xb9\x0c\xc1q\xe8\x14X\
+.\xb6\xb5\xec\xe0#\x1f\xfd4\x8f?r\x15\xb1x\xa2\
+\x9cM\xcdQ\xd5\xf7\x85\xb9\x9eO\x97\xf3nt\x93\xe3\
+\x06\xfc\xcc\x80\xd3\xfb\xd0\xcf\x94\xe7\x95\xefEm8^\
+\xc4\xb9\xa8\x14'{4T-\x7f\xfa\xf3_\xf8\xe9/\
+n.g3\xc7/\x1a\xb2\xd3\xcf\xf2D`\x89\xa1#\
+rp=8S\xb2\x0b\xb8\xa2\x18\xa3X\x8d\xf66\xcb\
+\xdf\xfa\xe8\xc2\x06~\xd9BB\x0b\xd5\x1ePQb\x8e\
+F\xdfU\xe1\xdfj\xb0\xd6\xca\x808@VaU\x10\
+\xd2\xe9\xa7\xcb\xbf\xc5y\x9c\xb1\xb3e+\x7f\xbd\xf76\
+\xc2\xb0\xac\xd1Z\x13\x80\xd7\x22\x8e\x1b\x95B,\xd3k\
+\x10\x0c\xc2^W\xd6D\xf3\xcf\x07\xde;\xa8\x9e\x0e\x91\
+\x1d\xdb6\xf1\xe8\x83\xf7\x96\xb3\x89\xe3\x9e\xf6 \xe0\xe9\
+|\xc0H\xf2O.\xde\x81\x22\xe0\x19%a\x94FG\
+I\xb8Q\xbd\xd0\xfdy\x97{\xf7\x0a[z\xb2\x04a\
+}\x90\xad\x15Z\xb3!O\xec\xf3\xe9\xce%\xc8\xab!\
+n\xa0\xc1U\x1a\x1c%.\x1a\xadx\x19\x19\xe2^\xdc\
+?O+\xac\x0fB\xfc\xc0\xafv\x97F\x1d\xfbZ\xf7\
+\xf3o\xff\xf9i\x82\xa0\xbc\xcf\xb0\x88\x99\xe6&\x9a\xfe\
+\x0e\xf0\xaaY\x9ce\xe0\xd4\xaf\xf1\xb1\xc7pZ\xc7\x82\
+\x22\x983\x89\xf6 \xca\xc6o\x7f\xffgn\xbd\xfd\xae\
+r6q\xdc\xd3m-\xabr>~2\x86hm\x0e\
+\xa4\xc5G\xc2\x10\xd5\xf7vDq$\xf24\x8f\xa6\xb5\
+.-i\xc3\xc3\xfbB\x1e\xda\x9dg\xc5\xfe4[:\
+R\xecO\xe7\x06\xe5y^\xa72\xf4ds\xdc\xb0b\
+\x17\x0fmo`\xde\xf8F.\x9c\x96\xe0\x8ai\x1e\xa7\
+\x8dU\x9a\xbc\x90\xb8\xb5\xa8*\xbeB\xa0\x10\xaa\xf4\x99\
+\xe5k\xcdz$D\xf7b\x8f\x85\x0d\xfe\xf1\xe6}R\
+\x19T\x95-\x9b7s\xcb\x1fo\xe4\x95\xaf~\x03\xc9\
+d\xd9\xc2\xb0'\x82|\x08\xd5\xdfW\xf3F\x1bDq\
+\x96\xb2y\x08\xbe\x00xu\xb9\x0e\x0e\xb0m\xcb:\xee\
+\xbb\xef.R\xa9t9\x9b9\xee\xc9\xab\xb2\xdd\xcf\x91\
+\xa6\x01\x8f\x10\x1f\xa9\x09Q\xef[\x85\x13\x99\xd1]\x81\
+X1a\xb68\x04\xea\xb0\xac]yl_\xc0\x92\xd6\
+4\xeb\xf6\xf7\xb2;\x95\xa75cI\xe5\xc3\x8a\xa6i\
+\xae38T\x95\xce\xac\xcf\xb3{\xbaY\xb5?\xcd\xa3\
+\xdb\x1d\xfe/\xe91k\x5c\x92\xc5\x13\x93\x5c6-\xc6\
+\x05\x93\x85\xc9\x09%fCP%\xb0\x10\xd8\x03\xe2^\
+\x0b\xfb\xee\xd1\xe4R\x11\x84nUZ\x82\xa0&\x9e\x99\
+\xd1H.\x9b\xe5\xbf>\xfe\x19\x9e\xff\xc2W\x94S\xd0\
+\x0d\xc8b'\xdet\xa9\xf5\xd3\x0f\xab\x86~5\xee\xb2\
+j\xe6r\x7f1pZ9\x1b\xf8\xc5/o\xe4\xf1\xc7\
+\x9f(g\x13u\x00lH\xab\x9fc\xab\xc2)(\x06\
+!\xa0:\x83fqP4\x05S\xba\xeb(\xae\x91\xe8\
+\x0d\x1c\xf6d\x84\xa5m\x96\xe7\xda|6u\xf7\xb2\xae\
+-\xc3\xd6\x9e\x90\x1d\xbd>\x84\xb5\x9fn\xb5N\x11\xc5\
+\x0f|\xf6\xf6\xfa\xec\xed\xcd\xb2\xa25\xc3C;b\xdc\
+\xbe\xd9a\xde\xd8\x18\x0b'$9}b\x8c\xb3&x\
+\x9c2\x06\x12^\x08VQU\xf2\x16\x02 8h\xe2\
+Y\xe9{5r\x88\x8b\xda\xedU\xd8W7\xb7\x97\x95\
+\xcd[\xb6q\xef]\xb7\xf3\xea\xd7\xbe\x9edC\xd9D\
+=!\xc6\xfdO\x94\xe5\xa8\xdd\x7f<\x09\xfa\x5c\xe0B\
+\xca\x18 \xb8g\xd76\xee\xf8\xcb]t\xd4\xe3\xce+\
+\x80\xd2\xe9\xe7x\xce\xb7\x9cR\x85\xbc }\xa6t\x14\
+G\xc1\x03b\x8e\x80g\xc8\x0b\xac\xe9\x86\xd5\x1d\x965\
+\x9d\x19\xd6\xb4\xe7X\xdd\x1e\xb0\xb1\xcb\xa77\x93%\x1a\
+\xda\xeb\x8c|\x02z2\x01+2\xb0b\x1f\xdc\xe2&\
+\x9876\xce\xc2q.\xa7N\x88q\xf2\xb88\x0b\xc7\
+9\x9c6\xdeeb\x5c\x89\xbb!\xa1@\x1e%\x00,\
+\xd2\x17rY\xa9a\xd8\x10\xdd\xbb=@G\x90\xafP\
+\xab\xc7/_\xfb\xfa\xd79\xf7\xfc\x8bYp\xf2\xc9\xe5\
+jB\x80\x97\x88\x1b?M\xf0\x1e\x06\xa9\xf8^]\xb5\
+\x04\xfd\x1f\x803\xca\xd9\xc0\x8f\x7f\xfc#6o\x5c_\
+\xce&\xea\x1cD\xd6\x06\xac\xf6C\xd4\x93\xf2\xa6q8\
+\x88b\x0el\x07\xc1\x13\x22\xcb\x80\x11Z-\xec\xec\xb6\
+\xec\xd8\x16\xb2!\x95\xe7\x99}\x01KZ}\xb6\xb4\xa7\
+\xc1\x96\xbe\xc6t\xf3\xd8\x09\x8c\x193\x06c\x0c\xaa\x8a\
+1\x86\x5c6KGG;\xf9\x5c\xa6\xe4\xed\x01\x8c\x9f\
+0\x99\xf1\x13\xc6c\xad\xe2\xfb\xa5\xb3\xee\x09B,\xe6\
+\x91\xcb\xe5\xd9\xdf\xba\x97\x5c\xb6\xf4\xfd\x17\x11\x9a\xc6\x8c\
+g\xdc\xd8\xb1 \x82\xaa\xc5\x18\x87t:MG\xfb~\
+\xc2R\xacV\x83,\x9b\xdb\xb2ln\x83;6\xb9\x8c\
+il\xe0\x8cIq.\x98\xeaq\xe6\x04\x8f\x99\xa1\xcb\
+\x89\x81a\x8a\x03\x0d\x02\x10\xed\xbb\x87(\x16){\xf5\
+\xc0\xe2\x9e\xbe\x15C\xafZ\xb2a}\x85^n\x9eY\
+\xb6\x82\x07\x1f|\x80\x993O$\x91l([;\xc6\
+\x8d\xbf\x13X\x0f\xf4\x9fY\xaa\x0c\x0c\x22\xb1L)o\
+mE\xc4i\x222\xb7\x8f/\xe1\x81\x0f\xa1\xab\xb3\x9d\
+\x1b~\xf5;Z\xf7w\x94\xab\x89:\x87\x11\x22\xec\x08\
+C\xac\xba\x83\x8d\xb0\x18\x12\x86\xa2\x90\x17~\x16!\xa7\
+\xb0\xd7\xc2\xdeP\xd9\x16\x86<\x9b\xf1y\xaa\xdb\xe7\xd9\
+T\x8e\x8e\x9e\x1e\xcaY\x86TDx\xd1\xd5\xaf\xe4\x8a\
++.'\x91\x88\x13ZK\xcc\xf3\xd8\xde\xb2\x9d\x9bo\
+\xbe\x99u\xab\x96\x96\xa5\xdd\x13g\x9f\xc4\xdf\xbd\xe9\xef\
+\x997g\x16\x9d]\x9d%\xcb\x16\xe7\xb9\x1e\x22\xc2}\
+\xf7?\xc8\x9d\xb7\xff\xb1,\x82\x1e\x8b%x\xc9\xcb_\
+\xc3UW^\x8e\xeb\xba\x84aH<\x16c\xf5\x9a5\
+\xfc\xeaW\xbfd\xcf\x10b\xfa\xfb'\xa0;\xd5\xcd#\
+)xd\x1b\x10k`\xf1\xd8F\xce\xf7b\x9ck]\
+N\xc2e\xba\x11&\x1bh\x16\xc1#r\xa8\xb3\x1c\xab\
+\x8f\xf1\xb1a\x80<B\xbbU(oXU\x9d\x02\xbf\
+\xf8\xf9\x8f9\xef\xdcs8\xeb\x9c\xf3\xca\xd9\xcc\xdb\x81\
+_Q\x8b\x82n\xfdR:\x94)\xc6k|\xad\x889\
+\xa1\x84\x07=\xb4\x05Un\xf8\xf9\x8f\xe8hk-W\
+\x13u\x8e@\xa0Jk\x10\x90\xc3%Ii\xcd\x96\xc5\
+c\x15\xb3jY\x94,B\xaf\x0a\x1d\x0a\xab\xfd\x90\x87\
+\xf3>\x0fgs\xacI\xf7\xa2%\xbdg\xfb\xc78\x1e\
+\xd7\xbc\xe6\x95\xbc\xe5M\xaf;\xe4\xfd\x1d\xbbv\xf3\xcc\
+\xb2\xa5e\x13\xf4\xed-[\x88\xb9\xc2\xdf]\xf3\x0a\x5c\
+\xb7\xb4\x86\xb6%K\x9f\xe3\xc6\x9bo\xa2\xab\xa3<\x13\
+\xe2\x86\xc6&\xde\xf8\x86kx\xfdk^~\xc8\xfb\xcf\
+\xaeX\xc5\x83\x0f>P\x06A?\x8c|\x9a\x15\xadi\
+V\x00?\x15\x97\xc9\xc9f\xceO&y^\xdc\xe3<\
+\xcfc\x96\x81fQ\x1a$\x1a \x0f6\xc7C\xe9\xc4\
+\xdd\x01:l\xc86?_\x8f?\xaf\x10\x8f<\xf64\
+\x8f<\xf6$\x8b\xcf<\x0b\xc7)\xab\x81\xfa\x0aT\x9f\
+\x00-\xdd\x9e\xef \x1c\xd4\x07qF%_n}\x08\
+\x98S\xea\x83\x16\x09\x82\x80\xeb\xbf\xf3C\xf6\xb7\xb5\x97\
+\xab\x89:G\xc0\x02\x9d6$\x87\xd0Ht\xd7\x0cw\
+\xe0+\x9a\xd4\x8b\xabr\x1f\xa1\x07a\x97\x0aO\xe7-\
+\x8f\xe4r<\x95M\xb3-\xddMP%\x93\xa5\xa2L\
+\x988\x89 T\x5c\xe7\xc0\xb3\xd2\xd3\xd3K6]\x1e\
+s;@g\xdb^>\xfb\x99k\xd9\xb9{\x0f\xd7}\
+\xe13\xc4b\xc3w^\xc8\xfb\x01\x0f<\xf4\x18\xff\xf9\
+\xd1\x8f\xb1|\xd9S\xa8-\x93eC\x94)\xd3\xa6\x13\
+\x04!\xae{ {AOo/\xe9t\x85#R4\
+\xa05\xdd\xc1\x1d\xe9\x0e\xee@\x18\x1bo\xe4\x8c\x86f\
+\x9e\x97HpY\xdc\xe54Gh\xc0\xe2\xa18D\xf7\
+t\xa9L\xf2\x22\x10Z\xc8\xe9H\x88\x9a\x1f=\xdcw\
+\xcfm\xbc\xf0\xf9\x97\xb1p\xd1\x99\xe5l\xe6\x9fm\x90\
+y\xc2\x06\xd9?\x0fF\x88\x07\x83\x9b\x187\xf0g\x06\
+\xfa@\x09s\xb9\x8b\x1bk:\x1d1e3\xb5\xe7\xf3\
+9\xee\xbb\xeb\x16\xda\xf7\xd7W\xe7\x95\xc6\xaa\xd2\x1b\x06\
+\xf8\x00\xa2\x88\x1e[\xe8\xda\xa1\xab\xf0\xa2\x88\x0b*\x86\
+\x0e\x11V\x05\xf0H\xce\xe7\x89\x5c\x8e\xb5\x99^:\xb2\
+irX\x82\x1a\xa8\xa1-F\xfef\x9bADJ\x5c\
+4\xe5oI\xf7t\xf2\xcb\x9f\xfd\x980\xb4|\xf5\x0b\
+\x9f\xa1!\x19\x1f\xf2\xb1\xc2\xd0r\xef\x03\x0f\xf3\xb1\x8f\
+}\x9c5+\x96\x95O\xcc\x01\x90\xc8\xaap\xd8\xf5\x91\
+\xc2\x7f\xd5C\xe9\xca\xa5x<\x9ff\x89\x08?t]\
+\xe6&\xc7rN<\xc9\x85q\x8f\x8bb\x0e\xd3\x05b\
+\x84\x88*\x96h3\xc7\x16\xbc\xe5\x8f\xf5.\x8c&\xa9\
+\x90\xa9\x8byE\xb9\xe3\xce\xfb\xb8\xe2\x05\x0f\x96[\xd0\
+\xc7\x83.\x06\xfds9\x1b9\x9cA\xe4r/\xd9\xcd\
+\xa6 \xff\x06\x94\xcd\xdc\x9e\xced\xb9\xf6s_!\x95\
+J\x95\xab\x89:GA\x81\xac\xb5\xe4\x8fA\xc8\x8b\x8e\
+A\x06\xf0P\x5c\x89\xde\x09\xc5\xa1\xc5\xc23\x81\xf2T\
+\xce\xe7\xd9l\x8a\xad\xd9\x14\x9d\x81O\xafZ\xfcB|\
+q\xb9\x984u\x16\x17]r1'\xcd\x9b\xcb\xdd\xf7\
+\xdc\xc3\x865+\x08\xfc\xa3y!\x0b\x8d\x8dM8\x87\
+\xd5OmlH\x96\xdc\x14~$:\xda\xf6q\xd3/\
+\x7f\x861\xc2\xe7\xaf\xfd\x04c\xc6\x0c-$\xe7\xee{\
+\x1f\xe0\xbf>\xf9IV-\x7f\x06[\xe6\x10*\xab\xca\
+\xb6-\x9b\xb9\xe4\xbc\xc5\x87\xbc\xdf\xd8\xd8\x80\xe3\xf5\x7f\
+\xcd\xa6L\x9b\xce\xcb^\xf9Z\xa6O\x9f\xc6M7\xff\
+\x86-\x1b\xd7\x978\xdcP\x09T\x09\x142\xf9\x90\xb6\
+\xa0\x8d5\xbd\x86[\x8daJ\xbc\x81E\x89F\xceK\
+\xc6\xb9\xc8sX\xe4\x08\xcd(\xa8%T\xc5/\x98\xe6\
+\x8b{\xef\x83\xb1RU;\x1e\xfex$\x9f\xf7y\xfa\
+\xf1\x87i{\xd35L\x9crb\xb9\x9a\x11\xe3&_\
+\x0f\xe6Q\xebg\x1e,\xd5*} \x06\xce\x14\x17+\
+U\x227\x9d\x84\xc8K\x80d\x89\x0ex\xe8\xd1m\xc0\
+\xbaU\xcbX\xb2d\x19u\xf3Uu\xf0\xd5\x1e\x92\x95\
+\xab8\xa8q\xd0\xcfQ4\xb8\xe2\x12eis\x89\x92\
+\xbc\xb4aX\xe1[V\x05>\xab\xfd,k\xb2)\xb6\
+\xe7s\xec\x0bB\xba\xc3\x00l9\x9d\x86\x5cf\xce=\
+\x89\x0b/\xbc\x80\x17\x5cu\x05\x8bN=\x95\xa9\xd3\xa6\
+\x22\xc6e\xe5\xaa5l\x5c\xbb\xf2\xa8\xbf\xa9a\xc0\x9f\
+\xfe\xf8'z{{\x89y.A\x10\xe0\xba.\x1b7\
+mb\xd7\xee\xfe\xeb\x88\x97\x8a\xf6\xfd{\xb9\xe1\xa7?\
+\xc2\xcf\xfb\xbc\xf4\xea\x17\xd1\xd4\xd8\x84\x1f\x04\x03\xe6S\
+w\x9c\xc8\x0e\xb2~\xdd\x06n\xf8\xe5/X\xbe\xe4\x09\
+*\xf1\xec\xe42i\xee\x7f\xf0!\xc6\x8f\x1f[p\x8a\
+\xb3\xc4\xe3q\x96<\xb3\x8c\x8e\xf6\xfe\xb7\xca\x1a\x1a\x1a\
+\xb8\xe4\xd2Ky\xcd+\xae\xe6\x15/\xbb\x9a\xae\xaeN\
+\xee\xbb\xef\x01\x1ex\xf0!V\xadZE\xa6\xa7\xb4[\
+mjCz\x09\xe9\x0da\xb7\xef\xb3&\x9b\xe2\xc1\x1e\
+\x97\x13\x5c\x97\x05\x89FN\x8f'X\x1c\xf38\xc5\x11\
+f;\xd0\xa8J\xa8!\x81B\x9e\xa2\xb8\xd7F\xa2\xa5\
+:\x07\xb8\xfb\x9e\xfb\xb8\xf9w\x7f\xe4\xfd\xef\xfb@\xf9\
+\x1a\x11\xb3\x181W\xa1\xfa`Y=\x85\x0f\xa22\xd5\
+\xd6\x84\xb8\x18\xef\x95\xc0\xc4\xe1\x1f\xec\xc8\xec\xdd\xb7\x9f\
+o~\xfb;\xd4\xc5\xbcZ(\xa1*\xf9\x82\x94\x1f\x9c\
+\xb0\xa3\xb8\x0f\xee\x01\xae\x08F\x84<\x86\xadVX\x1b\
+X\xd6\xf9>\xab\xf2Y\xd6d\xd3\xec\x0c\x02v\x87\x01\
+\x81\x9f\xa3\x9c\xdf\xe5\x98\xf1S8\xe9\xa4y\x5cp\xfe\
+\xf9\x9cy\xd6Y\xcc\x9c9\x93\x05\xf3\xe7s\xca\x82\xb9\
+}\x9f\xe9\xee\xc9 \x22\xfd\x1a\x03T-\xffw\xc3O\
+\xb8\xef\xde\xbbp\x1c\x83\x0dC\x8c\xe3\xd0\xdb\xdb\xcb\xce\
+\x1d\xdb\x87\xdc?\xe3\xb8\x8c\x19;\x11\xc75\xb4\xed\x1b\
+\xd8Y\xb6\xabc??\xfb\xc9\xff\xf2\xf0\x83\xf7\x91\x88\
+\xc7\x09\xc3p\xc0\xabg\xc4\x80\xc0\xbe}\xad\xecl\xd9\
+<\xe8\xbeM\x9c2\x83\xce\xf6}C\x0e/\xcbe\xb3\
+\xdcv\xcb\xefy\xe6\xa9GA)\x94O\xf5\xe8h\xef\
+`\xef\xce\xfe\xaf\x99\xb5\x8a\xe7\x1a&O\x1c\xcf\xe4\x89\
+\x91\xa7\xf2\xf9\xe7\x9e\xcf\xab_\xf5*\xb6\xef\xd8\xce\x86\
+\x8d\x1bx\xe8\xa1GX\xb5r\x15{v\xed(q\xb6\
+?K>\xc8\xb3+\xc8\xb3+\x07\xcfd\xb2L\xf4<\
+Nt]f\xc7b,\x8a'9\xc5\x8bq\xaa\xeb\xb0\
+\xc0\x15\xc6\x8b\x82\xb5\x84(y\x8d2\x1e\x14\xc5\xbd\xb8\
+\x8a\xafS\x1d\xf6\xb7u\xf0\xd7\xfb\xfe\xca\xfb\xde\xfbn\
+\xc4)[%6W\x8c{\x86\xb8\xf1\xc96\xc8\xb6V\
+B\xd4\x07\xf6r\x0f\x86\x1f\xb7\xab\xc2\x047\xe6}p\
+0\xed\x0d\x95M\x1b\xd7\xf1\xdb\xdf\xdfZ\xae\xc3\xd7\x19\
+\x04\x81Zr\x14R\xad\xf6\xad\xc2\x05\x17\xc1\x17C\xa7\
+\x85\x1d\xa1\xd2\x12\x86l\x0a|\x9e\xcbfY\x95\xf7\xd9\
+\xe4\xfbt\xfb\x99\xb2\xae\xc2\xc5\x8ds\xc2\x09'p\xea\
+\xa2\xd38\xef\xfc\xf3\x985s\x16\xf3\xe7\xcf\xe7\xdc\xb3\
+\xcfd\xe2\xf8#\xd7+\xc8\xe5\xf3\x07MM\x8e\xce\xbe\
+=\xbb\xd8\xb7\xa7\xf4\xab\xf1\x8b/{\x1e/~\xd1\x0b\
+\xf9\xd2\x17\xfe\x9b}{v\x0e\xf8\xf9\x5c\xba\x87U\xcb\
+\x97\x95\xbc\x1fE\x1c/\xc6K^\xfejf\xcd\x9a\xcb\
+\xaf\x7f\xf9c::\x86\xb6\x1aV\xb5\xec\xde\xb1\x8d\xdd\
+;\xfa\xaf\x17\x7f\xd4\xdf\x0f\x0f\xfdN&N\x18\xcbe\
+\x97\x5c\x00\x5c\x00\xc03/[\xc1\x8a\x95\xab\xd9\xde\xb2\
+\x95g\x97=\xc7\x9a5\xab\xd9\xbec\x07\xbd]mC\
+j\xef\xa8\xd8<m\xb9<m9x.%\xdc\xe6%\
+\x99\xe5\xc58\xd9\xf383\x1e\xe7\xb4x\x8cY\x8ea\
+\x8e\xe30\xdd@\xac\xb08\x0a\x0a\x13\xdfZ\xcc/\x7f\
+<\xb1\xfc\xd9g\xb9\xfd\x8e\xdbx\xc5+__\xb66\
+\xc48\xe7\x89\x1b{\xb5\xe6{\x7f,\xa6\xfcf\xf7\x81\
+\x05v\xd8w\x9c\xb8\xc6q\x17\x03g\x0d\xf7HG\xa3\
+\xbb\xab\x9d{\xee\xbe\x8d0\xa8\xc7rV\x1b\x0f\x88\x8b\
+\x12C\xe8F\xd8ga\xb7\x85\x960`U>`y\
+>\xc7\x1a\xdfgs>G\x98/\xa3\xaf\x8384\x8f\
+\x19\xc3\xc4I\x939\xf5\xd4\xd38e\xe1BNYx\
+*\xcf\xbb\xec\x12N;\xe5\xa4A\x1d\x22\x93I\x93\xcb\
+f\xcaV\x0a\xb4?l\x180o\xde\x1c\xfe\xdf\xbf\xbe\
+\x97|>\xe0k_\xf9\x02\xad\x83X\xa9\x97\x0b\xcf\x8b\
+\xf3\xc2\x97\xbc\x8c/\x7f\xf1\x0b\xac^\xbd\x96?\xfd\xe6\
+\x97U\xe9\x87\xef\xfb\xa4\x06\xf0\x84?\xf7\xac\xc5\x9c{\
+V\xb4?\xbfk\xf7>\x9eZ\xb2\x94\xe5+W\xb1e\
+\xf3FV\xad\x5c\xc9\x96M\x1b\xe9\xec\xea$\xc8\x972\
+\xc9\x90b\xfd4[\xfd4[\x81\xbbM\x8c\x09\xf1$\
+\x0bc1\xce\xf2b\x9c\x9f\x883\xdd\x81\x13\x8ca\xaa\
+14\x8b`\xc4\x92\x90h\xd2[\xa7\xf2l\xdc\xbc\x95\
+\xff\xfd\xd1\xcf\xcb*\xe8\xc0LT_\x8e1?C\x9c\
+\xb0\xdcv\x992'\x96Q\xc4x\x93\x8d\x93(\xeb\x15\
+{f\xe92~\xf6\x8b\x9b\xca\xd9D\x9dA\xd2\xad\xca\
+.+\xec\x0d\x95\xd5\xa1eI\xde\xe7\xa9\x9c\xcf\xea\x5c\
+\x96\xce|\x1a\xc2r\xa5\xb8\x14\xe2\x89\x04\x8d\x8dML\
+\x9c2\x8d\x05'/d\xe1)\x0b9\xeb\xec3y\xe5\
+K\xaff\xdc\xd8cs\x16\xcb\xe5\xf2<\xfa\xd8\x13\xb4\
+l\xdbZv'\xb1\xa3\xd1\xd1\x1e\xc5\x81\xff\xe7\x87\xdf\
+O.\x9f\xe7{\xdf\xf9\x06{v\x0d\xdd\x8c?Tb\
+\xb1\x04\x97_\xf5B\xae\xfd\xf4\xb5,>u\x01\x0f?\
+\xf4\x18\xbe_\x9d\xc9sgG;\xcf,]JW\xd7\
+\xeb\x19;v\xcc\x80\x9f\x9f~\xc2\x14^\xf3\xca\xaby\
+\xcd+\xaf\x06\xe0\xb9\x15k\xf9\xf3\x1d\x7fa\xf5\x9a5\
+l\x5c\xb7\x96\x96m\x9b\xe9\xed\xe9&\x93\xc9bK\x19\
+\xfah\xf3\xb4g\xf2<\x96\x81\xc7\x80x\xbc\x999\xb1\
+8g\xc4\xe2\x5c\x1c\xf78\xcdsY\xe4@\x0a!\xac\
+\xdb\xde\xab\xc6\xfa\xb5k\xd9\xb6i5\xb3OZT\xb6\
+6\xc48s\x1d7~\x96\xaa>Sn\x9b\xcc V\
+\xe8\xc31\x13( \xf3\x88R\xbd\x96\x850\x0cY\xbd\
+r\x05--\x03\x9b$\xeb\x94\x11\x85L\x18pS:\
+\x8f\x15\xe1\xc9l\x865\xd9\x14\xb9\x5c\x9a\xf2\xccJ\x05\
+\xe3\x18\x5c\xc7%\x91lb\xfa\xccY\x9cz\xda\xe9\x9c\
+{\xee9\x5ct\xc1\x05<\xff\x8aK\x86\xfc\xe8X\xab\
+l\xde\xda\xc2\x8f\x7f\xf23vn\xdb4(\xb3{\xb9\
+\xf9\xd4\xc7\xfe\x0d\x80\xef}\xfb\xeb\xec\xdd\xb3\xabbV\
+\x03\xd7\xf5\xb8\xec\x8a\x17\xf0\x99\xcf|\x9a\x8b\xce;\x0b\
+\xdf\x0f\xb0e\x0di\xeb\x9fL\xba\x97;\xfe|\x0b\xa7\
+\x9f\xb6\x88\x0f\xbd\xff=\xc7\x1cIp\xe6\xe2\x85\x9c\xb9\
+x!\x00\xbb[\xdb\xf9\xd3\x9fne\xd9s\xcbY\xb5\
+r\x15\x9b7\xad\xa7\xb3m\x1f\x81\xefG>\x08%L\
+\xf6\x92\xcb\xf5\xb0.\xd7\xc3:\xe0\xb7N\x9ci\x89F\
+.K6p\x92\x17cM\xbe\x9e\xc7\xbdZ\xec\xde\xb3\
+\x97\xaf}\xe3;|\xe7\xbb\xdf/[\x1bb\xdc\x85\xc6\
+k~o\x98\xeb~o\xb9\xfd#\x07|\x1a\xdcX\xf3\
+p\x8e\x1f#\xca\xd9\x1e\x1b\xceA\xfac\xcd\xaa\xe7\xb8\
+\xf3\xce\xdb\xcau\xf8:\x83F\xe9\xf5\xb3\xfc\xa4m\x17\
+\xd6Fa<\xe5\x14\xc2\x86\xe6q\xcc\x9cs\x12g\x9d\
+u\x16\x97^|\x11/\xbc\xear\xe6\xcf\x9f\x8b)\xc4\
+\x7f\x0fg\x1e\xbc{\xcf>\xae\xff\xd6wx\xe0\xde;\
+\xaa*^\x87\xf3\xf1\xff\xf8 \x8a\xf2\xedo|\x95\xb6\
+}{+\xd2\xe6\xc5\x97?\x9fk\xaf\xfd\x14\x17_p\
+nE\xda\x1b\x0c\xad{w\xf1\xe3\x9f\xfc\x84s\xcf9\
+\x93\xcb.\xbe\xe8\x90\xe44\xc7\xc2\xb4I\xe3y\xcf;\
+\xdf\x86\xaa\x92\xf3\x03\x1ex\xe8\x11\xee\xbb\xff!\x96<\
+\xfd\x0ck\xd6\xac\xa2}\xef.\xac-\x83u&\xcc\xb1\
+7\x95\xe3\x0f\xe9\x0e\x8c\x18*W\xfd\xa0\xce\xe1\xf4\xf4\
+\xf4r\xdb\x1dw\xf1\x1d\x0dA\x86v\x1f\x0d\x828\xe8\
+y@#\xd0[\xaeF`\x10\x82>\xe4}NU\xc4\
+\xf5\xe6\x1b'\xfe\x9a\xa1\x1d`p<\xfe\xe4R\xee\xfd\
+\xeb#\xe5l\xa2\xce1\x90/cN\xeaq\x93fp\
+\xea\xa2E\x9cw\xee\xd9\xbc\xeaU\xafb\xfe\xbc\xd94\
+75\x92H\xc4I&\x92\x183|sVo*\xc3\
+o\xfex\x0b7\xfe\xea\x975%\xe6\x00\x8e\xe3\xf0\xc1\
+\xf7\xbd\x87M\x1b\xd6s\xc3\xcf\x7f\x0a\xe5\x10\x9b\x83\x98\
+1k\x1e\xefy\xf7?q\xc9\x85\xe7\x96\xe4\xda\x96\x0a\
+U\xcb\xe6u\xab\xf9\xfc\x17\xaf\xe3\x87\xdf\xff\x0e\xf3\xe6\
+\xcc\x1c\xd2qD\x04\xc7\x89\x06q\xd7uy\xd1UW\
+p\xd9E\x17\x90\xcd\xe5\xd8\xb8q+\xf7\xde\xff\x00K\
+\x96>\xc3\x8a\xe5+\xd8\xbe}+6W\xba,vJ\
+\x94\xa6\xdajH9k\x0d\xd4\x19\x98\xce\x8ev\xfe\xf0\
+\xfb\x9bx\xc5\xab\xde@,6\xf4\xe4L\xfd!\xc69\
+\xc1\x897\xbd\xc1\xcft\xfe\xac,\x0d\x14(_\xd8\x9a\
+\xb5`\x9d3q\xb8lh\x07\x18\x98\x5c\xba\x8b\xe5\xcb\
+\x9e\x22\x9b\xad\xd7\xb1\x1e\x9d8\xcc\x98=\x8f3\xcf<\
+\x93+\xae\xbc\x9c\xcb.\xb9\x98I\x13'0vL3\
+\x93'O\xa6\x1c\x1as\xff\x03\x8f\xf0\xbd\xff\xf9\x1e\xe9\
+\xee\xda,\xec3nL\x13s\xe6\xcc#\x91l \x9b\
+\xea*k[\x13'M\xe1\xc4\x13g\xe2\x0d\x90\xec\xa5\
+\x1a\xe4\xf3Y\x1ey\xe0\x1e\xbe\xf6\xcd\xef\xf2\xa5\xcf}\
+\x8a\xb1c\x86\x9f/#\x16\xf3\x88\xc5<\xc6\x02S\xa7\
+L\xe6\xd4SO\xa6\xbb\xbb\x9b\xfd\xed\xed<\xf3\xcc\xb3\
+,yf\x19K\x97-e\xd5\xaa\x15\xe4z;\x87\xdd\
+^\x9d\xda\xa0\xb7\xb7\x97o~\xfb\x07\xbc\xe4e\xaf#\
+V6[2\x93\x10\xf3~\xd4\xdepXi\x80\x922\
+\xb0S\xdc\x10B\x89T\x15\xe3\xc6\xc7\x8b\x1b\xbb\x00(\
+[\x9d\xba\xfb\xee\x7f\x90{\xffz\x7f\xb9\x0e\x7f\xdc`\
+\xc40i\xda\x0c&O\x99F\x10\xf8}iK\xf7\xef\
+\xdf\xc7\xfe\xbd{\x86t\x0f\x0c\x95\xa6\xb1\x938\xf9\x94\
+\x939\xf5\xd4E\x5cx\xd1\x85\x9cz\xca)L?a\
+\x1a'\x9e8\x831M\xe5+y\x08\xb0r\xcdz\xfe\
+\xe7\x07?`\xe3\x9a\xe5\x83\xfa\xfc\xb4\x99'1v\xcc\
+\x18\xac\xda\xbf\xcd\x5c'\x821\x860\x08\xd8\xb9};\
+\x99Tg\xc9\xfa\x19\x86\x03'\x8di\x1a3\x9e)'\
+\xcc \x11\x8f\x93\xcf\xfb\x07\x85\xc0\x0a^\xcc\xa3m\xff\
+~\xda\xf6\xed.\xc4\xfb\x1f\x19U%(\xa5C\xa0\x18\
+f\xcc:\x89\xf1\xe3\xc7\x93\xcb\x1d\xd9\xc3\xdc\x18\x87\xc0\
+\xf7\xd9\xb6m\x0bA\xae\x7f\xeb`.\x9b\xe6\xa6\x1b~\
+\xca\xe9\xa7.\xe4\x1do\xff{\x1a\x92\xa5\x8d'\x9e0\
+~,\x13\xc6\x8fe\xce\xec\x99\x9c\xbe\xe8T^z\xf5\
+\x8b\xd9\xbdg7;v\xeeb\xd9\xb2gy\xec\xb1\xc7\
+Y\xbbv-\xbb\xb7o\xa1\x92Q\xe5\x89\x86fN\x9c\
+=\x97X,\x86\xef\xfbx\xaeK&\x93a\xcf\xee\x9d\
+dz\xcb;\xc9\x1b\x8d\x04A\xc8\x93O.a\xe7\xd6\
+u\x9c\xbc\xe8\x0c(\xcf\x16\x88+\xc8\x02q\xdc\x8b\xa3\
+\xa2-\x94eP\x1d\x84\xa0\x1f\xfbd\xc2\xaa\xc5Hb\
+\xb1\x88\xf3\xc2!\xf5j\x90\xdc{\xdf_Y\xbb~S\
+9\x9b8.hl\x1e\xc3\xeb\xdf\xf8\xf7\xbc\xfc\xea\x17\
+\x1f\xc8A.p\xef}\x0f\xf0\xbf\xdf\xff\x1e\xbd]\xfb\
+\xcb\xd7\xb88L?q6\xa7\x9cr2g\x9cq\x06\
+\xa7/^\xccI\xf3\xe61{\xf6,\xe6\xcd.[Z\
+\xc6\xbfa\xcf\xbe\xfd\xfc\xe0\x7f\x7f\xcc_\xef\xbd\x93\xc1\
+$\xec\xbc\xe8\xb2+\xf9\xc8\x87?Lcc#V\xc3\
+#\xe9y\x9f8-y\xe6Y\xfe\xf7\x7f\xff\x87\xbd;\
+[J\xd2\xd7 \x08\xb0\xb6\x7f\xcb\xd9\xc5\x97>\x8f\xb7\
+\xff\xc3;\x982i\x02y?Ji\x02Q\xcdx\xd7\
+s\xb9\xff\xa1G\xb8\xe1g?aW?\x95\xcd\x8a\xce\
+a\xa5@\x1c\x97\x97\xbc\xf4U\xbc\xfb]\xffDss\
+\x13\xb9\xa38\x829\xc6!\x97\xcf\xf1\xe0C\x0f\xf3\xc3\
+\xef\xff\x0f\xe9\x01\x04\xaa\xb3c?\xdf\xf8\xc67\x993\
+{&/\xbb\xba|\xc3M\x22\x1ec\xd6\x89'0\xeb\
+\xc4\x13\xb8\xf0\xbcs\xb8\xfa\xc5/b\xf5\x9aul\xd9\
+\xba\x8d\xf5\xeb\xd7\xf3\xdc\xb3\xcbX\xb7n-\x1b6l\
+\x22[\xc2\xc9\xdb\x91X|\xd6\xb9\xbc\xff\xfd\xff\xc2\xb4\
+\xa9S\xfb2\x13\xee\xd9\xb3\x97\x1f\xfd\xf8\xa7<\xfa\xc0\
+]em{\xb4\x92\xcf\xe7\xb8\xe9\xe6\x9b\xf8\x7f\x1f\x9e\
+\xcd\xd8qe*7\x22\xe29^\xc3\xdb\xc2 \xb3\x14\
+\xad\x92\xa0\x8b9vs\x9b\xd1P@.\x01N\x1bJ\
+\xa7\x06\xc3\xde=;Y\xfe\xdc\xb3e\xcd\xe9}\xbc\xd0\
+\xd8\xd4\xcck_\xf3j^x\xc5%\x87\xbc\xef\xfb!\
+7\xfc\xe2\x17e\x13\xf4\x89SN\xe0e/\x7f%W\
+^y%g.^\xcc\xa2E'\x93\x8c\x97\xcf\xe6u\
+42\x99,\xffw\xd3\xaf\xb9\xf9\xc6_\xe2g\x07\xde\
+']t\xc6\xd9|\xfa\xdak\xb9\xfaEW\x0e\xea\xf8\
+\xcf\xbf\xea\x0aR\x994?\xfa\xdew\xe9.Ar\x13\
+c\xcc\x80\x85_.\xb8\xe0\x02\xde\xfa\xc6\xd7\x1e\xf5\xdf\
+E\x0c\x7f\xfe\xd3\x1f\xfa\x15t\x91\xd2\xa5>9\xef\x82\
+K\xf8\xe4'>\xce\xa5\x17\x0d\xce\xb9\xee\xe2\x0b\xcfg\
+\x7f[;\xbf\xfe\xd5/\xf0s\xfdW\xad\xdb\xb8n9\
+\xff\xf3\xbd\x1f0\xe3\xc4\x19\x9cy\xfa\xa9\xa5\xe8\xee\x80\
+4&\xe3\x9c\x7f\xce\x19\x9c\x7f\xce\x19\x00l\xdd\xbe\x8b\
+U\xab\xd7\xb0b\xc5*~\xf7\xbb_\xb3\xec\xe9\xa7\xb0\
+e\xb2l\xcd\x9d;\x97W\xbd\xec%\x8c\x1fw !\
+ROo\x8a\xbf\xde\xff \x8f>P\x96&G=\x22\
+\xc2O\x7fq\x13oy\xfb\xbb\xca'\xe8\x900N\xfc\
+U\xa1\x9f\xbe\x1e\xb5\xebAJ.^\x83\x10\xf4c3\
+?\xa8*\x8e\x89\xcf\x10\xe3^D\x19\x83\xee~\xfd\xeb\
+\x9bX\xbdzM\xb9\x0e\x7f\x5ca\x8ca\xd2\xa4)\x84\
+\xa1\xe2\x1cR\x02\xb4\xa7\xe0\xb4S\x1e\xce<\xeb\x1c>\
+\xf1\xf1\xff\xe2\x94\xf9s\xca\xd6\xc6\xe1\x1c\x9c_\xbe\xc8\
+\xbd\xf7?\xccO\x7f\xfcc\xdaZ\xf7\x0c\xf8\xfb\x93\xa6\
+\xce\xe0=\xefy\xef\xa0\xc5\x1c\xa2\xc1\xff_\xdf\xfbn\
+6o\xdc\xc0m\x7f\xfa\x1d\xfeQ\x0b\xbd\x94\x8ed\xb2\
+\xff\x92\x09==\xbd\x15K\xc44}\xe6<\xde\xfb\xcf\
+\xff<h1\x07\x98:y\x22\x1f\xfb\x8f\x8f\xd0\xb2u\
+\x0b\x8f>x\xef\x80\x96\x82;n\xbf\x95\x93\xe6\xcf\xe7\
+\xdaO~\x94I\x13\xa2\x01\xf9\xe0\x02)\xe5v\xe9\x9b\
+3s:sfN\xe7\xe5/y\x01b\x0c\xabV\xae\
+*\x9b\x8fC>\xef\xd3\xd5\xd5}\x88\xa0wvv\x91\
+\xcd\x962Q\xce\xf1\x85\xaa\xd2\xd2\xb2\x9dukV2\
+g\xf6l\x5c\xaf,\x0b\x0bAd\x1ap%\xaa\xdb\x81\
+\x92\xd7\x0a\x1e8\xf5\xeb1V2R\xb5\x98\xf8\xd8K\
+\xc5\xf1N\x1fr\xaf\x06\xc0\x86\x01w\xfc\xe5>v\xef\
+\xd9W\xae&\x8e+T\x95 \x0c\x8eP\x02\x14\xd4\x1e\
+\xfb$R\x8cA\xc4\xa06\xecw\xaf7\x99L\xe0\x97\
+1\x067\x9f\xf7\xc9\xe7\xf3\xf4\xa4R\xeckm\xa7u\
+\x7f;\x822w\xceL\xe6\xcd\x99\x05@\xce\x0f\xf9\xe9\
+\xcf\x7f\xc1\x9a\x95\xcf\x0dx\xbcx<\xc1\x9b\xdf\xfc\x16\
+\xfe\xf1\xedo9\xe6\xbe\xcc\x99=\x83\xf7\xbd\xef_\xd8\
+\xd1\xd2\xc2\x92\xa7\x1e+i\x8c\xf3\x91\xf0}\x9f\x108\
+Z N\x10\x86\x03\x9a\xedKA2\xd9\xc0?\xbe\xf3\
+\x9fx\xfd5\xaf:\xe6\xdf=m\xe1|\xfe\xed\xdf>\
+\xcc\xfe\xbd\xbbY\xb3zE\xff~\x03\xd6\xe7\xd77\xfd\
+\x8a3\x16/\xe6]\xff\x18}?\xbd\xa94\xab\xd6l\
+\xa0\xab\xb3\x8bqc\x9b\x992e\x12\xe3\xc6\x8e%\x91\
+\x88\xe1\xb9\xde\x90\xc3\xdd\x06B\x04\xdc\x01\x1c\x09\x8dq\
+@\x04;\x84\xa8\x90\xa3]\x87jd4\x1cm\xdct\
+\xd3\xffq\xfa\xe23\x98=gp\xd9$\x87\x80\x8a\x1b\
+\x7f\xa9\x06\xfe\x1d\xa0\x95\x17\xf4c\x9f\xdb\x8a\x00\xa7\x03\
+\xb3\x86\xd0\x9fA\xb1u\xf3Z\xf6\xed\xadL%\xab\xe3\
+\x06U\xacZDM\xe1\xaf\x8a1\x06\xc7\x0cf\xd0\x13\
+\x8c\x11\x8cqH441k\xceI\xe4|\x9f]-\
+\x9b\xc9\xa4z\x8e\xfa[\x99L\x8e|\x89V\xab\xaa\x1a\
+\xc5\xbf\x87\x96\xdeT\x86\xae\xee\x1eV\xaf]\xcb\xbau\
+\x1bX\xbat\x19O/Y\xc2\xfa\xb5\xabH&\x93\xbc\
+\xf3\xdd\xef\xe1\xbb\xd7\x7f\x05\x80\x9d{\xdb\xd9\xb6e\x13\
+\x03\xed\x9b\x8b\x18.\x7f\xfeK\xf8\x87\xb7\xbf\x8d1\xcd\
+C+Q\xfa\xc2+/c\xc3?\xbd\x8b\xed;v\xb0\
+g\xe7\xd6!\x1dc\xf0\xf4\xff\xdc:\x8eA\xca\x1c\x8a\
+f\x8c\xe1\xe5\xaf~\x1do}\xcb\x9b\x18\xdb4\xb4k\
+\xf6\x9aW\xbc\x98\xb5k\xd7\xf2\xb5\xaf~\x99\xb6\xd6\xfe\
+S\xdf\xee\xdb\xb3\x83\x15+W\xf4\xfd}\xe3\xa6m\xbc\
+\xed\xed\xff\xc0\xc65\xab\x984\xed\x04\xce8\xeb\x1c\xce\
+?\xff<N;u!'\xcd\x99\xc3\xc9\xa7\x9cDs\
+C\x12\xc7\xf3\x0e\xe4/(A\x1a\xd6\x5c.O\x18\xf4\
+oQ\x98v\xe2l&O\x99N\xeb\xde\x9d\xb4\xee\xdd\
+\x89-L\xb0\x06#\xca\x8e#X\xd5C>\xab\xaax\
+\x9e7\xec\xbe\x1f\xef\xfc\xe1\x96;y\xc7;\xff\xa5\x9c\
+\x82.\xc6\x89\x9dk\xc3`\x9a\xaa\xddQj\xb3\xfb\x80\
+\x82n\xdcc\xf4\x1cU;W\x8cs\x11QZ\xef\xb2\
+p\xc3/ob[Ki\x1c\x8c\xea@oo\x0f\xbf\
+\xfe\xedo\x998\xfe\xdd\xc4\xe2\x09<\xcfe\xc7\x8e\xed\
+<\xf2\xf8\x13G\xf5F>\x98X\xa2\x91\x85\x8b\xcf\xe4\
+\xf2\xcb.\xe5\x15/{)\x97^t\x1e?\xb9\xe1&\
+\xbe\xfc\xc5\xcf\xf7+\xe8\xa5\x92\x93Pak\xcbNV\
+\xac\x5c\xc9\x9a5\xeby\xfa\xe9%\xac]\xb3\x9a\xdd\xbb\
+[\xc8\xf6\xf6\x12\x86ad\xb2\xb5!\x99^\x9f\xf5k\
+\xd6\x1e\xf8\xdd0d0\x1e\xca\xb3\xe7\x9d\xcc\xfb\xfe\xf9\
+\xbd\x9c\xb9xx)\x22\xdf\xf8\xfa\xd7\xb2a\xc3\x06\xbe\
+\xf9\x8d\xaf\xa1\xc1\xe8\x0e\xb7\x5c\xb0\xe8l>\xf8\x81\xf7\
+s\xf2Is\x86u\x9cw\xfe\xe3\xdbX\xbbv-\xbf\
+\xf8\xc9\x0f\x19(f\xbbh\x9aO\xa53<\xf8\xf0\xc3\
+\xec\xd8\xb2\x1e\x08h\xdb\xbb\x83\x87\xee\xdd\xcd\xa3\xf7\xdf\
+\x89\x1b\x8b3a\xd2T\xe6\x9f|*\xe7\x9e{.g\
+\x9dq:\xb3g\xcf\xe2\xd4\x93\x170q\xc2\x91\x0b\xf5\
+\x94\x9a\x17<\xff\x05|\xee\xb3\x9f\xc6s\x0d7\xfe\xfa\
+\x0f\xdcy\xe7\xdd,{\xf6\x19:\xf6\x0d\x9c\xf1r\xc7\
+\xf6\x9d<\xbb|%\xae\x97\xc0\x8b\xc5I\xa5zx\xf2\
+\xc9\xa7\xd8\xb9sG\x05z>\xba\xc9\xa4\xd3\xb4lY\
+\x07\x94\xcf\xc1\xd2\x18oz\xa8\xf6r\x0d\x83\xb5\x88\x1c\
+}\x80\x1c\x02\xa55\xb9\xab\xe2\xc6\xc6\x9c!\xc6\x1dZ\
+\xa6\x87Ar\xfb\x1dw\xd1\xd9\xd9]\xce&\x8e+R\
+=]\xfc\xf8{\xdf\xe2\x96\xdf\xdf\x0c\x80`\xf0\xfd<\
+\x9d\x1d\x1d\xf4v\xf5\x1f\x8f=o\xfe\xc9\xfc\xfb\x7f\xfc\
+\x17/\xbb\xfa\x054551\xa6\xb9\x19\xcfs\x89y\
+\xb1\x92\xacv\x8e\x84\x05\xd6o\xd8\xc2\xc6\xcd\x9bY\xbe\
+b%\xcf=\xbb\x9c\xb5kV\xd2\xbag'\xd9l\x96\
+t:\x13MD\x8eh\xd6\xb6\xec\xd8\xbe\x8d\xd5k7\
+\xb0h\xe1|\x8c1\x98\x01\xfai\xbc$\xefy\xcf\xbb\
+y\xe1\x0b\xaf,\xd4\x10\x1f:\x13\xc6\x8f\xe1Moz\
+\x03\xabV\xaf\xe4\xee\xdbo\x19\xd6\xb1j\x99\xc61\x13\
+\xf8\xe8\x7f~\x84\x0b\xcf?\x073\xcc*SS&\x8e\
+\xe7\x1d\xef\xf8\x076\xac_\xcfc\x0f\xdf\xd7\xefg\x8b\
+\xf7\x5c>\x9fc\xe3\xc6M}\xfe\x0aQ\x08^@\x10\
+\x04\xe4r9R=\xdd\xec\xde\xd9\xc23O<D\x22\
+\x91\xa0y\xecxf\xcd9\x893\xcf:\x9bs\xce>\
+\x8b\x85'/`\xee\xac\x99L\x9a4nX}?\x1a\
+'\x9cp\x02\xb3f\xce\xc0\x08\xbc\xf7]\xff\xc0\x9b\xdf\
+x\x0d\xa9t\x9a\x8f\x7f\xea\xb3\xdcq\xeb\x1f\xc8\xa4\x8f\
+\x1e\xb2\xf7\xdc\xd2'\xf8\xd0\x07\xdeGC2\x0a\xe3\xb4\
+\x16R\xe9\x14\x9d\x1d%\xae&w\x9c\xf2\x97;\xef\xe4\
+\xd2\xe7]\xc5)\x0b\xcb\x96\xdf\xdd\x88\xe3\x9e\x8b\xea$\
+\x84\xca\x0a:\xc7\xb2\xcf\xa6!\x88\x9c\x0d2}\x18}\
+\xea\xa7+\x96\x0dk\x9fe\xf7\x9e]\x15\xd9\xff;^\
+\xb0\xd6\xd2\xd9\xd1N\xe7\x10\xcaa\xce;i\x01\xaf}\
+\xdd\xeb\x986\xf1\xd0\x14\xc1~\x10\x0ci\xff\xfdH\xa4\
+\xb2y6l\xd8\xcc\xa6\xcd\x9bY\xb9r\x15\xeb\xd6\xaf\
+g\xf3\x86u\xb4\xedo\xa5\xb3\xab\x93\xae\xce.\xfc|\
+\xff\x9e\xd0\x07\xb3\xbfu/\x8f<\xf6$\x0bO>\x09\
+1f\xc0\xf5\xf9\xa4)\xd38\xf7\xbcsij\xe8\xdf\
+\xd1l\xb0\x9c\xb5x\x11W]u\x15w\xdf~+\xa3\
+\xb5*\xf6\xac\xb9\xf3\xb9\xe4\xa2\x0b\x88\x95\xc8\x0c|\xf1\
+\x05\xe7p\xd5\xf3\x9f\xcfc\x0f\xdfO4\xa5;2\xa6\
+P{\xa2\xb77\xc5\xcaU\xab\xfb\xbd\x07\x83|\x8e\xee\
+|\x8e\xee.\xd8\xb7w\x0f\x9b6\xacg\xc9\x93\x8f\xf2\
+\x87\xf1\xe3\x197v\x1c'\xce\x9a\xcb\xa9\xa7/\xe6\xb4\
+E\x0b9e\xc1\x02N\x9c1\x9dY'N+\xc9\xf9\
+\x18c\xb0\x0aF`Ls\x13c\x9a\xa3\xc48'\x9f\
+\xbc\x90{c\xf1~\x05=\x97\xcd\xb0\xa3eh\xa5g\
+\xeb\x0c\xcc\xdd\xf7<\xc05\x7f\xb7\xbc\x9c\x82\x8e1\xb1\
+\xf3\xad\xb1ST\xed\x96R\xbal\x0e\xec\xe5\xee\x1c\xc3\
+\x03\xa9\xeed\x90K\x81a%\x80?\x1aA\x18\xf0\xd3\
+\x9f\xdd@Ww}u^+$\x12\x09\x1a\x1bJ\x9f\
+\xf0e\xc3\xa6\xad\xacX\xb9\x9a\xf5\x1b7\xb2f\xcdj\
+6o\xd8@\xeb\xfeV\xf6\xee\xd9Cg{;\xc3I\
+\x97\x99J\xf5\xf2\xcc\xb2gy\xe7\xdb\xdf4\xa8G)\
+\x16\x8f\x95t\x7f2\xe6y\x8c\x193\x96r\x8ay\xcc\
+\xf3\x8e\xea\x10\x07\xf4\xed\x19\x97\x8bD\x22Q21\x07\
+\x88\xc7\xbcAUW+\xa6\xa8\xed\xe8\xeca\xed\x9a5\
+\xd8c\xb9\xc6\x1a\xd2\xd3\xd5AOW\x07-\xc0\xf2\xe7\
+\x96r\xff\x03\xf71u\xcad\xa6L\x9e\xcc\xd4\xa9\xd3\
+9e\xe1\x22\x16.Z\xc8\xa2\x85\x0bYx\xf2|\xc6\
+\x8f\x1b\xdaP\x17\xed\x81\x1f\xa1\x0b\xf5\x85J\xd5\xe9\xee\
+\xe9e\xf3\x86uem\xc38\xde\x1c\x1b\xe4\xce\xb3\xd6\
+_&\x98\x92y\x06\x0f(\xe8N\xec\x18R*\xaa\x9e\
+\x8bq\xca\xe6M\xe0\xfb9~\xf3\xfb[I\xf5\x96\xdc\
+9\xb0\xce\x10\x09\xc3\x80|>\x0f\x03\x84I\x0d\xfax\
+\xd6\xb2t\xd9\x0a\xbe\xf1\x8do\xb0t\xd9\xb3\xb4\xb4\xb4\
+\x90\xe9-m\x1a\xd6\x5c.\xc7\x9aU\xab\x09C\x8bc\
+\xcc\x80\xa2\x1e\x86a\xc9C\xbc\xf2e\xae\xb0\xd5\xd5\xd5\
+I`\x15\xf7(\x8eo\x8e\xeb\x965\x85C\xe0\x07%\
+KJS$\xbaf\xfdw\xda\xf3\x5cB\x0b\xcb\x9e]\
+N\xeb\x9e\x1d\x03~~ 2=\x9dl\xed\xe9d\xeb\
+\xa6\x0d\x00\xdcv[\x9c\xa9'Lg\xfe\xfcy\xbc\xfe\
+uo\xe0C\xff\xfa\xdea\x1d\xffp\x02\xdf\xaf{\xab\
+\xd7\x00\xcf<\xfd$-\x9b\xd73k\xde\xc9\xe5i@\
+\x8c\x8b\xc8\x85\x22\xe6\xcf\x22NK\xa9&\xf7%-\x9f\
+*\xc6\x9c\x07\x0c<\x8d\x1e\x026\x0c\xd9\xb4n\x15\xdb\
+[Z\xea7\xfc(&\x08\x02\xee\xbb\xff!n\xbe\xf1\
+\x97e\x0b\xed\x0a\x03\x9f-[6\xd0\xd9\xd5\x83\x883\
+\xec=\xdeZ\xe4\xc9'\x9f\xe4\xffn\xfa-\xf3f\xcf\
+\xa47\x95>0i\x11\xa1\xa9\xb1\x81G\x1f{\x82\xae\
+\xce\xce*\xf6p\x08\x0c\xc2\xa0\x10\x8b\xc5\xc8d\xf3<\
+\xf1\xe4\x93\xd828\x1dj\x98c\xcf\x8e-\xec\xd9\xb1\
+\x05\xc7qy\xff\xfb\xde\x8b[\xca\xdb\xa7\x8cV\x93:\
+\x83\xe7\xe1\xc7\x9e\xe4\xce{\xef\xe7=\xef)\x93\xa0\x03\
+\xc6\x89\x9d\x8e\xeaL\xb0-\xa52\xbb\x0f\xec\x14\xe7\x0f\
+zo2\xe1x\x0d\x17 R\x16A\xef\xee\xe9\xe6\xe6\
+\x9bo\xc6qL\xc9g\xfeuj\x08\x8d\xb6V\xc6\x8c\
+\x19CWWgy\xda\x10\x83\xebyttw\xd3\xd8\
+4\xbe\xac\xa6\xe7j\xf1\xe4\x13\x8f\xb1f\xddz<\xcf\
+\x8b\xfcM\xfa\xe6\xc0\x8a\xe3z\xf4vw\xd1\xd3Y\xc6\
+\x94\xbe\xd5B\x95\xc0\x06`\x04\xc7\x8d\x11\x06\xe5\xb3\x84\
+\xb8\xaeK\x10\x1e\xdd\x0aRg\xe4\xb2\x7f\x7f;\xcbW\
+\xac\xa4\x9ci\x89\xc4\xf1\xe6\x13\xe4\x16\x84~\xee1\x91\
+\xd2\x84\xaf\x0d\xbcB\x1f\xdc\xea\xc5\x00g\x02\xe7\x0d\xea\
+\x98C\xa0\xbd\xa3\x83_\xde\xfc\x07|\xbf.\xe6\xa3\x1a\
+\x01/\xe6\x95p\xa5\x228\xae\x83\xebz\xc4\x13\x09\xc6\
+M\x98\xcc\xcc\x13gq\xd1\xc5\x970~\xcc\x182A\
+X\xd6\xba\xed\xd5\x22\x9b\xee!\x9b.\xa9\x03\xed\x88 \
+\x9b\xcf\xd3\x90L\xf2\x82+\xae`\xd3\xa6\xcd\xec\xde\xb1\
+\x9d}\xfbv\xd1\xdb\xd3\x8d\x9f\xcf\x13\x04A\xc9\xf6\xa9\
+\xbdB\xfcz\x9d\xd1\xc9\xf6\xad\x1bio\xdd\xc9\x84\xc9\
+\xe5\xa9)!b\x9a\xc58\x97!\xf2G\xc4\x94$\xad\
+\xe0\xc0{\xe8\xee\xa0\xf6F\x1d\xe0l\xa0<\xc5d\x81\
+\xf6\xd6\xdd\xech\xd9^\xae\xc3\xd7\x19e\x88\x08^,\
+\xc9\xd8\xf1\x93\x989{6\x0b\x16\x9c\xc2\xb9\xe7\x9e\xcd\
+\x0b\xae\xba\x9cs\xce<\x90\xc4pc\xcb^\xc2\xb0\xee\
+\x884Z\xc8\xe7}b\x8e\xf0\xfak^\xc9\xeb\xafy\
+%\xbd\xa9\x0c\xb7\xdfu\x0f\x8f?\xf1\x14\xabV\xadb\
+\xf3\xa6\xcd\xec\xdb\xb3\x83t\xaa\x1b\x0d\xfb\xcfd8\x10\
+\xf5\xad\xbf\xd1\xcd\xf2\x15\xab\xb8\xf5\xb6\xbf\xf0\x8e\x7f|\
+w\xd9\xda\x10\xe3\xccv\xdc\xf8I\x88,-\xc5\xf1\x06\
+\x14t?3\x98P&\x11/9\xee,\x90\xd2\xd6/\
+,\xd0\xd5\xd9\xce\xfd\x7f\xbd\xa7\x1c\x87\xaeC$~\x8d\
+c&\xd24f,a\x18DV&cH\xf7t\x91\
+\xea>\xf6P\xb6j!n\x82\x89\x93\xa60g\xee<\
+N>y\x01g\x9fu\x16/y\xd1\x95\xcc8\xe1\x04\
+\x1c\xd7\xc5\xf3\x5c\xe2\x87\x15<\x16\x91\xb2\xe7\xf9\xaeS\
+=\x9a\x1a\x93\xbc\xe6\x15W\xf3\xf2\x17\xbf\x80 \x08\xc8\
+\x07\x01K\x9f[\xc1\xed\xb7\xdf\xc9\xea5k\xd9\xbcy\
+\x13{w\xef$\xd3SZ\xc7\xcbr\xe2x1\xc6O\
+\x9c\x8a\xeb\xc6\x08\xc3\x001\x86 \x9f\xa7\xbb\xab\x9d\xe0\
+\x18\xc27\xeb\xf4O\xcb\xf6\x9d<\xf8\xf0\xe3e\x15t\
+\xc4\xcc\x05\xe6b\x83\xa5\xa50\xed\x0f\x22\x0e}0\xde\
+\xbd2\x098\x1f(\x8b\xa0\xef\xd8\xb9\x9b\x9b~\xfd\xc7\
+r\x1c\xba\x0e0f\xecx\xfe\xe5\x83\x1f\xe4\xef\xaey\
+5\x8e\xe3\x16J\x7f\x1an\xfd\xf3\x9d|\xe9K_\xa4\
+\xa7\xb3\xb5\xda]<2&\xc6\xe4i3\x987o\x1e\
+\xa7\x9dv*\x97\x5cr\x11\x17\x9cs\x0e\x0d\x0dI\x92\
+\xc9\x04\x8d\x8d\x8d\x8c\x1dS\x96\x08\xca:#\x88x,\
+v\xc8D\xee\x05W<\x8fs\xceXL:\x9d&\x93\
+\xcd\xd2\xd6\xd6\xc1_\x1fx\x90%K\x96\xb2a\xc3\x06\
+Z\xb6m%\xddS\xbbIZ.\xbe\xf4J>\xf9\x89\
+\x8f1s\xc6t\xf2\xf9<\xb1\x98G\xcb\xce\xdd\x5c\xf7\
+\xb5o\xf0\xd7\xbb\xfe\x5c\xed\xee\x8d\x1a\xac\xb5\xec\xdc\xbe\
+\x0d\xf5\xd3\x88W\xfa\xd0\x5c\x00\x113K\xc4,T\x1b\
+\x96d\xab~\xe0\xd4\xaf\x03\x9f\x88\x07,\x06Y@\x99\
+*\xc3\xb7\xb7\xedg\xc5\xca\xd5\xe58t\x1d \xd9\xd0\
+\xc8\xcb_\xfe\x0a\xce>\xf3\x8cC\xde_\xbfq+\xf1\
+d\x92\x9e\xce\xea\xf4\xebh\x88\x08S\xa7\xcf\xe6S\x9f\
+\xfa\x14\xa7-Z\xc8\x98\xb1c\x980~<S\xa7N\
+!\x11\x1b\xfd\xf9\xac\xf5\xb0<\xde\xe5k\x87Q\x99\xf7\
+\xc6s\x1d\xa6L\x9e\x08L\xec{o\xd1\xa2Sh\xdd\
+\xb7\x9f\xce\xae.\xb6lm\xe1\xc6\x1bo\xe4\xb6?\xff\
+\x09\x0d\xfd\xeau\xf4(L\x9bv\x02g\x9fy&S\
+&O\xe8{o\xea\xb4\x13\x981cF\x15{5:\
+\xd9\xb1};\x0f>x?W\xbe\xf0\xe5e9\xbe\x88\
+\xe3\x898\x8bB\x9bi\x141G\xcf&4HJ!\
+\xe8I\xa2\xd5\xf9\xd0\xaa/\x0c\x80\x9f\xcf\xb2n\xcd\x0a\
+\x82\x0a\x95z<\x1e1\x22456\x13\xda(.\xbb\
+H6\x9b\xad\xc9}B\x11a\xee\xfc\x93y\xe3\x1b\xae\
+a\xe2\x84q\xd5\xeeN\xc5\xf1\xcb\x10\xe3}\xc4v\x02\
+\x9f`\x08\xd5\xc0F\x22\x13\xc6\x8deB\xa1\x1c\xe9\x85\
+\xe7\x9fCo*\xc5]w\xdfM>]\x9e\x12\xa8\xc3\
+!\x08C\xd2\xe9\x14p@\xd0\xd3\xa9\x14\xbe_{\x93\
+\x8f\x91\xce\xb6\x96\xed\xdc\xf8\x9b?\x96M\xd0#s\xa8\
+3OD\x16\x8aq\x9e\x19\xee\x0cz\xc0\x15\xb5\x1cT\
+\x85\xe8(\xaf\x98\x889\x9b2\xcd\xe5\xb7m\xdb\xc2]\
+w\xddY\x8eC\xd7)\xa0\xaaQ\xd2\x8e\xc3\xbeAk\
+m\xcdf\xae\xf2b\x1e\xd9\xec\xf1\x99`(\x9e\x88a\
++ \xe8\xc6up\xdd\xb2\x04\xad\xd4<\xe3\xc6\x8d\xab\
+\xd9p\xc6#UeSU|\xff\xf8\x98|U\x92t\
+&\xcb\x92\xa5\xcb\xca\xdb\x88qf\x1a'vNd\x10\
+3G}\x0d\x86\x01\x9fV\xb5\x03\xcd\xfad\x8a\x18\xef\
+\x1c\xcadn_\xbdv\x03\x7f}\xf0\xd1r\x1c\xbaN\
+\x11\x91\x92\x87Z\x0efe\x7f\xd4O\x0cbj\x98I\
+gJ\xe2\x9d>\xd8Yh-\xd9).8\xef\x5c\xae\
+y\xfd\xdf\xb1{\xe76\xbcx\x029\x86\xe4O\x83!\
+\x0c|\xac\x0a\x97\x5cz\x19\xb3g\x0e5d\xa7\x0cW\
+\xac\x82_B:\x9d\x1e\x94U\xb0\x96\x0cX\xb5:\x01\
+\x19\xe9tw\xb4\xb3{\xc7&N\x981\xaf,\x89\x7f\
+\xc48S\xd4\xf1\x16\xdb|\xef\xb0\xbf\xc3AL\xbf\xfb\
+\x1d,<\x903\x819\xc3\xea\xc5QQZZZh\
+o\xef,\xcf\xe1\xeb\x0c\x1b\x119b\xa6\xb5\xc1\xdc\x96\
+\xc6\x1c9\x9f\xf8`2\xb7\x95*\xbb\x9b#f\xc0\x87\
+T\xa4\xf4\x83\xa5\x0c\xa3\xff/\x7f\xe9\x8b\xb9\xea\xca\xab\
+\xc8\xe4\xfd\xa3^\xc3\xe1\xa0V1\x224&c$\xe2\
+C[\xa1\x97C\x5c\x06s\xccR\xb5k\x8c\xc1\x18\xd3\
+o\xc5\x00A\x8e\x98\xa6c0y\xf2\xa3\xe3\x1f\xf9\xfd\
+z\xd8Em\xd1\xd9\xd9\xc5\x8d7\xde\xcc\xff\xfb\xf0G\
+q\xca`\xb1\x12\xc4\x13\xe3\xcd/\xd8\xdf\x875E\x1c\
+\xb88\x8b\xe9\xf7#\xe3\x80\xc5\xc3\xe9@\x7f\xe4\xd2\xdd\
+\xb4lZ;\xf0\x07\xebT\x0d\xb5\xf4\xa5h-\xde\x89\
+B\x94\x82\xd3q\xfa+\x0f\x12\x15\x10q\x1d\xb7\xefw\
+\xa5\xf0r\x1cg\xc0\x01\xd1u\xdd\xbe\xcf\x0c\xe5\x09(\
+\x1e=\xdaR\x18`\xf0\x15\x83\xe7\x1e8\x97!?q\
+\x1a=\xb2\xd6\xdac\xabbx\x18\xaec\x18\xd3\x14g\
+L\xf9\xd2>\x0c\x1bg\x98\xdf\xcf\xc1\x14\xbf\x1d\xd7u\
+\x88\x16\x18G\x97Y\x11\xc1Z\xc5\x18\x19\xd6}\xe18\
+\x03\xa7\x04\x8e&z\x160\x87\xe4\x13\xf3<w\xe0\x09\
+\xa7j\xf4\xdc\xc8a\xbf\x1b\x8f\x8d\xcaT\xc4#\x99\xce\
+\xaenn\xb9\xfd.>\xf8o\xff\xd9o\xc1\xa3\xe1 \
+\xd0\xec\x88\xd3\x8c\x98aU\x1e\x1b\xeet\xa3\x19X8\
+\xccc\x1c\x95\xa5\xcb\x96\xf1\xf8\x93O\x97\xeb\xf0uJ\
+\xc0\xae];x\xf2\xc9'y\xc9\x0b\xaf\xa0\xab;\x85\
+\x08\x8c\x1b\xd3DwO\x0f~\xd0\xffvMwo/\
+\xdd=Q6\xb3\xce\xae\x1e\x5c\xd7\xc5\x86!\xad\xad\xad\
+\xfd\x16CQ\x22\x87\xbd\x5c\xce'\x08-=\xbd)\x8e\
+uYc\x8c!\x16sy\xf8\x91\x87hk\xeb?,\
+/\x9f\xf7\xe9\xee\xcd\x10*\xa4zS\x84C,\x0b\xab\
+\x0ac\x9a\x1b\xd8\xbc\xb5\x85U\xabW\x13\xe5c\x1a\x9d\
+\x99\x0f\xb3\x994y?\xc0*tu\xf70\x9ceg\
+\xccspcI\xd2\x99\x1c\x03]\xaf=\xbb\xf7\xb0u\
+\xfb.\xa6O\x9bL&{li_\x15\x88{\x0e\x8e\
+\x17\xa77\x95\x8er2\xf4CGg'\xcbW\xac\xe1\
+\xd4S\xe6\x93\xcdE\xd6\x92\xe6\xe6Fz\xd3\x99\x01\x9d\
+\x16\xd7\xac]\xcb\xcaU\xebY\xbcx!]]\xbd\xb8\
+\x8e\x83\xeb:\xf4\xf4\xa4\xea\xa9\xadk\x8c0\x0cY\xb7\
+nCy\x1d\x84\xff\x7f{\xf7\x1d\xdf\xc6q&|\xfc\
+7\xbb\x8b\xc6^\xd4{/V\xb5%Y\x96\xe4&\xf7\
+\x92\xc4%\xc5N\x8fSl\xc7\x89K\xect\xa79=\
+\xb9$\x97\xf2\x9es\x97\xc4\x97\xea$N?\xb7\xb8W\
+I\xb6l\xabKV\xef\x85\xa2\xd8I\xf4\xdd\x9dy\xff\
+\x00\xa9.\x02 \xb1\x00H\xcd\xf7>{\x8eHpg\
+@\x10xvfg\x9eG\x88r\x841\x11!V\xf4\
+\xe64\x19\xdcC\xef\xe6\x8fZ\x882!L\xcf\x8a\xc6\
+\xbe\xber\x1d\xaf\xbd\xb1\xda\xab\xd3k9\xb0}\xdbV\
+\xbe\xf4\xa5\xaf\xf2\xb3\xff7\x98d\x22\x810\x0c|>\
+\x93\xad[\xb6\xd0\x9c&P\xae_\xbd\x8a{>\xf3Y\
+j\x07\x0c \x11O`\x18\x06\xc20\xd8\xbai3\xb1\
+\xe8\xa9\x13d()\xd9\xbca\x0d\x1f\xbe\xf9V\xcaJ\
+\xcb\xb1\xbb*Te\x113R\xb7\x0aL\xf6\xed\xdbK\
+\xdd\x81\xfd\xdd>\xb6\xf9P\x1d_\xf9\xf2W\xf8\xf9\xcf\
+\xff\xbb\xb3\xf2Z\xcf\xf7\x8c\xfa\xfc~b\xb18\xdb6\
+o\xa4\xbf\x06s\x80\x9d\xdb\xb6p\xf3\xc7?AYy\
+\x05v\xd7\x82\xcb\x1e\xfe\xce,\xcb\xc2u]\xb6n\xda\
+\x98\xf6\xb1/<\xff\x0c\x1f\xb9\xb9\x91\xa0?\x90Z\xf5\
+\x9dM\x9b\x0a,\xcb\x87D\xb1g\xe7\x0e\x9cD\xf7\xbb\
+\x88\xde\x5c\xbf\x86O\xdey\x17\x95\xe5\x95\xd8\xb6\x8da\
+\x9a\x08C\xb0e\xe3F\xe2\x91p\xb7?\xbbl\xe9\xcb\
+|\xf2\x8e\xbb\xa8\xa8('\x99L\x1e\x9e\xcd\xd8\xf4\xe6\
+\x06\xa2\x91^\xef^\xd2r,\x1e\x8b\xb0a\xcdrf\
+\x9d\xb5\x00\xc3\xf4`\xa1\xa80j\x0d_p6\xc2\xf0\
+6\xa0CwS\x83b*\x98c{\xd3\x81\xee\x1c\xac\
+\xdb\xefy\x99I\xadw\xc2\x1d\xed\xac^\xb1\x0c!\x8c\
+c\x82\xaat\xdd\xd4||7Z[\x1ay\xfd\x95\x97\
+S?\xdb9A*\x10H\xd7E\xa9\xee\x83]\xb8\xbd\
+\x85\xa5/>\xdb\xb9 \xac\xb3\xb6t\x96\x1f\xde\x08\x81\
+\x92.Jv\xdf\x96c\xc7Y\xb3r9\xebV\xa7&\
+\xdc\xb2\xbdx8ZW^:\xd9\xcf\xb7\x83\xc5\xa3\xed\
+,{\xe9\xb9\xcej\x8d\xaaW\x01] PJf\xb4\
+\xb2\xbf\xfe\xe0~\x1a\x1b\x0e\x01=x\x9dT\xeaBO\
+)\x85\x94n\xda\x15o\xed\xad-,_\xf2\xe2\xe1\x9f\
+A\x088\xfc\xb3\xdd\xff\xed7\xd6\xd7\xd1\xd4x(\xf5\
+\xdc\xba~?\x80\x94Nq\xad\xb4\xd3\x80\xd4,\xdd\xbf\
+\x1e~\x84\x09SfQ^\x9e\xfb\xfacB\x18\x831\
+\xac\xcb\xa5\x1dy\xe0\x94\x7f\xb4\xa6\xff\xe4_?J\xfa\
+{\xe8\xe2\x94\x0f)G\x883\x80\xf4\xad\xf4@\xa4\xa3\
+\x85\xba\xfd{\xbc8\xb5\x96S\xaa\x17\xc1\xa97?\x9b\
+\xdf\xa0\xa8\xa4\x8b\x9b&\xf0\x17\x93H,\xc1\xa6\xcd[\
+\xd9\xb5{/\x07\x0e\xd4\x11\x89F\xf0\xf9|\x0c\xa8\xad\
+a\xe4\x88\x11L\x18?\x96Q#\x86z\xda\x87\x82\x5c\
+\xb4(\xe5i\x85\xb5\xe3\xc9\x1e&\x9eQJ\xa2\x9c\xe2\
+\xdc\x12\xaa\x9d(\x99\xb4\xf9\xc7\xc3\xff\xe6\xb6O\xde\xe3\
+I@'\xb5\xc0|rjF\xbc\xe7\xb7\xa7zS\x0f\
+}00\xb1\xc7-\xa7\xb1v\xedJ6m\xd2\x0b\xe2\
+4-\x1b\x0dM-,y\xe55\x9e{\xe6\x196\xac\
+_K\xdd\xc1z\x9a\x9a\x9aI&\x13\x98\x96EyY\
+\x19\x83\x06\x0ed\xe4\xa8\xd1,\x5c\xb4\x88\xcb/\xbb\x94\
+\xe9S={\x1bkZ\xbf \xa5\xcb\xc677\xe3\xd8\
+\x9e^,\x06A\x84@\xf48!\x7f\xfaz\xe8n\xe2\
+\xc4/*\x850\xacZaX\x9e}\x12\xbc\xf8\xf2r\
+6n\xde\xe6\xd5\xe95\xad_\x91J\xb1b\xd5:\x1e\
+\xfc\xe3\x1fy\xf8\x91G\xd9\xb9e\xc3I\x1f\xd7|\x08\
+v\xef\xd8\xc2\xeb\xcb\x97\xf2\xef\x7f?\xce\xf3\xcf=\xcf\
+\x0d7\xbc\x8b+\xaf\xb8\x94\x01\xa7a\xd6=M\xcb\x94\
+\xeb\xd8\x1c\xdc\xbf\x9ba\xc3\x86\xf7j\xdbi7|\xa0\
+\xc6\x03\x1b\xe8\xe1\xe6\x90\xb4\x01\xddI\x9cd\x15\xbd\x92\
+\x98\xbe\x92a\xa6\xbf|\x5cO\x1a\xcd\xc4\x9bon\xa6\
+\xad\xed\xf4\xab\xe7\x5c\x08B\x08\xfc>\x1f\xa6y\xec\x1f\
+\xe9\xd1[\xc3\xb4\xe2\x15\x89\xc6y\xe6\x85\x17\xf9\xe1\x0f\
+\x7f\xcc\xcb\xcfe\x9eU1\x16n\xe5\xb1\x87\xff\xc6\xf2\
+W_e\xc7\xce\xdb\xb9\xf9#\x1fb\xe8\x90A\x1e\xf6\
+T\xcb\x05\xd340\xadc7PY>\xeb\x84\xafi\
+\xb9\xf7\xdc\xf3\xcf0q\xca\x19TT\xd6\xa4\x7fp\xb6\
+\x04\xa5\xc2\xf0\x9f\x0d\xa2\xc7+f\xd3^f\x18\x86\xef\
+d\x87\x81aN\xe0\xe8d\xc29d\xdbIZ[\x1a\
+\xbd8\xb5v\x12\xae\xeb\xd2\xd6\xd6FG8B$\x1a\
+K\x1d\x91(\xb1X\xdc\x93\xccHZ\xee$l\x9b\xa7\
+\x9f{\x81{\xee\xfelV\xc1\xfch\x8d\x87\xf6\xf1\xad\
+o\xde\xc7w\x7f\xf0SZZ\xda\xf4\x9a\xac\x22\xe7\xba\
+\x0e\xd1h\x8cX,N8\x12%\x1a\x8d\x11\x0eG\x8b\
+\xb2\xeeB\x7f\xf3\xcf\x87\x1f\xe7\xe0!o\xaaO\x0aa\
+\x94\x1b\xfe\xd2\xc5\x86/(\x0c_\x90\xe3\x8fL\xa4\x1d\
+\xa1[\x81\x93-\x00\x10\xd5\xc0\x84,\xfb\x9b\xb1M\x1b\
+VR__\xe7\xd5\xe9\xb5\xe3\xb4\xb7\xb7r\xff\xfd?\
+g\xf1\x05\xe7!\xa5B\x18\x02\xc7qy\xf9\xe5%\xc4\
+\xd2l\xbf\xd1\x0aG)\xc5\x9auo\xf2\xed\xef~\x9f\
+\xed\x9b\xd7\xf6\xea\x5cv<\xca\xff\xfe\xea\xe7\x0c\x19<\
+\x88O\xde\xfaa\xca\xcb\xcbr\xd4K-\xd7\xb6m\xdd\
+\xc6#\x8f=\xc1\x80\xdaZ\xda\xda\xdb\x09\x85B\x1c:\
+\xd4\xc8\xe6\x8d\xe9\xb7\xf5i\xbd\xf3\xda\x1b\xabim\xed\
+U\xee\x97n\x88\x90\x80\x05v\xa2\xe3\xa4\x03m_\xa8\
+:\xed\x19z\xba(n(\xe0Y\xad\xbe%\xcb\x96\xb3\
+\x7f\xbf\x0e\xe8\xf9\x12\x8fF\xf8\xe7_\xff\xc0\xa3\xff\xfc\
+\xf3\x91\x1b7\x0a\x1c\xd7\xc1\xd1\x15\x9c\x8a\xd6\xfe\xba\x83\
+\xfc\xeew\x7f`\xe5\xf2\x97sr\xbeHG\x1b\xbf\xf8\
+\xe5/X\xb8p\x1e\xe7-\x98\xaf3\x96\x15\xa9\xcd\x1b\
+V\xf1\xd5{7\x1c\xde**Dj\x0d\x85\x9d\xd4\xef\
+U\xaf\xb9\xb6M\x22\xe6iQ\xa8j\xa0\x0ch\xee\xc9\
+\x0f\xf7t\x87\xfc\x10`X\x0f\x7f6\xade\xaf\xbc\xc1\
+\xc1zo\xa65\xb4\x13)\xa5\xb0\x93\xc9T\x02\x10\xed\
+\x04e\x95\xb5\xbc\xed\xda\xeb\xb8\xf2\x8a+\xa9\xae\xae&\
+\x1e?\xc9B\xd1\x0c(\x05\x95\x15el\xd9\xba\x85?\
+\xfc\xfe\x0f\xbc\xba\xf4\xf9^\xf5k\xf5\xba7\xf9\xd7\xc3\
+\x0fw\x9bU/\xab\xfeI\x97\xdd\xdb7\xf1\xbb?\xfc\
+\x89I\x13\xc63tp\xcf\xef\xa7\x0f\x1c2\x92[n\
+\xbd\x853\xcf<\x0b\xc3\xb0z\x9c\xfdL\x08(-)\
+a\xd3\x96-\xfc\xe9\x8f\x0f\xb2|\xe9\x8b\x14W\xa9\x9c\
+\xfcs]\x97X\xac\xc7\x0b\xa1\xb5^\xda\xbee=\x0b\
+\x16\xcc\xc7\xcap\x1a<K&\xa8\x91@\x1b=\xb8\x8f\
+\xde\xd3\x80>\x18\x18\xd9\xc3\x9fMk\xf7\xee=:\xfd\
+\xa1V4\xaa\xaa\x07\xf0\xee\x1bo\xe0\xb2\x8b\x17\xe3\xf7\
+\x99\xf4\xa6\xc8\x9bi\xc0\xc2s\xe6\xd0\xda\xd6\xd6\xab\x80\
+\xde\xd8\xd2\xc6\x0b/\xbc\xc8\xfe\xdd\xdb{\xde\x99\x93P\
+\xd2\xe5\xe9\xa7\x9e\xe1\xa37}\xb0W\x01}\xf8\xc8\xd1\
+\xbc\xeb\x1d\xd7s\xc6\x19S\x11\xf4\x22W\x8a\x00S\xc0\
+\xc2\x05\xf3hjj`\xf9\xd2%@\xffN\xca\xa3\x15\
+\xb7%K\x97q\xf1\xa5W2r\xb4\x07k\xc2\x85\xb0\
+\xac@\xc5,\x84\xd8\x92\xda\xbe\x96\xdd\x1b\xa7\xa7sj\
+\xe3\xf1hA\x5c\xac\xa3\x99\x8e\xf6V/N\xadi=\
+\x22\x0cAuU%~_j\x15\xb1i\xf4\xfc\x00(\
+-\x09QS[\xdb\xab>m\xdf\xbe\x937^\x7f\x1d\
+2Hv3`\xc8H\xce9w1S\xa6\x9f\x09\xa7\
+N\x14u\xd8\xbe\xdd\xdb\xd8\x7f\xa0\xbeW\xfd3\x0c\x83\
+\xca\x8a\x0aL\x01\x86\xe8\xc5\xef\xacsMfyi\x88\
+\xca\x8aJ\xba\xcf\x5c\xa9i\xde{\xe1\xe5W\xd8\xbdw\
+\x9fW\xa7\xf7\x0b\xc3\xbaL\xb9vH:q\xa4\x93<\
+|d\xa2'#\xf4\x10\xa9\x05q\x9e\xdc`[\xbbf\
+%\xe1\xb0\xde\xae\xa6\x15\x0f\xdb\xb5\x89Fsw\xdfL\
+\x01\xf1^N\x99\xee\xdb\xb7\x8f={\xd2dR\x14&\
+\xe7^\xb0\x98\x8f~\xf4\xa3\x8c\x1b;\x96\xd6\xd66\x9e\
+y\xee9\xfe\xf0\xbb_\xd3\xdcp\xea\x80\xad\x5c\x9b\x95\
+\xabV\xb1\xf8\x82E\xd4VW\xf6\xa8\x7f\xc9\xa4\x9d\xf3\
+\xb4\xcd\xb1x\x8c\xd3}\xba]+\xbc\x1d;w\xd3\xd0\
+\xd8\xa3[\xdc\x99\xb0\x80K\xa4\x1d\x0dI\xe5rt\xd6\
+8\xd3\x17\xca\xe8\x87\xb35\x82\xd4\x94\xbb'\x9e\x7fy\
+\x19-\xad\xad^\x9d^\xd3\xb2&\x109\xdd\xbe'\xe8\
+}\xdd\xee\xd6\xd66\xda\xdb\xda\xba}\xcc\xa81\xe3\xf9\
+\xe4\xedwr\xc3\xf5o9\xfc\xb5\xc5\x8b\xcfg\xcf\x9e\
+\xbd<\xfe\x7f\x7f#\x99<\xf5Z\x80\x0d\x1b\xd6\xd1\xd0\
+\xd8\xd8\xe3\x80^\xa8z\xe8\x9a\xe65%%\x1dm\xad\
+^\x9d^\x00\x83\x11F\x99\xe8A\x01\x84\x9e\x8c\xb2G\
+\x02\xbd\x9b/\xec\xc6+\xaf\xae\xa0\xbd]o\x95\xd2\x8a\
+\x87@\xe44\x98(\xe8\xf5\x05B\xd2\xb6\xb1\xd3,\x86\
+\x9b:u\x0a3gL;\xe6ke\xa1\x00s\xe7\xcc\
+\xa5\xb4<M\xa0V\xbd\xeb\x9f\x17\xb1W\xf4\xb2O\x9a\
+\x96+\x07\xeb\xf6\xe2\xa4)\x0f\xdd+\x8a\xa1(R1\
+\xbd\xeb\xc8@\xfa\x80.\xdd\xa3\x0e\x07\x94\x1c\x06\xca\x93\
+\xfb\xe7\xa0\xd8\xb4ek\xaa\xec\xa1\x96W\x86i\xe1\xf3\
+\xfb\xf1\xf9\x8e\x1c\x86\xa93O\x01\x18B\xe0\xcba\xc9\
+D\x01\x98\xa7\xae\x91\x90\x11\xd3\xb2\xb0\xac\xee\xfb\xd4p\
+\xa8\x9e\xdd\xbbv#\x8fZ\x91\x16O$\xd8w`?\
+\x89x\xbc\xdb\x9f--)\xc1o\xf9z\xdc?\xc30\
+r\xbe\xed-\xf5\xf7\xa8\x83\xba\x10\x06\x96\xcf\x8f\xcf\xef\
+O\xfd\xd7\xe7\xc7\xb2|\x9d\x95\x07\xb5|\xd8\xb0~\x1d\
+u\xfbwy\xd8\x82\x9a\x04*D\x96\x11=}\xea\xd7\
+\xe4Q\xa3e%1\xfdeC\x85\xe9\xf3d\x84n'\
+\xa2D\xf5\xfd\xf3\xbc3-\x8b\xb1\x13\xa71f\xccX\
+\x1c\xc7A\x18\x06\x02\xc1\xde=\xbb\xd8\xbee#\xd2=\
+\xbd\xb7\xb3\xb9\xd2%\x9aH\x05\xc0x<\x89+{\xb6\
+0K)\x08\x05\xfd\xb8J\x90\xe8f\xba;\x13\xe5\xe5\
+\xe5\x94\x95\x95\xd1|\xe8\xd4\x8fY\xb3v-\x7f\xf8\xe3\
+\x9f\x984y\x02#\x87\x0d#\x91H\xf0\xcf\xff{\x8c\
+\xa7\x9fx\x9ch\xa4\xfb\xe4\x18s\xe6\x9f\xc3\x90\xa1=\
+\xdf\x99\xea\xba\xf2p\xe6\xb2H4Fo\x02\xb1\xdfo\
+aZ\x16I;\x89\xbe\x87\x0e\x955\x03\x99>\xf3L\
+\x82\xa1\x10\xc9d\x12\x9f\xcfG8\x1cf\xcb\xc6\x0d\xb4\
+4\xea\xfc\x1d\xf9\xb0~\xc3&\xb6m\xdf\xc5\xc8\xd1\xde\
+\x943\x11\xa6\xefL\x94\xf1\x08\x88\xac\x16\xefd0\xec\
+8\xea\x0d\x94z\x83\x8e\x00\xca\xb3\xea]\x06\xa4t\xd9\
+\xbay\x03v/?\xe8\xb4\xecUV\xd5\xf2\xf1[o\
+\xe1\xdd\xef\xba\x9e@\xa0\xab\x1a\xae\xe0o\xff|\x98\xcf\
+\x7f\xfe\x8b\xb44\xec/h\xff\x0a\xad\xa5\xa9\x81\x9f\xfc\
+\xf4~\x1e\xff\xf73\xa0d\x8f\xb7T*\xa5\x08\x86B\
+D\xa3Q\x96/_\x96\xf6\xf1\xdd\x85\xc0!\x03\x072\
+h\xc0\x00\xf6\xec\xd8|\xca\xc7\xb8\xc9\x18\x8f\xfc\xf3o\
+\xec\xd9\xb3\x97i\xd3\xa7\xd3\xd2\xd2\xc2+K^d\xff\
+\xde\x9di\xdb\xae\xae\xac$\x108\xf9\xc7\x83\x10i:\
+\x07\xec\xdd\xbd\x83\xfb\xbe\xf5\x1f\xd4\xd4\xd4t{\xaf>\
+\x13>\xbf\x8fh4\xcek\xaf.E\x07t8g\xe1\
+y|\xe7\x9b_c\xd4\xc8\xe1\xb8\xae\x8bi\x9a\xec\xdb\
+\x7f\x80/\x7f\xed[<\xfc\xf7?\x16\xba{\xa7\x857\
+7oe\xf7\x1e\xef>\x17M_\xe9b\xe0\xbf\x80\xac\
+\xae\xd0\xd2\x06t\xc3Wr\xf4?\x03\xc20\xc7\xe2\xc1\
+\xbc\x97m\xdb\xbc\xfe\xfa\xeb$\xfaRr\x13\xc3\xe2\x8c\
+\x89#il\x09s\xa8\xa1\x09T\xdf\xdcR\xe3\x0f\x04\
+X\xb0p\x11C\x87\x1c\xbb\xd6\xb1\xa6\xa6\x16\xcb\x97\xbb\
+\xa9\xe6\xbe*\x11\x0d\xf3\xe23\x8f\xb3\xec\xc5g:\xbf\
+\xd2\xb3\xa0\xa2\x00C\x18H)\x89\xc7\xd3\xafr\xef.\
+7\xf7\xb8qc\x98<u*o\xbc\xb6\xb4\xdbs\xb4\
+\xb75\xb3\xec\xa5gY\xf5\xfa2\x1c\xd7!\x1e\x8d\xa4\
+m\xb7\xbcz0#\x87\x0f9\xbce\xecx\x02\x91\xf6\
+W\xd0\xd6\xd2\xc0?\xfe\xf2\x07L\xd3D\xf5\xf6}!\
+\x0c\xa4\xeb\x92Ht\x7f\x9b\xe0tQZZ\xc2\xc0\x01\
+\xb5\xd4TW\x1d\xfe\x9am;TTzR\xa7[;\
+\x89x,Ncc\x93w\x0d\x081\x10\x08d\xfbc\
+i?\xad\xc5\xb1\xfbV\x87\x82\xf0\xa8 \x8b\xcd\xab\xaf\
+\xad\xe8\xf5Td>M\x9d8\x92\xef\xdf}1KV\
+\x1d\xe0\x7f\xfe\xbc\x84\x16\xcfr\xfczK\x00\x81@\x10\
+\xd7\x95\xc7T\x5cK&\x93H\x9d\xe0\x07\xa5$\xf1X\
+\x94\xb8\xb7)\x1fO\x90H\x9c\xfa\xbd0l\xe8 \xce\
+?\xef<\xfe\xf5\xcf\x7f\x10i\xef~\x0b\x8d\xeb$\x09\
+wd~\xa1<\xf7\xec\xf9\x8c\x1e=\xe2\x14\xdfU$\
+\xecd\xdaB J\xbaD\xc2}\xf3\xfdP\xec\x1c\xc7\
+=aK`2\x99\xcc\xf96A\xad{\x1d\xed-^\
+\x9e\xbe\x0e\xc8\xfa\x0a6\x83U\x14G\xdf\x94W#\x81\
+\xd2l\x1b\xc9\x84m;\xbc\xb1j-\xc9D\xdfX\x10\
+gZ>\xce\x9d;\x9a\xf3\xcf\x1a\xce\xa5\xe7\x8ce\xf4\
+p\xcf\x16\xfe\xe7\x85\xe3\x9e\xb8bZ)\xa5+8\x15\
+P<\x1e?e\xeeG\x9feq\xde\xa2\x85\x5cx\xd1\
+%9m\xb3\xac\xb2\x96\x9b?z\x13#\x87\x9f\xfa\xfe\
+ysk+n\x06\x09m4o\x9c\xec=\xa9\x94\xc2\
+u\xf4k\x92O\x8d\x87\xeaH\xc4=\xdb\x91\x15\x90N\
+\xdcp\x93\x11\x5c;ud\x22\xdbe\x91\xc3\xf1\xe0\xfe\
+9\xa4\xf2\x13o\xdb\xbe\xb3O\xa4|\x15B0xP\
+\x0d\x97\xce\x1fC$\xe62nx%sg\x8c\xc2\xe7\
+\xcbz\x86D\xd3N\xa9\xa9\xb1\x81\xad[O\x9d<f\
+\xfc\xf81|\xe8\x03\xefc\xd8\xa8\xdc\x14>\xf4\xf9C\
+\xbc\xf3\x86\xf7p\xf5\xe5\x97\x12\x0a\x9e<O\xb5\x94\x92\
+\x86\xc6&\x9c\x1c\xe5\x8f\xd7rG\xef\xd3\xcf\xaf]\xbb\
+w\xb3k\xe76\xafN?R\xda\xb1\x127\x19\xc6M\
+Fp\x93\xb9\x0a\xe8B\x1c9<\x0c\xe8\x89X\x98\xf6\
+\xb6\xbe1EgZ&\xb3\xa6\x8ed\xf6\xe4!\xb8R\
+0\xb0&\xc4\xc2\xd9\xa3\x186\xc4\xa3\xdd|\xdai\xa9\
+\xbe\xfe +V\xae8\xe5\xf7\xfd>\x8b\xcb.\xbd\x88\
+\xbb\xee\xba\x8b\x01\x83\x86\xf4\xaa-\xcb\x17\xe4\xe2\xcb\xae\
+\xe4\xee;>Aii\xc9)\x1f\x97\xb4\x1d\x1a\x1b\x1a\
+\xfa\xc4\x85\xb7\xa6yi\xd7\xee\xbdl\xda\xecY@\x0f\
+ \x8c\x12!\x0c\xba\x8eL\xa4}\x94P\xaa\xf3\x90\x08\
+!\x86#r?\xe5\xae\x94\xa2\xbe~?\xa2\x8f,*\
+\xab\xa9.\xe7\xf2\x05\xe30\x0d\x81m\xbb\x84c6S\
+\xc6\xd40w\xfa\x08\xbdw[\xcb\x99x<NSs\
+\xf7\xf7\xe9*\xcaJ\xf9\xc4\xad\x1f\xe1\xf6\xbb>\xc3\xc8\
+\xd1c{\xf4\xf7WZV\xce\xe5W\xbd\x95\xaf}\xed\
++L\x9f6\x19\xc38\xf5H/\x12\x8d\xd1\xd8\xd0\xa0\
+G\xe8\x9ag\x0c\xc3 \x18\x08\xe0\xf7\xf7<\x0fB>\
+\x1c8X\xcf\x1e\x0fW\xba\x83Q\x8b0\x04\xc28U\
+\x19\xf3\x13\x7f\x22\xdd\x03\x5c'\xdey\xc4P\xa9Eq\
+9\x0f\xe8\xc9D\x8c\x9d\xdb\xb7\x16\xfd\x86\x14\xc30(\
+/+\xe1\xfc\xb3\xa7p\xcd\xe2\x89\x98\x86\xc0Q\x8ap\
+\xd4a\xf2\x98\x1a\xae\xbft\x1a\x13\xc6\x0d\xc7\xb2Lo\
+Rei\xa7\x95D\x22Nss\xfa\x9c\xd1%\xa1 \
+_\xfe\xfc\xdd|\xf3\xdb\xdfe\xf6\xdc\x05\x04C%\xe9\
+\x93\xba\x08\x81\xcf\xe7\xa7v\xd0\x10\xdew\xd3\xcd\xfc\xf7\
+\xfd?e\xfe\x9cYi\xdb\x8a\xc5\xe2\xb4\xb6\xb4 {\
+\xb8\x17_\xd3\xd2\x192\xb8\x9a+.:\x8b\xb9\xb3'\
+\x16\xf5m\x84\xd6\x966\xf6\xd7\x1d\xf4\xec\xfc\x86\xe9\x1f\
+i\xf8\x82~\xc3\x0abX\x99\x95j\xcdbO\x920\
+\xf1\xa8dj,\x1eg\xd3\xe6\xad^\x9c:wL\x8b\
+\x09\xe3Gp\xf5y\x93\xb9b\xe1hP\x0aG*P\
+\xa0PD\xa26\xd3\xc7\xd7r\xd7{\x17\xf0\xe8\xcb\xdb\
+X\xb2b\x07\xed\xad\x9e\xae\x82\xd4\xfa\xb9D<AK\
+\x06\x01\x1dR\xd7\x8f\xef\xbd\xe1\xed\x5ct\xe1y\xfc\xe2\
+\x81\xdf\xf2\xc7?\xfe\x89\xed\x9b\xdf\x04u\xf2\x91ti\
+\xe5\x00.\xbd\xf4rn\xbf\xed\x16\xce[4?m\xd6\
+9H\xa5\xa1\x88\xc6\x13tt\xb4\xe9\xdd\x0f\x9aG\x0c\
+\xce\x9b3\x9eo~\xf2<^Z\xb1\x97\xcd;\x0e\xd1\
+\xdc\xd4T\xb4\x8bs[ZZ=;\xb7\xe1\x0b\x8c\x81\
+@\x0dY\xecEO\xbfm\xedH\xca\xcb\xc1\x02\xe1\xc9\
+F\xc7h4\xc6\x9b\x1b7\x17\xe5\x8bVR^\xc9\xbc\
+\x19\xa3\xb8\xf1\xf238\xff\xcc\x91\x98\x96\x89i\x0a\x5c\
+W\x1d3\xa3\x90t\x5cJC~.\x9e?\x86\xf3\xe7\
+\x8c\xa4\xa1y>\x7f\x7fv\x13\xcf,\xdf\xc5\xa6\xad\xfb\
+@\xea-%Zv\x92v\x92\xf6\x8e\xee\x0b\xb0\x1c\xcd\
+4MF\x0c\x1b\xca\xa7\xef\xfc\x047\x7f\xf8\x03l\xde\
+\xba\x8d%\xcb^a\xe7\x8e=$\xec\x04\x01\x9f\x9f\xaa\
+\xea*\xce\x9c9\x93\xb9s\xcfd\xd0\xc0\x01TUV\
+\xe2\xcb0\xd7\x80T\x8aD\x22I4\x1aF'x\xd1\
+\xbcP]]\xc1\xcc\xc9\xc3\x19;\xac\x8a\xe6\xf6\x04S\
+'\x0c\xe5\x95\xe6\x16\x5cU\x9c\x17\x90\xc9\xb8\xa7[Y\
+G\x00\x15\xe42\xa0\x1f\x95Cf(\x90\xd9\xb8?K\
+\xb1X\x9c77\x15\xdb\x08]p\xd1\xa2i\xdc\xf1\x9e\
+yL\x1a]K\xc0\xe7\xa3\xa4\xc4G\xd2\x968\xaeD\
+\xcac?\xd0\x94J\x8d\x92\xfc>\x8b\x92\x90\x8f\x9a\x8a\
+ \xb7\xbe\xf3,>v\xdd,\x9exe'\xbf\xf8\xeb\
+r\xb6\xef\xd4i\x19\xb5\xcc9\xb6M{{\xf6\xa9\x90\
++*\xca\xa9\xa8(g\xc4\xf0a\x9c9k&\xd1h\
+\x0c)%\x86a\xe0\xf3\xf9\xa8\xa8('\x14\xec\xd9\x8e\
+\x0c)\x15\xc94y\xe05\xad\xa7&\x8e\x1e\xc8\x8c\x09\
+\x83H$]\xcaK\xfd\x9c5e(\xab\xd6\xee \x92\
+AB\xa4B\xe8ho\xc1I\x86\xb1\xfce^\x9c~\
+(Y.B\xcf&\x0d\xd8P\xc0\x9f\xf6Q=\x10\x8f\
+'\xd8\xbamG\x91\x8d\xd0\x15\x95\xe5e\x0c\xaa\xad`\
+\xfc\xc8\x1a\x92II[$N\xd2qO98Q\x0a\
+\x1cW\x02\x82@\xc8\xc7\xb8\xe1U\xb4\x87\x93\x0c\xac\xad\
+\x22\x10\xd0[\xda\xb4\xec(\xe9\xd2\xde\xd6\xd6\x83\x22\x8a\
+G\xd4TW\x1d\x93Q\xac7\x12\x89\x04k\xd7\xad#\
+\x11+\xce\x0fW\xad\x8f3|,<s\x0cs\xce\x18\
+LS{\x82\xa0\xcf\xe2\xea\xf3'\xf0\xd4\xb2-l\xda\
+\x1a\xedJ=^T\x9a\x9a\x9a\xd8\xb7g\x17c&L\
+\xf7\xe2\xf4\x83\xc92\xefK6\x01}\x08=HE\x97\
+\x09;\x99 \x12.\xbe\x92\xa9\xaf\xad\xde\xc6\xd7\xee\x8f\
+\xb0`\xf6XfL\x1c\xc4\xc4\xd1\xd5\x0c\x1fTN,\
+\x96$\x9e<v\x0aH)\xb0L\x83\x92\x90\x85cK\
+\xd6lm`\xcf\xc1\x0e^]\xbd\x975\x9b\xf6\xb3o\
+\x7fC\x81\x9e\x85\xd6w)\xc2\xe1v\x12\xb6K\xd0W\
+\xf8\xdd\x13\xc9d\x92\xad[\xb7b\xdb\xfa\xf6\x91\x96{\
+cG\x0eb\xfe\x8c\x11T\x95\xf9\xd9\xd7\x10!`\x19\
+L\x1d[\xc3\xbc\x19#\xd9\xb6\xeb N\xb2\xf8f\x86\
+\x9a\x9a\x9a\xd9\xbau\xbbW\x01}\x88r\x93eJ\xda\
+\x808>\x0d\xfbIe\x13\xd0\x07\xe3\xd1\x08=\x1a-\
+\xce\x0ak\xfb\x0f6\xb2\xff`#\xcbV\xefa\xe2\xa8\
+Z\xce\x995\x9aK\x16N`\xec\xd0rj\xabB\xd8\
+\x8eD\xa5\xd6\xc5\xe1\xf7\x19\xd8\xb6d\xd3\xcefVn\
+\xac\xe3\xa9\xa5[\xd8\xb6\xb7\x89\x9d{\x9bp\xed\xe2\xfb\
+C\xd4\xfa\x86x,F4\x96 \x98\xc1\x9b\xd9kJ\
+\xa9\xd4-\x80\x22\x1c)i}\xdb\xc0\xdajn\xbcr\
+\x063&\x0c\xa0\xb9#\x0e\x02\x5c\xa9\x10Bq\xfd\xe2\
+\xc9\xec9\xd0\xcc\xd2\x15\xdbp\x8a,5xKk+\
+;v\xef\xf5\xea\xf4%\xd2\x89\x95\xbav\x14\x84\x89?\
+\x17\x01]\x18]#\x035\x18A\xce7\x06*%i\
+j\xac\xcf\xf5is*\xdc\xde\xc6\xaa\xf5m\xacZ\xbf\
+\x87\x17^\xdf\xc9;.\x9b\xce\x8dWL%\x18\xb0P\
+\x0aL!0\x04\xbc\xb9\xb3\x91_\xffk\x15O\xbf\xb2\
+\x8dH{k\xa1\xbb\xad\xf5\x03\xd1p\x98\x9d\xbb\xf7R\
+=c\xf2)\xa7\xdd[\xda:\xd8\xb8i+-\xad-\
+\x08\x91\xe5\x96I)\x91J\x11\x08\x06\x18;f\x14\xa3\
+G\x0c\xc5w\x8a\x15\xef\xb6mS_\x7f\x08\xbdaM\
+\xcb\x05\xbf\xdfOMU\x09S'\x0c\xe7\xa2\xf9\x13\xb9\
+v\xf1D\x06\xd5\x94\xd0\x12N`\x08\x81T\x0a\xc7\x15\
+\x9cw\xd6\x08\xa48\x87\xf1\xa3jyu\xd5N\xf6\x1c\
+h\x22\x1c\x8eC\x11\xfc%\xb6\xb5w\xb0o\xbf\x87k\
+\xa3\x84Q\x9azOg\xb6\x0f=\x83\xe2,]'\x12\
+\x9e\x8c\xd0\xedD\x8c\xfa\xba\xbeR\x9e\xd3a\xe3\x96]\
+\xfc>a3fX\x05\x17\xce\x1d\x85a\x18\x84\x02\x16\
+\xfb\xea\xdb\xf9\xd7\xb3\x1by\xf8\xd9\xf5HG\x8f\xc8\xb5\
+\xdchmmb\xc9K/q\xd6\xf4I'\x0d\xd4\x89\
+D\x92e\xcbW\xf2\xcdo~\x87\xed\xdb\xb6 \x0c\xb3\
+\xdb\xc40\xc7S\x12l'IuM\x0d\xd7\x5c{\x1d\
+\x9f\xba\xfd\x16\x86\x0f\x19x\xd2\xfd\xbf\xb1X\x8c\xc6\xc6\
+\x86\x22[\xeb\xa2\xf5%\x86!(\x09\x05\x19:\xa4\x86\
+\xe9\x93\x86\xb3h\xf6(n\xbcl*\xd5\xe5~\x9a;\
+\xe2\xb4\x84\x93\x18G\xfd\xedI\xa5h\x8d$8\xff\xcc\
+\xe1\xbc\xf5\xbc\x09,Y}\x80\x87\x9ez\x937\xd6\xed\
+e\xe7\x9ez\xda;\x22\x05Mr\x14\x8e\xc4\xa8?\xd4\
+\xe8]\x03\xc2\xac\xc2\xb0r\x17\xd0\xbb\x82\x93a\x05\x07\
+\x80\xc8\xf9\x08=\x12\x8dr\xf0\xa0w\x9b\xf3\xbdp\xf0\
+\xe0!^Z\xb9\x8fE\xb3G\x12\x0a\x08\x82~\x83\x1d\
+\x07\xdaY\xf1\xe6^\x1d\xcc\xb5\x9c\xb2m\x9b\xa6\xe6\x16\
+\x94R'\x0d\xb2\xfb\x0f6\xf0\x8f\xff{\x84W_~\
+\xb2W\xed4\xd7\xef\xe6\x81\x83{\xb9\xf2\xaa+\x19<\
+\xb0\x16\x9fu\xe2=\xfbh<AKk\x8b\x0e\xe8Z\
+\x8fUV\x94s\xedegq\xd3\xdbf0sb-\
+\x8e#\x89\xc4]\x0e4EQ\x0aNv-\xaa$\xb4\
+v\xd8\xb4\x87m\xa6\x8e\xa9\xe2\x87w]@}s\x84\
+\xbf=\xbb\x95\xdf\xfck\x15\x9b\xb6\xec*\xd8\xdf\xa4\x92\
+2m6\xc7\xde0\xac\xc0\x00\xc3\xf4\x05\x80\x8c\xee5\
+dZ\x9c\xc5\x00\x06d\xf1\xf8\x8cE\xa2Q\xf6\xd5\x1d\
+\xc8\xf5i=\x95\xb4]^[\xb7\x87p\xcc!\xe03\
+\xb0|\x16\x9bv6\xb1mwfI@4-S\xb6\
+mw\x9b-n\xc7\xae=,Y\xf2rN\xdaJ\xc6\
+c,Y\xfa\xca)\xcb\xb6\xc6b\x09\xdaZ[u@\
+\xd7zl\xc8\x80r.;g,\x0bf\x0c&aK\
+\x22\x09\x17G*\x04\xdd\xdf)\x12\x9d\xff?\x9epi\
+\x8b\xd8\x0c\xa9-\xe3m\x17L`\xe6\xa4\xa1Y\xcdH\
+y!\x12\xf6n\x0d\x98\x10\xe6 a\xf8j\x84\x91\xd9\
+X:\x83\xe2,\xa6@\x98\xd5\x80'\xf5A\xc3\x1d\x11\
+v\xed\xda\xe7\xc5\xa9=#\xa5d\xd7\x9eC<\xb1l\
+\x1b\xa6\xa1\xd8\xb2\xab\x89%+\xb6w&\xdc\xd0\xb4\xdc\
+q]Ik\xeb\xc9\x93\xcb(`\xdf\xbe\xfd\xec\xd8\xb8\
+6'm\xd9v\x92g\x9fy\x9a\xba\xfa\x93\xef\xc8\x88\
+\xc7\xe2D:\xda\xf5\xa28\xad\xc7v\xeck\xe4\xfb\xbf\
+~\x89O\xfd\xe8E\xfe\xef\x85\xed\x80IU\x99\x9f\xb2\
+\x12\x0b\xcb\x14\xa7\xfc\xd3\x0a\xf8M*J}TW\x96\
+\xb0\xb3.\xcc\xb7\x7f\xfd:\xf7\xfc\xe0\x19\x9e]\xf6f\
+\xc1\xd3\x10;\xde\xee\xfa\x18J\x16\xb17\x93|\x8f\x82\
+\xd4\xe8\xdc\x93\x15\xee\x91h\x94}\xfb\xfa^\xc2\x95x\
+<\xc6S\xaf\xec\xe4c\xd7\xcdb\xfd\xb6&\xde\xdcZ\
+\xaf?\xe8\xb4\x9cs\x1c\x87\xd6\xd6\xe6\x93O\xb7\xd75\
+\xf2\xc6\xcaU89\xdaE\xe1\xba\x0ekW,g\xc7\
+\xee\xfd\x8c\x1b3\x0a\xf3\xa8\x91\x8f\x02\xa2\xf1\x18\x91h\
+D\x8f\xd0\xb5\x1eK\xc4\x13\xacZ\xbf\x93\xad;\x0f2\
+d@%O\xbf\xba\x83\x99\x93\x86p\xd6\x94\x81L\x19\
+SC(`\x11K\xb8\xc7\x8c\xd6\xcbB>\xf67t\
+\xb0zK\x03\xab7\xd5\xb3\xf2\xcd\xbdl\xdev\x80\xd6\
+\x8e\x18\xaec\x17\xee\xc9t\x8a\xc7\x22$b\xed\x04B\
+\x9e$R\xad&\x95-.#\x99l[3\x80\x1az\
+\x9e\xdb\xa2[\xd1h\x94\xba\x83\x87\xbc8\xb5\xa7\x94R\
+\xacZ\xbf\x8b\xaf\xffb\x09\xeb\xb6\xd4s\xa8\xb1\xb5\xd0\
+]\xd2\xfa!\xc7qhmnF\xba.\xe6q\xab\xcf\
+W\xaeZ\xc3SO>\x91\xb3\xb6\x94R\xb4\xb7\x1c\xe2\
+\xd9\xe7_b\xce\xeci\x0c\xa8\xae<\xf2=\xc0v$\
+\x89\x22\xcd\xd8\xa5\xf5!J\x12\x0eG\xd8\x16\x8e\xb0m\
+O\x03/./g\xfa\xa4\xe1\xbc\xff\xad\xb38\xef\xcc\
+\x11\xf8}&\xb6-\x11\x02\x0c!\xd8y\xa0\x95??\
+\xb9\x91\xa7\x97nb\xe7\xbe&\xe2QO\xd3\xadf-\
+\x1e\x8b\xd1\xd4x\x90a#=\x09\xe8\x95@\xc6i\xe8\
+2\x1d\xa1\xd7\xa00\xbc\x08\xe9\xf1D\x92\xd6\xb6\xcc\xf3\
+U\x17\x93\x8e\xf6v\xee\x7fp)\xca\xb5)\x86-\x14\
+Z\xff\xa3\xa4K{G;\xb1x\x82\xb2\xb2c\xdf\xae\
+\x87\x1a\x1a\xa9\xab;z\xcbgo\xdf\xa0\xa9\x91\xf7\x8e\
+\x1d\xbbiim;&\xa0G\x221\xb6n\xdd\x86t\
+uR\x19-\x87\xa4\xcd\xa1\x86f\x9ekh\xc30\x04\
+#\x06\x973\xe7\x8c!46\xc7\xb1L\x81e\x19<\
+\xb1l\x17\x7f}b5uu\xc5\x99\x9c+\x9eHP\
+w\xb0\x8ea#'yq\xfaj\xb2H\xff\x9a\xc1\x08\
+]\x19\x9d'\xcd\xf9\x828\x00\xdbv\xfat\xe5&\xe5\
+\x16W\xa2\x03\xad\xbfQD\xa2a\xda:\xa2\x94\x96\x95\
+\x1e\x0e\xd9R*&O\x9a\xc0M7\xdd\xc4\x9e\xdd\xdb\
+)-\xaf\xc0\xe8\xc5[T)\x85\x94.\x86i\xb2h\
+\xd1y\x84\x8eKU\xdc\xd1\xd6\xc6\xfau\xebz\xf1<\
+4\xad;.\xaf\xac\xda\xc9\x1bo\x8ec\xf6\xe4\xc1X\
+>\x01\x0a\x0e4\x84yn\xf9\x0e\x0e\x1e\xf4pkX\
+/\xc5\xe3\x09\xea\xbd\x9be\xae\x22\xa7#t\x81\x01T\
+u\xfe7\xe7\x8a-\xf3\x8f\xa6\x15\x9bx4F{8\
+\xca\xd0\xa3\xb6\xae)\x14g\xcf\x99\xc5\xbc9\xb3;\xf7\
+\x9e\xf7n\x09\x87 5>WJ!]\x07\x9fa\x1c\
+\xb3U\xcev\x1c::\x8a3\xa3\xa3\xd6?D\xc2\x1d\
+,[\xb9\x9b\x0b\xe7\x8ea\xe2\xc8J\x1a\xdbb<\xff\
+\xfan6n\xdb_\xd4\xeb6\x92\xc9$\x87\x1a<\xbb\
+\xe0(QJ\x96\xa3$\xc2H\x1f\xae3\x09\xd2\x82\xd4\
+<\xbe'\xf7\xd0\x93\xc9\x98\x17\xa7\xd5\xb4~#\x19\x8f\
+q\xa8\xa1\x11\xd7=r[\xc74\x0c\x02~\x8b\xa0\xdf\
+$`\x81\xcf\x00\xbf\xd9\xf3\xc3\xd7\xf9\xdf\x80%\x08\x05\
+|X>\xf3\x98\x85x\xf1x\x82\xc6\xc6\xe2\x1d%i\
+\xfd\xc3\xba-\x07X\xb7\xb5\x81\xcaR?\x89\xa4\xe4\xf5\
+\x8d\xf5\xb4\xb7\xb5\x17\xba[\xdd\x8a'\x12\xd4\x1f\xf2\xee\
+v\x80tb\xe5v\xb4)\xa3\xc7f\x12\xd0\x0dR\xab\
+\xec<\x19\xa1\xc7\xf5\x22\x1bM\xebV4\x1a\xe6\xf9\xe7\
+\x9f#^\xc0\xb2\xa5\xe1h\x94\xa6n\xf6\xc3kZ.\
+\xec\xaeke\xe3\x8ez\xac\x80E4a\xb3f\xe3~\
+\x5cY\xbc\xa3s\x80d\xd2\xa6\xb9\xb9\xd5\xc3\x16D0\
+\xd3t\xce\x19,\x8aC\x00\xe5\xde,\x8aS\x9en\xca\
+\xd7\xb4\xfe\xc0u\x1d\x9a\x9b\x9b\x91\xf2\xc8Z\x13\xe9J\
+b\xc9$\xb1\x84\x8d\xeb\xaac\xd2e\xf6\x94\xea,\xd4\
+\xea7MB!\x1f~\x9f\xef\xf0\xe7H,\x16\xa7\xbd\
+\xbdo.^\xd5\xfa\x0e\xe5$Y\xbaj\x17\xbf\xfc\xfb\
+\x066\xed\xacg\xf7\x9e\xba\x82\xef3O\xc7\xb6m\x9a\
+[<}od\x5c\xe54\x83EqB\x00e^\xdc\
+C\x97n\x92h\xac\xb8\xb6 hZ\xb1QR\xd1\xd2\
+\xd2\x86<j\xa4b\xbb\x8aG\x1e\x7f\x96\xff\xfe\xc5/\
+h\xae\xdfGIy\xef\xb6\xcc(\xa5p\x1d\x17C\x08\
+\x16\x9e\x7f\x09\x1f\xb9\xe9=\xcc\x982\xe1\xf0\xf7#\x91\
+\x08mm\xad\xbdjC\xd3\xd2S\xac\xdd\xb8\x87\xfb~\
+\xd6B\x22\xe9\xf4\x89R\xbdI\xdb\xa6\xd5\xcb\xdb\x02J\
+\x052]C\x90\xbe8\x8b\xe5O\x05\xf4\xacJ8e\
+\xc6\xb1\x93\xc4c\xfa\x1e\xba\xa6uG)Ess\xd3\
+\xb1#t\x04\x1b6l\xe0\xc5\xa7\x1e\xcey{\x0dm\
+\x11\xae\xbe\xea\x92c\x03z4JG\xbb\x9eM\xd3\xbc\
+\x17\x8f'\xd9\x7f0\xb3{\xc6\xc5\xc0u\x5c\xc2\x11\x0f\
+\x07\xa6B\x94\x08!\xfc@\xda\xab\x9b\xb4\xa3n!\x0c\
+C\x08\xa3\x0c\x0f\x16\xc5\xc5\xe3q\xc2z\xca]\xd3\xba\
+%\x95\xa4\xb1\xa9\xf1\x98\x11\xbae\x19X\x96'\xcbZ\
+0M\x03\xbf\xef\xc8\xb5\xbe\x02\xc2\x91(\x89\xa8~\xaf\
+j\xda\xf1\x94RD\xc2\xde\xad\x053\xcc@\x99\x15\xa8\
+\xc8h/z\xa6\x9f\x08\xa5Y<6c\xb1x\x9c\xf6\
+\xb0\xce\x7f\xaei\xdd\x91R\xd2\xd2\xdc\x8cm\x1fIs\
+i\x19PYY\x890C9oo\xc4\x88QTW\
+T\x1e\xf3\xb5\xa4m\x83*\x5c\x99JM+f\xa7*\
+h\x94\x0b\xc20\xcb\x0c+X\x95\xc9c3\xdd\xb6\x96\
+\xfbO\x0d \x99H\x12-\xb24~\x9aV\x8c\xc2\x1d\
+\x1d\x84\xc3G\xde+\x02\x08\x85B\xf8KJr\xde\xd6\
+\x80\xda\x81\x94\x96\x95\x1e\xfew$\x9a\xe0P}\xdfK\
+\xcf\xaci\xf9\xe2qM\xf6rR\x09f\xd2\xca4\xa0\
+\x07\xf1`\xca=\x91H\xe8\x80\xaeii(\xa5\x88E\
+\xc3\xb4v\x1c;\x9bURRBY/\x17\xc3\x9dL\
+\xed\xc0\x01\x84J\x8e\x5c\xc3\x1f<X\xc7\xba\xb5kr\
+\xde\x8e\xa6\xf5\x17Io\x13\xa4\x95\x93\xca\x05\x93V\x81\
+\x03z\x92HX\x07tM\xeb\x96R\xc4\xe3Q:\xc2\
+\x11\x8e\xde\x92[RRJEEF\xef\xf3\xac\x0c\x1c\
+8\x80\x80\xffHq\xc5X,N\xcb)J\xb8j\x9a\
+\xe6\xf9\x08\xbd\x84\x0c\xf3\xb9g\x1a\xd0\xfdx\x94)\xee\
+de!5M;\x96\x9dH\x10\x8e\xc4p\x8f\xda\x93\
+\x1b*\x09QV\x96q\xdd\x86\x8c\xd5VW\xe3\xf3\xf9\
+\x0e\xff;\x1a\x8b\xd3\xa6\x03\xba\xa6\x9d\x92\xc7Q,@\
+\x86\xb7\xbd3]\xe8\x96\xf1\xc6\xf6l\xb8Rb{{\
+e\xa3i\xfd\x82t\x1c^~\xe9%Z[Z\x0f\x7f\
+\xad$\x14\xa2\xac<\xf7\x01\xbd$\x14\xc40\x8e|4\
+D\x22a\xdatR\x19M;%\x8f\x93\xd9\x85H\x8d\
+\xd2\xd3\xcat\x84\xeeK\xfb\xa8\x1e\x08G\x224\xb7\xb4\
+xqjM\xebW\x14\x92\xfd\xfb\xf7\x13O\x1cI\xff\
+\x1a\x0a\x85\xa8\xc8q@\x17\x86I0\x18\xc4<j\xe6\
+\xac\xbd\xa3\x83v\x9dTF\xd3N\xc9um\x94\xf4,\
+\x09N\x80\xd4m\xef\xb42\x1d\xa1g\x90Q.{\xb6\
+m\x13\x8f\xe9jk\x9a\x96\x89\xd6\xd6\x16\x1c\xfb\xc8\x8c\
+VYY\x195559m\xc3\xb4\xfc\x04\xfd\xfec\
+F\xe8m\xeda\xda\xda\xf4\x08]\xd3NEI\x85\x92\
+\x9e\xcd6\xfb\xe9\x0b\x01]\x08q\xcc\x07\x87\xa6i\xa7\
+\xd6\xdc\xdcr\xcc\xe2\x9b\x8a\xf2rjkks\xda\x86\
+\xcf\x1f \x10\xf0#\x8ez[vt\x84\x89\x86u@\
+\xd7\xb4\xeexX\xe1\xd5\xdfy\xa4\x95\xe9\x94\xbb\xd9\xab\
+\xee\x9c\xea\xc4B \x0c\xbd(N\xd32\xd1\xda\xda\x8a\
+}\xd4\x08\xbd\xa4$HEf\x09\xa42#\x04\xa1\x92\
+RB\xa1\x00\xc6Q\xef\xcbX4\x8at\x8a?\xa7\xb6\
+\xa6\x15\x92\x87\x91\xccG\x86\xeb\xd82\x1d\x1e\xeb\xa8\xab\
+i\x05\xd6\xd1\xd6vLF*\x9f\xcfG0\x98\xd1L\
+\x5cF\x84\x10\x94\x94URRr\xe4\x1e\xba\xa43K\
+\x9c\xa6i\x85b\xa0\x03\xba\xa6\xf5/\xe1H\x07\xed\x91\
+#\xc9e\xfc\x96Ei(wI\x1c\x85\x10\x94\x95W\
+\x10\x0c\x84\x0e\xd7b\x8a\xc5\x1d]6U\xd3\x0a/\xa3\
+Y\xf2L\x03zqW\x98\xd7\xb4\xd3@,\x169&\
+\xfd\xabe\x19\x94\x96\xe62\xa0\x1bTTVQ\x12\x0a\
+\x1c\xbe\x82\xdf\xb9s\x07\x1b\xdf\xdc\x90\xb364M\xeb\
+\x91\x8cbp\xa6\x01\xbd\xb8+\xcck\xdai\xc0I\xc4\
+\x8e\xc9\xach\x1a\x10\x0a\x06\xc1\x97\x9b\xa0n\x08Ae\
+U\x15\xa1\xd0\x91\xd9\xbdh$J\xbb\x97\xb5\x9e5M\
+\xcbD\xce\x02\xba\x02\xdc\xb4\x8f\xea\x01E*O\xb5\xa6\
+i\x19P\x92x\xc2>|u-\x00\x7f @\xa8\xa4\
+,'\xa7\x17BP]SM0x$\xa0\xb7\xb6\xb7\
+\xd3\xaa\xb7\xaciZ\xa1e\x14\x833\x1d\xa1{\x12\xd0\
+-\xc38&\xc5\xa4\xa6i\xdd{\xed\x8d\xd7\xa8\xab;\
+R\xf9,\x18\x0cR\x9a\xa3\xf4\xaf\xc20\x18P;\x90\
+\xa0\xff\xc8B\xbb\x96\xd66\xda\xdb\xf5\x08]\xd3\xbac\
+\x08\x03az\xba\x05;\xa3\xad\xe3\x99\x8e\xd0=Y\xe6\
+ZRRBuU\xee\xabEiZ\x7f\xb5u\xcb\x16\
+Z\x8e\xca\xae\x18\x0a\x85\xa8\xa8\xa8\xca\xc9\xb9\x0d\xc3`\
+\xf0\xa0\xc1\xf8}G>;Z\x9b[uR\x19MK\
+\xc30M\x84\x91\xd1V\xf1\x1e7\x91\xb3\x07\x01\x9el\
+B\xf5\xfb|\x84\x02\xb9\xdbv\xa3i\xfd]GG;\
+\xc9\xe4\x91\xb7c0\x18\xa4\xbc\xb2*'\xe76\x0c\x83\
+!C\x06cZG\x16\xd4\xb6\xb5\xb7\x11\xee\xe8\xc8\xc9\
+\xf95\xad\xbfJ\xe5S\xf1t\x84\x9eQ\x1a\xbaL{\
+\xe0Q~V\x85\xd2\x0b\xe85-c\xed\xad\x1d$\x12\
+G\x02z \xe0\xa7\x22G5\xd1\x85\x10TWU\x1e\
+[\x98%\x1a%\x99\xd0%\x8e5\xad[\xde\x86\xb1\x8c\
+g\xc93\x9drO\xe0A\x97}>\x1f\x81\xa0'\x85\
+\xdc4\xad_jko#qt\x81\x96`\x90\xea\xea\
+\xea\x9c\x9c\xdb0\x0c\xfc\xc7\xadi\x89\xc7\xa2\xe0]\x8e\
+jM\xeb\x17\x0c\xd3\x93d\xaa]\x5cr\x1c\xd0\xe3x\
+\x10\xd0\x83\xa1\x10\x15\x15\x95\xb9>\xad\xa6\xf5[\x1d\xe1\
+v\xa2\xb1##\xe6\xd2\x92\x12\x06\x0d\x1a\x94\x93s[\
+\xbe\x00\xc1`\x10\xd1\x99T\xc6U\x10\x8b\xc7\xd3\xfc\x94\
+\xa6i\xc1\x90\xa7\xb7\x8e\x1dr\x1c\xd0cx\x11\xd0\x03\
+~JKr\x97\x18C\xd3\xfa\xbbHG\x07\x1dG\xed\
+E\x0f\x95\x84\x18\x98\xa3\x80\x1e\x0c\x95P\x12\xf2ct\
+\x06\xf4\xa4\xa3\x88F\xf4t\xbb\xa6\xa5\xe3\xf3y\xba \
+.\xe3\x1b\xf4\x05\x1d\xa1\x07\x02\x01JJ2\xaa\xdb\xae\
+i\x1a\xe0$\xe3\x84;\x8e\xa4\x7f\x0d\x05\x83TU\xe7\
+f\x96+\x10,9f\x84\xbee\xf3fv\xef\xda\x91\
+\x93skZ\x7fv\xf4\xce\x90\x5cSJnW\xcay\
+3\x93\xc7\xa6\x0d\xe8JI\xa5\x94\x8c\xe0I@\x0fR\
+V\x96\x9b\xa4\x18\x9avZP\x0e\x1d\xe1\xc8\xe17\xa3\
+\xdf\x9f\xa3|\xee\xc2 XRJ0\xe8?\x1c\xd0\x0f\
+54\xd0\xd4\xdc\xd4\xfbskZ\x7f&\xbc\x9dr\x97\
+nr\xad\x13o{%\x93\xc7\xa6\x0f\xe8\xae\xad\x94k\
+\x87Q*\xe7\xe9_\xfd~\x8b\x80\xde\xb6\xa6iY\x89\
+'\x92\x87\xb3\xc5Y\xa6II\xa8\xf7\x0bK\x850\xf0\
+\x07\x83\x04\x03G\x02zSs\xcb1\xb3\x01\x9a\xa6\x9d\
+\xc82-\xca\xbd\x1c\x98J\xb7A\xb9\xf6\xa1\xf4\x0f\xcc\
+d\xca]\xb9\x12\xe5\x86\xf1`\x84.\x0c?!=\xe5\
+\xaeiY\xd9\xb4\xf1M\xf6\xed=\x08\x80i\x18\x84\x02\
+\xbd\xbf\x7f\xa7\xa4C0XB(\x18\xe8*\xb4Fc\
+C\x13\x1dz\x0f\xba\xa6u\xcb\xef\xf7QS]\xe5e\
+\x13\xc9L\x0b\x9e\xa6\x9f\xf8O\xbd\xbb;\x10\x1e\x14h\
+\x11&e\xe5\xb9I[\xa9i\xa7\x8b\xad[6\xb3o\
+\xff>F\x8f\x1c\x82!\x04\x83\x06\x0db\xc6\xdc\xf3\xd8\
+\xbey\x03B\x18\x18\x19\xa6\xa0\x14\x02\xa4T\xb8\x8eC\
+\xcd\x80\x81\x5cx\xc1b\xca\x8eZ\xa4\xda\xd2\xdaB$\
+\x12\xf1\xeaihZ\xbf\xe0\xf7\xf9\xa8\xad\xad\xf2\xae\x01\
+!\xe2\x87\xaf\xb2\xd3\xc8\xe4N\xbe\x04\xda\xf1\xa8\xe2Z\
+(\xa4\xef\xa1kZ6\xe2\xf1\x04vg\xb68\xc3\x80\
+\xa9\x93'\xf0\xb5\xaf\xdd\xc7\xeb\xaf\xbf\x8aiXX\x19\
+.\xd0\x11B\xe0:.\xc9d\x92\xc1C\x86\xf0\x96\xab\
+.?\xa6\x1ckGG\xc71{\xde5M;\x91\xcf\
+\xe7\xa3\xba\xca\xd3\xed\xd7Q2,b\x96\xc9;_\x01\
+mx\x94\x0b'\x10\xd0\xdb\xd64-\x1b\x1d\xe1\x0e\xa2\
+\xb1\x18\x90\x0a\xcaC\x07\xd5r\xfd\xd5\x8b\xb9\xfe\xea\xc5\
+9m'\x12\x89\x90Lz\x94$R\xd3\xfa\x89@0\
+\xc0\xa0\x81\x03\xbdk@\x181afv\x91\x9e\xe9\x08\
+\xbd\x15\x8fF\xe8\x96_g\x8a\xd3\xb4lttt\x10\
+\x8dz\xbb?\xdc\x05\xa2\x91\x08\xb8\x9e\xd4e\xd2\xb4~\
+#\x18\x080dpnrA\x9c\x842\xad`\xd4\xb4\
+2[<\x9e\xc1\xa28$\x8a6\x94G\x01\xdd\xdb\x94\
+y\x9a\xd6\xef\x84\xc3a\xcf\xefm;Ng@\xd74\
+\xad[~\xbf\x8f\x01\xb55^\x9d>L*\xb1[F\
+2M,\xd3\x8aG#\xf4`0HUU\x95\x17\xa7\
+\xd6\xb4~)\x12\x09\xd3\xd6\xe6m\x8dr\xa9 i{\
+RdQ\xd3\xfa\x95\x80\xb7#\xf4\x0e \xe3+\xeb\xf4\
+\x01]\x08\x85\x10-\x08o\xee\xa1\x97\x84B\x0c\x1d\xe2\
+\xd9/C\xd3\xfa\x1de\xc7=\xdfN\xb6~\xdd:\xea\
+\x0e\x1c\xf0\xb4\x0d-\x87\x04\x99\xeel\xd2r,\x18*\
+a\xc8\xf0\x91^\x9d>\xd7\x01\xdd\x94\x08\xb3\x09\x8f\x16\
+\xc5\x95\x96\x86\x18>|\x88\x17\xa7\xd62\xa5\xd4I\x17\
+Q\xa6J\xdb\xea\xf2\xb6\xc5G\xd1\x11\x0e#=|i\
+v\xed\xdeMsS\x83w\x0dh=\xa6\xe4I\x8aN\
++\xfdN-\x94` \x88/\xe0\xd9\xf6\xeb&R\xbb\
+\xcc2\x92>S\x9c\xb4\xa5\x92v\x03Y\x5c%d\xa3\
+\xac\xac\x8c1\xa3Fxqj-C\xb6\x9dD\x9e$\
+:\xb8\xae\x8b\xed\xe8\xd2\x99\xc5(\x16Kx\x1a\xd0[\
+Z\xdb\x88\xc72\xbeu\xa7\xe5Q\xd2\xb6Q\xc7]\x81\
++\xa5p\x92\xfa\x16I!\xf8\xfdA<\x9c\x1e\xa9\x03\
+\x1a3}p\x06\xa9_\x93(7\xd9\x81\xc2\x93\xcb\xf5\
+\xf2\xb22F\x8f\x1e\xe5\xc5\xa9\xb5\x0c\x19\x96\x9f\x80\xdf\
+:\xe1o\xd2\xef\xf7c\x9a\xbe\x93\xff\x90VP\x87\x0e\
+\x1d\xa4\xb1\xa9\xd5\xb3\xf3w\x84\xc3$\xf4=\xf4\xa2T\
+ZZ\x82e\x1d\xbb\x98\xd80\x0dBA\x9dF\xbb\x10\
+\xbc\xccv\xaa\x94\xbb_\xb9v\xbd\x92\x99\xed6I\xbb\
+mM\x18\x87?\xd0\x1bH\xedf\xc9\xe9\xb2\xf4\x92\xd2\
+\x10C\x87\x0e\xcd\xe5)\xb5\x0c\x05K\xca\x18<x\x08\
+\xe7]x1\x83\x07\xd6\x1c.\x9b\xd9e\xd2\xa4\x09\xbc\
+\xe5\xea\xaby\xe1\xd9'hhh$\x11\xd7\xa54\x8b\
+\xc5\x86\x0d\xebyy\xe9R\x16\x9f\xb7\x10;i\xe7f\
+\xbaU\xa4R\xc9\xba\xd2e\xd7\xae]\xc4\xf4\x08\xbdh\
+\x08\xc3\xa2v\xc0\x00F\x8d\x19\xc7\xa5\x17/\xa6\xb2\xa2\
+\xe2\x98\xefW\x94\x97s\xc1\x85\xe7\xb3i\xd3F\xf6\xec\
+\xdaNsS#\xe4\xbe\xfc\x86v\x1c\xc30\xa8\x1dP\
+\xeb\xd9\xf9\xa5\x13\xaf\x97v\xa2\x1dC\xe0\x0bV\xa7}\
+|\xda\x80nt\xee\x7fS\xca=$\x84\x99\x04\x91\xd3\
+L0\xfe@\x90\x01\x03<\xdc\x94\xaf\x9d\xc0\x1f\x080\
+t\xc4(\xce\xbf\xe0\x12\xde\xf6\xd6\xb7r\xde\xa2\xb3\x19\
+4\xa0\xe6pQ\x8e.sfN\xe7\xc7?\xfa>\x8f\
+=y\x09\x8f=\xf6\x04\xaf.}\x89\xba\xfd\xfb\xb0\x93\
+:{X\xa1\xed\xdd\xbd\x9b\x07\x1f\xfc\x13\xabW\xad\xa1\
+\xa9\xa9\x91LSCvG\x08A\xc0\xe7#\x1a\x8f\xf3\
+\xc2\x0b/\x10\xd1y\xdc\x0bN\x08\x83\xca\xaa\x1af\x9c\
+9\x97\xab\xae\xba\x8a+.\xbd\x98\xe9\xd3\xa6`\x1d\x97\
+\xde\xb7\xb2\xa2\x9c\x8f|\xe8\xfd\xcc\x9ds\x16\x8f=\xfe\
+\x14\x8f?\xf6\x08\x1b7\xac%\xdc\xdez\xc2\xf4\xbc\x96\
+;ee%\x0c\x1f\xee\xe1\x80T\xc9f\x94\xad\x90\x99\
+\xa5sF)\xd5\xed\xe1:\x89\xae\xe3{J\xcaV\xe5\
+\x81W\x96\xbd\xd4\xb5\xfaJ\x1f\x1e\x1f\x86\xe1SW\xbe\
+\xf5\xed\xea\xa5\xa5\xcb\xb3z\x8d\x1c\xc7QO?\xf7\xb2\
+\xba\xf4\xaa\xebU0TZ\xf0\xe7\xa1\x0f}\xf4\xf7C\
+\x08\xa1F\x8f\x9b\xac\xbe\xfd\x1f?U-\xad\xedY\xbd\
+_\xf7\xee\xafS\xf7\xde\xf7]5l\xe4X%\x84(\
+\xf8s\xe9\xaf\xc7\xc8\x91\xc3\xd5/\x7fq\x7fV\xafM\
+6\x9cD\xfb\xfb\x92\xe1z\x92\x91\x86\xb4\xb1Z)E\
+6\x01\xfd\xd3J\xca\x06/:\xbdr\xe5\xca\x82\xbf0\
+\xa7\xc5a\x05\xd5g\xbf\xf8\x15\xb5{\xef>e\xdbN\
+\xd6\xaf\x93m\xdb\xea\xe0\xa1\x06u\xeb\xed\x9fQ\xa1\xd2\
+\x8a\xc2?\x1f}\xe8\xa3\x1f\x1f\xf3\x17^\xa8\x9ez\xe6\
+\x05\x15\x8d\xc5\xb2~\xafJ)U$\x1aU\xff\xf8\xbf\
+\xc7\xd4\xf4\xd9s\x0b\xfe\x5c\xfa\xeb1\xfd\x8c)\xea\xf1\
+G\xff\x99\xf5\xeb\x93\xc5+y\xbd\x92.J\xba9\x0f\
+\xe8\x1fPR\xee\xf7\xa2\xcb\xeb\xd6\xadS\xa5e\xe5\x05\
+\x7fq\xfa\xf5a\xf8\xd57\xbe\xf3\x1f\xea\xc0\xc1\xfa^\
+\xbf^\xf5\x87\x1a\xd4]\x9f\xfe\xa2\x0a\x94\xe8\xd7L\x1f\
+\xfa\xf0\xe2Xx\xfeb\xf5\xf4s/\xaad\xd2\xee\xd5\
+{5\x16O\xa8\x87\x1f{R\xcd\x9asN\xc1\x9fS\
+\x7f<\xce?\xf7\x1c\xb5e\xc3\xca^\x7f\xa6\x9eB\xb3\
+R\xear\x95A \xef:2\x9c\x98\x07\xe0 \xe0\xc9\
+\xb2\xd7@ \xc0\xa8Q\xc3O\xb8\x87\xab\xe5\x880\xf9\
+\xe8\xcd\xb7\xf2\xa1\x0f\xbc\x8f\xa19\xc8h4h\xe0\x00\
+>s\xf7\x1d\xdcp\xe3{\xc9,\xd9\xa0\xa6i\x99\x1a\
+=n2w\xdf}7\x17\x9e\xbf\x08_\x86\x95\xf3N\
+%\x18\xf0s\xf9\xa5\x17\xf1\x85\xcf\x7f\x96\x11c'\xe6\
+\xa8\x87Z\x97\xea\x9a\x1aF\x8f\x9b\xe4\xd5\xe9\xeb\xc9r\
+\xbbx6\x9f\xc6u\x80'\xa5\x97JBA\xa6N\x9e\
+\xe0\xc5\xa9O{\x86ar\xe6\xbc\x05\xdc\xf3\xa9\xdb\x19\
+1,w\x09|\x86\x0d\x1d\xccG?r\x13s\xe6/\
+\xcc\xd995\xed\xb4g\x06\xb8\xe7\xd3\xf7p\xd5e\x97\
+\xe4\xac\xce\x85\xdfgq\xcd[\xae\xe4c\x1f\xbb\x19\xd3\
+\xa7\xb7\xb6\xe5REe5\xfe`\xa9W\xa7\xaf#\x95\
+).c\x19\xecC\xb7S\x87\x93\xd8\x07\xd2\x93},\
+%%%\xcc\x9c>\xd5\x8bS\x9f\xf6\xaak\x07p\xcb\
+-\xb70e\xd2\xc9/\x98$\xd0\xd4\x1e\xa5\xa5\xad\xe3\
+\x98\xd5\xb0R*\x22\xb1$\x1d\xd1$\xce)v\xbf\x9c\
+=w6\xef}\xcf{\x08\x96z\x96%I\xd3N+\
+s\xe6\x9d\xc3\xf5\xd7\xbe\x8dP\xe8\xe4\x81\xb7#\x9a\xa4\
+5\x1c\xc3q\x8f}S\xda\x8eC$\x9e \x12?\xf9\
+~\xe5`0\xc8\x0do\xbf\x969\xf3\x16\xe4\xbc\xcf\xa7\
+\xb3\x92\xd2\x8a\xf4\x0f\xea\xb9\xbd\xa4J\x97g,\xed|\
+\x8e\xebtnQR\xaa\xc5\xf0\x85\x1a\xbd\x98\x15/)\
+\x091}\xdaT\x84\x10z\x8bE\x0e\x09\xc3`\xe2\xe4\
+3\xb8\xe1\xed\xd7\xa0\x94:\xe1\x96\xc6\xde\xfd\x07x\xf8\
+\xb1'ill\xe5m\xd7\xbc\x85\x19\x93\xc7\x1d\x95\xb0\
+B\xb1n\xfdF\x9ey\xe1%\x06\xd6Tq\xf5\x15\x97\
+0\xe2\xb8\xed\x19\x01\xbf\x9f\x0b/8\x9f\xe93\xe7\xf0\
+\xc6+/\xe4\xe7IiZ?e\xf9\x03\xdc\xf4\xc1\xf7\
+SYq\xe2\x05r2\x99\xe4\x85%\xcbye\xf9\xeb\
+\x0c\x1c4\x88w^s%\x03\x8f\xda\xff\xdc\xda\xd6\xce\
+cO>\xc7\xbe}\xfbX0\x7f>\xe7-\x98\x87\xdf\
+\x7f\xec\xc7\xfb\xf0\xe1\xc3\xb8\xee\xbakY\xbd\xe2\x15\x92\
+\x09\xbd\xf5\xb4\xb7\x0cCPUY\xe9\xd9\xf9\x95t\xb6\
+)\xa5\x9a\x0f\xb7\x97I\x92\xaft7\xd9\xedX[\xe7\
+\xd1\x8at\xed_)\xa5\xdc\x9c\xdf\xfa\x97\xaeZ\xf5\xc6\
+\x12e\x9aF\xc1\x179\xf4\xa7\xa3\xa4\xacR}\xfc\xce\
+\xcf\x9e\xf4W\x1e\x89D\xd5\xb7\xbe\xf7#\x05(\xcb\x17\
+P\xcf-]u\xc2\xca\xf7\xfb\x7f\xf1k\x05BY\xfe\
+\x90\xfa\xe2\x97\xbf\xa9\xa2\xd1\xe8\x09\xe7\xa9\xaboTw\
+\xde\xfd9\x85\xde\x1a\x93\xf7C\x08\xa1,_@\x05C\
+\xa5\xca\x1f\x08\xf5\xfe\x08\x86\x94\xcf\x1fT\x86a\x16\xfc\
+\xb9\x9dn\x870\x0c5j\xdc\x14\xb5c\xd7\xee\x13\xde\
+c\x8e\xe3\xaa\xd7\xdeX\xad\xa6\x9f9_\x01j\xe6\xdc\
+\x85j\xc3\xc6\xcd\xc7<f\xf3\xb6\xed\xea\x9c\xf3.I\
+}\x7f\xce\x02\xb5f\xed\x06\xe5\xba\xf2\xb8\xf38j\xe9\
++\xaf\xab1\x13\xa7)a\xe8\xcf\xda\xde\x1eU\x95\x15\
+\xea'?\xf9q\xb6\xd1.cv\xac\xf5\xbd\x89p\x03\
+\x89H#\x89HcF\x8b\xe2\xd2\x8e\xd0M\x7f\xd9Q\
+\xffRu(\xd5\x8e\x10U\xe9~.+\xc2`\xf0\xd0\
+Q\x18\x86\x89\xeb\xea\xecF\xb9R]U\xc5Y\xb3g\
+\x9f\xf4{\xcb\x96\xaf\xe0\x8f\x7f|0\xf5\xb8\xea*\xca\
+\xca\x82'\x8c\xe0\xcb\xcaJ)\xab\xac%\xdc\xd6\xc8\xef\
+\xff\xf0;\xaey\xdbU\xcc9s&\xe6Q\xf7\xf6*\
++\xca\x98<e\x0aV\xa0\x0c'\xae\x13\x91\xe4Si\
+y%\xd3f\xcee\xec\xb8\xb1\xb9\xc9\xbb.\x04v2\
+\xc9\x9aU+\xa9\xdb\xb7\x13\xd7\xd5y\xfc\xf3\xc5\xb2,\
+&N\x9arB\x068\x80\xc6\xe6\x16\xfe\xf8\xe7\xbf\xb0\
+~\xd5r\x00F\x8f\x1aM\xf0\xb84\xaf\x01\xbf\x9fa\
+\xc3R3hkW\xbc\xc2\xdf\xff\xf50#F\x0e\xa7\
+\xa6\xaa\xf2\xf0cL\xd3d\xf2\x94\x89L\x9c4\x99\x03\
+\xbb\xb7\x91Lz\xb2$\xea\xb41|\xd8\x10\xc6\x8c\xf6\
+\xb4\x0e\xc9\xa1l\x8b\x9cf\xb0\x84\xf2\x98\x13\xd6\x91Z\
+uW\x95U+\x19\xf0\xf9C\x84JJ\xb1\xdbZs\
+}\xea\xd3V\xed\x80\x81\xcc\x9a1\xed\xa4\xdf[\xbbv\
+-o\xae]\x03\x80\xe5\x0b\xa0\xe4\x89\x17R\xa6i\x11\
+\x08\x86\x08\xb7A\xc3\xc1}<\xfb\xfc\x8b\x9c1y\x22\
+e\xe5G.\xf2B\xc1\x00\xd3\xa7Me\xc0\xc0A\x1c\
+\xdc\xab\x03z>\x8d\x193\x96{\xbf\xf8y\xae\xbe|\
+qN\xcf\xfb\xd1\xdb>\xc5C\x0f\xfe\x9ahX\xbf\x9e\
+\xf9b\x9a&\xe3'\x8c;\xe6b\xb9K]\xddA\x9e\
+{\xfe\x85\xc3\xff6\x0cqBb@!\x0cL\xf3\xc8\
+\xc7\xf9\xa3\x8f\xff\x9b\xeb\xae}\xeb1\x01\x1d `Y\
+\x8c\x1d3\x86%\x96\xe9\xd1\x9e\xa5\xd3\xc7\xf0\xe1\xc3\x18\
+7v\xb4W\xa7\xb7\xc9\xf2\xfe9d\xbf\xe7\xe8\x00\x10\
+\xce\xb6\x91\x8c:b\x1a\x8c\x1d;\x0a\xc3\xd4\xdb\xa0r\
+E\x18&I\xd7\x05\xc0\x96\x8a\xa4\x93\xba8\xdb\xb0y\
+\x1b/\xbc\xf0<Ju?\x02KM\xe3\xa4\x02\xbdc\
+'y\xe9\xe5\xa5\xb4\xb4G;\xcf\xc7\xe1\xc5r>\x7f\
+\x80@0\xe0\xd1\xb3\xd0N\xa5\xa5\xb5\x95\xba\xba:\x0c\
+\xc3\xc8\xd9\x11\x8d%\xa8\xab\xab#\x91\xd0\x9f\xf6\xf9d\
+\x08\x83\x92\x92\x12\x0c#\x15\x94\x93\xae:\x5cMo_\
+\xdd!\xb6o\xdbz\xf8\xb1\xaak\xd2\xb7\x1b\x9b6\xbe\
+I\xfd\xa1T\x91.G\xa6\xce\x07\xa0\x10\xb8'\xb9x\
+\xd7\xb27f\xcc(\xa6L\xf6l\xcb\xda&+P\x1e\
+\xb6Jj\xb1B5X\xa1\x9a\x8c~(}q\x96c\
+/\x05\x0f \xbc\x09\xe8\x96e1c\xdaT6o\xda\
+L\xdc\xd5SA\xb9\xb0k\xe76\xbe\xfa\xb5\xfb\x188\
+p \xae\xe3\x80\x82`(\xc0\xc1\xbazV\xadX\x9e\
+\xd5\xb9\x5cW\xf2\xea\xb2\x97\xb9\xf5\x13\x9f\xa4\xb2\xb2\xb2\
+\xf3\xd6\x88\xc2\xb4,\x0e\xd5\x1f\xe4P\xdd~o\x9e\x84\
+vJ\xd1h\x94\xc6\xe6\xa6\x9c\x9dO)\x88\xc5\x13\xb4\
+\xb7\xb5\xe8\xe9\xf6<K$\x13<\xf1\xf8c\xec\xdb\xbb\
+\x17\xcb\xb4p]\x17\xc34P\x0avn\xdfF\xa4=\
+\xdd\xeb\xac8\xbaJz\xb4\xbd\x99o~\xe3[\xfc\xe1\
+\xc1?a\xdb6\xd2\x95\x98\xa6A\xd2\xb6Y\xb9\xe2\x0d\
+\x92\xfa\x82\xad\xd7\x06\x0d\x1a\x86\xe5]\x1d\xf4\xad\x08#\
+\x92\xed\x1a\xf4\xb4\x01]\x1d[\xb1g\x0f\xc2\x8cz\x91\
+\xfe\xc5\xef\xf3q\xee\x82y<\xfa\xe8\xbf\x89\xc7u@\
+\xcf\x85\xb6\x96&\x9e{\xeaq@\xa4>\xadE\xea\x02\
+MI\x89\x92nV\xe7RJ\xd2\xdaT\xcf\xe3\x0f\xff\
+\x13a\x88\x13\xbeG\x96\xe7\xd3z/\x91\x88\xd3\xda\xd2\
+\x92\xc33*\x92\xb6C$\x12\xd1\xafg\x9e\xb9\x8e\xc3\
+\xe67\xd7\xb2y\xe3\x86\xce!8\xa9\xb7\xadT\x90f\
+&\x0d8\xb2T\xeb\xf0\xbf%K^z\x8e\xa5K^\
+8\xf2\xfd\xce\xb7\xadr]R\x1bV\xb5\xde(\xab\xa8\
+\xc2\xc3:\xe8;\x81\xac\x17\xc6\xa4\xdf\xb6f\x1fU2\
+S\xa9\x06\xc3_RwTI\xd5\x9c\xf1\xf9|\x9c3\
+\xffl\xfc~\x7f\xce\xcf}:S\xee\xb1\xfbR\xb3[\
+bq\xb2\x13:(\xfdY_\x14\x12\xf1\x04\xad\xadY\
+\xdff\xebV,\x96 \x1a\xf1d\x12NK#u\x91\
+\x9d\xc37\x97r;\x83\xb7\x96k\xc1`\x80\xdaZ\xef\
+\xca\xa6\x82\xda\xc8\x09Ie\xd2_<\xa4\x0d\xe8\xd29\
+\xb2_Q)\xe9\x1a\xbe\xc0\x0e\xf09\x99\xfcl6L\
+\xd3d\xe2\xe4\xe9X>\x1d\xd05-\x13\xae\x9d\xa4\xa3\
+\xad\x1d\xa9\xc0\xc8\xc1@A)H\xd8.\x89\xb8\xae\x83\
+\xaei\xdd\x19?~\x8c\xa7+\xdc\xa5\x1d_\xaf\x8eK\
+\xe4f\xfa\xd2g\xa4K\xbb\x02\xcd0\x03\x87\x0f\xd3\x0a\
+\x220\xf6\x01\xad=\xee\xe9)\x09J\xca\xab)\xaf\xa8\
+L\xffPM\xd3\x00I8\x12&\x96\xc8\xcd\xfdn\xd7\
+u\xd9\xb9k'\xf1X4\xfd\x835\xed46\xe7\xcc\
+\x99L\x9e4\xde\xab\xd3\xc7\x5c;\xb6\xdfMFq\x93\
+\xb1\xc3G&\xd2\x06t+Xy\xd4Q\x850|\xfb\
+A5\xf4\xba\xcb\xa70q\xe2\xf8\x93n\xdd\xd0\xbce\
+\x18'\xfe)\x08!8a\x7f\x8cVTb\xb1h\xce\
+V\xa4\xc7\xe2q\x9e{\xeeY\x22z\xbbZQK\xbd\
+/O\xfc\x9a.n\x95?\xd3\xa7\xcf`\xe4\xc81^\
+\x9c\xda\x05\xd6\x1b\x86e\x1b\x86\x8f\xa3\x8fLd\xbfG\
+L\x88\x03 \x9a\xd3?\xb0g\x16\x9d3\x87\xea*O\
+\xf3\xe3j'\xa1\xa4<\xe1C\xc24\xcd\x93\x06z\xad\
+xD\xc2a\xc2\xd1\xdc\x8c\xa8\x1d\xc7\xa1\xb5\xb5\x0d\xa9\
+\xb75\x155\xd3<\x12\xbc\xbb\xd6\xc4\x08!\xf0\xfbs\
+\xbf\xb6I;\xb9a\xc3G\x83\x07k\xc9H\x05\xf4\x0d\
+f\xb0\x22i\x85\xaa\xb0B\x95\x87\x8fL\xf4\xe4\xd3z\
+\x1f\xd0\xd8\x83\x9f\xcb\xc8\xa2\x85\xf3\xa9\xf40?\xaev\
+\xa2D\x22\xce\xd2\xa5K\x88F\xe2\xc4\x936\xb1\xce]\
+\x06\xd1X\x1c\xd79y\xb1\x07\xad8\x1c\xaa?\xc8\xab\
+\xaf\xbc\x92\x93s\xd9\xb6Css3R/\xa4*j\
+\x1d\x1dal;u\x9b%\x1c\x89\xa6\xb6\x1b&\x92D\
+rta\xa7\xa5\x17,)K\xff\xa0\x9eq\x80M\x9d\
+\xff\xcdZ\x06\xc5Y\x8e\x9b\xbbW\xd4\x1b\xa6o\xbf0\
+r\xba&\xee\xb0\xb9\xf3\xe6SV\xae\xabw\xe5S{\
+[+\xbf\xfa\xd5\x03\xbc\xf8\xd2\xcb\xa9m2\x225\x05\
+\xbfc\xdb6\xdaZs\xb7\xcfY\xcb\xbdx,JS\
+sn\xb6\xae9\xaeK\xb8\xa3C\x8f\xd0\x8b\xdc\xaa\x15\
+\xafs\xc7\xa7>GYY)\xc9D\x02\xcb\xe7\xa3\xa3\
+\xa3\x835\xabW\x14\xbak\xa7\x85Q\xa3\x86S[S\
+\xe5\xd5\xe9]`%\xd0\xa3\xea9\xe9\xa3\xf2\xf1\xfbQ\
+\x95r1\xcd\xed\xa4R\xd3\xe5|\xce!TZC \
+X\x92\xeb\xd3j\xddp\xec$\x1b\xd7\xadb\xcb\xc6\xb5\
+(Ij\xea])\x5c\xd7EI\x9d`\xa4\x98%\xed\
+$\xad\xad\xad99\x97m\xdbtt\xb4\xeb\x8a\x87E\
+\xae\xf1P\x1d\xcf<\xf9H\xe7\xdbTAg\x95J=\
+\x9b\x96\x1f\x0b\xe6\xcfa\xe4\x88a\x1e\x9d]\xb9\xd2I\
+\xae\xe6$#t\xc3J\x9f\x8d3m@7\xac\x13\xeb\
+\xf2\x0aa\xec\x03\x0e\x01\xc33\xe9b\xb6\xc6\x8c\x1e\xcb\
+\x8a7\xde\xc0\xd5S\x7fy#]\x1b\xe9\xea\x0f\x84\xbe\
+&\x99L\xd2\xd8\x94\x9b;`\x89\xa4M[{;R\
+\xe9\x11zQS\x12'\xa9\xcb\x9f\x16\xcaE\x8b/b\
+\xc4\x08Or\xb8+`\xaf\x94v\x0b'I\x19b\x90\
+>\xa0\xa7\xbd\x87.\x0c\xeb\x84\x03a\xec\x07v\xf5\xa0\
+\xc3\x19Y\xb4`\xde1\xb5~5M;\xb9d2I\
+SS3\xb9\x18T'\x926\xe1\x8ev=\xe5\xaei\
+\xdd\x984e:\x81`\xc8\x8bS'\x80\xb5Go\x15\
+?\xfa\xc8D\xda\x80\xae\xa4{\x92\xc3\xd9\xae\x94\xdc\xd6\
+\xdb\xde\x9f\xcaE\x8b\xcfe\xf4(O\x06\xff\x9a\xd6\xaf\
+8\x8eMkk+I\xbbw\xb3Y\x8a\xd4\xa2\xb8X\
+4\x92\x83t\x82\x9a\xd6?\x05CA\xca\xca\xab\xbc:\
+}\x14\xc4*\xc3\xf4)\xc3\xf4q\xfc\x91\x89\xf4\x8b\xe2\
+\x92\x91\x13\xbf\xa8\xe4Aa\x05\xb6\x99>O\xaeR\x98\
+6}\x06\x83\x06\x0d\xf1\xe4\xdc\x9a\xd6\x9f8\x8eCG\
+[\x1b\xb1x\x02\xbf\xbf\xa4\xc7\x99\xa5m\xdba\xff\x81\
+:\x92\xf1\x18:\xa2k\xda\xc9\x9du\xd6,**=\
+[\xb4\x1dU\xca}\x83S\xbc\x01\x85H\x9f\x9f%}\
+\xeaW\xf7\xc4{5JJL\xc3\xd8\x0d!\x17\xc8y\
+\x16\x18a\x86\xa8\x1d4$UHD/\xd0\xd1\xb4S\
+\x93.\xe1p\x07\xf1D\x92J\x15\xeaq\x22\xa0\x8e\x8e\
+\x0e^Y\xba\x8cd\x86\x19\xa94\xedtt\xcd\xd5\x97\
+3h\xe0\x00O\xce\xad\x94\x0c\xcbdx5\x18'\x0d\
+zf\x06\x95\xdd2\xd8\x87.N<\x84\x00\xc4AR\
+{\xd2=1y\xd2DJ\xcb\xf4jwMK'\x1a\
+\x8d\x90H\xf6.[\x5c2i\xd3\xd0\xd4\x88\xd3\xcb\xf3\
+hZ\x7f\xb6x\xf1ETUeV\x9b<kJ5\
+*\xe9\xb6)\xe9(%\x1d\x8e?2\x91v\x84\xee/\
+9qqZ\xaa\x12\x9fh\x22\xb50\xce\x93\xe5~\xf3\
+\xe6\xcef\xf2\xc4\xf1\xacX\xb9\xd6\x8b\xd3kZ\xbf\x91\
+\x88'H\xda\x0e\x9d;\x98z$\x99\xb4i\xcei)\
+VM\xeb\x7f\x06\x0d\xf5$\xdcAj\xdf\xf9\xa6\xde\xae\
+nM?B\x17\xc6\x09\x87\x10\x06\x08Q\x07\xac\xefU\
+\xeb\xddXp\xce<&O\x9e\xe8\xd5\xe95\xad\xdf\x08\
+w\xb4\xf2\xc6\x1b\xaf#{Q\xc3\xdc\xb6m\xda\xdb;\
+r\xb2Z^\xd3\xfa\x1b\xc30\x18?a\x02\x81\xc0\x89\
+\xdb\xb8s\xa4M\x18\xc6&3X\x85\x19\xac<\xe9\x91\
+\x89\xf4\xf7\xd0\xedS\xdcSS\xaaA\x98\xd6Zaz\
+S\xee\xb4\xa4l\x00C\x86\x8e\xf2\xe4\xdc\x9a\xd6\x9f\xc4\
+cQv\xef\xda\xd3\xab\xedfI;I{[\x1bz\
+A\x9c\xa6\x9d\xc8\xe7\xf3\xf1\x96+/\xa6$\xe4Y@\
+o\x01\xb1F\x18\xbd[\x92\x96\xc1\xa2\xb8S\xdcSS\
+\xd21P[\x85\xe9\x8f\x00\xe9\x0b\xb5\xf6\xc0\x88\x91\xa3\
+\xf0\xf9|\xd8\xb6Nx\xa2i\xa7\xe2\xd8\x0e\xcd\xcd\xad\
+\xbd\x0a\xc5\xf1D\x92\xd6\xd6\xb6\x9c\xf5I\xd3\xfa\x13\x9f\
+\xcf\xe2\xdd7\xbc\x93\xd2Ror\xb8+%[\x95\x9b\
+\x5cqB\x85\xac\xa3d\x92).}=t+x\x8a\
+#\x840\xfd\x07\x01\xcfnr\x9f5{\x063\xa6O\
+\xf1\xea\xf4\x9a\xd6/\xb8\xd2\xa5\xa1\xa9\x01\xb7\x17#\xf4\
+D\x22I{\xbb\x0e\xe8\x9av2\xc1P)\xb3\xcf\x9a\
+\x8fiyS\xc3\x04\xe5\xee\x97v\xacE:qNu\
+d\x22\x83\x80\x1e8\xf9\xe1\x0b\x22L\xdf!\xe0\xb9\xde\
+>\x97S9s\xf6l\x16_p\x9eW\xa7\xd7\xb4~\
+\xc1u]\x9a\x9a\x9aH\xf6b\x85z,\x1e'\x1a\xe9\
+\xd0\x13\xee\x9av\x1c\xd34\x994i\x22\xa6\xdf\x9b\xbc\
++@\x14a\xacKe\x84\xf3\x9f\xf2\xc8D\xda\xcb\x0d\
+\xa5\xba]h\xd3\x02\xe2\x15!\xbc\xa9\x99]QU\xcb\
+\xa4)\xd3<9\xb7\xa6\xf5\x17\xae\xeb\xd2\xda\xd2B,\
+\x9e\xa0\xaa\xa2g\xe7\x88F\xa3\xc4\xa3\x11\xf4\xaa8M\
+;VUe9\xd7\xbd\xed\xf2\x1e'm\xca\xc0\x0e!\
+\xcc\xd7\x85\xbf\xf7\xdb\xb43\xc8\x14\x17\xee\xe6\xbbJ\x0a\
+a\xee2\xfd\xe5I\xc0\x93\xd5q\x03\x07\x0d\xc5\xef\xf7\
+\x91L\xea\xfb\xe8\x9av2RJ\xda\xdaZI\xc4{\
+6Bw%\x84#1\xec\x84.\xf8\xa1i\xc7\xab\xae\
+\xae\xe6\xfak\xaf\xc10<\x0b\xe9\xbbPjU\xfa+\
+\x86\xf4\xed\xf7,\xb1\xcc\xb1G\x0b\xf0\x22\xa9:\xae9\
+7u\xca\x04\xae\xba\xe2b/N\xadi\xfd\x82\x94.\
+\x91p\x07\xf1x\xb2GS\xe6\x8e+\x89D\xa2x\xf4\
+\x16\xd6\xb4>\xad\xac\xa2\x9a\xb1\x13g\xe0\xd5L\xb4r\
+\xed]n2|\xd0MF\xe8\xee\xc8D\xda\x1eZ\x81\
+\x8an\x0f\xd3_\xd6\x06<\x8cG\x9f\x06\x13&N\xe2\
+\x92\x8bu@\xd7\xb4SR\x8aX,F\xc2N\xf6(\
+Ur}\xfdA\x96,y\xc9\x83\x8eiZ\xdf\xe6\xf7\
+\xfb\x98v\xc6\x14DO36\xa5\x17\x03v\xa2\x94B\
+)\xba=2\xd0\xb3\xe2,\xc7\x8a\x02KL\x7f\x89\x91\
+\xc9\x94@\xb6,+\xc0\xf8\xc9\xfa>\xba\xa6u'\x11\
+\x8f\xe2J\xd5\x95\xc61+\xd1H\x94\xfa\xfaC\x9e\xf4\
+K\xd3\xfa\xb2\xd1\xa3Fp\xe3;\xdf\xe6e\x13\xdb\x85\
+\xe9\xdbd\x1a&\xb9\x88\x9fiG\xe8\xae\x13Kw(\
+\xd7\x89\xef\x06\x9a{\xdd\x9bS\x186t8S\xa7\xe8\
+\xacq\x9av*\x89X\x94\xd5\xabW\x13O$\xb2\xfe\
+\xd9x\x22A{{\xbb\x07\xbd\xd2\xb4\xbem\xf8\xf0\x91\
+,\xbe\xf8r\xcf\xce\xaf\xa4\xbdF:\xf17\xa4\xb4\x91\
+2\xd9\xed\x91\x89\x1e\xd6C?\xeePn\x14x\x92\xd4\
+\xf4A\xce\x8d\x1a9\x9cw\xbf\xebz/N\xadi\xfd\
+B2\x99`\xf3\xe6-${\x18\xd0[[[s\xdf\
+)M\xeb\xe3F\x8c\x1aMiY\x95g\xe7W\xd2}\
+S:\x89C\xd2I\x90\xee\xc8D\xfa{\xe8\xfe\xd2L\
+\x0e\x17\xc4\x9f\x80\x8e\xde>\xc1\x93\xa9\xaa\xae\xe1\x92\xcb\
+\xae\xf4\xe2\xd4\x9a\xd6/H\xd7\xa5\xa5\xb9\xa5G\xc9e\
+\xa2\xb1\x98\x0e\xe8\x9av\x9c\xc1C\x06r\xde\xa2s\xbc\
+l\xa2\x03\xd8\x8e\x82\x8c\x8e\x0c\xa4\xbd\x87n\xfa2\xda\
+\x1b\xe7*i/\x17\x86\x95\xf0\xe2>:\x08F\x8c\x1a\
+\xcf\xc0A\x83hlh\xd05\xd25\xed\x04\x8a\xfa\x86\
+\x06\x92=H\x93\x1c\x89Du\x968M;\xce\xd9s\
+\xce\xe2\xaa+\xbd\x9bn\x07V\x0aan\x13\xa6\xaf\xe7\
+e\x12\x8f\x936\xa0;\xb1\x8cJ**P\xcdf\xa8\
+\xe6\x80\x10b\x18\xd0\xbb\x0c\xf3'QVV\xc2\x87?\
+x#?\xfa\xf1\xcfunwM;\x8eR\x8a\xc6\xc6\
+Fb\xb1\xec\xf7\x92G#Q\xa2\x91\xee\xf2Mh\xda\
+\xe9g\xd2\x943\x181j\xbcw\x0d(\xb5L\x18\xd6\
+\x0e\xd3\xcc]:\xd9\x0c\xca\xa7\x9a\x99\x1f\xf0'\xa01\
+g\xbd;JeE\x05\xefx\xfbu\xf8|\x1e\xe5\xd2\
+\xd5\xb4>L)E[K\x13\xf1x\xf6\xf7\xd0#\x91\
+(n\xc2\x93\xe5/\x9a\xd6'\x95\x96\x950~\x9c\x87\
+\xc1\x1c\x94t\x13+\xddd\xb8%\xdd\xfe\xf3l\xf6\xa1\
+\xa7\x8d\x8eV\xa8*\x9bN\xfe\x1b\xb8\x09\x18\x9c\xcd\x0f\
+e\xc20-&M=\x93\xd2\xf2J\xa2Q\xfd\xe1\xa3\
+iGS\x0aZ\xdb\xda\x89g\x99\xcf]\x02\xb1D\xa2\
+\xf3\x7fi\x9a\x06p\xe1\xb9\x0b\xb8\xf0\x82\x85^6\xb1\
+\x1f\xa8\xcb\xf5I\xd3O\xb9'\xb2\xb8\xb7\xa6\xe4v\xd3\
+_\x1e\x13\x867\xa3\xe8` \xc8\xdb\xaf\xb9\x8a\xdf?\
+\xf8\xe7\xce\xccV\x9a\xa6\xa5(\xa2\x91\x08\xc9Dv\x01\
+}\xdf\xfe:\xd6\xac^\xe5Q\x9f4\xado\x9aw\xf6\
+\x02&N\xf22\xff\x89z\xc30\xfd\xf5\x98\xbe\x9c\x9e\
+5\xed\x94\xbbt\x93\x99\x1fN\xd2\x05\xf9\x0a\xe0\xc9\x0d\
+9\xcb\xb2\xf8\xf0\x87\xdeKy\x9975i5\xad\xaf\
+R\x0a\xe2\xf1(\xf1,\xf3\xb9\xb7\xb7\xb5SWw\xc0\
+\xa3^iZ\xdf\xe3\x0f\x04\x18;~\x02\x96\xcf\x93\xf2\
+$\x00('\xf9\xa4t\x13{\xa5k\x93\xe9\x91\x89\xb4\
+Ci_\xb0*\x8b^*\x84\xe1\xff;p!pf\
+\xe6?\x98\x19\xc349s\xeeBj\x07\x0c\xe2\xa0\xce\
+l\xa5iGQ$\xa2\x11\x1c'\xbb\x0c\xcc\xb1X\x9c\
+\xb6v\xbd N\xd3\xba\x5ct\xc1B\xe6\x9e5\xcb\xcb\
+&l%\xdd\x95R9Y\xed\x0a3\xac`\xfa\xc7\xa4\
+{\x80\x922\xf3C)\x5c;\xf6\x86\x92\xee\xae\x8c{\
+\x99%\xcb\x17\xe4\xca+.\xa1\xa2\x5c\x8f\xd25\xedh\
+\xd2\xb5\xd9\xb6}\x1b\x91h\xe6+\xdd\xa3\xb1\x18\x1d:\
+K\x9c\xa6\x1d\xf6\xd6\xb7\xbe\x8dI\x93\xa6x\xd9\xc4J\
+a\xfa\xeaM+@6G&\xd2\x06t'\xde\x9e\xed\
+\x91P\xae}\xb0\xd7O\xb9\x1b\x1f\xfd\xc8M\x8c\x1e=\
+\xca\xcb&4\xad\x0fR\xac[\xb7\x96\xf6\xb6\xcc\x03t\
+4\x12\xd1i_5\xadSee\x05\xd3f\x9c\x89\xe5\
+O?\x1a\xee)%\xed\x87\x10\xa29\xb5;\xcc\xc8\xfc\
+\xc8@\xda)w#\xc3+\x83\xc3\x9dU\x12\x0cc\x1d\
+\xd0\x02Tg\xf5\xc3\x19\x9a<u&c\xc7\x8dg\xfd\
+\x86\x8d:\xc9\x8c\xa6\x1d\xe5PcSV\xf9\xdc\xc3\xe1\
+\x08\x1d\x1d\x9e$x\xd4\xb4>\xe7-W]\xc6\x98\xd1\
+#\xbcl\x22)\x1d\xfb\x09PY\xbf\xe9L\x7f\xfa\xc5\
+\xe6\xe93\xc5\xf9K\xb3m\x17\x94zI)\xf7U!\
+L\xcf\xf2\xb5^p\xc1\xf9,]\xb6\x94\xa6F\xcfj\
+\xc2hZ\x9f\xd3\xd0\xd0@,\x9e\xf9\xb6\xce\x8eH\x84\
+pX\x07tM\x13B\xf0\xee\x1b\xdf\xc5\xe81\xe3\xbc\
+j\xc2\x05\xd6c\x18\x072\xce\xe5\x9a\xa5\xdcn[\xeb\
+\xa4\x94\xdc`\xfaJ7\x98\xbe\x90g\x01\xfd\x86w\xbc\
+\x8d'\x1e\x7f\x94\xa7\x9f}\xd1\xab&4\xad\xcfin\
+j&\x9aE\xb6\xb8p$L,\x9aY\xd2\x0aM\xeb\
+\xcfj\x07\x0c`\xdc\xc4\xe9x\x93\xbe\x1c\x808\xf0\xa8\
+i\x05\x1d\xaf\x1a\xc8`\xc3x\x0f\xae$R\xd3\xe0+\
+Ie\x8d\x1b\x90\xfd\x09\xd2\x1b:b<\xe3&L\x05\
+\x1d\xd05\xed\xb0\xb6\xb6\xd6\xac\xd2\xbfF#Qp\xb3\
+\xcf.\xa7i\xfd\x89a\x08>\xf8\xde\xb73h`\xad\
+\x87\xad\xa8\xb8t\x92\x7f\xa6\x87UI3\xb9\xfd\x9d>\
+S\x9c\xbf<\xeb\x86\x15\x0a!\xcc\x97\x14\xf2\x09\x81\xf1\
+\xbe\xacO\x90\x01\xc30\xb9x\xf1\xb9<\xf7\xec\x13l\
+\xdd\xb6\xcb\x8b&4\xad\xcf\x09\x87\xc3\xc4\x13\x99\x07\xf4\
+D\x0fR\xc5jZ\x7f#\xa5\xe2C\x1f\xfa(\xd5\xd5\
+^\x06t\xb6\xa3\xe4\x16<L\xcb\x986\xa0\xbb=\xb8\
+z\x17\x80T\xf2\x80a\xfa\xdf\x10V\xc8\x93\x80\x0ep\
+\xe9eW\xf0\xc4\x13:\xa0kZ\x97pGG\xc6\x01\
+}\xd7\x9e\xfdl\xde\xbc\xd9\xe3\x1eiZq3M\x93\
+\x193\xa63j\xec\x04\x0c3\xe7u\xc5\xba\xb4\x82x\
+\xda\xb0\x02\xd9%\x8a\xc8R\xfaLq\x19\x14^?\xfe\
+p\x9d\x04\xd2\x89+\xe5:\xab\x81-^u\xbe\xaa\xba\
+\x96\xb3\xe6\xcc\xc3\xb4t\xc1\x16M\x03H\xc6\xc3\xc43\
+\x9cr?PW\xcf\xbe}{=\xee\x91\xa6\x15\xb7`\
+0\xc0\x9d\x9f\xfc\x18\xc1\x80w[\xd5P\xaaQ\xb9\xf6\
+\xef\x94\x92\xf4\xf4\xc8D\xfaU\xee\x19d\xa79\xf9\x13\
+\x90\x08\xd3Z\x83\x92\x7fA\x18_\xea\xd9I\xd2;w\
+\xd1B\xce[t6/\xbc\xb8\xcc\xab&4\xad\xef\x90\
+\x0e\xc9dfkn\xa2\xd1\x18\x91\x88^\x10\xa7\x9d\xde\
+j\x07\x0c\xe4\x1d\xef\xba\x11\xbf\xdf\xbbT\xaf\xa0\xb6+\
+7\xb9\xa57\x0b\xeeD\x06\xdb\xd6\xd2\x8e\xd0\x0d_\xb0\
+g\x87\xbf\x14a\xf8Z\x95\x92/\x02\x9e\xad\xea\x9b5\
+{\x16\xd7_w\x9dW\xa7\xd7\xb4>\xe7\xc0\x81:b\
+\x19\xdc\x1b\x8fD#D\xa2\xba\xc8\x91v\xfa\x0a\x85\x82\
+\x5cy\xf9\xa5\x94\x95\xd7\x82\xf0lu{\x13\xa8g0\
+Lzud }\xfa\x19\xa5zxH:W\xc8\xef\
+\x04\xde\xe8\xcdo\xa3[\xc2\xc7\xcc3\xcf\xa6\xa6\xc6\x93\
+\x1c6\x9a\xd6\xe7\xacY\xb3\x9a\x03u\xf5i\x1f\x17\x8e\
+t\x10\xd5[\xd6\xb4\xd3\xd8\xe8\xd1\xa3\xb8\xeb\xf6[=\
+mC)w\xab\xeb$\x1eQ\xa4\x16\x8c\xf7\xf4\xff2\
+\x91A>9\xd5\xcbC\xeeW\xd2\xfe\x7f\xd9\xfd\x0a\xb2\
+3}\xea$n\xbb\xe5&/\x9b\xd0\xb4>\xa3\xa5\xa5\
+\x8dx<\xfd}\xf4\xf6\xf6\x0e\xc2a]\x98E;=\
+\x19\x86\xc1\xb8\xf1\x93\x982}\x8e\x97\xcd(%\x9d\xdd\
+n\xb2c\xb3Lv\xd0\x9b#\xa3\xe7\x94\xee\x01n2\
+\xda\xcb#\x12w\xed\xd8\xeb\xbd\xfe\xb5t\xa3v\xe0`\
+.\xbb\xe2\xad^6\xa1i}FKk\x0b\xe1H\xfa\
+\xa9\xf4\x8e\xf6\x0e\xa2\xfa\x1e\xbav\x9a\x1a3f$\xef\
+{\xf7\xf5^7\x13\x06\xd6\xa4\xee\x9d\xf7\xf6H\xcf\x9b\
+\xc42'\xfc\xbcj\x04\x1e\x04\xde\x09x\xb0\xf2@0\
+j\xf4h\xdez\xf5\xe5<\xf2\xd8\x93\xb9?\xbd\xa6\xf5\
+!--\xcdD\x22\xe9G\xde\x1d\xe1\x0e\x921}\x0f\
+];=M\x9d:\x9dk\xaf\xbf\xc1\xd36\x94\x94o\
+\x00\x8fZ\x81\x0aO\xdb\xe9\x92Aq\x96P/\x9bP\
+\x80h\x97\xd2~\xc00|\x9e]\x0e\x0d\x1b6\x82\xbb\
+\xee\xbcS\x07t\xed\xb4\xd7\xd6\xd6F$\x83{\xe3\x1d\
+\xeda\x94\xf2l\xbd\xaa\xa6\x15\xad\xaa\xaa\x0a\xce?o\
+!\xa1P\x89\xa7\xed(iou\xed\xf0&!z\xbf\
+\xbf=\x93z\xe8\xe9G\xe89\xe8\x08\xe0\xa0\xd4k\xc0\
+\x1e`r.Nx<\x9f\xcf\xc7\xac3\xe70\xed\x8c\
+\xc9l\xda\xbc\x0d\xd7\xf5t\xff\xbe\xa6\x15\xad\xf6\xb6v\
+\x22\x91\xee\xb3K*R\xb5\xd05\xedtt\xc1y\xe7\
+\xf2\x9e\xf7x\x96\xf3\xacKXIg\xbd\x92\x8e\x8d\xf0\
+,9\xdc12+\xb2\x9a\x13\x22\xa2\x94\xfc\x15\x8a\x16\
+\xafZ(/\xaf\xe4\x8b\x9f\xff4\xa6w\xd9~4\xad\
+\xe8\xc5\x22\xed\xc4\xd2lG\xdb\xb6s\x1f\xfb\xf6\xee\xce\
+S\x8f4\xadx\xf8|\x16\xe7_p\x01#F\x8e\xf2\
+\xb4\x1d\xe9$^\x95N\xe2E\x81\x01J\xf4\xfe\xc8@\
+\xda\x80\xae\xa4\x93\xb3C:\xb1_\x83\xf4\xac\xde\xa9?\
+\x10\xe0\x9d\xef\xba\x911cF#\xbc\xdbS\xa8iE\
+M:\x09l\xdb\xee\xf61;w\xee\xa4\xee\xc0\xfe<\
+\xf5H\xd3\x8a\xc7\x85\x17,\xe2\x92K/\xf7\xbc\x1d\xe5\
+$_\xc3\xb5\xd7{X\xbd\xed\x04\xe9\x03\xba\x93\xc8\xe1\
+\x91lR\xa8\xd5\xa4\xca\xc8y\xc2\x17(\xe3#\x1f\xfe\
+\x00\x15\x15\xd9\x17\x95\xd1\xb4\xfe\xe2\xd0\xa1\x06\x92\xf6\xa9\
+\xef\x8fG\xa3q]\x98E;\xed\x08!\xb8\xe1\x9d\xef\
+b\xe6\xccY\x1e\xb7\xa4\xf6!\xd4*\x04\xb2\xf7[\xbf\
+\xbb\x8e\xf42\xc8%\x97\xcbYy\x05\xa8\x9f\x00g\x00\
+Ssx\xe2#-(\xc5\xddw\xdd\xc5C\x7f\xf9;\
++W\xad\xf6\xaa\x8e\xbc\xa6\x15\xb5\xe7\x9e\x7f\x81)g\
+\x9c\xc1\x94I\x13\xe9\xe88\xb2\xe2\xdd\x10\x82\xca\xcaJ\
+^{m9\x8dM\x0d\x05\xec\xa1\xa6\xe5\xdf\x8c\xe9\xd3\
+\x986\xeb,\xaf\x9b\x89)%\xbf\xa7\x94z$\x9f\xa3\
+s\xc8d\x95\xbb\x99\xdb]f\xca\xb5_\xc64v\x0b\
+aL\xc1\x83g+\x84\xc0\x0a\x94q\xe1\x85\x17\xb2e\
+\xcbV\xc2a\xbd\xcfV;\xfd\xbc\xf4\xc23\xac\x5c\xb1\
+\x02\x7f \x80t]\x94J]\xd9\x0a!\x10\x86I\xb8\
+\xa3\x95x4\xb3d\x15\x9a\xd6\x1f\x08!\xf8\xcc=w\
+p\xce\xfcs\xbcn\xeaQ\xe0\x11 \x91\xcd\x1e\xf2\x5c\
+(T\x99\xb2\xa7\x80\xb3\x80A^5p\xef\x17\xeea\
+\xf9\xab\xaf\xb0t\xd9r\xaf\x9a\xd0\xb4\xa2\xe5\xda\x09\xda\
+[N\x9d\xfe5\x15\xdf\xf5\xf4\x95v\xfa\x181b8\
+\x93\xa6\xce\xf4\xbc\x1d%\x9d\xdf\x80\xdak\xfaC\xe0\xeb\
+\xed\xb6\xef\xec\xe4q\x95{\x17\x01N\xf2\x0fJ\xb9\xde\
+\xe5w\x07j\x06\x0cg\xee\xdc\xb3\xb1,\xbd\xe2];\
+=)\xa5Ny\xe8`\xae\x9dn\xbey\xdf\x97\x985\
+\xcb\xd3{\xe7\x12X\x0elH\xfdo\x91*\xf8\x92\xab\
+#\x03iG\xe8\xae\x9d\xfb\xbd\xaaJ\xca\x06K\x94m\
+\x17\x9e\x06[\xc1\xa7>u;k\xd7\xae\xe6\xf9\x17^\
+\xf6\xb0\x1dM\xd34\xadX\x09!\x18<d\x10\x8b\xce\
+_L\xc0\xcb\x9a\xe7`(\xe9\xfcH)U\xe7\xc5\x05\
+s&!=\xfd*w\xd7\xc9\xfd!]\xa4\xb4_D\
+\xa9\x1d9x\x9e\xa74z\xccD\x16_\xb4\x18\xc3\xd0\
+[\xd84M\xd3NGJ)\xbe\xf5\x8d\xaf2|\xb8\
+\xa7\xfb\xce]`\x8dR\xf2iPI/\x1b\xeaN\xfa\
+)\xf7\x5cN\x19t\x1e\x86a\xa0\xdc\xe4\xf3\xd2M>\
+\xed\xf5\x13\xbc\xee\xbawr\xe9\xc5\x8b\xbdnF\xd34\
+M+2\xa6i0e\xcaD\xde\xf7\xde\x0f\x10\x0cz\
+::\x8f*\xe9\xfe\x04h\xf3\xb2\x91t\xd2\x06t!\
+T\xce\x0f\x04(7\xd9\xac\xdc\xe43@\xfa\xc2\xcd\xbd\
+0}\xfat\xde\xf3\xde\xf7\x10\x0ay\xfabj\x9a\xa6\
+iE\xa6\xac\xac\x9c{\xef\xfd\x02\x96\xdf\xd3\xc5i.\
+J\xbd\xa9\x5c\xfb\xcf(\xa9P\x12O\x8e\x0cd0B\
+7=8\x0c\x0c\xc3\x02x\x19%\xff\xda\xbb\xdfez\
+\xf3\xce>\x87\xcb/\xbb\xd8\xebf4M\xd3\xb4\x22a\
+Y&\xb3f\xcd\xe0}\xef\xbb\x09#\xa7\xf9TN\xd0\
+\x08\xfc\x16\xc3\x8c!L\xe5M\xcc\xccl\xbdY\x06\xfb\
+\xd0\xbd\x1c\xd9\xcaz\xe9&\x9e1\xac\xd0G\x00\xcf.\
+\xa1\xa6N\x9d\xc6m\x1f\xff\x04O<\xf9\x0cq\x9d\x1d\
+K\xebg\x84aPQY\xcd\x80\x81\x83;\xb7\xa3I\
+2[B\xa3\x10\xc2@\x08A,\x1a\xe5`\xdd~\x5c\
+\xa7`\xb7\xff4-\xa7\x86\x0e\x1d\xca\xc7o\xf9\x88\xd7\
+\xcd(\xe0M\x84\xf8\xb5a\xfa\xbcn+\xad<\xd4C\
+OG\xac\x00\xfe\x08x\xfa\x9b\x9f8i\x12\xef|\xfb\
+[\xf9\xfd\x83\x7f\xf3\xb2\x19M\xcb\xbb\x92\x92R\xdeq\
+\xe3\xfb\xf9\xfcg\xeeF\x18\x06\x8e\xe3\x92i@7\x0c\
+A\xc0\x1f`\xdd\xfa7\xb9\xe3\xce;\xd8\xb9e\xfd\xe1\
+$4\x9a\xd6\x97M\x9b>\x83\x1b\xdf\xf3!\xaf\x9bi\
+\x02\x1e\xc7\xc3t\xe6\xd9H\x1b\xd0\x85\xe1\xf9>\xee\x03\
+\xd2\xb5\xffa\x98>O\x03\xfa\xa8Qc\xb8\xf5\xb6\xbb\
+t@\xd7\xfa\x1d\xd34\x19:t\x08#\x86\x0f\xc6\xef\
+\xf3ew\x0d.@ \x08\xb7\xb7R\xe2qmhM\
+\xcb\x97Y3\xcf\xe0\xb3\x9f\xba-\x1fM\xad\x04\x1e\xc8\
+GC\x99(\xc8*\xf7\xe3\x0e\x89`\x15\xf0{<\x9c\
+\x0e0L\x933\xce8\x83O\xdfu\xabWMhZ\
+A\xd8\xb6\xcd\xee]\xbbq\x1d\x17C\x08\x0c#\x8bC\
+\x08\x84\x80\xf6p\x98\xc6\xc6\x06\x9dnF\xeb\x17\xce\x9a\
+;\x9fE\xe7{\xben\xaa\x09x\x02\xbc+\x09\x9e\xad\
+\xb4#t\xe9Ab\x99\x938\xa4\x0c\xeb\xe7\xa6\xbf\xec\
+\xfd^6RQQ\xc9\xad\xb7\xdd\xc9\xcf\x7f\xf5 \x91\
+\xb0\xcec\xad\xf5\x0f\x8e\xe3PWWG4\x16\xa7\xb4\
+\xa4gKQ\xda;:hmm\xee\xca\x09\xabi}\
+\xd6\xf9\x8b\xe6\xf3\xa9;n\xc3\x1f\xf06\xed\xaaR\xee\
+\x0bH\xf9GO\x1b9\x8a\xc8\xe0\x1e}\xda\x11\xbat\
+\x93y8\xe2\xae\xeb\xc4\xd6\x00\x7f\x05<[\xb5f\x18\
+\x06\xe3&L\xe1[\xdf\xf82\x96U\xa84\xf6\x9a\x96\
+[\xae\xeb\xd2\xda\xdaB\xb4\x17\x0b>\xe3\x09\x9bDL\
+\x172\xd2\xfa6\xc3\x10\x5c{\xfd\xf5\xcc\x985\xd7\xeb\
+\xa6\x9aP\xf2Q%\x9dz%]\xf2qd\x22\xfd*\
+w+\xd0\xebg\x9e\x19#\xae\xa4\xfb\x15a\x98\x17\x03\
+\x9e5*\x04\xdcy\xe7]\xfc\xe5/\x7f\xe3\xb5\xd7V\
+\xe0\xb8\x99\xfd\xa24\xadXI)ikk%\x1e\xef\
+\xd9\xba\x9c\xf6p\x94\xcd\x9b\xb7\xa2\x5c;\xc7=\xd3\xb4\
+\xfc\xba\xe6\x9a\xb7r\xd5\xd5\xd7\xe4\xa3\xa9G\x11\xe63\
+\xa9\xddd\xc5\x93\x894\x83\x80\x9e\xb7\x852RIg\
+\x930\xcc\xa7\x80k\x01\xef\xf6\xcb\x09\x1f\xf7\xdcs7\
+\x9f\xfc\xe4]\xd4\x1d<\xe8Y3\x9a\x96\x17J\x12\x0e\
+w`'\x1d\x94\xca\xb8\x8e\xc3aMMM\xac\x5c\xb9\
+\xc2\x9b\xbeiZ\x9e\x0c\x1e4\x90;\xef\xb8\x83\xc9\x93\
+'{\xddT\x03\xf0\x90\x10\xc6>D\x01\xea\x9bu#\
+}.w\xe9\xe4\xefP\x12%\x9d/\x82\xda\xea\xf5\x13\
+\xbf\xfe\xed7\xb0\xf8\xa2\x0b\x09\x06\xf25\x03\xa1i\xde\
+ID#446\xf5h\xc6)\x11O\xd0\xd6V\xd0\
+\x8c\x95\x9a\xd6k\x1f\xfb\xc8\x87\x986}\x86\xf7\x0d)\
+\xf5;\x94\x5c\x89R\xe4\xf5\xc8@\x06\x8b\xe2\xc2\xbd~\
+\xfe\xd9\x90\x09\xb5\xd3*\xa9~U\x18\xbe\xa9x\x5c\xaf\
+\xfdk_\xfe\x1c{\xf7\xec\xe2\xe5%\xafz\xd9\x8c\xa6\
+y.\x1e\x8f\xb1\xfc\xb5\xe5\xcc\x99=\x0d_yYV\
+?\x1b\x8b'hmm\xf5\xa6c\x9a\x96\x07ee\xe5\
+\xdc\xf8\xde\x0f2`\xc0 \xaf\x9bj\x96\xae\xfd'\x94\
+[\x9f\xef\xa9v\xc3\x97~\xd2:\x83\xf9\x02\x91\xdfC\
+\x08\xa4k\x7fC)\xf5J\xa6O\xb4\xa7&L\x9e\xc5\
+\xa2\xf3.\xf4:-\xa0\xa6y\xceN\xc6iiiE\
+\xf6`\x84\x1e\x8bEii)\x9a\x9d7\x9a\x96\xb5_\
+\xfc\xfc?\x998a\x5c>\x9a\xfa\x7f\xc0\xce|4\xd4\
+\x13iG\xc0\x85\xc8\x1a\xe5$#\xfb|\x86\xf5\x8a0\
+\xfd\xe7\x00\x9e\xe5\xd3\x13B\xf0\xf9\xcf}\x9e\xdd;w\
+\xf0\xa7?\xff\xc5\xabf4\xcdsJ*\xea\xeb\x0f\xf5\
+h\xca=\x16\x8b\xd3\xa6\x03\xba\xd6\x07Y\x96\xc9\xfc\xb3\
+\xe7r\xc1\xe2\xcb\xbc\xde\xa6\xa6\x80\x06\xd7\x8d\xff\x09\xa5\
+ZS\xff,\xbe-\x9eE94\x15\xcaU\xd2\xb5\x7f\
+\xa6\x94|\xc1\xeb\xb6*++y\xef{o`\xea\xe4\
+\xbc\x5c\xddi\x9a'\x94R\x1c<XO\xa2\x07[\xd7\
+\xc2\xe10\xad\xed\xfa\x1e\xba\xd6\xf7(\x0c\xfe\xfb\xe7?\
+g\xc8\xd0\xe1^7%\x81\x9f\xa1\xd4\xee\x8cK\x9f\x15\
+@\xfa\x80\xeeU)\xb8n\x0f\x05\xc8}\xc0?\x81f\
+\xaf\x7f\x09\x17\x5cp1\xef\xbc\xe1=^7\xa3i\x9e\
+QJr\xe8\xd0!\x22\xd1\xec\x13A\xb5\x85\xc3\xc4#\
+\xed\x1e\xf4J\xd3\xbcSZ\x12\xe23\x9f\xfa\x04\xd3g\
+\x9e\xe9\xf5mS\x05l\x03\x1e\x00\x15\xcf\xfbb\xb8\x5c\
+.\x8a3|\x85\xc8\xef\xac\x10\x86\x85R\xee\xc3\xc0\x22\
+!\x8c\xf7z\xd9ZYy%\x1f\xfc\xc0\x07Y\xbel\
+)O>\xf3\xbc\x97Mi\x9a'\x94R475\x12\
+\x8de\xbf\x17=\x16O\xe8=\xe8Z\x9f3}\xfa4\
+>\xfd\x99\xcf\xe4\xa3\xa9\x08\xf03\xa0\xce0\xfc`\x14\
+\xdfT{\x97\x0c\x02\xba\xb7\xe9\xf3NI)Pr?\
+\x88\x07\x11\xc6\xb9\xc0h/\x9b\x1b7~\x02_\xfc\xc2\
+\xe7X\xb5f-\x87\x1a\x9a\xbclJ\xd3<\xd1\xd1\xd1\
+F<\x91\xdd\x94{K[\x98\xdd;wy\xd3!M\
+\xf3\xc8\xb0aC\xf9\xd4\xdd\xf7P;p\x98\xd7MI\
+R\x05X~\x03 \x8c\xe2\xce0\x9a~\x9eB\xba\x85\
+9\x94\xec\x5cw\xa0\x96\xa2\xd4\xffz\xff\xab\x80\x19\xb3\
+\xe7q\xeb\xad\x1f\xcdGS\x9a\x96s\xb1h\x94D2\
+\xbb\x91\xf6\xde}\xfbX\xb3z\xb57\x1d\xd24\x0f\x94\
+\x96\x84\xb8\xe1\x9do\xe7\x86\x1bn\xccGsu\xc0/\
+I\x8d\xd2\x8b^\x06\xf7\xd0\x0bt\xbf\xa0\xf3P\xd2i\
+Wn\xf2QP\x8d^\xff2\xaakj\xb8\xe3\xae\xcf\
+2a\xd2D\x8a)\x9d\x9f\xa6\xa5\xa3\x94\x22\x1e\x8b\xd0\
+\xdc\xdc\x82\xebf\xbef'\x16\x8b\xd1\xa6\x17\xc4i}\
+\xc8\xf9\xe7-\xe2\xb6\x8f\xdf\x92\x8f\xa6\x1c`\x19\xf0\x87\
+|4\x96\x0bE\xb9\xca\xfdX\x02\xa5\xd4:)\x9d;\
+HM\x7fx\xaa\xba\xb2\x82\x87\xfe\xf0+**\xca\xbd\
+nJ\xd3rJ\xb9IV\xadZEKk\xe6\x01:\
+\x1a\x8d\xd2\xde\xa1+\x0fj}CMM5o\x7f\xe7\
+\x0dL\x98<=\x1f\xcdm\x03\xfe\x9c\x8f\x86r\xa5\xb8\
+o\x08\x1ca\x03K\x81\x97\x80\xf3\x00\xd3\xab\x86\x0c\xd3\
+\xe2\x8c\xe9\xf3\xf8\xe4m\x1f\xe1g\xff\xf5K::\xf2\
+\x9b)O\xd3z\xa3\xe1P\x03\xc9d2\xe3\xc7\x87\xc3\
+Q\xda\xdb\xf4\x0aw\xado\xb8\xf3\x8e\xdby\xff\xfb?\
+\x90\x97\xb6\x94t\x9fW\xd2~\xa4Xfk3)\x94\
+\x96~\x84n\x18\xc5q(\xb5_\xba\xf67\xf00\x98\
+w\x09\x86B|\xfa3\xf72v\xdc\x04\xaf\x9b\xd2\xb4\
+\x9c\xdaw\xe0\x00\xd1X\xe6[\xd7:\xc2a\xda\xf5\x94\
+\xbb\xd6\x07\xbc\xe3\xba\xaby\xcf\xbb\xdf\x85\xdf\xef\xcfG\
+skA\xfc\x1f\xa9\xc1d\x9f\x91>\xa0\x0bQ\x1c\x07\
+\xc2\x05\xf5*\xf0w<\xac\x99\xde\xa5\xba\xa6\x96\xdf<\
+p?\xa3F\x8e\xf0\xba)M\xcb\x99\x83uu\x84\xc3\
+\x99\xaf\xdfioo\xd7S\xee\x9dF\x0c\x1f\xc4\xa2y\
+g0j\xb8\xe7\xf9\xc0\xb5,\xd5\xd6V\xf1\xa1\x9b>\
+\xca\xf8\x09\x9eWR\x03@I\xe71\xe5&\x97\x14z\
+\x0d\xd9\x91#\xb3\xbb\xcd\xe9\xab\xad\xb9vq\x1c\xd2F\
+I'*\x9d\xf8W@\xb5\xf6\xf6\x05\xcb\xc4\x99s\x16\
+p\xfb'oe\xc0\x80\x9a|4\xa7i\xbd\xd6\xd4\xd4\
+H4\x9ay@\xefh\xef\xc0MD=\xecQ\xdf`\
+\xfa\x82|\xfc\xc6\xf9\xfc\xe8+W\xf3\x8e\xcbg!\xcc\
+\xbc\x8c\x02\xb5\x0c}\xf9+_\xe5\x82\x0b/\xce\xd7\xb6\
+\xb1\xf5\xc0\xe3(\x15)\x8a\xe9v\x01d\x98f6\xfd\
+oG:\xbd\xebL\x8e)\xc5\x9b\x18\xd6\x8f0\xac{\
+\x81\x0a\xaf\xdb\xbb\xe9\xc3\x1fe\xed\xba\x0d\xfc\xfe\x0f\x7f\
+\xf2\xba)\xcd#\xa3G\x0cb\xd0\x80J\xf6\xd65q\
+\xb0\xde\xf3\xc4\x83\x05\xd5\xd6\xdeN4\x9eyr\x99H\
+,\x06*\xfb\xfc\xef\xfd\xcd\xa8\x91\x83\xb8t\xfeX\xe6\
+\xcd\x1b\xc9\x9e\x1dM\xfceH-\xfb\xf6\xd7\x15\xba[\
+\x1a\xf0\xaew]\xcf-\x1f\xbb\x99`(?I\xce\x94\
+\x9b\xfc\x9dt\x12\xabP\xb2sv\xb8\xc0\x94B\x98\x99\
+]\xc8\x14_\xb5\xb5\x0c\xaa\xb1)\xe5~\x1fx\x94<\
+L\xbd\xd7\x0e\x18\xcc-\xb7\xde\xc6\xd9\xf3\xe6y\xdd\x94\
+\xe6\x01\xc3\xf4\xf1\xee\xb7\x9c\xc5w>{5\xd7^2\
+\x13#\xc37F_\x15\xeeh'\x96a\xb6\xb8C\xcd\
+\xed\xec\xdb\xb7\xd7\xe3\x1e\x15?a\x98,\x989\x02\xbf\
+\xcfG|\x7f\x1b\xa3\x86U\xb1x\xfex\x8abtv\
+\x1a\x13\xc0\xf4iS\xb8\xffg?\xce[0G\xa95\
+\xae\x1d}L\xda\x91\x88\x94I\xa4\x93(\x82#\x9eq\
+\x91\xb4>\xb0m\xedD*\xb5?\xfd\xe7(\xf5f>\
+\xda[\xb4\xe8\x5c\xbe\xf0\x85\xcf3t\xc8\xe0|4\xa7\
+\xe5\xd0\xf0a\x83\xb8\xe4\x9cq\x5c\xbcx\x1cW\x9c;\
+\x91\xa1C\x06\x16\xbaK\x9eJF\xc3D3\xcc\xe7\xbe\
+e\xf3f6o\xd8\xe0q\x8f\x8a_MM5\x17\xcd\
+\x1bEe\x99\x9f\xe6\x8e\x04\x93FUs\xe9\xc2\x89\x94\
+\x94y>\x01\xa8uc\xd8\xb0\xa1\xfc\xc7\xf7\xbeM\xcd\
+\xc0\xbc\xadcRJ\xc9\xef\x01[\x11&]\x03\xc8\xa2\
+82\x94\xfe\x1ez\x11\xfe\x9ft\x93\xb8\x89\x8e%R\
+\xda\xff\x07d_\x8d\xa2\x07\xae\xbd\xeeZ\xbe\xfc\xa5\xcf\
+\x10\x0c\xa6\xdf:\xa0\x15\x09!\xb8p\xeeh\xcaK\xfc\
+\xc4\xea\xda\xa9\xa9\x08r\xd6\xd4!\xc51\x8d\xe6\x197\
+\xe3\x80\x1e\x8dF\x09gq\xbf\xbd?2\x0c\x833&\
+\x0c\xe5\x9c\x99#\x08\x05-b\x09\x17\xd7u\x19R\x1b\
+b\xc6\xe4\xa1\x85\xee\xdei\xab\xbc\xbc\x9cw\xbc\xeb\x9d\
+\x5cq\xf5u\x88\xfc\xbc_\x15Jn@\xc9e\x14\xdb\
+\xca\xf6,\x82z\x9f\x1c\xa1\x03 \x0cP\xf2?Q\xf9\
+\xda\xf8op\xd5\xd5\xd7\xf0\xeew]\x9b\x9f\xe6\xb4^\
++)\xad\xe0\x9a\xc5S\x195\xa4\x92\xb6p\x82\x9a\x8a\
+\x003'\x0f%T\xd2\xbf\x93\x06u\x84#\xd8\x19\xdc\
+\x16\x0fG\xa2\x84#\xa7w@\x0f\x85B\x9c?g$\
+\xc1\x80\x89\xed(\x5c\x09\xb6\xe32\xb8&\xc4\x9c3\x86\
+f\xb4\xf7W\xcb\xbd\xf9\xe7,\xe0\xc7\xff\xf9\x93|6\
+\xa9\xecx\xeb\x97\x9cDk\x9d\x92N\xd1\x5c\xf4+%\
+1}\xa5\x98\xbe\xd2\x8c\x1e\xdfw\x03zJ;\x82\xbf\
+\x03\x9b\xf2\xd1\xd8\xc8Qc\xf9\xc4\xed\xf70j\x94\xde\
+\xca\xd6\x17L\x9b4\x84\xc1\x03J\x10\x02\xa2q\x87\x01\
+U!\x16\x9d9\x82Ic\xfb\xf7\xb4\xfb+\xaf,c\
+\xf7\xee\xddi\x1f\xd7\xd6\xd6\x9e\xd5\x16\xb7~G\x18\x9c\
+s\xe6D\xde~\xc9T\xfc>\x1fI\xc7E\x08\x88%\
+\x5c\x06V\x95\xf0\xb6\xc5\x939s\xba\xa75\xa1\xb4\x93\
+X\xb4`>\x7f\xfa\xfd\xaf\xf2\xd9\xa4\xab\x94\xbb\x0a\xd4\
+2\x10\x99ge*BE\x9f\xcb\xbd\xbb\xda\xb0\x9dS\
+\xef\xcfK'\xfe\x80\xd7\xbf(\x00\xc30\x995\xfbL\
+~\xf3\xdb\xdf\xe7\xa39\xad\x17L+\xc0\xa2\xd9\xa3\xa8\
+*\x0b\xe08\x12W\x82T0l@9\xe7\xcc\x1a\x09\
+F\xff\xdd\x96\x94\xaa\x8b\x9e~+Z,\x16%\x1c>\
+\x1d3!\x1a\x8c\x181\x8c\x9bo<\x8f\xfbn;\x9f\
+\xda\x8a \xb6\x9d\xfa\x1b\x11\x02\x5c\xa9H\xda.\x93G\
+U\xf3\x8d\x8f/\xe6\x9dW\xcdg\xe0\xa0\xfe}\x11X\
+,fL\x9f\xcc\x97\xbe\xf49\x06\x0c\x1e\x99\xcffm\
+'\xde\xf6\x15%e\xb3R\x8a\xa2;\xb2x\x22}{\
+\xc9\xafR(\xe5F\x11\xe2A\x94\x9c\x8e0>\xe8u\
+\x93\x96e\xb1\xf8\xc2\x0b\xf9\xf9\x7f\xfd\x98\x8f\x7f\xe2.\
+\xaf\x9b\xd3z\xc0\xf0\x85\xb8t\xd1d\xae\xb9p\x22e\
+\xa5~\x12G\x8d\xbc*\xcb\x02\x5c\xbbx2\x9bw4\
+\xf1\xc2+\x9b(\xb6\xdbe\xb9P_\x7f\x88h\xb4\xfb\
+\x0d \x8eT\xec\xdb\xb7\x8fh\xf4\xf4\x09\xe8\xc1\xd2\x0a\
+\xce\x9c2\x84\xc5g\x8fc\xc1\xecQ\x0c\x1bX\xc6\xd0\
+\x01e\xc4\xe2\x0eR\xa9c\xd6\xb4\xdb\xae\xc2g\x0af\
+N\x1a\xc8\xdd\x1f<\x87\x1b\xae\x9c\xce\x8b\xaf\xef`\xc9\
+\xca=\xac\xdbv\x10'~\x1a\xcflx$\x14\xf2\xf3\
+\xfe\x0f|\x80\x8b.\xb9\x22om*%\x1d7\xd1\xf1\
+\xbcr\x9d\xa7\x11\xa2\xe8\xf6o*%\x0f\x0f`3!\
+\xd2-\x87w\xe2E\x9e\x16\xb2s\x8f\x9e\xe9/9\x0b\
+\x8c\x07\x81)\xf9i\xd8\xe5\xf6O\xdc\xca\xff\xfc\xf27\
+\xd8vq\xed\xd5?]\x85J\xcb\x981q\x08\x0b\xce\
+\x1c\xcd\x95\xe7N\xe4\x8c\xb15\xb8\x0al'\xf5a\xad\
+\x14\xf8\xac\xd4\xc7\xf6\xba\xad\x0d<\xfe\xd2\x16\x96\xaf\xdb\
+\xcb\x86m\x07I\xc6\xfbOr\x95\xb2\xca\x1a\xae\xb9\xe6\
+zf\xcd\x9eM,\x1eC\xc9c\xb3L\xf9|~\xda\
+\xda\xdax\xf2\x89\xc7Y\xb3\xea\x8d\x8c\xb3P\xf5M\x82\
+\xd1#\x061{\xea0\x16\x9e9\x86Y\x93\x073q\
+d5\x03\xaaK\x88\xc6\x93DbN\xb7\x9f\x97\xa6!\
+(\x09Z\x04\xfd>\xf6\x1d\xea`\xc7\xfe6Vo:\
+\xc0\xd2U\xbbY\xbdq\x1f\xf5\x87\xfaw^\x83|\xba\
+\xf5\xd6\x9b\xf9\xf2\x97\xbf\xc2\xb0a\xc3\xf3\xd6\xa6r\x9d\
+\x1dN\xac\xf9\xe3\x18\xe6Syk4CJ)\x0c\xd3\
+\x8f\xe9\x0f!\x0c_F?\xd3?\x02\xbaa L_\
+\x00a\xdeh\x98\xfe\xdf\xe4\xab\xe9\xc6C\xfb\xf8\xe8G\
+o\xe6\xb1\x7f?\x85\xe3\x14\xdd\xc5\xdd\xe9\xc1\xf01r\
+H\x15gM\x1b\xc1\xfc\x99\xa3\x996a \x93GW\
+SS\x19\x22\x1cM\xe2\xb8\xc7\xaeoQ\x0a,SP\
+\x1a\xf4\xd1\xd8\x16\xe3\xcd]\xcdl\xd8z\x88\xd7\xd6\xec\
+b\xf5\xa6\x03\x1c8\xd8J\xaajb_g ,?\
+B\x08\xe4q\x01\xdb\xc0@J\x09\xd2\xf34\x0e\x05W\
+YU\xc5w>u\x05\x17\xcd\x1b\xcd\x90\xda\x12\x94\x80\
+\x8e\x88M\x22\x99\xc5\xfbU\x01\x06\x04\xfd\x16\x15%>\
+\xa4\x94\xeco\x88\xf0\xd0S\x1b\xf9\xc1\x03/\x10;\x8d\
+f9\xbcr\xe5\x15\x97\xf3\xb3\xff\xf7_\x8c\x1f?>\
+om*%\x93n\xa2\xe3\x17\xcau\xee@\x88lf\
+\xb6\xf3BI\x17+T\x89\x91E\xd6\xc2\x0c\xa6\xdc\x8b\
+\xeey\x1eK\xa4\xa6%\x94\x1dK \x8c?\x19\xa6\xef\
+- \xde\x91\x8f\xa6\x07\x0c\x1a\xc1\xe7>\xf79\xea\x1b\
+\x1ay\xf5\xd5\xd7\xf3\xd1\xa4v\x94\xc1\x03\xab\xb8h\xe1\
+d\xce\x9f3\x8e\xf3\xcf\x1a\xc5\xe4QU\xb4E\x13\x84\
+\xa3\x0e\xad\xe1d*\x15\xd1q\x8bU\xbb\xee\x91\xb6G\
+\x93T\x94\xfa\xb9d\xeeH\xae9\x7f<\x9bvN\xe6\
+\xc5\x95{y\xe1\xb5\xed,y}+\xf5\x8d\xad\x85x\
+J9$QN\xfc\xa4\xef\xde\xfe<\x1e?\x9a\x10\x02\
+\xbf\xdfb\xe4\x90r|>\x83\xf6\xa8\x8d\x10\x02W*\
+\x0cC e\x86\x9fm\x02\x0c!p]IG\xd4\x06\
+\x14\xe5%~\x86\x0f*\xc7\x1f\xb0\x88\xf5\x9f\xc9\x9d\x82\
+8\xeb\xccY\xfc\xcf\x7f\xff7#G\x8f\xc9[\x9bJ\
+\xb9\xaet\xe2/)\xe9\xfcZ\x98Vq\x06\xb9\x1e\xac\
+\xb4\xcf`\x84\xde\xda\xc3\xde\x14\x800\xb0\xfce5\x08\
+\xe3\x05\xe0\x0c\xf2P\x99\x0d\xe0\x0f\x0f\xfe\x9e{\xef\xfd\
+\x12{v\xef\xc9GsZ\xa7k\xaf\x98\xc7\x8f\xee^\
+\xcc\xd8\x91\xd5\xd45D\x89\xc6\x1c$\xd9\xe5\xf7\x12*\
+\xb5\x03\xb2\xbc\xc4\xc7\xc0\xda\x126lm\xe4\xcb\xff\xfd\
+\x12\xff|\xfc5\xaf\xba\xad\xe5\xd9\x84q#\x99;c\
+8W.\x9c\xc8\xb4\x09\x03)\x09\x98\xf8|&>\xcb\
+\xc4u\x15\xb2\x9b\xcf@\xc3\x10\x18\x068\x8e$\x99\x94\
+\x84\xe3\x0e\xab7\xd7\xf1\xf4\xb2\x1d,[\xbd\x8b\x03\x07\
+\xea\xf3\xf8L\xfa\x9f\xa1C\x07\xf3\xcc\x93\x8fq\xc6\x8c\
+9ym\xd7M\x86WK'\xf1E3X\xfe\xefl\
+\xeeQ\xe7\x97B\x18>\x84\xc8<\x8c\x99_\xfb\xda\xd7\
+\xba}\x80\xb4cE\xb3'/-!0\x0c_\x0c\xc4\
+~\x848\x17\xa8\xccG\xb33g\xce\xc2u\x15/\xbf\
+\xf4\x12\x8e\xd3\x1f\xa6k\xfb\x86P(DII\x10\xbf\
+ea\x18\x02a\x08L\xc3@\x08\x95\xd1{\xd4\x00\xcc\
+\xce\xf7J\xd2Ql\xdc\xd1\xc4\x93\xaf\xec\xe0\x955{\
+\xa9\xeb\xe79\xdfO'\xcd-\xed\xac\xdf\xbc\x8f\x17W\
+\xeee\xf3\xeeV\x9a\xdb\xe2\x08\x04\x03kK\xbb\x9d\x80\
+L\xd5\xc4P$\x93.\xab6\xd6\xf3\xd4\xab;\xf9\xf5\
+\xc3\xab\xf9\xed?W\xb0z\xfdv::\xf4\xc2\xb8\x9e\
+\x12\x02*++\xf8\xc5\xfd\xff\xc99\x8b\x16c\xe65\
+%\xb3\xeaPN\xf2{\xa0\xfe$L_V\x8b\xce\xf2\
+K!\x0c\x13!2\xdf]\x9ev\x84nG[\xfaN\
+@\xef\xa20\xad`\xf9\x03\xc20\xdf\x0d\xe4e\x7f\x92\
+\xe38\xfc\xe0\xfb\xdf\xe5\x0b\xf7~9\x1f\xcdi\xa4\xa6\
+Akj\xab9s\xdah\xce\x9e1\x9c\x85\xb3G0\
+{\xd2`\x5c\xd7\xc1q\x14n7S\xaa\x86\x01\x96i\
+`\x1a\x06+7\x1e\xe4\xd5u\x07X\xb6f\x1f\xab\xdf\
+\xdcM{[[\xe6\xd3\xb1Z\x9f!\x84@\x08A \
+\xe0g\xf2\xc4Q\x5c2\x7f\x1c\xe7\xcf\x19\xc1\xb4\xf1\x03\
+\x81c\xa7\xe0-\xd3 \x91\xb4Y\xbb\xb9\x9e\xe7\xde\xd8\
+\xcb\x8bo\xecd\xe7\xae\xfd$\xed\xd4\x8a\xf8\xe2\x0d\x02\
+}CyY)w\xddy\x1b_\xbc\xf7>\x82\xa1P\
+^\xdbv\x12\xe1oH;r\x9fa\x05]\xc3\x17,\
+\xd2\xd7Ra\x98\x81\xd4\xf4a\x16\xd2\x07\xf4Hs\xea\
+\xd3\xafOQX\xfe\xb2Za\xfa\xfe\x0e\x5c\x90\xafV\
+;:\x9a\xf9\xf67\xbf\xcew\xbf\x9f\xd7\x0cG\xa7\xb9\
+\xd4}\xd2\x92`\x801\xa3\x87\xb0\xf0\xacq,\x9a5\
+\x8c\xf3\xcf\x1a\x85\xe388\xeeq\x7f\xdf\x0a|\x96\x81\
+\x12\x82g_\xdb\xcd\xb25\xfbx}\xedn\xf6\xee;\
+D$\x96\xe8\xdc\xb1P\x8cop-\x97,\xcb\xa2\xb2\
+<\xc4%\xe7\xcd\xe4;\xb7_\x80\xcf2\x88%]P\
+\xa9i\xf6\xd2\x90\x8f\xddu\xed|\xed\xe7/\xf2\xf2\xf2\
+7\x89'l\x5cW/|\xcd\x05\xcb2y\xc7\xdb\xaf\
+\xe5\x7f\xfe\xe7WTTV\xe5\xb5m\xd7\x8e\xfc\xd8M\
+\xc6\xbe\x0d\xaa\xc10\xfd\x14o@\x97\x18f0\xeb\x80\
+\x9ev\xca\xdd0-\xa4\xdb\xf7\xf6\xea\x1a\xa6?&\x0c\
+s\x1b0\x17\xc8KU\x95@ \xc4\xc4\x09\xe3hk\
+md\xf5\x9a\xf5\xf9hR\x03\x5cW\x12O$\xa9o\
+lc\xf3\xf6:\xd6n\xa9'\x96\x84Y\x93\x06\xe2\x0f\
+\x18\xb8G\x05\xf5`\xc0\x22\x9ap\xf8\xd5?W\xf3\x8b\
+\x87\x96\xf1\xda\xaa\xed\xec\xabk$\x9eH\xa4V~k\
+\xa7\x05)%\xb1x\x92\x83\x87\xda\x198\xa0\x8a\xc9\xa3\
+\xab\xf1\x99&\x8e+)\x09Y\xb4\xb6\xc7\xf9\xebS\x1b\
+y\xe8\xd1\xd7\x89\xc62\xafv\xa5\xa5w\xe1\xe2\xc5\xfc\
+\xecg\xff\xc5\xe0\xc1C\xf2\xdb\xb0\x92\x7f\x91N\xe2\xfb\
+J:{!Ue/\xd3\xb2\xa4\xf9f\x18~0\xb2\
+_\x02\x966\xfc\x0b3\xb3\xfdoE'u\x9b`\x09\
+\xf0\x00\xd0\x94\xaffG\x8f\x9d\xc4=\xf7|\x86+.\
+\xbd0_Mj\x9d\x94ti\xef\x88\xb0a\xf3\x1e\x1e\
+\xf8\xeb\xab<\xff\xfan\x92I75\x22W\xe0\xf7\x19\
+D\xe3I\x9e\x5c\xb6\x8d\x07\xfe\xf6\x0a\xdbw\xd5\x11\x8e\
+D\xfb\xf9>l\xad;M-m<\xf2\xe2\x16\x92\xb6\
+$\xe87\x11\x02B\x01\x8b\xfa\xe6(\xcf.\xdfA,\
+\x96\x97\xdaO\xa7\x8d\x05\x8b\x16\xf2\x1f\xff\xf1\x03F\xe7\
+qE;\x80R\xee\x12\x85\xfc\x1e\xb0%\xaf\x0d\xf7\x88\
+\xcazd\xde%\x83\xd4\xaf\x12\x94D\xa0\x0a]\x09=\
+\xabCu\xd6\x91\x95v\xec!%\xed\xbf\xf7\xe8\xb7\xd3\
+C\xd3f\x9c\xc5}_\xff:\xb3f\x9e\x91\xcff\xb5\
+\xa3\xec?x\x88\x7f\xbd\xb0\x85\x8eH\x92\xa0\xdf\x02\x14\
+%\x01\x1f-\x1dq\x1eya\x0b\x8d\x8d-\x85\xee\xa2\
+V$\xd6n\xda\xcf\x8a\x8d\x07\x89\xdb6\xe5%>\xda\
+\xc3\x09Vo\xaac\xd3v\xbd\x82=\x97\xe6\xcd\x9d\xc3\
+\xf7\xbf\xf7}\xce:\xf3\xcc|7\xbd\x06\xa5\xeeE\x88\
+\x95'|G\x14:R\x9dx\x08\xc3\xd7\xe3uki\
+\xa7\xdc\x01\x04*\x95\x82\xae\x0f\xdd[T\xd2A\xb9I\
+\x94\x9b\x88\x08a\xec\x11\xa6\x7f6\x90\xb7\x04\xc1\xc3G\
+\x8cf\xe4\xc8\xe1\xac\x5c\xb9\x8a\xc6\xa6\xbcM\x10hG\
+i\x8bJ\xe6N\x1f\xc6\xf0\x81\xe5X\x96\x81\xebH^\
+]w\x80?<\xba\x86h\x06\xb9\xce\xb5\xd3C,\x9e\
+$\x18\x0a1g\xea\x10F\x0c\xae`\xe3\x8ef\x1ez\
+b\x1dk6\xec\xa6/}\xe6\x15\xb3\xe9\xd3\xcf\xe0G\
+?\xfc\x01\x17\x5cpa\x9e[V\x1b\xa5\x9b\xfc\x02\xd2\
+y\x1a%Q\xd2E\x91J\xda\x7fx\xf5\xb8r\x0f\x0f\
+\x5c\x0b~\xa00\xac`\x8f\x9fm\xfa\x1b\x08B`\xf8\
+K\x91\xf1\xb6\xce\x06\xfb\xc8\x8a\xf7\xc3W^\x80\x10k\
+\x81\xcf\x02\x7f\x00\xf2V>\xe9\xea\xb7\x5cK}\xfd!\
+\xbe\xf9\xad\xef\xb0s\xe7\xae|5\xabu\xaa?\xd8\xc8\
+\xf3\xcbw2iT\x0dS\xc6\xd4\xb2~G#\xcf.\
+\xdfAc\x83\xde\x92\xa6\x1dE\xb9\xbc\xban\x1fm\xe1\
+\x04\x81\x8a u\x8d\x11\xd6l\xae\x07\xf4\x22\xb8\x5c\x18\
+3f\x14\xdf\xfb\xce7Y|\xd1\xa5\xf9nz\x97\x94\
+\xce\x0f\x9dD\xfb\xa3\x02\x83\xae\xa9\xec\xae@\x9eJH\
+\x16\xcfw\x9f\xba\xa5\x04\x19\x97J=\x99\x8c'\xeaS\
+\xbf\x84>\x12\xccO\xee\x15\xe0\xf3@^7\x8f~\xf8\
+#7s\xdb'nc\xf0\xe0A\xf9lV\x03\xc0\xe1\
+\xb5\xf5u4\xb7\xc5)\x09Y\xec\xaf\xef`\xcd\xa6:\
+\xf4\x07\xb5v\xbc\x1d{\x1a\xd8\xb0\xbd\x91C\x07\xc3l\
+\xd8v\x88\x1d{\x1b\x0b\xdd\xa5~\xa1\xb6\xb6\x86\x1f\xfd\
+\xe0\xdb\x5c\xf5\x96\xeb\xf2\xddt#J\xfe\x5cI\xf7\x01\
+!\xcc\xd4\x00\xefd\xf7\xa5\x85(\xaa\xc30z\xb7H\
+/\xa3)w\x00\xc3\x0a\xa0\xa4\x03\xf2\xb8\xe4\xd8EO\
+!L\x1f\x9d\xe9\xfd\xea\x80*\x10s\xc8c-\xf8\x85\
+\x0b\x17\x11O$X\xbad\xa9\xde\xfa\x92g\x8d\xed\x09\
+.>g\x1cC\x07\x94\xf1\x8fg7\xf1\xe8\x0b\x1bq\
+\x9d\xbe\xb7kC\xf3\x98t\xd8\xb1?\xcc\x925u\xbc\
+\xfc\xc66\x1a\x1b\xf5,No\xf9|>~\xfe\xb3\x1f\
+p\xed\xf57`Yy-W\xec(%\x7f\xa2\xa4\xf3\
+\x0d\x81B\xc9\xbe\xf0~W\x08\xc3\xc2\x0a\xf4.\x17Z\
+\xc6\x01\x1d@:q\x94\xec\x0aH\xaa\x8f\x1c\xa9\xd5\xcf\
+\xd2\x89#\x9dx\x5c\xba\x89u\xa6\x15z\x0bPC\x1e\
+\xa7\x1c\xce>\xfblL\x9f\xc5\x0b\xcf?\x9f\xaf&5\
+@:\x0e-a\x97\xf5\xbb\xday\xf9\xf5m\xec\xdb\x7f\
+\xa8\xd0]\xd2\x8aTsk\x07;v\xd5\xd1\xd8\xdc\xae\
+\xb7\xa9\xf5\x92\xcfg\xf1\xe3\x1f~\x9bw\xbd\xfbC\x94\
+\x94\x96\xe7\xb5m%\x9d\xfb\x95t\xbe\x820\x1c\xfaL\
+@\x07!D\xaf\xee\x9f\x03\xe9\x13\xcb\x1c\xcd\x89\xb5\xa6\
+~9=\x5cR_$\x84a\x05\x16\x98\xbe\x92\xe7\x11\
+F^/\x1b[[[\xf9\xf1\x7f\xfe\x88\xfb\xbe\xfe\x8d\
+|6{\xda\x0b\xf8}\xf8\xfc\x16\xc9\x84MR\x97\xba\
+\xd54O\x05\xfc~\xbe\xf2\xa5Os\xfb]\x9f\xa5\xbc\
+</\xd9\xb7\x8f\xf6\x1b%\x9d/+\xe9\xeeC\x18\xa0\
+\x5c\x5c\xbb\xc8\x17\xc0\xaa\xd4,\xb2\xe9/\xcd*o\xfb\
+\xc9d5B\x17\xa6\x95\xbar\xeds\xd3\xee\xc7\x11b\
+\xafa\x06\x14B,$\xa3\x8as\xb9\x11\x0c\x06\x999\
+s&\x01\xbf\xc9K/-\xc9W\xb3\xa7=\xd7\x95$\
+\x93\x0e\xaeN\x1c\xa3i\x9e\x0a\x86\x02\xdcs\xf7'\xb9\
+\xe3\xce{\xa8\xaa\xaa\xcdw\xf3\xff\x07|\x0b%\xb7\xa1\
+Tg\x8c\xea\x03#t\x95\xca\xd9nZ\xbdO\x81\x9b\
+]@\x17\x06\xcau:G\xe9}7\xa0\x0b\xc3\xc2\xb0\
+\x82\xeb\x812`&\x90\xb7\xec9\xa1\x92\x12\xe6\xcc\x9d\
+\x83!\x14//Y\x9a\xaff5M\xd3<UQ^\
+\xca\x9dw\xdc\xc6\x9dw\xde\xcd\x80\x81C\xf3\xdd\xfc\xcb\
+\xc0W\x80U\xa9-`}#\xa0+\xa50,?\x86\
+/\xd4\xeb\xd19d\x19\xd0\x81T\x8de\xe9\xf4\xe9i\
+w!\x14(\x15\x97\xd2\xde \x0cs\x88\x10\x22o\xa5\
+V\x01\x02\x81 \x17_\xb4\x98\xf6\xf6v^}uy\
+\xbe\x9a\xd54M\xf3DmM%\x9f\xb8\xed\x16>\xf5\
+\xa9{\x188hX\xbe\x9b\xdf\x08|\x8eTP\xe7\xc4\
+\x80\x9e\xccw\x7f2\xa6\x94\x8bi\x051{y\xef\xbc\
+K\xd6\xd3\xcd\xc2\xf4!\x94\xdd\x99h\xa6o\x8e\xd2\x95\
+tp\x5c\x1b\x94\xdc\xab\xa4\xfb\x03\xcb_R\x830\xdf\
+\x92\xd7N\x08\x8b\x1f\xfd\xe8\xc7\xc4\x126\xbf\xfa\xe5/\
+q\xec\xe2\xbd\x8a\xd44M;\x95\xda\x9a*n\xb9\xf9\
+#|\xfa3\x9f\xa5\xaaz`\xbe\x9b\xdf\xa9\x94\xfb%\
+\xe0\xd9\xc3_9\xbc.,\xf5_\xd1\xcb\xad`^2\
+\x0d\x0b\xd1\x83\x9c\xed\xa7\x92\xd5\xa2\xb8.\xae\x1d\xc5M\
+v\xe4d\x8a\xa0\xd0\x94t1}%\xe7\x1a\xfe\xd2\x1f\
+\x0aa\x9c]\x88>|\xf8#\x1f\xe1/\x0f=D$\
+\xa2\xeb+k\x9a\xd6w\xd4TWr\xcb\xcd7\xf1\xd9\
+\xcf\xddKU\xf5\x80|7\xbf\x17\xe5~W\xba\xc9\xfb\
+\x8f\xfd\xf2q\x03\xcd\xa2\xbd=\xacREXr8\xdb\
+\xdd\xf3\x80nG\x10}t\x84~\x02%1\xac\xd0y\
+f\xa0\xec\xd7 \xc6\x17\xa2\x0b\xb7\xdcz+\x7f\xf8\xfd\
+\xefuJRM\xd3\xfa\x84\xf2\xf22>u\xc7-\xdc\
+\xf3\x99/RQY\x93\xef\xe6\x9bP\xf2\xbf\xa4\x13\xff\
+j\xdf\xbd\xfd\xab\x10\x86/\xa73\x08=\x0a\xe8\x90\xda\
+\x93\xee$\xda\x8f\xe4\xc3\xed\xe3\x8400\xac\xd0%\x86\
+/\xf4OR\x8b\xe5\xf2\xee\x0b_\xfc\x22\xdf\xfd\xcew\
+\x0a\xd1\xb4\xa6iZ\xc6L\xd3\xe4\xbf~\xf2]\xde\xf7\
+\xc1\x9b)-\xab\xc8w\xf3\x0e\xf0s\x94\xbcC:\x89\
+\x22\x1e\x81\xa7\x93\xfb\x80\xde\xbbh\xdc\xff\x92/\xbc\x08\
+\xbc\xb7P\x8d\xdf\xfb\xc5/\xf2\xado\x7f\xbbP\xcdk\
+\x9a\xa6\xa5\xe5\xb3,~\xf3\xc0\xff\xe3\xdd\xef\xffh!\
+\x829\xa4jr\xdc[\x88\x86s\xa73\x83i\x8e\xef\
+\xef\xf78\xa0\x1b\xa6\x1f+P\xd1\xdfjI\xdb\xc0\x93\
+\xc0\xbb\x81\xbc?\xb1\xb2\xb22n\xfb\xf8\xc7\xf9\xe1\x0f\
+\x7f\x98\xef\xa65M\xd3\xd2\xaa\xac\xac\xe0o\x7f\xf9=\
+o\x7f\xe7\xfb\xa8\xa8\xa8*D\x17\xfeH*\x98w\x14\
+\xa2\xf1\xdcQx\xb1\xa8\xbc\xe7#ta\xa4V\xe7\xf5\
+\xaf\x80\x0e\x90\x00\xfe\x0a\xdc\xda\xf9\xbf\xf3\xaa\xaa\xaa\x8a\
+\x9bo\xbe\x99\x9f\xfe\xf4'\x94\x96\x95\xe4\xbbyM\xd3\
+\xb4\x93\x1a5j8\x7f~\xf0\xd7\xbc\xed\xbaw\x12*\
+)\xc8]\xc9\xbf\x03_\x07\x0e\x14\xa2\xf1\xdcQ\x08\xc3\
+\xef\xc9\xed\xea\xac\xf7\xa1\x1f-U\xa1\xd4\xe8\xdc\xb8\xdf\
+W\xefc\xa4\x08\x91*,/L\x1f\xa4.\x9fV\x92\
+\x0a\xe8\xf3\x81@>\xfb\xe2\xf7\xfb\x99?\xffl\x06\x0e\
+\x18\xc0\xc6M\x1bhnn\xcdg\xf3\x9a\xa6i\xc7\x98\
+=k\x06\xff\xf1\x83\x1fp\xf5[\xae#\x8fu\xad\x8e\
+\xf6\x18\xf0e\xe0\xcd#_R\xa9\xda\x22}\xee\x1e\xba\
+\xc20|\x9e\xe4r\xe9U@O\x8d\xd2}H;\xdc\
+\xa7\x13\xcd\xc0\x09\x01\xbd\xcb2RY\xe4f\x01\xbd\xcf\
+\xcb\x97]\x8f\x983g.\xc3\x87\x0d\xa1\xbe\xfe\x00\xbb\
+w\xef\xcdo\xf3\x9a\xa6i\xc0y\xe7\x9d\xcb7\xbe\xfe\
+u\xae\xba*\xbf\xa9:\x8e\xf2<\xf0i`\xdd\xb1_\
+\xee\x9b\x01]\x18&\x87K\xba\xe6X\xef\x02:\x00*\
+\x95d\xa6\x8fO\xbd\x9f\x22\xa0\x03,%\xb5\xea}:\
+y\x0f\xeap\xc6\x19\xd3\x99v\xc6$\xea\x0e\xecg\xe7\
+\xce\xddH\x9d\x8f\x5c\xd3\xb4<\x99\x7f\xce|\xee\xbf\xff\
+\xbfX\xb4\xe8\xbcBu\xe1U\xe0\xe3\xc0\xfa\x13\xbf\xd5\
+7\x03\xbaa\x06<\xebs\x8f\xb7\xad\x1d\xcf\x8e6\xd1\
+\x95\x99\xa7/\xea\xdc\xb6\x86\xe1;i\xcc.\x05\xbe\x06\
+\xdc\x02\xe4\xb7\x16`\xa7\xfa\x03;\xb8\xf3\xaeO\xf3\xd8\
+\xe3O\x12\x8e\xe8\xbd\xea\x9a\xa6y'\x14\x0a2\xef\xec\
+\xb3y\xe8\xa1\x87\x182xH!\xba\xe0\x02+\x80\x0f\
+\x03\x1bN\xfa\x08%\xe9s\xdb\xd6\x84\xc00\xfdxu\
+\x8b:G\xf3\xe4\xaao\xfdR\xb3\x17\x01~\x00\xfc\x1e\
+(Hb\xe0\xc1\xc3\xc6\xf1\xe7?\xff\x91\xf7\xbf\xef\xdd\
+\x04\x83\xb9\xc9\xfb\xabi\x9av\xbc\xb2\xb2R\xae\xbb\xf6\
+\xad<\xfe\xd8c\x85\x0c\xe6\xabH\x0d\xa0N\x1e\xcc\xfb\
+$\x91\x1a\x9d{\xb8\xde,G\x01]\xe0\x0bUw\xa6\
+\x82\xed\xbb\xa3\xf44\x0eq$\xa8\x17\x86\x11\xe4\xc7?\
+\xbd\x9fo|\xe3k\x05\xeb\x82\xa6i\xfdWii\x09\
+\xf7~\xe1n~\xf1\xcb\xff\xa5\xb4\xb4\xb4P\xddX\x05\
+|\x12X[\xa8\x0e\xf4U9\x9br\x07p\xa2\xcd(\
+\x1c\x0a\xb4\x0a\xb2W\xd2L\xb9w1\x80\xf1\xa4V[\
+\xbe?/\x1d;\x89p8\xcc\xe3\x8f?\xc6\xfb?\xf0\
+\x01\x92\x89\xe2\xad$\xa4iZ\xdf1d\xc8 \x1e\xf8\
+\xc5O9\xef\xc2+)//H\xc2\x18H\x05\xf3\xbb\
+\x81%\xa42\xc2\x9dZ_\x9ar\x17F\xe7\xcavo\
+\xfb\x9a\xd3\xc8k\x06+\x10\x86\xaf?f\x90\xeb\x22\x81\
+\xad\xc0\xb7\x81\x87\x0a\xd5\x89\xb2\xb22\xae\xbd\xf6:\xfe\
+\xfe\xb7\xbfr\xf6\xbc\xd9\x85\xea\x86\xa6i\xfd\xc4\xa2E\
+\x0bx\xec\xb1G\xb9\xfc\xcak\x0b\x19\xccW\x03_\x22\
+\x93`\xde\xe7\xe4\xe7\xb6t\x0eV\xb9\x1f!\x84\x91\xba\
+b\xea\x83+\x0f\xbbY\xe5~2\x8d\xa4\xa6\x83\x86\x01\
+gx\xda\xb1S0M\x93I\x93&3m\xda\x19X\
+\xc2a\xc5*=;\xa5iZ\xf6\xde\xf7\xbe\xf7r\xdf\
+}\xf71g\xce<\x8c\xc2\x95\x1a]\x01\xdc\x07\xfc\x9b\
+\xd4=\xf4\x0c\xf4\x85U\xee\x0a!\xccTl\xc9C?\
+s\xfe\xea\x19V\x10\x89BI\x87>\x97l&\xbb_\
+\xf8\x16\xe0\xab\x80\x1fx\x0b\x05z\xb2\x0b\x17\x9e\xcf\xb8\
+1\xa3\x199j\x0c?\xf8\xd1Oikk/D7\
+4M\xebc\x06\x0f\xaa\xe5\xdd7\xbe\x87\xbb\xee\xbe\x87\
+\xd1\xa3G\x17\xb2+]\xc1\xfc\x91Bv\xc2\x1b\xa9\x14\
+\xaf\xf9*b\x96\xd3{\xe8]\xdcd$U^\xb5O\
+%\x9bIm'\x10\xa6?\xab\x9fR\xa8\xb9\xa6\x19\xb8\
+\x0f!.\x07\x0aZ \xfeG?\xfa\x11\xff\xfb\xbf\x0f\
+\xb0a\xc3\x9b\xe9\x1f\xaci\xdai\xeb\xec\xb9\xb3\xf9\xc0\
+\xfb\xdf\xc7\xad\xb7\xdd\x8eie\xf7\x99\x97c\x1b\x80\xcf\
+\x91\xca\x04\x97\x9d\xbep\x0f]\x08\x84\xb0Ri\xd2\xf3\
+\xd1\x9c\x17\x01\xddI\x84q\xedh\x1f\x0b\xe8\x80R\xa8\
+,W\xe9+%\xf1\x05\xcb\xcf6\xad\xd07\x11\xc6E\
+\x148\xa8?\xf1\xc4\xe3|\xfb\xdb\xdff\xe5\x8a\x95D\
+\xa2\xb1BvE\xd3\xb4\x22\xe3\xf3\xfb\x99?o\x1e?\
+\xf9\xd1\xb79\xeb\xec\xf3\x0b\xdd\x9d\xcd\xc0\xa7HM\xb3\
+g\xaf\xe8\x03z\xee\xcb\xa3\xa6\xe3\xd1\x08=\x8ak\x9f\
+F\xc9O\x94\x8b\x19([hZ%\xdfA\x88\x05\xa4\
+\xd2\xc5\x16\xcc\xc1\x03{\xf8\xdaW\xbf\xcc\xdf\xfe\xf1\x08\
+M\xcd-\x85\xec\x8a\xa6iE\xa2\xa6\xa6\x9a\xc5\x17_\
+\xc2\xdf\xfe\xf2\x97BwE\x92\xbae\xf9Yz3\xcd\
+^\xf4\x01\x9d\xce\x80\x9e\xbf1\x9e'\x01\x1d\xc0\xb5\xa3\
+8\x89p\xdf\x1b\xa5\xf7\x80\x10\x80\x94\x18\xfe\xd29\xa6\
+\xbf\xf4\x07\xc0\xf9\x14|\xef\x9e\xcb\x83\xbf\xfb5\x1f\xfe\
+\xd8m\xd8\xb6\x83W\xaf\xb3\xa6i\xc5\xcd0\x0cF\x8d\
+\x18\xc6\x17\xbe\xf0Yn\xbe\xf5\xf6BwG\x91\xda)\
+\xf4\x19\xe0\xe1\xde\x9d\xa9\x98\x03zgE\xb5<\x06s\
+\xf0<\xe8\x9cvAd5p\x1b\xf0\xb7\x02\xf7\x030\
+y\xe7\x8d\xefg\xe5\xca\x95L\x9c4\xa1\xd0\x9d\xd14\
+\xad@.<\x7f!O<\xfe/>x\xd3\xcd\x85\xee\
+\x0a\xa4\x82\xf9\xe7\xe8\xe94\xbb\xd6-\xcf\x02\xbaa\x05\
+\xb1\x02\xe5\xa9\xc2-\xa7\x0f\x17\xd8D*\xf1\xcc\xfd\x05\
+\xee\x0b~\x7f\x80i\xd3\xa6\xf3\xf0\xff=\xc2W\xbf\xfc\
+\x99BwG\xd3\xb4<\xfb\xfa\xd7\xbf\xc6o~\xfb \
+\x93\xa7\x9dE \x90\xd7*\xd0'\xb3\x8bTM\x8c'\
+\x00\xbb\xa0=\xf1T\xd7\xe8<\xff\x93\xb4\x9eM\xb9\x03\
+H'A2\xd6R\xc8\xbd\x8dyq\xd4\x94;\xa6\xff\
+p\xba\xc4\x91\xc0\xcd\xa4\x12%\x14\x5cs\xd3!V\xad\
+Z\xc9'n\xbf\x93\xcd\x9b\xb6\x14\xba;\x9a\xa6yh\
+\xfe\xd9\xb3\xb9\xed\xb6;x\xeb\xdb\xae\xa1\xba\xba\xa6\xd0\
+\xdd\x01x\x1a\xf8O\xe0E 7\x0b\xac\x8av\xca]\
+\x22\xcc`An7{\x1a\xd0\x95tq\xed\x18\xd2\x8e\
+\x15\xe1/=wN\x11\xd0\x01\xaaH\x95\xfe\xbb\x97T\
+\xc5\xb6\x82{\xee\xb9g\xf9\xedo\x7f\xcd\xef\x7f\xf7\xe0\
+\xe9wCD\xd3N\x03\x9f\xbe\xfbv\xde\xfe\xf6\xb7s\
+\xce\xc2\x0b\x0a\xdd\x95.\xbf\x00~N\xea\x96d\xee\x14\
+i@\x17F\xd76\xb5\xfc\xf7\xcb\xd3\x80\x0e\x80tH\
+F\x1a\xa1\x1f\x8f\xd2\xbb\x09\xe8\x90\xba\xadq;\xa9E\
+ \xc3\xf3\xdd\xb7\x93\xa9;\xb0\x8f?\xfc\xe1\xb7<\xf4\
+\xd0_Y\xb1rM\xa1\xbb\xa3iZ\x0e\xcc\x9cq\x06\
+\xd7\xbf\xe3F\xee\xfd\xfc\xddX'~\x0e\x15B\x02\xf8\
+\x15\xf0uR\xc5\xadr\xab(\x03\xba\xc20C\x05\xcb\
+\xa9\xe6y@W\xd2\xc5Mt e?K\xcd{\x94\
+4\x01\xbd\xcb\xc7H\x05\xf5\x89y\xebX\x1a\xcf?\xfb\
+\x04\xdf\xf9\xde\x0fY\xb6l)\x91\x88\xde\xb3\xaei}\
+QeE9W^y\x19\xef\x7f\xff\xfb\xb9\xea\xeak\
+\x0a\xdd\x9d.\x0d\xc0oI\xcdNzSA\xaa\x08\x03\
+z*\xcd\xabU\xb0>y?B'\xb5\xd6\xdd\x8e4\
+\xd0\xe7R\xc1f(\xc3\x80\x0eJ]\x07|\x1b!&\
+Q\xf0mm)\x8ecs\xcf\xddw\xf2\xe4\x93O\xb3\
+y\xcb\xb6BwG\xd3\xb4\x0c\x99\xa6\xc1\xe8\xd1\xa3y\
+\xd7;\xdf\xc1w\xbe\xfb=\x8a\xe8\xf3u\x0f\xf0\xbf\xa4\
+\xd2\xb9z\xa7\x08\x03\xbaa\x05\x0b\xda~~\x02\xba\x92\
+8\xb1\xd6~\xbb\xe2=\xd3\x80.\x9d\x04(y\xb6a\
+\x05\x7f\x86\x10\xb3I\xe5\x81/\x0a\xbb\xb6\xad\xe7\xfaw\
+}\x90\xad[7\x13\x0eG\x0a\xdd\x1dM\xd3\xbaQQ\
+Q\xce\xdc9\xb3\xf9\xee\xf7\xbe\xcf\xbcy\xe7\x14\xba;\
+]\x5c`\x07\xf0}\x94\xfc\x15^/\x0a+\xba\x80.\
+0\xac\xc2\xee$\xc8\xcb(Q\x08\x03_I\x0d\x9e\xbf\
+\xc0E.U\x8d.\xfe\x9a\x93h\x7f\x0f\xbdM\xaa\x90\
+cc&Lg\xc5\x8a7\xf8\xeaW\xbe\xc8\xa0\x81\x03\
+\x0a\xdd\x1dM\xd3NI\xf0\xd3\xff\xfc\x1eO=\xf9T\
+1\x05s\x807I\xa5r}\xa0\xd0\x1d\xc9;Q\xf8\
+`\x0e\xf9\x9e\xf6\xd5\xd9\xca\xba\xec$\xf5\x87\xff\xcdB\
+w\xe4hB\x08>~\xdb\x9d\xacx}\x19\xef\xbe\xf1\
+\x1d\x85\xee\x8e\xa6i\xc7\xb9\xf1\x9d\xd7\xb0~\xdd\x1an\
+x\xf7\x870}\x85\x9d\xde=\xce\x0b\xc0\xad\xa4\xb6\xa7\
+\xe9\x0f\xfa\x02\xc9\xcb\x94{\x17%\x1d\x9cD\x07\xcau\
+\x8ah\x9a\xa4\xf72\x9drW\xae\x8d\x9b\x0c\x830\xb0\
+\x82\x95\x00\x03H\x95^\xfd1P\x99\x8f\xbefj\xdf\
+\xbe\xbd\xbc\xfc\xd2\xf3\xfc\xe0\xfb\xdfc\xe5\x1a]\xbdM\
+\xd3\x0a\xe9\xcc\xb3f\xf3\xc3\xff\xf8\x0e\x13&Le\xe4\
+\xa8\x82\x96:=\x99?\x01\xdf\x03\xd6\xd3U\xcb\x5cI\
+\xefgd\x8bb\xca]\x1d\xb5\x10\xae\xf03\xd0y\x0d\
+\xe8\x00v\xb49\x15\xd0\x0b\x90E\xc7+\xbd\x08\xe8\x90\
+*\xe4r)\xf0]`\x86\xe7\x9d\xcd\x8a\xe4\xf5\xd7^\
+\xe3\xe5%/\xf3\xedo\x7f\x87\xa6&]\xe8E\xd3\xf2\
+i\xe4\x88a\xdcu\xc7m\x9cw\xe1e\xcc\x9b7\xaf\
+\xd0\xdd9\x99\xfb\x81\x9f\x90*\xb6r\xc4i\x13\xd0e\
+*\xa0\x9b\x85\x9fn\x87\x02\x04t\xe9$p\x93Q\x94\
+\xec?\xa3\xf4^\x06t\x00\xa4\x9b\xb8H\x18\xd6\xddB\
+\x98W{\xdc\xdd\x1ey\xe8\xa1?\xf3\xf2\x8b\xcf\xf2\xeb\
+\xdf\xfe\x91h\xf44\xaa\xa4\xa7i\x05PYQ\xca\x0d\
+7\xde\xc8\xd5W\xbf\x85\xb7\xbd\xf5j\x10\x05-\xe0x\
+2mJ\xc9\x9f\x0a!\xfe\x1f\x88\x13\xf7\x98\x9f\x16\x01\
+]!\x84\xd19:/h\xd5\xec\xc3\xf2\x1e\xd0\x01\x9c\
+x{*{\x5c\x9e+\xd1x%\x17\x01\xddM\x86\x01\
+5\xcd\xb0Bw\x0a\xc3z\x07P\xedi\xa7{ \x11\
+m\xe3\xfe\xff\xf9_\x9e{\xf6)\x9ey\xf6y\xe2\xf1\
+D\xa1\xbb\xa4i\xfdJ \xe0\xe7\xca+.\xe7\xe2K\
+.\xe2\xa6\x9b>LiiE\xa1\xbbt2o*\xe9\
+\xfe\x02\xd4ON\x99\x11\xedt\x09\xe8\x86\x850\x8a\xe7\
+b\xab \x01\xddMF\x91N\xacs\x1b[\xdf\x1f\xa5\
+\xe7$\xa0\xdbQd2\x8aa\x85\xca\xcd@\xe9\xdd\xc0\
+\x07\x80q\x9ev\xbc\x87\x1a\x0f\xed\xe3?~\xf0c\x9e\
+y\xf6Y6\xac\xdf@\x22\xd9\x8f\xeb,hZ\x1e\x04\
+\x02~f\xcf\x9a\xc1\xa2s\xcf\xe3\xeb_\xfd2\xa5\x15\
+E\x91\x7f\xfdx.\xf0*J\xfdX\xba\x89\xbf\xa5\x82\
+\xd9)2\x80\x9e\x0e\x01]t\xa6y\x15\xc5\x93\x05\xb5\
+ \x01\x1dRA\xddI\xf6\x8fz\xe99\x0b\xe8v\x0c\
+\xc3\x0aa\xfaK\x00\xae\x07\xfe\x03\x18\x05\x14\xcf_\xcc\
+Q\xb6o\xdd\xc4}_\xff\x1a/\xbd\xfc\x0auu\x07\
+I&\xbdI\x08\xa5i\xfdU0\x18`\xf8\xf0a,\
+\x5c\xb4\x88\x1f~\xef\x1b\x0c\x1c2\xa6\xd0]:\x95\x18\
+\xa9\xc2*_B\xa9\x15\xd2M\x22\x0c\xf34\x0e\xe8\x0a\
+a\xf8N\xfd\xfc\x0b\xa4\xc0\x01=\x82\xe8\x07\xf7\xd1=\
+\x0a\xe8\x00\xe3A=\x00\xe2l \xe4U\xff{k\xcb\
+\xc6\xb5|\xfas\x9f\xe7\xb9\xe7^\x22\x91H\xe08\xfd\
+7\xcd\xaf\xa6\xe5\x82eY\x04\x02\x01\xder\xf5\x15|\
+\xef;\xf71z\xdc\xb4Bw\xa9;I\xe0o\xa4\xea\
+\x98\xefC)t@/\xce\x80^\xb0\xe1\xb1\xe9/\xc1\
+\x0a\x94\xf5\xdb\xecq9\xa1\xe4\x0e'\xd6\xfeV\x94\xfc\
+1P\xb4\xe9\xdb&N\x9e\xce_\xfe\xf2wV\xbc\xf6\
+2W]uy\xbf\x98u\xd14/]{\xcd\x95\xbc\
+\xf6\xeaK\xfc\xeew\x0f2j\xec\xd4Bw\xa7[J\
+9?U\xca\xbd\x03\xd8_\xe8\xbe\x14\x07\x850\xfdE\
+\x17\xcc\xa1\xe0\xf9\xc4\x95N6\xd3=\x05\xaa\x83\xd4\x1e\
+\xcf\x1b\x81M\x05\xee\xcfI\x09\xc3 \x18\x0c1y\xea\
+,~\xf9\xcb\x07X\xf5\xc62\xde\xf5\xae\xeb\x0b\xdd-\
+M+:\xef\xb9\xf1:\x96.y\x89\xfb\x7f\xfe+\xa6\
+N\x9b\x8d?\x10(\xe6\x0b`G)\xf7\x0e\x94\xfc\x16\
+\xd0\x84N\x18\xd3\xa9x\x7f\x0d\x05\x9br\x87T\x8ew\
+\xe9\xc4q\x12}{\xea\xdd\xb3)w%q\xe2\xedX\
+\xc1\x0a:\x0b\xec^Jj\xcf\xe7$\xaf\x9eK\xae\xec\
+\xda\xb5\x93]\xdb\xb7\xf2\xc7?\xff\x91_\xfe\xea\xb7\x85\
+\xee\x8e\xa6\x15\xd4m\xb7\xde\xc4\xdb\xae\xbb\x81\xa9\x93'\
+1j\xf4\xd8Bw'\x13;\xa5\x1b\xff<\x88\xc7\x85\
+0\xc2\x08\x03\xd1\xb55\xeb\xb4\x9er\xef\x9aj/L\
+\xbd\xf3t\x0a\x1a\xd0\x01\xa4\x9b$\x19m\xc6(\xc2\xe9\
+\x8bL\xe5)\xa0\x03 \x9d\xc4\xe5\x08\xf1Y\xc3\xf4_\
+\xe4\xd5\xf3\xc9\xa5\xbd{v\xb2l\xd9+\xbc\xb2\xec%\
+\xfe\xfb\x17\xbf&\x91\xd0\x0b\xe7\xb4\xd3CEE\x197\
+}\xe8\xfd,Xt!\xe7-\x9c\xcf\xb0\x11E\x97\xe1\
+\xed\xe4\x94|\xd1IF\xbe\x03\xeaI\xd3\x0a\xa4>{\
+t@\xef$1\xcc`Qd\x85;\x99\x82GQ!\
+L,\x7fi\xea\x85\xd1\xd2R\xd2yR\xba\x89&\xfc\
+\xa5\x1f2\xcc\xc0U@Q_\xee\x8f\x1c5\x96\x1bF\
+\x8d\xe5\xca+.c\xda\x8c\xb3\xd8\xbci\x03\x8f<\xf2\
+\x18[\xb6n/t\xd74\xcd\x13\x93'\x8d\xe3\xf2\xcb\
+/\xe7\xac9\xf3\xb8\xee\xda\xb7QQY[\xe8.e\
+B\xa2\xe4\x93J:\xcb\x840\x9fq\xed\xe8\xab\xa6/\
+D1\x8eB\x0b)\xb5\xe7\xbcx\x7f'\x85\x0f\xe8F\
+*\xa0'\x93\xb1~\x95\x0e\xd63\xc2@\xb9\xce\x1b\xd2\
+\x8e\xbfa\x98\x81\xf7*7\xf9>a\xfa/\xa0\x88W\
+\xc1\x03TT\x0d\xe0c\x1f\xbb\x19\x80s\xe6/\xe0\xe9\
+g\x9fc\xf5\xaa\x95\xbc\xf6\xfa\x8a\x02\xf7L\xd3r\xe3\
+\x9c\xb3\xe70f\xdc\x04\xde\xf9\xf6k\xb8\xfe\x1d\xef.\
+tw\xb2\xb1\x1d\xf8\x87R\xf2\x01\xe9$6\x9b\xfe\x92\
+#\xa3q\xed(\xaa\xa8\x92\xc8\x9cL\xc1\xa7\xdc\x01\x94\
+tq\x12\xed(\xe9\x16\xba+=\x92\xcf)w\xd7\x8e\
+\xe1&\xc3\x98V\x10\xd3_\x86\x13o\xa90\x03\x15\xf7\
+\x09\xc3\xbc\x14\xc4T\x0a\xbe\xd01s+_\x7f\x85\x1f\
+\xff\xec\xff\xb1a\xc3Fvl\xdfNk[{\xa1\xbb\
+\xa4iY\xa9\xa9\xa9f\xe2\x84\xf1\x8c\x1e;\x9e{?\
+{'3\xcfZP\xe8.e#\xa2\x94\x5c/\xe0'\
+\x08\xe3OJ:H'\x8e\xe9\x0b\x91\x8c\xb6`X~\
+L+\x98\xfa\x80\xd3S\xee \x0c\x0c\xb3\xb8G\xe8E\
+\x11\xd0\x01\x14\x0a;\xd2T\xe8n\xf4H\xc1\x02z\xa0\
+\x0c'\xd6\x8a\x92.V\xa8\xea\x1c!\xcc\xaf\x22X\x00\
+\xa2\xa8*\xb7\xa5\xd3\xd6\xd2\xc4w\xbe\xf3M\xfe\xf8\xe7\
+\xbf\x13\x8bEhii\xc3u\xfb\xe6\xc5\x9d\xd6\xffY\
+\x96Iuu5\x03\x07\x0d\xe2\x1do\xbf\x96\xaf\xde\xfb\
+y\x0c\x7fy\xa1\xbb\x95\x0d\x094\x03\xffr\xed\xc8\xd7\
+\x840\xf7\x1bV\x10\x1d\xd0\xbbS\x1c\xf5\xce\xd3)\x9e\
+\xd1\x5c\x91\x5cX\xf4IB \x10\xaf\xbav\xe4J\xe9\
+\xda_\x01\xf6\x91z\xd3\xf6\x09\x95\xd5\xb5|\xf7\xfb\xff\
+\xc9\x8e\x1d\xdb\xf8\xdd\xff\xfe\x9c\x993g\x12\x0c\x040\
+\xf4-\x18\xad\x88\x98\x86\x81eY\x9c=o\x0e\x7f\xfc\
+\xc3o\xd8\xb0~\x03\xf7\xdd\xf7\xad\xbe\x16\xcc\x1d`#\
+\xf0!\xe06\x10\xfb\x8by\xc4\xa9e\xa7h>1\x85\
+0\xf0\x97\xd4v\xee\xc9\xd4\xc1\xbd\x17\xfe\x07\xb8\x0a\xa5\
+\xfeX\xe8\x8ed\xcb\xb2\xfc\x5cz\xc5u\xbc\xf0\xc2\x0b\
+\xec\xd9\xb3\x8d/~\xeeSTT\xf4\xa9\x0fK\xad\x9f\
+\x0a\x86B|\xe5\xde{\xd8\xb2\xe9M\xfe\xfd\xc4\xd3\x5c\
+x\xd1e\x85\xeeRODQ\xeaGN\xa2\xe3R\x94\
+|\x0a\xd0E\x182!\xfa\xc6\xe8\x1c\x8ah\xca\xbd\x8b\
+\x1diD*\xb73\xb0\xf7\x8d+\xc7\x82O\xb9+\x89\
+/X\x85\xeb\xc4\x10\xa6\x1f\xc3\xf4\xa3\xdc\xe4\x10%\xdd\
+\x8b\x0d_\xe8\xcb\xc0d\x8f\x9e\xba\xa7Z\x9a\x9b\xa8?\
+\xd4\xc0\x8em\x9b\xb8\xff\xe7\xf7\xf3\xd8\xe3O\x17\xbaK\
+\xdai\xe6\x1do\x7f+w|\xf2\x93\x0c\x184\x82\xa1\
+C\x07SU\xdd'V\xac\x9f\xcc\xf3\xc07Pj\x8d\
+\x93\xech\xb6\xfce \x0c\x5c;\x8a\x10&\x86\x15\xd0\
+S\xee\xa7\x22HmU\xeb\x03\x0a\xbe\xca\xfdxf\xb0\
+\x12\x13\x85\x9b\x8c \x9dD\xea\x8f\xa8\x0f'\x9d)\x18\
+\xa5\x0e*\xe5>\x04\xecPJ\xbeU\x08\xe3.\x8a|\
+%\xfc\xf1\xaakj\xa9\xae\xa9e\xca\x94)L\x988\
+\x99\xdb>\xb9\x93=;\xb6\xf0\xc0\xff\xfe\x9a7V\xae\
+-t\xf7\xb4~j\xe1\x82y\xbc\xff\xbd\xefa\xdc\xa4\
+3\x18?n\x0c\xe3\xc7\x17}\x1e\xa7\xee\xd4)\xd7\xfe\
+/\xa5\xdc\x7f\x1aV\xf0\xcdBw\xa6oI\xd5;\xa7\
+\xc8W\xb6\x1f\xad\xe8\x02zj\x15!\xe0\x17\x87\xaf\x1a\
+\xddd,u\x9f\xb8H7\xf3\x17/\xe1\x00\xaf\xa0\xd4\
+F)\x93\xab\x85\xe1\xbbA\x08\xd1's\xb2N\x9a<\
+\x95I\x93\xa7\x02W0c\xd6\x99\xac\x7fs3\xbb\xb7\
+o\xe2\x89\xa7\x9ef\xd5\xea\xf5\x85\xee\x9e\xd6\xc7\xcd\x9e\
+y\x06W_\xfd\x16F\x8d\x19\xcf\xac\x99\xd3\x98\x7f\xce\
+\x02\x8a\xe8\x8edO=\x04\xfcI)\xf7\x19%\x9d\xa2\
+\xad\x05Q\xbc\x14\xd0\xb7\xe2N\xd1\x05\xf4.\x86\xe9\x03\
+\xd3\xd7\xb9\x95-5B\x97v,\xf5\xcd>\xf4\x0b.\
+\x12\xad\xcaI\xfeE\xf8\xad\xd5J\xa97\x840\xde\x01\
+\x9cU\xe8N\xf5\x8c\xc1\xa2s/`\xd1\xb9\x17\x00I\
+\x16_|\x09K\x96\xbd\xc6\xfe\xbd\xbbX\xb5j%+\
+W\xaf\xd3K0\xb4\xb4,\x9f\xc5\x9c\xd93\x993g\
+\x0e\xb5\x83\x86r\xee\xc2\xb3\xb9\xec\xf2\xab\x0b\xdd\xad\x5c\
+y]\xba\xc9G\x0d\xc3\xfa-\xc2\xd8\x9d\xfa\xfc\xd4\xb3\
+\x9c\x99S\x9d\xb7\x18|\xf4\xb5\x8b\xba\xa2\x0d\xe8]\x84\
+ab\x05R\x0b\xa3\x9c\xce\xfb\xfd\xd2M\xa6V\xc5\xeb\
+\xa9\xf8\xcc\x09\x81\x80-\x0a\xf9\x1d\xe5:\xcb\x11\xe2\x16\
+a\xf8\x16\x00#\x0b\xdd\xb5\x9e\xf3s\xe9eWq\xe9\
+eW\x01\xf0\xfc3\x8f\xf3\xc8\xbf\x9fe\xc7\x8e\x1d\xec\
+\xdf\xbb\x8bm\xdbw\xd0\xda\xaa\xf7\xb6k)\x95\x95\xe5\
+L\x99<\x89\x11#\xc70a\xe2\x04\xdez\xd5e,\
+:\xafOdP\xce\x90\xda\xa9\x5c\xe7%a\xfa\x1e\x90\
+v\xece\xe1\x0b!L\x7f\xa1;\xd5\xa7\x1c\x1e\x8d\x1b\
+V\x9f\x1a\x99w)\xfa\x80~4+X\x01\x80\x93\xe8\
+@I'UzUJ\x1d\xd8\xb3 \x84\x81\x93\x0c?\
+\x87\x10/X\xc1\xb2\x8f(%n\x11\xc2\x18\x0fT\x15\
+\xbao\xbd\xb5\xf8\x92\xabX|I*\xb8\xaf_\xb3\x9c\
+?\xfd\xe5\x9f,]\xb6\x9c\xc6C\xf5457\xd1\xd4\
+\xd4\x8cm\xebZ\xed\xa7\x8b@ @Mu\x15\xb5\xb5\
+\xb5\xd4\x0c\x18\xc4\xa2\x05s\xf9\xd0\x07\xde\xcb\xa4\xa9\xb3\
+\x0b\xdd\xb5\x5ck\x05\xd6+\xa5\xfe\xc7M\x86\xff`\x85\
+\xaa;g1\xf5\xe7b\xc6:\x83\xb70|}:\x9e\
+\xf4\xa9\x80\xde\xe5\xf0\x88=\x19IM\xc3\x0b\xa1\xf7\xb1\
+g#\xb5\x1eA*\xe9\xfeRJ\xf9g\xd3\x0a~\x0e\
+\xd4\x07A\x0c\x00\xfa\xc6r\xce4\xa6\xcf\x9a\xcf\xb7f\
+\xcd\x07\xa0\xad\xb9\x9e\x7f\xfd\xebo\xfc\xf5\x1f\x8f\xb2j\
+\xf5:b\xd1\x08\x89D\x82D\x22\xa9\x13\xd8\xf4#\xa6\
+i\x12\x0c\x06\x08\x04\x02TTV3w\xcel\xaey\
+\xcbe\xbc\xe3\xed\xef$XVS\xe8\xeey!\x09\xaa\
+\x01\xc5o\x11\xe2{@\xbb\xbe\x1d\x99\xad\xd4\xed\x08\xa3\
+\x9f\xccd\xf4\xc9\x80\xde\xc5\xf2\x97Bga\x17;\xde\
+\xd6'\xa7H\x8a@\x07\xf0U\xe9$\x7fnX\xfe/\
+\x81x\x1fPV\xe8N\xe5Re\xcd`>p\xd3m\
+\xbc\xffC\x1f\xc7N\xc6\xd9\xb4a%\xff\xfc\xbf\x87\xf9\
+\xf7\x93\xcf\xb3f\xed\x06\x12\xf1X\xa1\xbb\xa8\xf5\x92\xcf\
+\x1f\xe0\xcc\xd9\xd3\xb9\xfe\x9a\xab\xb8\xe6m\xd70q\xea\
+l\x84\x10\x87\x8f~\xea1i\xc7\xbf\xa1\x94\x5cc\xfa\
+K\xfbL\x22\xa9\xe2\xa0\x10\xc2B\x98}g\x05{&\
+\xfat@\xefbX~\xfc\xa5\x03PJ\xe2D[R\
+_\xec\xbfob/\xb8\xc0~\x10\x9f\x97\xae\xfd\x80\x10\
+\xc6]\xc20\xdf[\xe8N\xe5R\xd7\x07{ X\xc2\
+\xf4\xd9\xe70~\xd2L>q\xfb\xa7I&\x93l\xdf\
+\xbc\x96\xe7_x\x81\xa7\x9e}\x91\xd7^_\x8dc\xeb\
+\x12\xaf\xc5.\x18\x0a1\x7f\xdeY\x5cx\xde\x02\x16_\
+t\x11c\xc7O%TRBI(D\xa8\xa4\x04\xc3\
+\xe8\xd7\xc5E\xb6\xb9\xc9\xf0\x17\x0d3\xf8,\xc2hC\
+I\x1d\xcc3\xa2H\x15X\xf1w\xd63\xef\x7f\xfaE\
+@Om-Hm/\xf0\x95T\x03`\xc7\xdbP\xae\
+\x93\x1a\xb5\xeb\xe0\x9e\xa96Po \xc4\xe7\x94t\x7f\
+/\xe0&\x0c\xf3\x86Bw*\xd7L\xd3\xa2\xac\xbc\x82\
+\xb2\xf2\xd4\x9a\x8c\xe1\xc3\x862c\xf6\xd9\xbc\xf7\x03\x1f\
+\xa3\xbd#LK\xe3AV\xafz\x9d\xe5\xaf\xbd\xc1\xab\
+\xaf\xadb\xef\xde}\x05\xee\xb16|\xf8P\x16-\x9c\
+\xc7y\x8b\x161m\xe6l\xaa\xaa\x07QY^Nu\
+u%U\xd5\xd5\xa7Cu\xb0\xbd\xa0\xfe\xdbMF^\
+3}\xa5\xfbQj;(}\xe5\x99\x91\xd4\xedX\xc3\
+\xf0\x1fN\x92\xd3_\xf5\x93\x80~DW\xe6\x22+P\
+\xd1\x99I(\x8ek\xc7:\x03{\xff}!sl?\
+\x82\xfd\xae\x1d\xdb\x8e\x10O\x9a\xbe\xd2\x1b\x81>\x99\xeb\
+2#\xc2\xa4\xbaf\x00\xd55\x03\x0e\x7f\xe9\x9cs\x16\
+p\xcdu\x079Pw\x88\xa6\xa6&\x1a\x1b\xea\xd8\xb1\
+m3k\xd6\xaec\xcd\xda79PW_\xc0\x0e\xf7\
+o\xe3\xc6\x8f\xe1\x8c)\x13\x981m:\x13&L\xa6\
+\xaav\x10\xb5\xb55\x0c\x1f>\x84\x11\xc3\x87\x13\x0c\x9d\
+V\xe9\x80\x0f(\xe9\xfeV\xba\xc9'L_h\x8d\x92\
+N[\xea\xcbz\x90\x92^\xe7>\xf2\xae\xfb\xe3\xfd\xff\
+\xa2\xaf\xff\x05\xf4.]\x09j\xba\xd2\x13*%q\x93\
+Q\x9d\xa0&c\x02%\x9dm(\xb5\x0d_\xe9j%\
+\x9d\xa7\x85a]\x01\x5c\x5c\xe8\x9e\xe5Ciy\x15\x13\
+\xca\xab\x980q\xca\xe1\xaf\x85\xdb\x9b\xd8\xb1c'\xdb\
+w\xecf\x7f\xddA\xda[[ij\xacc\xff\xfe}\
+l\xdf\xb1\x93m;v\xd3\xda\xd2V\xc0^\xf7-\xd5\
+\xd5U\x8c\x1f;\x8a\xf1\xe3\xc72z\xf4Xj\x07\x0e\
+\xa1\xa2\xb2\x8a\x91#\x861z\xd4p\xc6\x8c\x19CY\
+y\xbf\x5c\xcc\x96\x89\x83\xc0\xa3\xc0\xe3(\xf9\x8cr\xed\
+\x0e|!t \xcfD\xd7>r\xab\xf3\xf3\xbe\xff\x07\
+\xf2.\xfd6\xa0w\x11\x86\x85\xe9O\x05\xf4\xae+6\
+i\xc7;\xbf\xa9\xdf\x1c\xdd\x13]\xbf\xa3UJ\xda\xab\
+\x84a=\xa7\xa4{\x9d0\x8c\x8b@\xcc\x07N\x9fw\
+\x0aPVQ\xcb\xcc\xd9\xb5\xcc\x9c=\xf7\xa8\xaf\xba\x1c\
+\xd8\xbb\x8b\x8d\x9b\xb7\xb0i\xf36\xf6\xee\xddO[[\
+\x1b\xb1H\x07\xad\xad-477q\xa8\xa1\x91\xc6\xa6\
+f\x9a\x9aZ\x0a\xd6\xf7B\xa9\xa9\xa9b\xd0\x80\x01\x0c\
+\x1a4\x90\x01\x03\x07PQQI\xa8\xb4\x82\x8a\x8aJ\
+F\x8d\x18\xc6\xe4I\xe3\x992e\x12\xc3G\x8e/t\
+W\x8b\xc5\x1e`\x05\xa9`\xfeWR\x8bV\xf5gU\
+Z\x9d\xbb\x9c\x84\x99\x9aU\x17\xe6i1\x22?^\xbf\
+\x0f\xe8]\x840R\xd3\xf0\x80\xa3RkH\xa4\xebt\
+\x16\x11\xd0o\x96\xf4\x04\xc0J%\xed\x95\x08\xff?\x04\
+|\x04X\x84\x10\x13\x81SW\xa4\xe9\xf7L\x86\x8d\x1c\
+\xcf\xb0\x91\xe3\xb9\xf8\x92c\xbf\x13no`\xd7\xce\x1d\
+l\xde\xb2\x8dm;v\xb1}\xc7\x1e\x0e\x1e\xac'\x1e\
+\x8d`\xdbI\xe2\xf1\x18\xb1X\x94X,FG8B\
+,\x16'\x1a\x8d\x92L\x16\x7f\x11,\xbf\xdfO(\x14\
+\xa4\xb4\xb4\x84\xb2\xd2\x12JJJ\x08\x85J\x08\x06C\
+\xf8\xfcA\x02\xa1 \x83\x06\x0c`\xfc\xf81L\x9e8\
+\x9e\xa9S&1a\xe2D|\x9d\xefA\xed\x04;\x80\
+M\xc0?\x81\xdf\x03\x89\xc2v\xa7oI\x8d\xc2\x15\x98\
+\x16\xa2\x8few\xcb\xa5\xd3&\xa0\x1f\xad\xab\xd2\x99\x93\
+\x08\xa3\xdc$\x0a\x95\x0a\xecz:+\x03\x02\x81X\xa5\
+\xa4\xf3I\x84\x98$\x84y;\x8a+\x10b P\x99\
+\xf6\xc7O#e\x15\x03\x99>k \xd3;\xf7\xc3\x1f\
+\xaf\xa3\xf5 \xfb\xf6\xeda\xff\xfe:\xb6n\xdb\xc9\xbe\
+\xfd\x07\xd8\xbdw\x1fu\x07\x1bhkk'\x11\x8b\xe1\
+J\x89\x92.\xae\xeb \xa5\x8bt%RJ\x5c\xd7=\
+\xe6H\xfd\x0d\x83\xeb\xba8\xae\x9b6\x91\xa2i\x9a\x98\
+f\xe7h\x06\x81i\x99\x98\x86\x89a\x1a\x98\xa6\x89a\
+\x18\x9d\xffN=\xce0-L\xd3$\x10\x08RS[\
+\xc3\xe0\x81\x03\x19>l\x10c\xc7\x8cd\xdc\xb81\x8c\
+\x1a5\x8a\xe1\xc3GPZ>\xd0\xa3\xdff\xbf\x94\x00\
+\x1aA\xad\x03\xf1\x0bR\xc1\x5c\xcbFj8\xae3\xe2\
+u:-\x03z\x17+\x90\xdan\xed\xda1\x9cd\x18\
+\x81@'\x02\xcf\x86\xd8\xa2\xa4{\xbb\x94\xf6 \xd3\x0a\
+}\x1c\xd4\xfb@\x0c\x07\xfc\x9cf\xd3\xf1=Q^5\
+\x84\xa9UC\x98:\x1d.\xb9\xbc\xfb\xc7\xda\x890\xe1\
+p\x1b\xb1p\x84\xf6\x8evZZ\x9binn\xa1\xb9\
+\xb9\x85\xf6\xf6v\x1c\xc7\xc5\x95\x92\x96\xe6V\x9aZZ\
+\xb0\x1d\xe7\x94\xfb\xafM!\xa8\xae\xae\xa4\xa6\xa6\x06\x9f\
+eaY\x16U\xd5U\xd4VWQ^^Auu\
+5\xa5eeTTTRQY\x8d\xe9+\xf1\xe0\xd9\
+\x9f\xd6lP1\xe0\x19\xa5\xd4\x8f\x95t_6\xfa\xd9\
+~\xe8\xbc\x10\x06\x86\xd5/\xf2`\xe5\xcci\x1d\xd0\xbb\
+\x98\xbe\x10\xa6\x15DJ\x1b;\xd6\xd2\xa7j\xb1\x17\x03\
+\x81h@\xc9\xef\xd8\xb1\x96\x9f\x9a\xfe\xb2\xb7\x19\x96\xff\
+\xc3 \xceC\xff\x12s\xc6\x17(\xa5\xca_JU\x8d\
+b\x88\x02\xa5\x14(\x85B\x1d\x95$1\xf5\xbfU\x06\
+Y\x13S\xdb<\xa1\xeb%J\x0dtRY\xb3D*\
+\xef\x7f\xe7\x82\x22\xfd\x12\xe6X\x1cx\xd0MF\xfe\x0b\
+\xc4F\xd3_j+t\xb6B-7t@\xef\x22R\
+\xe9\xff\xfc%\x03\x00E2\xd6\x02J\xe9\x15\xf1\x99Q\
+\xa4\xd2P&\x81\xbf\x82xZJg\x8a\x10\xe2\x16!\
+\xccw\x15\xbas\xfd\xc3\x91\x00\xaccl\x9f\xb4\x0f\xf8\
+\x8d\x9bh\xff\x87\xe1+\xdd\x8b\x10\xcd(tB\x18-\
+\xa7t@?NW\x06!_\xb0\x0a\x007\xd1\x81t\
+m\x9d\xa0&s\xd1\xd4\xa1\x0e\x80\xb1C)\xf9;\xa5\
+\xe4[\x0d\xc3z/\xfd,\xa5\xac\xa6e`%\xf0;\
+`\x09\xb0[)\xb7\xb1k\xb7\x8d\xbe\xbd\xa7\xe5\x9a\x0e\
+\xe8\xa7px\x1f{\xa0\x1c%]\xa4\x9b\xc4\xb5\xa3\x9d\
+\xfb\x1b\xf5\xa8=C\xbbPj\x17J\xadF\xa9\x7fK\
+71G\x98\xfe\xb7\x0aa\xcc.t\xc74\xcdKJ\
+:\xcf\x01\x0f\x0b\xc3ZN*\xa8wfu\xd3\x83\x02\
+\xcd;:\xa0\xa7!L_\xe7a\x81a\x80R\xb8\xc9\
+X\xe7\x16m\x1d\xd83!`?\xa8\xfd\xcaI>\x22\
+\x0c\xdfK\xae\x13\x9bg\x18\xd69\xc2\xf4\x9d\x0b\x9c\xb6\
+\x99C\xb4~\xc7Qn\xe29aX/*%\x9fB\
+\xc97\xba2WjZ>\xe8\xbf\xb6\x0c\x09\xc3\xc2\xf2\
+\x97\x01\xa9\xc5H\x08\x81t\x12\x9d\xfb\xd8u`\xcf\x88\
+\x10\x12x\xc6I\x84\x9f\xb1\x02\xa5c\x0c\xd45J\xa9\
+\xf9\xc2\xb0\xa6\x08\xc3\x9cFju\xbc\xa6\xf5!j\xaf\
+\x92\xeeV\xa5d\xa3a\xfa7K'\xfeg\xc3\x0a\xbe\
+)\x84\x99\xd1\xe2DM\xcb%\x1d\xd0\xb3&\xb0\x82]\
+\x09jT*\x03\x9dru=\xf6,t\xe6\xd5\xdf\xe5\
+\xda\xd1\x9fH7\x89\xe5/[$D\xe8}J\xb9g\
+\x0b\xc3\x1a\x0c\x0cF\xffmj\xc5\xab\x0d%\x0f(\xd8\
+,\xe0q\x99\x8c=\xe2\xca\xc4A\x7f\xa8\xb6\xf3\xe2^\
+O\xabk\x85\xa1?4{\xa1+\xb0\xbb\xc90R\xea\
+\x8csY\xeb\xca\xab/\x8c\xa5J\xdaK\x9dx{\x89\
+\x15\xaay\x970\x8c\xb7\xa3\xe4,\x84(\x07Q\x86\xfe\
+;\xd5\x0a/\x8eR\x11\x84\xd8\x0f<)e\xf2\xb7J\
+:\x1bL_\x99\xae\x0f\xa1\x15\x0d\xfdA\x99\x03\xa6\xbf\
+\x0c\xd3\xaf\x17p\xf7\x9a\x10Q\x04\xbf\x01~\xe3$;\
+\x06\x18f\xf0:\xc3\x0a\xbc\x1b\x98\x07\x84\x00=\xfc\xd1\
+\xf2Iv\x1e\xad\xc0\xbf]'\xf6\xa0a\xfa_\x10\x86\
+\x95H\xfd\x19\xea?E\xad\xb8\xe8\x80\xae\x15\xabF!\
+\x8c\xdf\xb9\x89\xf0_\xa4\x9b\x18`\xfaB\x17\x1b\xbe\x92\
+\x1b\x81\xf3\xd1Y\xe84\xefE\x94\x92\x8fH;\xfa7\
+\xe9&\x97\xf8\x82\xd5\x11\x10\x09\xa0\xf8\x13\xedk\xa7-\
+\x1d\xd0\xb5b\x96@\xa9\x04\xcamCpPI\xe7\x09\
+7\xdeQ)L\xb3\xd4\xf4\x95\x8d\xc50\xde\x01\x5c_\
+\xe8Nj\xfdF\x87\x94\xce\x93\xd2\x8e>l\x08s\x85\
+\xe1/mA\xa9f\x94\xd2\x85R\xb4>A\x07\xf4\xbc\
+\xea*\x02\xa3eG\x00\x22\x82R\x11\xe5\xda \x14\xa0\
+^\x07^\x97N\xec\xbf\x850\x17\x08\xd3\xff\x16RS\
+\xf3\x9a\x96\x8d:\xe9&\x97('\xfe\x9c\xe1+\xdd$\
+`\xaf\x92\xcene\xe0\x14\xbac\x9a\x96-\x1d\xd0\xf3\
+H\x18\x16\x86\xbe\xd7\xde;\xe2\xf0\xbdK\x17\xd8\xa6\xa4\
+\xbd\x0d\x83\xa5\x02\x9eU\xd2=CI{\xaaa\x05\xcf\
+\x01f\x01\xba\xaa\x88v\x02\xa5\xe4N%\x93\xaf()\
+W\x98\xbe\x92\xadJ9\x9b\xa5\x13\xdfbX\xa1\xa3V\
+\xa9\xeb\xfb\xe3\xbd\xa2\x17\x08\x17\x84\x0e\xe8\xf9$\x0c\x0c\
++p\x8ao\xeamo=#\x00\x11\x05\x96\xa2\x9c\xa5\
+\xd2IX]\x01]:\xf1\xc9\xc08\xc3\xf4OB\x18\
+\x13\x0b\xdbO\xadP\x94\x92(\xd7\xde\xa2\x94\xb3\xda0\
+\x03[\x10\xc6\x1a\xe5$^q]{\x7f\xaa\x92\x9c\xd0\
+\xb9$rN\x07\xf4B\xd0\x01\xbdH\x08\xc3\xea\xbc\xaa\
+\xd5\x81\xbd\xe7\x04\x08\xe1\x90\xca\x9b\xbd\xc4I\x84\x015\
+\xd2\x17\xaaZ\x80R\x8b\x94t&\x0a\xc3\x1a$\x0cs\
+\x040\x90\xd4\xaay\xad\x7fq\x80z%\xddCJ\xb9\
+\x0d\x86\xe9\x8f+\xe9\x1c\x90\xc9\xf0\xf3\xae\x1b\x7f\xcc\x17\
+\xa8\x8a\x18\xfeR\xbd\xd5,\x17\xf4(\xbc\xe8\xe8\x80^\
+$\x0c3\x80\xb2\xdc\xce\x9a\xecZ.\xa4>\xb0\xd5^\
+\x84\xb1W:\xf1\xbf8\xf1\x0e\xac`\xf9L\xd3(\xbd\
+\x14\x98\xab\xa43\x09D\xb90\x8c\x0a\x10\xe5\xe8)\xfa\
+\xbe(\x0a\x84\x95t\xdb\x11\xa2E\x08c\x13J\xbd*\
+\xed\xf8r\xe9DW\x18\xa5\x03S\xef)a \x84\xa9\
+\x83P\xae\xe8\x0b\xa2\xa2\xa4\x03z\x11IM\xff\x1dG\
+\x7f\x00\xe5H\xd7\x07\x90X\x0b\xacE)\xech\x0b\xc2\
+0\xc7[\xc1\xca\x0b\x85a.\x04f\x83\x1a\x81R>\
+\x84\xf0\x81\xf0\x91z\x8f\xe8mr\xc5\xc1\x05\x95D)\
+\x1bD\x12!\xf6\x02\xabPr\xb9\x1bo}A\xf8\x82\
+[L_i\xea\x91BO\xa3{\xa6\xb3\xd4\xb4V|\
+t@/f\xc2\xc0\x0aV\x16\xba\x17\xfd\x97\x10 \xc4\
+\x0e`'\xf0\x1b@H'\xe1s\x13\x1d\xa3\xcc@\xd9\
+9\x86\x15:\x078\x07\x98\x8e~\xaf\x14\x9a\x03\xac\x91\
+N\xe2Y'\xd9\xf1\xb2\xc0X\xe9+\xa9=D\xea\x1e\
+\x95B\x08\xa5\xef\xdbzA!\x0c\x1f\xfaw\xdb7\xe8\
+\x0f\xa9>\xa7s\xeb\x9b\xce\x1d\x9f+\x8ac\x17.8\
+\xc0\x16`7\xf0/ \xe0\xc4Z\x83\x18\xc6x\xd3W\
+z\x810\xcc\x0b@\xcd\xedLI\xab\xe5\x5cW\xadp\
+@\xa97\x9dd\xe4Q\xe9\xc6\x9f\xb7\xfc\xe5\x9b\x0d+\
+\x10\x01b@\x82\xc3\xe5H\xb5\xdc\xea|+(\x89i\
+\x95 L\x13\x1d\xcc\xfb\x0e\x1d\xd0\xfb\x18\xc3\x0av\xd6\
+j7:\x0b\xc3\xc8\xd4\x7f\xb5\x5cR@\xbc\xf3\xe8*\
+\xbe\xb3\x17X\x03\xfc^J\xa7\xc2M\x84k\xc1\x98 \
+\x04g\x19\xbe\xd0E\x86\xe9\x1f_\xc0\xfe\xf6i\xd2I\
+ \x9dx\x02%\x97 \x8c\x17\x15l@\x89:_\xb0\
+\xac\x15%\x1b\x95r\x9bS/\x82\x96sJu\xe6u\
+\x00a\x98\x18\xbe\x12\x10\x06\xbe\x92jt\xe9\xd7\xbeG\
+\xbfb}Lg1\x93\xce\x7f)\xcc@9\x86R\xa9\
+\xaf\xa9\xe3\x07\x9bZn\x08:?\xf5\x9a\x81f\x94B\
+\xb96 ^B\xf0\x18V\xe0\xf7\xae\x1d\x1d\x86R5\
+\xd2I\x0c\x039\xc9\xb0Bg(%\xc7\x0a\x8cR3\
+\xd0\xb95\x0a\x8e)\xa9)\xfa\xe5\xfa\x88\xe3\xff\xfe\x04\
+JI\xa4\x1dCIG!D\xbd\xb4c\xfbL\x7f\xe9\
+V`/P\xa7\x5c\xa7UI\xfb\x10J\xedE\x18{\
+\x14\xb4\xa1D\xd7\x8f\xa3G\x889v\xd4\x00\xc0\xb0\x02\
+G}\x9e\x88\xd4\xc2A\xe8\x9cf\xd7\xfa\x1a\x1d\xd0\xfb\
+4\x810\xfd\x87?\xee\x0c+\x00\xc6Q\xeb\xb7\xf4\xb4\
+\xbcwR\x09n\x92\x08\xf6\x22\xc4^e'QJ\xe2\
+&#A\x85\x1ca\x09c\xacT\xeePSXUv\
+,1\x08D\x05P\x0bj P+\x84Y)L_\
+\x05JU\x08\xc3\x0a\x18\xa6\x0f\x84\xe8\x0c\xf8]\xaf\xe8\
+\x89\xaf_\xbeV\x16+\xd4)\xfe~\x8e\x04\xd7\xae\xeb\
+\x11\xe9\xd8(i+P\x1d\xd2M\xb6\x0bhW\xd0&\
+\xe0\x90\x82F\x94jE\x98-B\x88C\xae\x1dkv\
+\x93\x1d\x0d\xc2\xb0\xf6\x83\xaa\x07\xc2\x87\x13\xb9\x08q\xd4\
+\x22P\x1d\xc4s\xe7\xa8\xd7R\x08\x0c_\xe8\xf0\xefY\
+\x8f\xc2\xfb\x17\xfdj\xf6#\xe2\xe8\x95\xa7\x86y\xe4#\
+Q\xefo\xf7^g\x06;!\x8c8\xb0\x0d!\xb6\x09\
+\x0c\x84abGZ\xc1p\x011H \x86\x02\x83\x0c\
+\xd3W-\xa4\xbfZI\xb7\xda\xb0\x02\x15\xae\x1b\xafA\
+Q& \x88\x10! \x84R\xa5\xa4\xb6\xd2\xf9\x80\x00\
+\xe03\x0c\x9f\x1f\xc3\xf0!\x0c\x9f\x10\xa6\xaf\xf3{\xa7\
+\x88~\xdd\x07\xe4\x93p\x95rm\x94t\x94R6\xae\
+c+d\x9c\xd4\xd6\xb0(\x10G\x88\x18\xa9[\x11R\
+)\x1c \xa6\xa4\xd3(\xa4\xdb\xac\x84ju\xedh\x8b\
+\x806\x05M\x02\xea\x94\x94\x071\xac\x88\x15\xaa\xc2\xb0\
+\x82H'q\xd4\xf6\xb1\xae{\xe5\xa7\xea\xab\xd6cG\
+\xcf\x04\x19\x16G\xbf\xee\x86y\xaa\xe4VZ_\xa7\x03\
+z?%\x0c\xeb\xf0\xd5\xb7\x10\xc6\x09oj\xfd\x01\x9a\
+?\xc20\xba\xa6\x8e\x0f\x098\xd4\xf9\xc5\xce\xbd\xd1\xa9\
+\xff\xed$\xdaA)\x840\x04P\x05\xaa\xda\x80\x01@\
+5P*\x15e\x08J\x0c\xc3_\x8a d\x18\xbe\x12\
+\xc3\x17\x0c\x81\x08\x22\x95\x9fT\xc0\xb70\xf0\x03\x96\x92\
+\xca\x04erl\xc9Y)\x0cC\x82r\x91\xc2%U\
+9\xcc\x06\x92\xa0\x12@B\xba\x89\xb8\xeb&c\xa6\xe9\
+\x8f+'\x19U\xd2nG\xd0,\xa1\x09h#UJ\
+\xb4\x1d\x84\xa3REKl\xc3\xb40\x0c? \x11\xe2\
+\xc8\x85\xa4\x000\x8e\xda>\xa6g\x8c\xf2\xa0\xf3~\xb8\
+i\x1d3\x0a\xd7#\xf1\xd3\x83P\xfaM\xa6i\x9a\xa6\
+i}\x9e\xce\xbc\xa0i\x9a\xa6i\xfd\x80\x0e\xe8\x9a\xa6\
+i\x9a\xd6\x0f\xe8\x80\xaei\x9a\xa6i\xfd\x80\x0e\xe8\x9a\
+\xa6i\x9a\xd6\x0f\xe8\x80\xaei\x9a\xa6i\xfd\x80\x0e\xe8\
+\x9a\xa6i\x9a\xd6\x0f\xe8\x80\xaei\x9a\xa6i\xfd\xc0\xff\
+\x07\xd4\x8e\xb2c\x00\xff\xbar\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x06\
+\x07\x03}\xc3\
+\x00i\
+\x00m\x00a\x00g\x00e\x00s\
+\x00\x09\
+\x09\xbf\x8e\x87\
+\x00e\
+\x00x\x00c\x00e\x00l\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x06\xc1Y\x87\
+\x00o\
+\x00p\x00e\x00n\x00.\x00p\x00n\x00g\
+\x00\x0c\
+\x0b\xdf!G\
+\x00s\
+\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00.\x00p\x00n\x00g\
+\x00\x08\
+\x0aaZ\xa7\
+\x00i\
+\x00c\x00o\x00n\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x00%\xe2\
+\x00\x00\x01\x87\x0cMS\x98\
+\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x87\x0cMS\x98\
+\x00\x00\x00^\x00\x00\x00\x00\x00\x01\x00\x00\xe5\x1d\
+\x00\x00\x01\x87\x0cMS\x98\
+\x00\x00\x00@\x00\x00\x00\x00\x00\x01\x00\x00a\x03\
+\x00\x00\x01\x87\x0cMS\x98\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'settings_window.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QComboBox, QDialog,
+    QDialogButtonBox, QDoubleSpinBox, QGridLayout, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QSizePolicy,
+    QVBoxLayout, QWidget)
+
+class Ui_SettingsWindow(object):
+    def setupUi(self, SettingsWindow):
+        if not SettingsWindow.objectName():
+            SettingsWindow.setObjectName(u"SettingsWindow")
+        SettingsWindow.resize(832, 154)
+        icon = QIcon()
+        icon.addFile(u":/images/icon.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        SettingsWindow.setWindowIcon(icon)
+        self.verticalLayout_2 = QVBoxLayout(SettingsWindow)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.theme_label = QLabel(SettingsWindow)
+        self.theme_label.setObjectName(u"theme_label")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.theme_label.sizePolicy().hasHeightForWidth())
+        self.theme_label.setSizePolicy(sizePolicy)
+
+        self.gridLayout.addWidget(self.theme_label, 1, 0, 1, 1)
+
+        self.horizontalLayout_5 = QHBoxLayout()
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.select_log_file_directory_push_button = QPushButton(SettingsWindow)
+        self.select_log_file_directory_push_button.setObjectName(u"select_log_file_directory_push_button")
+        icon1 = QIcon()
+        icon1.addFile(u":/images/open.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        self.select_log_file_directory_push_button.setIcon(icon1)
+
+        self.horizontalLayout_5.addWidget(self.select_log_file_directory_push_button)
+
+        self.log_file_directory_line_edit = QLineEdit(SettingsWindow)
+        self.log_file_directory_line_edit.setObjectName(u"log_file_directory_line_edit")
+        sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        sizePolicy1.setHorizontalStretch(0)
+        sizePolicy1.setVerticalStretch(0)
+        sizePolicy1.setHeightForWidth(self.log_file_directory_line_edit.sizePolicy().hasHeightForWidth())
+        self.log_file_directory_line_edit.setSizePolicy(sizePolicy1)
+        self.log_file_directory_line_edit.setMinimumSize(QSize(0, 0))
+
+        self.horizontalLayout_5.addWidget(self.log_file_directory_line_edit)
+
+
+        self.gridLayout.addLayout(self.horizontalLayout_5, 0, 2, 1, 1)
+
+        self.log_file_directory_label = QLabel(SettingsWindow)
+        self.log_file_directory_label.setObjectName(u"log_file_directory_label")
+        sizePolicy.setHeightForWidth(self.log_file_directory_label.sizePolicy().hasHeightForWidth())
+        self.log_file_directory_label.setSizePolicy(sizePolicy)
+
+        self.gridLayout.addWidget(self.log_file_directory_label, 0, 0, 1, 1)
+
+        self.mode_label = QLabel(SettingsWindow)
+        self.mode_label.setObjectName(u"mode_label")
+        sizePolicy.setHeightForWidth(self.mode_label.sizePolicy().hasHeightForWidth())
+        self.mode_label.setSizePolicy(sizePolicy)
+
+        self.gridLayout.addWidget(self.mode_label, 2, 0, 1, 1)
+
+        self.mode_combo_box = QComboBox(SettingsWindow)
+        self.mode_combo_box.setObjectName(u"mode_combo_box")
+
+        self.gridLayout.addWidget(self.mode_combo_box, 2, 2, 1, 1)
+
+        self.theme_combo_box = QComboBox(SettingsWindow)
+        self.theme_combo_box.setObjectName(u"theme_combo_box")
+
+        self.gridLayout.addWidget(self.theme_combo_box, 1, 2, 1, 1)
+
+        self.mode_label_2 = QLabel(SettingsWindow)
+        self.mode_label_2.setObjectName(u"mode_label_2")
+        sizePolicy.setHeightForWidth(self.mode_label_2.sizePolicy().hasHeightForWidth())
+        self.mode_label_2.setSizePolicy(sizePolicy)
+
+        self.gridLayout.addWidget(self.mode_label_2, 3, 0, 1, 1)
+
+        self.scale_double_spin_box = QDoubleSpinBox(SettingsWindow)
+        self.scale_double_spin_box.setObjectName(u"scale_double_spin_box")
+        self.scale_double_spin_box.setMinimum(0.250000000000000)
+        self.scale_double_spin_box.setMaximum(5.000000000000000)
+        self.scale_double_spin_box.setValue(1.000000000000000)
+
+        self.gridLayout.addWidget(self.scale_double_spin_box, 3, 2, 1, 1)
+
+
+        self.horizontalLayout_3.addLayout(self.gridLayout)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_3)
+
+        self.button_box = QDialogButtonBox(SettingsWindow)
+        self.button_box.setObjectName(u"button_box")
+        self.button_box.setOrientation(Qt.Horizontal)
+        self.button_box.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.RestoreDefaults|QDialogButtonBox.Save)
+
+        self.verticalLayout_2.addWidget(self.button_box)
+
+
+        self.retranslateUi(SettingsWindow)
+        self.button_box.accepted.connect(SettingsWindow.accept)
+        self.button_box.rejected.connect(SettingsWindow.reject)
+
+        QMetaObject.connectSlotsByName(SettingsWindow)
+    # setupUi
+
+    def retranslateUi(self, SettingsWindow):
+        SettingsWindow.setWindowTitle(QCoreApplication.translate("SettingsWindow", u"Settings", None))
+        self.theme_label.setText(QCoreApplication.translate("SettingsWindow", u"Theme", None))
+        self.select_log_file_directory_push_button.setText("")
+        self.log_file_directory_label.setText(QCoreApplication.translate("SettingsWindow", u"Log File Directory", None))
+        self.mode_label.setText(QCoreApplication.translate("SettingsWindow", u"Mode", None))
+        self.mode_combo_box.setCurrentText("")
+        self.theme_combo_box.setCurrentText("")
+        self.mode_label_2.setText(QCoreApplication.translate("SettingsWindow", u"Scale", None))
+    # retranslateUi
+
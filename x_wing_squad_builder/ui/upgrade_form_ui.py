@@ -0,0 +1,1193 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'upgrade_form.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QAbstractSpinBox, QApplication, QCheckBox,
+    QDialog, QDialogButtonBox, QFrame, QHBoxLayout,
+    QLabel, QLineEdit, QSizePolicy, QSpacerItem,
+    QSpinBox, QVBoxLayout, QWidget)
+from . import resources_rc
+
+class Ui_UpgradeForm(object):
+    def setupUi(self, UpgradeForm):
+        if not UpgradeForm.objectName():
+            UpgradeForm.setObjectName(u"UpgradeForm")
+        UpgradeForm.resize(721, 814)
+        icon = QIcon()
+        icon.addFile(u":/images/icon.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        UpgradeForm.setWindowIcon(icon)
+        self.verticalLayout_2 = QVBoxLayout(UpgradeForm)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.verticalLayout = QVBoxLayout()
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.horizontalLayout_24 = QHBoxLayout()
+        self.horizontalLayout_24.setObjectName(u"horizontalLayout_24")
+        self.verticalLayout_5 = QVBoxLayout()
+        self.verticalLayout_5.setObjectName(u"verticalLayout_5")
+        self.label_19 = QLabel(UpgradeForm)
+        self.label_19.setObjectName(u"label_19")
+        font = QFont()
+        font.setPointSize(16)
+        font.setBold(True)
+        self.label_19.setFont(font)
+
+        self.verticalLayout_5.addWidget(self.label_19)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.label = QLabel(UpgradeForm)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout.addWidget(self.label)
+
+        self.upgrade_name_line_edit = QLineEdit(UpgradeForm)
+        self.upgrade_name_line_edit.setObjectName(u"upgrade_name_line_edit")
+
+        self.horizontalLayout.addWidget(self.upgrade_name_line_edit)
+
+
+        self.verticalLayout_5.addLayout(self.horizontalLayout)
+
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.label_2 = QLabel(UpgradeForm)
+        self.label_2.setObjectName(u"label_2")
+
+        self.horizontalLayout_2.addWidget(self.label_2)
+
+        self.upgrade_slot_line_edit = QLineEdit(UpgradeForm)
+        self.upgrade_slot_line_edit.setObjectName(u"upgrade_slot_line_edit")
+
+        self.horizontalLayout_2.addWidget(self.upgrade_slot_line_edit)
+
+
+        self.verticalLayout_5.addLayout(self.horizontalLayout_2)
+
+        self.horizontalLayout_25 = QHBoxLayout()
+        self.horizontalLayout_25.setObjectName(u"horizontalLayout_25")
+        self.label_25 = QLabel(UpgradeForm)
+        self.label_25.setObjectName(u"label_25")
+
+        self.horizontalLayout_25.addWidget(self.label_25)
+
+        self.upgrade_cost_spinbox = QSpinBox(UpgradeForm)
+        self.upgrade_cost_spinbox.setObjectName(u"upgrade_cost_spinbox")
+        self.upgrade_cost_spinbox.setMinimum(-1)
+        self.upgrade_cost_spinbox.setMaximum(9999)
+        self.upgrade_cost_spinbox.setValue(-1)
+
+        self.horizontalLayout_25.addWidget(self.upgrade_cost_spinbox)
+
+
+        self.verticalLayout_5.addLayout(self.horizontalLayout_25)
+
+        self.variable_cost_frame = QFrame(UpgradeForm)
+        self.variable_cost_frame.setObjectName(u"variable_cost_frame")
+        self.variable_cost_frame.setFrameShape(QFrame.StyledPanel)
+        self.variable_cost_frame.setFrameShadow(QFrame.Raised)
+        self.verticalLayout_6 = QVBoxLayout(self.variable_cost_frame)
+        self.verticalLayout_6.setObjectName(u"verticalLayout_6")
+        self.label_39 = QLabel(self.variable_cost_frame)
+        self.label_39.setObjectName(u"label_39")
+        font1 = QFont()
+        font1.setPointSize(9)
+        font1.setBold(True)
+        self.label_39.setFont(font1)
+
+        self.verticalLayout_6.addWidget(self.label_39)
+
+        self.horizontalLayout_32 = QHBoxLayout()
+        self.horizontalLayout_32.setObjectName(u"horizontalLayout_32")
+        self.variable_agility_checkbox = QCheckBox(self.variable_cost_frame)
+        self.variable_agility_checkbox.setObjectName(u"variable_agility_checkbox")
+        self.variable_agility_checkbox.setLayoutDirection(Qt.RightToLeft)
+
+        self.horizontalLayout_32.addWidget(self.variable_agility_checkbox)
+
+        self.variable_base_checkbox = QCheckBox(self.variable_cost_frame)
+        self.variable_base_checkbox.setObjectName(u"variable_base_checkbox")
+        self.variable_base_checkbox.setLayoutDirection(Qt.RightToLeft)
+
+        self.horizontalLayout_32.addWidget(self.variable_base_checkbox)
+
+        self.variable_initiative_checkbox = QCheckBox(self.variable_cost_frame)
+        self.variable_initiative_checkbox.setObjectName(u"variable_initiative_checkbox")
+        self.variable_initiative_checkbox.setLayoutDirection(Qt.RightToLeft)
+
+        self.horizontalLayout_32.addWidget(self.variable_initiative_checkbox)
+
+        self.variable_attacks_checkbox = QCheckBox(self.variable_cost_frame)
+        self.variable_attacks_checkbox.setObjectName(u"variable_attacks_checkbox")
+        self.variable_attacks_checkbox.setLayoutDirection(Qt.RightToLeft)
+
+        self.horizontalLayout_32.addWidget(self.variable_attacks_checkbox)
+
+        self.horizontalSpacer_5 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_32.addItem(self.horizontalSpacer_5)
+
+
+        self.verticalLayout_6.addLayout(self.horizontalLayout_32)
+
+        self.horizontalLayout_33 = QHBoxLayout()
+        self.horizontalLayout_33.setObjectName(u"horizontalLayout_33")
+        self.label_48 = QLabel(self.variable_cost_frame)
+        self.label_48.setObjectName(u"label_48")
+
+        self.horizontalLayout_33.addWidget(self.label_48)
+
+        self.variable_attribute_line_edit = QLineEdit(self.variable_cost_frame)
+        self.variable_attribute_line_edit.setObjectName(u"variable_attribute_line_edit")
+
+        self.horizontalLayout_33.addWidget(self.variable_attribute_line_edit)
+
+
+        self.verticalLayout_6.addLayout(self.horizontalLayout_33)
+
+        self.horizontalLayout_34 = QHBoxLayout()
+        self.horizontalLayout_34.setObjectName(u"horizontalLayout_34")
+        self.label_49 = QLabel(self.variable_cost_frame)
+        self.label_49.setObjectName(u"label_49")
+
+        self.horizontalLayout_34.addWidget(self.label_49)
+
+        self.variable_cost_line_edit = QLineEdit(self.variable_cost_frame)
+        self.variable_cost_line_edit.setObjectName(u"variable_cost_line_edit")
+
+        self.horizontalLayout_34.addWidget(self.variable_cost_line_edit)
+
+
+        self.verticalLayout_6.addLayout(self.horizontalLayout_34)
+
+
+        self.verticalLayout_5.addWidget(self.variable_cost_frame)
+
+        self.horizontalLayout_37 = QHBoxLayout()
+        self.horizontalLayout_37.setObjectName(u"horizontalLayout_37")
+        self.label_26 = QLabel(UpgradeForm)
+        self.label_26.setObjectName(u"label_26")
+
+        self.horizontalLayout_37.addWidget(self.label_26)
+
+        self.upgrade_limit_spinbox = QSpinBox(UpgradeForm)
+        self.upgrade_limit_spinbox.setObjectName(u"upgrade_limit_spinbox")
+        self.upgrade_limit_spinbox.setMinimum(0)
+        self.upgrade_limit_spinbox.setValue(0)
+
+        self.horizontalLayout_37.addWidget(self.upgrade_limit_spinbox)
+
+
+        self.verticalLayout_5.addLayout(self.horizontalLayout_37)
+
+
+        self.horizontalLayout_24.addLayout(self.verticalLayout_5)
+
+        self.verticalLayout_7 = QVBoxLayout()
+        self.verticalLayout_7.setObjectName(u"verticalLayout_7")
+        self.label_52 = QLabel(UpgradeForm)
+        self.label_52.setObjectName(u"label_52")
+        font2 = QFont()
+        font2.setPointSize(12)
+        font2.setBold(True)
+        self.label_52.setFont(font2)
+
+        self.verticalLayout_7.addWidget(self.label_52)
+
+        self.horizontalLayout_38 = QHBoxLayout()
+        self.horizontalLayout_38.setObjectName(u"horizontalLayout_38")
+        self.label_53 = QLabel(UpgradeForm)
+        self.label_53.setObjectName(u"label_53")
+
+        self.horizontalLayout_38.addWidget(self.label_53)
+
+        self.added_actions_line_edit = QLineEdit(UpgradeForm)
+        self.added_actions_line_edit.setObjectName(u"added_actions_line_edit")
+
+        self.horizontalLayout_38.addWidget(self.added_actions_line_edit)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_38)
+
+        self.horizontalLayout_39 = QHBoxLayout()
+        self.horizontalLayout_39.setObjectName(u"horizontalLayout_39")
+        self.label_54 = QLabel(UpgradeForm)
+        self.label_54.setObjectName(u"label_54")
+
+        self.horizontalLayout_39.addWidget(self.label_54)
+
+        self.added_action_colors_line_edit = QLineEdit(UpgradeForm)
+        self.added_action_colors_line_edit.setObjectName(u"added_action_colors_line_edit")
+
+        self.horizontalLayout_39.addWidget(self.added_action_colors_line_edit)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_39)
+
+        self.horizontalLayout_40 = QHBoxLayout()
+        self.horizontalLayout_40.setObjectName(u"horizontalLayout_40")
+        self.label_55 = QLabel(UpgradeForm)
+        self.label_55.setObjectName(u"label_55")
+
+        self.horizontalLayout_40.addWidget(self.label_55)
+
+        self.added_upgrade_slots_line_edit = QLineEdit(UpgradeForm)
+        self.added_upgrade_slots_line_edit.setObjectName(u"added_upgrade_slots_line_edit")
+
+        self.horizontalLayout_40.addWidget(self.added_upgrade_slots_line_edit)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_40)
+
+        self.horizontalLayout_41 = QHBoxLayout()
+        self.horizontalLayout_41.setObjectName(u"horizontalLayout_41")
+        self.label_56 = QLabel(UpgradeForm)
+        self.label_56.setObjectName(u"label_56")
+
+        self.horizontalLayout_41.addWidget(self.label_56)
+
+        self.removed_upgrade_slots_line_edit = QLineEdit(UpgradeForm)
+        self.removed_upgrade_slots_line_edit.setObjectName(u"removed_upgrade_slots_line_edit")
+
+        self.horizontalLayout_41.addWidget(self.removed_upgrade_slots_line_edit)
+
+
+        self.verticalLayout_7.addLayout(self.horizontalLayout_41)
+
+        self.verticalSpacer_3 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_7.addItem(self.verticalSpacer_3)
+
+        self.verticalLayout_7.setStretch(0, 1)
+        self.verticalLayout_7.setStretch(1, 1)
+        self.verticalLayout_7.setStretch(2, 1)
+        self.verticalLayout_7.setStretch(3, 1)
+        self.verticalLayout_7.setStretch(4, 1)
+        self.verticalLayout_7.setStretch(5, 1)
+
+        self.horizontalLayout_24.addLayout(self.verticalLayout_7)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout_24)
+
+        self.verticalSpacer_2 = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer_2)
+
+        self.label_20 = QLabel(UpgradeForm)
+        self.label_20.setObjectName(u"label_20")
+        self.label_20.setFont(font2)
+
+        self.verticalLayout.addWidget(self.label_20)
+
+        self.horizontalLayout_3 = QHBoxLayout()
+        self.horizontalLayout_3.setObjectName(u"horizontalLayout_3")
+        self.verticalLayout_3 = QVBoxLayout()
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.horizontalLayout_36 = QHBoxLayout()
+        self.horizontalLayout_36.setObjectName(u"horizontalLayout_36")
+        self.label_50 = QLabel(UpgradeForm)
+        self.label_50.setObjectName(u"label_50")
+
+        self.horizontalLayout_36.addWidget(self.label_50)
+
+        self.horizontalSpacer_7 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_36.addItem(self.horizontalSpacer_7)
+
+        self.pilot_limit_low_spinbox = QSpinBox(UpgradeForm)
+        self.pilot_limit_low_spinbox.setObjectName(u"pilot_limit_low_spinbox")
+        self.pilot_limit_low_spinbox.setMinimum(-1)
+        self.pilot_limit_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_36.addWidget(self.pilot_limit_low_spinbox)
+
+        self.label_51 = QLabel(UpgradeForm)
+        self.label_51.setObjectName(u"label_51")
+
+        self.horizontalLayout_36.addWidget(self.label_51)
+
+        self.pilot_limit_high_spinbox = QSpinBox(UpgradeForm)
+        self.pilot_limit_high_spinbox.setObjectName(u"pilot_limit_high_spinbox")
+        self.pilot_limit_high_spinbox.setMinimum(-1)
+        self.pilot_limit_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_36.addWidget(self.pilot_limit_high_spinbox)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_36)
+
+        self.horizontalLayout_29 = QHBoxLayout()
+        self.horizontalLayout_29.setObjectName(u"horizontalLayout_29")
+        self.label_37 = QLabel(UpgradeForm)
+        self.label_37.setObjectName(u"label_37")
+
+        self.horizontalLayout_29.addWidget(self.label_37)
+
+        self.horizontalSpacer_3 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_29.addItem(self.horizontalSpacer_3)
+
+        self.initiative_low_spinbox = QSpinBox(UpgradeForm)
+        self.initiative_low_spinbox.setObjectName(u"initiative_low_spinbox")
+        self.initiative_low_spinbox.setMinimum(-1)
+        self.initiative_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_29.addWidget(self.initiative_low_spinbox)
+
+        self.label_38 = QLabel(UpgradeForm)
+        self.label_38.setObjectName(u"label_38")
+
+        self.horizontalLayout_29.addWidget(self.label_38)
+
+        self.initiative_high_spinbox = QSpinBox(UpgradeForm)
+        self.initiative_high_spinbox.setObjectName(u"initiative_high_spinbox")
+        self.initiative_high_spinbox.setMinimum(-1)
+        self.initiative_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_29.addWidget(self.initiative_high_spinbox)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_29)
+
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.label_3 = QLabel(UpgradeForm)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayout_4.addWidget(self.label_3)
+
+        self.faction_line_edit = QLineEdit(UpgradeForm)
+        self.faction_line_edit.setObjectName(u"faction_line_edit")
+
+        self.horizontalLayout_4.addWidget(self.faction_line_edit)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_4)
+
+        self.horizontalLayout_7 = QHBoxLayout()
+        self.horizontalLayout_7.setObjectName(u"horizontalLayout_7")
+        self.label_4 = QLabel(UpgradeForm)
+        self.label_4.setObjectName(u"label_4")
+
+        self.horizontalLayout_7.addWidget(self.label_4)
+
+        self.ships_line_edit = QLineEdit(UpgradeForm)
+        self.ships_line_edit.setObjectName(u"ships_line_edit")
+
+        self.horizontalLayout_7.addWidget(self.ships_line_edit)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_7)
+
+        self.horizontalLayout_9 = QHBoxLayout()
+        self.horizontalLayout_9.setObjectName(u"horizontalLayout_9")
+        self.label_9 = QLabel(UpgradeForm)
+        self.label_9.setObjectName(u"label_9")
+
+        self.horizontalLayout_9.addWidget(self.label_9)
+
+        self.base_sizes_line_edit = QLineEdit(UpgradeForm)
+        self.base_sizes_line_edit.setObjectName(u"base_sizes_line_edit")
+
+        self.horizontalLayout_9.addWidget(self.base_sizes_line_edit)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_9)
+
+        self.horizontalLayout_12 = QHBoxLayout()
+        self.horizontalLayout_12.setObjectName(u"horizontalLayout_12")
+        self.label_12 = QLabel(UpgradeForm)
+        self.label_12.setObjectName(u"label_12")
+
+        self.horizontalLayout_12.addWidget(self.label_12)
+
+        self.colors_line_edit = QLineEdit(UpgradeForm)
+        self.colors_line_edit.setObjectName(u"colors_line_edit")
+
+        self.horizontalLayout_12.addWidget(self.colors_line_edit)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_12)
+
+        self.horizontalLayout_10 = QHBoxLayout()
+        self.horizontalLayout_10.setObjectName(u"horizontalLayout_10")
+        self.label_10 = QLabel(UpgradeForm)
+        self.label_10.setObjectName(u"label_10")
+
+        self.horizontalLayout_10.addWidget(self.label_10)
+
+        self.actions_line_edit = QLineEdit(UpgradeForm)
+        self.actions_line_edit.setObjectName(u"actions_line_edit")
+
+        self.horizontalLayout_10.addWidget(self.actions_line_edit)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_10)
+
+        self.horizontalLayout_13 = QHBoxLayout()
+        self.horizontalLayout_13.setObjectName(u"horizontalLayout_13")
+        self.label_13 = QLabel(UpgradeForm)
+        self.label_13.setObjectName(u"label_13")
+
+        self.horizontalLayout_13.addWidget(self.label_13)
+
+        self.traits_line_edit = QLineEdit(UpgradeForm)
+        self.traits_line_edit.setObjectName(u"traits_line_edit")
+
+        self.horizontalLayout_13.addWidget(self.traits_line_edit)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_13)
+
+        self.horizontalLayout_5 = QHBoxLayout()
+        self.horizontalLayout_5.setObjectName(u"horizontalLayout_5")
+        self.label_5 = QLabel(UpgradeForm)
+        self.label_5.setObjectName(u"label_5")
+
+        self.horizontalLayout_5.addWidget(self.label_5)
+
+        self.horizontalSpacer_15 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_5.addItem(self.horizontalSpacer_15)
+
+        self.attack_low_spinbox = QSpinBox(UpgradeForm)
+        self.attack_low_spinbox.setObjectName(u"attack_low_spinbox")
+        self.attack_low_spinbox.setButtonSymbols(QAbstractSpinBox.UpDownArrows)
+        self.attack_low_spinbox.setMinimum(-1)
+        self.attack_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_5.addWidget(self.attack_low_spinbox)
+
+        self.label_11 = QLabel(UpgradeForm)
+        self.label_11.setObjectName(u"label_11")
+
+        self.horizontalLayout_5.addWidget(self.label_11)
+
+        self.attack_high_spinbox = QSpinBox(UpgradeForm)
+        self.attack_high_spinbox.setObjectName(u"attack_high_spinbox")
+        self.attack_high_spinbox.setMinimum(-1)
+        self.attack_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_5.addWidget(self.attack_high_spinbox)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_5)
+
+        self.horizontalLayout_6 = QHBoxLayout()
+        self.horizontalLayout_6.setObjectName(u"horizontalLayout_6")
+        self.label_6 = QLabel(UpgradeForm)
+        self.label_6.setObjectName(u"label_6")
+
+        self.horizontalLayout_6.addWidget(self.label_6)
+
+        self.arc_types_line_edit = QLineEdit(UpgradeForm)
+        self.arc_types_line_edit.setObjectName(u"arc_types_line_edit")
+
+        self.horizontalLayout_6.addWidget(self.arc_types_line_edit)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_6)
+
+        self.horizontalLayout_28 = QHBoxLayout()
+        self.horizontalLayout_28.setObjectName(u"horizontalLayout_28")
+        self.autoinclude_checkbox = QCheckBox(UpgradeForm)
+        self.autoinclude_checkbox.setObjectName(u"autoinclude_checkbox")
+        self.autoinclude_checkbox.setLayoutDirection(Qt.RightToLeft)
+
+        self.horizontalLayout_28.addWidget(self.autoinclude_checkbox)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_28.addItem(self.horizontalSpacer_2)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_28)
+
+        self.horizontalLayout_31 = QHBoxLayout()
+        self.horizontalLayout_31.setObjectName(u"horizontalLayout_31")
+        self.epic_checkbox = QCheckBox(UpgradeForm)
+        self.epic_checkbox.setObjectName(u"epic_checkbox")
+        self.epic_checkbox.setLayoutDirection(Qt.RightToLeft)
+
+        self.horizontalLayout_31.addWidget(self.epic_checkbox)
+
+        self.horizontalSpacer_4 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_31.addItem(self.horizontalSpacer_4)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_31)
+
+        self.horizontalLayout_35 = QHBoxLayout()
+        self.horizontalLayout_35.setObjectName(u"horizontalLayout_35")
+        self.solitary_checkbox = QCheckBox(UpgradeForm)
+        self.solitary_checkbox.setObjectName(u"solitary_checkbox")
+        self.solitary_checkbox.setLayoutDirection(Qt.RightToLeft)
+
+        self.horizontalLayout_35.addWidget(self.solitary_checkbox)
+
+        self.horizontalSpacer_6 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_35.addItem(self.horizontalSpacer_6)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_35)
+
+        self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout_3.addItem(self.verticalSpacer)
+
+
+        self.horizontalLayout_3.addLayout(self.verticalLayout_3)
+
+        self.verticalLayout_4 = QVBoxLayout()
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.horizontalLayout_8 = QHBoxLayout()
+        self.horizontalLayout_8.setObjectName(u"horizontalLayout_8")
+        self.label_7 = QLabel(UpgradeForm)
+        self.label_7.setObjectName(u"label_7")
+
+        self.horizontalLayout_8.addWidget(self.label_7)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_8.addItem(self.horizontalSpacer)
+
+        self.agility_low_spinbox = QSpinBox(UpgradeForm)
+        self.agility_low_spinbox.setObjectName(u"agility_low_spinbox")
+        self.agility_low_spinbox.setMinimum(-1)
+        self.agility_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_8.addWidget(self.agility_low_spinbox)
+
+        self.label_14 = QLabel(UpgradeForm)
+        self.label_14.setObjectName(u"label_14")
+
+        self.horizontalLayout_8.addWidget(self.label_14)
+
+        self.agility_high_spinbox = QSpinBox(UpgradeForm)
+        self.agility_high_spinbox.setObjectName(u"agility_high_spinbox")
+        self.agility_high_spinbox.setMinimum(-1)
+        self.agility_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_8.addWidget(self.agility_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_8)
+
+        self.horizontalLayout_11 = QHBoxLayout()
+        self.horizontalLayout_11.setObjectName(u"horizontalLayout_11")
+        self.label_15 = QLabel(UpgradeForm)
+        self.label_15.setObjectName(u"label_15")
+
+        self.horizontalLayout_11.addWidget(self.label_15)
+
+        self.horizontalSpacer_16 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_11.addItem(self.horizontalSpacer_16)
+
+        self.hull_low_spinbox = QSpinBox(UpgradeForm)
+        self.hull_low_spinbox.setObjectName(u"hull_low_spinbox")
+        self.hull_low_spinbox.setMinimum(-1)
+        self.hull_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_11.addWidget(self.hull_low_spinbox)
+
+        self.label_16 = QLabel(UpgradeForm)
+        self.label_16.setObjectName(u"label_16")
+
+        self.horizontalLayout_11.addWidget(self.label_16)
+
+        self.hull_high_spinbox = QSpinBox(UpgradeForm)
+        self.hull_high_spinbox.setObjectName(u"hull_high_spinbox")
+        self.hull_high_spinbox.setMinimum(-1)
+        self.hull_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_11.addWidget(self.hull_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_11)
+
+        self.horizontalLayout_14 = QHBoxLayout()
+        self.horizontalLayout_14.setObjectName(u"horizontalLayout_14")
+        self.label_17 = QLabel(UpgradeForm)
+        self.label_17.setObjectName(u"label_17")
+
+        self.horizontalLayout_14.addWidget(self.label_17)
+
+        self.horizontalSpacer_17 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_14.addItem(self.horizontalSpacer_17)
+
+        self.shield_low_spinbox = QSpinBox(UpgradeForm)
+        self.shield_low_spinbox.setObjectName(u"shield_low_spinbox")
+        self.shield_low_spinbox.setMinimum(-1)
+        self.shield_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_14.addWidget(self.shield_low_spinbox)
+
+        self.label_18 = QLabel(UpgradeForm)
+        self.label_18.setObjectName(u"label_18")
+
+        self.horizontalLayout_14.addWidget(self.label_18)
+
+        self.shield_high_spinbox = QSpinBox(UpgradeForm)
+        self.shield_high_spinbox.setObjectName(u"shield_high_spinbox")
+        self.shield_high_spinbox.setMinimum(-1)
+        self.shield_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_14.addWidget(self.shield_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_14)
+
+        self.horizontalLayout_15 = QHBoxLayout()
+        self.horizontalLayout_15.setObjectName(u"horizontalLayout_15")
+        self.label_21 = QLabel(UpgradeForm)
+        self.label_21.setObjectName(u"label_21")
+
+        self.horizontalLayout_15.addWidget(self.label_21)
+
+        self.horizontalSpacer_18 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_15.addItem(self.horizontalSpacer_18)
+
+        self.shield_recharge_low_spinbox = QSpinBox(UpgradeForm)
+        self.shield_recharge_low_spinbox.setObjectName(u"shield_recharge_low_spinbox")
+        self.shield_recharge_low_spinbox.setMinimum(-1)
+        self.shield_recharge_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_15.addWidget(self.shield_recharge_low_spinbox)
+
+        self.label_22 = QLabel(UpgradeForm)
+        self.label_22.setObjectName(u"label_22")
+
+        self.horizontalLayout_15.addWidget(self.label_22)
+
+        self.shield_recharge_high_spinbox = QSpinBox(UpgradeForm)
+        self.shield_recharge_high_spinbox.setObjectName(u"shield_recharge_high_spinbox")
+        self.shield_recharge_high_spinbox.setMinimum(-1)
+        self.shield_recharge_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_15.addWidget(self.shield_recharge_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_15)
+
+        self.horizontalLayout_16 = QHBoxLayout()
+        self.horizontalLayout_16.setObjectName(u"horizontalLayout_16")
+        self.label_23 = QLabel(UpgradeForm)
+        self.label_23.setObjectName(u"label_23")
+
+        self.horizontalLayout_16.addWidget(self.label_23)
+
+        self.horizontalSpacer_19 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_16.addItem(self.horizontalSpacer_19)
+
+        self.shield_decharge_low_spinbox = QSpinBox(UpgradeForm)
+        self.shield_decharge_low_spinbox.setObjectName(u"shield_decharge_low_spinbox")
+        self.shield_decharge_low_spinbox.setMinimum(-1)
+        self.shield_decharge_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_16.addWidget(self.shield_decharge_low_spinbox)
+
+        self.label_24 = QLabel(UpgradeForm)
+        self.label_24.setObjectName(u"label_24")
+
+        self.horizontalLayout_16.addWidget(self.label_24)
+
+        self.shield_decharge_high_spinbox = QSpinBox(UpgradeForm)
+        self.shield_decharge_high_spinbox.setObjectName(u"shield_decharge_high_spinbox")
+        self.shield_decharge_high_spinbox.setMinimum(-1)
+        self.shield_decharge_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_16.addWidget(self.shield_decharge_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_16)
+
+        self.horizontalLayout_17 = QHBoxLayout()
+        self.horizontalLayout_17.setObjectName(u"horizontalLayout_17")
+        self.label_27 = QLabel(UpgradeForm)
+        self.label_27.setObjectName(u"label_27")
+
+        self.horizontalLayout_17.addWidget(self.label_27)
+
+        self.horizontalSpacer_20 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_17.addItem(self.horizontalSpacer_20)
+
+        self.force_low_spinbox = QSpinBox(UpgradeForm)
+        self.force_low_spinbox.setObjectName(u"force_low_spinbox")
+        self.force_low_spinbox.setMinimum(-1)
+        self.force_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_17.addWidget(self.force_low_spinbox)
+
+        self.label_28 = QLabel(UpgradeForm)
+        self.label_28.setObjectName(u"label_28")
+
+        self.horizontalLayout_17.addWidget(self.label_28)
+
+        self.force_high_spinbox = QSpinBox(UpgradeForm)
+        self.force_high_spinbox.setObjectName(u"force_high_spinbox")
+        self.force_high_spinbox.setMinimum(-1)
+        self.force_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_17.addWidget(self.force_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_17)
+
+        self.horizontalLayout_18 = QHBoxLayout()
+        self.horizontalLayout_18.setObjectName(u"horizontalLayout_18")
+        self.label_29 = QLabel(UpgradeForm)
+        self.label_29.setObjectName(u"label_29")
+
+        self.horizontalLayout_18.addWidget(self.label_29)
+
+        self.horizontalSpacer_21 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_18.addItem(self.horizontalSpacer_21)
+
+        self.force_recharge_low_spinbox = QSpinBox(UpgradeForm)
+        self.force_recharge_low_spinbox.setObjectName(u"force_recharge_low_spinbox")
+        self.force_recharge_low_spinbox.setMinimum(-1)
+        self.force_recharge_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_18.addWidget(self.force_recharge_low_spinbox)
+
+        self.label_30 = QLabel(UpgradeForm)
+        self.label_30.setObjectName(u"label_30")
+
+        self.horizontalLayout_18.addWidget(self.label_30)
+
+        self.force_recharge_high_spinbox = QSpinBox(UpgradeForm)
+        self.force_recharge_high_spinbox.setObjectName(u"force_recharge_high_spinbox")
+        self.force_recharge_high_spinbox.setMinimum(-1)
+        self.force_recharge_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_18.addWidget(self.force_recharge_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_18)
+
+        self.horizontalLayout_19 = QHBoxLayout()
+        self.horizontalLayout_19.setObjectName(u"horizontalLayout_19")
+        self.label_40 = QLabel(UpgradeForm)
+        self.label_40.setObjectName(u"label_40")
+
+        self.horizontalLayout_19.addWidget(self.label_40)
+
+        self.horizontalSpacer_22 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_19.addItem(self.horizontalSpacer_22)
+
+        self.force_decharge_low_spinbox = QSpinBox(UpgradeForm)
+        self.force_decharge_low_spinbox.setObjectName(u"force_decharge_low_spinbox")
+        self.force_decharge_low_spinbox.setMinimum(-1)
+        self.force_decharge_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_19.addWidget(self.force_decharge_low_spinbox)
+
+        self.label_41 = QLabel(UpgradeForm)
+        self.label_41.setObjectName(u"label_41")
+
+        self.horizontalLayout_19.addWidget(self.label_41)
+
+        self.force_decharge_high_spinbox = QSpinBox(UpgradeForm)
+        self.force_decharge_high_spinbox.setObjectName(u"force_decharge_high_spinbox")
+        self.force_decharge_high_spinbox.setMinimum(-1)
+        self.force_decharge_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_19.addWidget(self.force_decharge_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_19)
+
+        self.horizontalLayout_20 = QHBoxLayout()
+        self.horizontalLayout_20.setObjectName(u"horizontalLayout_20")
+        self.label_31 = QLabel(UpgradeForm)
+        self.label_31.setObjectName(u"label_31")
+
+        self.horizontalLayout_20.addWidget(self.label_31)
+
+        self.horizontalSpacer_23 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_20.addItem(self.horizontalSpacer_23)
+
+        self.energy_low_spinbox = QSpinBox(UpgradeForm)
+        self.energy_low_spinbox.setObjectName(u"energy_low_spinbox")
+        self.energy_low_spinbox.setMinimum(-1)
+        self.energy_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_20.addWidget(self.energy_low_spinbox)
+
+        self.label_32 = QLabel(UpgradeForm)
+        self.label_32.setObjectName(u"label_32")
+
+        self.horizontalLayout_20.addWidget(self.label_32)
+
+        self.energy_high_spinbox = QSpinBox(UpgradeForm)
+        self.energy_high_spinbox.setObjectName(u"energy_high_spinbox")
+        self.energy_high_spinbox.setMinimum(-1)
+        self.energy_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_20.addWidget(self.energy_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_20)
+
+        self.horizontalLayout_21 = QHBoxLayout()
+        self.horizontalLayout_21.setObjectName(u"horizontalLayout_21")
+        self.label_33 = QLabel(UpgradeForm)
+        self.label_33.setObjectName(u"label_33")
+
+        self.horizontalLayout_21.addWidget(self.label_33)
+
+        self.horizontalSpacer_24 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_21.addItem(self.horizontalSpacer_24)
+
+        self.energy_recharge_low_spinbox = QSpinBox(UpgradeForm)
+        self.energy_recharge_low_spinbox.setObjectName(u"energy_recharge_low_spinbox")
+        self.energy_recharge_low_spinbox.setMinimum(-1)
+        self.energy_recharge_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_21.addWidget(self.energy_recharge_low_spinbox)
+
+        self.label_34 = QLabel(UpgradeForm)
+        self.label_34.setObjectName(u"label_34")
+
+        self.horizontalLayout_21.addWidget(self.label_34)
+
+        self.energy_recharge_high_spinbox = QSpinBox(UpgradeForm)
+        self.energy_recharge_high_spinbox.setObjectName(u"energy_recharge_high_spinbox")
+        self.energy_recharge_high_spinbox.setMinimum(-1)
+        self.energy_recharge_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_21.addWidget(self.energy_recharge_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_21)
+
+        self.horizontalLayout_22 = QHBoxLayout()
+        self.horizontalLayout_22.setObjectName(u"horizontalLayout_22")
+        self.label_42 = QLabel(UpgradeForm)
+        self.label_42.setObjectName(u"label_42")
+
+        self.horizontalLayout_22.addWidget(self.label_42)
+
+        self.horizontalSpacer_25 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_22.addItem(self.horizontalSpacer_25)
+
+        self.energy_decharge_low_spinbox = QSpinBox(UpgradeForm)
+        self.energy_decharge_low_spinbox.setObjectName(u"energy_decharge_low_spinbox")
+        self.energy_decharge_low_spinbox.setMinimum(-1)
+        self.energy_decharge_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_22.addWidget(self.energy_decharge_low_spinbox)
+
+        self.label_43 = QLabel(UpgradeForm)
+        self.label_43.setObjectName(u"label_43")
+
+        self.horizontalLayout_22.addWidget(self.label_43)
+
+        self.energy_decharge_high_spinbox = QSpinBox(UpgradeForm)
+        self.energy_decharge_high_spinbox.setObjectName(u"energy_decharge_high_spinbox")
+        self.energy_decharge_high_spinbox.setMinimum(-1)
+        self.energy_decharge_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_22.addWidget(self.energy_decharge_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_22)
+
+        self.horizontalLayout_23 = QHBoxLayout()
+        self.horizontalLayout_23.setObjectName(u"horizontalLayout_23")
+        self.label_35 = QLabel(UpgradeForm)
+        self.label_35.setObjectName(u"label_35")
+
+        self.horizontalLayout_23.addWidget(self.label_35)
+
+        self.horizontalSpacer_26 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_23.addItem(self.horizontalSpacer_26)
+
+        self.charge_low_spinbox = QSpinBox(UpgradeForm)
+        self.charge_low_spinbox.setObjectName(u"charge_low_spinbox")
+        self.charge_low_spinbox.setMinimum(-1)
+        self.charge_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_23.addWidget(self.charge_low_spinbox)
+
+        self.label_36 = QLabel(UpgradeForm)
+        self.label_36.setObjectName(u"label_36")
+
+        self.horizontalLayout_23.addWidget(self.label_36)
+
+        self.charge_high_spinbox = QSpinBox(UpgradeForm)
+        self.charge_high_spinbox.setObjectName(u"charge_high_spinbox")
+        self.charge_high_spinbox.setMinimum(-1)
+        self.charge_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_23.addWidget(self.charge_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_23)
+
+        self.horizontalLayout_26 = QHBoxLayout()
+        self.horizontalLayout_26.setObjectName(u"horizontalLayout_26")
+        self.label_44 = QLabel(UpgradeForm)
+        self.label_44.setObjectName(u"label_44")
+
+        self.horizontalLayout_26.addWidget(self.label_44)
+
+        self.horizontalSpacer_27 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_26.addItem(self.horizontalSpacer_27)
+
+        self.charge_recharge_low_spinbox = QSpinBox(UpgradeForm)
+        self.charge_recharge_low_spinbox.setObjectName(u"charge_recharge_low_spinbox")
+        self.charge_recharge_low_spinbox.setMinimum(-1)
+        self.charge_recharge_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_26.addWidget(self.charge_recharge_low_spinbox)
+
+        self.label_45 = QLabel(UpgradeForm)
+        self.label_45.setObjectName(u"label_45")
+
+        self.horizontalLayout_26.addWidget(self.label_45)
+
+        self.charge_recharge_high_spinbox = QSpinBox(UpgradeForm)
+        self.charge_recharge_high_spinbox.setObjectName(u"charge_recharge_high_spinbox")
+        self.charge_recharge_high_spinbox.setMinimum(-1)
+        self.charge_recharge_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_26.addWidget(self.charge_recharge_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_26)
+
+        self.horizontalLayout_27 = QHBoxLayout()
+        self.horizontalLayout_27.setObjectName(u"horizontalLayout_27")
+        self.label_46 = QLabel(UpgradeForm)
+        self.label_46.setObjectName(u"label_46")
+
+        self.horizontalLayout_27.addWidget(self.label_46)
+
+        self.horizontalSpacer_28 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout_27.addItem(self.horizontalSpacer_28)
+
+        self.charge_decharge_low_spinbox = QSpinBox(UpgradeForm)
+        self.charge_decharge_low_spinbox.setObjectName(u"charge_decharge_low_spinbox")
+        self.charge_decharge_low_spinbox.setMinimum(-1)
+        self.charge_decharge_low_spinbox.setValue(-1)
+
+        self.horizontalLayout_27.addWidget(self.charge_decharge_low_spinbox)
+
+        self.label_47 = QLabel(UpgradeForm)
+        self.label_47.setObjectName(u"label_47")
+
+        self.horizontalLayout_27.addWidget(self.label_47)
+
+        self.charge_decharge_high_spinbox = QSpinBox(UpgradeForm)
+        self.charge_decharge_high_spinbox.setObjectName(u"charge_decharge_high_spinbox")
+        self.charge_decharge_high_spinbox.setMinimum(-1)
+        self.charge_decharge_high_spinbox.setValue(-1)
+
+        self.horizontalLayout_27.addWidget(self.charge_decharge_high_spinbox)
+
+
+        self.verticalLayout_4.addLayout(self.horizontalLayout_27)
+
+
+        self.horizontalLayout_3.addLayout(self.verticalLayout_4)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout_3)
+
+        self.horizontalLayout_30 = QHBoxLayout()
+        self.horizontalLayout_30.setObjectName(u"horizontalLayout_30")
+        self.label_8 = QLabel(UpgradeForm)
+        self.label_8.setObjectName(u"label_8")
+
+        self.horizontalLayout_30.addWidget(self.label_8)
+
+        self.other_equipped_upgrades_line_edit = QLineEdit(UpgradeForm)
+        self.other_equipped_upgrades_line_edit.setObjectName(u"other_equipped_upgrades_line_edit")
+
+        self.horizontalLayout_30.addWidget(self.other_equipped_upgrades_line_edit)
+
+
+        self.verticalLayout.addLayout(self.horizontalLayout_30)
+
+
+        self.verticalLayout_2.addLayout(self.verticalLayout)
+
+        self.buttonBox = QDialogButtonBox(UpgradeForm)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Cancel|QDialogButtonBox.Ok)
+
+        self.verticalLayout_2.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(UpgradeForm)
+        self.buttonBox.accepted.connect(UpgradeForm.accept)
+        self.buttonBox.rejected.connect(UpgradeForm.reject)
+
+        QMetaObject.connectSlotsByName(UpgradeForm)
+    # setupUi
+
+    def retranslateUi(self, UpgradeForm):
+        UpgradeForm.setWindowTitle(QCoreApplication.translate("UpgradeForm", u"Upgrade Form", None))
+        self.label_19.setText(QCoreApplication.translate("UpgradeForm", u"Upgrade", None))
+        self.label.setText(QCoreApplication.translate("UpgradeForm", u"Upgrade Name: ", None))
+        self.upgrade_name_line_edit.setText("")
+        self.upgrade_name_line_edit.setPlaceholderText("")
+        self.label_2.setText(QCoreApplication.translate("UpgradeForm", u"Upgrade Slot Type(s): ", None))
+        self.upgrade_slot_line_edit.setText("")
+        self.upgrade_slot_line_edit.setPlaceholderText("")
+        self.label_25.setText(QCoreApplication.translate("UpgradeForm", u"Cost:", None))
+        self.upgrade_cost_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"variable", None))
+        self.label_39.setText(QCoreApplication.translate("UpgradeForm", u"Variable Cost", None))
+        self.variable_agility_checkbox.setText(QCoreApplication.translate("UpgradeForm", u"Agility", None))
+        self.variable_base_checkbox.setText(QCoreApplication.translate("UpgradeForm", u"Base", None))
+        self.variable_initiative_checkbox.setText(QCoreApplication.translate("UpgradeForm", u"Initiative", None))
+        self.variable_attacks_checkbox.setText(QCoreApplication.translate("UpgradeForm", u"Attack (Highest)", None))
+        self.label_48.setText(QCoreApplication.translate("UpgradeForm", u"Attribute Value:", None))
+        self.variable_attribute_line_edit.setText("")
+        self.variable_attribute_line_edit.setPlaceholderText("")
+        self.label_49.setText(QCoreApplication.translate("UpgradeForm", u"Variable Cost:", None))
+        self.variable_cost_line_edit.setText("")
+        self.variable_cost_line_edit.setPlaceholderText("")
+        self.label_26.setText(QCoreApplication.translate("UpgradeForm", u"Upgrade Limit:", None))
+        self.upgrade_limit_spinbox.setSpecialValueText("")
+        self.label_52.setText(QCoreApplication.translate("UpgradeForm", u"Upgrade Modifications", None))
+        self.label_53.setText(QCoreApplication.translate("UpgradeForm", u"Added Action(s):", None))
+        self.added_actions_line_edit.setText("")
+        self.added_actions_line_edit.setPlaceholderText("")
+        self.label_54.setText(QCoreApplication.translate("UpgradeForm", u"Added Action Color(s):", None))
+        self.added_action_colors_line_edit.setText("")
+        self.added_action_colors_line_edit.setPlaceholderText("")
+        self.label_55.setText(QCoreApplication.translate("UpgradeForm", u"Added Upgrade Slot(s):", None))
+        self.added_upgrade_slots_line_edit.setText("")
+        self.added_upgrade_slots_line_edit.setPlaceholderText(QCoreApplication.translate("UpgradeForm", u"separate with commas", None))
+        self.label_56.setText(QCoreApplication.translate("UpgradeForm", u"Removed Upgrade Slot(s):", None))
+        self.removed_upgrade_slots_line_edit.setText("")
+        self.removed_upgrade_slots_line_edit.setPlaceholderText(QCoreApplication.translate("UpgradeForm", u"separate with commas", None))
+        self.label_20.setText(QCoreApplication.translate("UpgradeForm", u"Upgrade Restrictions", None))
+        self.label_50.setText(QCoreApplication.translate("UpgradeForm", u"Pilot Limit:", None))
+        self.pilot_limit_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_51.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.pilot_limit_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_37.setText(QCoreApplication.translate("UpgradeForm", u"Pilot Initiative:", None))
+        self.initiative_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_38.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.initiative_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_3.setText(QCoreApplication.translate("UpgradeForm", u"Faction(s):", None))
+        self.faction_line_edit.setText("")
+        self.faction_line_edit.setPlaceholderText("")
+        self.label_4.setText(QCoreApplication.translate("UpgradeForm", u"Ship(s):", None))
+        self.ships_line_edit.setText("")
+        self.ships_line_edit.setPlaceholderText("")
+        self.label_9.setText(QCoreApplication.translate("UpgradeForm", u"Base Size(s):", None))
+        self.base_sizes_line_edit.setText("")
+        self.base_sizes_line_edit.setPlaceholderText("")
+        self.label_12.setText(QCoreApplication.translate("UpgradeForm", u"Action Color(s):", None))
+        self.colors_line_edit.setText("")
+        self.colors_line_edit.setPlaceholderText("")
+        self.label_10.setText(QCoreApplication.translate("UpgradeForm", u"Action(s):", None))
+        self.actions_line_edit.setText("")
+        self.actions_line_edit.setPlaceholderText("")
+        self.label_13.setText(QCoreApplication.translate("UpgradeForm", u"Keyword(s):", None))
+        self.traits_line_edit.setText("")
+        self.traits_line_edit.setPlaceholderText("")
+        self.label_5.setText(QCoreApplication.translate("UpgradeForm", u"Attack:", None))
+        self.attack_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_11.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.attack_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_6.setText(QCoreApplication.translate("UpgradeForm", u"Arc Type(s): ", None))
+        self.arc_types_line_edit.setText("")
+        self.arc_types_line_edit.setPlaceholderText("")
+        self.autoinclude_checkbox.setText(QCoreApplication.translate("UpgradeForm", u"Auto Include", None))
+        self.epic_checkbox.setText(QCoreApplication.translate("UpgradeForm", u"Epic", None))
+        self.solitary_checkbox.setText(QCoreApplication.translate("UpgradeForm", u"Solitary", None))
+        self.label_7.setText(QCoreApplication.translate("UpgradeForm", u"Agility: ", None))
+        self.agility_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_14.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.agility_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_15.setText(QCoreApplication.translate("UpgradeForm", u"Hull:", None))
+        self.hull_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_16.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.hull_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_17.setText(QCoreApplication.translate("UpgradeForm", u"Shield:", None))
+        self.shield_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_18.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.shield_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_21.setText(QCoreApplication.translate("UpgradeForm", u"Shield Recharge:", None))
+        self.shield_recharge_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_22.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.shield_recharge_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_23.setText(QCoreApplication.translate("UpgradeForm", u"Shield Decharge:", None))
+        self.shield_decharge_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_24.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.shield_decharge_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_27.setText(QCoreApplication.translate("UpgradeForm", u"Force:", None))
+        self.force_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_28.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.force_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_29.setText(QCoreApplication.translate("UpgradeForm", u"Force Recharge:", None))
+        self.force_recharge_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_30.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.force_recharge_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_40.setText(QCoreApplication.translate("UpgradeForm", u"Force Decharge:", None))
+        self.force_decharge_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_41.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.force_decharge_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_31.setText(QCoreApplication.translate("UpgradeForm", u"Energy:", None))
+        self.energy_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_32.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.energy_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_33.setText(QCoreApplication.translate("UpgradeForm", u"Energy Recharge:", None))
+        self.energy_recharge_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_34.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.energy_recharge_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_42.setText(QCoreApplication.translate("UpgradeForm", u"Energy Decharge:", None))
+        self.energy_decharge_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_43.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.energy_decharge_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_35.setText(QCoreApplication.translate("UpgradeForm", u"Charge:", None))
+        self.charge_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_36.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.charge_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_44.setText(QCoreApplication.translate("UpgradeForm", u"Charge Recharge:", None))
+        self.charge_recharge_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_45.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.charge_recharge_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_46.setText(QCoreApplication.translate("UpgradeForm", u"Charge Decharge:", None))
+        self.charge_decharge_low_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_47.setText(QCoreApplication.translate("UpgradeForm", u"to", None))
+        self.charge_decharge_high_spinbox.setSpecialValueText(QCoreApplication.translate("UpgradeForm", u"none", None))
+        self.label_8.setText(QCoreApplication.translate("UpgradeForm", u"Other Equipped Upgrades:", None))
+        self.other_equipped_upgrades_line_edit.setText("")
+        self.other_equipped_upgrades_line_edit.setPlaceholderText("")
+    # retranslateUi
+
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'viewer_dialog.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractButton, QApplication, QDialog, QDialogButtonBox,
+    QHBoxLayout, QHeaderView, QLabel, QLineEdit,
+    QPushButton, QSizePolicy, QSpacerItem, QTabWidget,
+    QTextEdit, QTreeView, QVBoxLayout, QWidget)
+from . import resources_rc
+
+class Ui_Viewer(object):
+    def setupUi(self, Viewer):
+        if not Viewer.objectName():
+            Viewer.setObjectName(u"Viewer")
+        Viewer.resize(1188, 860)
+        icon = QIcon()
+        icon.addFile(u":/images/icon.png", QSize(), QIcon.Mode.Normal, QIcon.State.Off)
+        Viewer.setWindowIcon(icon)
+        self.verticalLayout = QVBoxLayout(Viewer)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.viewer_tab_widget = QTabWidget(Viewer)
+        self.viewer_tab_widget.setObjectName(u"viewer_tab_widget")
+        self.upgrade_tab = QWidget()
+        self.upgrade_tab.setObjectName(u"upgrade_tab")
+        self.upgrade_tab.setLayoutDirection(Qt.LeftToRight)
+        self.verticalLayout_2 = QVBoxLayout(self.upgrade_tab)
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.horizontalLayout_2 = QHBoxLayout()
+        self.horizontalLayout_2.setObjectName(u"horizontalLayout_2")
+        self.label = QLabel(self.upgrade_tab)
+        self.label.setObjectName(u"label")
+
+        self.horizontalLayout_2.addWidget(self.label)
+
+        self.upgrade_filter_line_edit = QLineEdit(self.upgrade_tab)
+        self.upgrade_filter_line_edit.setObjectName(u"upgrade_filter_line_edit")
+
+        self.horizontalLayout_2.addWidget(self.upgrade_filter_line_edit)
+
+
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+
+        self.upgrade_layout = QHBoxLayout()
+        self.upgrade_layout.setObjectName(u"upgrade_layout")
+        self.upgrade_viewer_tree_view = QTreeView(self.upgrade_tab)
+        self.upgrade_viewer_tree_view.setObjectName(u"upgrade_viewer_tree_view")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.upgrade_viewer_tree_view.sizePolicy().hasHeightForWidth())
+        self.upgrade_viewer_tree_view.setSizePolicy(sizePolicy)
+        self.upgrade_viewer_tree_view.setContextMenuPolicy(Qt.DefaultContextMenu)
+
+        self.upgrade_layout.addWidget(self.upgrade_viewer_tree_view)
+
+
+        self.verticalLayout_2.addLayout(self.upgrade_layout)
+
+        self.viewer_tab_widget.addTab(self.upgrade_tab, "")
+        self.pilot_viewer = QWidget()
+        self.pilot_viewer.setObjectName(u"pilot_viewer")
+        self.verticalLayout_3 = QVBoxLayout(self.pilot_viewer)
+        self.verticalLayout_3.setObjectName(u"verticalLayout_3")
+        self.horizontalLayout_4 = QHBoxLayout()
+        self.horizontalLayout_4.setObjectName(u"horizontalLayout_4")
+        self.label_3 = QLabel(self.pilot_viewer)
+        self.label_3.setObjectName(u"label_3")
+
+        self.horizontalLayout_4.addWidget(self.label_3)
+
+        self.pilot_filter_line_edit = QLineEdit(self.pilot_viewer)
+        self.pilot_filter_line_edit.setObjectName(u"pilot_filter_line_edit")
+
+        self.horizontalLayout_4.addWidget(self.pilot_filter_line_edit)
+
+
+        self.verticalLayout_3.addLayout(self.horizontalLayout_4)
+
+        self.pilot_layout = QHBoxLayout()
+        self.pilot_layout.setObjectName(u"pilot_layout")
+        self.pilot_viewer_tree_view = QTreeView(self.pilot_viewer)
+        self.pilot_viewer_tree_view.setObjectName(u"pilot_viewer_tree_view")
+        sizePolicy.setHeightForWidth(self.pilot_viewer_tree_view.sizePolicy().hasHeightForWidth())
+        self.pilot_viewer_tree_view.setSizePolicy(sizePolicy)
+
+        self.pilot_layout.addWidget(self.pilot_viewer_tree_view)
+
+
+        self.verticalLayout_3.addLayout(self.pilot_layout)
+
+        self.viewer_tab_widget.addTab(self.pilot_viewer, "")
+        self.squad_viewer = QWidget()
+        self.squad_viewer.setObjectName(u"squad_viewer")
+        self.verticalLayout_4 = QVBoxLayout(self.squad_viewer)
+        self.verticalLayout_4.setObjectName(u"verticalLayout_4")
+        self.squad_text_edit = QTextEdit(self.squad_viewer)
+        self.squad_text_edit.setObjectName(u"squad_text_edit")
+
+        self.verticalLayout_4.addWidget(self.squad_text_edit)
+
+        self.viewer_tab_widget.addTab(self.squad_viewer, "")
+
+        self.verticalLayout.addWidget(self.viewer_tab_widget)
+
+        self.horizontalLayout = QHBoxLayout()
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.expand_all_push_button = QPushButton(Viewer)
+        self.expand_all_push_button.setObjectName(u"expand_all_push_button")
+
+        self.horizontalLayout.addWidget(self.expand_all_push_button)
+
+        self.collapse_all_push_button = QPushButton(Viewer)
+        self.collapse_all_push_button.setObjectName(u"collapse_all_push_button")
+
+        self.horizontalLayout.addWidget(self.collapse_all_push_button)
+
+        self.horizontalSpacer = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer)
+
+        self.edit_tree_widget_item_push_button = QPushButton(Viewer)
+        self.edit_tree_widget_item_push_button.setObjectName(u"edit_tree_widget_item_push_button")
+
+        self.horizontalLayout.addWidget(self.edit_tree_widget_item_push_button)
+
+        self.horizontalSpacer_2 = QSpacerItem(40, 20, QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
+
+        self.horizontalLayout.addItem(self.horizontalSpacer_2)
+
+        self.horizontalLayout.setStretch(4, 1)
+
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.buttonBox = QDialogButtonBox(Viewer)
+        self.buttonBox.setObjectName(u"buttonBox")
+        self.buttonBox.setOrientation(Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QDialogButtonBox.Close)
+
+        self.verticalLayout.addWidget(self.buttonBox)
+
+
+        self.retranslateUi(Viewer)
+        self.buttonBox.accepted.connect(Viewer.accept)
+        self.buttonBox.rejected.connect(Viewer.reject)
+
+        self.viewer_tab_widget.setCurrentIndex(0)
+
+
+        QMetaObject.connectSlotsByName(Viewer)
+    # setupUi
+
+    def retranslateUi(self, Viewer):
+        Viewer.setWindowTitle(QCoreApplication.translate("Viewer", u"X-Wing Viewer", None))
+        self.label.setText(QCoreApplication.translate("Viewer", u"Upgrade Filter:", None))
+        self.upgrade_filter_line_edit.setPlaceholderText(QCoreApplication.translate("Viewer", u"search text here...", None))
+        self.viewer_tab_widget.setTabText(self.viewer_tab_widget.indexOf(self.upgrade_tab), QCoreApplication.translate("Viewer", u"Upgrade Viewer", None))
+        self.label_3.setText(QCoreApplication.translate("Viewer", u"Pilot Filter:", None))
+        self.pilot_filter_line_edit.setPlaceholderText(QCoreApplication.translate("Viewer", u"search text here...", None))
+        self.viewer_tab_widget.setTabText(self.viewer_tab_widget.indexOf(self.pilot_viewer), QCoreApplication.translate("Viewer", u"Pilot Viewer", None))
+        self.viewer_tab_widget.setTabText(self.viewer_tab_widget.indexOf(self.squad_viewer), QCoreApplication.translate("Viewer", u"Squad Viewer", None))
+        self.expand_all_push_button.setText(QCoreApplication.translate("Viewer", u"Expand All", None))
+        self.collapse_all_push_button.setText(QCoreApplication.translate("Viewer", u"Collapse All", None))
+        self.edit_tree_widget_item_push_button.setText(QCoreApplication.translate("Viewer", u"Edit...", None))
+    # retranslateUi
+
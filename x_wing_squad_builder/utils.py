@@ -5,24 +5,25 @@ import argparse
 
 from typing import List
 
-from PIL import Image
 import numpy as np
 
-from PySide6.QtGui import QImage
 
-
-def change_action_image_color(image_path, color) -> QImage:
-    im = Image.open(image_path)
-    im_arr = np.array(im).astype('uint8')
+def recolor_image_array(im_arr: np.ndarray, color) -> np.ndarray:
+    """recolors an (h, w, 3 or 4) uint8 array of white icons in place, returns the array.
+    Works on a single icon or a whole atlas of icons at once."""
+    if color not in ("red", "purple", "green"):
+        return im_arr
+    # Pixels with any red are part of the icon
+    mask = im_arr[:, :, 0] > 0
     if color == "red":
-        im_arr[im_arr[:, :, 0] > 0, 1] = 0
-        im_arr[im_arr[:, :, 0] > 0, 2] = 0
+        im_arr[mask, 1] = 0
+        im_arr[mask, 2] = 0
     elif color == "purple":
-        im_arr[im_arr[:, :, 0] > 0, 1] = 0
+        im_arr[mask, 1] = 0
     elif color == "green":
-        im_arr[im_arr[:, :, 0] > 0, 0] = 0
-        im_arr[im_arr[:, :, 0] > 0, 2] = 0
-    return Image.fromarray(im_arr).toqimage()
+        # Only red is removed: once it is zeroed no pixel matches the mask for blue any more.
+        im_arr[mask, 0] = 0
+    return im_arr
 
 
 def contains_number(text):
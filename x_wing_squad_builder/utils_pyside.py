@@ -1,13 +1,17 @@
+from collections import OrderedDict
 from pathlib import Path
-from PySide6 import QtWidgets, QtGui
+from PIL import Image
+import numpy as np
+from PySide6 import QtWidgets, QtGui, QtCore
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import logging
 
-from .utils import change_action_image_color, gui_text_encode
+from .utils import recolor_image_array, gui_text_encode
+from .atlas import icon_atlas
 from .model.ship import Ship
 
-from .settings import Settings
+from .settings import settings_snapshot
 
 
 def parse_attacks(attacks_line_edit: QtWidgets.QLineEdit, arc_types_line_edit: QtWidgets.QLineEdit, statistics: dict):
@@ -63,28 +67,137 @@ def set_low_high(low_spinbox: QtWidgets.QSpinBox, high_spinbox: QtWidgets.QSpinB
     high_spinbox.setValue(high_val)
 
 
-def treewidget_item_is_top_level(item: QtWidgets.QTreeWidgetItem):
+class PixmapCache:
     """
-    This can be used to navigate the squad tree widget.  Returns false if
-    an upgrade, otherwise returns True if a pilot.
-    """
-    if item.childCount() == 0:
-        return False
-    return True
+    LRU cache of decoded pixmaps keyed by (path, color, scale).
 
+    The same icons are requested for every row of the squad and viewer trees, so decoding
+    (and recoloring) each image once saves reading it from disk again on every refresh.
+    Pixmaps are implicitly shared by Qt, so handing out the cached instance is cheap; callers
+    must not paint on it.  Entries are evicted least recently used first once the decoded size
+    exceeds budget_bytes.
+    """
 
-def image_path_to_qpixmap(image_path: Path, color=None) -> QtGui.QPixmap:
+    DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.__budget_bytes = budget_bytes
+        self.__entries: "OrderedDict[Tuple[str, Optional[str], float], QtGui.QPixmap]" = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @property
+    def budget_bytes(self) -> int:
+        return self.__budget_bytes
+
+    @budget_bytes.setter
+    def budget_bytes(self, val: int):
+        self.__budget_bytes = val
+        self.evict()
+
+    @staticmethod
+    def pixmap_bytes(pixmap: QtGui.QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    @staticmethod
+    def key(image_path: Path, color: Optional[str] = None) -> Tuple[str, Optional[str], float]:
+        return str(image_path), color, settings_snapshot().scale
+
+    def lookup(self, image_path: Path, color: Optional[str] = None) -> Optional[QtGui.QPixmap]:
+        """returns the cached pixmap, or None without decoding if it is not cached"""
+        key = self.key(image_path, color)
+        pixmap = self.__entries.get(key)
+        if pixmap is not None:
+            self.hits += 1
+            self.__entries.move_to_end(key)
+        return pixmap
+
+    def insert(self, image_path: Path, color: Optional[str], pixmap: QtGui.QPixmap):
+        """adds a pixmap decoded elsewhere (e.g. off the GUI thread) to the cache"""
+        key = self.key(image_path, color)
+        previous = self.__entries.pop(key, None)
+        if previous is not None:
+            self.size_bytes -= self.pixmap_bytes(previous)
+        self.__entries[key] = pixmap
+        self.size_bytes += self.pixmap_bytes(pixmap)
+        self.evict()
+
+    def get(self, image_path: Path, color: Optional[str] = None) -> QtGui.QPixmap:
+        pixmap = self.lookup(image_path, color)
+        if pixmap is None:
+            self.misses += 1
+            pixmap = load_qpixmap(image_path, color, settings_snapshot().scale)
+            self.insert(image_path, color, pixmap)
+        return pixmap
+
+    def evict(self):
+        """drops least recently used pixmaps until the cache fits in its budget"""
+        while self.__entries and self.size_bytes > self.__budget_bytes:
+            _, pixmap = self.__entries.popitem(last=False)
+            self.size_bytes -= self.pixmap_bytes(pixmap)
+
+    def clear(self):
+        """drops every pixmap, call when the theme or scale changes"""
+        logging.debug(f"Clearing pixmap cache: {len(self)} pixmaps, {self.size_bytes} bytes, "
+                      f"{self.hits} hits, {self.misses} misses")
+        self.__entries.clear()
+        self.size_bytes = 0
+
+
+_pixmap_cache: Optional[PixmapCache] = None
+
+
+def pixmap_cache() -> PixmapCache:
+    """returns the process wide pixmap cache used by image_path_to_qpixmap"""
+    global _pixmap_cache
+    if _pixmap_cache is None:
+        _pixmap_cache = PixmapCache()
+    return _pixmap_cache
+
+
+def change_action_image_color(image_path, color) -> QtGui.QImage:
+    im = Image.open(image_path)
+    if im.mode not in ("RGB", "RGBA"):
+        # e.g. palette images, which have no color channels to edit
+        im = im.convert("RGBA")
+    im_arr = np.array(im).astype('uint8')
+    recolor_image_array(im_arr, color)
+    return Image.fromarray(im_arr).toqimage()
+
+
+def load_qimage(image_path: Path, color=None) -> QtGui.QImage:
+    """decodes an image from disk.  Unlike pixmaps, images may be decoded off the GUI thread.
+    Icons packed in the icon atlas are cut from it (or its recolored variant) instead of
+    opening their own file."""
+    qimage = icon_atlas().qimage(image_path, color)
+    if qimage is not None:
+        return qimage
     if color is not None:
-        qimage = change_action_image_color(image_path, color)
-    else:
-        qimage = QtGui.QImage(image_path)
+        return change_action_image_color(image_path, color)
+    return QtGui.QImage(image_path)
+
+
+def qimage_to_qpixmap(qimage: QtGui.QImage, scale: float = 1) -> QtGui.QPixmap:
     pixmap = QtGui.QPixmap.fromImage(qimage)
 
-    pixmap.setDevicePixelRatio(Settings().scale)
+    pixmap.setDevicePixelRatio(scale)
 
     return pixmap
 
 
+def load_qpixmap(image_path: Path, color=None, scale: float = 1) -> QtGui.QPixmap:
+    """decodes an image from disk, bypassing the pixmap cache"""
+    return qimage_to_qpixmap(load_qimage(image_path, color), scale)
+
+
+def image_path_to_qpixmap(image_path: Path, color=None) -> QtGui.QPixmap:
+    return pixmap_cache().get(image_path, color)
+
+
 def populate_list_widget(arr: List[str], list_widget: QtWidgets.QListWidget, image_path: Optional[Path] = None) -> None:
     list_widget.blockSignals(True)
     for s in arr:
@@ -137,6 +250,32 @@ def clear_ship_layout(layout: QtWidgets.QLayout):
             widget.deleteLater()
 
 
+def list_widget_neighbours(list_widget: QtWidgets.QListWidget, distance: int = 1) -> List[QtWidgets.QListWidgetItem]:
+    """returns the items up to distance rows before and after the current row, nearest first"""
+    row = list_widget.currentRow()
+    if row < 0:
+        return []
+    items = []
+    for offset in range(1, distance + 1):
+        for neighbour_row in (row + offset, row - offset):
+            if 0 <= neighbour_row < list_widget.count():
+                items.append(list_widget.item(neighbour_row))
+    return items
+
+
+def tree_view_neighbours(index: QtCore.QModelIndex, distance: int = 1) -> List[QtCore.QModelIndex]:
+    """returns the sibling indexes up to distance rows before and after index, nearest first"""
+    if not index.isValid():
+        return []
+    row_count = index.model().rowCount(index.parent())
+    indexes = []
+    for offset in range(1, distance + 1):
+        for neighbour_row in (index.row() + offset, index.row() - offset):
+            if 0 <= neighbour_row < row_count:
+                indexes.append(index.siblingAtRow(neighbour_row))
+    return indexes
+
+
 def detect_pyside_widget(pyside_object, target_widget):
     """Recursively generates a list of the desired widget type within a given layout."""
     # This first block basically tests if the object is a layout
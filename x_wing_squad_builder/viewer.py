@@ -8,34 +8,56 @@ from .model import Upgrades
 from .model import XWing
 from .model import Squad
 
-from .utils_pyside import image_path_to_qpixmap, treewidget_item_is_top_level, gui_text_encode
+from .utils_pyside import gui_text_encode, tree_view_neighbours
 from .utils import get_upgrade_name_from_list_item_text, prettify_name, get_pilot_name_from_list_item_text
 from .ui.card_viewer import CardViewer
+from .card_loader import CardLoader
+from .catalog_tree_model import CatalogNode, CatalogTreeModel, CatalogFilterProxyModel
 
-from PySide6 import QtWidgets, QtGui, QtCore
+from PySide6 import QtWidgets, QtCore
 
-from typing import Optional
+from typing import Iterator, List, Optional, Tuple
 
 
 class Viewer(QtWidgets.QDialog):
     upgrade_edit_signal = QtCore.Signal(str)
     pilot_edit_signal = QtCore.Signal(str, str, str)
 
+    # The filters are applied once typing pauses for this long
+    FILTER_DELAY_MS = 150
+
     def __init__(self, xwing: XWing, upgrades: Upgrades, upgrade_slots_dir: Path, upgrades_dir: Path,
-                 factions_dir: Path, ship_icons_dir: Path, pilots_dir: Path, parent=None):
+                 factions_dir: Path, ship_icons_dir: Path, pilots_dir: Path, parent=None,
+                 card_loader: Optional[CardLoader] = None):
         super().__init__(parent)
         self.ui = Ui_Viewer()
         self.ui.setupUi(self)
 
+        if card_loader is None:
+            card_loader = CardLoader(QtCore.QThreadPool.globalInstance(), self)
+        self.card_loader = card_loader
+
         self.upgrades = upgrades
         self.upgrade_slots_dir = upgrade_slots_dir
         self.upgrades_dir = upgrades_dir
         self.factions_dir = factions_dir
         self.ship_icons_dir = ship_icons_dir
         self.pilots_dir = pilots_dir
-        self.ui.upgrade_viewer_tree_widget.itemSelectionChanged.connect(
+
+        self.upgrade_model = CatalogTreeModel("Upgrade", self)
+        self.upgrade_proxy = CatalogFilterProxyModel(self.upgrade_paths, self)
+        self.upgrade_proxy.setSourceModel(self.upgrade_model)
+        self.ui.upgrade_viewer_tree_view.setModel(self.upgrade_proxy)
+        self.ui.upgrade_viewer_tree_view.selectionModel().selectionChanged.connect(
             self.handle_upgrade_tree_click)
 
+        self.pilot_model = CatalogTreeModel("Pilot", self)
+        self.pilot_proxy = CatalogFilterProxyModel(self.pilot_paths, self)
+        self.pilot_proxy.setSourceModel(self.pilot_model)
+        self.ui.pilot_viewer_tree_view.setModel(self.pilot_proxy)
+        self.ui.pilot_viewer_tree_view.selectionModel().selectionChanged.connect(
+            self.handle_pilot_tree_click)
+
         self.ui.expand_all_push_button.clicked.connect(
             partial(self.expand_collapse_all, True))
         self.ui.collapse_all_push_button.clicked.connect(
@@ -44,63 +66,72 @@ class Viewer(QtWidgets.QDialog):
         self.ui.edit_tree_widget_item_push_button.clicked.connect(
             self.handle_edit)
 
-        self.ui.upgrade_filter_line_edit.textChanged.connect(self.filter_items)
-        self.ui.pilot_filter_line_edit.textChanged.connect(self.filter_items)
+        self.upgrade_filter_timer = self.filter_timer(
+            self.ui.upgrade_filter_line_edit, self.upgrade_proxy, self.ui.upgrade_viewer_tree_view)
+        self.pilot_filter_timer = self.filter_timer(
+            self.ui.pilot_filter_line_edit, self.pilot_proxy, self.ui.pilot_viewer_tree_view)
 
         self.xwing = xwing
 
         self.populate_upgrade_viewer()
         self.upgrade_viewer = CardViewer(self)
         self.add_card_viewer(
-            self.upgrade_viewer, self.ui.upgrade_viewer_tree_widget, self.ui.upgrade_layout)
+            self.upgrade_viewer, self.ui.upgrade_viewer_tree_view, self.ui.upgrade_layout)
 
-        self.ui.pilot_viewer_tree_widget.itemSelectionChanged.connect(
-            self.handle_pilot_tree_click)
 
         self.populate_pilot_viewer()
         self.pilot_viewer = CardViewer(self)
         self.add_card_viewer(
-            self.pilot_viewer, self.ui.pilot_viewer_tree_widget, self.ui.pilot_layout)
+            self.pilot_viewer, self.ui.pilot_viewer_tree_view, self.ui.pilot_layout)
 
         self.ui.squad_text_edit.setReadOnly(True)
 
     def populate_upgrade_viewer(self):
-        # populate upgrade viewer
-        self.ui.upgrade_viewer_tree_widget.clear()
+        # populate upgrade viewer, upgrades are added to the tree when a slot is expanded
+        slots = [CatalogNode(k.capitalize(), self.upgrade_slots_dir / f"{k}.png", partial(self.leaf_nodes, v))
+                 for k, v in self.upgrades.upgrade_slot_dict.items()]
+        self.upgrade_model.set_roots(list(reversed(slots)))
+        self.upgrade_proxy.reset_search_index()
+        self.filter_items(self.ui.upgrade_filter_line_edit, self.upgrade_proxy, self.ui.upgrade_viewer_tree_view)
+        self.ui.upgrade_viewer_tree_view.resizeColumnToContents(0)
+
+    def populate_pilot_viewer(self):
+        # populate pilot viewer, ships and pilots are added to the tree when their parent is expanded
+        factions = [CatalogNode(prettify_name(faction_name), self.factions_dir / f"{faction_name}.png",
+                                partial(self.ship_nodes, faction_name))
+                    for faction_name in self.xwing.faction_names]
+        self.pilot_model.set_roots(factions)
+        self.pilot_proxy.reset_search_index()
+        self.filter_items(self.ui.pilot_filter_line_edit, self.pilot_proxy, self.ui.pilot_viewer_tree_view)
+        self.ui.pilot_viewer_tree_view.resizeColumnToContents(0)
+
+    def ship_nodes(self, faction_name: str) -> List[CatalogNode]:
+        faction = self.xwing.get_faction(faction_name)
+        if faction is None:
+            return []
+        return [CatalogNode(prettify_name(ship.ship_name), self.ship_icons_dir / f"{ship.ship_name}.png",
+                            partial(self.leaf_nodes, ship.pilot_names_for_gui))
+                for ship in faction.faction_ships]
+
+    @staticmethod
+    def leaf_nodes(names: List[str]) -> List[CatalogNode]:
+        return [CatalogNode(name) for name in names]
+
+    def upgrade_paths(self) -> Iterator[Tuple[str, ...]]:
+        """returns the path of every upgrade in the upgrade viewer, for the search index"""
         for k, v in self.upgrades.upgrade_slot_dict.items():
-            item = QtWidgets.QTreeWidgetItem([k.capitalize()])
-            pixmap = image_path_to_qpixmap(self.upgrade_slots_dir / f"{k}.png")
-            item.setIcon(0, pixmap)
             for upgrade_gui_name in v:
-                child = QtWidgets.QTreeWidgetItem([upgrade_gui_name])
-                item.addChild(child)
-            self.ui.upgrade_viewer_tree_widget.insertTopLevelItem(0, item)
-            self.ui.upgrade_viewer_tree_widget.resizeColumnToContents(0)
-        self.ui.upgrade_viewer_tree_widget.expandAll()
-
-    def populate_pilot_viewer(self, item: Optional[QtWidgets.QTreeWidgetItem] = None):
-        # populate pilot viewer
-        self.ui.pilot_viewer_tree_widget.clear()
-        for faction_name, ship_dict in self.xwing.faction_ship_pilot_dict.items():
-            faction_item = QtWidgets.QTreeWidgetItem(
-                [prettify_name(faction_name)])
-            pixmap = image_path_to_qpixmap(
-                self.factions_dir / f"{faction_name}.png")
-            faction_item.setIcon(0, pixmap)
-            for ship_name, pilot_list in ship_dict.items():
-                ship_item = QtWidgets.QTreeWidgetItem(
-                    [prettify_name(ship_name)])
-                faction_item.addChild(ship_item)
-                pixmap = image_path_to_qpixmap(
-                    self.ship_icons_dir / f"{ship_name}.png")
-                ship_item.setIcon(0, pixmap)
-                for pilot_name in pilot_list:
-                    pilot_item = QtWidgets.QTreeWidgetItem([pilot_name])
-                    ship_item.addChild(pilot_item)
-            self.ui.pilot_viewer_tree_widget.insertTopLevelItem(
-                self.ui.pilot_viewer_tree_widget.topLevelItemCount(), faction_item)
-            self.ui.pilot_viewer_tree_widget.resizeColumnToContents(0)
-        self.ui.pilot_viewer_tree_widget.expandAll()
+                yield k.capitalize(), upgrade_gui_name
+
+    def pilot_paths(self) -> Iterator[Tuple[str, ...]]:
+        """returns the path of every pilot in the pilot viewer, for the search index"""
+        for faction_name in self.xwing.faction_names:
+            faction = self.xwing.get_faction(faction_name)
+            if faction is None:
+                continue
+            for ship in faction.faction_ships:
+                for pilot_name in ship.pilot_names_for_gui:
+                    yield prettify_name(faction_name), prettify_name(ship.ship_name), pilot_name
 
     def populate_squad_viewer(self, squad: Squad):
         if len(squad.squad_dict) == 0:
@@ -117,85 +148,80 @@ class Viewer(QtWidgets.QDialog):
         s += f"\nTotal Squad Points: {total_cost}\n"
         self.ui.squad_text_edit.setText(s)
 
-    def filter_items(self):
-        show_all = False
-        if len(self.current_search_text) == 0:
-            show_all = True
-        item_iterator = QtWidgets.QTreeWidgetItemIterator(
-            self.current_tree_widget,
-            QtWidgets.QTreeWidgetItemIterator.NoChildren)
-        while item_iterator.value():
-            item = item_iterator.value()
-            item_text = item.text(0).lower()
-            if show_all:
-                item.setHidden(False)
-                item.setForeground(
-                    0,
-                    QtGui.QBrush(QtGui.QColor("white"))
-                )
-            elif self.current_search_line_edit.text().lower() in item_text:
-                item.setHidden(False)
-                item.setForeground(
-                    0,
-                    QtGui.QBrush(QtGui.QColor("green"))
-                )
-            else:
-                item.setHidden(True)
-            item_iterator += 1
+    def filter_timer(self, line_edit: QtWidgets.QLineEdit, proxy: CatalogFilterProxyModel,
+                     tree_view: QtWidgets.QTreeView) -> QtCore.QTimer:
+        """returns a timer filtering tree_view by the text of line_edit once typing pauses"""
+        timer = QtCore.QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.FILTER_DELAY_MS)
+        timer.timeout.connect(partial(self.filter_items, line_edit, proxy, tree_view))
+        line_edit.textChanged.connect(timer.start)
+        return timer
+
+    @staticmethod
+    def filter_items(line_edit: QtWidgets.QLineEdit, proxy: CatalogFilterProxyModel, tree_view: QtWidgets.QTreeView):
+        proxy.set_query(line_edit.text())
+        if proxy.query:
+            tree_view.expandAll()
+
+    @staticmethod
+    def selected_index(tree_view: QtWidgets.QTreeView) -> Optional[QtCore.QModelIndex]:
+        try:
+            return tree_view.selectionModel().selectedIndexes()[0]
+        except IndexError:
+            return None
+
+    def selected_node(self, tree_view: QtWidgets.QTreeView) -> Optional[CatalogNode]:
+        index = self.selected_index(tree_view)
+        return None if index is None else tree_view.model().node(index)
 
     def handle_edit(self):
-        if self.current_tree_widget is None:
-            return
-        selected_items = self.current_tree_widget.selectedItems()
-        if len(selected_items) == 0:
+        if self.current_tree_view is None:
             return
-        current_selection = selected_items[0]
-        if treewidget_item_is_top_level(current_selection):
+        node = self.selected_node(self.current_tree_view)
+        if node is None or not node.is_leaf:
             return
-        if self.current_tree_widget_is_upgrade:
-            upgrade_name = get_upgrade_name_from_list_item_text(
-                current_selection.text(0))
+        if self.current_tree_view_is_upgrade:
+            upgrade_name = get_upgrade_name_from_list_item_text(node.text)
             self.upgrade_edit_signal.emit(upgrade_name)
-        elif self.current_tree_widget_is_pilot:
-            pilot_name = get_pilot_name_from_list_item_text(
-                current_selection.text(0))
-            ship_item = current_selection.parent()
-            faction_item = ship_item.parent()
-            ship_name = gui_text_encode(ship_item.text(0))
-            faction_name = gui_text_encode(faction_item.text(0))
+        elif self.current_tree_view_is_pilot:
+            pilot_name = get_pilot_name_from_list_item_text(node.text)
+            ship_node = node.parent
+            faction_node = ship_node.parent
+            ship_name = gui_text_encode(ship_node.text)
+            faction_name = gui_text_encode(faction_node.text)
             self.pilot_edit_signal.emit(pilot_name, ship_name, faction_name)
 
     def handle_upgrade_tree_click(self):
-        item = self.ui.upgrade_viewer_tree_widget.selectedItems()[0]
-        if item is None:
+        index = self.selected_index(self.ui.upgrade_viewer_tree_view)
+        if index is None or not self.upgrade_proxy.node(index).is_leaf:
             return
-        if treewidget_item_is_top_level(item):
-            return
-        upgrade_name = get_upgrade_name_from_list_item_text(item.text(0))
-        pixmap = image_path_to_qpixmap(
-            self.upgrades_dir / f"{upgrade_name}.jpg")
-        self.upgrade_viewer.set_card(pixmap)
+        upgrade_name = get_upgrade_name_from_list_item_text(index.data())
+        prefetch = [self.upgrades_dir / f"{get_upgrade_name_from_list_item_text(neighbour.data())}.jpg"
+                    for neighbour in tree_view_neighbours(index)]
+        self.card_loader.request("viewer_upgrade", self.upgrades_dir / f"{upgrade_name}.jpg",
+                                 self.upgrade_viewer.set_card, prefetch)
 
     def handle_pilot_tree_click(self):
-        item = self.ui.pilot_viewer_tree_widget.selectedItems()[0]
-        if item is None:
-            return
-        if treewidget_item_is_top_level(item):
+        index = self.selected_index(self.ui.pilot_viewer_tree_view)
+        if index is None or not self.pilot_proxy.node(index).is_leaf:
             return
-        pilot_name = get_pilot_name_from_list_item_text(item.text(0))
-        pixmap = image_path_to_qpixmap(self.pilots_dir / f"{pilot_name}.jpg")
-        self.pilot_viewer.set_card(pixmap)
+        pilot_name = get_pilot_name_from_list_item_text(index.data())
+        prefetch = [self.pilots_dir / f"{get_pilot_name_from_list_item_text(neighbour.data())}.jpg"
+                    for neighbour in tree_view_neighbours(index)]
+        self.card_loader.request("viewer_pilot", self.pilots_dir / f"{pilot_name}.jpg",
+                                 self.pilot_viewer.set_card, prefetch)
 
     def expand_collapse_all(self, expand=True):
-        if self.current_tree_widget is None:
+        if self.current_tree_view is None:
             return
         if expand:
-            self.current_tree_widget.expandAll()
+            self.current_tree_view.expandAll()
         else:
-            self.current_tree_widget.collapseAll()
+            self.current_tree_view.collapseAll()
 
     @property
-    def current_tree_widget(self) -> Optional[QtWidgets.QTreeWidget]:
+    def current_tree_view(self) -> Optional[QtWidgets.QTreeView]:
         tab_idx = self.ui.viewer_tab_widget.currentIndex()
         tab_obj_arr = self.ui.viewer_tab_widget.widget(tab_idx).children()
         for obj in tab_obj_arr:
@@ -204,35 +230,21 @@ class Viewer(QtWidgets.QDialog):
         return None
 
     @property
-    def current_search_line_edit(self) -> QtWidgets.QLineEdit:
-        tab_idx = self.ui.viewer_tab_widget.currentIndex()
-        tab_obj_arr = self.ui.viewer_tab_widget.widget(tab_idx).children()
-        for obj in tab_obj_arr:
-            if "filter_line_edit" in obj.objectName():
-                return obj
-        return None
-
-    @property
-    def current_search_text(self) -> str:
-        """returns the lowercase version of the current search text"""
-        return self.current_search_line_edit.text().lower()
-
-    @property
-    def current_tree_widget_is_upgrade(self) -> bool:
-        if "upgrade" in self.current_tree_widget.objectName():
+    def current_tree_view_is_upgrade(self) -> bool:
+        if "upgrade" in self.current_tree_view.objectName():
             return True
         return False
 
     @property
-    def current_tree_widget_is_pilot(self) -> bool:
-        if "pilot" in self.current_tree_widget.objectName():
+    def current_tree_view_is_pilot(self) -> bool:
+        if "pilot" in self.current_tree_view.objectName():
             return True
         return False
 
-    def add_card_viewer(self, card_viewer, tree_widget, layout):
+    def add_card_viewer(self, card_viewer, tree_view, layout):
         layout.addWidget(card_viewer)
-        tree_policy = tree_widget.sizePolicy()
+        tree_policy = tree_view.sizePolicy()
         tree_policy.setHorizontalStretch(1)
-        tree_widget.setSizePolicy(tree_policy)
+        tree_view.setSizePolicy(tree_policy)
         tree_policy.setHorizontalStretch(2)
         card_viewer.setSizePolicy(tree_policy)
@@ -18,10 +18,14 @@ class WorkerSignals(QObject):
     result
         `object` data returned from processing, anything
 
+    progress
+        `int` done, `int` total (0 if unknown)
+
     '''
     finished = Signal()
     error = Signal(tuple)
     result = Signal(object)
+    progress = Signal(int, int)
 
 
 class Worker(QRunnable):
@@ -35,16 +39,20 @@ class Worker(QRunnable):
     :type callback: function
     :param args: Arguments to pass to the callback function
     :param kwargs: Keywords to pass to the callback function
+    :param report_progress: Pass signals.progress.emit to the callback function as its
+                            progress_callback keyword
 
     '''
 
-    def __init__(self, fn, *args, **kwargs):
+    def __init__(self, fn, *args, report_progress=False, **kwargs):
         super(Worker, self).__init__()
         # Store constructor arguments (re-used for processing)
         self.fn = fn
         self.args = args
         self.kwargs = kwargs
         self.signals = WorkerSignals()
+        if report_progress:
+            self.kwargs['progress_callback'] = self.signals.progress.emit
 
     @Slot()
     def run(self):